@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the time per `as_regex` call on a watch list of nouns and verbs, when
+compiling the pattern on every call, when reusing the same objects, and when sharing
+patterns between new objects through the "term.patterns" cache.
+
+Usage::
+
+    python benchmarks/as_regex.py [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inflex import Noun, Verb, cache  # pylint: disable=C0413
+
+NOUNS = ["child", "cherub", "mouse", "formula", "book", "mother-in-law", "sheep", "knife", "cactus", "person"]
+VERBS = ["eat", "fly", "walk", "be", "go", "write", "try", "stop", "sing", "have"]
+
+
+def time_calls(function: Callable[[], None], calls: int, repeat: int) -> float:
+    """Call `function` `repeat` times, and return the best time per call in microseconds.
+
+    Args:
+        function (Callable[[], None]): Function performing `calls` calls to `as_regex`.
+        calls (int): Number of calls to `as_regex` per call of `function`.
+        repeat (int): Number of times to call `function`.
+
+    Returns:
+        float: The lowest time per `as_regex` call, in microseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the watch list per scenario.")
+    args = parser.parse_args()
+
+    calls = len(NOUNS) + len(VERBS)
+    objects: List = [Noun(noun) for noun in NOUNS] + [Verb(verb) for verb in VERBS]
+
+    def new_objects() -> None:
+        for noun in NOUNS:
+            Noun(noun).as_regex()
+        for verb in VERBS:
+            Verb(verb).as_regex()
+
+    def same_objects() -> None:
+        for term in objects:
+            term.as_regex()
+
+    cache.disable()
+    scenarios = [("new objects, uncached", new_objects), ("same objects", same_objects)]
+    for name, function in scenarios:
+        function()
+        print(f"{name:<40} {time_calls(function, calls, args.repeat):8.2f} us per call")
+
+    cache.enable("term.patterns")
+    new_objects()
+    name = 'new objects, "term.patterns" enabled'
+    print(f"{name:<40} {time_calls(new_objects, calls, args.repeat):8.2f} us per call")
+    cache.disable()
+
+
+if __name__ == "__main__":
+    main()
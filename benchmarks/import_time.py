@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the cold-start time of Inflex, i.e. the time taken by a fresh Python process
+to import Inflex and perform a first conversion.
+
+Usage::
+
+    python benchmarks/import_time.py [--runs 20]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+SCENARIOS = {
+    "baseline (python -c pass)": "pass",
+    "import inflex": "import inflex",
+    "first Noun conversion": "import inflex; inflex.Noun('book').plural()",
+    "first Verb conversion": "import inflex; inflex.Verb('walk').past()",
+    "import inflex; inflex.preload()": "import inflex; inflex.preload()",
+}
+
+
+def time_process(code: str, runs: int) -> List[float]:
+    """Run `code` in `runs` fresh Python processes, and return the wall times in seconds.
+
+    Args:
+        code (str): Python code to execute.
+        runs (int): Number of processes to start.
+
+    Returns:
+        List[float]: The wall time of each process, in seconds.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    # Write the bytecode cache up front, so only the first run doesn't pay for compilation
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="Number of processes per scenario.")
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        timings = time_process(code, args.runs)
+        print(f"{name:<35} median {statistics.median(timings) * 1000:7.1f} ms, "
+              f"min {min(timings) * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
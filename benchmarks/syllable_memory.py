@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the resident memory (RSS) used by the syllable stress data, by comparing
+the RSS of a fresh Python process before and after loading it.
+
+Scenarios:
+
+* json.load: Parsing cmudict_stress.json, i.e. one list of lists per word.
+* Syllable.data(): The dictionary of all words, built from the index, with one list
+  of lists per word.
+* Syllable.index(): The memory-mapped index used by the other Syllable methods,
+  after looking up every word once, which fills its cache of recent lookups.
+
+Usage::
+
+    python benchmarks/syllable_memory.py
+"""
+
+import os
+import subprocess
+import sys
+
+SCENARIOS = {
+    "json.load": """
+import json, os, inflex
+path = os.path.join(os.path.dirname(inflex.__file__), "data", "cmudict_stress.json")
+with open(path, "r", encoding="utf8") as file:
+    data = json.load(file)
+""",
+    "Syllable.data()": """
+from inflex.syllable import Syllable
+data = Syllable.data()
+""",
+    "Syllable.index()": """
+from inflex.syllable import Syllable
+index = Syllable.index()
+for word, _stresses in index.items():
+    index.get(word)
+""",
+}
+
+MEASURE = """
+import gc, resource
+
+def rss():
+    # Current RSS in KiB, falling back to the peak RSS where /proc is unavailable
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+import inflex.stress_index
+gc.collect()
+before = rss()
+{code}
+gc.collect()
+print(before, rss())
+"""
+
+
+def main() -> None:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    for name, code in SCENARIOS.items():
+        output = subprocess.run([sys.executable, "-c", MEASURE.format(code=code)], env=env,
+                                stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+        before, after = map(int, output.split())
+        print(f"{name:<20} RSS before {before / 1024:6.1f} MiB, after {after / 1024:6.1f} MiB, "
+              f"increase {(after - before) / 1024:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Measure the memory used per `Noun`, `Verb` and `Adjective` object, using `tracemalloc`.
+Each object is measured both freshly created, and after two of its forms have been
+computed once, which includes any memory retained by the object for those forms.
+
+Usage::
+
+    python benchmarks/term_memory.py [--count 10000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Tuple
+
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inflex import Adjective, Noun, Verb  # pylint: disable=C0413
+
+SCENARIOS = {
+    "Noun": (Noun, lambda noun: (noun.plural(), noun.singular())),
+    "Verb": (Verb, lambda verb: (verb.singular(), verb.past())),
+    "Adjective": (Adjective, lambda adj: (adj.comparative(), adj.superlative())),
+}
+
+
+def allocated(function: Callable[[], Any]) -> Tuple[Any, int]:
+    """Call `function`, and return its output and the number of bytes still allocated afterwards.
+
+    Args:
+        function (Callable[[], Any]): Function to call.
+
+    Returns:
+        Tuple[Any, int]: The output of `function` and the number of bytes allocated by it
+            which are still alive, including the output.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    output = function()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return output, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10000, help="Number of objects per class")
+    args = parser.parse_args()
+
+    # Distinct terms without whitespace, which are not copied by `Term.__init__`
+    terms = [f"word{i}" for i in range(args.count)]
+    for name, (cls, convert) in SCENARIOS.items():
+        # Includes the 8 bytes per object of the list holding the objects
+        objects, created = allocated(lambda: [cls(term) for term in terms]) # pylint: disable=W0640
+        # The outputs are discarded, so only memory retained by the objects is counted
+        _, converted = allocated(lambda: deque(map(convert, objects), maxlen=0)) # pylint: disable=W0640
+        print(f"{name:<10} {created / args.count:6.1f} bytes per object, "
+              f"{(created + converted) / args.count:6.1f} bytes per object after conversion")
+
+
+if __name__ == "__main__":
+    main()
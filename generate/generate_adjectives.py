@@ -101,6 +101,8 @@ class CodeWriter(object):
 ## Contains no user-servicable parts!!! ##
 ##########################################
 
+from inflex.cache import memoize
+
 VERSION = {version}
 
 adj_is_singular = {json.dumps(sorted(self.reader.words["singular"]), indent=4)}
@@ -111,6 +113,7 @@ adj_singular_of = {json.dumps(self.reader.literals["singular"], indent=4, sort_k
 
 adj_plural_of = {json.dumps(self.reader.literals["plural"], indent=4, sort_keys=True)}
 
+@memoize
 def is_plural(word: str) -> bool:
     """Detect whether `word` is in plural form.
 
@@ -124,6 +127,7 @@ def is_plural(word: str) -> bool:
            word.lower() in adj_is_plural or\\
            (word not in adj_is_singular and word.lower() not in adj_is_singular)
 
+@memoize
 def is_singular(word: str) -> bool:
     """Detect whether `word` is in singular form.
 
@@ -137,6 +141,7 @@ def is_singular(word: str) -> bool:
            word.lower() in adj_is_singular or\\
            (word not in adj_is_plural and word.lower() not in adj_is_plural)
 
+@memoize
 def convert_to_plural(word: str) -> str:
     """Convert `word` to plural form.
 
@@ -152,6 +157,7 @@ def convert_to_plural(word: str) -> str:
         return adj_plural_of[word.lower()]
     return word
 
+@memoize
 def convert_to_singular(word: str) -> str:
     """Convert `word` to singular form.
 
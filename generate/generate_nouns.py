@@ -1,12 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import argparse
+import os
 import re
 import json
+import sys
 from datetime import datetime
 from typing import Dict, Generator, List, Set, Tuple, Optional
 
 from generate_tests import TestWriter
+from rule_order import load_profile, order_alternatives, order_rules
+
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inflex.noun_lei import CAPTURE_PAT, Reader  # pylint: disable=C0413
 
 """
 Keys existing in Lingua::EN::Inflexion, but not in mine:
@@ -20,394 +29,14 @@ singular_of:
 There are no keys in mine that are not in Lingua
 """
 
-"""
-Compiled variants of useful regexes used all around this file
-"""
-xms  = re.VERBOSE | re.MULTILINE | re.DOTALL
-COMMENT_LINE_PAT = re.compile(r" \A \s* \#",         flags=xms)
-COMMENT_PAT      = re.compile(r" \# .* ",            flags=xms)
-BLANK_LINE_PAT   = re.compile(r" \A \s* $ ",         flags=xms)
-WS               = re.compile(r" [\s]* ",            flags=xms)
-DATA_PAT         = re.compile(r"""
-    \A
-      (?: {WS} < ([^>]+) > )?    # ...optional category tag
-      {WS} ([*-]?) {WS}             # ...leading whitespace and optional generic marker
-      (.*?)                     # ...singular word
-      {WS} =>                    # ...singular/plural separator
-      {WS} ([*-]?) {WS}             # ...leading whitespace and optional generic marker
-      (.*?)                     # ...plural of word
-      (?:                       # ...optionally:
-        {WS} \|                  #    ...modern/classical separator
-        {WS} ([*-]?) {WS}           #    ...leading whitespace and optional generic marker
-        (.*?)                   #    ...classical plural of word
-      )?
-    {WS}                         # ...trailing whitespace
-    (?:{COMMENT_PAT})?               # Optional trailing comment
-    \Z                          # ...trailing whitespace
-""".format(WS=WS.pattern, COMMENT_PAT=COMMENT_PAT.pattern),
-    flags=xms)
-RECURSE = re.compile(r"\(SING\) | \(PREP\)", flags=xms)
-RECURSE_GROUPED = re.compile(r"""
-      (?P<star>   \*        )
-    | (?P<sing>   \(SING\)  )
-    | (?P<plur>   \(PL\)    )
-    | (?P<prep>   \(PREP\)  )
-    | (?P<prepr>  \(PREPR\)  )
-""", flags=xms)
-"""
-CONS     = re.compile(r"\(CONS\)", flags=xms)
-VOWEL    = re.compile(r"\(VOWEL\)", flags=xms)
-VOWELY   = re.compile(r"\(VOWELY\)", flags=xms)
-"""
-DASH = re.compile(r"-")
-STAR = re.compile(r"\*")
-RESTRICT = re.compile(r"( \[.*?\] )+", flags=xms)
-"""
-SPLIT    = re.compile(r"(.*?) [|] (.*)", flags=xms)
-"""
-
-
-class Word(object):
-    def __init__(self, gen: Optional[str], word: Optional[str]):
-        super().__init__()
-        self.gen = gen or ""
-        self.word = word or ""
-        self.restrict = ""
-
-    def expand_dash_star(self):
-        """
-        Replace - and * with the proper regex variant in input gen: "-" -> ".+"
-        """
-        if not self.gen:
-            return
-        self.gen = DASH.sub(r".+", self.gen)
-        self.gen = STAR.sub(r".*", self.gen)
-
-    '''
-    def expand_cons_vowel(self) -> str:
-        """
-        Replace (CONS), (VOWEL) and (VOWELS) macros in input verb, e.g. "(VOWEL)ys" -> "[aeiou]ys"
-        """
-        self.word = CONS.sub(r"[^aeiou]", self.word)
-        self.word = VOWEL.sub(r"[aeiou]", self.word)
-        self.word = VOWELY.sub(r"[aeiouy]", self.word)
-    '''
-
-    def restrict_word(self) -> None:
-        """
-        Input verb (e.g. "[aeiou]ys") is split up into restriction (e.g. "[aeiou]") and remainder (e.g. "ys")
-        """
-        if not self.word:
-            return
-        match = RESTRICT.search(self.word)
-        if match:
-            self.restrict = match.group()
-            self.word = RESTRICT.sub(r"", self.word, count=1)
-
-    '''
-    def split(self) -> Optional[str]:
-        match = SPLIT.match(self.word)
-        if match:
-            self.word = match.group(1)
-            return match.group(2)
-        return None
-    '''
-
-    def __str__(self) -> str:
-        return f"{self.gen or ''}{self.restrict}{self.word}"
-
-
-class Noun(object):
-    def __init__(self, match):
-        super().__init__()
-        # tag                   Optional category tag, eg "nonindicative"
-        # is_generic            "*", "-" or ""
-        # sing:                 Singular word
-        # is_pure_generic       "*", "-" or ""
-        # pl1:                  Plural word 1
-        # other                 "*", "", "-", None
-        # pl2:                  Plural word 2
-        self.tag = match.group(1) or ""
-        self.sing = Word(match.group(2), match.group(3))
-        self.sing.expand_dash_star()
-        self.sing.restrict_word()
-
-        self.plur_one = Word(match.group(4), match.group(5))
-        self.plur_one.restrict_word()
-        self.plur_two = Word(match.group(6), match.group(7))
-        self.plur_two.restrict_word()
-        # TODO: Check if this can be removed
-        # If the first plural does not exist, have both point to the same object
-        # if not self.plur_one.word:
-        # self.plur_one = self.plur_two
-
-    def has_hyphen(self):
-        return "-" in self.sing.word or "-" in self.plur_one.word or "-" in self.plur_two.word
-
-    def replace_hyphens(self, repl: str):
-        self.sing.word = self.sing.word.replace("-", repl)
-        self.plur_one.word = self.plur_one.word.replace("-", repl)
-        self.plur_two.word = self.plur_two.word.replace("-", repl)
-
-    def __str__(self) -> str:
-        # return (f"<{self.tag}> " if self.tag else "") + f"{self.sing}: {self.plur_one} | "
-        return "{: <14} : {: <20} => {: <20} | {: <20}".format(self.tag or "",
-                                                               str(self.sing),
-                                                               str(self.plur_one) if self.plur_one.word else "",
-                                                               str(self.plur_two) if self.plur_two.word else "")
-
-
-class Reader(object):
-    def __init__(self, fname: str):
-        types = ["modern_plural", "classical_plural", "singular"]
-        self.patterns: Dict[str, List[Dict[str, str]]] = {key: [] for key in types}
-        self.literals: Dict[str, Dict[str, str]] = {key: {} for key in types}
-        self.words: Dict[str, Set[str]] = {
-            "plural": set(),
-            "singular": set()
-        }
-        self.fname = fname
-
-    def get_readlines(self) -> List[str]:
-        with open(self.fname, "r") as f:
-            return f.readlines()
-
-    def parse_file(self):
-        """
-        Fill `pattern`, `literal` and `words`
-        """
-
-        """
-        # TODO: Add these in the convert functions themselves
-        # Add conversions for possessives
-        self.patterns["modern_plural"].append({
-            "from": r"(.*?)'s?",
-            "to": "lambda match: (lambda subword: subword + '\\'' if subword.endswith(('s', 'S')) else subword + '\\'s')(convert_to_modern_plural(match.group(1)))",
-            "conv_conditional": "lambda match: is_singular(match.group(1))",
-            "tag": ""
-        })
-        self.patterns["classical_plural"].append({
-            "from": r"(.*?)'s?",
-            "to": "lambda match: (lambda subword: subword + '\\'' if subword.endswith(('s', 'S')) else subword + '\\'s')(convert_to_classical_plural(match.group(1)))",
-            "conv_conditional": "lambda match: is_singular(match.group(1))",
-            "tag": ""
-        })
-        self.patterns["singular"].append({
-            "from": r"(.*?)'s?",
-            "to": "lambda match: (lambda subword: subword + '\\'' if subword.endswith(('s', 'S')) else subword + '\\'s')(convert_to_singular(match.group(1)))",
-            "conv_conditional": "lambda match: is_plural(match.group(1))",
-            "tag": ""
-        })
-        """
-
-        lines = self.get_readlines()
-
-        for line in lines:
-            # Skip empty or comment lines
-            if COMMENT_LINE_PAT.match(line) or BLANK_LINE_PAT.match(line):
-                continue
-
-            # Extract data
-            match = DATA_PAT.match(line)
-            if match:
-                noun = Noun(match)
-            else:
-                # TODO: Change exception
-                raise Exception("Unknown input:", line)
-
-            if noun.sing.gen:
-                if noun.plur_one.word:
-                    if noun.tag != "plur_to_sing":
-                        self.optionally_add_pattern(self.patterns["modern_plural"], {
-                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_one.word}"',
-                            "tag": noun.tag
-                        })
-                    if noun.tag != "sing_to_plur":
-                        self.optionally_add_pattern(self.patterns["singular"], {
-                            "from": f"({noun.sing.gen}{noun.plur_one.restrict}){noun.plur_one.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.sing.word}"',
-                            "tag": noun.tag
-                        })
-                elif noun.plur_two.word:
-                    if noun.tag != "plur_to_sing":
-                        self.optionally_add_pattern(self.patterns["modern_plural"], {
-                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_two.word}"',
-                            "tag": noun.tag
-                        })
-                    if noun.tag != "sing_to_plur":
-                        self.optionally_add_pattern(self.patterns["singular"], {
-                            "from": f"({noun.sing.gen}{noun.plur_two.restrict}){noun.plur_two.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.sing.word}"',
-                            "tag": noun.tag
-                        })
-
-                if noun.plur_two.word:
-                    if noun.tag != "plur_to_sing":
-                        self.optionally_add_pattern(self.patterns["classical_plural"], {
-                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_two.word}"',
-                            "tag": noun.tag
-                        })
-                    if noun.tag != "sing_to_plur":
-                        self.optionally_add_pattern(self.patterns["singular"], {
-                            "from": f"({noun.sing.gen}{noun.plur_two.restrict}){noun.plur_two.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.sing.word}"',
-                            "tag": noun.tag
-                        })
-                else:
-                    if noun.tag != "plur_to_sing":
-                        self.optionally_add_pattern(self.patterns["classical_plural"], {
-                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
-                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_one.word}"',
-                            # "conditional": "lambda match: True",
-                            "tag": noun.tag
-                        })
-
-            elif RECURSE.search(noun.sing.word):
-                self.add_recurse_patterns(noun)
-
-                if noun.has_hyphen():
-                    noun.replace_hyphens(" ")
-                    self.add_recurse_patterns(noun)
-
-                # TODO: Investigate this setting to 1
-                noun.plur_one.gen = 1
-
-            if not noun.plur_one.gen and not noun.plur_two.gen:
-                self.add_literals(noun)
-                self.add_words(noun)
-
-    def add_recurse_patterns(self, noun):
-        self.optionally_add_pattern(self.patterns["modern_plural"], {
-            **self.build_recursive(_from=noun.sing.word,
-                                    to=noun.plur_one.word,
-                                    from_type="singular",
-                                    to_type="modern_plural"),
-            **{"tag": noun.tag}
-        })
-        self.optionally_add_pattern(self.patterns["singular"], {
-            **self.build_recursive(_from=noun.plur_one.word,
-                                    to=noun.sing.word,
-                                    from_type="modern_plural",
-                                    to_type="singular"),
-            **{"tag": noun.tag}
-        })
-
-        if not noun.plur_two.word:
-            noun.plur_two = noun.plur_one
-
-        self.optionally_add_pattern(self.patterns["classical_plural"], {
-            **self.build_recursive(_from=noun.sing.word,
-                                    to=noun.plur_two.word,
-                                    from_type="singular",
-                                    to_type="classical_plural"),
-            **{"tag": noun.tag}
-        })
-        self.optionally_add_pattern(self.patterns["singular"], {
-            **self.build_recursive(_from=noun.plur_two.word,
-                                    to=noun.sing.word,
-                                    from_type="classical_plural",
-                                    to_type="singular"),
-            **{"tag": noun.tag}
-        })
-
-    def optionally_add_pattern(self, collection, dict_to_add):
-        if dict_to_add["from"] not in (pattern["from"] for pattern in collection):
-            collection.append(dict_to_add)
-
-    def optionally_add_literal(self, collection, key, word):
-        if key == "_" or word == "_" or key == "":
-            return
-        if key not in collection or not collection[key]:
-            collection[key] = word
-
-    def add_literals(self, noun):
-        if not noun.plur_two.word:
-            noun.plur_two = noun.plur_one
-
-        self.optionally_add_literal(
-            self.literals["modern_plural"], noun.sing.word, noun.plur_one.word)
-        self.optionally_add_literal(
-            self.literals["classical_plural"], noun.sing.word, noun.plur_two.word)
-        self.optionally_add_literal(
-            self.literals["singular"], noun.plur_one.word, noun.sing.word)
-        self.optionally_add_literal(
-            self.literals["singular"], noun.plur_two.word, noun.sing.word)
-
-    def add_words(self, noun):
-        self.words["plural"].add(noun.plur_one.word)
-        self.words["plural"].add(noun.plur_two.word)
-        self.words["singular"].add(noun.sing.word)
-
-    def build_recursive(self, _from: str, to: str, from_type: str, to_type: str):
-        check_conditional = ""
-
-        def wrap(input_string: str) -> str:
-            return '{' + str(input_string) + '}'
-
-        def irepl(match, input_string: str, replace: str) -> str:
-            """
-            Replace using indices from match
-            """
-            return input_string[:match.start()] + replace + input_string[match.end():]
-
-        n = 1
-        # Get list of match objects, right to left, for both _from and to
-        # This way we can use match indices to replace, rather than relying on substitutions
-        # which causes issues with * being both in the input and output
-        from_matches = list(RECURSE_GROUPED.finditer(_from))[::-1]
-        to_matches = list(RECURSE_GROUPED.finditer(to))[::-1]
-        if len(from_matches) != len(to_matches):
-            # TODO: Write exception
-            raise Exception()
-
-        n = len(from_matches)
-        # Iterate over all matches right to left
-        for from_match, to_match in zip(from_matches, to_matches):
-            if from_match.group("star"):
-                _from = irepl(from_match, _from, r"(.*?)")
-                to = irepl(to_match, to, wrap(f'subterms[{n-1}]'))
-
-            elif from_match.group("sing"):
-                _from = irepl(from_match, _from, r"(.*?)")
-                to = irepl(to_match, to, wrap(
-                    f"convert_to_{to_type}(subterms[{n-1}]) if is_singular(subterms[{n-1}]) else subterms[{n-1}]"))
-                if not check_conditional:
-                    check_conditional = f"lambda match: is_singular(match.group({n}))"
-
-            elif from_match.group("plur"):
-                _from = irepl(from_match, _from, r"(.*?)")
-                to = irepl(to_match, to, wrap(
-                    f"convert_to_{to_type}(subterms[{n-1}]) if is_plural(subterms[{n-1}]) else subterms[{n-1}]"))
-                if not check_conditional:
-                    check_conditional = f"lambda match: is_plural(match.group({n}))"
-
-            elif from_match.group("prep"):
-                _from = irepl(from_match, _from, r"(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)")
-                to = irepl(to_match, to, wrap(f'subterms[{n-1}]'))
-
-            elif from_match.group("prepr"):
-                # Relative to prep, prepr(educed) lacks:
-                # out, about, off, in, on, over
-                _from = irepl(from_match, _from, r"(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)")
-                to = irepl(to_match, to, wrap(f'subterms[{n-1}]'))
-
-            n -= 1
-
-        return {
-            "from": _from,
-            "to": f'lambda subterms: f"{to}"',
-            "check_conditional": check_conditional
-        }
-
 
 class CodeWriter(object):
-    def __init__(self, reader: Reader, fname: str):
+    def __init__(self, reader: Reader, fname: str, profile: Optional[str] = None):
         super().__init__()
         self.reader: Reader = reader
         self.fname: str = fname
+        # Rule hits as recorded by `record_profile.py`, used to order the rules
+        self.profile: Dict[str, Dict[str, Dict[str, int]]] = load_profile(profile)
 
     def write_file(self):
         version = datetime.strftime(datetime.now(), '%Y%m%d.%H%M%S')
@@ -421,44 +50,47 @@ class CodeWriter(object):
 ##########################################
 
 import re
-from typing import Pattern
+import warnings
+from typing import Dict, Match, Optional, Tuple
+
+from inflex.cache import memoize
+from inflex.lazy_regex import LazyPattern, lazy_compile
+from inflex.suffix_trie import SuffixTrie
 
 VERSION = {version}
 
-def rei(regex: str) -> Pattern[str]:
-    """Return compiled `re.Pattern` with `regex` as pattern, and the IGNORECASE flag.
+# The engine used to apply the conversion rules: Either "regex" to match the
+# `*_convert_rule_regex` patterns directly, or "trie" to use the equivalent
+# `*_convert_trie` objects, which look up rules by the ending of the word.
+rule_engine = "regex"
+
+# Words of at least this many characters always use the tries, both to convert them and
+# to recognize whether they are plural or singular. The regexes try every rule at every
+# position, while the tries only look at the ending of the word.
+long_input_length = 64
+
+# Opt-in engine mode for untrusted or very long input, e.g. `max_input_length = 128`: Words
+# of more than this many characters are then inflected as a single word, in time linear in
+# their length. Only the rules for word endings apply to them, and not the rules for
+# collocations and possessives, e.g. "son of a gun" or "gun's", so their output may differ.
+# These rules convert and classify subterms recursively, which takes time quadratic in the
+# length of the input, and a few stack frames per nesting level. Defaults to None, i.e.
+# all rules apply to words of any length.
+max_input_length: Optional[int] = None
+
+def rei(regex: str) -> LazyPattern:
+    """Return lazily compiled `re.Pattern` with `regex` as pattern, and the IGNORECASE flag.
 
     Args:
         regex (str): Regular expression pattern.
 
     Returns:
-        re.Pattern: Compiled version of `regex`, with IGNORECASE flag.
+        LazyPattern: Version of `regex` with IGNORECASE flag, compiled on first use.
     """
-    return re.compile(regex, flags=re.I)
+    return lazy_compile(regex, flags=re.I)
 
 '''
-        # If there is no modern plural known, use the classical plural
-        self.reader.literals["modern_plural"] = {key: (
-            value if value else self.reader.literals["classical_plural"][key]) for key, value in self.reader.literals["modern_plural"].items()}
-
-        for key in self.reader.literals:
-            # For phrases with dashes, also add variants with spaces
-            data = {}
-            for phrase_key, phrase_value in self.reader.literals[key].items():
-                data[phrase_key] = phrase_value
-                # if not phrase_key.islower():
-                # data[phrase_key.lower()] = phrase_value.lower()
-                if "-" in phrase_key and "-" in phrase_value:
-                    data[phrase_key.replace(
-                        "-", " ")] = phrase_value.replace("-", " ")
-
-            data_to_add = {}
-            for data_key in data:
-                if not data_key.islower():
-                    if data_key.lower() not in data:
-                        data_to_add[data_key.lower()] = data[data_key].lower()
-
-            data = {**data, **data_to_add}
+        for key, data in self.reader.get_literals().items():
             generated_code += f"{key}_of = " + \
                 json.dumps(data, indent=4, sort_keys=True) + "\n\n"
 
@@ -470,6 +102,9 @@ def rei(regex: str) -> Pattern[str]:
             "plural", self.reader.patterns["singular"]) + "\n\n"
         generated_code += self.get_recognize_rule_output(
             "singular", self.reader.patterns["modern_plural"]) + "\n\n"
+        generated_code += self.get_number_recognize_output(
+            [("plural", self.reader.patterns["singular"]),
+             ("singular", self.reader.patterns["modern_plural"])]) + "\n\n"
 
         generated_code += '''def known_plural(word: str) -> bool:
     """True if `word` is known to be plural.
@@ -499,10 +134,9 @@ def known_singular(word):
             generated_code += self.get_converter_output(
                 key, self.reader.patterns[key]) + "\n\n"
 
-        generated_code += self.get_recognizer_output(
-            "plural", "singular") + "\n\n"
-        generated_code += self.get_recognizer_output(
-            "singular", "plural") + "\n\n"
+        generated_code += self.get_classifier_output() + "\n\n"
+        generated_code += self.get_recognizer_output("plural") + "\n\n"
+        generated_code += self.get_recognizer_output("singular") + "\n\n"
 
         self.output_code(generated_code)
 
@@ -533,35 +167,48 @@ def known_singular(word):
         return output
         """
 
+        unique_suffixes = []
+        for replacement_dict in replacement_suffixes:
+            if replacement_dict["from"] not in (unique_dict["from"] for unique_dict in unique_suffixes):
+                unique_suffixes.append(replacement_dict)
+        # Move frequently used rules forward, if a profile is given
+        order = order_rules([replacement_dict["from"] for replacement_dict in unique_suffixes],
+                            self.profile["convert"].get(name, {}))
+
         regexes = []
         outputs = []
         slices = []
         i = 1
-        for index, replacement_dict in enumerate(replacement_suffixes):
-            if replacement_dict["from"] not in regexes:
-                regexes.append(replacement_dict["from"])
-                outputs.append(replacement_dict["to"])
-                # Informal method of finding out how many capture groups there are.
-                # Optionally, use re.compile(replacement_dict["from"]).groups
-                n_captures = re.compile(replacement_dict["from"]).groups
-                for _ in range(n_captures):
-                    slices.append(
-                        (index, [i + group_id for group_id in range(n_captures)]))
-                i += n_captures
+        for index, replacement_dict in enumerate(unique_suffixes[rule_index] for rule_index in order):
+            regexes.append(replacement_dict["from"])
+            outputs.append(replacement_dict["to"])
+            # Informal method of finding out how many capture groups there are.
+            # Optionally, use re.compile(replacement_dict["from"]).groups
+            n_captures = re.compile(replacement_dict["from"]).groups
+            for _ in range(n_captures):
+                slices.append(
+                    (index, [i + group_id for group_id in range(n_captures)]))
+            i += n_captures
 
         output = f"{name}_convert_rule_regex = rei(r\"^(?:{'|'.join(regexes)})$\")\n\n"
         output += f"{name}_convert_outputs = [" + ''.join(
             '\n    ' + output + ',' for output in outputs) + "\n]\n\n"
         output += f"{name}_convert_slices = [" + ''.join(
-            '\n    ' + str(index_list) + ',' for index_list in slices) + "\n]"
+            '\n    ' + str(index_list) + ',' for index_list in slices) + "\n]\n\n"
+        output += f"{name}_convert_trie = SuffixTrie({name}_convert_rule_regex, " \
+                  f"{name}_convert_outputs, {name}_convert_slices)"
 
         return output
 
     def get_converter_output(self, name, replacement_suffixes):
         _type = "plural" if "plural" in name else "singular"
-        _extra_check = " and not is_singular(word, is_word_plural=True)" if _type == "plural" else ""
+        if _type == "plural":
+            _check = "classify_number(word) == (True, False)"
+        else:
+            _check = "classify_number(word)[1]"
 
-        output = f'''def convert_to_{name}(word: str) -> str:
+        output = f'''@memoize
+def convert_to_{name}(word: str) -> str:
     """Convert `word` to {name.replace("_", " ")} form.
 
     Args:
@@ -570,9 +217,9 @@ def known_singular(word):
     Returns:
         str: The {name.replace("_", " ")} form of `word`.
     """
-    if word.lower().endswith(("'s", "'")):
+    if (max_input_length is None or len(word) <= max_input_length) and word.lower().endswith(("'s", "'")):
         subword = word[:word.rfind("'")]
-        if is_{"singular" if _type == "plural" else "plural"}(subword):
+        if classify_number(subword)[{1 if _type == "plural" else 0}]:
             subword = convert_to_{name}(subword)
             return subword + "'" if subword.endswith(('s', 'S')) else subword + "'s"
         return word
@@ -583,9 +230,15 @@ def known_singular(word):
     if not word.islower() and word.lower() in {name}_of:
         return {name}_of[word.lower()]
 
-    if is_{_type}(word){_extra_check}:
+    if {_check}:
         return word
 
+    if rule_engine == "trie" or len(word) >= long_input_length:
+        # The output is applied here rather than by the trie, as it may convert subterms
+        # recursively, so each extra function would cost a stack frame per nesting level
+        found = {name}_convert_trie.find(word, suffix_only=max_input_length is not None and len(word) > max_input_length)
+        return {name}_convert_outputs[found[0]](found[1]) if found else word
+
     match = {name}_convert_rule_regex.match(word)
     if match:
         for i, group in enumerate(match.groups()):
@@ -613,6 +266,20 @@ def known_singular(word):
                 used_lines.append(line)
                 output += line
         """
+        for regex, conditional in self.get_recognize_regexes(name, replacement_suffixes):
+            if conditional:
+                output += f'    rei(r"^{regex}$"): {{"conditional": {conditional}}},\n'
+            else:
+                output += f'    rei(r"^{regex}$"): {{}},\n'
+        output += "}"
+        return output
+
+    def get_recognize_regexes(self, name, replacement_suffixes):
+        """
+        Get the regexes of the recognize rules, in order, as tuples of the regex without
+        anchors, and the conditional, which is "" if the rule has no conditional.
+        The first rule combines all rules without conditional.
+        """
         non_cond_regexes = {
             repl_dict["from"]
             for repl_dict in replacement_suffixes
@@ -625,46 +292,125 @@ def known_singular(word):
             if "check_conditional" in repl_dict and repl_dict["check_conditional"]
             and repl_dict["tag"] != "nonindicative"
         ]
-        large_regex = "|".join(sorted(
-            sorted(non_cond_regexes), key=lambda x: len(x) - x.find(")") + x.find("(")))
-        output += f'    rei(r"^(?:{large_regex})$"): {{}},\n'
+        large_regex = "|".join(order_alternatives(sorted(
+            sorted(non_cond_regexes), key=lambda x: len(x) - x.find(")") + x.find("(")),
+            self.profile["recognize"].get(name, {})))
+        regexes = [(f"(?:{large_regex})", "")]
         # sorted(cond_regexes, key=lambda x: len(x["from"]) - x["from"].find(")") + x["from"].find("(")):
         for replacement_dict in cond_regexes:
-            output += f'    rei(r"^{replacement_dict["from"]}$"): {{"conditional": {replacement_dict["check_conditional"]}}},\n'
-        output += "}"
-        return output
+            regexes.append((replacement_dict["from"], replacement_dict["check_conditional"]))
+        return regexes
 
-    def get_recognizer_output(self, name, compl_name):
-        output = f'''def is_{name}(word{', is_word_plural=None' if name == "singular" else ''}):
-    """Detect whether `word` is in {name.replace("_", " ")} form.
+    def get_number_recognize_output(self, rules):
+        """
+        Get the combined regex of the plural and singular recognize rules, used by `classify_number`.
+        Every rule becomes an alternative in a named group, e.g. "plural_0", within one lookahead
+        per number, so a single match captures the first matching plural and singular rule.
+        """
+        lookaheads = []
+        output = ""
+        for name, replacement_suffixes in rules:
+            regexes = self.get_recognize_regexes(name, replacement_suffixes)
+            groups = [f"{name}_{index}" for index in range(len(regexes))]
+            # Captures within the rules are only needed by the conditionals, which get a match of
+            # the rule itself, so they're made non-capturing, which speeds up matching
+            alternatives = "|".join(
+                f"(?P<{group}>{CAPTURE_PAT.sub('(?:', regex)})" for group, (regex, _) in zip(groups, regexes))
+            # The empty alternative lets the lookahead succeed when no rule matches, which is
+            # faster than making the lookahead optional
+            lookaheads.append(f"(?=(?:{alternatives})$|)")
+            output += f"{name}_recognize_groups = (" + ", ".join(f'"{group}"' for group in groups) + ")\n\n"
+            # The first rule has no conditional, and only consists of suffixes, which the trie
+            # recognizes in time proportional to the length of the suffix
+            output += f"{name}_recognize_trie = SuffixTrie(next(iter({name}_recognize_rules)), [lambda subterms: True], " \
+                      f"[(0, [])] * {re.compile(regexes[0][0]).groups})\n\n"
+        output = f"number_recognize_regex = rei(r\"^{''.join(lookaheads)}\")\n\n" + output
+        output += '''def _first_recognize_rule(word: str, match: Optional[Match], groups: Tuple[str, ...], trie: SuffixTrie) -> Optional[int]:
+    """Get the index of the first recognize rule that may apply to `word`.
 
     Args:
         word (str): Input word or collocation.
+        match (Optional[Match]): Match of `number_recognize_regex` on `word`, or None if
+            `word` is long, in which case only the first rule is checked, using `trie`.
+        groups (Tuple[str, ...]): The names of the groups in `match` corresponding to the rules.
+        trie (SuffixTrie): Trie of the first rule, i.e. either `plural_recognize_trie` or
+            `singular_recognize_trie`.
 
     Returns:
-        bool: True if `word` is deemed {name.replace("_", " ")}.
+        Optional[int]: The index of the first rule that may apply, or None if no rule applies.
+            The first rule, without conditional, is only returned if it matches `word`.
     """
-    if known_{name}(word) or (not word.islower() and known_{name}(word.lower())):
-        return True
-'''
-        if compl_name:
-            output += f"""
-    if known_{compl_name}(word) or (not word.islower() and known_{compl_name}(word.lower())):
-        return False
+    if match is None:
+        return 0 if trie.convert(word, default=False) else 1
+    for index, group in enumerate(match.group(*groups)):
+        if group is not None:
+            return index
+    return None'''
+        return output
 
-    for rule in {name}_recognize_rules:
-        match = rule.match(word)
-        if match:
-            if not "conditional" in {name}_recognize_rules[rule] or {name}_recognize_rules[rule]["conditional"](match):
-                return True
+    def get_classifier_output(self):
+        return '''@memoize
+def classify_number(word: str) -> Tuple[bool, bool]:
+    """Detect whether `word` is in plural form, and whether it is in singular form.
+    Both are determined at once, using a single match of `number_recognize_regex`, or
+    for long words, using `plural_recognize_trie` and `singular_recognize_trie`.
+
+    Note that a word may be both, e.g. "sheep".
+
+    Args:
+        word (str): Input word or collocation.
 
+    Returns:
+        Tuple[bool, bool]: True if `word` is deemed plural, and True if `word` is deemed singular.
     """
+    is_known_plural = known_plural(word) or (not word.islower() and known_plural(word.lower()))
+    is_known_singular = known_singular(word) or (not word.islower() and known_singular(word.lower()))
+    if is_known_plural or is_known_singular:
+        return is_known_plural, is_known_singular
+
+    match = number_recognize_regex.match(word) if len(word) < long_input_length else None
+    recognized = []
+    for rules, groups, trie in ((plural_recognize_rules, plural_recognize_groups, plural_recognize_trie),
+                                (singular_recognize_rules, singular_recognize_groups, singular_recognize_trie)):
+        first = _first_recognize_rule(word, match, groups, trie)
+        is_recognized = first == 0
+        # The conditionals are called from here rather than from a helper function, as they
+        # classify subterms recursively, so each helper would cost a stack frame per nesting
+        # level of e.g. "son of a son of a gun". They don't apply to long words.
+        if first and (max_input_length is None or len(word) <= max_input_length):
+            for rule, options in list(rules.items())[first:]:
+                rule_match = rule.match(word)
+                if rule_match and (not "conditional" in options or options["conditional"](rule_match)):
+                    is_recognized = True
+                    break
+        recognized.append(is_recognized)
+    is_word_plural = recognized[0] or word.endswith(('s', 'S'))
+    is_word_singular = recognized[1] or not is_word_plural
+    return is_word_plural, is_word_singular'''
+
+    def get_recognizer_output(self, name):
+        index = 0 if name == "plural" else 1
+        extra_args = ""
+        deprecation = ""
         if name == "singular":
-            output += """if is_word_plural is not None:
-        return not is_word_plural
-    return not is_plural(word)"""
-        else:
-            output += "return word.endswith(('s', 'S'))"
+            extra_args = """
+        is_word_plural (Optional[bool], optional): Deprecated and ignored, as `classify_number`
+            determines whether `word` is plural as well. Defaults to None."""
+            deprecation = """
+    if is_word_plural is not None:
+        warnings.warn("The is_word_plural argument of is_singular is deprecated and ignored.",
+                      DeprecationWarning, stacklevel=3)"""
+        output = f'''@memoize
+def is_{name}(word{', is_word_plural=None' if name == "singular" else ''}):
+    """Detect whether `word` is in {name.replace("_", " ")} form, see `classify_number`.
+
+    Args:
+        word (str): Input word or collocation.{extra_args}
+
+    Returns:
+        bool: True if `word` is deemed {name.replace("_", " ")}.
+    """{deprecation}
+    return classify_number(word)[{index}]'''
         return output
 
 
@@ -923,6 +669,10 @@ class NounTestWriter(TestWriter):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate inflex/noun_core.py and its tests from lei/nouns.lei.")
+    parser.add_argument("--profile", help="JSON file of rule hits, as written by generate/record_profile.py")
+    args = parser.parse_args()
+
     in_fname = "lei//nouns.lei"
     out_fname = "inflex//noun_core.py"
     class_name = "Noun"
@@ -930,7 +680,7 @@ if __name__ == "__main__":
     reader = Reader(in_fname)
     reader.parse_file()
 
-    cwriter = CodeWriter(reader, out_fname)
+    cwriter = CodeWriter(reader, out_fname, profile=args.profile)
     cwriter.write_file()
 
     twriter = NounTestWriter(reader, class_name)
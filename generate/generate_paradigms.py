@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, Set, Tuple
+
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inflex import noun_core, paradigm_core, verb_core  # pylint: disable=C0413
+from inflex.noun import Noun  # pylint: disable=C0413
+from inflex.verb import Verb  # pylint: disable=C0413
+
+"""
+Precompute the forms of every noun and verb in the dictionaries of `noun_core` and `verb_core`,
+both lemmas and inflected forms, into `inflex/paradigm_core.py`. `Noun` and `Verb` return these
+forms directly for terms that exactly match a known word.
+
+The forms are computed by `Noun` and `Verb` themselves, so this must be run after
+`generate_nouns.py` and `generate_verbs.py`, and after any change to `Noun` or `Verb`::
+
+    python generate/generate_nouns.py
+    python generate/generate_verbs.py
+    python generate/generate_paradigms.py
+"""
+
+
+def get_words(tables: Iterable[Dict[str, str]]) -> Set[str]:
+    """Get the keys and values of the dictionaries of a core module.
+
+    Args:
+        tables (Iterable[Dict[str, str]]): Dictionaries, e.g. `noun_core.singular_of`.
+
+    Returns:
+        Set[str]: All words and collocations in `tables`, except for placeholders.
+    """
+    words = set()
+    for table in tables:
+        words.update(table.keys(), table.values())
+    return {word for word in words if word and word != "_"}
+
+
+def get_noun_paradigm(word: str) -> Tuple[str, str, str]:
+    noun = Noun(word)
+    return noun.plural(), noun.classical().plural(), noun.singular()
+
+
+def get_verb_paradigm(word: str) -> Tuple[str, str, str, str, str]:
+    verb = Verb(word)
+    return verb.singular(), verb.plural(), verb.past(), verb.pres_part(), verb.past_part()
+
+
+def get_paradigms_output(name: str, paradigms: Dict[str, Tuple[str, ...]]) -> str:
+    output = f"{name} = {{\n"
+    for word, paradigm in sorted(paradigms.items()):
+        assert all(isinstance(form, str) for form in paradigm), (word, paradigm)
+        output += f"    {json.dumps(word)}: ({', '.join(json.dumps(form) for form in paradigm)}),\n"
+    return output + "}\n"
+
+
+if __name__ == "__main__":
+    out_fname = "inflex//paradigm_core.py"
+
+    # Compute the forms without using the previously generated paradigms
+    paradigm_core.noun_paradigms.clear()
+    paradigm_core.verb_paradigms.clear()
+
+    noun_words = get_words([noun_core.modern_plural_of, noun_core.classical_plural_of, noun_core.singular_of])
+    verb_words = get_words([verb_core.plural_of, verb_core.singular_of, verb_core.past_of,
+                            verb_core.pres_part_of, verb_core.past_part_of])
+
+    version = datetime.strftime(datetime.now(), '%Y%m%d.%H%M%S')
+    generated_code = f'''\
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##########################################
+## NOTE: This module was autogenerated. ##
+## Contains no user-servicable parts!!! ##
+##########################################
+
+VERSION = {version}
+
+# The versions of the core modules from which the paradigms were computed. `Noun` and `Verb`
+# only use the paradigms if these match the versions of the imported core modules.
+noun_core_version = {noun_core.VERSION}
+verb_core_version = {verb_core.VERSION}
+
+# Mapping of every noun in the dictionaries of `noun_core` to its modern plural,
+# classical plural and singular form, as computed by `Noun`
+'''
+    generated_code += get_paradigms_output("noun_paradigms", {word: get_noun_paradigm(word) for word in noun_words})
+    generated_code += '''
+# Mapping of every verb in the dictionaries of `verb_core` to its singular, plural,
+# past, present participle and past participle form, as computed by `Verb`
+'''
+    generated_code += get_paradigms_output("verb_paradigms", {word: get_verb_paradigm(word) for word in verb_words})
+
+    with open(out_fname, "w+") as f:
+        f.write(generated_code)
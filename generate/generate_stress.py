@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import tempfile
+
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inflex.adjective import Adjective  # pylint: disable=C0413
+from inflex.stress_index import StressIndex  # pylint: disable=C0413
+from inflex.syllable import Syllable  # pylint: disable=C0413
+
+"""
+Convert the syllable stress data from cmudict_stress.json into the packed binary
+format read by `inflex.stress_index.StressIndex`, including the flags of each word
+as described in `Syllable.get_flags`.
+"""
+
+
+def compute_flags(word: str) -> int:
+    """Compute the flags of `word` using the runtime heuristics, which only rely on the
+    stress patterns of `word`.
+
+    Args:
+        word (str): A word from the stress data.
+
+    Returns:
+        int: Bitset of the flags of `word`.
+    """
+    flags = 0
+    if 1 in Syllable.count_syllables(word):
+        flags |= Syllable.ONE_SYLLABLE
+    if Syllable.ends_with_stress(word):
+        flags |= Syllable.ENDS_WITH_STRESS
+    if flags and Adjective._stem_double_regex.search(word):  # pylint: disable=W0212
+        flags |= Syllable.DOUBLES_FINAL_CONSONANT
+    if Adjective._guess_more_most(word):  # pylint: disable=W0212
+        flags |= Syllable.TAKES_MORE_MOST
+    return flags
+
+
+if __name__ == "__main__":
+    in_fname = "inflex//data//cmudict_stress.json"
+    out_fname = "inflex//data//cmudict_stress.bin"
+
+    with open(in_fname, "r", encoding="utf8") as f:
+        data = json.load(f)
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Write the stress patterns without flags, which is all the heuristics need
+        tmp_fname = os.path.join(directory, "cmudict_stress.bin")
+        StressIndex.write(data, tmp_fname)
+        Syllable._index = StressIndex(tmp_fname)  # pylint: disable=W0212
+        flags = {word: compute_flags(word) for word in data}
+        Syllable._index.close()  # pylint: disable=W0212
+        Syllable._index = None  # pylint: disable=W0212
+
+    StressIndex.write(data, out_fname, flags=flags)
+
+    # Verify that the written index reproduces the input data
+    index = StressIndex(out_fname)
+    for word, stresses in data.items():
+        assert index.get(word) == tuple(tuple(stress) for stress in stresses), word
+        assert index.get_flags(word) == flags[word], word
+    index.close()
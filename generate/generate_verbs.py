@@ -1,338 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import argparse
+import os
 import re
 import json
+import sys
 from datetime import datetime
 from typing import Dict, List, Set, Tuple, Optional
 
 from generate_tests import TestWriter
+from rule_order import SUFFIX_RULE_PAT, load_profile, order_alternatives, order_rules
 
-"""
-Compiled variants of useful regexes used all around this file
-"""
-xms  = re.VERBOSE | re.MULTILINE | re.DOTALL
-COMMENT_LINE_PAT = re.compile(r" \A \s* \#",         flags=xms)
-COMMENT_PAT      = re.compile(r" \# .* ",            flags=xms)
-BLANK_LINE_PAT   = re.compile(r" \A \s* $ ",         flags=xms)
-WS               = re.compile(r" [\s]* ",            flags=xms)
-WORD_SEQ         = re.compile(r" \S* (?: \s \S+)* ", flags=xms)
-DATA_PAT         = re.compile(r"""
-    \A
-        {WS}
-        ([*-])? ( {WORD_SEQ} )      # 3rd person singular
-        {WS}
-        ([*-])? ( {WORD_SEQ} )      # 3rd person plural
-        {WS}
-        ([*-])? ( {WORD_SEQ} )      # Simple past (preterite)
-        {WS}
-        ([*-])? ( {WORD_SEQ} )      # Present continuous participle
-        {WS}
-        ([*-])? ( {WORD_SEQ} )      # Past participle
-        {WS}
-        (?:{COMMENT_PAT})?          # Optional trailing comment
-    \Z
-""".format(WS=WS.pattern, WORD_SEQ=WORD_SEQ.pattern, COMMENT_PAT=COMMENT_PAT.pattern),
-    flags=xms)
-CONS = re.compile(r"\(CONS\)", flags=xms)
-VOWEL = re.compile(r"\(VOWEL\)", flags=xms)
-VOWELY = re.compile(r"\(VOWELY\)", flags=xms)
-DASH = re.compile(r"-")
-STAR = re.compile(r"\*")
-RESTRICT = re.compile(r"( \[.*?\] )+", flags=xms)
-SPLIT = re.compile(r"(.*?) [|] (.*)", flags=xms)
-
-
-class Word(object):
-    def __init__(self, gen: Optional[str], word: str):
-        super().__init__()
-        self.gen = gen
-        self.word = word
-        self.restrict = ""
-
-    def expand_dash_star(self) -> None:
-        """
-        Replace - and * with the proper regex variant in input gen: "-" -> ".+"
-        """
-        if not self.gen:
-            return
-        self.gen = DASH.sub(r".+", self.gen)
-        self.gen = STAR.sub(r"(?:.{2,})?", self.gen)
-
-    def expand_cons_vowel(self) -> None:
-        """
-        Replace (CONS), (VOWEL) and (VOWELS) macros in input verb, e.g. "(VOWEL)ys" -> "[aeiou]ys"
-        """
-        self.word = CONS.sub(r"[^aeiou]", self.word)
-        self.word = VOWEL.sub(r"[aeiou]", self.word)
-        self.word = VOWELY.sub(r"[aeiouy]", self.word)
-
-    def restrict_word(self) -> None:
-        """
-        Input verb (e.g. "[aeiou]ys") is split up into restriction (e.g. "[aeiou]") and remainder (e.g. "ys")
-        """
-        match = RESTRICT.search(self.word)
-        if match:
-            self.restrict = match.group()
-            self.word = RESTRICT.sub(r"", self.word, count=1)
-
-    def split(self) -> Optional[str]:
-        match = SPLIT.match(self.word)
-        if match:
-            self.word = match.group(1)
-            return match.group(2)
-        return None
-
-    def __str__(self) -> str:
-        return f"{self.gen or ''}{self.restrict}{self.word}"
-
-
-class Verb(object):
-    def __init__(self, match):
-        super().__init__()
-        """
-        Extract line information.
-
-        sing -> Singular
-        plur -> Plural
-        pret -> Preterite
-        pres -> Present participle
-        past -> Past participle
-
-        ..._gen holds "-" and "*" generator for suffixes, e.g. in "-ys" or "*melts"
-        """
-        types = ["sing", "plur", "pret", "pres", "past"]
-        self.verbs = {}
-        for i, key in enumerate(types):
-            # Get gen and verb of this word
-            gen = match.group(i * 2 + 1)
-            verb = match.group(i * 2 + 2)
-            # Turn into Word object and add to list for this type
-            w = Word(gen, verb)
-            self.verbs[key] = w
-            # It's possible this word can be split up, eg "was|were"
-            if key == "pret":
-                self.pret_plur = w.split()
-
-        """
-        For each word:
-        - Replace (CONS), (VOWEL) and (VOWELS) macros: "(VOWEL)ys" -> "[aeiou]ys"
-        - Replace - and * with the proper regex variant: "-ys" -> ".+ys"
-        - Split up word (e.g. "[aeiou]ys") into restriction (e.g. "[aeiou]") and remainder (e.g. "ys")
-        """
-        for word in self.verbs.values():
-            word.expand_cons_vowel()
-            word.expand_dash_star()
-            word.restrict_word()
-
-    def replace_hyphens(self, repl: str):
-        for word in self.verbs.values():
-            word.word = word.word.replace("-", repl)
-
-    def __getitem__(self, key):
-        return self.verbs[key]
-
-    def __getattribute__(self, name):
-        try:
-            return super().__getattribute__(name)
-        except AttributeError:
-            return self.verbs[name]
-
-    def has_gen(self) -> bool:
-        """
-        Returns true iff there is at least one verb between the five that is prefixed with * or -
-        """
-        return any(self.verbs[key].gen for key in self.verbs)
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    def __str__(self) -> str:
-        return "\n".join(f"{key: <9}: {self.verbs[key]}" for key in self.verbs) + (f"\npret_plur: {self.pret_plur}" if self.pret_plur else "")
-
-
-class Reader(object):
-    def __init__(self, fname: str):
-        types = ["plural", "singular", "past", "pres_part", "past_part"]
-        self.patterns: Dict[str, List[Dict[str, str]]] = {key: [] for key in types}
-        self.literals: Dict[str, Dict[str, str]] = {key: {} for key in types}
-        self.words: Dict[str, Set[str]] = {key: set() for key in types}
-        self.fname = fname
-
-    def get_readlines(self) -> List[str]:
-        with open(self.fname, "r") as f:
-            return f.readlines()
-
-    def parse_file(self):
-        """
-        Fill `pattern`, `literal` and `words`
-        """
-        lines = self.get_readlines()
-
-        for line in lines:
-            # Skip empty or comment lines
-            if COMMENT_LINE_PAT.match(line) or BLANK_LINE_PAT.match(line):
-                continue
-
-            # Extract data
-            match = DATA_PAT.match(line)
-            if match:
-                verb = Verb(match)
-            else:
-                # TODO: Change exception
-                raise Exception("Unknown input:", line)
-
-            if verb.has_gen():
-                self.optionally_add_pattern(self.patterns["plural"], {
-                    "is": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
-                    "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
-                    "to": f'"{verb.plur.word}"'
-                })
-                self.optionally_add_pattern(self.patterns["singular"], {
-                    "is": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
-                    "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
-                    "to": f'"{verb.sing.word}"'
-                })
-                if verb.pret.word != "_":
-                    self.optionally_add_pattern(self.patterns["past"], {
-                        "is": f"({verb.pret.gen}{verb.pret.restrict}){verb.pret.word}",
-                        "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
-                        "to": f'"{verb.pret.word}"'
-                    })
-                    self.optionally_add_pattern(self.patterns["past"], {
-                        "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
-                        "to": f'"{verb.pret.word}"'
-                    })
-                    """
-                    self.optionally_add_pattern(self.patterns["singular"], {
-                        "from": f"({verb.pret.gen}{verb.pret.restrict}){verb.pret.word}",
-                        "to": f'"{verb.sing.word}"'
-                    })
-                    self.optionally_add_pattern(self.patterns["plural"], {
-                        "from": f"({verb.pret.gen}{verb.pret.restrict}){verb.pret.word}",
-                        "to": f'"{verb.plur.word}"'
-                    })
-                    """
-                if verb.pres.word != "_":
-                    self.optionally_add_pattern(self.patterns["pres_part"], {
-                        "is": f"({verb.pres.gen}{verb.pres.restrict}){verb.pres.word}",
-                        "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
-                        "to": f'"{verb.pres.word}"'
-                    })
-                    self.optionally_add_pattern(self.patterns["pres_part"], {
-                        "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
-                        "to": f'"{verb.pres.word}"'
-                    })
-                    """
-                    self.optionally_add_pattern(self.patterns["singular"], {
-                        "from": f"({verb.pres.gen}{verb.pres.restrict}){verb.pres.word}",
-                        "to": f'"{verb.sing.word}"'
-                    })
-                    self.optionally_add_pattern(self.patterns["plural"], {
-                        "from": f"({verb.pres.gen}{verb.pres.restrict}){verb.pres.word}",
-                        "to": f'"{verb.plur.word}"'
-                    })
-                    """
-                if verb.past.word != "_":
-                    self.optionally_add_pattern(self.patterns["past_part"], {
-                        "is": f"({verb.past.gen}{verb.past.restrict}){verb.past.word}",
-                        "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
-                        "to": f'"{verb.past.word}"'
-                    })
-                    self.optionally_add_pattern(self.patterns["past_part"], {
-                        "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
-                        "to": f'"{verb.past.word}"'
-                    })
-                    """
-                    self.optionally_add_pattern(self.patterns["singular"], {
-                        "from": f"({verb.past.gen}{verb.past.restrict}){verb.past.word}",
-                        "to": f'"{verb.sing.word}"'
-                    })
-                    self.optionally_add_pattern(self.patterns["plural"], {
-                        "from": f"({verb.past.gen}{verb.past.restrict}){verb.past.word}",
-                        "to": f'"{verb.plur.word}"'
-                    })
-                    """
-
-            if not (verb.sing.gen and verb.plur.gen and verb.pret.gen):
-                self.add_literals_and_words(verb)
-
-                # If there is a hyphen in the singular verb, replace the hyphens
-                # in all verbs, and add those to the literals and words too
-                if "-" in verb.sing.word:
-                    verb.replace_hyphens(" ")
-                    self.add_literals_and_words(verb)
-
-    def optionally_add_pattern(self, collection, dict_to_add):
-        if dict_to_add["from"] not in (pattern["from"] for pattern in collection):
-            collection.append(dict_to_add)
-
-    def optionally_add_literal(self, collection, key, word):
-        if key == "_" or word == "_":
-            return
-        if key not in collection:
-            collection[key] = word
-
-    def add_literals_and_words(self, verb):
-        self.optionally_add_literal(
-            self.literals["plural"], verb.sing.word, verb.plur.word)
-        self.optionally_add_literal(
-            self.literals["singular"], verb.plur.word, verb.sing.word)
-
-        self.words["singular"].add(verb.sing.word)
-        self.words["plural"].add(verb.plur.word)
-
-        if verb.pret.word:
-            self.words["past"].add(verb.pret.word)
-
-            self.optionally_add_literal(
-                self.literals["past"], verb.sing.word, verb.pret.word)
-            self.optionally_add_literal(
-                self.literals["past"], verb.past.word, verb.pret.word)
-            self.optionally_add_literal(
-                self.literals["past"], verb.pres.word, verb.pret.word)
-            self.optionally_add_literal(
-                self.literals["past"], verb.past.word, verb.pret.word)
-
-            if verb.pret_plur:
-                self.optionally_add_literal(
-                    self.literals["past"], verb.plur.word, verb.pret_plur)
-                self.words["past"].add(verb.pret_plur)
-            else:
-                self.optionally_add_literal(
-                    self.literals["past"], verb.plur.word, verb.pret.word)
-
-        if verb.pres.word:
-            self.words["pres_part"].add(verb.pres.word)
-
-            self.optionally_add_literal(
-                self.literals["pres_part"], verb.sing.word, verb.pres.word)
-            self.optionally_add_literal(
-                self.literals["pres_part"], verb.plur.word, verb.pres.word)
-            self.optionally_add_literal(
-                self.literals["pres_part"], verb.pret.word, verb.pres.word)
-            self.optionally_add_literal(
-                self.literals["pres_part"], verb.pres.word, verb.pres.word)
-            self.optionally_add_literal(
-                self.literals["pres_part"], verb.past.word, verb.pres.word)
-
-        if verb.past.word:
-            self.words["past_part"].add(verb.past.word)
-
-            self.optionally_add_literal(
-                self.literals["past_part"], verb.sing.word, verb.past.word)
-            self.optionally_add_literal(
-                self.literals["past_part"], verb.plur.word, verb.past.word)
-            self.optionally_add_literal(
-                self.literals["past_part"], verb.pret.word, verb.past.word)
-            self.optionally_add_literal(
-                self.literals["past_part"], verb.pres.word, verb.past.word)
-            self.optionally_add_literal(
-                self.literals["past_part"], verb.past.word, verb.past.word)
+from inflex.verb_lei import Reader  # pylint: disable=C0413
 
 
 class CodeWriter(object):
-    def __init__(self, reader, fname):
+    # The forms of which the conversion rules are merged into `paradigm_convert_rule_regex`
+    paradigm_names = ["past", "pres_part", "past_part"]
+
+    def __init__(self, reader, fname, profile: Optional[str] = None):
         super().__init__()
         self.reader = reader
         self.fname = fname
+        # Rule hits as recorded by `record_profile.py`, used to order the rules
+        self.profile: Dict[str, Dict[str, Dict[str, int]]] = load_profile(profile)
 
     def write_file(self):
         version = datetime.strftime(datetime.now(), '%Y%m%d.%H%M%S')
@@ -345,7 +40,9 @@ class CodeWriter(object):
 ## Contains no user-servicable parts!!! ##
 ##########################################
 
-import re
+from inflex.cache import memoize
+from inflex.lazy_regex import lazy_compile
+from inflex.suffix_buckets import SuffixBuckets
 
 VERSION = {version}
 
@@ -359,6 +56,8 @@ VERSION = {version}
             generated_code += self.get_convert_rule_output(
                 key, self.reader.patterns[key]) + "\n\n"
 
+        generated_code += self.get_paradigm_rule_output() + "\n\n"
+
         for key in self.reader.literals:
             generated_code += self.get_recognize_rule_output(
                 key, self.reader.patterns[key]) + "\n\n"
@@ -446,7 +145,9 @@ def known_pres_part(word):
         generated_code += self.get_recognizer_output(
             "pres_part", None, self.reader.literals["pres_part"]) + "\n\n"
         generated_code += self.get_recognizer_output(
-            "past_part", None, self.reader.literals["past_part"]) + "\n"
+            "past_part", None, self.reader.literals["past_part"]) + "\n\n"
+
+        generated_code += self.get_paradigm_output() + "\n"
 
         self.output_code(generated_code)
 
@@ -467,7 +168,9 @@ def known_pres_part(word):
                    .replace("pres", "present")\
                    .replace("part", "participle")
 
-    def get_convert_rule_output(self, name, replacement_suffixes):
+    def get_convert_rules(self, replacement_suffixes) -> Tuple[List[str], List[str]]:
+        """Return the conversion regexes in the order in which they should be tried, and their outputs.
+        """
         regexes = []
         outputs = []
         for replacement_dict in sorted(replacement_suffixes, key=lambda x: len(x["from"]) - x["from"].rfind(")") + x["from"].find("("), reverse=True):
@@ -476,14 +179,54 @@ def known_pres_part(word):
                 outputs.append(replacement_dict["to"])
 
             # output += f'    re.compile(r"^{replacement_dict["from"]}$"): {replacement_dict["to"]},\n'
-        output = f"{name}_convert_rule_regex = re.compile(r\"^(?:{'|'.join(regexes)})$\")\n\n"
+        return regexes, outputs
+
+    def get_ordered_convert_rules(self, name: str) -> Tuple[List[str], List[str]]:
+        """Return the conversion regexes for `name` and their outputs, in the order of `get_convert_rules`,
+        except that frequently used rules are moved forward if a profile is given. The past and participle
+        forms keep the relative order of the merged paradigm rules.
+        """
+        regexes, outputs = self.get_convert_rules(self.reader.patterns[name])
+        if name in self.paradigm_names:
+            merged = self.get_paradigm_rules()
+            order = sorted(range(len(regexes)), key=lambda index: merged.index(regexes[index]))
+        else:
+            order = order_rules(regexes, self.profile["convert"].get(name, {}))
+        return [regexes[index] for index in order], [outputs[index] for index in order]
+
+    def get_buckets_output(self, name: str, regex_name: str, regexes: List[str]) -> str:
+        """
+        Get the `SuffixBuckets` called `name` of the rule regex `regex_name`, with as `regexes` its alternatives.
+        Every rule is keyed on the last (up to) three characters of its literal suffix, and the
+        bucket of each key holds the indices of the rules of which the key is an ending of that key.
+        """
+        keys = []
+        for regex in regexes:
+            if not re.compile(regex).groups:
+                raise ValueError(f"The rule {regex!r} has no capture group.")
+            match = SUFFIX_RULE_PAT.match(regex)
+            # Rules that aren't suffix rules may match any word
+            keys.append(match.group("suffix")[-3:] if match else "")
+
+        output = f"{name} = SuffixBuckets({regex_name}, {{"
+        for key in sorted(set(keys) | {""}):
+            endings = {key[i:] for i in range(len(key) + 1)}
+            indices = tuple(index for index, rule_key in enumerate(keys) if rule_key in endings)
+            output += f'\n    "{key}": {indices},'
+        return output + "\n})"
+
+    def get_convert_rule_output(self, name, replacement_suffixes):
+        regexes, outputs = self.get_ordered_convert_rules(name)
+        output = f"{name}_convert_rule_regex = lazy_compile(r\"^(?:{'|'.join(regexes)})$\")\n\n"
 
         output += f"{name}_convert_outputs = [" + ''.join(
-            '\n    ' + output + ',' for output in outputs) + "\n]"
+            '\n    ' + output + ',' for output in outputs) + "\n]\n\n"
+        output += self.get_buckets_output(f"{name}_convert_buckets", f"{name}_convert_rule_regex", regexes)
         return output
 
     def get_converter_output(self, name, replacement_suffixes):
         output = f'''\
+@memoize
 def convert_to_{name}(word):
     """Convert `word` to {self.normalize_name(name)} form.
 
@@ -507,11 +250,10 @@ def convert_to_{name}(word):
         return word
     """
 
-        output += f"""match = {name}_convert_rule_regex.match(word.lower())
-    if match:
-        for i, group in enumerate(match.groups()):
-            if group is not None:
-                return group + {name}_convert_outputs[i]
+        output += f"""rule = {name}_convert_buckets.match(word.lower())
+    if rule:
+        index, stem = rule
+        return stem + {name}_convert_outputs[index]
     return None"""
         return output
 
@@ -520,15 +262,155 @@ def convert_to_{name}(word):
         """
         regexes = (replacement_dict["is"] for replacement_dict in replacement_suffixes if "is" in replacement_dict)
         for regex in sorted(regexes, key=lambda x: len(x) - x.rfind(")") + x.find("(")):
-            output += f'    re.compile(r"^{regex}$"),\n'
+            output += f'    lazy_compile(r"^{regex}$"),\n'
+        """
+        regexes = order_alternatives(sorted(sorted(replacement_dict["is"] for replacement_dict in replacement_suffixes if "is" in replacement_dict), key=lambda x: len(
+            x) - x.rfind(")") + x.find("(")), self.profile["recognize"].get(name, {}))
+        output += f'lazy_compile(r"^(?:{"|".join(regexes)})$")\n\n'
+        output += self.get_buckets_output(f"{name}_recognize_buckets", f"{name}_recognize_rule", regexes)
+        return output
+
+    def get_paradigm_rules(self) -> List[str]:
+        """
+        Merge the conversion regexes of the past, present participle and past participle forms,
+        keeping the relative order of the regexes for each form. If a profile is given, then
+        frequently used rules are moved forward, based on the hits of all three forms.
         """
-        regex = '|'.join(sorted(sorted(replacement_dict["is"] for replacement_dict in replacement_suffixes if "is" in replacement_dict), key=lambda x: len(
-            x) - x.rfind(")") + x.find("(")))
-        output += f're.compile(r"^(?:{regex})$")'
+        rules = [self.get_convert_rules(self.reader.patterns[name])[0] for name in self.paradigm_names]
+
+        merged = []
+        for regexes in rules:
+            for i, regex in enumerate(regexes):
+                if regex not in merged:
+                    merged.insert(merged.index(regexes[i - 1]) + 1 if i else 0, regex)
+        for regexes in rules:
+            if [regex for regex in merged if regex in regexes] != regexes:
+                raise ValueError("The rule order differs between the past and participle forms.")
+
+        hits: Dict[str, int] = {}
+        for name in self.paradigm_names:
+            for regex, count in self.profile["convert"].get(name, {}).items():
+                hits[regex] = hits.get(regex, 0) + count
+        return [merged[index] for index in order_rules(merged, hits)]
+
+    def get_paradigm_rule_output(self):
+        """
+        The past, present participle and past participle conversion rules are (nearly) identical,
+        so they are merged into one regex. Matching that regex once gives the suffix for all three
+        forms, or None for a form which does not have the matched rule.
+        """
+        names = self.paradigm_names
+        rules = {name: self.get_ordered_convert_rules(name) for name in names}
+        merged = self.get_paradigm_rules()
+
+        outputs = []
+        for regex in merged:
+            outputs.append(tuple(
+                rules[name][1][rules[name][0].index(regex)] if regex in rules[name][0] else "None"
+                for name in names
+            ))
+
+        output = f"paradigm_convert_rule_regex = lazy_compile(r\"^(?:{'|'.join(merged)})$\")\n\n"
+        output += "paradigm_convert_outputs = [" + ''.join(
+            f'\n    ({", ".join(output)}),' for output in outputs) + "\n]\n\n"
+        output += self.get_buckets_output("paradigm_convert_buckets", "paradigm_convert_rule_regex", merged)
+        return output
+
+    def get_paradigm_output(self):
+        output = '''\
+def _convert_with_rules(word, lword, literals, is_form, convert_buckets, convert_outputs):
+    """Convert `word` using `literals` and the conversion rules, as in the `convert_to_...` functions.
+
+    Args:
+        word (str): Input word.
+        lword (str): `word` in lowercase.
+        literals (Dict[str, str]): Known conversions, e.g. `plural_of`.
+        is_form (Optional[Callable[[str], bool]]): If this returns True for `word`,
+            then `word` is already in the target form.
+        convert_buckets (SuffixBuckets): The conversion rules, e.g. `plural_convert_buckets`.
+        convert_outputs (List[str]): The suffixes for each conversion rule.
+
+    Returns:
+        Optional[str]: The converted `word`, or None if it can't be converted.
+    """
+    if word in literals:
+        return literals[word]
+    if lword in literals:
+        return literals[lword]
+    if is_form is not None and is_form(word):
+        return word
+    rule = convert_buckets.match(lword)
+    if rule:
+        index, stem = rule
+        return stem + convert_outputs[index]
+    return None
+
+paradigm_forms = ("singular", "plural", "past", "pres_part", "past_part")
+
+def convert_to_paradigm(word, forms=paradigm_forms):
+    """Convert `word` to several forms at once, e.g. to its past, present participle and past participle.
+
+    Note:
+        The output is identical to calling the `convert_to_...` functions on `word`,
+        but `word` is only lowercased once, and the past, present participle and
+        past participle forms share one match of `paradigm_convert_buckets`.
+
+    Args:
+        word (str): Input word.
+        forms (Tuple[str, ...], optional): The forms to convert to, out of "singular", "plural",
+            "past", "pres_part" and "past_part". Defaults to all of them.
+
+    Returns:
+        Dict[str, Optional[str]]: Mapping of each form in `forms` to the corresponding form
+            of `word`, or to None if `word` can't be converted to that form.
+    """
+    lword = word.lower()
+    converted = {}
+    if "singular" in forms:
+        converted["singular"] = _convert_with_rules(word, lword, singular_of, None,
+                                                    singular_convert_buckets,
+                                                    singular_convert_outputs)
+    if "plural" in forms:
+        converted["plural"] = _convert_with_rules(word, lword, plural_of, known_plural,
+                                                  plural_convert_buckets,
+                                                  plural_convert_outputs)
+
+    remaining = []
+    for i, (name, literals, is_form, convert_buckets, convert_outputs) in enumerate((
+        ("past", past_of, is_past, past_convert_buckets, past_convert_outputs),
+        ("pres_part", pres_part_of, is_pres_part, pres_part_convert_buckets, pres_part_convert_outputs),
+        ("past_part", past_part_of, is_past_part, past_part_convert_buckets, past_part_convert_outputs),
+    )):
+        if name not in forms:
+            continue
+        if word in literals:
+            converted[name] = literals[word]
+        elif lword in literals:
+            converted[name] = literals[lword]
+        elif is_form(word):
+            converted[name] = word
+        else:
+            converted[name] = None
+            remaining.append((i, name, convert_buckets, convert_outputs))
+
+    if remaining:
+        rule = paradigm_convert_buckets.match(lword)
+        if rule:
+            j, stem = rule
+            for i, name, convert_buckets, convert_outputs in remaining:
+                if paradigm_convert_outputs[j][i] is not None:
+                    converted[name] = stem + paradigm_convert_outputs[j][i]
+                else:
+                    # The matched rule does not exist for this form
+                    converted[name] = _convert_with_rules(word, lword, {}, None,
+                                                          convert_buckets,
+                                                          convert_outputs)
+    return converted'''
         return output
 
     def get_recognizer_output(self, name, compl_name, replacement_suffixes):
         output = f'''\
+@memoize
 def is_{name}(word: str):
     """Detect whether `word` is in {self.normalize_name(name)} form.
 
@@ -545,7 +427,7 @@ def is_{name}(word: str):
     if known_{compl_name}(word):
         return False"""
         output += f"""
-    if {name}_recognize_rule.match(word):
+    if {name}_recognize_buckets.match(word):
         return True
 """
         if name == "singular":
@@ -810,13 +692,17 @@ class VerbTestWriter(TestWriter):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate inflex/verb_core.py and its tests from lei/verbs.lei.")
+    parser.add_argument("--profile", help="JSON file of rule hits, as written by generate/record_profile.py")
+    args = parser.parse_args()
+
     in_fname = "lei//verbs.lei"
     out_fname = "inflex//verb_core.py"
     class_name = "Verb"
     reader = Reader(in_fname)
     reader.parse_file()
 
-    cwriter = CodeWriter(reader, out_fname)
+    cwriter = CodeWriter(reader, out_fname, profile=args.profile)
     cwriter.write_file()
 
     twriter = VerbTestWriter(reader, class_name)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Pattern
+
+# Allow importing `inflex` when running this file from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inflex import noun_core, verb_core  # pylint: disable=C0413
+from inflex.suffix_trie import split_alternatives  # pylint: disable=C0413
+
+"""
+Record which generated rules are hit by a corpus of terms, e.g. extracted from request logs,
+as a profile for `generate_nouns.py --profile` or `generate_verbs.py --profile`, which
+then move frequently hit rules forward. See `rule_order.py` for the format of the profile.
+
+Usage::
+
+    python generate/record_profile.py nouns terms.txt -o noun_profile.json
+    python generate/generate_nouns.py --profile noun_profile.json
+
+The input files contain one term per line. Terms that are converted or recognized through
+the literal tables, e.g. `modern_plural_of`, never reach the rules, and are not counted.
+"""
+
+
+class RuleSet(object):
+    def __init__(self, regex: Pattern[str], skip: Callable[[str], bool], lower: bool = False):
+        """
+        Args:
+            regex (Pattern[str]): The generated regex of the rules, of the form `^(?:...|...)$`.
+            skip (Callable[[str], bool]): True for terms that are handled before the rules are tried.
+            lower (bool, optional): Whether the rules are matched against the lowercased term.
+                Defaults to False.
+        """
+        super().__init__()
+        self.regex = regex
+        self.skip = skip
+        self.lower = lower
+        self.rules = split_alternatives(regex.pattern)
+        # The index of the rule to which each capture group belongs
+        self.group_rules: List[int] = []
+        for index, rule in enumerate(self.rules):
+            self.group_rules += [index] * re.compile(rule).groups
+
+    def hit(self, term: str) -> Optional[str]:
+        """Get the rule that is hit by `term`, i.e. the first rule that matches it.
+
+        Args:
+            term (str): Input term.
+
+        Returns:
+            Optional[str]: The rule regex, or None if `term` is not matched by any rule.
+        """
+        if self.skip(term):
+            return None
+        if self.lower:
+            term = term.lower()
+        match = self.regex.match(term)
+        if not match:
+            return None
+        for group, value in enumerate(match.groups()):
+            if value is not None:
+                return self.rules[self.group_rules[group]]
+        # The matching rule has no capture groups, so try the rules one by one
+        for rule in self.rules:
+            if re.match(f"^(?:{rule})$", term, flags=self.regex.flags):
+                return rule
+        return None
+
+
+def literal(literals: Dict[str, str]) -> Callable[[str], bool]:
+    return lambda term: term in literals or term.lower() in literals
+
+
+def get_rule_sets(kind: str) -> Dict[str, Dict[str, RuleSet]]:
+    """Get the rule sets of the generated `noun_core` or `verb_core` module.
+
+    Args:
+        kind (str): Either "nouns" or "verbs".
+
+    Returns:
+        Dict[str, Dict[str, RuleSet]]: Mapping of "convert" and "recognize" to the rule sets,
+            by name as used by the corresponding generator.
+    """
+    if kind == "nouns":
+        core = noun_core
+        return {
+            "convert": {
+                name: RuleSet(getattr(core, f"{name}_convert_rule_regex"), literal(getattr(core, f"{name}_of")))
+                for name in ("modern_plural", "classical_plural", "singular")
+            },
+            # Only the first recognize rule, which combines the rules without conditional, is ordered
+            "recognize": {
+                name: RuleSet(next(iter(getattr(core, f"{name}_recognize_rules"))),
+                              lambda term: core.known_plural(term) or core.known_plural(term.lower())
+                              or core.known_singular(term) or core.known_singular(term.lower()))
+                for name in ("plural", "singular")
+            },
+        }
+
+    core = verb_core
+    names = ("singular", "plural", "past", "pres_part", "past_part")
+    return {
+        "convert": {
+            name: RuleSet(getattr(core, f"{name}_convert_rule_regex"), literal(getattr(core, f"{name}_of")), lower=True)
+            for name in names
+        },
+        "recognize": {
+            name: RuleSet(getattr(core, f"{name}_recognize_rule"), getattr(core, f"known_{name}"))
+            for name in names
+        },
+    }
+
+
+def read_terms(fnames: Iterable[str]) -> Counter:
+    """Count the terms in the input files, with one term per line.
+
+    Args:
+        fnames (Iterable[str]): Paths of the input files.
+
+    Returns:
+        Counter: The number of occurrences of each term.
+    """
+    terms: Counter = Counter()
+    for fname in fnames:
+        with open(fname, "r", encoding="utf8") as f:
+            terms.update(line.strip() for line in f if line.strip())
+    return terms
+
+
+def record_profile(kind: str, terms: Counter) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Count the hits of each rule for `terms`.
+
+    Args:
+        kind (str): Either "nouns" or "verbs".
+        terms (Counter): The number of occurrences of each term.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, int]]]: The profile, i.e. the mapping of "convert" and
+            "recognize" to the hits of each rule regex, per rule set.
+    """
+    profile: Dict[str, Dict[str, Dict[str, int]]] = {}
+    for category, rule_sets in get_rule_sets(kind).items():
+        profile[category] = {}
+        for name, rule_set in rule_sets.items():
+            hits: Counter = Counter()
+            for term, count in terms.items():
+                rule = rule_set.hit(term)
+                if rule is not None:
+                    hits[rule] += count
+            profile[category][name] = dict(hits.most_common())
+    return profile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record the rule hits of a corpus of terms as a profile.")
+    parser.add_argument("kind", choices=["nouns", "verbs"], help="Which generated rules to record")
+    parser.add_argument("fnames", nargs="+", help="Input files, with one term per line")
+    parser.add_argument("-o", "--output", required=True, help="Output JSON profile")
+    args = parser.parse_args()
+
+    profile = record_profile(args.kind, read_terms(args.fnames))
+    with open(args.output, "w", encoding="utf8") as f:
+        json.dump(profile, f, indent=4)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import heapq
+import json
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+"""
+Profile-guided ordering of the generated rules.
+
+Python's `re` tries the alternatives of a regex from left to right, so words that end up
+matching a frequently used rule pay for every rule in front of it. Given a profile, i.e.
+a JSON file as written by `record_profile.py` of the form::
+
+    {
+        "convert": {"<rule set>": {"<rule regex>": <hits>, ...}, ...},
+        "recognize": {"<rule set>": {"<rule regex>": <hits>, ...}, ...}
+    }
+
+the generators move frequently hit rules forward. Conversion rules are ordered: The first
+rule that matches determines the output. So a rule is only ever moved in front of another
+rule if no word can match both of them. Recognition rules only determine whether any rule
+matches, so they may be ordered freely.
+
+Without profile, or for rules without hits, the original order is kept.
+"""
+
+# Matches rules of the shape `(<generic><restriction>)<suffix>`, e.g. "(.+[aeiou])o",
+# "(.*)staff" or "((?:.{2,})?)believe". Other rules, e.g. "son-of-a-(.*?)", are
+# assumed to possibly match the same words as any other rule, as are rules with ranges or
+# escapes in their character classes, e.g. "(.+[a-z])s".
+SUFFIX_RULE_PAT = re.compile(r"""
+    \A
+    \( (?: \.[*+]\?? | \(\?:\.\{\d+,\}\)\? ) (?P<restrict> (?:\[[^\]]+\])* ) \)
+    (?P<suffix> [^\\()\[\]{}|.*+?^$]* )
+    \Z
+""", flags=re.VERBOSE)
+
+
+def load_profile(fname: Optional[str]) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Load a profile as written by `record_profile.py`.
+
+    Args:
+        fname (Optional[str]): Path to the JSON profile, or None for an empty profile.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, int]]]: Mapping of "convert" and "recognize" to the hits
+            of each rule regex, per rule set.
+    """
+    profile = {"convert": {}, "recognize": {}}
+    if fname:
+        with open(fname, "r", encoding="utf8") as f:
+            profile.update(json.load(f))
+    return profile
+
+
+def _tail(rule: str) -> Optional[List[Tuple[bool, FrozenSet[str]]]]:
+    """Get the characters a word must end with to match `rule`, from the last character
+    to the first, as tuples of whether the set of characters is negated, and the set.
+
+    Args:
+        rule (str): Rule regex, without anchors.
+
+    Returns:
+        Optional[List[Tuple[bool, FrozenSet[str]]]]: The required ending of the word,
+            or None if `rule` is not a suffix rule, or if it has a character class with
+            a range or escape, e.g. "[a-z]" or "[\\w]", which are not expanded here.
+    """
+    match = SUFFIX_RULE_PAT.match(rule)
+    if not match:
+        return None
+    char_classes = re.findall(r"\[([^\]]+)\]", match.group("restrict"))
+    if any("-" in char_class or "\\" in char_class for char_class in char_classes):
+        return None
+    tail = [(False, frozenset(char)) for char in reversed(match.group("suffix").lower())]
+    for char_class in reversed(char_classes):
+        negated = char_class.startswith("^")
+        tail.append((negated, frozenset(char_class.lstrip("^").lower())))
+    return tail
+
+
+def _overlap(first: Tuple[bool, FrozenSet[str]], second: Tuple[bool, FrozenSet[str]]) -> bool:
+    """True if a character can be in both (possibly negated) sets of characters.
+    """
+    (first_negated, first_chars), (second_negated, second_chars) = first, second
+    if first_negated and second_negated:
+        return True
+    if first_negated:
+        return bool(second_chars - first_chars)
+    if second_negated:
+        return bool(first_chars - second_chars)
+    return bool(first_chars & second_chars)
+
+
+def rules_overlap(first: str, second: str) -> bool:
+    """True if a word may match both rules. This may give false positives, e.g. because
+    the minimum length of the words is ignored, but no false negatives.
+
+    Examples:
+        >>> rules_overlap("(.+)ies", "(.+[^e])s")
+        False
+        >>> rules_overlap("(.*)staff", "(.+)ff")
+        True
+
+    Args:
+        first (str): Rule regex, without anchors.
+        second (str): Rule regex, without anchors.
+
+    Returns:
+        bool: False if no word can match both rules.
+    """
+    first_tail, second_tail = _tail(first), _tail(second)
+    if first_tail is None or second_tail is None:
+        return True
+    return all(_overlap(first_char, second_char) for first_char, second_char in zip(first_tail, second_tail))
+
+
+def order_rules(rules: List[str], hits: Dict[str, int]) -> List[int]:
+    """Order the conversion `rules` by decreasing number of `hits`, as far as that does
+    not change which rule matches a word first.
+
+    Args:
+        rules (List[str]): Rule regexes, without anchors, in their original order.
+        hits (Dict[str, int]): Number of hits per rule regex. Missing rules have 0 hits.
+
+    Returns:
+        List[int]: The indices of `rules` in the new order.
+    """
+    if not hits:
+        return list(range(len(rules)))
+
+    # The number of preceding rules that must remain in front of each rule, and the inverse
+    waiting = [0] * len(rules)
+    successors: List[List[int]] = [[] for _ in rules]
+    for second in range(len(rules)):
+        for first in range(second):
+            if rules_overlap(rules[first], rules[second]):
+                waiting[second] += 1
+                successors[first].append(second)
+
+    # The priority of a rule is the largest number of hits of the rule itself, and of the
+    # rules that must remain behind it, so rules blocking a frequently hit rule go first too
+    priority = [hits.get(rule, 0) for rule in rules]
+    for index in reversed(range(len(rules))):
+        for successor in successors[index]:
+            priority[index] = max(priority[index], priority[successor])
+
+    # Among the rules that may be placed next, place the one with the highest priority first,
+    # and otherwise the one that came first originally
+    order = []
+    heap = [(-priority[index], index) for index in range(len(rules)) if not waiting[index]]
+    heapq.heapify(heap)
+    while heap:
+        _, index = heapq.heappop(heap)
+        order.append(index)
+        for successor in successors[index]:
+            waiting[successor] -= 1
+            if not waiting[successor]:
+                heapq.heappush(heap, (-priority[successor], successor))
+    return order
+
+
+def order_alternatives(rules: List[str], hits: Dict[str, int]) -> List[str]:
+    """Order the recognition `rules` by decreasing number of `hits`. Unlike `order_rules`,
+    any order is allowed, as only whether any of the rules matches is relevant.
+
+    Args:
+        rules (List[str]): Rule regexes, without anchors, in their original order.
+        hits (Dict[str, int]): Number of hits per rule regex. Missing rules have 0 hits.
+
+    Returns:
+        List[str]: `rules` in the new order.
+    """
+    return sorted(rules, key=lambda rule: -hits.get(rule, 0))
@@ -3,13 +3,112 @@ Import the Noun, Verb and Adjective classes from the relevant files,
 allowing for::
 
     >>> from inflex import Noun, Verb, Adjective
+
+as well as:
+
+* stateless functions such as `inflex.noun_plural(word)`, see `inflex.functions`,
+* `inflex.load_lexicon(path)` to add domain vocabulary, see `inflex.lexicon`,
+* `inflex.lemmatize(token)` to find the lemma of a noun or verb, see `inflex.lemmatizer`,
+* `inflex.Matcher(lemmas)` to find every form of many lemmas in a text, see `inflex.matcher`.
+
+These classes, and the large generated modules they rely on, are only imported
+when they are first accessed. Use `inflex.preload()` to load everything eagerly,
+e.g. before forking worker processes.
 """
 __all__ = [
     "Noun",
     "Verb",
     "Adjective",
+    "Matcher",
+    "noun_singular",
+    "noun_plural",
+    "verb_singular",
+    "verb_plural",
+    "verb_past",
+    "verb_pres_part",
+    "verb_past_part",
+    "adj_singular",
+    "adj_plural",
+    "adj_comparative",
+    "adj_superlative",
+    "load_lexicon",
+    "lemmatize",
+    "lemmatize_all",
+    "preload",
 ]
 
-from inflex.noun import Noun
-from inflex.verb import Verb
-from inflex.adjective import Adjective
+__version__ = "1.0.6"
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, List
+
+# Maps lazily imported attributes to the module that defines them
+_lazy_attributes = {
+    "Noun": "inflex.noun",
+    "Verb": "inflex.verb",
+    "Adjective": "inflex.adjective",
+    "Matcher": "inflex.matcher",
+    "noun_singular": "inflex.functions",
+    "noun_plural": "inflex.functions",
+    "verb_singular": "inflex.functions",
+    "verb_plural": "inflex.functions",
+    "verb_past": "inflex.functions",
+    "verb_pres_part": "inflex.functions",
+    "verb_past_part": "inflex.functions",
+    "adj_singular": "inflex.functions",
+    "adj_plural": "inflex.functions",
+    "adj_comparative": "inflex.functions",
+    "adj_superlative": "inflex.functions",
+    "load_lexicon": "inflex.lexicon",
+    "lemmatize": "inflex.lemmatizer",
+    "lemmatize_all": "inflex.lemmatizer",
+}
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    # Module-level __getattr__ (PEP 562) requires Python 3.7
+    from inflex.noun import Noun
+    from inflex.verb import Verb
+    from inflex.adjective import Adjective
+    from inflex.matcher import Matcher
+    from inflex.functions import (
+        noun_singular,
+        noun_plural,
+        verb_singular,
+        verb_plural,
+        verb_past,
+        verb_pres_part,
+        verb_past_part,
+        adj_singular,
+        adj_plural,
+        adj_comparative,
+        adj_superlative,
+    )
+    from inflex.lexicon import load_lexicon
+    from inflex.lemmatizer import lemmatize, lemmatize_all
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def preload() -> None:
+    """Import all modules and compile all regular expressions, rather than doing so on first use.
+
+    Examples:
+        >>> import inflex
+        >>> inflex.preload()
+    """
+    from inflex.lazy_regex import compile_all  # pylint: disable=C0415
+
+    for name in _lazy_attributes:
+        __getattr__(name)
+    compile_all()
@@ -2,10 +2,10 @@
 # -*- coding: utf-8 -*-
 
 import re
-
+from typing import Callable
 
 from inflex.syllable import Syllable
-from inflex.term import Term
+from inflex.term import Term, memoize_form
 from inflex.adjective_core import (
     is_singular,
     is_plural,
@@ -18,6 +18,8 @@ from inflex.noun import Noun
 class Adjective(Term):
     """Class for detecting and converting to adjective forms."""
 
+    __slots__ = ()
+
     # Regexes to be tried before applying -er or -est.
     # E.g. "pretty" is converted to "pretti" according to these regexes,
     # and then "er" or "est" are appended for comparative and
@@ -161,6 +163,7 @@ class Adjective(Term):
         """
         return is_plural(self.term)
 
+    @memoize_form
     def singular(self, person: int = 0) -> str:
         """Returns this adjective's singular form.
 
@@ -172,16 +175,9 @@ class Adjective(Term):
             str: This adjective's singular form.
         """
         self._check_valid_person(person)
-        # Is it possessive form?
-        match = self._possessive_regex.match(self.term)
-        if match:
-            return self._reapply_whitespace(Noun(match.group(1)).singular() + "'s")
-
-        if self.term.lower() in self._possessive_inflexion:
-            return self._encase(self._possessive_inflexion[self.term.lower()]["singular"][person])
-
-        return self._encase(convert_to_singular(self.term))
+        return Adjective._singular(self.term, person, self._encase, self._reapply_whitespace)
 
+    @memoize_form
     def plural(self, person: int = 0) -> str:
         """Returns this adjective's plural form.
 
@@ -193,18 +189,66 @@ class Adjective(Term):
             str: This adjective's plural form.
         """
         self._check_valid_person(person)
+        return Adjective._plural(self.term, person, self._encase, self._reapply_whitespace)
+
+    @staticmethod
+    def _singular(term: str,
+                  person: int,
+                  encase: Callable[[str], str],
+                  reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to singular form, see `singular()`.
+
+        Args:
+            term (str): The stripped input word or collocation.
+            person (int): Represents the grammatical "person" (1st, 2nd, 3rd).
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
+
+        Returns:
+            str: The singular form of `term`.
+        """
+        # Is it possessive form?
+        match = Adjective._possessive_regex.match(term)
+        if match:
+            return reapply_whitespace(Noun(match.group(1)).singular() + "'s")
+
+        if term.lower() in Adjective._possessive_inflexion:
+            return encase(Adjective._possessive_inflexion[term.lower()]["singular"][person])
+
+        return encase(convert_to_singular(term))
+
+    @staticmethod
+    def _plural(term: str,
+                person: int,
+                encase: Callable[[str], str],
+                reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to plural form, see `plural()`.
+
+        Args:
+            term (str): The stripped input word or collocation.
+            person (int): Represents the grammatical "person" (1st, 2nd, 3rd).
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
+
+        Returns:
+            str: The plural form of `term`.
+        """
         # Is it possessive form?
-        match = self._possessive_regex.match(self.term)
+        match = Adjective._possessive_regex.match(term)
         if match:
             noun = Noun(match.group(1)).plural() + "'s"
-            return self._reapply_whitespace(re.sub(r"s's\Z", "s'",
-                                                   noun,
-                                                   flags=re.MULTILINE | re.DOTALL))
+            return reapply_whitespace(re.sub(r"s's\Z", "s'",
+                                             noun,
+                                             flags=re.MULTILINE | re.DOTALL))
 
-        if self.term.lower() in self._possessive_inflexion:
-            return self._encase(self._possessive_inflexion[self.term.lower()]["plural"][person])
+        if term.lower() in Adjective._possessive_inflexion:
+            return encase(Adjective._possessive_inflexion[term.lower()]["plural"][person])
 
-        return self._encase(convert_to_plural(self.term))
+        return encase(convert_to_plural(term))
 
     def lemma(self) -> str:
         """Return this object's lemma form.
@@ -242,6 +286,12 @@ class Adjective(Term):
                 return term[:match.start()] + Adjective._stem_regexes[regex](match) +\
                     term[match.end():]
 
+        flags = Syllable.get_flags(term)
+        if flags is not None:
+            if flags & Syllable.DOUBLES_FINAL_CONSONANT:
+                return term + term[-1]
+            return term
+
         # Get a set of known syllable counts for term
         syllable_count = Syllable.count_syllables(term)
 
@@ -275,6 +325,22 @@ class Adjective(Term):
                 `word` when converting it to comparative or superlative, respectively.
                 Based on the deemed syllable count of `word`
         """
+        flags = Syllable.get_flags(word)
+        if flags is not None:
+            return bool(flags & Syllable.TAKES_MORE_MOST)
+        return Adjective._guess_more_most(word)
+
+    @staticmethod
+    def _guess_more_most(word: str) -> bool:
+        """Guess whether "more" or "most" should be prepended before `word` for comp/super,
+        based on the syllable counts of `word` rather than on its precomputed flags.
+
+        Args:
+            word (str): Input word or collocation.
+
+        Returns:
+            bool: True if "more" or "most" should be prepended to `word`.
+        """
         syllable_counts = Syllable.count_reduced_syllables(word)
 
         if max(syllable_counts) > 2:
@@ -288,6 +354,8 @@ class Adjective(Term):
 
         return False
 
+    # Not converted via the lowercase term, as uppercase adjectives get "more" prepended
+    @memoize_form(canonical=False)
     def comparative(self, only_suffix: bool = False) -> str:
         """Returns this Adjective's comparative form.
 
@@ -329,18 +397,33 @@ class Adjective(Term):
         Returns:
             str: This Adjective's comparative form.
         """
-        if self.term.lower() in self._comparative_conversions.values():
-            return self._encase(self.term)
+        return Adjective._comparative(self.term, only_suffix, self._encase)
 
-        if self.term.lower() in self._comparative_conversions:
-            return self._encase(self._comparative_conversions[self.term.lower()])
+    @staticmethod
+    def _comparative(term: str, only_suffix: bool, encase: Callable[[str], str]) -> str:
+        """Convert `term` to comparative form, see `comparative()`.
+
+        Args:
+            term (str): The stripped input word or collocation.
+            only_suffix (bool): If `True`, then only convert by modifying suffix.
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+
+        Returns:
+            str: The comparative form of `term`.
+        """
+        if term.lower() in Adjective._comparative_conversions.values():
+            return encase(term)
+
+        if term.lower() in Adjective._comparative_conversions:
+            return encase(Adjective._comparative_conversions[term.lower()])
 
         # If multiple words
         pattern = re.compile(r"-| ")
-        match = pattern.search(self.term)
+        match = pattern.search(term)
         if match:
-            term = self.term[:match.start()]
-            remainder = self.term[match.end():]
+            remainder = term[match.end():]
+            term = term[:match.start()]
             # If the form is e.g. "high and mighty",
             # then we want to convert both before and after the "and"
             if remainder.startswith("and "):
@@ -351,11 +434,12 @@ class Adjective(Term):
 
             return output_format.format(Adjective(term).comparative(only_suffix), remainder)
 
-        if not only_suffix and (self.term.isupper() or Adjective._prepend_more_most(self.term)):
-            return f"more {self._encase(self.term)}"
+        if not only_suffix and (term.isupper() or Adjective._prepend_more_most(term)):
+            return f"more {encase(term)}"
 
-        return self._encase(Adjective._stem(self.term) + "er")
+        return encase(Adjective._stem(term) + "er")
 
+    @memoize_form(canonical=False)
     def superlative(self, only_suffix: bool = False) -> str:
         """Returns this Adjective's superlative form.
 
@@ -398,17 +482,32 @@ class Adjective(Term):
         Returns:
             str: This Adjective's superlative form.
         """
-        if self.term.lower() in self._superlative_conversions.values():
-            return self._encase(self.term)
+        return Adjective._superlative(self.term, only_suffix, self._encase)
+
+    @staticmethod
+    def _superlative(term: str, only_suffix: bool, encase: Callable[[str], str]) -> str:
+        """Convert `term` to superlative form, see `superlative()`.
+
+        Args:
+            term (str): The stripped input word or collocation.
+            only_suffix (bool): If `True`, then only convert by modifying suffix.
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+
+        Returns:
+            str: The superlative form of `term`.
+        """
+        if term.lower() in Adjective._superlative_conversions.values():
+            return encase(term)
 
-        if self.term.lower() in self._superlative_conversions:
-            return self._encase(self._superlative_conversions[self.term.lower()])
+        if term.lower() in Adjective._superlative_conversions:
+            return encase(Adjective._superlative_conversions[term.lower()])
 
         pattern = re.compile(r"-| ")
-        match = pattern.search(self.term)
+        match = pattern.search(term)
         if match:
-            term = self.term[:match.start()]
-            remainder = self.term[match.end():]
+            remainder = term[match.end():]
+            term = term[:match.start()]
             # If the form is e.g. "high and mighty",
             # then we want to convert both before and after the "and"
             if remainder.startswith("and "):
@@ -419,7 +518,7 @@ class Adjective(Term):
 
             return output_format.format(Adjective(term).superlative(only_suffix), remainder)
 
-        if not only_suffix and (self.term.isupper() or Adjective._prepend_more_most(self.term)):
-            return f"most {self._encase(self.term)}"
+        if not only_suffix and (term.isupper() or Adjective._prepend_more_most(term)):
+            return f"most {encase(term)}"
 
-        return self._encase(Adjective._stem(self.term) + "est")
+        return encase(Adjective._stem(term) + "est")
@@ -6,7 +6,9 @@
 ## Contains no user-servicable parts!!! ##
 ##########################################
 
-VERSION = 20210606.161222
+from inflex.cache import memoize
+
+VERSION = 20261018.115354
 
 adj_is_singular = [
     "a",
@@ -52,6 +54,7 @@ adj_plural_of = {
     "your": "your"
 }
 
+@memoize
 def is_plural(word: str) -> bool:
     """Detect whether `word` is in plural form.
 
@@ -65,6 +68,7 @@ def is_plural(word: str) -> bool:
            word.lower() in adj_is_plural or\
            (word not in adj_is_singular and word.lower() not in adj_is_singular)
 
+@memoize
 def is_singular(word: str) -> bool:
     """Detect whether `word` is in singular form.
 
@@ -78,6 +82,7 @@ def is_singular(word: str) -> bool:
            word.lower() in adj_is_singular or\
            (word not in adj_is_plural and word.lower() not in adj_is_plural)
 
+@memoize
 def convert_to_plural(word: str) -> str:
     """Convert `word` to plural form.
 
@@ -93,6 +98,7 @@ def convert_to_plural(word: str) -> str:
         return adj_plural_of[word.lower()]
     return word
 
+@memoize
 def convert_to_singular(word: str) -> str:
     """Convert `word` to singular form.
 
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Inflect many terms at once, e.g. a column of tokens::
+
+    >>> from inflex import batch
+    >>> list(batch.plural_nouns(["book", "Child", "book"]))
+    ['books', 'Children', 'books']
+
+Every function accepts any iterable of terms and lazily yields the converted terms
+in input order, so the input may be a stream that doesn't fit in memory. Each distinct
+term is converted only once: Results are remembered for the `cache_size` most recently
+seen distinct terms, which bounds the memory used. Invalid arguments are rejected when
+the function is called, rather than once the first term is converted.
+"""
+
+__all__ = [
+    "plural_nouns",
+    "singular_nouns",
+    "plural_verbs",
+    "singular_verbs",
+    "past_verbs",
+    "pres_part_verbs",
+    "past_part_verbs",
+    "plural_adjectives",
+    "singular_adjectives",
+    "comparatives",
+    "superlatives",
+]
+
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator
+
+from inflex.adjective import Adjective
+from inflex.functions import _check_valid_person
+from inflex.noun import Noun
+from inflex.verb import Verb
+
+DEFAULT_CACHE_SIZE = 2 ** 20
+
+
+def _map_unique(convert: Callable[[str], str],
+                terms: Iterable[str],
+                cache_size: int) -> Iterator[str]:
+    """Lazily apply `convert` to each term, converting each distinct term only once.
+
+    Args:
+        convert (Callable[[str], str]): Conversion function.
+        terms (Iterable[str]): Input terms.
+        cache_size (int): Maximum number of distinct terms of which the result is remembered.
+
+    Yields:
+        str: The converted terms, in the order of `terms`.
+    """
+    results: "OrderedDict[str, str]" = OrderedDict()
+    for term in terms:
+        try:
+            result = results[term]
+            results.move_to_end(term)
+        except KeyError:
+            result = results[term] = convert(term)
+            if len(results) > cache_size:
+                results.popitem(last=False)
+        yield result
+
+
+def plural_nouns(terms: Iterable[str],
+                 person: int = 0,
+                 classical: bool = False,
+                 cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert nouns to plural form, equivalent to `Noun(term).plural(person)` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects personal and possessive pronouns. Defaults to 0.
+        classical (bool, optional): Use the classical plural, e.g. "formulae" rather than
+            "formulas". Defaults to False.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `person` is invalid.
+
+    Yields:
+        str: The plural form of each term.
+    """
+    _check_valid_person(person)
+    if classical:
+        return _map_unique(lambda term: Noun(term).classical().plural(person), terms, cache_size)
+    return _map_unique(lambda term: Noun(term).plural(person), terms, cache_size)
+
+
+def singular_nouns(terms: Iterable[str],
+                   person: int = 0,
+                   cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert nouns to singular form, equivalent to `Noun(term).singular(person)` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects personal and possessive pronouns. Defaults to 0.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `person` is invalid.
+
+    Yields:
+        str: The singular form of each term.
+    """
+    _check_valid_person(person)
+    return _map_unique(lambda term: Noun(term).singular(person), terms, cache_size)
+
+
+def plural_verbs(terms: Iterable[str],
+                 person: int = 0,
+                 cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert verbs to plural form, equivalent to `Verb(term).plural(person)` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            Defaults to 0.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `person` is invalid.
+
+    Yields:
+        str: The plural form of each term.
+    """
+    _check_valid_person(person)
+    return _map_unique(lambda term: Verb(term).plural(person), terms, cache_size)
+
+
+def singular_verbs(terms: Iterable[str],
+                   person: int = 0,
+                   cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert verbs to singular form, equivalent to `Verb(term).singular(person)` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            Defaults to 0.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `person` is invalid.
+
+    Yields:
+        str: The singular form of each term.
+    """
+    _check_valid_person(person)
+    return _map_unique(lambda term: Verb(term).singular(person), terms, cache_size)
+
+
+def past_verbs(terms: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert verbs to past form, equivalent to `Verb(term).past()` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Yields:
+        str: The past form of each term.
+    """
+    return _map_unique(lambda term: Verb(term).past(), terms, cache_size)
+
+
+def pres_part_verbs(terms: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert verbs to present participle form, equivalent to `Verb(term).pres_part()`
+    for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Yields:
+        str: The present participle form of each term.
+    """
+    return _map_unique(lambda term: Verb(term).pres_part(), terms, cache_size)
+
+
+def past_part_verbs(terms: Iterable[str], cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert verbs to past participle form, equivalent to `Verb(term).past_part()`
+    for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Yields:
+        str: The past participle form of each term.
+    """
+    return _map_unique(lambda term: Verb(term).past_part(), terms, cache_size)
+
+
+def plural_adjectives(terms: Iterable[str],
+                      person: int = 0,
+                      cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert adjectives to plural form, equivalent to `Adjective(term).plural(person)`
+    for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects possessive adjectives. Defaults to 0.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `person` is invalid.
+
+    Yields:
+        str: The plural form of each term.
+    """
+    _check_valid_person(person)
+    return _map_unique(lambda term: Adjective(term).plural(person), terms, cache_size)
+
+
+def singular_adjectives(terms: Iterable[str],
+                        person: int = 0,
+                        cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert adjectives to singular form, equivalent to `Adjective(term).singular(person)`
+    for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects possessive adjectives. Defaults to 0.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `person` is invalid.
+
+    Yields:
+        str: The singular form of each term.
+    """
+    _check_valid_person(person)
+    return _map_unique(lambda term: Adjective(term).singular(person), terms, cache_size)
+
+
+def comparatives(terms: Iterable[str],
+                 only_suffix: bool = False,
+                 cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert adjectives to comparative form, equivalent to
+    `Adjective(term).comparative(only_suffix)` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        only_suffix (bool, optional): Never prepend "more". Defaults to False.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Yields:
+        str: The comparative form of each term.
+    """
+    return _map_unique(lambda term: Adjective(term).comparative(only_suffix), terms, cache_size)
+
+
+def superlatives(terms: Iterable[str],
+                 only_suffix: bool = False,
+                 cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[str]:
+    """Convert adjectives to superlative form, equivalent to
+    `Adjective(term).superlative(only_suffix)` for each term.
+
+    Args:
+        terms (Iterable[str]): Input words or collocations.
+        only_suffix (bool, optional): Never prepend "most". Defaults to False.
+        cache_size (int, optional): Maximum number of distinct terms of which the result
+            is remembered. Defaults to 2 ** 20.
+
+    Yields:
+        str: The superlative form of each term.
+    """
+    return _map_unique(lambda term: Adjective(term).superlative(only_suffix), terms, cache_size)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    "CacheInfo",
+    "LRUCache",
+    "memoize",
+    "caches",
+    "enable",
+    "disable",
+    "is_enabled",
+    "clear",
+    "cache_info",
+]
+
+import functools
+import importlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a single `LRUCache`."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Opt-in, bounded least-recently-used cache around a pure function.
+
+    While the cache is disabled, calls are passed through to the wrapped function
+    directly. Once enabled, results are stored for up to `maxsize` distinct arguments,
+    discarding the least recently used result when the cache is full.
+
+    The wrapped function is called without holding any lock, so it may recursively call
+    itself (or other cached functions), as happens for compound nouns such as
+    "mother-in-law". Each result is only stored once the call that computed it returns.
+    """
+
+    def __init__(self, func: Callable[..., Any], name: str, maxsize: int = 4096):
+        """Wrap `func` in a disabled LRUCache.
+
+        Args:
+            func (Callable[..., Any]): Function of which the results depend solely on
+                its (hashable) arguments.
+            name (str): Name under which the cache is registered, e.g.
+                "noun_core.convert_to_singular".
+            maxsize (int, optional): Maximum number of stored results. Defaults to 4096.
+        """
+        super().__init__()
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = name
+        self.maxsize = maxsize
+        self.enabled = False
+
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.enabled:
+            return self.func(*args, **kwargs)
+
+        key: Tuple = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        with self._lock:
+            if key in self._results:
+                self._hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+            self._misses += 1
+
+        result = self.func(*args, **kwargs)
+        self._store(key, result)
+        return result
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get the result stored for `key`, or call `compute` and store its result for `key`.
+        Unlike calling the cache, this allows computing results other than by calling `func`,
+        e.g. by calling a method on an existing object, which must then give the same result
+        for equal keys. While the cache is disabled, `compute` is called directly.
+
+        Args:
+            key (Hashable): Key identifying the result.
+            compute (Callable[[], Any]): Function computing the result.
+
+        Returns:
+            Any: The stored or computed result.
+        """
+        if not self.enabled:
+            return compute()
+
+        with self._lock:
+            if key in self._results:
+                self._hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+            self._misses += 1
+
+        result = compute()
+        self._store(key, result)
+        return result
+
+    def __repr__(self) -> str:
+        return f"<LRUCache {self.name!r} {self.cache_info()}>"
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        """Store `result` for `key` as the most recently used result, unless the cache was
+        disabled or resized to hold no results while `result` was being computed.
+        """
+        with self._lock:
+            if self.enabled and self.maxsize > 0:
+                self._results[key] = result
+                self._results.move_to_end(key)
+                self._evict()
+
+    def _evict(self) -> None:
+        """Discard the least recently used results until at most `maxsize` remain.
+        Must be called while holding `self._lock`.
+        """
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+            self._evictions += 1
+
+    def enable(self, maxsize: Optional[int] = None) -> None:
+        """Start storing results, optionally changing the maximum number of stored results.
+
+        Args:
+            maxsize (Optional[int], optional): New maximum number of stored results.
+                Defaults to None, i.e. keep the current maximum.
+        """
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 0:
+                    raise ValueError(f"maxsize must be non-negative, not {maxsize}")
+                self.maxsize = maxsize
+                self._evict()
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Stop storing results, and discard all stored results."""
+        with self._lock:
+            self.enabled = False
+            self._results.clear()
+
+    def clear(self) -> None:
+        """Discard all stored results, and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Get the hit, miss and eviction counts, and the current and maximum size.
+
+        Returns:
+            CacheInfo: Statistics of this cache.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._results))
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Get the stored results, from least to most recently used.
+
+        Returns:
+            List[Tuple[Hashable, Any]]: Pairs of the key of the arguments and the result.
+        """
+        with self._lock:
+            return list(self._results.items())
+
+    def update(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """Store results, e.g. as returned by `items()`, as the most recently used results.
+        Results are only stored while the cache is enabled.
+
+        Args:
+            items (Iterable[Tuple[Hashable, Any]]): Pairs of the key of the arguments and the result.
+        """
+        with self._lock:
+            if not self.enabled:
+                return
+            for key, result in items:
+                self._results[key] = result
+                self._results.move_to_end(key)
+            self._evict()
+
+
+"""
+Registry of all caches, keyed on names such as "verb_core.is_past".
+"""
+caches: Dict[str, LRUCache] = {}
+
+"""
+Modules that register caches. These are imported lazily, so they are imported
+before selecting caches.
+"""
+_core_modules = ("inflex.noun_core", "inflex.verb_core", "inflex.adjective_core", "inflex.term")
+
+
+def memoize(func: Callable[..., Any]) -> LRUCache:
+    """Decorator wrapping `func` in a disabled, registered LRUCache.
+
+    Args:
+        func (Callable[..., Any]): Function of which the results depend solely on
+            its (hashable) arguments.
+
+    Returns:
+        LRUCache: The cache wrapping `func`.
+    """
+    name = f"{func.__module__.rpartition('.')[2]}.{func.__name__}"
+    cache = LRUCache(func, name)
+    caches[name] = cache
+    return cache
+
+
+def _select(names: Tuple[str, ...]) -> Dict[str, LRUCache]:
+    """Get the caches with the given names, or all caches if no names are given.
+    A name may also be a module prefix, e.g. "noun_core" for all noun_core caches.
+
+    Args:
+        names (Tuple[str, ...]): Cache names or module names.
+
+    Raises:
+        KeyError: If a name matches no cache.
+
+    Returns:
+        Dict[str, LRUCache]: Mapping of names to the selected caches.
+    """
+    for module in _core_modules:
+        importlib.import_module(module)
+
+    if not names:
+        return dict(caches)
+    selected = {}
+    for name in names:
+        matches = {key: cache for key, cache in caches.items()
+                   if key == name or key.startswith(name + ".")}
+        if not matches:
+            raise KeyError(f"No cache named {name!r}. Options are {sorted(caches)}")
+        selected.update(matches)
+    return selected
+
+
+def enable(*names: str, maxsize: Optional[int] = None) -> None:
+    """Enable caching for the core conversion and recognition functions, for the
+    "term.canonical_forms" cache shared by the case variants of nouns and adjectives,
+    and for the "term.patterns" cache of `as_regex` patterns shared by new objects.
+
+    Examples:
+        >>> from inflex import cache
+        >>> cache.enable()
+        >>> cache.enable("noun_core.convert_to_singular", maxsize=100_000)
+
+    Args:
+        names (str): Names of caches, e.g. "noun_core.convert_to_singular", or of core
+            modules, e.g. "verb_core". Defaults to all caches.
+        maxsize (Optional[int], optional): Maximum number of results stored per cache.
+            Defaults to None, i.e. keep the current maximum.
+    """
+    for cache in _select(names).values():
+        cache.enable(maxsize)
+
+
+def disable(*names: str) -> None:
+    """Disable caching, discarding the stored results.
+
+    Args:
+        names (str): Names of caches or of core modules. Defaults to all caches.
+    """
+    for cache in _select(names).values():
+        cache.disable()
+
+
+def is_enabled(name: str) -> bool:
+    """Check whether the cache with the given name is enabled.
+
+    Args:
+        name (str): Name of a cache, e.g. "verb_core.is_past", or of a core module.
+
+    Returns:
+        bool: True if the cache, or every cache of the core module, is enabled.
+    """
+    return all(cache.enabled for cache in _select((name,)).values())
+
+
+def clear(*names: str) -> None:
+    """Discard the stored results and reset the statistics.
+
+    Args:
+        names (str): Names of caches or of core modules. Defaults to all caches.
+    """
+    for cache in _select(names).values():
+        cache.clear()
+
+
+def cache_info(*names: str) -> Dict[str, CacheInfo]:
+    """Get the statistics of caches.
+
+    Examples:
+        >>> cache.cache_info("noun_core.convert_to_singular")
+        {'noun_core.convert_to_singular': CacheInfo(hits=3, misses=1, evictions=0, maxsize=4096, currsize=1)}
+
+    Args:
+        names (str): Names of caches or of core modules. Defaults to all caches.
+
+    Returns:
+        Dict[str, CacheInfo]: Mapping of cache names to their statistics.
+    """
+    return {name: cache.cache_info() for name, cache in _select(names).items()}
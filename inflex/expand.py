@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Expand a vocabulary of lemmas to all of their inflected forms, e.g. to expand query and
+index terms of a search engine, as an offline batch step::
+
+    from inflex import expand
+    with open("vocabulary.txt", encoding="utf8") as vocabulary:
+        expand.build(vocabulary, "expansions.tsv", processes=8)
+
+    for lemma, pos, forms in expand.read("expansions.tsv"):
+        ...
+
+The expansion file holds one line per lemma and part of speech, with tab-separated
+columns: The lemma, "noun" or "verb", and the distinct forms other than the lemma itself,
+in the order of `noun_forms` and `verb_forms`. Lemmas can't contain tabs or line breaks::
+
+    child	noun	children
+    fly	verb	flies	flew	flying	flown
+
+Lemmas are expanded in chunks by a pool of processes, while only a bounded number of chunks
+is pending at any time, so the vocabulary may be a stream that doesn't fit in memory. After
+each chunk, the progress is recorded next to the expansion file, so an interrupted build
+can be resumed by calling `build` with the same vocabulary again.
+"""
+
+__all__ = [
+    "noun_forms",
+    "verb_forms",
+    "build",
+    "read",
+]
+
+import json
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from inflex.noun import Noun
+from inflex.verb import Verb
+
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def noun_forms(lemma: str) -> List[str]:
+    """Get the distinct forms of a noun, i.e. the singular, modern plural and classical plural,
+    like those matched by `Noun.as_regex`.
+
+    Examples:
+        >>> noun_forms("formula")
+        ['formula', 'formulas', 'formulae']
+
+    Args:
+        lemma (str): Input word or collocation.
+
+    Returns:
+        List[str]: The distinct forms of `lemma`.
+    """
+    noun = Noun(lemma)
+    return list(dict.fromkeys((noun.singular(), noun.plural(), noun.classical().plural())))
+
+
+def verb_forms(lemma: str) -> List[str]:
+    """Get the distinct forms of a verb, i.e. the plural, singular, past, present participle
+    and past participle, like those matched by `Verb.as_regex`.
+
+    Examples:
+        >>> verb_forms("fly")
+        ['fly', 'flies', 'flew', 'flying', 'flown']
+
+    Args:
+        lemma (str): Input word or collocation.
+
+    Returns:
+        List[str]: The distinct forms of `lemma`.
+    """
+    verb = Verb(lemma)
+    return list(dict.fromkeys((verb.plural(), verb.singular(), verb.past(), verb.pres_part(), verb.past_part())))
+
+
+# Functions computing the forms of a lemma, per part of speech
+_pos_forms: Dict[str, Callable[[str], List[str]]] = {
+    "noun": noun_forms,
+    "verb": verb_forms,
+}
+
+
+def _expand_chunk(lemmas: List[str], pos: Tuple[str, ...]) -> str:
+    """Expand a chunk of lemmas into lines of the expansion file. Runs in the worker processes.
+
+    Args:
+        lemmas (List[str]): Stripped, non-empty lemmas.
+        pos (Tuple[str, ...]): The parts of speech into which each lemma is expanded.
+
+    Returns:
+        str: The lines of the expansion file for `lemmas`.
+    """
+    lines = []
+    for lemma in lemmas:
+        for part in pos:
+            forms = [form for form in _pos_forms[part](lemma) if form != lemma]
+            lines.append("\t".join([lemma, part] + forms) + "\n")
+    return "".join(lines)
+
+
+def _chunks(vocabulary: Iterator[str], chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Split the vocabulary into chunks of stripped, non-empty lemmas.
+
+    Args:
+        vocabulary (Iterator[str]): Lemmas, optionally with surrounding whitespace, e.g. lines.
+        chunk_size (int): Number of vocabulary entries per chunk.
+
+    Raises:
+        ValueError: If a lemma contains a tab or a line break, which separate the columns
+            and lines of the expansion file.
+
+    Yields:
+        Tuple[int, List[str]]: The number of vocabulary entries consumed for the chunk,
+            including empty entries, and the lemmas in the chunk.
+    """
+    while True:
+        entries = list(islice(vocabulary, chunk_size))
+        if not entries:
+            return
+        lemmas = [lemma for lemma in (entry.strip() for entry in entries) if lemma]
+        for lemma in lemmas:
+            if any(char in lemma for char in "\t\n\r"):
+                raise ValueError(f"The lemma {lemma!r} contains a tab or a line break.")
+        yield len(entries), lemmas
+
+
+def _progress_path(path: str) -> str:
+    return path + ".progress"
+
+
+def _write_progress(path: str, progress: Dict[str, object]) -> None:
+    """Atomically record the progress of the build of the expansion file at `path`.
+
+    Args:
+        path (str): Path of the expansion file.
+        progress (Dict[str, object]): The progress, see `build`.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf8") as f:
+            json.dump(progress, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, _progress_path(path))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _read_progress(path: str, pos: Tuple[str, ...]) -> Optional[Dict[str, int]]:
+    """Read the progress of an interrupted build of the expansion file at `path`.
+
+    Args:
+        path (str): Path of the expansion file.
+        pos (Tuple[str, ...]): The parts of speech of the build.
+
+    Raises:
+        ValueError: If the interrupted build used other parts of speech.
+
+    Returns:
+        Optional[Dict[str, int]]: The number of vocabulary entries that were expanded, and
+            the size of the expansion file afterwards, or None if no build was interrupted,
+            or if the expansion file was removed or truncated since.
+    """
+    try:
+        with open(_progress_path(path), encoding="utf8") as f:
+            progress = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if tuple(progress["pos"]) != pos:
+        raise ValueError(f"The interrupted build of {path!r} expanded {progress['pos']}, not {list(pos)}.")
+    try:
+        if os.path.getsize(path) < progress["size"]:
+            return None
+    except FileNotFoundError:
+        return None
+    return progress
+
+
+def build(vocabulary: Iterable[str],
+          path: str,
+          pos: Optional[str] = None,
+          processes: Optional[int] = None,
+          chunk_size: int = DEFAULT_CHUNK_SIZE,
+          resume: bool = True) -> int:
+    """Expand every lemma in `vocabulary` to its forms, and write them to the expansion file at `path`.
+
+    Examples:
+        >>> from inflex import expand
+        >>> expand.build(["child", "fly"], "expansions.tsv", processes=1)
+        4
+
+    Args:
+        vocabulary (Iterable[str]): Lemmas, e.g. the lines of a file. Surrounding whitespace
+            is stripped, and empty entries are skipped.
+        path (str): Path of the expansion file.
+        pos (Optional[str], optional): Either "noun" or "verb". Defaults to None, i.e. each
+            lemma is expanded both as a noun and as a verb.
+        processes (Optional[int], optional): Number of worker processes. Defaults to None,
+            i.e. the number of CPUs. With 1, lemmas are expanded in this process.
+        chunk_size (int, optional): Number of vocabulary entries expanded by a worker at once,
+            and between recording the progress. Defaults to 1024.
+        resume (bool, optional): Whether to resume an interrupted build of `path`, skipping the
+            vocabulary entries that were already expanded. The vocabulary must then hold the
+            same entries in the same order. Defaults to True.
+
+    Raises:
+        ValueError: If `pos` is invalid, if the interrupted build used another `pos`, or if
+            a lemma contains a tab or a line break.
+
+    Returns:
+        int: The number of lines in the expansion file written by this call.
+    """
+    if pos is not None and pos not in _pos_forms:
+        raise ValueError(f"Unknown part of speech {pos!r}. Options are {sorted(_pos_forms)}")
+    parts = (pos,) if pos else tuple(_pos_forms)
+    processes = processes or os.cpu_count() or 1
+
+    progress = _read_progress(path, parts) if resume else None
+    if progress is None:
+        progress = {"pos": list(parts), "entries": 0, "size": 0}
+    vocabulary = islice(vocabulary, progress["entries"], None)
+
+    n_lines = 0
+    with open(path, "r+b" if progress["size"] else "wb") as f:
+        # Discard output of the chunk that was being written when the build was interrupted
+        f.truncate(progress["size"])
+        f.seek(progress["size"])
+
+        def write(n_entries: int, lines: str) -> None:
+            nonlocal n_lines
+            f.write(lines.encode("utf8"))
+            f.flush()
+            # The progress may only be recorded once the lines are on disk, as resuming
+            # truncates the file to the recorded size
+            os.fsync(f.fileno())
+            n_lines += lines.count("\n")
+            progress["entries"] += n_entries
+            progress["size"] = f.tell()
+            _write_progress(path, progress)
+
+        if processes == 1:
+            for n_entries, lemmas in _chunks(vocabulary, chunk_size):
+                write(n_entries, _expand_chunk(lemmas, parts))
+        else:
+            with multiprocessing.Pool(processes) as pool:
+                # Chunks are written in order, and only a few chunks per process are pending
+                pending: deque = deque()
+                for n_entries, lemmas in _chunks(vocabulary, chunk_size):
+                    pending.append((n_entries, pool.apply_async(_expand_chunk, (lemmas, parts))))
+                    if len(pending) >= 2 * processes:
+                        n_entries, result = pending.popleft()
+                        write(n_entries, result.get())
+                while pending:
+                    n_entries, result = pending.popleft()
+                    write(n_entries, result.get())
+
+    # The build is complete, so a later build starts over
+    try:
+        os.remove(_progress_path(path))
+    except FileNotFoundError:
+        pass
+    return n_lines
+
+
+def read(path: str) -> Iterator[Tuple[str, str, List[str]]]:
+    """Read an expansion file written by `build`.
+
+    Args:
+        path (str): Path of the expansion file.
+
+    Yields:
+        Tuple[str, str, List[str]]: The lemma, the part of speech, and the other forms of the lemma.
+    """
+    with open(path, encoding="utf8") as f:
+        for line in f:
+            lemma, pos, *forms = line.rstrip("\n").split("\t")
+            yield lemma, pos, forms
@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Stateless functions for inflecting a single word, e.g.::
+
+    >>> import inflex
+    >>> inflex.noun_plural("book")
+    'books'
+    >>> inflex.verb_past("fly")
+    'flew'
+    >>> inflex.adj_superlative("pretty")
+    'prettiest'
+
+Each function gives the same output as the corresponding method, e.g. `noun_plural(word)`
+is equivalent to `Noun(word).plural()`. However, plain words, i.e. words without uppercase
+letters, whitespace or hyphens, are inflected without creating a `Noun`, `Verb` or
+`Adjective` object, which makes these functions faster for large numbers of clean tokens.
+
+Callers that guarantee their input is a plain lowercase word may pass
+`preserve_case=False` to also skip applying the casing and whitespace of the input onto
+the output.
+
+Words that exactly match a word in the dictionaries of the core modules are looked up in
+the precomputed forms of `inflex.paradigm_core` instead. With `preserve_case=False`, the
+lowercase word is looked up.
+"""
+
+__all__ = [
+    "noun_singular",
+    "noun_plural",
+    "verb_singular",
+    "verb_plural",
+    "verb_past",
+    "verb_pres_part",
+    "verb_past_part",
+    "adj_singular",
+    "adj_plural",
+    "adj_comparative",
+    "adj_superlative",
+]
+
+import re
+from typing import Callable, Dict, Optional, Tuple
+
+from inflex.adjective import Adjective
+from inflex.noun import Noun
+from inflex.noun_core import convert_to_classical_plural, convert_to_modern_plural, convert_to_singular
+from inflex.paradigm_core import noun_paradigms, verb_paradigms
+from inflex.term import Term
+from inflex.verb import Verb
+
+# Matches words for which `Term._encase` only lowercases the output:
+# No uppercase letters, no whitespace or hyphens, and at least one "word" character
+_plain_regex = re.compile(r"[^A-Z\s\-]*[^A-Z\s\-'][^A-Z\s\-]*")
+
+_lower: Callable[[str], str] = Term._casing_formats["lower"]["transformation"] # type: ignore # pylint: disable=W0212
+
+
+def _encase_lower(target: str) -> str:
+    """Equivalent to `Term._encase` for a plain lowercase input term.
+
+    Args:
+        target (str): The word or collocation on which to apply the casing.
+
+    Returns:
+        str: `target`, lowercased apart from "I", and stripped.
+    """
+    return Term._word_regex.sub(lambda match_obj: _lower(match_obj.group()), target).strip() # pylint: disable=W0212
+
+
+def _identity(target: str) -> str:
+    return target
+
+
+def _callbacks(word: str, preserve_case: bool):
+    """Return the `encase` and `reapply_whitespace` callbacks to use for `word`,
+    or None if `word` requires a `Term` object to preserve its casing and whitespace.
+
+    Args:
+        word (str): Input word or collocation.
+        preserve_case (bool): Whether to apply the casing and whitespace of `word` onto the output.
+
+    Returns:
+        Optional[Tuple[Callable[[str], str], Callable[[str], str]]]: The two callbacks, or None.
+    """
+    if not preserve_case:
+        return _identity, _identity
+    if _plain_regex.fullmatch(word):
+        return _encase_lower, str.strip
+    return None
+
+
+def _paradigm(paradigms: Dict[str, Tuple[str, ...]], word: str, preserve_case: bool) -> Optional[Tuple[str, ...]]:
+    """Return the precomputed forms of `word` from `paradigms`, if any. If not `preserve_case`,
+    then the lowercase `word` is looked up, as the output casing needn't match the input.
+
+    Args:
+        paradigms (Dict[str, Tuple[str, ...]]): `noun_paradigms` or `verb_paradigms`.
+        word (str): Input word or collocation.
+        preserve_case (bool): Whether the casing and whitespace of `word` are applied onto the output.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The precomputed forms of `word`, or None.
+    """
+    return paradigms.get(word if preserve_case else word.lower())
+
+
+def _check_valid_person(person: int) -> None:
+    """Raise a ValueError if `person` is invalid, like `Term._check_valid_person`.
+
+    Args:
+        person (int): Represents the grammatical "person" (1st, 2nd, 3rd).
+
+    Raises:
+        ValueError: If `person` is not in [0, 1, 2, 3].
+    """
+    if person not in [0, 1, 2, 3]:
+        raise ValueError(
+            "Invalid `person` parameter supplied. Valid values include 0, 1, 2, and 3.")
+
+
+def noun_singular(word: str, person: int = 0, preserve_case: bool = True) -> str:
+    """Convert a noun to singular form, equivalent to `Noun(word).singular(person)`.
+
+    Args:
+        word (str): Input word or collocation.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects personal and possessive pronouns. Defaults to 0.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The singular form of `word`.
+    """
+    _check_valid_person(person)
+    forms = _paradigm(noun_paradigms, word, preserve_case) if person == 0 else None
+    if forms is not None:
+        return forms[2]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Noun(word).singular(person)
+    return callbacks[0](Noun._inflect(word, "singular", person, convert_to_singular)) # pylint: disable=W0212
+
+
+def noun_plural(word: str, person: int = 0, classical: bool = False, preserve_case: bool = True) -> str:
+    """Convert a noun to plural form, equivalent to `Noun(word).plural(person)`.
+
+    Args:
+        word (str): Input word or collocation.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects personal and possessive pronouns. Defaults to 0.
+        classical (bool, optional): Use the classical plural, e.g. "formulae" rather than
+            "formulas". Defaults to False.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The plural form of `word`.
+    """
+    _check_valid_person(person)
+    forms = _paradigm(noun_paradigms, word, preserve_case) if person == 0 else None
+    if forms is not None:
+        return forms[1 if classical else 0]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        noun = Noun(word)
+        return (noun.classical() if classical else noun).plural(person)
+    convert = convert_to_classical_plural if classical else convert_to_modern_plural
+    return callbacks[0](Noun._inflect(word, "plural", person, convert)) # pylint: disable=W0212
+
+
+def verb_singular(word: str, person: int = 0, preserve_case: bool = True) -> str:
+    """Convert a verb to singular form, equivalent to `Verb(word).singular(person)`.
+
+    Args:
+        word (str): Input word or collocation.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            Defaults to 0.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The singular form of `word`.
+    """
+    _check_valid_person(person)
+    forms = _paradigm(verb_paradigms, word, preserve_case) if person == 0 else None
+    if forms is not None:
+        return forms[0]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Verb(word).singular(person)
+    return Verb._singular(word, person, *callbacks) # pylint: disable=W0212
+
+
+def verb_plural(word: str, person: int = 0, preserve_case: bool = True) -> str:
+    """Convert a verb to plural form, equivalent to `Verb(word).plural(person)`.
+
+    Args:
+        word (str): Input word or collocation.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            Defaults to 0.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The plural form of `word`.
+    """
+    _check_valid_person(person)
+    forms = _paradigm(verb_paradigms, word, preserve_case) if person == 0 else None
+    if forms is not None:
+        return forms[1]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Verb(word).plural(person)
+    return Verb._plural(word, *callbacks) # pylint: disable=W0212
+
+
+def verb_past(word: str, preserve_case: bool = True) -> str:
+    """Convert a verb to past form, equivalent to `Verb(word).past()`.
+
+    Args:
+        word (str): Input word or collocation.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The past form of `word`.
+    """
+    forms = _paradigm(verb_paradigms, word, preserve_case)
+    if forms is not None:
+        return forms[2]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Verb(word).past()
+    return Verb._past(word, *callbacks) # pylint: disable=W0212
+
+
+def verb_pres_part(word: str, preserve_case: bool = True) -> str:
+    """Convert a verb to present participle form, equivalent to `Verb(word).pres_part()`.
+
+    Args:
+        word (str): Input word or collocation.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The present participle form of `word`.
+    """
+    forms = _paradigm(verb_paradigms, word, preserve_case)
+    if forms is not None:
+        return forms[3]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Verb(word).pres_part()
+    return Verb._pres_part(word, *callbacks) # pylint: disable=W0212
+
+
+def verb_past_part(word: str, preserve_case: bool = True) -> str:
+    """Convert a verb to past participle form, equivalent to `Verb(word).past_part()`.
+
+    Args:
+        word (str): Input word or collocation.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The past participle form of `word`.
+    """
+    forms = _paradigm(verb_paradigms, word, preserve_case)
+    if forms is not None:
+        return forms[4]
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Verb(word).past_part()
+    return Verb._past_part(word, *callbacks) # pylint: disable=W0212
+
+
+def adj_singular(word: str, person: int = 0, preserve_case: bool = True) -> str:
+    """Convert an adjective to singular form, equivalent to `Adjective(word).singular(person)`.
+
+    Args:
+        word (str): Input word or collocation.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects possessive adjectives. Defaults to 0.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The singular form of `word`.
+    """
+    _check_valid_person(person)
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Adjective(word).singular(person)
+    return Adjective._singular(word, person, *callbacks) # pylint: disable=W0212
+
+
+def adj_plural(word: str, person: int = 0, preserve_case: bool = True) -> str:
+    """Convert an adjective to plural form, equivalent to `Adjective(word).plural(person)`.
+
+    Args:
+        word (str): Input word or collocation.
+        person (int, optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+            This option only affects possessive adjectives. Defaults to 0.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The plural form of `word`.
+    """
+    _check_valid_person(person)
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Adjective(word).plural(person)
+    return Adjective._plural(word, person, *callbacks) # pylint: disable=W0212
+
+
+def adj_comparative(word: str, only_suffix: bool = False, preserve_case: bool = True) -> str:
+    """Convert an adjective to comparative form, equivalent to
+    `Adjective(word).comparative(only_suffix)`.
+
+    Args:
+        word (str): Input word or collocation.
+        only_suffix (bool, optional): Never prepend "more". Defaults to False.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The comparative form of `word`.
+    """
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Adjective(word).comparative(only_suffix)
+    return Adjective._comparative(word, only_suffix, callbacks[0]) # pylint: disable=W0212
+
+
+def adj_superlative(word: str, only_suffix: bool = False, preserve_case: bool = True) -> str:
+    """Convert an adjective to superlative form, equivalent to
+    `Adjective(word).superlative(only_suffix)`.
+
+    Args:
+        word (str): Input word or collocation.
+        only_suffix (bool, optional): Never prepend "most". Defaults to False.
+        preserve_case (bool, optional): Apply the casing and whitespace of `word` onto
+            the output. Defaults to True.
+
+    Returns:
+        str: The superlative form of `word`.
+    """
+    callbacks = _callbacks(word, preserve_case)
+    if callbacks is None:
+        return Adjective(word).superlative(only_suffix)
+    return Adjective._superlative(word, only_suffix, callbacks[0]) # pylint: disable=W0212
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    "LazyPattern",
+    "lazy_compile",
+    "compile_all",
+]
+
+import re
+import weakref
+from typing import Any, Optional, Pattern
+
+
+class LazyPattern:
+    """Regular expression that is only compiled when it is first used.
+
+    The generated core modules contain several huge regular expressions, which dominate
+    the time needed to import these modules. A LazyPattern defers this compilation until
+    one of the methods of `re.Pattern`, e.g. `match`, is first accessed. Afterwards, the
+    attributes of the compiled pattern are stored on the LazyPattern itself, so repeated
+    access is as fast as an ordinary attribute lookup.
+
+    The `pattern` and `flags` attributes are available without compiling.
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        """Create a LazyPattern, without compiling `pattern`.
+
+        Args:
+            pattern (str): Regular expression pattern.
+            flags (int, optional): Regular expression flags, e.g. `re.I`. Defaults to 0.
+        """
+        super().__init__()
+        self._compiled: Optional[Pattern[str]] = None
+        self.pattern = pattern
+        self.flags = flags
+        _uncompiled.add(self)
+
+    def compile(self) -> Pattern[str]:
+        """Compile the pattern if it hasn't been compiled yet.
+
+        Returns:
+            Pattern[str]: The compiled pattern.
+        """
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, flags=self.flags)
+            _uncompiled.discard(self)
+        return self._compiled
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which are not yet stored on this object
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = getattr(self.compile(), name)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self) -> str:
+        return f"LazyPattern({self.pattern[:40]!r}{'...' if len(self.pattern) > 40 else ''}, flags={self.flags!r})"
+
+
+"""
+All LazyPattern instances that have not been compiled yet.
+"""
+_uncompiled: "weakref.WeakSet[LazyPattern]" = weakref.WeakSet()
+
+
+def lazy_compile(pattern: str, flags: int = 0) -> LazyPattern:
+    """Equivalent of `re.compile`, which compiles `pattern` on first use instead.
+
+    Args:
+        pattern (str): Regular expression pattern.
+        flags (int, optional): Regular expression flags, e.g. `re.I`. Defaults to 0.
+
+    Returns:
+        LazyPattern: Pattern which is compiled on first use.
+    """
+    return LazyPattern(pattern, flags=flags)
+
+
+def compile_all() -> int:
+    """Compile all LazyPattern instances that have not been compiled yet.
+
+    Returns:
+        int: The number of patterns that were compiled.
+    """
+    patterns = list(_uncompiled)
+    for pattern in patterns:
+        pattern.compile()
+    return len(patterns)
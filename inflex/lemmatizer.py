@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Map inflected nouns and verbs back to their lemma, e.g. for search indexing::
+
+    >>> import inflex
+    >>> inflex.lemmatize("children")
+    Analysis(lemma='child', pos='noun', form='plural')
+    >>> inflex.lemmatize("flew", pos="verb")
+    Analysis(lemma='fly', pos='verb', form='past')
+
+Every form of the words in the dictionaries of `noun_core` and `verb_core` is looked up
+in an inverted index, which is built from the precomputed forms of `inflex.paradigm_core`
+on first use. Only other tokens are analysed using the rules, like `Noun.lemma` and
+`Verb.lemma`. The lemma of a verb is its plural form, e.g. "fly", and the past of "are",
+"can" and other verbs of which the past is in `plural_of` is analysed as such::
+
+    >>> inflex.lemmatize("was")
+    Analysis(lemma='are', pos='verb', form='past')
+
+The lemma of other inflected verbs is found by undoing the regular rules, e.g. removing
+"-ed" and restoring a final "e" or undoubling a final consonant, and by inverting the
+irregular rules of `verb_core`, e.g. for "ran". Only lemmas which are inflected back into
+the token are kept::
+
+    >>> inflex.lemmatize("hopped")
+    Analysis(lemma='hop', pos='verb', form='past')
+    >>> inflex.lemmatize("ran")
+    Analysis(lemma='run', pos='verb', form='past')
+
+Known limitation: Strong verbs which are neither in the dictionaries nor in the irregular
+rules of `verb_core`, such as "throve", are not recognised as inflected forms, and are their
+own lemma::
+
+    >>> inflex.lemmatize("throve", pos="verb")
+    Analysis(lemma='throve', pos='verb', form='plural')
+
+Add their lemmas to a lexicon using `inflex.load_lexicon` where needed.
+
+Use `lemmatize_all` for large numbers of tokens.
+"""
+
+__all__ = [
+    "Analysis",
+    "lemmatize",
+    "lemmatize_all",
+]
+
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from inflex import noun_core, paradigm_core, verb_core
+from inflex.noun import Noun
+from inflex.suffix_trie import split_alternatives
+from inflex.syllable import Syllable
+from inflex.term import Term
+from inflex.verb import Verb
+
+DEFAULT_CACHE_SIZE = 2 ** 20
+
+
+class Analysis(NamedTuple):
+    """The lemma of a token, with its part of speech and the form of the token."""
+    lemma: str
+    # "noun" or "verb"
+    pos: str
+    # "singular" or "plural" for nouns, and "singular", "plural", "past", "pres_part" or
+    # "past_part" for verbs. The lemma of a verb is its plural form, e.g. "fly".
+    form: str
+
+
+# Names of the forms in the records of `paradigm_core.verb_paradigms`
+_verb_forms = ("singular", "plural", "past", "pres_part", "past_part")
+
+# Stems left after removing e.g. "-ed" must contain a vowel, see `_verb_lemma`
+_vowel_regex = re.compile(r"[aeiouy]")
+# Order in which forms of the same verb take priority, e.g. "put" is analysed as "plural"
+_verb_form_order = ("plural", "singular", "past", "past_part", "pres_part")
+
+"""
+Inverted indices from each known form to its analysis, per part of speech, and for
+None, i.e. any part of speech. Built on first use by `_get_indices`, and discarded
+when the dictionaries change, e.g. by `inflex.load_lexicon`.
+"""
+_indices: Optional[Dict[Optional[str], Dict[str, Analysis]]] = None
+
+"""
+Mapping of "past", "pres_part" and "past_part" to the irregular forms produced by the
+rules of `verb_core` with a fixed stem, e.g. "ran", mapped to that stem, e.g. "run".
+Built on first use by `_get_irregular_stems`.
+"""
+_irregular_stems: Optional[Dict[str, Dict[str, List[str]]]] = None
+
+# Rules of `verb_core` of the shape `((?:.{2,})?)<stem>`, e.g. `((?:.{2,})?)run`
+_fixed_stem_rule = re.compile(r"\(\(\?:\.\{2,\}\)\?\)([a-z']+)")
+
+
+def _dictionary_words(tables: Iterable[Dict[str, str]]) -> Iterator[str]:
+    for table in tables:
+        for words in (table.keys(), table.values()):
+            for word in words:
+                if word and word != "_":
+                    yield word
+
+
+def _noun_paradigm(word: str) -> Tuple[str, str, str]:
+    paradigm = paradigm_core.noun_paradigms.get(word)
+    if paradigm is None:
+        noun = Noun(word)
+        paradigm = noun.plural(), noun.classical().plural(), noun.singular()
+    return paradigm
+
+
+def _verb_paradigm(word: str) -> Tuple[str, str, str, str, str]:
+    paradigm = paradigm_core.verb_paradigms.get(word)
+    if paradigm is None:
+        verb = Verb(word)
+        paradigm = verb.singular(), verb.plural(), verb.past(), verb.pres_part(), verb.past_part()
+    return paradigm
+
+
+def _build_indices() -> Dict[Optional[str], Dict[str, Analysis]]:
+    """Build the inverted indices from every form of the words in the dictionaries of the
+    core modules to its analysis. If a form belongs to several words, the first analysis
+    takes priority, and nouns take priority over verbs in the index for any part of speech.
+
+    Returns:
+        Dict[Optional[str], Dict[str, Analysis]]: Mapping of "noun", "verb" and None
+            to the index of the corresponding part of speech.
+    """
+    nouns: Dict[str, Analysis] = {}
+    paradigms = {word: _noun_paradigm(word) for word in _dictionary_words((
+        noun_core.modern_plural_of, noun_core.classical_plural_of, noun_core.singular_of))}
+    # The words themselves have the same lemma as `Noun.lemma`, e.g. "leaves" is the plural of "leaf"
+    for word, (_, _, singular) in paradigms.items():
+        nouns[word] = Analysis(singular, "noun", "singular" if word == singular else "plural")
+    for modern_plural, classical_plural, singular in paradigms.values():
+        nouns.setdefault(modern_plural, Analysis(singular, "noun", "plural"))
+        nouns.setdefault(classical_plural, Analysis(singular, "noun", "plural"))
+
+    verbs: Dict[str, Analysis] = {}
+    # The plural forms, e.g. "fly" for "flies", are the lemmas of all other forms. These are
+    # visited in dictionary order, so the first analysis doesn't depend on hash randomization.
+    paradigms = {lemma: dict(zip(_verb_forms, _verb_paradigm(lemma)))
+                 for lemma in dict.fromkeys(verb_core.plural_of.values()) if lemma not in ("", "_")}
+    for lemma, forms in paradigms.items():
+        for form in _verb_form_order:
+            verbs.setdefault(forms[form], Analysis(lemma, "verb", form))
+    # Lemmas which are the past of another lemma, e.g. "were" of "are", are analysed as that
+    # past, and so is their singular form if it is its own past, e.g. "was", but not "rents"
+    for lemma, forms in paradigms.items():
+        past = forms["past"]
+        if past != lemma and past in paradigms:
+            for word in (paradigms[past]["singular"], past):
+                if _verb_paradigm(word)[_verb_forms.index("past")] == word:
+                    verbs[word] = Analysis(lemma, "verb", "past")
+    # Words of which the lemma is not in `plural_of`
+    for word in _dictionary_words((verb_core.plural_of, verb_core.singular_of, verb_core.past_of,
+                                   verb_core.pres_part_of, verb_core.past_part_of)):
+        if word not in verbs:
+            forms = dict(zip(_verb_forms, _verb_paradigm(word)))
+            form = next((form for form in _verb_form_order if forms[form] == word), "plural")
+            if forms["plural"]:
+                verbs[word] = Analysis(forms["plural"], "verb", form)
+
+    return {"noun": nouns, "verb": verbs, None: {**verbs, **nouns}}
+
+
+def _get_indices() -> Dict[Optional[str], Dict[str, Analysis]]:
+    global _indices  # pylint: disable=W0603
+    indices = _indices
+    if indices is None:
+        indices = _indices = _build_indices()
+    return indices
+
+
+def _get_irregular_stems() -> Dict[str, Dict[str, List[str]]]:
+    global _irregular_stems  # pylint: disable=W0603
+    irregular_stems = _irregular_stems
+    if irregular_stems is None:
+        irregular_stems = {form: {} for form in ("past", "pres_part", "past_part")}
+        for rule in split_alternatives(verb_core.plural_recognize_rule.pattern):
+            match = _fixed_stem_rule.fullmatch(rule)
+            if match:
+                stem = match.group(1)
+                for form, inflected in verb_core.convert_to_paradigm(stem, tuple(irregular_stems)).items():
+                    if inflected and inflected != stem:
+                        irregular_stems[form].setdefault(inflected, []).append(stem)
+        _irregular_stems = irregular_stems
+    return irregular_stems
+
+
+def _verb_lemma(word: str, form: str) -> Optional[str]:
+    """Find the lemma of a lowercase past, present participle or past participle verb
+    by undoing the regular and irregular rules, e.g. "jump" for "jumped", "hop" for "hopped",
+    "bake" for "baked" and "run" for "ran".
+
+    Note:
+        Only candidates which are converted back into `word`, e.g. `Verb(candidate).past()`,
+        are kept. Candidates of the irregular rules are preferred, followed by the known
+        words, i.e. those in the dictionaries or in the stress data, so "stop" is preferred
+        over "stopp" for "stopped". The regular rules are only undone if the remaining stem
+        has at least two letters, including a vowel, so "fed" doesn't give "f".
+
+    Args:
+        word (str): Lowercase input word.
+        form (str): The form of `word`, either "past", "pres_part" or "past_part".
+
+    Returns:
+        Optional[str]: The lemma of `word`, or None if no candidate is converted back into `word`.
+    """
+    irregular = []
+    for inflected, stems in _get_irregular_stems()[form].items():
+        if word.endswith(inflected):
+            irregular += [word[:-len(inflected)] + stem for stem in stems]
+
+    candidates = []
+    suffix = "ing" if form == "pres_part" else "ed"
+    stem = word[:-len(suffix)]
+    if word.endswith(suffix) and len(stem) >= 2 and _vowel_regex.search(stem):
+        # "died" and "dying" of "die", "tried" of "try"
+        if len(stem) == 2 and stem[-1] == ("y" if suffix == "ing" else "i"):
+            candidates.append(stem[:-1] + "ie")
+        elif suffix == "ed" and stem[-1] == "i":
+            candidates.append(stem[:-1] + "y")
+        # "hopped" of "hop", but "called" of "call"
+        if len(stem) > 2 and stem[-1] == stem[-2] and stem[-1] not in "aeiou":
+            if stem[-1] in "fls":
+                candidates += [stem, stem[:-1]]
+            else:
+                candidates += [stem[:-1], stem]
+        else:
+            candidates.append(stem)
+        # "baked" of "bake", "agreed" of "agree"
+        candidates.append(stem + "e")
+    # "wed" and "shed", which are their own past, but not "thing" or "king"
+    if suffix == "ed":
+        candidates.append(word)
+
+    valid = [candidate for candidate in dict.fromkeys(irregular + candidates)
+             if dict(zip(_verb_forms, _verb_paradigm(candidate)))[form] == word]
+    for candidate in valid:
+        if candidate in irregular:
+            return candidate
+    verbs = _get_indices()["verb"]
+    for candidate in valid:
+        if candidate in verbs or Syllable.get_flags(candidate) is not None:
+            return candidate
+    return valid[0] if valid else None
+
+
+def _analyse(token: str, pos: Optional[str]) -> Analysis:
+    """Analyse a token that is not in the index of `pos` using the rules.
+
+    Args:
+        token (str): Input word or collocation.
+        pos (Optional[str]): "noun", "verb" or None.
+
+    Returns:
+        Analysis: The lemma of `token`, with its part of speech and form.
+    """
+    # Known words with another casing, e.g. at the start of a sentence
+    lower = token.lower()
+    if lower != token:
+        analysis = _get_indices()[pos].get(lower)
+        if analysis is not None:
+            return analysis._replace(lemma=_encase(token, analysis.lemma))
+
+    if pos != "verb":
+        noun = Noun(token)
+        if noun.is_plural():
+            return Analysis(noun.lemma(), "noun", "plural")
+        if pos == "noun":
+            return Analysis(noun.lemma(), "noun", "singular")
+
+    verb = Verb(lower)
+    if verb.is_past():
+        form = "past"
+    elif verb.is_pres_part():
+        form = "pres_part"
+    elif verb.is_past_part():
+        form = "past_part"
+    elif pos is None:
+        # Neither a plural noun, nor an inflected verb
+        return Analysis(noun.lemma(), "noun", "singular")
+    elif verb.is_singular() and not verb.is_plural():
+        form = "singular"
+    else:
+        form = "plural"
+    lemma = _verb_lemma(lower, form) if form not in ("singular", "plural") else None
+    if lemma is None:
+        if pos is None and form not in ("singular", "plural"):
+            # Not an inflected verb after all, e.g. "thing"
+            return Analysis(noun.lemma(), "noun", "singular")
+        lemma = verb.lemma()
+    return Analysis(_encase(token, lemma), "verb", form)
+
+
+def _encase(token: str, lemma: str) -> str:
+    """Apply the casing of `token` onto its lemma.
+
+    Args:
+        token (str): Input word or collocation.
+        lemma (str): The lowercase lemma of `token`.
+
+    Returns:
+        str: `lemma` with the casing of `token`, or `token` itself if it is its own lemma,
+            e.g. "I" rather than "i".
+    """
+    if lemma == token.lower():
+        return token
+    return Term(token)._encase(lemma)  # pylint: disable=W0212
+
+
+def _check_valid_pos(pos: Optional[str]) -> None:
+    if pos not in ("noun", "verb", None):
+        raise ValueError(f"Invalid `pos` parameter {pos!r}. Valid values include 'noun', 'verb' and None.")
+
+
+def lemmatize(token: str, pos: Optional[str] = None) -> Analysis:
+    """Get the lemma of a noun or verb, with its part of speech and the form of `token`.
+
+    Examples:
+        >>> lemmatize("geese")
+        Analysis(lemma='goose', pos='noun', form='plural')
+        >>> lemmatize("flies", pos="verb")
+        Analysis(lemma='fly', pos='verb', form='singular')
+        >>> lemmatize("Wolves")
+        Analysis(lemma='Wolf', pos='noun', form='plural')
+
+    Args:
+        token (str): Input word or collocation.
+        pos (Optional[str], optional): Either "noun" or "verb". Defaults to None, i.e. the
+            part of speech is inferred from `token`. Known nouns take priority over known
+            verbs, e.g. "flies" is analysed as a noun.
+
+    Raises:
+        ValueError: If `pos` is invalid.
+
+    Returns:
+        Analysis: The tuple of the lemma, the part of speech and the form of `token`.
+            The casing of `token` is applied onto the lemma.
+    """
+    _check_valid_pos(pos)
+    analysis = _get_indices()[pos].get(token)
+    if analysis is None:
+        return _analyse(token, pos)
+    return analysis
+
+
+def lemmatize_all(tokens: Iterable[str],
+                  pos: Optional[str] = None,
+                  cache_size: int = DEFAULT_CACHE_SIZE) -> Iterator[Analysis]:
+    """Lemmatize many tokens, equivalent to `lemmatize(token, pos)` for each token.
+
+    Tokens are lazily analysed in input order, so `tokens` may be a stream that doesn't fit
+    in memory. Known forms are looked up in the index directly, while the analyses of the
+    `cache_size` most recently seen other distinct tokens are remembered, which bounds the
+    memory used.
+
+    Examples:
+        >>> list(lemmatize_all(["cats", "ate", "mice"]))
+        [Analysis(lemma='cat', pos='noun', form='plural'), Analysis(lemma='eat', pos='verb', form='past'), Analysis(lemma='mouse', pos='noun', form='plural')]
+
+    Args:
+        tokens (Iterable[str]): Input words or collocations.
+        pos (Optional[str], optional): Either "noun" or "verb". Defaults to None, i.e. the
+            part of speech is inferred from each token.
+        cache_size (int, optional): Maximum number of distinct unknown tokens of which the
+            analysis is remembered. Defaults to 2 ** 20.
+
+    Raises:
+        ValueError: If `pos` is invalid.
+
+    Yields:
+        Analysis: The analyses of `tokens`, in input order.
+    """
+    _check_valid_pos(pos)
+    return _lemmatize_all(tokens, pos, cache_size)
+
+
+def _lemmatize_all(tokens: Iterable[str], pos: Optional[str], cache_size: int) -> Iterator[Analysis]:
+    index = _get_indices()[pos]
+    results: "OrderedDict[str, Analysis]" = OrderedDict()
+    for token in tokens:
+        analysis = index.get(token)
+        if analysis is None:
+            try:
+                analysis = results[token]
+                results.move_to_end(token)
+            except KeyError:
+                analysis = results[token] = _analyse(token, pos)
+                if len(results) > cache_size:
+                    results.popitem(last=False)
+        yield analysis
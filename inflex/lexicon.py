@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Extend the core modules with domain vocabulary at runtime, without regenerating them::
+
+    import inflex
+    inflex.load_lexicon("custom_nouns.lei")
+
+A lexicon uses the `.lei` format of `lei/nouns.lei` or `lei/verbs.lei`, and is parsed
+by the same `Reader` as used by `generate/generate_nouns.py` and `generate/generate_verbs.py`.
+The parsed entries are stored in a cache directory, keyed on a hash of the contents of the
+lexicon, so later processes loading the same lexicon skip parsing it.
+
+Only literal entries, e.g. "schema => schemata | schemata" or "pings ping pinged pinging pinged",
+are supported. Generic rules, e.g. "-ix => -ices", and recursive rules, e.g. "(SING)-general",
+are compiled into the rule regexes of the core modules, and require regenerating them.
+"""
+
+__all__ = [
+    "load_lexicon",
+    "default_cache_dir",
+]
+
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from typing import Dict, Iterable, Optional, Set
+
+from inflex import cache, noun_core, noun_lei, paradigm_core, term, verb_core, verb_lei
+from inflex.verb import Verb
+
+# Version of the format of the cached lexicons. Cached lexicons of another version are ignored.
+CACHE_FORMAT = 1
+
+# The dictionaries of the core modules that are extended, per part of speech
+_literal_tables = {
+    "noun": (noun_core, ("modern_plural", "classical_plural", "singular")),
+    "verb": (verb_core, ("plural", "singular", "past", "pres_part", "past_part")),
+}
+
+
+def default_cache_dir() -> str:
+    """Get the directory in which parsed lexicons are cached, i.e. `$INFLEX_CACHE_DIR` if set,
+    and `inflex/lexicons` in the user cache directory otherwise.
+
+    Returns:
+        str: Path of the cache directory.
+    """
+    if os.environ.get("INFLEX_CACHE_DIR"):
+        return os.environ["INFLEX_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "inflex", "lexicons")
+
+
+def _infer_pos(path: str) -> str:
+    """Infer whether the lexicon at `path` holds nouns or verbs, from its first data line.
+    Noun lines hold a "=>" separator, while verb lines hold five columns.
+
+    Args:
+        path (str): Path of the lexicon.
+
+    Raises:
+        ValueError: If the lexicon holds no data lines.
+
+    Returns:
+        str: Either "noun" or "verb".
+    """
+    with open(path, "r", encoding="utf8") as f:
+        for line in f:
+            if noun_lei.COMMENT_LINE_PAT.match(line) or noun_lei.BLANK_LINE_PAT.match(line):
+                continue
+            return "noun" if "=>" in line else "verb"
+    raise ValueError(f"Lexicon {path!r} holds no entries")
+
+
+def _parse(path: str, pos: str) -> Dict[str, Dict[str, str]]:
+    """Parse the lexicon at `path` into the entries of the dictionaries of the core module.
+
+    Args:
+        path (str): Path of the lexicon.
+        pos (str): Either "noun" or "verb".
+
+    Raises:
+        ValueError: If the lexicon holds invalid lines, or generic or recursive rules.
+
+    Returns:
+        Dict[str, Dict[str, str]]: Mapping of the names of the dictionaries, e.g. "singular"
+            for `singular_of`, to the entries to add to them.
+    """
+    if pos == "noun":
+        noun_reader = noun_lei.Reader(path)
+        noun_reader.parse_file()
+        patterns = noun_reader.patterns
+        literals = noun_reader.get_literals()
+    else:
+        verb_reader = verb_lei.Reader(path)
+        verb_reader.parse_file()
+        patterns = verb_reader.patterns
+        literals = verb_reader.literals
+
+    for rules in patterns.values():
+        if rules:
+            raise ValueError(f"Lexicon {path!r} holds the generic or recursive rule {rules[0]['from']!r}. "
+                             f"Such rules can only be added to lei/{pos}s.lei, after which "
+                             f"generate/generate_{pos}s.py must be run.")
+    return literals
+
+
+def _read_cache(cache_path: str, pos: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Read parsed entries from the cache, if they exist and have the current format.
+
+    Args:
+        cache_path (str): Path of the cached entries.
+        pos (str): Either "noun" or "verb".
+
+    Returns:
+        Optional[Dict[str, Dict[str, str]]]: The cached entries, or None if there are none.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("format") != CACHE_FORMAT or cached.get("pos") != pos:
+        return None
+    return cached["literals"]
+
+
+def _write_cache(cache_path: str, pos: str, literals: Dict[str, Dict[str, str]]) -> None:
+    """Write parsed entries to the cache. The cache is replaced atomically, so concurrent
+    processes never read a partially written file. Failures, e.g. due to a read-only
+    file system, are ignored, as the cache only saves time.
+
+    Args:
+        cache_path (str): Path of the cached entries.
+        pos (str): Either "noun" or "verb".
+        literals (Dict[str, Dict[str, str]]): The parsed entries.
+    """
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as f:
+                json.dump({"format": CACHE_FORMAT, "pos": pos, "literals": literals}, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _update_verb_sets() -> None:
+    """Recompute the sets which `verb_core` derives from its dictionaries, e.g. `past_of_values`.
+    The sets are updated in place, as they may also be referenced by name elsewhere.
+    """
+    for name in ("past", "pres_part", "past_part"):
+        values = getattr(verb_core, f"{name}_of_values")
+        values.clear()
+        values.update(getattr(verb_core, f"{name}_of").values())
+    verb_core.plural_and_singular.clear()
+    verb_core.plural_and_singular.update(verb_core.past_of_values,
+                                         verb_core.pres_part_of_values,
+                                         verb_core.past_part_of_values)
+
+
+def _drop_paradigms(words: Iterable[str]) -> Set[str]:
+    """Drop the precomputed forms of `paradigm_core` that may depend on the dictionary entries of
+    `words`. The rules only look up the dictionaries using a whole word, or a subterm of a
+    collocation or possessive, delimited by whitespace, hyphens or apostrophes, optionally after
+    splitting off a verb prefix such as "un" in "unbind". Records are only dropped if their word
+    or one of their forms holds one of `words` in this way.
+
+    Args:
+        words (Iterable[str]): The keys and values of the changed dictionary entries.
+
+    Returns:
+        Set[str]: The words of which the precomputed forms were dropped.
+    """
+    words = {word for word in words if word}
+    if not words:
+        return set()
+    alternatives = "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+    prefixes = "|".join(map(re.escape, Verb._prefixes))  # pylint: disable=W0212
+    stale_regex = re.compile(rf"(?<![^\s'-])(?:{prefixes})?(?:{alternatives})(?![^\s'-])", flags=re.I)
+
+    dropped = set()
+    for paradigms in (paradigm_core.noun_paradigms, paradigm_core.verb_paradigms):
+        stale = [word for word, forms in paradigms.items() if stale_regex.search("\t".join((word, *forms)))]
+        for word in stale:
+            del paradigms[word]
+        dropped.update(stale)
+    return dropped
+
+
+def _invalidate(words: Optional[Iterable[str]] = None) -> None:
+    """Discard all results computed using the dictionaries of the core modules, and the
+    index of `inflex.lemmatizer`.
+
+    Args:
+        words (Optional[Iterable[str]], optional): The keys and values of the changed dictionary
+            entries, of which the precomputed forms of `paradigm_core` are dropped, together
+            with the forms of the words that are inflected through them. Defaults to None,
+            i.e. all precomputed forms are dropped.
+    """
+    cache.clear()
+    term._case_sensitive = None  # pylint: disable=W0212
+    dropped = None
+    if words is None:
+        paradigm_core.noun_paradigms.clear()
+        paradigm_core.verb_paradigms.clear()
+    else:
+        dropped = _drop_paradigms(words)
+    lemmatizer = sys.modules.get("inflex.lemmatizer")
+    if lemmatizer is not None:
+        lemmatizer._indices = None  # pylint: disable=W0212
+    for (_, word), instance in list(term.Term._instances.items()):  # pylint: disable=W0212
+        instance._memo = None  # pylint: disable=W0212
+        if dropped is not None and word not in dropped:
+            continue
+        if hasattr(instance, "_paradigm"):
+            instance._paradigm = None  # pylint: disable=W0212
+        if getattr(instance, "_classical", None) is not None:
+            instance._classical._paradigm = None  # pylint: disable=W0212
+
+
+def load_lexicon(path: str,
+                 pos: Optional[str] = None,
+                 cache_dir: Optional[str] = None,
+                 use_cache: bool = True) -> Dict[str, Dict[str, str]]:
+    """Add the entries of the `.lei` lexicon at `path` to the core modules, overriding
+    existing entries for the same words.
+
+    Afterwards, all cached results are discarded, including the forms computed by the shared
+    instances from e.g. `Noun.get`, and the precomputed forms in `inflex.paradigm_core` of the
+    words in the lexicon, and of the collocations containing them, e.g. "man-child" for
+    "child", so these are computed again. Instances created using e.g.
+    `Noun(term)` keep the forms they already computed. Lexicons should be loaded before
+    converting terms in other threads.
+
+    Examples:
+        >>> import inflex
+        >>> inflex.load_lexicon("custom_nouns.lei")
+        {'modern_plural': {'schema': 'schemata'}, 'classical_plural': {'schema': 'schemata'}, 'singular': {'schemata': 'schema'}}
+        >>> inflex.Noun("schema").plural()
+        'schemata'
+
+    Args:
+        path (str): Path of the lexicon, in the format of `lei/nouns.lei` or `lei/verbs.lei`.
+        pos (Optional[str], optional): Either "noun" or "verb". Defaults to None, i.e. inferred
+            from the first entry of the lexicon.
+        cache_dir (Optional[str], optional): Directory in which parsed lexicons are cached.
+            Defaults to None, i.e. `default_cache_dir()`.
+        use_cache (bool, optional): Whether to read and write the cache. Defaults to True.
+
+    Raises:
+        ValueError: If `pos` is invalid, or if the lexicon holds no entries, invalid lines,
+            or generic or recursive rules.
+
+    Returns:
+        Dict[str, Dict[str, str]]: Mapping of the names of the dictionaries of the core module,
+            e.g. "singular" for `singular_of`, to the entries added to them.
+    """
+    if pos is None:
+        pos = _infer_pos(path)
+    if pos not in _literal_tables:
+        raise ValueError(f"Unknown part of speech {pos!r}. Options are {sorted(_literal_tables)}")
+
+    literals = None
+    if use_cache:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        cache_path = os.path.join(cache_dir or default_cache_dir(), f"{pos}-{digest}.json")
+        literals = _read_cache(cache_path, pos)
+    if literals is None:
+        literals = _parse(path, pos)
+        if use_cache:
+            _write_cache(cache_path, pos, literals)
+
+    core, names = _literal_tables[pos]
+    for name in names:
+        getattr(core, f"{name}_of").update(literals[name])
+    if pos == "verb":
+        _update_verb_sets()
+
+    _invalidate({word for entries in literals.values() for item in entries.items() for word in item})
+    return literals
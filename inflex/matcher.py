@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Find every inflected form of many lemmas in a text, in a single pass::
+
+    >>> import inflex
+    >>> matcher = inflex.Matcher(["child", "fly"])
+    >>> list(matcher.finditer("The Children saw a fly flying by."))
+    [Match(start=4, end=12, lemma='child', pos='noun', form='children'), Match(start=19, end=22, lemma='fly', pos='noun', form='fly'), Match(start=19, end=22, lemma='fly', pos='verb', form='fly'), Match(start=23, end=29, lemma='fly', pos='verb', form='flying')]
+
+The forms of all lemmas, i.e. those listed by `inflex.expand`, are compiled into one
+Aho-Corasick automaton, so the time taken to scan a text grows with the length of the text,
+rather than with the number of lemmas, unlike scanning the text with the `as_regex` pattern
+of each lemma.
+"""
+
+__all__ = [
+    "Match",
+    "Matcher",
+]
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from inflex.expand import noun_forms, verb_forms
+
+# Number of distinct characters, used to combine a state and a character into one integer key
+_N_CHARS = 0x110000
+
+
+class Match(NamedTuple):
+    """An occurrence of a form of a lemma, at `text[start:end]`."""
+    start: int
+    end: int
+    lemma: str
+    # "noun" or "verb"
+    pos: str
+    # The lowercase form of `lemma` that matched, e.g. "children"
+    form: str
+
+
+def _lower(text: str) -> str:
+    """Lowercase `text`, while keeping the offsets of all characters.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        str: `text` in lowercase, apart from characters of which the lowercase form
+            consists of several characters, e.g. "İ".
+    """
+    lower = text.lower()
+    if len(lower) == len(text):
+        return lower
+    return "".join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+def _is_word_char(char: str) -> bool:
+    # Equivalent to matching `\w` in a regular expression
+    return char.isalnum() or char == "_"
+
+
+class Matcher:
+    """Matches any inflected form of many lemmas at once, case-insensitively.
+
+    Each state of the automaton corresponds to a prefix of a form. The transitions are stored
+    in one dictionary keyed on the state and the next character, which takes far less memory
+    than a dictionary per state. If a character has no transition from the current state, the
+    automaton falls back to the state of the longest proper suffix of the current prefix,
+    until a transition is found or the initial state is reached.
+    """
+
+    def __init__(self, lemmas: Iterable[str], pos: Optional[str] = None, whole_words: bool = True) -> None:
+        """Expand `lemmas` to their forms, and build the automaton matching these forms.
+
+        Examples:
+            >>> matcher = Matcher(["child", "mouse"], pos="noun")
+
+        Args:
+            lemmas (Iterable[str]): Input words or collocations.
+            pos (Optional[str], optional): Either "noun" or "verb". Defaults to None, i.e. the
+                forms of each lemma as both a noun and a verb are matched.
+            whole_words (bool, optional): Only match forms that are not directly preceded or
+                followed by a letter, digit or underscore, like the `\\b` boundary of regular
+                expressions. Defaults to True.
+
+        Raises:
+            ValueError: If `pos` is invalid.
+        """
+        super().__init__()
+        pos_forms = {"noun": noun_forms, "verb": verb_forms}
+        if pos is not None and pos not in pos_forms:
+            raise ValueError(f"Unknown part of speech {pos!r}. Options are {sorted(pos_forms)}")
+        self.pos = pos
+        self.whole_words = whole_words
+
+        # Transitions, keyed on `state * _N_CHARS + ord(char)`
+        self._goto: Dict[int, int] = {}
+        # The matches ending in each state that has any, as (length, matched lemmas) pairs
+        self._output: Dict[int, List[Tuple[int, Tuple[Tuple[str, str, str], ...]]]] = {}
+        self._n_states = 1
+        self._max_length = 0
+
+        found: Dict[str, Dict[Tuple[str, str, str], None]] = {}
+        for lemma in lemmas:
+            for part in ((pos,) if pos else tuple(pos_forms)):
+                for form in pos_forms[part](lemma):
+                    form = _lower(form)
+                    if form:
+                        found.setdefault(form, {})[(lemma, part, form)] = None
+
+        for form, matched in found.items():
+            self._output[self._insert(form)] = [(len(form), tuple(matched))]
+            self._max_length = max(self._max_length, len(form))
+        self._n_forms = len(found)
+        self._fail = self._link()
+
+    def __len__(self) -> int:
+        """The number of distinct forms matched."""
+        return self._n_forms
+
+    def _insert(self, form: str) -> int:
+        """Add the states for the prefixes of `form`.
+
+        Args:
+            form (str): Non-empty, lowercase form.
+
+        Returns:
+            int: The state of `form`.
+        """
+        goto = self._goto
+        state = 0
+        for char in form:
+            key = state * _N_CHARS + ord(char)
+            next_state = goto.get(key)
+            if next_state is None:
+                next_state = goto[key] = self._n_states
+                self._n_states += 1
+            state = next_state
+        return state
+
+    def _link(self) -> List[int]:
+        """Compute the fallback state of each state, in breadth-first order, and add the
+        matches of the fallback states to the matches of each state.
+
+        Returns:
+            List[int]: The fallback state of each state.
+        """
+        goto = self._goto
+        output = self._output
+        children: List[List[Tuple[int, int]]] = [[] for _ in range(self._n_states)]
+        for key, state in goto.items():
+            parent, char = divmod(key, _N_CHARS)
+            children[parent].append((char, state))
+
+        fail = [0] * self._n_states
+        queue = deque(state for _, state in children[0])
+        while queue:
+            state = queue.popleft()
+            for char, child in children[state]:
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and fallback * _N_CHARS + char not in goto:
+                    fallback = fail[fallback]
+                fallback = goto.get(fallback * _N_CHARS + char, 0)
+                fail[child] = fallback
+                if fallback in output:
+                    output[child] = output.get(child, []) + output[fallback]
+        return fail
+
+    def finditer(self, text: str) -> Iterator[Match]:
+        """Find all occurrences of the forms in `text`, including overlapping occurrences.
+
+        Examples:
+            >>> [match.form for match in Matcher(["mouse"], pos="noun").finditer("Mice!")]
+            ['mice']
+
+        Args:
+            text (str): Input text.
+
+        Yields:
+            Match: The occurrences, ordered by their end offset, and then by decreasing length.
+        """
+        return self.finditer_chunks((text,))
+
+    def finditer_chunks(self, chunks: Iterable[str]) -> Iterator[Match]:
+        """Find all occurrences of the forms in a text that is split into chunks, e.g. read
+        from a large file. Forms spanning several chunks are also found.
+
+        Examples:
+            >>> with open("document.txt", encoding="utf8") as f:
+            ...     matches = list(matcher.finditer_chunks(iter(lambda: f.read(65536), "")))
+
+        Args:
+            chunks (Iterable[str]): Consecutive parts of the input text.
+
+        Yields:
+            Match: The occurrences, with offsets into the concatenation of the chunks,
+                ordered by their end offset, and then by decreasing length.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        whole_words = self.whole_words
+
+        state = 0
+        # The end of the previous chunks, to check the character preceding a form
+        tail = ""
+        offset = 0
+        # Occurrences ending at the end of the previous chunk, which are only reported
+        # if the next chunk doesn't continue the word
+        pending: List[Match] = []
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            text = tail + _lower(chunk)
+            # Offset of `text` in the full text
+            base = offset - len(tail)
+
+            if pending:
+                if not _is_word_char(text[len(tail)]):
+                    yield from pending
+                pending = []
+
+            for i in range(len(tail), len(text)):
+                char = ord(text[i])
+                next_state = goto.get(state * _N_CHARS + char)
+                while next_state is None and state:
+                    state = fail[state]
+                    next_state = goto.get(state * _N_CHARS + char)
+                state = next_state or 0
+
+                if state not in output:
+                    continue
+                end = i + 1
+                for length, matched in output[state]:
+                    start = end - length
+                    if whole_words:
+                        if start > 0 and _is_word_char(text[start - 1]):
+                            continue
+                        if end < len(text) and _is_word_char(text[end]):
+                            continue
+                    matches = [Match(base + start, base + end, lemma, part, form) for lemma, part, form in matched]
+                    if whole_words and end == len(text):
+                        pending.extend(matches)
+                    else:
+                        yield from matches
+
+            offset += len(chunk)
+            tail = text[-(self._max_length + 1):]
+
+        yield from pending
@@ -2,26 +2,59 @@
 # -*- coding: utf-8 -*-
 
 import re
-from typing import Dict, List, Optional, Pattern, Union
+from typing import Callable, Dict, List, Optional, Pattern, Tuple, Union
 
 
-from inflex.term import Term
+from inflex.term import Term, memoize_form, memoize_pattern
 from inflex.noun_core import (
-    is_singular,
-    is_plural,
+    VERSION,
+    classify_number,
     convert_to_classical_plural,
     convert_to_modern_plural,
     convert_to_singular,
 )
+from inflex.paradigm_core import noun_core_version, noun_paradigms
 from inflex.indefinite_core import (
     select_indefinite_article,
     prepend_indefinite_article,
 )
 
+# The precomputed forms are only valid for the noun_core from which they were generated
+if noun_core_version != VERSION:
+    noun_paradigms.clear()
+
+
+def _flatten_inflection(inflection: Dict[str, Dict[str, Dict[str, Union[str, int, List[str]]]]],
+                        cases: List[str]) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """Flatten the pronoun inflection table into one mapping per number, from the lowercase
+    pronoun to its inflections for each person. If a pronoun occurs for several cases,
+    the case that comes first in `cases` takes priority.
+
+    Args:
+        inflection (Dict[str, Dict[str, Dict[str, Union[str, int, List[str]]]]]):
+            Pronoun inflection table, i.e. `Noun._noun_inflection`.
+        cases (List[str]): The cases in `inflection`, in order of priority.
+
+    Returns:
+        Dict[str, Dict[str, Tuple[str, ...]]]: Mapping from "singular" and "plural" to a
+            mapping from pronoun to the inflections for each person.
+    """
+    flattened: Dict[str, Dict[str, Tuple[str, ...]]] = {"singular": {}, "plural": {}}
+    for case in reversed(cases):
+        for pronoun, forms in inflection[case].items():
+            for number, pronouns in flattened.items():
+                pronouns[pronoun] = tuple(forms[number]) # type: ignore
+    return flattened
+
 
 class Noun(Term):
     """Class for detecting and converting to noun forms."""
 
+    __slots__ = ("_classical", "_paradigm")
+
+    # Index of the plural form in the records of `paradigm_core.noun_paradigms`
+    _paradigm_plural = 0
+
     _noun_inflection: Dict[str, Dict[str, Dict[str, Union[str, int, List[str]]]]] = {
         # CASE
         #   TERM             0TH            1ST             2ND             3RD
@@ -353,6 +386,13 @@ class Noun(Term):
         },
     }
 
+    # Pronoun inflections by number and lowercase pronoun, both for standalone pronouns and
+    # for pronouns following a preposition, where the objective case takes priority.
+    _pronoun_inflection = _flatten_inflection(
+        _noun_inflection, ["nominative", "objective", "possessive", "reflexive"])
+    _prep_pronoun_inflection = _flatten_inflection(
+        _noun_inflection, ["objective", "possessive", "reflexive", "nominative"])
+
     # Regex to detect a preposition
     _prep_regex = re.compile(
         r"""\A ( \s*(?:
@@ -390,11 +430,19 @@ class Noun(Term):
 
         # Cached classical form of this Noun, to be lazily loaded just once.
         self._classical: Optional[ClassicalNoun] = None
+        # The precomputed forms of `term`, if it is a known noun
+        self._paradigm: Optional[Tuple[str, str, str]] = noun_paradigms.get(term)
 
     # ---------------------------------- #
     # Override default methods from Term #
     # ---------------------------------- #
 
+    def _reset(self) -> None:
+        """Discard everything computed for the previous term, including the classical form and the precomputed forms."""
+        super()._reset()
+        self._classical = None
+        self._paradigm = None
+
     def is_noun(self) -> bool:
         """Returns `True` only if this noun is instantiated via `Noun(term)`.
 
@@ -409,7 +457,7 @@ class Noun(Term):
         Returns:
             bool: True if this noun is deemed singular.
         """
-        return is_singular(self.term)
+        return self._classify_number()[1]
 
     def is_plural(self) -> bool:
         """Detect whether this noun is in plural form.
@@ -417,8 +465,19 @@ class Noun(Term):
         Returns:
             bool: True if this noun is deemed plural.
         """
-        return is_plural(self.term)
+        return self._classify_number()[0]
 
+    @memoize_form(canonical=False)
+    def _classify_number(self) -> Tuple[bool, bool]:
+        """Detect whether this noun is in plural form, and whether it is in singular form,
+        see `noun_core.classify_number`.
+
+        Returns:
+            Tuple[bool, bool]: True if this noun is deemed plural, and True if it is deemed singular.
+        """
+        return classify_number(self.term)
+
+    @memoize_form
     def singular(self, person: int = 0) -> str:
         """Returns this noun's singular form.
 
@@ -429,27 +488,12 @@ class Noun(Term):
         Returns:
             str: This noun's singular form.
         """
+        if person == 0 and self._paradigm is not None:
+            return self._paradigm[2]
         self._check_valid_person(person)
-        match = Noun._prep_regex.match(self.term)
-
-        if match:
-            prep = match.group()
-            term = self.term[match.end():]
-
-            for case in ["objective", "possessive", "reflexive", "nominative"]:
-                if term.lower() in Noun._noun_inflection[case]:
-                    converted = Noun._noun_inflection[case][term.lower()]["singular"][person] # type: ignore
-                    return self._encase(prep + converted)
-
-            return self._encase(prep + convert_to_singular(term))
-
-        for case in ["nominative", "objective", "possessive", "reflexive"]:
-            if self.term.lower() in Noun._noun_inflection[case]:
-                converted = Noun._noun_inflection[case][self.term.lower()]["singular"][person] # type: ignore
-                return self._encase(converted)
-
-        return self._encase(convert_to_singular(self.term))
+        return self._encase(Noun._inflect(self.term, "singular", person, convert_to_singular))
 
+    @memoize_form
     def plural(self, person: int = 0) -> str:
         """Returns this noun's plural form.
 
@@ -460,26 +504,45 @@ class Noun(Term):
         Returns:
             str: This noun's plural form.
         """
+        if person == 0 and self._paradigm is not None:
+            return self._paradigm[self._paradigm_plural]
         self._check_valid_person(person)
-        match = Noun._prep_regex.match(self.term)
+        return self._encase(Noun._inflect(self.term, "plural", person, self._convert_to_plural))
 
-        if match:
-            prep = match.group()
-            term = self.term[match.end():]
+    @staticmethod
+    def _inflect(term: str, number: str, person: int, convert: Callable[[str], str]) -> str:
+        """Convert `term` to singular or plural form, without applying the casing of `term`.
 
-            for case in ["objective", "possessive", "reflexive", "nominative"]:
-                if term.lower() in Noun._noun_inflection[case]:
-                    converted = Noun._noun_inflection[case][term.lower()]["plural"][person] # type: ignore
-                    return self._encase(prep + converted)
+        Args:
+            term (str): The stripped input word or collocation.
+            number (str): Either "singular" or "plural".
+            person (int): Represents the grammatical "person" (1st, 2nd, 3rd).
+            convert (Callable[[str], str]): Converts a word that is not a pronoun,
+                e.g. `convert_to_singular`.
+
+        Returns:
+            str: The singular or plural form of `term`.
+        """
+        # A preposition must be followed by whitespace. All whitespace characters
+        # other than " " are unprintable, so this check avoids most regex calls.
+        if " " in term or not term.isprintable():
+            match = Noun._prep_regex.match(term)
+
+            if match:
+                prep = match.group()
+                term = term[match.end():]
 
-            return self._encase(prep + self._convert_to_plural(term))
+                pronoun = Noun._prep_pronoun_inflection[number].get(term.lower())
+                if pronoun:
+                    return prep + pronoun[person]
 
-        for case in ["nominative", "objective", "possessive", "reflexive"]:
-            if self.term.lower() in Noun._noun_inflection[case]:
-                converted = Noun._noun_inflection[case][self.term.lower()]["plural"][person] # type: ignore
-                return self._encase(converted)
+                return prep + convert(term)
 
-        return self._encase(self._convert_to_plural(self.term))
+        pronoun = Noun._pronoun_inflection[number].get(term.lower())
+        if pronoun:
+            return pronoun[person]
+
+        return convert(term)
 
     def _convert_to_plural(self, term) -> str: # pylint: disable=R0201
         """The convert to plural call used by this class. Is overridden for classical nouns.
@@ -532,9 +595,14 @@ class Noun(Term):
         """
         return self.singular()
 
-    def as_regex(self) -> Pattern[str]:
+    @memoize_pattern
+    def as_regex(self, word_boundaries: bool = False) -> Pattern[str]:
         """Returns a `re.Pattern` which case-insensitively matches any inflected form of the word.
 
+        Args:
+            word_boundaries (bool, optional): Only match whole words, by surrounding the
+                pattern with `\\b`. Defaults to False.
+
         Returns:
             re.Pattern: Compiled regex object which case-insensitively matches any inflected form
                 of the word.
@@ -543,10 +611,8 @@ class Noun(Term):
             >>> Noun('cherub').as_regex()
             re.compile('cherubs|cherubim|cherub', re.IGNORECASE)
         """
-        return re.compile("|".join(sorted(map(re.escape, {self.singular(), # type: ignore
-                                                          self.plural(),
-                                                          self.classical().plural()
-                                                          }), reverse=True)), flags=re.I)
+        return Term._compile_forms({self.singular(), self.plural(), self.classical().plural()}, # pylint: disable=W0212
+                                   word_boundaries)
 
     # ---------------------------- #
     # Methods exclusively for Noun #
@@ -590,6 +656,10 @@ class Noun(Term):
 class ClassicalNoun(Noun):
     """Subclass of noun for detecting and converting to noun forms, with a classical plural."""
 
+    __slots__ = ("_modern",)
+
+    _paradigm_plural = 1
+
     def __init__(self, term: str, modern: Noun) -> None:
         """Creates ClassicalNoun instance with detection and conversion methods.
 
@@ -610,6 +680,20 @@ class ClassicalNoun(Noun):
         # Modern form of this Classical noun
         self._modern = modern
 
+    @classmethod
+    def _canonical_instance(cls, term: str) -> "ClassicalNoun":
+        """Create the instance on which outputs are computed for the "term.canonical_forms"
+        and "term.patterns" caches, see `memoize_form` and `memoize_pattern`.
+
+        Args:
+            term (str): The lowercase, stripped term, or for the "term.patterns" cache,
+                the term including its casing and whitespace.
+
+        Returns:
+            ClassicalNoun: The classical form of `Noun(term)`.
+        """
+        return Noun(term).classical()
+
     def _convert_to_plural(self, term) -> str:
         """The convert to classical plural call used by this class.
 
@@ -651,9 +735,14 @@ class ClassicalNoun(Noun):
         """
         return self._modern
 
-    def as_regex(self) -> Pattern[str]:
+    @memoize_pattern
+    def as_regex(self, word_boundaries: bool = False) -> Pattern[str]:
         """Returns a `re.Pattern` which case-insensitively matches any inflected form of the word.
 
+        Args:
+            word_boundaries (bool, optional): Only match whole words, by surrounding the
+                pattern with `\\b`. Defaults to False.
+
         Returns:
             re.Pattern: Compiled regex object which case-insensitively matches any inflected form
                 of the word.
@@ -662,9 +751,7 @@ class ClassicalNoun(Noun):
             >>> Noun('brother').classical().as_regex()
             re.compile('brother|brethren', re.IGNORECASE)
         """
-        return re.compile("|".join(sorted(map(re.escape, {self.singular(), # type: ignore
-                                                          self.plural(),
-                                                          }), reverse=True)), flags=re.I)
+        return Term._compile_forms({self.singular(), self.plural()}, word_boundaries) # pylint: disable=W0212
 
     def __repr__(self) -> str:
         """Return `repr(self)`.
@@ -7,20 +7,44 @@
 ##########################################
 
 import re
-from typing import Pattern
+import warnings
+from typing import Dict, Match, Optional, Tuple
 
-VERSION = 20210606.190936
+from inflex.cache import memoize
+from inflex.lazy_regex import LazyPattern, lazy_compile
+from inflex.suffix_trie import SuffixTrie
 
-def rei(regex: str) -> Pattern[str]:
-    """Return compiled `re.Pattern` with `regex` as pattern, and the IGNORECASE flag.
+VERSION = 20261018.145056
+
+# The engine used to apply the conversion rules: Either "regex" to match the
+# `*_convert_rule_regex` patterns directly, or "trie" to use the equivalent
+# `*_convert_trie` objects, which look up rules by the ending of the word.
+rule_engine = "regex"
+
+# Words of at least this many characters always use the tries, both to convert them and
+# to recognize whether they are plural or singular. The regexes try every rule at every
+# position, while the tries only look at the ending of the word.
+long_input_length = 64
+
+# Opt-in engine mode for untrusted or very long input, e.g. `max_input_length = 128`: Words
+# of more than this many characters are then inflected as a single word, in time linear in
+# their length. Only the rules for word endings apply to them, and not the rules for
+# collocations and possessives, e.g. "son of a gun" or "gun's", so their output may differ.
+# These rules convert and classify subterms recursively, which takes time quadratic in the
+# length of the input, and a few stack frames per nesting level. Defaults to None, i.e.
+# all rules apply to words of any length.
+max_input_length: Optional[int] = None
+
+def rei(regex: str) -> LazyPattern:
+    """Return lazily compiled `re.Pattern` with `regex` as pattern, and the IGNORECASE flag.
 
     Args:
         regex (str): Regular expression pattern.
 
     Returns:
-        re.Pattern: Compiled version of `regex`, with IGNORECASE flag.
+        LazyPattern: Version of `regex` with IGNORECASE flag, compiled on first use.
     """
-    return re.compile(regex, flags=re.I)
+    return lazy_compile(regex, flags=re.I)
 
 modern_plural_of = {
     "Achinese": "Achinese",
@@ -8429,19 +8453,19 @@ singular_of = {
 modern_plural_convert_rule_regex = rei(r"^(?:(.*?)-general|(.*?) general|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) it|son-of-a-(.*?)|son of a (.*?)|(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)|(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)|(.*?)-errant|(.*?) errant|(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)|(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)|(.*)staff|(.*)stave|(.*)genus|(.*)person|(.*)hertz|(.*)siemens|(.*)brother|(.*)child|(.*)cow|(.*)mensch|(.*)elf|(.*)hoof|(.*)knife|(.*)leaf|(.*)loaf|(.*)shelf|(.*)thief|(.*)wife|(.*)wolf|(.*)human|(.*)foot|(.*)goose|(.*)man|(.*)mouse|(.*)tooth|(.*)buzz|(.*)fizz|(.*)frizz|(.*)fuzz|(.*)jazz|(.*)proboscis|(.*)bema|(.*)drama|(.*)edema|(.*)lemma|(.*)sarcoma|(.*)stoma|(.*)nova|(.*)umbra|(.*)lumen|(.*)datum|(.*)stratum|(.*)bacillus|(.*)nucleus|(.+)thesis|(.*)hedron|(.*)helion|(.*)legomenon|(.*)phenomenon|(.*)helix|(.*)measles|(.*)pox|(.*)bass|(.*)deer|(.*)fish|(.*)fowl|(.*)sheep|(.*)wildebeest|(.*)craft|(.+)star general|(.+)oux|(.+[aeiou])o|(.+[aeo])lf|(.+)nge|(.+[aiy])nx|(.+)arf|(.+)ceps|(.+[^aeoui][aeouiy])che|(.+[cs])h|(.+)eaf|(.+)eau|(.+)ieu|(.+)nife|(.+)oe|(.+)o|(.+)quy|(.+[aeiou])y|(.+[rnlpwaeio])se|(.+)ss|(.+[aeo])use|(.+)um|(.+)us|(.+[^ns])sis|(.+)trix|(.+)x|(.+)y|(.+[^aeiouy])z|(.+)z|(.+)zoon|(.+)s|(.+))$")
 
 modern_plural_convert_outputs = [
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-general",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} general",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-general",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} general",
     lambda subterms: f"{subterms[0]} them",
-    lambda subterms: f"sons-of-{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}",
-    lambda subterms: f"sons of {convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-{subterms[1]}-{subterms[2]}",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} {subterms[1]} {subterms[2]}",
-    lambda subterms: f"{subterms[0]}-{convert_to_modern_plural(subterms[1]) if is_singular(subterms[1]) else subterms[1]}",
-    lambda subterms: f"{subterms[0]} {convert_to_modern_plural(subterms[1]) if is_singular(subterms[1]) else subterms[1]}",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-errant",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} errant",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-{subterms[1]}",
-    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} {subterms[1]}",
+    lambda subterms: f"sons-of-{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}",
+    lambda subterms: f"sons of {convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-{subterms[1]}-{subterms[2]}",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} {subterms[1]} {subterms[2]}",
+    lambda subterms: f"{subterms[0]}-{convert_to_modern_plural(subterms[1]) if classify_number(subterms[1])[1] else subterms[1]}",
+    lambda subterms: f"{subterms[0]} {convert_to_modern_plural(subterms[1]) if classify_number(subterms[1])[1] else subterms[1]}",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-errant",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} errant",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-{subterms[1]}",
+    lambda subterms: f"{convert_to_modern_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} {subterms[1]}",
     lambda subterms: f"{subterms[0]}staffs",
     lambda subterms: f"{subterms[0]}staves",
     lambda subterms: f"{subterms[0]}genera",
@@ -8650,22 +8674,24 @@ modern_plural_convert_slices = [
     (103, [112]),
 ]
 
+modern_plural_convert_trie = SuffixTrie(modern_plural_convert_rule_regex, modern_plural_convert_outputs, modern_plural_convert_slices)
+
 classical_plural_convert_rule_regex = rei(r"^(?:(.*?)-general|(.*?) general|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) it|son-of-a-(.*?)|son of a (.*?)|(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)|(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)|(.*?)-errant|(.*?) errant|(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)|(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)|(.*)staff|(.*)stave|(.*)genus|(.*)person|(.*)hertz|(.*)siemens|(.*)brother|(.*)child|(.*)cow|(.*)mensch|(.*)elf|(.*)hoof|(.*)knife|(.*)leaf|(.*)loaf|(.*)shelf|(.*)thief|(.*)wife|(.*)wolf|(.*)human|(.*)foot|(.*)goose|(.*)man|(.*)mouse|(.*)tooth|(.*)buzz|(.*)fizz|(.*)frizz|(.*)fuzz|(.*)jazz|(.*)proboscis|(.*)bema|(.*)drama|(.*)edema|(.*)lemma|(.*)sarcoma|(.*)stoma|(.*)nova|(.*)umbra|(.*)lumen|(.*)datum|(.*)stratum|(.*)bacillus|(.*)nucleus|(.+)thesis|(.*)hedron|(.*)helion|(.*)legomenon|(.*)phenomenon|(.*)helix|(.*)measles|(.*)pox|(.*)bass|(.*)deer|(.*)fish|(.*)fowl|(.*)sheep|(.*)wildebeest|(.*)craft|(.+)star general|(.+)oux|(.+[aeiou])o|(.+[aeo])lf|(.+)nge|(.+[aiy])nx|(.+)arf|(.+)ceps|(.+[^aeoui][aeouiy])che|(.+[cs])h|(.+)eaf|(.+)eau|(.+)ieu|(.+)nife|(.+)oe|(.+)o|(.+)quy|(.+[aeiou])y|(.+[rnlpwaeio])se|(.+)ss|(.+[aeo])use|(.+)um|(.+)us|(.+[^ns])sis|(.+)trix|(.+)x|(.+)y|(.+[^aeiouy])z|(.+)z|(.+)zoon|(.+)s|(.+))$")
 
 classical_plural_convert_outputs = [
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-general",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} general",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-general",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} general",
     lambda subterms: f"{subterms[0]} them",
-    lambda subterms: f"sons-of-{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}",
-    lambda subterms: f"sons of {convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-{subterms[1]}-{subterms[2]}",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} {subterms[1]} {subterms[2]}",
-    lambda subterms: f"{subterms[0]}-{convert_to_classical_plural(subterms[1]) if is_singular(subterms[1]) else subterms[1]}",
-    lambda subterms: f"{subterms[0]} {convert_to_classical_plural(subterms[1]) if is_singular(subterms[1]) else subterms[1]}",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-errant",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} errant",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]}-{subterms[1]}",
-    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if is_singular(subterms[0]) else subterms[0]} {subterms[1]}",
+    lambda subterms: f"sons-of-{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}",
+    lambda subterms: f"sons of {convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-{subterms[1]}-{subterms[2]}",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} {subterms[1]} {subterms[2]}",
+    lambda subterms: f"{subterms[0]}-{convert_to_classical_plural(subterms[1]) if classify_number(subterms[1])[1] else subterms[1]}",
+    lambda subterms: f"{subterms[0]} {convert_to_classical_plural(subterms[1]) if classify_number(subterms[1])[1] else subterms[1]}",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-errant",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} errant",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]}-{subterms[1]}",
+    lambda subterms: f"{convert_to_classical_plural(subterms[0]) if classify_number(subterms[0])[1] else subterms[0]} {subterms[1]}",
     lambda subterms: f"{subterms[0]}staves",
     lambda subterms: f"{subterms[0]}staves",
     lambda subterms: f"{subterms[0]}genera",
@@ -8874,22 +8900,24 @@ classical_plural_convert_slices = [
     (103, [112]),
 ]
 
+classical_plural_convert_trie = SuffixTrie(classical_plural_convert_rule_regex, classical_plural_convert_outputs, classical_plural_convert_slices)
+
 singular_convert_rule_regex = rei(r"^(?:(.*?)-general|(.*?) general|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) them|sons-of-(.*?)|sons of (.*?)|(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)|(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)|(.*?)-errant|(.*?) errant|(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)|(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)|(.*)staffs|(.*)staves|(.*)genera|(.*)people|(.*)persons|(.*)hertz|(.*)siemens|(.*)brothers|(.*)brethren|(.*)children|(.*)cows|(.*)kine|(.*)menschen|(.*)elves|(.*)hoofs|(.*)hooves|(.*)knives|(.*)leaves|(.*)loaves|(.*)shelves|(.*)thieves|(.*)wives|(.*)wolves|(.*)humans|(.*)feet|(.*)geese|(.*)men|(.*)mice|(.*)teeth|(.*)buzzes|(.*)fizzes|(.*)frizzes|(.*)fuzzes|(.*)jazzes|(.*)proboscises|(.*)proboscides|(.*)bemas|(.*)bemata|(.*)dramas|(.*)edemas|(.*)edemata|(.*)lemmas|(.*)lemmata|(.*)sarcomas|(.*)sarcomata|(.*)stomas|(.*)stomata|(.*)novas|(.*)novae|(.*)umbras|(.*)umbrae|(.*)lumens|(.*)lumina|(.*)data|(.*)stratums|(.*)strata|(.*)bacilli|(.*)nuclei|(.+)theses|(.*)hedrons|(.*)hedra|(.*)helions|(.*)helia|(.*)legomena|(.*)phenomena|(.*)helices|(.*)measles|(.*)pox|(.*)basses|(.*)bass|(.*)deer|(.*)fish|(.*)fowls|(.*)fowl|(.*)sheep|(.*)wildebeests|(.*)wildebeest|(.*)craft|(.+)star generals|(.+)oux|(.+[aeiou])os|(.+[aeo])lves|(.+)nges|(.+[aiy])nxes|(.+[aiy])nges|(.+)arves|(.+)ceps|(.+[^aeoui][aeouiy])ches|(.+[cs])hes|(.+)eaves|(.+)eaus|(.+)eaux|(.+)ieus|(.+)ieux|(.+)nives|(.+)oes|(.+)os|(.+)quies|(.+[aeiou])ys|(.+[rnlpwaeio])ses|(.+)sses|(.+[aeo])uses|(.+)uses|(.+[^ns])ses|(.+)trices|(.+)xes|(.+)ies|(.+)zzes|(.+)zoa|(.+)ae|(.+)ses|(.+)s)$")
 
 singular_convert_outputs = [
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]}-general",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]} general",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]}-general",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]} general",
     lambda subterms: f"{subterms[0]} it",
-    lambda subterms: f"son-of-a-{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]}",
-    lambda subterms: f"son of a {convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]}",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]}-{subterms[1]}-{subterms[2]}",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]} {subterms[1]} {subterms[2]}",
-    lambda subterms: f"{subterms[0]}-{convert_to_singular(subterms[1]) if is_plural(subterms[1]) else subterms[1]}",
-    lambda subterms: f"{subterms[0]} {convert_to_singular(subterms[1]) if is_plural(subterms[1]) else subterms[1]}",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]}-errant",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]} errant",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]}-{subterms[1]}",
-    lambda subterms: f"{convert_to_singular(subterms[0]) if is_plural(subterms[0]) else subterms[0]} {subterms[1]}",
+    lambda subterms: f"son-of-a-{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]}",
+    lambda subterms: f"son of a {convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]}",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]}-{subterms[1]}-{subterms[2]}",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]} {subterms[1]} {subterms[2]}",
+    lambda subterms: f"{subterms[0]}-{convert_to_singular(subterms[1]) if classify_number(subterms[1])[0] else subterms[1]}",
+    lambda subterms: f"{subterms[0]} {convert_to_singular(subterms[1]) if classify_number(subterms[1])[0] else subterms[1]}",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]}-errant",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]} errant",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]}-{subterms[1]}",
+    lambda subterms: f"{convert_to_singular(subterms[0]) if classify_number(subterms[0])[0] else subterms[0]} {subterms[1]}",
     lambda subterms: f"{subterms[0]}staff",
     lambda subterms: f"{subterms[0]}staff",
     lambda subterms: f"{subterms[0]}genus",
@@ -9140,34 +9168,68 @@ singular_convert_slices = [
     (124, [133]),
 ]
 
+singular_convert_trie = SuffixTrie(singular_convert_rule_regex, singular_convert_outputs, singular_convert_slices)
+
 plural_recognize_rules = {
     rei(r"^(?:(.+)ae|(.+)os|(.+[aeiou])os|(.+[aeiou])ys|(.*)men|(.*)pox|(.+)ies|(.+)oes|(.+)oux|(.+)xes|(.+)zoa|(.+[^ns])ses|(.+[cs])hes|(.+[rnlpwaeio])ses|(.*)bass|(.*)cows|(.*)data|(.*)deer|(.*)feet|(.*)fish|(.*)fowl|(.*)kine|(.*)mice|(.+)ceps|(.+)eaus|(.+)eaux|(.+)ieus|(.+)ieux|(.+)nges|(.+)sses|(.+)uses|(.+)zzes|(.+[^aeoui][aeouiy])ches|(.+[aeo])lves|(.+[aeo])uses|(.+[aiy])nges|(.+[aiy])nxes|(.*)bemas|(.*)craft|(.*)elves|(.*)fowls|(.*)geese|(.*)hedra|(.*)helia|(.*)hertz|(.*)hoofs|(.*)novae|(.*)novas|(.*)sheep|(.*)teeth|(.*)wives|(.+)arves|(.+)eaves|(.+)nives|(.+)quies|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) them|(.*)basses|(.*)bemata|(.*)buzzes|(.*)dramas|(.*)edemas|(.*)fizzes|(.*)fuzzes|(.*)genera|(.*)hooves|(.*)humans|(.*)jazzes|(.*)knives|(.*)leaves|(.*)lemmas|(.*)loaves|(.*)lumens|(.*)lumina|(.*)nuclei|(.*)people|(.*)staffs|(.*)staves|(.*)stomas|(.*)strata|(.*)umbrae|(.*)umbras|(.*)wolves|(.+)theses|(.+)trices|(.*)bacilli|(.*)edemata|(.*)frizzes|(.*)hedrons|(.*)helices|(.*)helions|(.*)lemmata|(.*)measles|(.*)persons|(.*)shelves|(.*)siemens|(.*)stomata|(.*)thieves|(.*)brethren|(.*)brothers|(.*)children|(.*)legomena|(.*)menschen|(.*)sarcomas|(.*)stratums|(.*)phenomena|(.*)sarcomata|(.*)wildebeest|(.*)proboscides|(.*)proboscises|(.*)wildebeests|(.+)star generals)$"): {},
-    rei(r"^sons-of-(.*?)$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^sons of (.*?)$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: is_plural(match.group(2))},
-    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: is_plural(match.group(2))},
-    rei(r"^(.*?)-errant$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^(.*?) errant$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: is_plural(match.group(1))},
-    rei(r"^(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: is_plural(match.group(1))},
+    rei(r"^sons-of-(.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^sons of (.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: classify_number(match.group(2))[0]},
+    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: classify_number(match.group(2))[0]},
+    rei(r"^(.*?)-errant$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^(.*?) errant$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
+    rei(r"^(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: classify_number(match.group(1))[0]},
 }
 
 singular_recognize_rules = {
     rei(r"^(?:(.+)o|(.+)x|(.+)y|(.+)z|(.+[^aeiouy])z|(.+[aeiou])o|(.+[aeiou])y|(.+[cs])h|(.+)oe|(.+)ss|(.+)um|(.+)us|(.+[aeo])lf|(.+[aiy])nx|(.+[rnlpwaeio])se|(.*)cow|(.*)elf|(.*)man|(.*)pox|(.+)arf|(.+)eaf|(.+)eau|(.+)ieu|(.+)nge|(.+)oux|(.+)quy|(.+[^aeoui][aeouiy])che|(.+[^ns])sis|(.+[aeo])use|(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) it|(.*)bass|(.*)bema|(.*)buzz|(.*)deer|(.*)fish|(.*)fizz|(.*)foot|(.*)fowl|(.*)fuzz|(.*)hoof|(.*)jazz|(.*)leaf|(.*)loaf|(.*)nova|(.*)wife|(.*)wolf|(.+)ceps|(.+)nife|(.+)trix|(.+)zoon|(.*)child|(.*)craft|(.*)datum|(.*)drama|(.*)edema|(.*)frizz|(.*)genus|(.*)goose|(.*)helix|(.*)hertz|(.*)human|(.*)knife|(.*)lemma|(.*)lumen|(.*)mouse|(.*)sheep|(.*)shelf|(.*)staff|(.*)stave|(.*)stoma|(.*)thief|(.*)tooth|(.*)umbra|(.*)hedron|(.*)helion|(.*)mensch|(.*)person|(.+)thesis|(.*)brother|(.*)measles|(.*)nucleus|(.*)sarcoma|(.*)siemens|(.*)stratum|(.*)bacillus|(.*)legomenon|(.*)proboscis|(.*)phenomenon|(.*)wildebeest|(.+)star general)$"): {},
-    rei(r"^son-of-a-(.*?)$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^son of a (.*?)$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: is_singular(match.group(2))},
-    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: is_singular(match.group(2))},
-    rei(r"^(.*?)-errant$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^(.*?) errant$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: is_singular(match.group(1))},
-    rei(r"^(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: is_singular(match.group(1))},
+    rei(r"^son-of-a-(.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^son of a (.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^(.*?)-(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^(.*?) (about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(.*?)$"): {"conditional": lambda match: classify_number(match.group(2))[1]},
+    rei(r"^(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (.*?)$"): {"conditional": lambda match: classify_number(match.group(2))[1]},
+    rei(r"^(.*?)-errant$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^(.*?) errant$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^(.*?)-(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
+    rei(r"^(.*?) (above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)$"): {"conditional": lambda match: classify_number(match.group(1))[1]},
 }
 
+number_recognize_regex = rei(r"^(?=(?:(?P<plural_0>(?:(?:.+)ae|(?:.+)os|(?:.+[aeiou])os|(?:.+[aeiou])ys|(?:.*)men|(?:.*)pox|(?:.+)ies|(?:.+)oes|(?:.+)oux|(?:.+)xes|(?:.+)zoa|(?:.+[^ns])ses|(?:.+[cs])hes|(?:.+[rnlpwaeio])ses|(?:.*)bass|(?:.*)cows|(?:.*)data|(?:.*)deer|(?:.*)feet|(?:.*)fish|(?:.*)fowl|(?:.*)kine|(?:.*)mice|(?:.+)ceps|(?:.+)eaus|(?:.+)eaux|(?:.+)ieus|(?:.+)ieux|(?:.+)nges|(?:.+)sses|(?:.+)uses|(?:.+)zzes|(?:.+[^aeoui][aeouiy])ches|(?:.+[aeo])lves|(?:.+[aeo])uses|(?:.+[aiy])nges|(?:.+[aiy])nxes|(?:.*)bemas|(?:.*)craft|(?:.*)elves|(?:.*)fowls|(?:.*)geese|(?:.*)hedra|(?:.*)helia|(?:.*)hertz|(?:.*)hoofs|(?:.*)novae|(?:.*)novas|(?:.*)sheep|(?:.*)teeth|(?:.*)wives|(?:.+)arves|(?:.+)eaves|(?:.+)nives|(?:.+)quies|(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) them|(?:.*)basses|(?:.*)bemata|(?:.*)buzzes|(?:.*)dramas|(?:.*)edemas|(?:.*)fizzes|(?:.*)fuzzes|(?:.*)genera|(?:.*)hooves|(?:.*)humans|(?:.*)jazzes|(?:.*)knives|(?:.*)leaves|(?:.*)lemmas|(?:.*)loaves|(?:.*)lumens|(?:.*)lumina|(?:.*)nuclei|(?:.*)people|(?:.*)staffs|(?:.*)staves|(?:.*)stomas|(?:.*)strata|(?:.*)umbrae|(?:.*)umbras|(?:.*)wolves|(?:.+)theses|(?:.+)trices|(?:.*)bacilli|(?:.*)edemata|(?:.*)frizzes|(?:.*)hedrons|(?:.*)helices|(?:.*)helions|(?:.*)lemmata|(?:.*)measles|(?:.*)persons|(?:.*)shelves|(?:.*)siemens|(?:.*)stomata|(?:.*)thieves|(?:.*)brethren|(?:.*)brothers|(?:.*)children|(?:.*)legomena|(?:.*)menschen|(?:.*)sarcomas|(?:.*)stratums|(?:.*)phenomena|(?:.*)sarcomata|(?:.*)wildebeest|(?:.*)proboscides|(?:.*)proboscises|(?:.*)wildebeests|(?:.+)star generals))|(?P<plural_1>sons-of-(?:.*?))|(?P<plural_2>sons of (?:.*?))|(?P<plural_3>(?:.*?)-(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(?:.*?))|(?P<plural_4>(?:.*?) (?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (?:.*?))|(?P<plural_5>(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(?:.*?))|(?P<plural_6>(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (?:.*?))|(?P<plural_7>(?:.*?)-errant)|(?P<plural_8>(?:.*?) errant)|(?P<plural_9>(?:.*?)-(?:above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with))|(?P<plural_10>(?:.*?) (?:above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)))$|)(?=(?:(?P<singular_0>(?:(?:.+)o|(?:.+)x|(?:.+)y|(?:.+)z|(?:.+[^aeiouy])z|(?:.+[aeiou])o|(?:.+[aeiou])y|(?:.+[cs])h|(?:.+)oe|(?:.+)ss|(?:.+)um|(?:.+)us|(?:.+[aeo])lf|(?:.+[aiy])nx|(?:.+[rnlpwaeio])se|(?:.*)cow|(?:.*)elf|(?:.*)man|(?:.*)pox|(?:.+)arf|(?:.+)eaf|(?:.+)eau|(?:.+)ieu|(?:.+)nge|(?:.+)oux|(?:.+)quy|(?:.+[^aeoui][aeouiy])che|(?:.+[^ns])sis|(?:.+[aeo])use|(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) it|(?:.*)bass|(?:.*)bema|(?:.*)buzz|(?:.*)deer|(?:.*)fish|(?:.*)fizz|(?:.*)foot|(?:.*)fowl|(?:.*)fuzz|(?:.*)hoof|(?:.*)jazz|(?:.*)leaf|(?:.*)loaf|(?:.*)nova|(?:.*)wife|(?:.*)wolf|(?:.+)ceps|(?:.+)nife|(?:.+)trix|(?:.+)zoon|(?:.*)child|(?:.*)craft|(?:.*)datum|(?:.*)drama|(?:.*)edema|(?:.*)frizz|(?:.*)genus|(?:.*)goose|(?:.*)helix|(?:.*)hertz|(?:.*)human|(?:.*)knife|(?:.*)lemma|(?:.*)lumen|(?:.*)mouse|(?:.*)sheep|(?:.*)shelf|(?:.*)staff|(?:.*)stave|(?:.*)stoma|(?:.*)thief|(?:.*)tooth|(?:.*)umbra|(?:.*)hedron|(?:.*)helion|(?:.*)mensch|(?:.*)person|(?:.+)thesis|(?:.*)brother|(?:.*)measles|(?:.*)nucleus|(?:.*)sarcoma|(?:.*)siemens|(?:.*)stratum|(?:.*)bacillus|(?:.*)legomenon|(?:.*)proboscis|(?:.*)phenomenon|(?:.*)wildebeest|(?:.+)star general))|(?P<singular_1>son-of-a-(?:.*?))|(?P<singular_2>son of a (?:.*?))|(?P<singular_3>(?:.*?)-(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(?:.*?))|(?P<singular_4>(?:.*?) (?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (?:.*?))|(?P<singular_5>(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)-(?:.*?))|(?P<singular_6>(?:about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with) (?:.*?))|(?P<singular_7>(?:.*?)-errant)|(?P<singular_8>(?:.*?) errant)|(?P<singular_9>(?:.*?)-(?:above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with))|(?P<singular_10>(?:.*?) (?:above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)))$|)")
+
+plural_recognize_groups = ("plural_0", "plural_1", "plural_2", "plural_3", "plural_4", "plural_5", "plural_6", "plural_7", "plural_8", "plural_9", "plural_10")
+
+plural_recognize_trie = SuffixTrie(next(iter(plural_recognize_rules)), [lambda subterms: True], [(0, [])] * 111)
+
+singular_recognize_groups = ("singular_0", "singular_1", "singular_2", "singular_3", "singular_4", "singular_5", "singular_6", "singular_7", "singular_8", "singular_9", "singular_10")
+
+singular_recognize_trie = SuffixTrie(next(iter(singular_recognize_rules)), [lambda subterms: True], [(0, [])] * 90)
+
+def _first_recognize_rule(word: str, match: Optional[Match], groups: Tuple[str, ...], trie: SuffixTrie) -> Optional[int]:
+    """Get the index of the first recognize rule that may apply to `word`.
+
+    Args:
+        word (str): Input word or collocation.
+        match (Optional[Match]): Match of `number_recognize_regex` on `word`, or None if
+            `word` is long, in which case only the first rule is checked, using `trie`.
+        groups (Tuple[str, ...]): The names of the groups in `match` corresponding to the rules.
+        trie (SuffixTrie): Trie of the first rule, i.e. either `plural_recognize_trie` or
+            `singular_recognize_trie`.
+
+    Returns:
+        Optional[int]: The index of the first rule that may apply, or None if no rule applies.
+            The first rule, without conditional, is only returned if it matches `word`.
+    """
+    if match is None:
+        return 0 if trie.convert(word, default=False) else 1
+    for index, group in enumerate(match.group(*groups)):
+        if group is not None:
+            return index
+    return None
+
 def known_plural(word: str) -> bool:
     """True if `word` is known to be plural.
 
@@ -9190,6 +9252,7 @@ def known_singular(word):
     """
     return word in modern_plural_of
 
+@memoize
 def convert_to_modern_plural(word: str) -> str:
     """Convert `word` to modern plural form.
 
@@ -9199,9 +9262,9 @@ def convert_to_modern_plural(word: str) -> str:
     Returns:
         str: The modern plural form of `word`.
     """
-    if word.lower().endswith(("'s", "'")):
+    if (max_input_length is None or len(word) <= max_input_length) and word.lower().endswith(("'s", "'")):
         subword = word[:word.rfind("'")]
-        if is_singular(subword):
+        if classify_number(subword)[1]:
             subword = convert_to_modern_plural(subword)
             return subword + "'" if subword.endswith(('s', 'S')) else subword + "'s"
         return word
@@ -9212,9 +9275,15 @@ def convert_to_modern_plural(word: str) -> str:
     if not word.islower() and word.lower() in modern_plural_of:
         return modern_plural_of[word.lower()]
 
-    if is_plural(word) and not is_singular(word, is_word_plural=True):
+    if classify_number(word) == (True, False):
         return word
 
+    if rule_engine == "trie" or len(word) >= long_input_length:
+        # The output is applied here rather than by the trie, as it may convert subterms
+        # recursively, so each extra function would cost a stack frame per nesting level
+        found = modern_plural_convert_trie.find(word, suffix_only=max_input_length is not None and len(word) > max_input_length)
+        return modern_plural_convert_outputs[found[0]](found[1]) if found else word
+
     match = modern_plural_convert_rule_regex.match(word)
     if match:
         for i, group in enumerate(match.groups()):
@@ -9223,6 +9292,7 @@ def convert_to_modern_plural(word: str) -> str:
                 return modern_plural_convert_outputs[output_id]([match.group(index) for index in slices])
     return word
 
+@memoize
 def convert_to_classical_plural(word: str) -> str:
     """Convert `word` to classical plural form.
 
@@ -9232,9 +9302,9 @@ def convert_to_classical_plural(word: str) -> str:
     Returns:
         str: The classical plural form of `word`.
     """
-    if word.lower().endswith(("'s", "'")):
+    if (max_input_length is None or len(word) <= max_input_length) and word.lower().endswith(("'s", "'")):
         subword = word[:word.rfind("'")]
-        if is_singular(subword):
+        if classify_number(subword)[1]:
             subword = convert_to_classical_plural(subword)
             return subword + "'" if subword.endswith(('s', 'S')) else subword + "'s"
         return word
@@ -9245,9 +9315,15 @@ def convert_to_classical_plural(word: str) -> str:
     if not word.islower() and word.lower() in classical_plural_of:
         return classical_plural_of[word.lower()]
 
-    if is_plural(word) and not is_singular(word, is_word_plural=True):
+    if classify_number(word) == (True, False):
         return word
 
+    if rule_engine == "trie" or len(word) >= long_input_length:
+        # The output is applied here rather than by the trie, as it may convert subterms
+        # recursively, so each extra function would cost a stack frame per nesting level
+        found = classical_plural_convert_trie.find(word, suffix_only=max_input_length is not None and len(word) > max_input_length)
+        return classical_plural_convert_outputs[found[0]](found[1]) if found else word
+
     match = classical_plural_convert_rule_regex.match(word)
     if match:
         for i, group in enumerate(match.groups()):
@@ -9256,6 +9332,7 @@ def convert_to_classical_plural(word: str) -> str:
                 return classical_plural_convert_outputs[output_id]([match.group(index) for index in slices])
     return word
 
+@memoize
 def convert_to_singular(word: str) -> str:
     """Convert `word` to singular form.
 
@@ -9265,9 +9342,9 @@ def convert_to_singular(word: str) -> str:
     Returns:
         str: The singular form of `word`.
     """
-    if word.lower().endswith(("'s", "'")):
+    if (max_input_length is None or len(word) <= max_input_length) and word.lower().endswith(("'s", "'")):
         subword = word[:word.rfind("'")]
-        if is_plural(subword):
+        if classify_number(subword)[0]:
             subword = convert_to_singular(subword)
             return subword + "'" if subword.endswith(('s', 'S')) else subword + "'s"
         return word
@@ -9278,9 +9355,15 @@ def convert_to_singular(word: str) -> str:
     if not word.islower() and word.lower() in singular_of:
         return singular_of[word.lower()]
 
-    if is_singular(word):
+    if classify_number(word)[1]:
         return word
 
+    if rule_engine == "trie" or len(word) >= long_input_length:
+        # The output is applied here rather than by the trie, as it may convert subterms
+        # recursively, so each extra function would cost a stack frame per nesting level
+        found = singular_convert_trie.find(word, suffix_only=max_input_length is not None and len(word) > max_input_length)
+        return singular_convert_outputs[found[0]](found[1]) if found else word
+
     match = singular_convert_rule_regex.match(word)
     if match:
         for i, group in enumerate(match.groups()):
@@ -9289,51 +9372,71 @@ def convert_to_singular(word: str) -> str:
                 return singular_convert_outputs[output_id]([match.group(index) for index in slices])
     return word
 
-def is_plural(word):
-    """Detect whether `word` is in plural form.
+@memoize
+def classify_number(word: str) -> Tuple[bool, bool]:
+    """Detect whether `word` is in plural form, and whether it is in singular form.
+    Both are determined at once, using a single match of `number_recognize_regex`, or
+    for long words, using `plural_recognize_trie` and `singular_recognize_trie`.
+
+    Note that a word may be both, e.g. "sheep".
 
     Args:
         word (str): Input word or collocation.
 
     Returns:
-        bool: True if `word` is deemed plural.
+        Tuple[bool, bool]: True if `word` is deemed plural, and True if `word` is deemed singular.
     """
-    if known_plural(word) or (not word.islower() and known_plural(word.lower())):
-        return True
+    is_known_plural = known_plural(word) or (not word.islower() and known_plural(word.lower()))
+    is_known_singular = known_singular(word) or (not word.islower() and known_singular(word.lower()))
+    if is_known_plural or is_known_singular:
+        return is_known_plural, is_known_singular
 
-    if known_singular(word) or (not word.islower() and known_singular(word.lower())):
-        return False
+    match = number_recognize_regex.match(word) if len(word) < long_input_length else None
+    recognized = []
+    for rules, groups, trie in ((plural_recognize_rules, plural_recognize_groups, plural_recognize_trie),
+                                (singular_recognize_rules, singular_recognize_groups, singular_recognize_trie)):
+        first = _first_recognize_rule(word, match, groups, trie)
+        is_recognized = first == 0
+        # The conditionals are called from here rather than from a helper function, as they
+        # classify subterms recursively, so each helper would cost a stack frame per nesting
+        # level of e.g. "son of a son of a gun". They don't apply to long words.
+        if first and (max_input_length is None or len(word) <= max_input_length):
+            for rule, options in list(rules.items())[first:]:
+                rule_match = rule.match(word)
+                if rule_match and (not "conditional" in options or options["conditional"](rule_match)):
+                    is_recognized = True
+                    break
+        recognized.append(is_recognized)
+    is_word_plural = recognized[0] or word.endswith(('s', 'S'))
+    is_word_singular = recognized[1] or not is_word_plural
+    return is_word_plural, is_word_singular
 
-    for rule in plural_recognize_rules:
-        match = rule.match(word)
-        if match:
-            if not "conditional" in plural_recognize_rules[rule] or plural_recognize_rules[rule]["conditional"](match):
-                return True
+@memoize
+def is_plural(word):
+    """Detect whether `word` is in plural form, see `classify_number`.
 
-    return word.endswith(('s', 'S'))
+    Args:
+        word (str): Input word or collocation.
+
+    Returns:
+        bool: True if `word` is deemed plural.
+    """
+    return classify_number(word)[0]
 
+@memoize
 def is_singular(word, is_word_plural=None):
-    """Detect whether `word` is in singular form.
+    """Detect whether `word` is in singular form, see `classify_number`.
 
     Args:
         word (str): Input word or collocation.
+        is_word_plural (Optional[bool], optional): Deprecated and ignored, as `classify_number`
+            determines whether `word` is plural as well. Defaults to None.
 
     Returns:
         bool: True if `word` is deemed singular.
     """
-    if known_singular(word) or (not word.islower() and known_singular(word.lower())):
-        return True
-
-    if known_plural(word) or (not word.islower() and known_plural(word.lower())):
-        return False
-
-    for rule in singular_recognize_rules:
-        match = rule.match(word)
-        if match:
-            if not "conditional" in singular_recognize_rules[rule] or singular_recognize_rules[rule]["conditional"](match):
-                return True
-
     if is_word_plural is not None:
-        return not is_word_plural
-    return not is_plural(word)
+        warnings.warn("The is_word_plural argument of is_singular is deprecated and ignored.",
+                      DeprecationWarning, stacklevel=3)
+    return classify_number(word)[1]
 
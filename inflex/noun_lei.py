@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parser for noun lexicons in the `.lei` format, e.g. `lei/nouns.lei`, of which each line
+holds a singular noun and its plural forms, e.g. "ox => oxen". It is used both by
+`generate/generate_nouns.py` to generate `noun_core`, and by `inflex.load_lexicon`
+to extend `noun_core` at runtime.
+"""
+
+__all__ = [
+    "Reader"
+]
+
+import re
+from typing import Dict, List, Optional, Set
+
+"""
+Compiled variants of useful regexes used all around this file
+"""
+xms  = re.VERBOSE | re.MULTILINE | re.DOTALL
+COMMENT_LINE_PAT = re.compile(r" \A \s* \#",         flags=xms)
+COMMENT_PAT      = re.compile(r" \# .* ",            flags=xms)
+BLANK_LINE_PAT   = re.compile(r" \A \s* $ ",         flags=xms)
+CAPTURE_PAT      = re.compile(r"(?<!\\)\((?!\?)")
+WS               = re.compile(r" [\s]* ",            flags=xms)
+DATA_PAT         = re.compile(r"""
+    \A
+      (?: {WS} < ([^>]+) > )?    # ...optional category tag
+      {WS} ([*-]?) {WS}             # ...leading whitespace and optional generic marker
+      (.*?)                     # ...singular word
+      {WS} =>                    # ...singular/plural separator
+      {WS} ([*-]?) {WS}             # ...leading whitespace and optional generic marker
+      (.*?)                     # ...plural of word
+      (?:                       # ...optionally:
+        {WS} \|                  #    ...modern/classical separator
+        {WS} ([*-]?) {WS}           #    ...leading whitespace and optional generic marker
+        (.*?)                   #    ...classical plural of word
+      )?
+    {WS}                         # ...trailing whitespace
+    (?:{COMMENT_PAT})?               # Optional trailing comment
+    \Z                          # ...trailing whitespace
+""".format(WS=WS.pattern, COMMENT_PAT=COMMENT_PAT.pattern),
+    flags=xms)
+RECURSE = re.compile(r"\(SING\) | \(PREP\)", flags=xms)
+RECURSE_GROUPED = re.compile(r"""
+      (?P<star>   \*        )
+    | (?P<sing>   \(SING\)  )
+    | (?P<plur>   \(PL\)    )
+    | (?P<prep>   \(PREP\)  )
+    | (?P<prepr>  \(PREPR\)  )
+""", flags=xms)
+DASH = re.compile(r"-")
+STAR = re.compile(r"\*")
+RESTRICT = re.compile(r"( \[.*?\] )+", flags=xms)
+
+
+class Word(object):
+    def __init__(self, gen: Optional[str], word: Optional[str]):
+        super().__init__()
+        self.gen = gen or ""
+        self.word = word or ""
+        self.restrict = ""
+
+    def expand_dash_star(self):
+        """
+        Replace - and * with the proper regex variant in input gen: "-" -> ".+"
+        """
+        if not self.gen:
+            return
+        self.gen = DASH.sub(r".+", self.gen)
+        self.gen = STAR.sub(r".*", self.gen)
+
+    '''
+    def expand_cons_vowel(self) -> str:
+        """
+        Replace (CONS), (VOWEL) and (VOWELS) macros in input verb, e.g. "(VOWEL)ys" -> "[aeiou]ys"
+        """
+        self.word = CONS.sub(r"[^aeiou]", self.word)
+        self.word = VOWEL.sub(r"[aeiou]", self.word)
+        self.word = VOWELY.sub(r"[aeiouy]", self.word)
+    '''
+
+    def restrict_word(self) -> None:
+        """
+        Input verb (e.g. "[aeiou]ys") is split up into restriction (e.g. "[aeiou]") and remainder (e.g. "ys")
+        """
+        if not self.word:
+            return
+        match = RESTRICT.search(self.word)
+        if match:
+            self.restrict = match.group()
+            self.word = RESTRICT.sub(r"", self.word, count=1)
+
+    '''
+    def split(self) -> Optional[str]:
+        match = SPLIT.match(self.word)
+        if match:
+            self.word = match.group(1)
+            return match.group(2)
+        return None
+    '''
+
+    def __str__(self) -> str:
+        return f"{self.gen or ''}{self.restrict}{self.word}"
+
+
+class Noun(object):
+    def __init__(self, match):
+        super().__init__()
+        # tag                   Optional category tag, eg "nonindicative"
+        # is_generic            "*", "-" or ""
+        # sing:                 Singular word
+        # is_pure_generic       "*", "-" or ""
+        # pl1:                  Plural word 1
+        # other                 "*", "", "-", None
+        # pl2:                  Plural word 2
+        self.tag = match.group(1) or ""
+        self.sing = Word(match.group(2), match.group(3))
+        self.sing.expand_dash_star()
+        self.sing.restrict_word()
+
+        self.plur_one = Word(match.group(4), match.group(5))
+        self.plur_one.restrict_word()
+        self.plur_two = Word(match.group(6), match.group(7))
+        self.plur_two.restrict_word()
+
+    def has_hyphen(self):
+        return "-" in self.sing.word or "-" in self.plur_one.word or "-" in self.plur_two.word
+
+    def replace_hyphens(self, repl: str):
+        self.sing.word = self.sing.word.replace("-", repl)
+        self.plur_one.word = self.plur_one.word.replace("-", repl)
+        self.plur_two.word = self.plur_two.word.replace("-", repl)
+
+    def __str__(self) -> str:
+        return "{: <14} : {: <20} => {: <20} | {: <20}".format(self.tag or "",
+                                                               str(self.sing),
+                                                               str(self.plur_one) if self.plur_one.word else "",
+                                                               str(self.plur_two) if self.plur_two.word else "")
+
+
+class Reader(object):
+    def __init__(self, fname: str):
+        types = ["modern_plural", "classical_plural", "singular"]
+        self.patterns: Dict[str, List[Dict[str, str]]] = {key: [] for key in types}
+        self.literals: Dict[str, Dict[str, str]] = {key: {} for key in types}
+        self.words: Dict[str, Set[str]] = {
+            "plural": set(),
+            "singular": set()
+        }
+        self.fname = fname
+
+    def get_readlines(self) -> List[str]:
+        with open(self.fname, "r", encoding="utf8") as f:
+            return f.readlines()
+
+    def parse_file(self):
+        """
+        Fill `pattern`, `literal` and `words`
+        """
+        lines = self.get_readlines()
+
+        for line in lines:
+            # Skip empty or comment lines
+            if COMMENT_LINE_PAT.match(line) or BLANK_LINE_PAT.match(line):
+                continue
+
+            # Extract data
+            match = DATA_PAT.match(line)
+            if match:
+                noun = Noun(match)
+            else:
+                raise ValueError(f"Unknown input: {line!r}")
+
+            if noun.sing.gen:
+                if noun.plur_one.word:
+                    if noun.tag != "plur_to_sing":
+                        self.optionally_add_pattern(self.patterns["modern_plural"], {
+                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_one.word}"',
+                            "tag": noun.tag
+                        })
+                    if noun.tag != "sing_to_plur":
+                        self.optionally_add_pattern(self.patterns["singular"], {
+                            "from": f"({noun.sing.gen}{noun.plur_one.restrict}){noun.plur_one.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.sing.word}"',
+                            "tag": noun.tag
+                        })
+                elif noun.plur_two.word:
+                    if noun.tag != "plur_to_sing":
+                        self.optionally_add_pattern(self.patterns["modern_plural"], {
+                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_two.word}"',
+                            "tag": noun.tag
+                        })
+                    if noun.tag != "sing_to_plur":
+                        self.optionally_add_pattern(self.patterns["singular"], {
+                            "from": f"({noun.sing.gen}{noun.plur_two.restrict}){noun.plur_two.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.sing.word}"',
+                            "tag": noun.tag
+                        })
+
+                if noun.plur_two.word:
+                    if noun.tag != "plur_to_sing":
+                        self.optionally_add_pattern(self.patterns["classical_plural"], {
+                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_two.word}"',
+                            "tag": noun.tag
+                        })
+                    if noun.tag != "sing_to_plur":
+                        self.optionally_add_pattern(self.patterns["singular"], {
+                            "from": f"({noun.sing.gen}{noun.plur_two.restrict}){noun.plur_two.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.sing.word}"',
+                            "tag": noun.tag
+                        })
+                else:
+                    if noun.tag != "plur_to_sing":
+                        self.optionally_add_pattern(self.patterns["classical_plural"], {
+                            "from": f"({noun.sing.gen}{noun.sing.restrict}){noun.sing.word}",
+                            "to": f'lambda subterms: f"{{subterms[0]}}{noun.plur_one.word}"',
+                            "tag": noun.tag
+                        })
+
+            elif RECURSE.search(noun.sing.word):
+                self.add_recurse_patterns(noun)
+
+                if noun.has_hyphen():
+                    noun.replace_hyphens(" ")
+                    self.add_recurse_patterns(noun)
+
+                # Recursive entries are converted by the patterns, so they aren't added as literals
+                noun.plur_one.gen = 1
+
+            if not noun.plur_one.gen and not noun.plur_two.gen:
+                self.add_literals(noun)
+                self.add_words(noun)
+
+    def add_recurse_patterns(self, noun):
+        self.optionally_add_pattern(self.patterns["modern_plural"], {
+            **self.build_recursive(_from=noun.sing.word,
+                                    to=noun.plur_one.word,
+                                    from_type="singular",
+                                    to_type="modern_plural"),
+            **{"tag": noun.tag}
+        })
+        self.optionally_add_pattern(self.patterns["singular"], {
+            **self.build_recursive(_from=noun.plur_one.word,
+                                    to=noun.sing.word,
+                                    from_type="modern_plural",
+                                    to_type="singular"),
+            **{"tag": noun.tag}
+        })
+
+        if not noun.plur_two.word:
+            noun.plur_two = noun.plur_one
+
+        self.optionally_add_pattern(self.patterns["classical_plural"], {
+            **self.build_recursive(_from=noun.sing.word,
+                                    to=noun.plur_two.word,
+                                    from_type="singular",
+                                    to_type="classical_plural"),
+            **{"tag": noun.tag}
+        })
+        self.optionally_add_pattern(self.patterns["singular"], {
+            **self.build_recursive(_from=noun.plur_two.word,
+                                    to=noun.sing.word,
+                                    from_type="classical_plural",
+                                    to_type="singular"),
+            **{"tag": noun.tag}
+        })
+
+    def optionally_add_pattern(self, collection, dict_to_add):
+        if dict_to_add["from"] not in (pattern["from"] for pattern in collection):
+            collection.append(dict_to_add)
+
+    def optionally_add_literal(self, collection, key, word):
+        if key == "_" or word == "_" or key == "":
+            return
+        if key not in collection or not collection[key]:
+            collection[key] = word
+
+    def add_literals(self, noun):
+        if not noun.plur_two.word:
+            noun.plur_two = noun.plur_one
+
+        self.optionally_add_literal(
+            self.literals["modern_plural"], noun.sing.word, noun.plur_one.word)
+        self.optionally_add_literal(
+            self.literals["classical_plural"], noun.sing.word, noun.plur_two.word)
+        self.optionally_add_literal(
+            self.literals["singular"], noun.plur_one.word, noun.sing.word)
+        self.optionally_add_literal(
+            self.literals["singular"], noun.plur_two.word, noun.sing.word)
+
+    def add_words(self, noun):
+        self.words["plural"].add(noun.plur_one.word)
+        self.words["plural"].add(noun.plur_two.word)
+        self.words["singular"].add(noun.sing.word)
+
+    def get_literals(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get the literals as stored in the generated `*_of` dictionaries, i.e. including
+        variants with spaces for phrases with dashes, and lowercase variants
+        """
+        # If there is no modern plural known, use the classical plural
+        self.literals["modern_plural"] = {key: (
+            value if value else self.literals["classical_plural"][key]) for key, value in self.literals["modern_plural"].items()}
+
+        literals = {}
+        for key in self.literals:
+            # For phrases with dashes, also add variants with spaces
+            data = {}
+            for phrase_key, phrase_value in self.literals[key].items():
+                data[phrase_key] = phrase_value
+                if "-" in phrase_key and "-" in phrase_value:
+                    data[phrase_key.replace(
+                        "-", " ")] = phrase_value.replace("-", " ")
+
+            data_to_add = {}
+            for data_key in data:
+                if not data_key.islower():
+                    if data_key.lower() not in data:
+                        data_to_add[data_key.lower()] = data[data_key].lower()
+
+            literals[key] = {**data, **data_to_add}
+        return literals
+
+    def build_recursive(self, _from: str, to: str, from_type: str, to_type: str):
+        check_conditional = ""
+
+        def wrap(input_string: str) -> str:
+            return '{' + str(input_string) + '}'
+
+        def irepl(match, input_string: str, replace: str) -> str:
+            """
+            Replace using indices from match
+            """
+            return input_string[:match.start()] + replace + input_string[match.end():]
+
+        n = 1
+        # Get list of match objects, right to left, for both _from and to
+        # This way we can use match indices to replace, rather than relying on substitutions
+        # which causes issues with * being both in the input and output
+        from_matches = list(RECURSE_GROUPED.finditer(_from))[::-1]
+        to_matches = list(RECURSE_GROUPED.finditer(to))[::-1]
+        if len(from_matches) != len(to_matches):
+            raise ValueError(f"Unmatched placeholders between {_from!r} and {to!r}")
+
+        n = len(from_matches)
+        # The subterms are classified with `classify_number` directly, rather than through
+        # `is_singular` or `is_plural`, which would cost extra stack frames per nesting level
+        # Iterate over all matches right to left
+        for from_match, to_match in zip(from_matches, to_matches):
+            if from_match.group("star"):
+                _from = irepl(from_match, _from, r"(.*?)")
+                to = irepl(to_match, to, wrap(f'subterms[{n-1}]'))
+
+            elif from_match.group("sing"):
+                _from = irepl(from_match, _from, r"(.*?)")
+                to = irepl(to_match, to, wrap(
+                    f"convert_to_{to_type}(subterms[{n-1}]) if classify_number(subterms[{n-1}])[1] else subterms[{n-1}]"))
+                if not check_conditional:
+                    check_conditional = f"lambda match: classify_number(match.group({n}))[1]"
+
+            elif from_match.group("plur"):
+                _from = irepl(from_match, _from, r"(.*?)")
+                to = irepl(to_match, to, wrap(
+                    f"convert_to_{to_type}(subterms[{n-1}]) if classify_number(subterms[{n-1}])[0] else subterms[{n-1}]"))
+                if not check_conditional:
+                    check_conditional = f"lambda match: classify_number(match.group({n}))[0]"
+
+            elif from_match.group("prep"):
+                _from = irepl(from_match, _from, r"(about|above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|in|near|off|of|onto|on|out|over|since|till|to|under|until|unto|upon|with)")
+                to = irepl(to_match, to, wrap(f'subterms[{n-1}]'))
+
+            elif from_match.group("prepr"):
+                # Relative to prep, prepr(educed) lacks:
+                # out, about, off, in, on, over
+                _from = irepl(from_match, _from, r"(above|across|after|among|around|athwart|at|before|behind|below|beneath|besides?|between|betwixt|beyond|but|by|during|except|for|from|into|near|of|onto|since|till|to|under|until|unto|upon|with)")
+                to = irepl(to_match, to, wrap(f'subterms[{n-1}]'))
+
+            n -= 1
+
+        return {
+            "from": _from,
+            "to": f'lambda subterms: f"{to}"',
+            "check_conditional": check_conditional
+        }
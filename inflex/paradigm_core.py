@@ -0,0 +1,6307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##########################################
+## NOTE: This module was autogenerated. ##
+## Contains no user-servicable parts!!! ##
+##########################################
+
+VERSION = 20261018.145207
+
+# The versions of the core modules from which the paradigms were computed. `Noun` and `Verb`
+# only use the paradigms if these match the versions of the imported core modules.
+noun_core_version = 20261018.145056
+verb_core_version = 20261018.140505
+
+# Mapping of every noun in the dictionaries of `noun_core` to its modern plural,
+# classical plural and singular form, as computed by `Noun`
+noun_paradigms = {
+    "Achinese": ("Achinese", "Achinese", "Achinese"),
+    "Alfurese": ("Alfurese", "Alfurese", "Alfurese"),
+    "Amboinese": ("Amboinese", "Amboinese", "Amboinese"),
+    "Americanese": ("Americanese", "Americanese", "Americanese"),
+    "Amoyese": ("Amoyese", "Amoyese", "Amoyese"),
+    "Andamanese": ("Andamanese", "Andamanese", "Andamanese"),
+    "Angolese": ("Angolese", "Angolese", "Angolese"),
+    "Annamese": ("Annamese", "Annamese", "Annamese"),
+    "Antananarivo": ("Antananarivos", "Antananarivos", "Antananarivo"),
+    "Antananarivos": ("Antananarivos", "Antananarivos", "Antananarivo"),
+    "Aragonese": ("Aragonese", "Aragonese", "Aragonese"),
+    "Arakanese": ("Arakanese", "Arakanese", "Arakanese"),
+    "Asherah": ("Asherahs", "Asherim", "Asherah"),
+    "Asherahs": ("Asherahs", "Asherahs", "Asherah"),
+    "Asherim": ("Asherim", "Asherim", "Asherah"),
+    "Assamese": ("Assamese", "Assamese", "Assamese"),
+    "Atlantes": ("Atlantes", "Atlantes", "Atlas"),
+    "Atlas": ("Atlantes", "Atlantes", "Atlas"),
+    "Auslese": ("Auslesen", "Auslesen", "Auslese"),
+    "Auslesen": ("Auslesen", "Auslesen", "Auslese"),
+    "Avignonese": ("Avignonese", "Avignonese", "Avignonese"),
+    "Azerbaijanese": ("Azerbaijanese", "Azerbaijanese", "Azerbaijanese"),
+    "Bahaman": ("Bahamans", "Bahamans", "Bahaman"),
+    "Bahamans": ("Bahamans", "Bahamans", "Bahaman"),
+    "Balinese": ("Balinese", "Balinese", "Balinese"),
+    "Bamako": ("Bamakos", "Bamakos", "Bamako"),
+    "Bamakos": ("Bamakos", "Bamakos", "Bamako"),
+    "Barquisimeto": ("Barquisimetos", "Barquisimetos", "Barquisimeto"),
+    "Barquisimetos": ("Barquisimetos", "Barquisimetos", "Barquisimeto"),
+    "Bengalese": ("Bengalese", "Bengalese", "Bengalese"),
+    "Bernese": ("Bernese", "Bernese", "Bernese"),
+    "Bhutanese": ("Bhutanese", "Bhutanese", "Bhutanese"),
+    "Biro": ("Biros", "Biros", "Biro"),
+    "Biros": ("Biros", "Biros", "Biro"),
+    "Bolognese": ("Bolognese", "Bolognese", "Bolognese"),
+    "Bolzano": ("Bolzanos", "Bolzanos", "Bolzano"),
+    "Bolzanos": ("Bolzanos", "Bolzanos", "Bolzano"),
+    "Borghese": ("Borghese", "Borghese", "Borghese"),
+    "Bostonese": ("Bostonese", "Bostonese", "Bostonese"),
+    "Boto": ("Botos", "Botos", "Boto"),
+    "Botos": ("Botos", "Botos", "Boto"),
+    "Buginese": ("Buginese", "Buginese", "Buginese"),
+    "Burman": ("Burmans", "Burmans", "Burman"),
+    "Burmans": ("Burmans", "Burmans", "Burman"),
+    "Burmese": ("Burmese", "Burmese", "Burmese"),
+    "Cairo": ("Cairos", "Cairos", "Cairo"),
+    "Cairos": ("Cairos", "Cairos", "Cairo"),
+    "Calabrese": ("Calabrese", "Calabrese", "Calabrese"),
+    "Camaldolese": ("Camaldolese", "Camaldolese", "Camaldolese"),
+    "Cantonese": ("Cantonese", "Cantonese", "Cantonese"),
+    "Carlylese": ("Carlylese", "Carlylese", "Carlylese"),
+    "Cassinese": ("Cassinese", "Cassinese", "Cassinese"),
+    "Celanese": ("Celanese", "Celanese", "Celanese"),
+    "Ceylonese": ("Ceylonese", "Ceylonese", "Ceylonese"),
+    "Chicago": ("Chicagos", "Chicagos", "Chicago"),
+    "Chicagos": ("Chicagos", "Chicagos", "Chicago"),
+    "Chimango": ("Chimangos", "Chimangos", "Chimango"),
+    "Chimangos": ("Chimangos", "Chimangos", "Chimango"),
+    "Chinese": ("Chinese", "Chinese", "Chinese"),
+    "Colombo": ("Colombos", "Colombos", "Colombo"),
+    "Colombos": ("Colombos", "Colombos", "Colombo"),
+    "Colorado": ("Colorados", "Colorados", "Colorado"),
+    "Colorados": ("Colorados", "Colorados", "Colorado"),
+    "Congoese": ("Congoese", "Congoese", "Congoese"),
+    "Congolese": ("Congolese", "Congolese", "Congolese"),
+    "Czech": ("Czechs", "Czechs", "Czech"),
+    "Czechs": ("Czechs", "Czechs", "Czech"),
+    "Dongolese": ("Dongolese", "Dongolese", "Dongolese"),
+    "Draco": ("Dracos", "Dracos", "Draco"),
+    "Dracos": ("Dracos", "Dracos", "Draco"),
+    "Esperanto": ("Esperantos", "Esperantos", "Esperanto"),
+    "Esperantos": ("Esperantos", "Esperantos", "Esperanto"),
+    "Faro": ("Faros", "Faros", "Faro"),
+    "Faroese": ("Faroese", "Faroese", "Faroese"),
+    "Faros": ("Faros", "Faros", "Faro"),
+    "Ferrarese": ("Ferrarese", "Ferrarese", "Ferrarese"),
+    "Filipino": ("Filipinos", "Filipinos", "Filipino"),
+    "Filipinos": ("Filipinos", "Filipinos", "Filipino"),
+    "Foochowese": ("Foochowese", "Foochowese", "Foochowese"),
+    "Gabunese": ("Gabunese", "Gabunese", "Gabunese"),
+    "Galla": ("Gallas", "Galla", "Galla"),
+    "Gallas": ("Gallas", "Gallas", "Galla"),
+    "Genevese": ("Genevese", "Genevese", "Genevese"),
+    "Genoese": ("Genoese", "Genoese", "Genoese"),
+    "German": ("Germans", "Germans", "German"),
+    "Germans": ("Germans", "Germans", "German"),
+    "Gestapo": ("Gestapos", "Gestapos", "Gestapo"),
+    "Gestapos": ("Gestapos", "Gestapos", "Gestapo"),
+    "Gilbertese": ("Gilbertese", "Gilbertese", "Gilbertese"),
+    "Goanese": ("Goanese", "Goanese", "Goanese"),
+    "Greensboro": ("Greensboros", "Greensboros", "Greensboro"),
+    "Greensboros": ("Greensboros", "Greensboros", "Greensboro"),
+    "Guaiabero": ("Guaiaberos", "Guaiaberos", "Guaiabero"),
+    "Guaiaberos": ("Guaiaberos", "Guaiaberos", "Guaiabero"),
+    "Guianese": ("Guianese", "Guianese", "Guianese"),
+    "Hainanese": ("Hainanese", "Hainanese", "Hainanese"),
+    "Hararese": ("Hararese", "Hararese", "Hararese"),
+    "Harlemese": ("Harlemese", "Harlemese", "Harlemese"),
+    "Havanese": ("Havanese", "Havanese", "Havanese"),
+    "Heavenese": ("Heavenese", "Heavenese", "Heavenese"),
+    "Hiroshiman": ("Hiroshimans", "Hiroshimans", "Hiroshiman"),
+    "Hiroshimans": ("Hiroshimans", "Hiroshimans", "Hiroshiman"),
+    "Hoosierese": ("Hoosierese", "Hoosierese", "Hoosierese"),
+    "Hottentotese": ("Hottentotese", "Hottentotese", "Hottentotese"),
+    "Hunanese": ("Hunanese", "Hunanese", "Hunanese"),
+    "I": ("we", "we", "I"),
+    "Idaho": ("Idahos", "Idahos", "Idaho"),
+    "Idahos": ("Idahos", "Idahos", "Idaho"),
+    "Indochinese": ("Indochinese", "Indochinese", "Indochinese"),
+    "Iquico": ("Iquicos", "Iquicos", "Iquico"),
+    "Iquicos": ("Iquicos", "Iquicos", "Iquico"),
+    "Japanese": ("Japanese", "Japanese", "Japanese"),
+    "Javanese": ("Javanese", "Javanese", "Javanese"),
+    "Jerry": ("Jerrys", "Jerrys", "Jerry"),
+    "Jerrys": ("Jerrys", "Jerrys", "Jerry"),
+    "Johnsonese": ("Johnsonese", "Johnsonese", "Johnsonese"),
+    "Kakapo": ("Kakapos", "Kakapos", "Kakapo"),
+    "Kakapos": ("Kakapos", "Kakapos", "Kakapo"),
+    "Kanarese": ("Kanarese", "Kanarese", "Kanarese"),
+    "Kinkimavo": ("Kinkimavos", "Kinkimavos", "Kinkimavo"),
+    "Kinkimavos": ("Kinkimavos", "Kinkimavos", "Kinkimavo"),
+    "Kiplingese": ("Kiplingese", "Kiplingese", "Kiplingese"),
+    "Kokako": ("Kokakos", "Kokakos", "Kokako"),
+    "Kokakos": ("Kokakos", "Kokakos", "Kokako"),
+    "Kongoese": ("Kongoese", "Kongoese", "Kongoese"),
+    "Kongolese": ("Kongolese", "Kongolese", "Kongolese"),
+    "Kosovo": ("Kosovos", "Kosovos", "Kosovo"),
+    "Kosovos": ("Kosovos", "Kosovos", "Kosovo"),
+    "Lapith": ("Lapiths", "Lapithae", "Lapith"),
+    "Lapithae": ("Lapithae", "Lapithae", "Lapith"),
+    "Lapiths": ("Lapiths", "Lapiths", "Lapith"),
+    "Lapponese": ("Lapponese", "Lapponese", "Lapponese"),
+    "Lebanese": ("Lebanese", "Lebanese", "Lebanese"),
+    "Leonese": ("Leonese", "Leonese", "Leonese"),
+    "Lesotho": ("Lesothos", "Lesothos", "Lesotho"),
+    "Lesothos": ("Lesothos", "Lesothos", "Lesotho"),
+    "Lilo": ("Lilos", "Lilos", "Lilo"),
+    "Lilos": ("Lilos", "Lilos", "Lilo"),
+    "Liman": ("Limans", "Limans", "Liman"),
+    "Limans": ("Limans", "Limans", "Liman"),
+    "Londonese": ("Londonese", "Londonese", "Londonese"),
+    "Lorrainese": ("Lorrainese", "Lorrainese", "Lorrainese"),
+    "Lucchese": ("Lucchese", "Lucchese", "Lucchese"),
+    "Lyonese": ("Lyonese", "Lyonese", "Lyonese"),
+    "Macanese": ("Macanese", "Macanese", "Macanese"),
+    "Macassarese": ("Macassarese", "Macassarese", "Macassarese"),
+    "Madurese": ("Madurese", "Madurese", "Madurese"),
+    "Majuro": ("Majuros", "Majuros", "Majuro"),
+    "Majuros": ("Majuros", "Majuros", "Majuro"),
+    "Malabarese": ("Malabarese", "Malabarese", "Malabarese"),
+    "Malabo": ("Malabos", "Malabos", "Malabo"),
+    "Malabos": ("Malabos", "Malabos", "Malabo"),
+    "Maltese": ("Maltese", "Maltese", "Maltese"),
+    "Maputo": ("Maputos", "Maputos", "Maputo"),
+    "Maputos": ("Maputos", "Maputos", "Maputo"),
+    "Maracaibo": ("Maracaibos", "Maracaibos", "Maracaibo"),
+    "Maracaibos": ("Maracaibos", "Maracaibos", "Maracaibo"),
+    "Mary": ("Marys", "Marys", "Mary"),
+    "Marys": ("Marys", "Marys", "Mary"),
+    "Messinese": ("Messinese", "Messinese", "Messinese"),
+    "Mexico": ("Mexicos", "Mexicos", "Mexico"),
+    "Mexicos": ("Mexicos", "Mexicos", "Mexico"),
+    "Milanese": ("Milanese", "Milanese", "Milanese"),
+    "Milano": ("Milanos", "Milanos", "Milano"),
+    "Milanos": ("Milanos", "Milanos", "Milano"),
+    "Modenese": ("Modenese", "Modenese", "Modenese"),
+    "Monaco": ("Monacos", "Monacos", "Monaco"),
+    "Monacos": ("Monacos", "Monacos", "Monaco"),
+    "Montenegro": ("Montenegros", "Montenegros", "Montenegro"),
+    "Montenegros": ("Montenegros", "Montenegros", "Montenegro"),
+    "Morocco": ("Moroccos", "Moroccos", "Morocco"),
+    "Moroccos": ("Moroccos", "Moroccos", "Morocco"),
+    "Muqdisho": ("Muqdishos", "Muqdishos", "Muqdisho"),
+    "Muqdishos": ("Muqdishos", "Muqdishos", "Muqdisho"),
+    "Muranese": ("Muranese", "Muranese", "Muranese"),
+    "Nakayaman": ("Nakayamans", "Nakayamans", "Nakayaman"),
+    "Nakayamans": ("Nakayamans", "Nakayamans", "Nakayaman"),
+    "Nankingese": ("Nankingese", "Nankingese", "Nankingese"),
+    "Navarrese": ("Navarrese", "Navarrese", "Navarrese"),
+    "Nenets": ("Nenets", "Nentsi", "Nenets"),
+    "Nentsi": ("Nentsi", "Nentsi", "Nenets"),
+    "Nepalese": ("Nepalese", "Nepalese", "Nepalese"),
+    "Niasese": ("Niasese", "Niasese", "Niasese"),
+    "Nicobarese": ("Nicobarese", "Nicobarese", "Nicobarese"),
+    "Ningbo": ("Ningbos", "Ningbos", "Ningbo"),
+    "Ningbos": ("Ningbos", "Ningbos", "Ningbo"),
+    "Nipponese": ("Nipponese", "Nipponese", "Nipponese"),
+    "Norman": ("Normans", "Normans", "Norman"),
+    "Normans": ("Normans", "Normans", "Norman"),
+    "Oklahoman": ("Oklahomans", "Oklahomans", "Oklahoman"),
+    "Oklahomans": ("Oklahomans", "Oklahomans", "Oklahoman"),
+    "Orinoco": ("Orinocos", "Orinocos", "Orinoco"),
+    "Orinocos": ("Orinocos", "Orinocos", "Orinoco"),
+    "Orlando": ("Orlandos", "Orlandos", "Orlando"),
+    "Orlandos": ("Orlandos", "Orlandos", "Orlando"),
+    "Oslo": ("Oslos", "Oslos", "Oslo"),
+    "Oslos": ("Oslos", "Oslos", "Oslo"),
+    "Otomi": ("Otomies", "Otomi", "Otomi"),
+    "Otomies": ("Otomies", "Otomies", "Otomi"),
+    "Panaman": ("Panamans", "Panamans", "Panaman"),
+    "Panamans": ("Panamans", "Panamans", "Panaman"),
+    "Pangasinan": ("Pangasinans", "Pangasinanes", "Pangasinan"),
+    "Pangasinanes": ("Pangasinanes", "Pangasinanes", "Pangasinan"),
+    "Pangasinans": ("Pangasinans", "Pangasinans", "Pangasinan"),
+    "Paramaribo": ("Paramaribos", "Paramaribos", "Paramaribo"),
+    "Paramaribos": ("Paramaribos", "Paramaribos", "Paramaribo"),
+    "Pardusco": ("Parduscos", "Parduscos", "Pardusco"),
+    "Parduscos": ("Parduscos", "Parduscos", "Pardusco"),
+    "Parmese": ("Parmese", "Parmese", "Parmese"),
+    "Pekingese": ("Pekingese", "Pekingese", "Pekingese"),
+    "Piedmontese": ("Piedmontese", "Piedmontese", "Piedmontese"),
+    "Pistoiese": ("Pistoiese", "Pistoiese", "Pistoiese"),
+    "Pluto": ("Plutos", "Plutos", "Pluto"),
+    "Plutos": ("Plutos", "Plutos", "Pluto"),
+    "Polonese": ("Polonese", "Polonese", "Polonese"),
+    "Porto": ("Portos", "Portos", "Porto"),
+    "Porto Novo": ("Porto Novos", "Porto Novos", "Porto Novo"),
+    "Porto Novos": ("Porto Novos", "Porto Novos", "Porto Novo"),
+    "Porto-Novo": ("Porto-Novos", "Porto-Novos", "Porto-Novo"),
+    "Porto-Novos": ("Porto-Novos", "Porto-Novos", "Porto-Novo"),
+    "Portos": ("Portos", "Portos", "Porto"),
+    "Portuguese": ("Portuguese", "Portuguese", "Portuguese"),
+    "Purum": ("Purums", "Purum", "Purum"),
+    "Purums": ("Purums", "Purums", "Purum"),
+    "Quito": ("Quitos", "Quitos", "Quito"),
+    "Quitos": ("Quitos", "Quitos", "Quito"),
+    "Rom": ("Roma", "Roma", "Rom"),
+    "Roma": ("Roma", "Roma", "Rom"),
+    "Romagnese": ("Romagnese", "Romagnese", "Romagnese"),
+    "Roman": ("Romans", "Romans", "Roman"),
+    "Romanese": ("Romanese", "Romanese", "Romanese"),
+    "Romanies": ("Romanies", "Romanies", "Romany"),
+    "Romans": ("Romans", "Romans", "Roman"),
+    "Romany": ("Romanies", "Romanies", "Romany"),
+    "Sacramento": ("Sacramentos", "Sacramentos", "Sacramento"),
+    "Sacramentos": ("Sacramentos", "Sacramentos", "Sacramento"),
+    "Sangirese": ("Sangirese", "Sangirese", "Sangirese"),
+    "Santiago": ("Santiagos", "Santiagos", "Santiago"),
+    "Santiagos": ("Santiagos", "Santiagos", "Santiago"),
+    "Sapporo": ("Sapporos", "Sapporos", "Sapporo"),
+    "Sapporos": ("Sapporos", "Sapporos", "Sapporo"),
+    "Sarajevo": ("Sarajevos", "Sarajevos", "Sarajevo"),
+    "Sarajevos": ("Sarajevos", "Sarajevos", "Sarajevo"),
+    "Sarawakese": ("Sarawakese", "Sarawakese", "Sarawakese"),
+    "Selman": ("Selmans", "Selmans", "Selman"),
+    "Selmans": ("Selmans", "Selmans", "Selman"),
+    "Senegalese": ("Senegalese", "Senegalese", "Senegalese"),
+    "Shavese": ("Shavese", "Shavese", "Shavese"),
+    "Shawanese": ("Shawanese", "Shawanese", "Shawanese"),
+    "Siamese": ("Siamese", "Siamese", "Siamese"),
+    "Sienese": ("Sienese", "Sienese", "Sienese"),
+    "Sikkimese": ("Sikkimese", "Sikkimese", "Sikkimese"),
+    "Siluri": ("Siluri", "Siluri", "Silurus"),
+    "Silurus": ("Siluri", "Siluri", "Silurus"),
+    "Singhalese": ("Singhalese", "Singhalese", "Singhalese"),
+    "Sinhalese": ("Sinhalese", "Sinhalese", "Sinhalese"),
+    "Sogdianese": ("Sogdianese", "Sogdianese", "Sogdianese"),
+    "Sonaman": ("Sonamans", "Sonamans", "Sonaman"),
+    "Sonamans": ("Sonamans", "Sonamans", "Sonaman"),
+    "Spaetlese": ("Spaetlesen", "Spaetlesen", "Spaetlese"),
+    "Spaetlesen": ("Spaetlesen", "Spaetlesen", "Spaetlese"),
+    "Sudanese": ("Sudanese", "Sudanese", "Sudanese"),
+    "Sundanese": ("Sundanese", "Sundanese", "Sundanese"),
+    "Swahilese": ("Swahilese", "Swahilese", "Swahilese"),
+    "Tacoman": ("Tacomans", "Tacomans", "Tacoman"),
+    "Tacomans": ("Tacomans", "Tacomans", "Tacoman"),
+    "Taiko": ("Taikos", "Taikos", "Taiko"),
+    "Taikos": ("Taikos", "Taikos", "Taiko"),
+    "Tenggerese": ("Tenggerese", "Tenggerese", "Tenggerese"),
+    "Timorese": ("Timorese", "Timorese", "Timorese"),
+    "Tirolese": ("Tirolese", "Tirolese", "Tirolese"),
+    "Tocharese": ("Tocharese", "Tocharese", "Tocharese"),
+    "Togo": ("Togos", "Togos", "Togo"),
+    "Togos": ("Togos", "Togos", "Togo"),
+    "Tokyo": ("Tokyos", "Tokyos", "Tokyo"),
+    "Tokyos": ("Tokyos", "Tokyos", "Tokyo"),
+    "Tonkinese": ("Tonkinese", "Tonkinese", "Tonkinese"),
+    "Torinese": ("Torinese", "Torinese", "Torinese"),
+    "Torino": ("Torinos", "Torinos", "Torino"),
+    "Torinos": ("Torinos", "Torinos", "Torino"),
+    "Tornese": ("Tornesi", "Tornesi", "Tornese"),
+    "Tornesi": ("Tornesi", "Tornesi", "Tornese"),
+    "Toronto": ("Torontos", "Torontos", "Toronto"),
+    "Torontos": ("Torontos", "Torontos", "Toronto"),
+    "Tyrolese": ("Tyrolese", "Tyrolese", "Tyrolese"),
+    "Vermontese": ("Vermontese", "Vermontese", "Vermontese"),
+    "Veronese": ("Veronese", "Veronese", "Veronese"),
+    "Viennese": ("Viennese", "Viennese", "Viennese"),
+    "Vietnamese": ("Vietnamese", "Vietnamese", "Vietnamese"),
+    "Virgo": ("Virgos", "Virgos", "Virgo"),
+    "Virgos": ("Virgos", "Virgos", "Virgo"),
+    "Wenchowese": ("Wenchowese", "Wenchowese", "Wenchowese"),
+    "Whitmanese": ("Whitmanese", "Whitmanese", "Whitmanese"),
+    "Yakiman": ("Yakimans", "Yakimans", "Yakiman"),
+    "Yakimans": ("Yakimans", "Yakimans", "Yakiman"),
+    "Yamoussoukro": ("Yamoussoukros", "Yamoussoukros", "Yamoussoukro"),
+    "Yamoussoukros": ("Yamoussoukros", "Yamoussoukros", "Yamoussoukro"),
+    "Yengeese": ("Yengeese", "Yengeese", "Yengeese"),
+    "Yokohaman": ("Yokohamans", "Yokohamans", "Yokohaman"),
+    "Yokohamans": ("Yokohamans", "Yokohamans", "Yokohaman"),
+    "Yuman": ("Yumans", "Yumans", "Yuman"),
+    "Yumans": ("Yumans", "Yumans", "Yuman"),
+    "Yunnanese": ("Yunnanese", "Yunnanese", "Yunnanese"),
+    "Zibo": ("Zibos", "Zibos", "Zibo"),
+    "Zibos": ("Zibos", "Zibos", "Zibo"),
+    "abacus": ("abacuses", "abacuses", "abacus"),
+    "abacuses": ("abacuses", "abacuses", "abacus"),
+    "aboiteau": ("aboiteaus", "aboiteaux", "aboiteau"),
+    "aboiteaus": ("aboiteaus", "aboiteaus", "aboiteau"),
+    "aboiteaux": ("aboiteaux", "aboiteaux", "aboiteau"),
+    "abortoria": ("abortoria", "abortoria", "abortorium"),
+    "abortorium": ("abortoria", "abortoria", "abortorium"),
+    "abortus": ("abortuses", "abortuses", "abortus"),
+    "abortuses": ("abortuses", "abortuses", "abortus"),
+    "abscissa": ("abscissas", "abscissae", "abscissa"),
+    "abscissae": ("abscissae", "abscissae", "abscissa"),
+    "abscissas": ("abscissas", "abscissas", "abscissa"),
+    "abstracta": ("abstracta", "abstracta", "abstractum"),
+    "abstractum": ("abstracta", "abstracta", "abstractum"),
+    "acari": ("acari", "acari", "acarus"),
+    "acarus": ("acari", "acari", "acarus"),
+    "achinese": ("achinese", "achinese", "achinese"),
+    "acicula": ("aciculae", "aciculae", "acicula"),
+    "aciculae": ("aciculae", "aciculae", "acicula"),
+    "acini": ("acini", "acini", "acinus"),
+    "acinus": ("acini", "acini", "acinus"),
+    "acroama": ("acroamata", "acroamata", "acroama"),
+    "acroamata": ("acroamata", "acroamata", "acroama"),
+    "acropolis": ("acropolises", "acropolises", "acropolis"),
+    "acropolises": ("acropolises", "acropolises", "acropolis"),
+    "actinia": ("actinias", "actiniae", "actinia"),
+    "actiniae": ("actiniae", "actiniae", "actinia"),
+    "actinias": ("actinias", "actinias", "actinia"),
+    "aculei": ("aculei", "aculei", "aculeus"),
+    "aculeus": ("aculei", "aculei", "aculeus"),
+    "addenda": ("addenda", "addenda", "addendum"),
+    "addendum": ("addendums", "addenda", "addendum"),
+    "addendums": ("addendums", "addendums", "addendum"),
+    "adieu": ("adieus", "adieux", "adieu"),
+    "adieus": ("adieus", "adieus", "adieu"),
+    "adieux": ("adieux", "adieux", "adieu"),
+    "adjutant general": ("adjutant generals", "adjutant generals", "adjutant general"),
+    "adjutant generals": ("adjutant generals", "adjutant generals", "adjutant general"),
+    "adminicula": ("adminicula", "adminicula", "adminiculum"),
+    "adminiculum": ("adminicula", "adminicula", "adminiculum"),
+    "ado": ("ados", "ados", "ado"),
+    "ados": ("ados", "ados", "ado"),
+    "adviso": ("advisoes", "advisoes", "adviso"),
+    "advisoes": ("advisoes", "advisoes", "adviso"),
+    "adyta": ("adyta", "adyta", "adytum"),
+    "adytum": ("adyta", "adyta", "adytum"),
+    "aecidia": ("aecidia", "aecidia", "aecidium"),
+    "aecidium": ("aecidia", "aecidia", "aecidium"),
+    "aegis": ("aegises", "aegises", "aegis"),
+    "aegises": ("aegises", "aegises", "aegis"),
+    "aelf": ("aelfe", "aelfe", "aelf"),
+    "aelfe": ("aelfe", "aelfe", "aelf"),
+    "aficionado": ("aficionados", "aficionados", "aficionado"),
+    "aficionados": ("aficionados", "aficionados", "aficionado"),
+    "afreet": ("afreets", "afreeti", "afreet"),
+    "afreeti": ("afreeti", "afreeti", "afreet"),
+    "afreets": ("afreets", "afreets", "afreet"),
+    "afrit": ("afrits", "afriti", "afrit"),
+    "afriti": ("afriti", "afriti", "afrit"),
+    "afrits": ("afrits", "afrits", "afrit"),
+    "agapae": ("agapae", "agapae", "agape"),
+    "agape": ("agapes", "agapae", "agape"),
+    "agapes": ("agapes", "agapes", "agape"),
+    "agend": ("agends", "agenda", "agend"),
+    "agenda": ("agenda", "agenda", "agendum"),
+    "agends": ("agends", "agends", "agend"),
+    "agendum": ("agenda", "agenda", "agendum"),
+    "agent provocateur": ("agents provocateurs", "agents provocateurs", "agent provocateur"),
+    "agents provocateurs": ("agents provocateurs", "agents provocateurs", "agent provocateur"),
+    "aggro": ("aggros", "aggros", "aggro"),
+    "aggros": ("aggros", "aggros", "aggro"),
+    "agon": ("agones", "agones", "agon"),
+    "agones": ("agones", "agones", "agon"),
+    "agora": ("agorae", "agorae", "agora"),
+    "agorae": ("agorae", "agorae", "agora"),
+    "agrogorod": ("agrogoroda", "agrogoroda", "agrogorod"),
+    "agrogoroda": ("agrogoroda", "agrogoroda", "agrogorod"),
+    "aide de camp": ("aides de camp", "aides de camp", "aide de camp"),
+    "aide-de-camp": ("aides-de-camp", "aides-de-camp", "aide-de-camp"),
+    "aides de camp": ("aides de camp", "aides de camp", "aide de camp"),
+    "aides-de-camp": ("aides-de-camp", "aides-de-camp", "aide-de-camp"),
+    "ala": ("alae", "alae", "ala"),
+    "alae": ("alae", "alae", "ala"),
+    "alan": ("alans", "alani", "alan"),
+    "alani": ("alani", "alani", "alan"),
+    "alans": ("alans", "alans", "alan"),
+    "alberghi": ("alberghi", "alberghi", "albergo"),
+    "albergo": ("alberghi", "alberghi", "albergo"),
+    "albino": ("albinos", "albinos", "albino"),
+    "albinos": ("albinos", "albinos", "albino"),
+    "ale wife": ("ale wives", "ale wives", "ale wife"),
+    "ale wives": ("ale wives", "ale wives", "ale wife"),
+    "ale-wife": ("ale-wives", "ale-wives", "ale-wife"),
+    "ale-wives": ("ale-wives", "ale-wives", "ale-wife"),
+    "alfurese": ("alfurese", "alfurese", "alfurese"),
+    "alga": ("algae", "algae", "alga"),
+    "algae": ("algae", "algae", "alga"),
+    "alguacil": ("alguacils", "alguaciles", "alguacil"),
+    "alguaciles": ("alguaciles", "alguaciles", "alguacil"),
+    "alguacils": ("alguacils", "alguacils", "alguacil"),
+    "alias": ("aliases", "aliases", "alias"),
+    "aliases": ("aliases", "aliases", "alias"),
+    "allargandi": ("allargandi", "allargandi", "allargando"),
+    "allargando": ("allargandi", "allargandi", "allargando"),
+    "allegro": ("allegros", "allegros", "allegro"),
+    "allegros": ("allegros", "allegros", "allegro"),
+    "alluvia": ("alluvia", "alluvia", "alluvium"),
+    "alluvium": ("alluviums", "alluvia", "alluvium"),
+    "alluviums": ("alluviums", "alluviums", "alluvium"),
+    "alti": ("alti", "alti", "alto"),
+    "alto": ("altos", "alti", "alto"),
+    "alto relievo": ("alto relievos", "alto relievos", "alto relievo"),
+    "alto relievos": ("alto relievos", "alto relievos", "alto relievo"),
+    "alto-relievo": ("alto-relievos", "alto-relievos", "alto-relievo"),
+    "alto-relievos": ("alto-relievos", "alto-relievos", "alto-relievo"),
+    "altorelievo": ("altorelievos", "altorelievos", "altorelievo"),
+    "altorelievos": ("altorelievos", "altorelievos", "altorelievo"),
+    "altos": ("altos", "altos", "alto"),
+    "alula": ("alulae", "alulae", "alula"),
+    "alulae": ("alulae", "alulae", "alula"),
+    "alumna": ("alumnae", "alumnae", "alumna"),
+    "alumnae": ("alumnae", "alumnae", "alumna"),
+    "alumni": ("alumni", "alumni", "alumnus"),
+    "alumnus": ("alumni", "alumni", "alumnus"),
+    "alveoli": ("alveoli", "alveoli", "alveolus"),
+    "alveolus": ("alveoli", "alveoli", "alveolus"),
+    "ambo": ("ambos", "ambones", "ambo"),
+    "amboinese": ("amboinese", "amboinese", "amboinese"),
+    "ambones": ("ambones", "ambones", "ambo"),
+    "ambos": ("ambos", "ambos", "ambo"),
+    "ambulacra": ("ambulacra", "ambulacra", "ambulacrum"),
+    "ambulacrum": ("ambulacra", "ambulacra", "ambulacrum"),
+    "ambuscado": ("ambuscados", "ambuscadoes", "ambuscado"),
+    "ambuscadoes": ("ambuscadoes", "ambuscadoes", "ambuscado"),
+    "ambuscados": ("ambuscados", "ambuscados", "ambuscado"),
+    "amenta": ("amenta", "amenta", "amentum"),
+    "amentum": ("amenta", "amenta", "amentum"),
+    "americanese": ("americanese", "americanese", "americanese"),
+    "amici curiae": ("amici curiae", "amici curiae", "amicus curiae"),
+    "amicus curiae": ("amici curiae", "amici curiae", "amicus curiae"),
+    "ammo": ("ammos", "ammos", "ammo"),
+    "ammos": ("ammos", "ammos", "ammo"),
+    "amoeba": ("amoebas", "amoebae", "amoeba"),
+    "amoebae": ("amoebae", "amoebae", "amoeba"),
+    "amoebas": ("amoebas", "amoebas", "amoeba"),
+    "amoretti": ("amoretti", "amoretti", "amoretto"),
+    "amoretto": ("amoretti", "amoretti", "amoretto"),
+    "amorini": ("amorini", "amorini", "amorino"),
+    "amorino": ("amorini", "amorini", "amorino"),
+    "amoyese": ("amoyese", "amoyese", "amoyese"),
+    "amphipneust": ("amphipneusts", "amphipneusta", "amphipneust"),
+    "amphipneusta": ("amphipneusta", "amphipneusta", "amphipneust"),
+    "amphipneusts": ("amphipneusts", "amphipneusts", "amphipneust"),
+    "amphora": ("amphorae", "amphorae", "amphora"),
+    "amphorae": ("amphorae", "amphorae", "amphora"),
+    "anacolutha": ("anacolutha", "anacolutha", "anacoluthon"),
+    "anacoluthon": ("anacoluthons", "anacolutha", "anacoluthon"),
+    "anacoluthons": ("anacoluthons", "anacoluthons", "anacoluthon"),
+    "anathema": ("anathemas", "anathemata", "anathema"),
+    "anathemas": ("anathemas", "anathemas", "anathema"),
+    "anathemata": ("anathemata", "anathemata", "anathema"),
+    "ancona": ("ancone", "ancone", "ancona"),
+    "ancone": ("ancone", "ancone", "ancona"),
+    "andamanese": ("andamanese", "andamanese", "andamanese"),
+    "angioma": ("angiomata", "angiomata", "angioma"),
+    "angiomata": ("angiomata", "angiomata", "angioma"),
+    "angolese": ("angolese", "angolese", "angolese"),
+    "angustia": ("angustiae", "angustiae", "angustia"),
+    "angustiae": ("angustiae", "angustiae", "angustia"),
+    "anlage": ("anlages", "anlagen", "anlage"),
+    "anlagen": ("anlagen", "anlagen", "anlage"),
+    "anlages": ("anlages", "anlages", "anlage"),
+    "annamese": ("annamese", "annamese", "annamese"),
+    "anta": ("antae", "antae", "anta"),
+    "antae": ("antae", "antae", "anta"),
+    "antananarivo": ("antananarivos", "antananarivos", "antananarivo"),
+    "antananarivos": ("antananarivos", "antananarivos", "antananarivo"),
+    "antefix": ("antifixes", "antefixa", "antefix"),
+    "antefixa": ("antefixa", "antefixa", "antefix"),
+    "antenna": ("antennas", "antennae", "antenna"),
+    "antennae": ("antennae", "antennae", "antenna"),
+    "antennas": ("antennas", "antennas", "antenna"),
+    "anthemia": ("anthemia", "anthemia", "anthemion"),
+    "anthemion": ("anthemia", "anthemia", "anthemion"),
+    "anthodia": ("anthodia", "anthodia", "anthodium"),
+    "anthodium": ("anthodia", "anthodia", "anthodium"),
+    "anti sera": ("anti sera", "anti sera", "anti serum"),
+    "anti serum": ("anti serums", "anti sera", "anti serum"),
+    "anti serums": ("anti serums", "anti serums", "anti serum"),
+    "anti-sera": ("anti-sera", "anti-sera", "anti-serum"),
+    "anti-serum": ("anti-serums", "anti-sera", "anti-serum"),
+    "anti-serums": ("anti-serums", "anti-serums", "anti-serum"),
+    "antifixes": ("antifixes", "antifixes", "antefix"),
+    "antisera": ("antisera", "antisera", "antiserum"),
+    "antiserum": ("antisera", "antisera", "antiserum"),
+    "antra": ("antra", "antra", "antrum"),
+    "antrum": ("antra", "antra", "antrum"),
+    "apex": ("apexes", "apices", "apex"),
+    "apexes": ("apexes", "apexes", "apex"),
+    "aphelia": ("aphelia", "aphelia", "aphelion"),
+    "aphelion": ("aphelia", "aphelia", "aphelion"),
+    "aphides": ("aphides", "aphides", "aphis"),
+    "aphis": ("aphides", "aphides", "aphis"),
+    "apices": ("apices", "apices", "apex"),
+    "apothecia": ("apothecia", "apothecia", "apothecium"),
+    "apothecium": ("apothecia", "apothecia", "apothecium"),
+    "apparatchik": ("apparatchiks", "apparatchiki", "apparatchik"),
+    "apparatchiki": ("apparatchiki", "apparatchiki", "apparatchik"),
+    "apparatchiks": ("apparatchiks", "apparatchiks", "apparatchik"),
+    "apparatus": ("apparatuses", "apparatus", "apparatus"),
+    "apparatuses": ("apparatuses", "apparatuses", "apparatus"),
+    "appendices": ("appendices", "appendices", "appendix"),
+    "appendix": ("appendixes", "appendices", "appendix"),
+    "appendixes": ("appendixes", "appendixes", "appendix"),
+    "appressoria": ("appressoria", "appressoria", "appressorium"),
+    "appressorium": ("appressoria", "appressoria", "appressorium"),
+    "apsides": ("apsides", "apsides", "apsis"),
+    "apsis": ("apsides", "apsides", "apsis"),
+    "apteria": ("apteria", "apteria", "apterium"),
+    "apterium": ("apteria", "apteria", "apterium"),
+    "aptychi": ("aptychi", "aptychi", "aptychus"),
+    "aptychus": ("aptychi", "aptychi", "aptychus"),
+    "aquaria": ("aquaria", "aquaria", "aquarium"),
+    "aquarium": ("aquariums", "aquaria", "aquarium"),
+    "aquariums": ("aquariums", "aquariums", "aquarium"),
+    "aragonese": ("aragonese", "aragonese", "aragonese"),
+    "arakanese": ("arakanese", "arakanese", "arakanese"),
+    "arango": ("arangoes", "arangoes", "arango"),
+    "arangoes": ("arangoes", "arangoes", "arango"),
+    "arboreta": ("arboreta", "arboreta", "arboretum"),
+    "arboretum": ("arboreta", "arboreta", "arboretum"),
+    "arcana": ("arcana", "arcana", "arcanum"),
+    "arcanum": ("arcana", "arcana", "arcanum"),
+    "archegonia": ("archegonia", "archegonia", "archegonium"),
+    "archegonium": ("archegonia", "archegonia", "archegonium"),
+    "archipelago": ("archipelagos", "archipelagoes", "archipelago"),
+    "archipelagoes": ("archipelagoes", "archipelagoes", "archipelago"),
+    "archipelagos": ("archipelagos", "archipelagos", "archipelago"),
+    "arcosolia": ("arcosolia", "arcosolia", "arcosolium"),
+    "arcosolium": ("arcosolia", "arcosolia", "arcosolium"),
+    "areola": ("areolae", "areolae", "areola"),
+    "areolae": ("areolae", "areolae", "areola"),
+    "argumenta": ("argumenta", "argumenta", "argumentum"),
+    "argumentum": ("argumenta", "argumenta", "argumentum"),
+    "arista": ("aristae", "aristae", "arista"),
+    "aristae": ("aristae", "aristae", "arista"),
+    "armadillo": ("armadillos", "armadillos", "armadillo"),
+    "armadillos": ("armadillos", "armadillos", "armadillo"),
+    "arrha": ("arrhae", "arrhae", "arrha"),
+    "arrhae": ("arrhae", "arrhae", "arrha"),
+    "asbestos": ("asbestoses", "asbestoses", "asbestos"),
+    "asbestoses": ("asbestoses", "asbestoses", "asbestos"),
+    "ascidia": ("ascidia", "ascidia", "ascidium"),
+    "ascidium": ("ascidia", "ascidia", "ascidium"),
+    "asherah": ("asherahs", "asherim", "asherah"),
+    "asherahs": ("asherahs", "asherahs", "asherah"),
+    "asherim": ("asherim", "asherim", "asherah"),
+    "assamese": ("assamese", "assamese", "assamese"),
+    "asteriae": ("asteriae", "asteriae", "asterias"),
+    "asterias": ("asteriae", "asteriae", "asterias"),
+    "astrocytoma": ("astrocytomas", "astrocytomata", "astrocytoma"),
+    "astrocytomas": ("astrocytomas", "astrocytomas", "astrocytoma"),
+    "astrocytomata": ("astrocytomata", "astrocytomata", "astrocytoma"),
+    "asyla": ("asyla", "asyla", "asylum"),
+    "asylum": ("asylums", "asyla", "asylum"),
+    "asylums": ("asylums", "asylums", "asylum"),
+    "asyndeta": ("asyndeta", "asyndeta", "asyndeton"),
+    "asyndeton": ("asyndeta", "asyndeta", "asyndeton"),
+    "ataman": ("atamans", "atamans", "ataman"),
+    "atamans": ("atamans", "atamans", "ataman"),
+    "atlantes": ("atlantes", "atlantes", "atlas"),
+    "atlas": ("atlases", "atlantes", "atlas"),
+    "atlases": ("atlases", "atlases", "atlas"),
+    "atman": ("atmas", "atmas", "atman"),
+    "atmas": ("atmas", "atmas", "atman"),
+    "aurei": ("aurei", "aurei", "aureus"),
+    "aureus": ("aurei", "aurei", "aureus"),
+    "aurora": ("auroras", "aurorae", "aurora"),
+    "aurorae": ("aurorae", "aurorae", "aurora"),
+    "auroras": ("auroras", "auroras", "aurora"),
+    "auslese": ("ausleses", "auslesen", "auslese"),
+    "auslesen": ("auslesen", "auslesen", "auslese"),
+    "ausleses": ("ausleses", "ausleses", "auslese"),
+    "auspex": ("auspices", "auspices", "auspex"),
+    "auspices": ("auspices", "auspices", "auspex"),
+    "auto": ("autos", "autos", "auto"),
+    "auto de fe": ("auto de fes", "autos de fes", "auto de fe"),
+    "auto de fes": ("auto de fes", "auto de fes", "auto de fe"),
+    "auto-de-fe": ("auto-de-fes", "autos-de-fes", "auto-de-fe"),
+    "auto-de-fes": ("auto-de-fes", "auto-de-fes", "auto-de-fe"),
+    "autobahn": ("autobahns", "autobahnen", "autobahn"),
+    "autobahnen": ("autobahnen", "autobahnen", "autobahn"),
+    "autobahns": ("autobahns", "autobahns", "autobahn"),
+    "autochthon": ("autochthons", "autochthones", "autochthon"),
+    "autochthones": ("autochthones", "autochthones", "autochthon"),
+    "autochthons": ("autochthons", "autochthons", "autochthon"),
+    "autos": ("autos", "autos", "auto"),
+    "autos de fes": ("autos de fes", "autos de fes", "auto de fe"),
+    "autos-de-fes": ("autos-de-fes", "autos-de-fes", "auto-de-fe"),
+    "autostrada": ("autostradas", "autostrade", "autostrada"),
+    "autostradas": ("autostradas", "autostradas", "autostrada"),
+    "autostrade": ("autostrade", "autostrade", "autostrada"),
+    "avicularia": ("avicularia", "avicularia", "avicularium"),
+    "avicularium": ("avicularia", "avicularia", "avicularium"),
+    "avignonese": ("avignonese", "avignonese", "avignonese"),
+    "aviso": ("avisos", "avisos", "aviso"),
+    "avisos": ("avisos", "avisos", "aviso"),
+    "avocado": ("avocados", "avocados", "avocado"),
+    "avocados": ("avocados", "avocados", "avocado"),
+    "ax": ("axes", "axes", "ax"),
+    "axe": ("axes", "axes", "axe"),
+    "axes": ("axes", "axes", "axe"),
+    "axilla": ("axillae", "axillae", "axilla"),
+    "axillae": ("axillae", "axillae", "axilla"),
+    "axis": ("axes", "axes", "axis"),
+    "axon": ("axons", "axones", "axon"),
+    "axones": ("axones", "axones", "axon"),
+    "axons": ("axons", "axons", "axon"),
+    "axopodia": ("axopodia", "axopodia", "axopodium"),
+    "axopodium": ("axopodia", "axopodia", "axopodium"),
+    "azerbaijanese": ("azerbaijanese", "azerbaijanese", "azerbaijanese"),
+    "baal": ("baals", "baalim", "baal"),
+    "baalim": ("baalim", "baalim", "baal"),
+    "baals": ("baals", "baals", "baal"),
+    "bacilli": ("bacilli", "bacilli", "bacillus"),
+    "bacillus": ("bacilli", "bacilli", "bacillus"),
+    "bacteria": ("bacteria", "bacteria", "bacterium"),
+    "bacterium": ("bacteria", "bacteria", "bacterium"),
+    "bahaman": ("bahamans", "bahamans", "bahaman"),
+    "bahamans": ("bahamans", "bahamans", "bahaman"),
+    "bajocchi": ("bajocchi", "bajocchi", "bajocco"),
+    "bajocco": ("bajocchi", "bajocchi", "bajocco"),
+    "balinese": ("balinese", "balinese", "balinese"),
+    "ballabile": ("ballabili", "ballabili", "ballabile"),
+    "ballabili": ("ballabili", "ballabili", "ballabile"),
+    "ballata": ("ballate", "ballate", "ballata"),
+    "ballate": ("ballate", "ballate", "ballata"),
+    "ballerina": ("ballerinas", "ballerine", "ballerina"),
+    "ballerinas": ("ballerinas", "ballerinas", "ballerina"),
+    "ballerine": ("ballerine", "ballerine", "ballerina"),
+    "ballista": ("ballistas", "ballistae", "ballista"),
+    "ballistae": ("ballistae", "ballistae", "ballista"),
+    "ballistas": ("ballistas", "ballistas", "ballista"),
+    "bamako": ("bamakos", "bamakos", "bamako"),
+    "bamakos": ("bamakos", "bamakos", "bamako"),
+    "bandeau": ("bandeaus", "bandeaux", "bandeau"),
+    "bandeaus": ("bandeaus", "bandeaus", "bandeau"),
+    "bandeaux": ("bandeaux", "bandeaux", "bandeau"),
+    "bandit": ("bandits", "banditti", "bandit"),
+    "bandits": ("bandits", "bandits", "bandit"),
+    "banditti": ("banditti", "banditti", "bandit"),
+    "barquisimeto": ("barquisimetos", "barquisimetos", "barquisimeto"),
+    "barquisimetos": ("barquisimetos", "barquisimetos", "barquisimeto"),
+    "barrico": ("barricoes", "barricoes", "barrico"),
+    "barricoes": ("barricoes", "barricoes", "barrico"),
+    "base": ("bases", "bases", "base"),
+    "bases": ("bases", "bases", "base"),
+    "basilica": ("basilicas", "basilicae", "basilica"),
+    "basilicae": ("basilicae", "basilicae", "basilica"),
+    "basilicas": ("basilicas", "basilicas", "basilica"),
+    "basis": ("bases", "bases", "basis"),
+    "bass": ("basses", "bass", "bass"),
+    "basses": ("basses", "basses", "bass"),
+    "bassi": ("bassi", "bassi", "basso"),
+    "basso": ("bassos", "bassi", "basso"),
+    "bassos": ("bassos", "bassos", "basso"),
+    "bateau": ("bateaus", "bateaux", "bateau"),
+    "bateaus": ("bateaus", "bateaus", "bateau"),
+    "bateaux": ("bateaux", "bateaux", "bateau"),
+    "bath": ("baths", "baths", "bath"),
+    "bathos": ("bathoses", "bathoses", "bathos"),
+    "bathoses": ("bathoses", "bathoses", "bathos"),
+    "baths": ("baths", "baths", "bath"),
+    "batz": ("batzes", "batzes", "batz"),
+    "batzes": ("batzes", "batzes", "batz"),
+    "beau": ("beaus", "beaux", "beau"),
+    "beau geste": ("beau gestes", "beaux gestes", "beau geste"),
+    "beau gestes": ("beau gestes", "beau gestes", "beau geste"),
+    "beaus": ("beaus", "beaus", "beau"),
+    "beaux": ("beaux", "beaux", "beau"),
+    "beaux esprits": ("beaux esprits", "beaux esprits", "bel esprit"),
+    "beaux gestes": ("beaux gestes", "beaux gestes", "beau geste"),
+    "beaux hommes": ("beaux hommes", "beaux hommes", "bel homme"),
+    "bechuana": ("bechuanas", "bechuana", "bechuana"),
+    "bechuanas": ("bechuanas", "bechuanas", "bechuana"),
+    "beef": ("beefs", "beeves", "beef"),
+    "beefs": ("beefs", "beefs", "beef"),
+    "beerenauslese": ("beerenauslesen", "beerenauslesen", "beerenauslese"),
+    "beerenauslesen": ("beerenauslesen", "beerenauslesen", "beerenauslese"),
+    "beeves": ("beeves", "beeves", "beef"),
+    "bel esprit": ("beaux esprits", "beaux esprits", "bel esprit"),
+    "bel homme": ("beaux hommes", "beaux hommes", "bel homme"),
+    "belle epoque": ("belle epoques", "belles epoques", "belle epoque"),
+    "belle epoques": ("belle epoques", "belle epoques", "belle epoque"),
+    "belles epoques": ("belles epoques", "belles epoques", "belle epoque"),
+    "bema": ("bemas", "bemata", "bema"),
+    "bemas": ("bemas", "bemas", "bema"),
+    "bemata": ("bemata", "bemata", "bema"),
+    "bengalese": ("bengalese", "bengalese", "bengalese"),
+    "bernese": ("bernese", "bernese", "bernese"),
+    "bersagliere": ("bersaglieri", "bersaglieri", "bersagliere"),
+    "bersaglieri": ("bersaglieri", "bersaglieri", "bersagliere"),
+    "bhikshook": ("bhikshook", "bhikshook", "bhikshu"),
+    "bhikshu": ("bhikshus", "bhikshook", "bhikshu"),
+    "bhikshus": ("bhikshus", "bhikshus", "bhikshu"),
+    "bhutanese": ("bhutanese", "bhutanese", "bhutanese"),
+    "bias": ("biases", "biases", "bias"),
+    "biases": ("biases", "biases", "bias"),
+    "bierstube": ("bierstubes", "bierstuben", "bierstube"),
+    "bierstuben": ("bierstuben", "bierstuben", "bierstube"),
+    "bierstubes": ("bierstubes", "bierstubes", "bierstube"),
+    "bifolia": ("bifolia", "bifolia", "bifolium"),
+    "bifolium": ("bifolia", "bifolia", "bifolium"),
+    "bijou": ("bijoux", "bijoux", "bijou"),
+    "bijoux": ("bijoux", "bijoux", "bijou"),
+    "bilbo": ("bilboes", "bilboes", "bilbo"),
+    "bilboes": ("bilboes", "bilboes", "bilbo"),
+    "bimbo": ("bimbos", "bimbos", "bimbo"),
+    "bimbos": ("bimbos", "bimbos", "bimbo"),
+    "bingo": ("bingos", "bingos", "bingo"),
+    "bingos": ("bingos", "bingos", "bingo"),
+    "biro": ("biros", "biros", "biro"),
+    "biros": ("biros", "biros", "biro"),
+    "biscotti": ("biscotti", "biscotti", "biscotto"),
+    "biscotto": ("biscotti", "biscotti", "biscotto"),
+    "bison": ("bisons", "bison", "bison"),
+    "bisons": ("bisons", "bisons", "bison"),
+    "blastema": ("blastemata", "blastemata", "blastema"),
+    "blastemata": ("blastemata", "blastemata", "blastema"),
+    "blemya": ("blemyae", "blemyae", "blemya"),
+    "blemyae": ("blemyae", "blemyae", "blemya"),
+    "blin": ("blinis", "blini", "blin"),
+    "blini": ("blini", "blini", "blin"),
+    "blinis": ("blinis", "blinis", "blin"),
+    "blitz": ("blitzes", "blitzes", "blitz"),
+    "blitzes": ("blitzes", "blitzes", "blitz"),
+    "blouse": ("blouses", "blouses", "blouse"),
+    "blouses": ("blouses", "blouses", "blouse"),
+    "blue": ("blues", "blues", "blue"),
+    "blues": ("blues", "blues", "blue"),
+    "bodegon": ("bodegones", "bodegones", "bodegon"),
+    "bodegones": ("bodegones", "bodegones", "bodegon"),
+    "bolero": ("boleros", "boleros", "bolero"),
+    "boleros": ("boleros", "boleros", "bolero"),
+    "bolognese": ("bolognese", "bolognese", "bolognese"),
+    "bolus": ("boluses", "boluses", "bolus"),
+    "boluses": ("boluses", "boluses", "bolus"),
+    "bolzano": ("bolzanos", "bolzanos", "bolzano"),
+    "bolzanos": ("bolzanos", "bolzanos", "bolzano"),
+    "bon mot": ("bon mots", "bons mots", "bon mot"),
+    "bon mots": ("bon mots", "bon mots", "bon mot"),
+    "bon vivant": ("bon vivants", "bons vivants", "bon vivant"),
+    "bon vivants": ("bon vivants", "bon vivants", "bon vivant"),
+    "bona fides": ("bonis fidebus", "bonis fidebus", "bona fides"),
+    "bongo": ("bongos", "bongoes", "bongo"),
+    "bongoes": ("bongoes", "bongoes", "bongo"),
+    "bongos": ("bongos", "bongos", "bongo"),
+    "bonis fidebus": ("bonis fidebus", "bonis fidebus", "bona fides"),
+    "bons mots": ("bons mots", "bons mots", "bon mot"),
+    "bons vivants": ("bons vivants", "bons vivants", "bon vivant"),
+    "bordereau": ("bordereaux", "bordereaux", "bordereau"),
+    "bordereaux": ("bordereaux", "bordereaux", "bordereau"),
+    "borghese": ("borghese", "borghese", "borghese"),
+    "bostonese": ("bostonese", "bostonese", "bostonese"),
+    "boto": ("botos", "botos", "boto"),
+    "botos": ("botos", "botos", "boto"),
+    "bozzetti": ("bozzetti", "bozzetti", "bozzetto"),
+    "bozzetto": ("bozzetti", "bozzetti", "bozzetto"),
+    "braccia": ("braccia", "braccia", "braccio"),
+    "braccio": ("braccia", "braccia", "braccio"),
+    "brachiopod": ("brachiopods", "brachiopoda", "brachiopod"),
+    "brachiopoda": ("brachiopoda", "brachiopoda", "brachiopod"),
+    "brachiopods": ("brachiopods", "brachiopods", "brachiopod"),
+    "branchiopod": ("branchiopods", "branchiopoda", "branchiopod"),
+    "branchiopoda": ("branchiopoda", "branchiopoda", "branchiopod"),
+    "branchiopods": ("branchiopods", "branchiopods", "branchiopod"),
+    "bratwurst": ("bratwursts", "bratwurste", "bratwurst"),
+    "bratwurste": ("bratwurste", "bratwurste", "bratwurst"),
+    "bratwursts": ("bratwursts", "bratwursts", "bratwurst"),
+    "bravo": ("bravos", "bravoes", "bravo"),
+    "bravoes": ("bravoes", "bravoes", "bravo"),
+    "bravos": ("bravos", "bravos", "bravo"),
+    "break away": ("break aways", "breaks away", "break away"),
+    "break aways": ("break aways", "break aways", "break away"),
+    "break-away": ("break-aways", "breaks-away", "break-away"),
+    "break-aways": ("break-aways", "break-aways", "break-away"),
+    "breakaway": ("breakaways", "breaksaway", "breakaway"),
+    "breakaways": ("breakaways", "breakaways", "breakaway"),
+    "breaks away": ("breaks away", "breaks away", "break away"),
+    "breaks-away": ("breaks-away", "breaks-away", "break-away"),
+    "breaksaway": ("breaksaway", "breaksaway", "breakaway"),
+    "bream": ("bream", "bream", "bream"),
+    "breech": ("breeches", "breeches", "breech"),
+    "breeches": ("breeches", "breeches", "breech"),
+    "bregma": ("bregmata", "bregmata", "bregma"),
+    "bregmata": ("bregmata", "bregmata", "bregma"),
+    "brethren": ("brethren", "brethren", "brother"),
+    "brethren german": ("brethren german", "brethren german", "brother german"),
+    "brethren-german": ("brethren-german", "brethren-german", "brother-german"),
+    "brigadier general": ("brigadier generals", "brigadier generals", "brigadier general"),
+    "brigadier generals": ("brigadier generals", "brigadier generals", "brigadier general"),
+    "britches": ("britches", "britches", "britches"),
+    "bronchi": ("bronchi", "bronchi", "bronchus"),
+    "bronchitis": ("bronchitises", "bronchitises", "bronchitis"),
+    "bronchitises": ("bronchitises", "bronchitises", "bronchitis"),
+    "bronchus": ("bronchi", "bronchi", "bronchus"),
+    "brother": ("brothers", "brethren", "brother"),
+    "brother german": ("brothers german", "brethren german", "brother german"),
+    "brother-german": ("brothers-german", "brethren-german", "brother-german"),
+    "brothers": ("brothers", "brothers", "brother"),
+    "brothers german": ("brothers german", "brothers german", "brother german"),
+    "brothers-german": ("brothers-german", "brothers-german", "brother-german"),
+    "bruschetta": ("bruschette", "bruschette", "bruschetta"),
+    "bruschette": ("bruschette", "bruschette", "bruschetta"),
+    "bubo": ("buboes", "buboes", "bubo"),
+    "buboes": ("buboes", "buboes", "bubo"),
+    "buffalo": ("buffalos", "buffalo", "buffalo"),
+    "buffalos": ("buffalos", "buffalos", "buffalo"),
+    "buginese": ("buginese", "buginese", "buginese"),
+    "bulimi": ("bulimi", "bulimi", "bulimus"),
+    "bulimus": ("bulimi", "bulimi", "bulimus"),
+    "bulla": ("bullae", "bullae", "bulla"),
+    "bullae": ("bullae", "bullae", "bulla"),
+    "bureau": ("bureaus", "bureaux", "bureau"),
+    "bureaus": ("bureaus", "bureaus", "bureau"),
+    "bureaux": ("bureaux", "bureaux", "bureau"),
+    "burman": ("burmans", "burmans", "burman"),
+    "burmans": ("burmans", "burmans", "burman"),
+    "burmese": ("burmese", "burmese", "burmese"),
+    "burro": ("burros", "burros", "burro"),
+    "burros": ("burros", "burros", "burro"),
+    "bursa": ("bursae", "bursae", "bursa"),
+    "bursae": ("bursae", "bursae", "bursa"),
+    "bursch": ("burschen", "burschen", "bursch"),
+    "burschen": ("burschen", "burschen", "bursch"),
+    "bursitis": ("bursitises", "bursitises", "bursitis"),
+    "bursitises": ("bursitises", "bursitises", "bursitis"),
+    "busto": ("bustos", "bustoes", "busto"),
+    "bustoes": ("bustoes", "bustoes", "busto"),
+    "bustos": ("bustos", "bustos", "busto"),
+    "buzz": ("buzzes", "buzzes", "buzz"),
+    "buzzes": ("buzzes", "buzzes", "buzz"),
+    "bylina": ("bylinas", "byliny", "bylina"),
+    "bylinas": ("bylinas", "bylinas", "bylina"),
+    "byliny": ("byliny", "byliny", "bylina"),
+    "cabaletta": ("cabalettas", "cabalette", "cabaletta"),
+    "cabalettas": ("cabalettas", "cabalettas", "cabaletta"),
+    "cabalette": ("cabalette", "cabalette", "cabaletta"),
+    "cacti": ("cacti", "cacti", "cactus"),
+    "cactus": ("cactuses", "cacti", "cactus"),
+    "cactuses": ("cactuses", "cactuses", "cactus"),
+    "caddis": ("caddises", "caddises", "caddis"),
+    "caddises": ("caddises", "caddises", "caddis"),
+    "caducei": ("caducei", "caducei", "caduceus"),
+    "caduceus": ("caducei", "caducei", "caduceus"),
+    "caeca": ("caeca", "caeca", "caecum"),
+    "caecum": ("caeca", "caeca", "caecum"),
+    "caffe macchiati": ("caffe macchiati", "caffe macchiati", "caffe macchiato"),
+    "caffe macchiato": ("caffe macchiatos", "caffe macchiati", "caffe macchiato"),
+    "caffe macchiatos": ("caffe macchiatos", "caffe macchiatos", "caffe macchiato"),
+    "caffe ristretti": ("caffe ristretti", "caffe ristretti", "caffe ristretto"),
+    "caffe ristretto": ("caffe ristrettos", "caffe ristretti", "caffe ristretto"),
+    "caffe ristrettos": ("caffe ristrettos", "caffe ristrettos", "caffe ristretto"),
+    "caiman": ("caimans", "caimans", "caiman"),
+    "caimans": ("caimans", "caimans", "caiman"),
+    "cairo": ("cairos", "cairos", "cairo"),
+    "cairos": ("cairos", "cairos", "cairo"),
+    "calabrese": ("calabrese", "calabrese", "calabrese"),
+    "calamistra": ("calamistra", "calamistra", "calamistrum"),
+    "calamistrum": ("calamistra", "calamistra", "calamistrum"),
+    "calathi": ("calathi", "calathi", "calathus"),
+    "calathus": ("calathi", "calathi", "calathus"),
+    "calices": ("calices", "calices", "calix"),
+    "calix": ("calices", "calices", "calix"),
+    "callus": ("calluses", "calluses", "callus"),
+    "calluses": ("calluses", "calluses", "callus"),
+    "calypso": ("calypsos", "calypsos", "calypso"),
+    "calypsos": ("calypsos", "calypsos", "calypso"),
+    "calzone": ("calzones", "calzoni", "calzone"),
+    "calzones": ("calzones", "calzones", "calzone"),
+    "calzoni": ("calzoni", "calzoni", "calzone"),
+    "camaldolese": ("camaldolese", "camaldolese", "camaldolese"),
+    "camera obscura": ("camera obscuras", "camerae obscurae", "camera obscura"),
+    "camera obscuras": ("camera obscuras", "camera obscuras", "camera obscura"),
+    "camerae obscurae": ("camerae obscurae", "camerae obscurae", "camera obscura"),
+    "canaliculi": ("canaliculi", "canaliculi", "canaliculus"),
+    "canaliculus": ("canaliculi", "canaliculi", "canaliculus"),
+    "candelabra": ("candelabra", "candelabra", "candelabrum"),
+    "candelabrum": ("candelabra", "candelabra", "candelabrum"),
+    "cannabis": ("cannabises", "cannabises", "cannabis"),
+    "cannabises": ("cannabises", "cannabises", "cannabis"),
+    "canthari": ("canthari", "canthari", "cantharus"),
+    "cantharus": ("canthari", "canthari", "cantharus"),
+    "canto": ("cantos", "cantos", "canto"),
+    "cantonese": ("cantonese", "cantonese", "cantonese"),
+    "cantos": ("cantos", "cantos", "canto"),
+    "cantus": ("cantuses", "cantus", "cantus"),
+    "cantuses": ("cantuses", "cantuses", "cantus"),
+    "canvas": ("canvases", "canvases", "canvas"),
+    "canvases": ("canvases", "canvases", "canvas"),
+    "canzonetta": ("canzonettas", "canzonette", "canzonetta"),
+    "canzonettas": ("canzonettas", "canzonettas", "canzonetta"),
+    "canzonette": ("canzonette", "canzonette", "canzonetta"),
+    "capataces": ("capataces", "capataces", "capataz"),
+    "capataz": ("capataces", "capataces", "capataz"),
+    "capi": ("capi", "capi", "capo"),
+    "capo": ("capos", "capi", "capo"),
+    "capos": ("capos", "capos", "capo"),
+    "cappuccino": ("cappuccinos", "cappuccinos", "cappuccino"),
+    "cappuccinos": ("cappuccinos", "cappuccinos", "cappuccino"),
+    "carabiniere": ("carabinieri", "carabinieri", "carabiniere"),
+    "carabinieri": ("carabinieri", "carabinieri", "carabiniere"),
+    "carcinoma": ("carcinomas", "carcinomata", "carcinoma"),
+    "carcinomas": ("carcinomas", "carcinomas", "carcinoma"),
+    "carcinomata": ("carcinomata", "carcinomata", "carcinoma"),
+    "cardines": ("cardines", "cardines", "cardo"),
+    "cardo": ("cardines", "cardines", "cardo"),
+    "cardophagi": ("cardophagi", "cardophagi", "cardophagus"),
+    "cardophagus": ("cardophagi", "cardophagi", "cardophagus"),
+    "carex": ("carices", "carices", "carex"),
+    "cargador": ("cargadores", "cargadores", "cargador"),
+    "cargadores": ("cargadores", "cargadores", "cargador"),
+    "caribou": ("caribous", "caribou", "caribou"),
+    "caribous": ("caribous", "caribous", "caribou"),
+    "carices": ("carices", "carices", "carex"),
+    "carlylese": ("carlylese", "carlylese", "carlylese"),
+    "carmen": ("carmens", "carmina", "carmen"),
+    "carmens": ("carmens", "carmens", "carmen"),
+    "carmina": ("carmina", "carmina", "carmen"),
+    "carp": ("carp", "carp", "carp"),
+    "carte de visite": ("cartes de visite", "cartes de visite", "carte de visite"),
+    "carte-de-visite": ("cartes-de-visite", "cartes-de-visite", "carte-de-visite"),
+    "cartes de visite": ("cartes de visite", "cartes de visite", "carte de visite"),
+    "cartes-de-visite": ("cartes-de-visite", "cartes-de-visite", "carte-de-visite"),
+    "caryatid": ("caryatids", "caryatides", "caryatid"),
+    "caryatides": ("caryatides", "caryatides", "caryatid"),
+    "caryatids": ("caryatids", "caryatids", "caryatid"),
+    "caryopsides": ("caryopsides", "caryopsides", "caryopsis"),
+    "caryopsis": ("caryopsides", "caryopsides", "caryopsis"),
+    "casino": ("casinos", "casinos", "casino"),
+    "casinos": ("casinos", "casinos", "casino"),
+    "cassinese": ("cassinese", "cassinese", "cassinese"),
+    "cassone": ("cassones", "cassoni", "cassone"),
+    "cassones": ("cassones", "cassones", "cassone"),
+    "cassoni": ("cassoni", "cassoni", "cassone"),
+    "castra": ("castra", "castra", "castrum"),
+    "castrati": ("castrati", "castrati", "castrato"),
+    "castrato": ("castrati", "castrati", "castrato"),
+    "castrum": ("castra", "castra", "castrum"),
+    "casus belli": ("casus belli", "casus belli", "casus belli"),
+    "cathisma": ("cathismata", "cathismata", "cathisma"),
+    "cathismata": ("cathismata", "cathismata", "cathisma"),
+    "caudex": ("caudices", "caudices", "caudex"),
+    "caudices": ("caudices", "caudices", "caudex"),
+    "caules": ("caules", "caules", "caulis"),
+    "caulis": ("caules", "caules", "caulis"),
+    "cavea": ("caveae", "caveae", "cavea"),
+    "caveae": ("caveae", "caveae", "cavea"),
+    "cayman": ("caymans", "caymans", "cayman"),
+    "caymans": ("caymans", "caymans", "cayman"),
+    "cecidia": ("cecidia", "cecidia", "cecidium"),
+    "cecidium": ("cecidia", "cecidia", "cecidium"),
+    "celanese": ("celanese", "celanese", "celanese"),
+    "celia": ("celiae", "celiae", "celia"),
+    "celiae": ("celiae", "celiae", "celia"),
+    "cello": ("cellos", "cellos", "cello"),
+    "cellos": ("cellos", "cellos", "cello"),
+    "cementoma": ("cementomata", "cementomata", "cementoma"),
+    "cementomata": ("cementomata", "cementomata", "cementoma"),
+    "centesimi": ("centesimi", "centesimi", "centesimo"),
+    "centesimo": ("centesimi", "centesimi", "centesimo"),
+    "centumvir": ("centumviri", "centumviri", "centumvir"),
+    "centumviri": ("centumviri", "centumviri", "centumvir"),
+    "cerci": ("cerci", "cerci", "cercus"),
+    "cercus": ("cerci", "cerci", "cercus"),
+    "ceriman": ("cerimans", "cerimans", "ceriman"),
+    "cerimans": ("cerimans", "cerimans", "ceriman"),
+    "ceylonese": ("ceylonese", "ceylonese", "ceylonese"),
+    "chaeta": ("chaetae", "chaetae", "chaeta"),
+    "chaetae": ("chaetae", "chaetae", "chaeta"),
+    "chaos": ("chaoses", "chaoses", "chaos"),
+    "chaoses": ("chaoses", "chaoses", "chaos"),
+    "chapeau": ("chapeaus", "chapeaux", "chapeau"),
+    "chapeaus": ("chapeaus", "chapeaus", "chapeau"),
+    "chapeaux": ("chapeaux", "chapeaux", "chapeau"),
+    "chapplies": ("chapplies", "chapplies", "chapplis"),
+    "chapplis": ("chapplies", "chapplies", "chapplis"),
+    "charisma": ("charismas", "charismata", "charisma"),
+    "charismas": ("charismas", "charismas", "charisma"),
+    "charismata": ("charismata", "charismata", "charisma"),
+    "chassis": ("chassis", "chassis", "chassis"),
+    "chateau": ("chateaus", "chateaux", "chateau"),
+    "chateaus": ("chateaus", "chateaus", "chateau"),
+    "chateaux": ("chateaux", "chateaux", "chateau"),
+    "cherub": ("cherubs", "cherubim", "cherub"),
+    "cherubim": ("cherubim", "cherubim", "cherub"),
+    "cherubs": ("cherubs", "cherubs", "cherub"),
+    "chervonetz": ("chervontzi", "chervontzi", "chervonetz"),
+    "chervontzi": ("chervontzi", "chervontzi", "chervonetz"),
+    "cheval": ("chevaux", "chevaux", "cheval"),
+    "cheval de bataille": ("chevaux de bataille", "chevaux de bataille", "cheval de bataille"),
+    "cheval-de-bataille": ("chevaux-de-bataille", "chevaux-de-bataille", "cheval-de-bataille"),
+    "chevaux": ("chevaux", "chevaux", "cheval"),
+    "chevaux de bataille": ("chevaux de bataille", "chevaux de bataille", "cheval de bataille"),
+    "chevaux-de-bataille": ("chevaux-de-bataille", "chevaux-de-bataille", "cheval-de-bataille"),
+    "chicago": ("chicagos", "chicagos", "chicago"),
+    "chicagos": ("chicagos", "chicagos", "chicago"),
+    "child": ("children", "children", "child"),
+    "children": ("children", "children", "child"),
+    "chimango": ("chimangos", "chimangos", "chimango"),
+    "chimangos": ("chimangos", "chimangos", "chimango"),
+    "chinese": ("chinese", "chinese", "chinese"),
+    "chintz": ("chintzes", "chintzes", "chintz"),
+    "chintzes": ("chintzes", "chintzes", "chintz"),
+    "chitarrone": ("chitarroni", "chitarroni", "chitarrone"),
+    "chitarroni": ("chitarroni", "chitarroni", "chitarrone"),
+    "chlamydia": ("chlamydias", "chlamydiae", "chlamydia"),
+    "chlamydiae": ("chlamydiae", "chlamydiae", "chlamydia"),
+    "chlamydias": ("chlamydias", "chlamydias", "chlamydia"),
+    "choana": ("choanae", "choanae", "choana"),
+    "choanae": ("choanae", "choanae", "choana"),
+    "chorda": ("chordae", "chordae", "chorda"),
+    "chordae": ("chordae", "chordae", "chorda"),
+    "chorus": ("choruses", "choruses", "chorus"),
+    "choruses": ("choruses", "choruses", "chorus"),
+    "chou": ("choux", "choux", "chou"),
+    "choux": ("choux", "choux", "chou"),
+    "chromidia": ("chromidia", "chromidia", "chromidium"),
+    "chromidium": ("chromidia", "chromidia", "chromidium"),
+    "chromonema": ("chromonemata", "chromonemata", "chromonema"),
+    "chromonemata": ("chromonemata", "chromonemata", "chromonema"),
+    "chrysalides": ("chrysalides", "chrysalides", "chrysalis"),
+    "chrysalis": ("chrysalises", "chrysalides", "chrysalis"),
+    "chrysalises": ("chrysalises", "chrysalises", "chrysalis"),
+    "cicatrices": ("cicatrices", "cicatrices", "cicatrix"),
+    "cicatrix": ("cicatrices", "cicatrices", "cicatrix"),
+    "cilantro": ("cilantros", "cilantros", "cilantro"),
+    "cilantros": ("cilantros", "cilantros", "cilantro"),
+    "cimex": ("cimices", "cimices", "cimex"),
+    "cimices": ("cimices", "cimices", "cimex"),
+    "cinclides": ("cinclides", "cinclides", "cinclis"),
+    "cinclis": ("cinclides", "cinclides", "cinclis"),
+    "cistophorori": ("cistophorori", "cistophorori", "cistophorus"),
+    "cistophorus": ("cistophorori", "cistophorori", "cistophorus"),
+    "cladi": ("cladi", "cladi", "cladus"),
+    "cladus": ("cladi", "cladi", "cladus"),
+    "claustra": ("claustra", "claustra", "claustrum"),
+    "claustrum": ("claustra", "claustra", "claustrum"),
+    "clausula": ("clausulae", "clausulae", "clausula"),
+    "clausulae": ("clausulae", "clausulae", "clausula"),
+    "clavula": ("clavulae", "clavulae", "clavula"),
+    "clavulae": ("clavulae", "clavulae", "clavula"),
+    "cleithra": ("cleithra", "cleithra", "cleithrum"),
+    "cleithrum": ("cleithra", "cleithra", "cleithrum"),
+    "clepsydra": ("clepsydras", "clepsydrae", "clepsydra"),
+    "clepsydrae": ("clepsydrae", "clepsydrae", "clepsydra"),
+    "clepsydras": ("clepsydras", "clepsydras", "clepsydra"),
+    "clipper": ("clippers", "clippers", "clipper"),
+    "clippers": ("clippers", "clippers", "clippers"),
+    "clitorides": ("clitorides", "clitorides", "clitoris"),
+    "clitoris": ("clitorises", "clitorides", "clitoris"),
+    "clitorises": ("clitorises", "clitorises", "clitoris"),
+    "clostridia": ("clostridia", "clostridia", "clostridium"),
+    "clostridium": ("clostridia", "clostridia", "clostridium"),
+    "co": ("coes", "coes", "co"),
+    "coagula": ("coagula", "coagula", "coagulum"),
+    "coagulum": ("coagula", "coagula", "coagulum"),
+    "coccidia": ("coccidia", "coccidia", "coccidium"),
+    "coccidium": ("coccidia", "coccidia", "coccidium"),
+    "cochito": ("cochitos", "cochitos", "cochito"),
+    "cochitos": ("cochitos", "cochitos", "cochito"),
+    "coco": ("cocos", "cocos", "coco"),
+    "cocos": ("cocos", "cocos", "coco"),
+    "cod": ("cod", "cod", "cod"),
+    "codex": ("codices", "codices", "codex"),
+    "codices": ("codices", "codices", "codex"),
+    "coe": ("coes", "coes", "coe"),
+    "coelia": ("coeliae", "coeliae", "coelia"),
+    "coeliae": ("coeliae", "coeliae", "coelia"),
+    "coes": ("coes", "coes", "co"),
+    "cognoscente": ("cognoscenti", "cognoscenti", "cognoscente"),
+    "cognoscenti": ("cognoscenti", "cognoscenti", "cognoscente"),
+    "coitus": ("coituses", "coitus", "coitus"),
+    "coituses": ("coituses", "coituses", "coitus"),
+    "collegia": ("collegia", "collegia", "collegium"),
+    "collegia musica": ("collegia musica", "collegia musica", "collegium musicum"),
+    "collegium": ("collegia", "collegia", "collegium"),
+    "collegium musicum": ("collegia musica", "collegia musica", "collegium musicum"),
+    "colombo": ("colombos", "colombos", "colombo"),
+    "colombos": ("colombos", "colombos", "colombo"),
+    "colorado": ("colorados", "colorados", "colorado"),
+    "colorados": ("colorados", "colorados", "colorado"),
+    "columbaria": ("columbaria", "columbaria", "columbarium"),
+    "columbarium": ("columbaria", "columbaria", "columbarium"),
+    "columna": ("columnae", "columnae", "columna"),
+    "columnae": ("columnae", "columnae", "columna"),
+    "coma": ("comae", "comae", "coma"),
+    "comae": ("comae", "comae", "coma"),
+    "comatula": ("comatulae", "comatulae", "comatula"),
+    "comatulae": ("comatulae", "comatulae", "comatula"),
+    "commando": ("commandos", "commandos", "commando"),
+    "commandos": ("commandos", "commandos", "commando"),
+    "compendia": ("compendia", "compendia", "compendium"),
+    "compendium": ("compendiums", "compendia", "compendium"),
+    "compendiums": ("compendiums", "compendiums", "compendium"),
+    "competent": ("competentes", "competentes", "competent"),
+    "competentes": ("competentes", "competentes", "competent"),
+    "concerti grossi": ("concerti grossi", "concerti grossi", "concerto grosso"),
+    "concertino": ("concertinos", "concertinos", "concertino"),
+    "concertinos": ("concertinos", "concertinos", "concertino"),
+    "concerto grosso": ("concerti grossi", "concerti grossi", "concerto grosso"),
+    "concetti": ("concetti", "concetti", "concetto"),
+    "concetto": ("concetti", "concetti", "concetto"),
+    "condo": ("condos", "condos", "condo"),
+    "condos": ("condos", "condos", "condo"),
+    "condottiere": ("condottieri", "condottieri", "condottiere"),
+    "condottieri": ("condottieri", "condottieri", "condottiere"),
+    "conducti": ("conducti", "conducti", "conductus"),
+    "conductus": ("conducti", "conducti", "conductus"),
+    "coney": ("coneys", "conies", "coney"),
+    "coneys": ("coneys", "coneys", "coney"),
+    "conferva": ("confervae", "confervae", "conferva"),
+    "confervae": ("confervae", "confervae", "conferva"),
+    "confluvia": ("confluvia", "confluvia", "confluvium"),
+    "confluvium": ("confluvia", "confluvia", "confluvium"),
+    "congii": ("congii", "congii", "congius"),
+    "congius": ("congii", "congii", "congius"),
+    "congoese": ("congoese", "congoese", "congoese"),
+    "congolese": ("congolese", "congolese", "congolese"),
+    "conidia": ("conidia", "conidia", "conidium"),
+    "conidium": ("conidia", "conidia", "conidium"),
+    "conies": ("conies", "conies", "coney"),
+    "conoscente": ("conoscenti", "conoscenti", "conoscente"),
+    "conoscenti": ("conoscenti", "conoscenti", "conoscente"),
+    "consortia": ("consortia", "consortia", "consortium"),
+    "consortium": ("consortiums", "consortia", "consortium"),
+    "consortiums": ("consortiums", "consortiums", "consortium"),
+    "contadina": ("contadine", "contadine", "contadina"),
+    "contadine": ("contadine", "contadine", "contadina"),
+    "contadini": ("contadini", "contadini", "contadino"),
+    "contadino": ("contadini", "contadini", "contadino"),
+    "contagia": ("contagia", "contagia", "contagium"),
+    "contagium": ("contagia", "contagia", "contagium"),
+    "contango": ("contangos", "contangos", "contango"),
+    "contangos": ("contangos", "contangos", "contango"),
+    "contrafacta": ("contrafacta", "contrafacta", "contrafactum"),
+    "contrafactum": ("contrafacta", "contrafacta", "contrafactum"),
+    "contralti": ("contralti", "contralti", "contralto"),
+    "contralto": ("contraltos", "contralti", "contralto"),
+    "contraltos": ("contraltos", "contraltos", "contralto"),
+    "contretemps": ("contretemps", "contretemps", "contretemps"),
+    "conversazione": ("conversaziones", "conversazioni", "conversazione"),
+    "conversaziones": ("conversaziones", "conversaziones", "conversazione"),
+    "conversazioni": ("conversazioni", "conversazioni", "conversazione"),
+    "convolvuli": ("convolvuli", "convolvuli", "convolvulus"),
+    "convolvulus": ("convolvuluses", "convolvuli", "convolvulus"),
+    "convolvuluses": ("convolvuluses", "convolvuluses", "convolvulus"),
+    "cony": ("conys", "conies", "cony"),
+    "conys": ("conys", "conys", "cony"),
+    "corgi": ("corgis", "corgwn", "corgi"),
+    "corgis": ("corgis", "corgis", "corgi"),
+    "corgwn": ("corgwn", "corgwn", "corgi"),
+    "corgy": ("corgys", "corgwn", "corgy"),
+    "corgys": ("corgys", "corgys", "corgy"),
+    "cornetti": ("cornetti", "cornetti", "cornetto"),
+    "cornetto": ("cornetti", "cornetti", "cornetto"),
+    "corni": ("corni", "corni", "corno"),
+    "corno": ("corni", "corni", "corno"),
+    "cornu": ("cornua", "cornua", "cornu"),
+    "cornua": ("cornua", "cornua", "cornu"),
+    "corona": ("coronas", "coronae", "corona"),
+    "coronae": ("coronae", "coronae", "corona"),
+    "coronas": ("coronas", "coronas", "corona"),
+    "corpora": ("corpora", "corpora", "corpus"),
+    "corpora vilia": ("corpora vilia", "corpora vilia", "corpus vile"),
+    "corps": ("corps", "corps", "corps"),
+    "corpus": ("corpuses", "corpora", "corpus"),
+    "corpus vile": ("corpora vilia", "corpora vilia", "corpus vile"),
+    "corpuscula": ("corpuscula", "corpuscula", "corpusculum"),
+    "corpusculum": ("corpuscula", "corpuscula", "corpusculum"),
+    "corpuses": ("corpuses", "corpuses", "corpus"),
+    "corrigenda": ("corrigenda", "corrigenda", "corrigendum"),
+    "corrigendum": ("corrigenda", "corrigenda", "corrigendum"),
+    "cortex": ("cortexes", "cortices", "cortex"),
+    "cortexes": ("cortexes", "cortexes", "cortex"),
+    "cortices": ("cortices", "cortices", "cortex"),
+    "cosmos": ("cosmoses", "cosmoses", "cosmos"),
+    "cosmoses": ("cosmoses", "cosmoses", "cosmos"),
+    "costa": ("costae", "costae", "costa"),
+    "costae": ("costae", "costae", "costa"),
+    "coup d'etat": ("coups d'etat", "coups d'etat", "coup d'etat"),
+    "coups d'etat": ("coups d'etat", "coups d'etat", "coup d'etat"),
+    "court martial": ("court martials", "courts martial", "court martial"),
+    "court martials": ("court martials", "court martials", "court martial"),
+    "court-martial": ("court-martials", "courts-martial", "court-martial"),
+    "court-martials": ("court-martials", "court-martials", "court-martial"),
+    "courts martial": ("courts martial", "courts martial", "court martial"),
+    "courts-martial": ("courts-martial", "courts-martial", "court-martial"),
+    "cow": ("cows", "kine", "cow"),
+    "cows": ("cows", "cows", "cow"),
+    "coxendices": ("coxendices", "coxendices", "coxendix"),
+    "coxendix": ("coxendices", "coxendices", "coxendix"),
+    "coz": ("cozes", "cozes", "coz"),
+    "cozes": ("cozes", "cozes", "coz"),
+    "craft": ("craft", "craft", "craft"),
+    "crafts child": ("crafts childer", "crafts childer", "crafts child"),
+    "crafts childer": ("crafts childer", "crafts childer", "crafts child"),
+    "crafts-child": ("crafts-childer", "crafts-childer", "crafts-child"),
+    "crafts-childer": ("crafts-childer", "crafts-childer", "crafts-child"),
+    "crania": ("crania", "crania", "cranium"),
+    "cranium": ("craniums", "crania", "cranium"),
+    "craniums": ("craniums", "craniums", "cranium"),
+    "craspeda": ("craspeda", "craspeda", "craspedum"),
+    "craspedon": ("craspeda", "craspeda", "craspedon"),
+    "craspedum": ("craspeda", "craspeda", "craspedum"),
+    "crazia": ("crazie", "crazie", "crazia"),
+    "crazie": ("crazie", "crazie", "crazia"),
+    "credo": ("credos", "credos", "credo"),
+    "credos": ("credos", "credos", "credo"),
+    "cremaster": ("cremasters", "cremasteres", "cremaster"),
+    "cremasteres": ("cremasteres", "cremasteres", "cremaster"),
+    "cremasters": ("cremasters", "cremasters", "cremaster"),
+    "crescendo": ("crescendos", "crescendos", "crescendo"),
+    "crescendos": ("crescendos", "crescendos", "crescendo"),
+    "cri de coeur": ("cris de coeur", "cris de coeur", "cri de coeur"),
+    "cris de coeur": ("cris de coeur", "cris de coeur", "cri de coeur"),
+    "crista": ("cristae", "cristae", "crista"),
+    "cristae": ("cristae", "cristae", "crista"),
+    "criteria": ("criteria", "criteria", "criterion"),
+    "criterion": ("criteria", "criteria", "criterion"),
+    "crowfoot": ("crowfoots", "crowfoots", "crowfoot"),
+    "crowfoots": ("crowfoots", "crowfoots", "crowfoot"),
+    "crura": ("crura", "crura", "crus"),
+    "crus": ("crura", "crura", "crus"),
+    "crusta": ("crustae", "crustae", "crusta"),
+    "crustae": ("crustae", "crustae", "crusta"),
+    "cubicula": ("cubicula", "cubicula", "cubiculum"),
+    "cubiculum": ("cubicula", "cubicula", "cubiculum"),
+    "cul de four": ("culs de four", "culs de four", "cul de four"),
+    "cul de lampe": ("culs de lampe", "culs de lampe", "cul de lampe"),
+    "cul de sac": ("culs de sac", "culs de sac", "cul de sac"),
+    "cul-de-four": ("culs-de-four", "culs-de-four", "cul-de-four"),
+    "cul-de-lampe": ("culs-de-lampe", "culs-de-lampe", "cul-de-lampe"),
+    "cul-de-sac": ("culs-de-sac", "culs-de-sac", "cul-de-sac"),
+    "culs de four": ("culs de four", "culs de four", "cul de four"),
+    "culs de lampe": ("culs de lampe", "culs de lampe", "cul de lampe"),
+    "culs de sac": ("culs de sac", "culs de sac", "cul de sac"),
+    "culs-de-four": ("culs-de-four", "culs-de-four", "cul-de-four"),
+    "culs-de-lampe": ("culs-de-lampe", "culs-de-lampe", "cul-de-lampe"),
+    "culs-de-sac": ("culs-de-sac", "culs-de-sac", "cul-de-sac"),
+    "cultelli": ("cultelli", "cultelli", "cultellus"),
+    "cultellus": ("cultelli", "cultelli", "cultellus"),
+    "cumuli": ("cumuli", "cumuli", "cumulus"),
+    "cumulus": ("cumuli", "cumuli", "cumulus"),
+    "cuniculi": ("cuniculi", "cuniculi", "cuniculus"),
+    "cuniculus": ("cuniculi", "cuniculi", "cuniculus"),
+    "curiosi": ("curiosi", "curiosi", "curioso"),
+    "curioso": ("curiosos", "curiosi", "curioso"),
+    "curiosos": ("curiosos", "curiosos", "curioso"),
+    "curricula": ("curricula", "curricula", "curriculum"),
+    "curricula vitae": ("curricula vitae", "curricula vitae", "curriculum vitae"),
+    "curriculum": ("curriculums", "curricula", "curriculum"),
+    "curriculum vitae": ("curricula vitae", "curricula vitae", "curriculum vitae"),
+    "curriculums": ("curriculums", "curriculums", "curriculum"),
+    "cuspides": ("cuspides", "cuspides", "cuspis"),
+    "cuspis": ("cuspides", "cuspides", "cuspis"),
+    "cyano": ("cyanos", "cyanos", "cyano"),
+    "cyanos": ("cyanos", "cyanos", "cyano"),
+    "cyathi": ("cyathi", "cyathi", "cyathus"),
+    "cyathus": ("cyathi", "cyathi", "cyathus"),
+    "cyclopes": ("cyclopes", "cyclopes", "cyclops"),
+    "cyclops": ("cyclopses", "cyclopes", "cyclops"),
+    "cyclopses": ("cyclopses", "cyclopses", "cyclops"),
+    "cynocephali": ("cynocephali", "cynocephali", "cynocephalus"),
+    "cynocephalus": ("cynocephali", "cynocephali", "cynocephalus"),
+    "cyphella": ("cyphellae", "cyphellae", "cyphella"),
+    "cyphellae": ("cyphellae", "cyphellae", "cyphella"),
+    "cysticerci": ("cysticerci", "cysticerci", "cysticercus"),
+    "cysticercus": ("cysticerci", "cysticerci", "cysticercus"),
+    "cystidia": ("cystidia", "cystidia", "cystidium"),
+    "cystidium": ("cystidia", "cystidia", "cystidium"),
+    "cystoma": ("cystomata", "cystomata", "cystoma"),
+    "cystomata": ("cystomata", "cystomata", "cystoma"),
+    "czech": ("czechs", "czechs", "czech"),
+    "czechs": ("czechs", "czechs", "czech"),
+    "dace": ("daces", "dace", "dace"),
+    "daces": ("daces", "daces", "dace"),
+    "dais": ("daises", "daises", "dais"),
+    "daises": ("daises", "daises", "dais"),
+    "data": ("data", "data", "datum"),
+    "datum": ("data", "data", "datum"),
+    "debris": ("debris", "debris", "debris"),
+    "decennia": ("decennia", "decennia", "decennium"),
+    "decennium": ("decennia", "decennia", "decennium"),
+    "deer": ("deer", "deer", "deer"),
+    "deliria": ("deliria", "deliria", "delirium"),
+    "delirium": ("deliriums", "deliria", "delirium"),
+    "deliriums": ("deliriums", "deliriums", "delirium"),
+    "demo": ("demos", "demos", "demo"),
+    "demos": ("demos", "demos", "demo"),
+    "denarii": ("denarii", "denarii", "denarius"),
+    "denarius": ("denarii", "denarii", "denarius"),
+    "denkmal": ("denkmaler", "denkmaler", "denkmal"),
+    "denkmaler": ("denkmaler", "denkmaler", "denkmal"),
+    "denotata": ("denotata", "denotata", "denotatum"),
+    "denotatum": ("denotata", "denotata", "denotatum"),
+    "dentalia": ("dentalia", "dentalia", "dentalium"),
+    "dentalium": ("dentalia", "dentalia", "dentalium"),
+    "deposita": ("deposita", "deposita", "depositum"),
+    "depositum": ("depositums", "deposita", "depositum"),
+    "depositums": ("depositums", "depositums", "depositum"),
+    "descripta": ("descripta", "descripta", "descriptum"),
+    "descriptum": ("descripta", "descripta", "descriptum"),
+    "desiderata": ("desiderata", "desiderata", "desideratum"),
+    "desideratum": ("desiderata", "desiderata", "desideratum"),
+    "designata": ("designata", "designata", "designatum"),
+    "designatum": ("designata", "designata", "designatum"),
+    "desma": ("desmas", "desmata", "desma"),
+    "desman": ("desmans", "desmans", "desman"),
+    "desmans": ("desmans", "desmans", "desman"),
+    "desmas": ("desmas", "desmas", "desma"),
+    "desmata": ("desmata", "desmata", "desma"),
+    "devoti": ("devoti", "devoti", "devoto"),
+    "devoto": ("devotos", "devoti", "devoto"),
+    "devotos": ("devotos", "devotos", "devoto"),
+    "diabetes": ("diabetes", "diabetes", "diabetes"),
+    "diastema": ("diastemata", "diastemata", "diastema"),
+    "diastemata": ("diastemata", "diastemata", "diastema"),
+    "dice": ("dice", "dice", "die"),
+    "dichasia": ("dichasia", "dichasia", "dichasium"),
+    "dichasium": ("dichasia", "dichasia", "dichasium"),
+    "dicta": ("dicta", "dicta", "dictum"),
+    "dictum": ("dictums", "dicta", "dictum"),
+    "dictums": ("dictums", "dictums", "dictum"),
+    "didymes": ("didymes", "didymes", "didymis"),
+    "didymis": ("didymes", "didymes", "didymis"),
+    "die": ("dice", "dies", "die"),
+    "dies": ("dies", "dies", "die"),
+    "differentia": ("differentiae", "differentiae", "differentia"),
+    "differentiae": ("differentiae", "differentiae", "differentia"),
+    "digitalis": ("digitalises", "digitalises", "digitalis"),
+    "digitalises": ("digitalises", "digitalises", "digitalis"),
+    "dilettante": ("dilettantes", "dilettanti", "dilettante"),
+    "dilettantes": ("dilettantes", "dilettantes", "dilettante"),
+    "dilettanti": ("dilettanti", "dilettanti", "dilettante"),
+    "diplococci": ("diplococci", "diplococci", "diplococcus"),
+    "diplococcus": ("diplococci", "diplococci", "diplococcus"),
+    "diploma": ("diplomas", "diplomata", "diploma"),
+    "diplomas": ("diplomas", "diplomas", "diploma"),
+    "diplomata": ("diplomata", "diplomata", "diploma"),
+    "diporpa": ("diporpae", "diporpae", "diporpa"),
+    "diporpae": ("diporpae", "diporpae", "diporpa"),
+    "dipsades": ("dipsades", "dipsades", "dipsas"),
+    "dipsas": ("dipsades", "dipsades", "dipsas"),
+    "directrices": ("directrices", "directrices", "directrix"),
+    "directrix": ("directrices", "directrices", "directrix"),
+    "ditto": ("dittos", "dittos", "ditto"),
+    "dittos": ("dittos", "dittos", "ditto"),
+    "diverticula": ("diverticula", "diverticula", "diverticulum"),
+    "diverticulum": ("diverticula", "diverticula", "diverticulum"),
+    "divertimenti": ("divertimenti", "divertimenti", "divertimento"),
+    "divertimento": ("divertimentos", "divertimenti", "divertimento"),
+    "divertimentos": ("divertimentos", "divertimentos", "divertimento"),
+    "djinn": ("djinns", "djinn", "djinn"),
+    "djinns": ("djinns", "djinns", "djinn"),
+    "do": ("does", "does", "do"),
+    "doe": ("does", "does", "doe"),
+    "does": ("does", "does", "doe"),
+    "dogma": ("dogmas", "dogmata", "dogma"),
+    "dogmas": ("dogmas", "dogmas", "dogma"),
+    "dogmata": ("dogmata", "dogmata", "dogma"),
+    "dolman": ("dolmans", "dolmans", "dolman"),
+    "dolmans": ("dolmans", "dolmans", "dolman"),
+    "dolphinaria": ("dolphinaria", "dolphinaria", "dolphinarium"),
+    "dolphinarium": ("dolphinariums", "dolphinaria", "dolphinarium"),
+    "dolphinariums": ("dolphinariums", "dolphinariums", "dolphinarium"),
+    "dongolese": ("dongolese", "dongolese", "dongolese"),
+    "draco": ("dracos", "dracos", "draco"),
+    "dracos": ("dracos", "dracos", "draco"),
+    "dragoman": ("dragomen", "dragomans", "dragoman"),
+    "dragomans": ("dragomans", "dragomans", "dragoman"),
+    "dragomen": ("dragomen", "dragomen", "dragoman"),
+    "drama": ("dramas", "dramas", "drama"),
+    "dramas": ("dramas", "dramas", "drama"),
+    "dreikanter": ("dreikanters", "dreikanter", "dreikanter"),
+    "dreikanters": ("dreikanters", "dreikanters", "dreikanter"),
+    "dumka": ("dumkas", "dumky", "dumka"),
+    "dumkas": ("dumkas", "dumkas", "dumka"),
+    "dumky": ("dumky", "dumky", "dumka"),
+    "duumvir": ("duumvirs", "duumviri", "duumvir"),
+    "duumviri": ("duumviri", "duumviri", "duumvir"),
+    "duumvirs": ("duumvirs", "duumvirs", "duumvir"),
+    "dynamo": ("dynamos", "dynamos", "dynamo"),
+    "dynamos": ("dynamos", "dynamos", "dynamo"),
+    "edema": ("edemas", "edemata", "edema"),
+    "edemas": ("edemas", "edemas", "edema"),
+    "edemata": ("edemata", "edemata", "edema"),
+    "editio princeps": ("editiones principes", "editiones principes", "editio princeps"),
+    "editiones principes": ("editiones principes", "editiones principes", "editio princeps"),
+    "efreet": ("efreets", "efreeti", "efreet"),
+    "efreeti": ("efreeti", "efreeti", "efreet"),
+    "efreets": ("efreets", "efreets", "efreet"),
+    "eland": ("elands", "eland", "eland"),
+    "elands": ("elands", "elands", "eland"),
+    "elf": ("elves", "elves", "elf"),
+    "elk": ("elks", "elk", "elk"),
+    "elks": ("elks", "elks", "elk"),
+    "ellipse": ("ellipses", "ellipses", "ellipse"),
+    "ellipses": ("ellipses", "ellipses", "ellipse"),
+    "ellipsis": ("ellipses", "ellipses", "ellipsis"),
+    "elves": ("elves", "elves", "elf"),
+    "emblema": ("emblememata", "emblememata", "emblema"),
+    "emblememata": ("emblememata", "emblememata", "emblema"),
+    "embryo": ("embryos", "embryos", "embryo"),
+    "embryoma": ("embryomata", "embryomata", "embryoma"),
+    "embryomata": ("embryomata", "embryomata", "embryoma"),
+    "embryos": ("embryos", "embryos", "embryo"),
+    "emporia": ("emporia", "emporia", "emporium"),
+    "emporium": ("emporiums", "emporia", "emporium"),
+    "emporiums": ("emporiums", "emporiums", "emporium"),
+    "enconia": ("enconia", "enconia", "enconium"),
+    "enconium": ("enconiums", "enconia", "enconium"),
+    "enconiums": ("enconiums", "enconiums", "enconium"),
+    "endothelioma": ("endotheliomata", "endotheliomata", "endothelioma"),
+    "endotheliomata": ("endotheliomata", "endotheliomata", "endothelioma"),
+    "enema": ("enemas", "enemata", "enema"),
+    "enemas": ("enemas", "enemas", "enema"),
+    "enemata": ("enemata", "enemata", "enema"),
+    "enigma": ("enigmas", "enigmata", "enigma"),
+    "enigmas": ("enigmas", "enigmas", "enigma"),
+    "enigmata": ("enigmata", "enigmata", "enigma"),
+    "ens rationis": ("entia rationis", "entia rationis", "ens rationis"),
+    "ens reale": ("entia realia", "entia realia", "ens reale"),
+    "entente cordiale": ("ententes cordiales", "ententes cordiales", "entente cordiale"),
+    "ententes cordiales": ("ententes cordiales", "ententes cordiales", "entente cordiale"),
+    "entera": ("entera", "entera", "enteron"),
+    "enteron": ("entera", "entera", "enteron"),
+    "entia rationis": ("entia rationis", "entia rationis", "ens rationis"),
+    "entia realia": ("entia realia", "entia realia", "ens reale"),
+    "entrochi": ("entrochi", "entrochi", "entrochus"),
+    "entrochus": ("entrochi", "entrochi", "entrochus"),
+    "ephelides": ("ephelides", "ephelides", "ephelis"),
+    "ephelis": ("ephelides", "ephelides", "ephelis"),
+    "ephemera": ("ephemeras", "ephemerae", "ephemera"),
+    "ephemerae": ("ephemerae", "ephemerae", "ephemera"),
+    "ephemeras": ("ephemeras", "ephemeras", "ephemera"),
+    "ephemerides": ("ephemerides", "ephemerides", "ephemeris"),
+    "ephemeris": ("ephemerises", "ephemerides", "ephemeris"),
+    "ephemerises": ("ephemerises", "ephemerises", "ephemeris"),
+    "epicardia": ("epicardia", "epicardia", "epicardium"),
+    "epicardium": ("epicardia", "epicardia", "epicardium"),
+    "epidermis": ("epidermises", "epidermises", "epidermis"),
+    "epidermises": ("epidermises", "epidermises", "epidermis"),
+    "epididymides": ("epididymides", "epididymides", "epididymis"),
+    "epididymis": ("epididymises", "epididymides", "epididymis"),
+    "epididymises": ("epididymises", "epididymises", "epididymis"),
+    "epilimnia": ("epilimnia", "epilimnia", "epilimnion"),
+    "epilimnion": ("epilimnia", "epilimnia", "epilimnion"),
+    "epimera": ("epimera", "epimera", "epimeron"),
+    "epimeron": ("epimera", "epimera", "epimeron"),
+    "epiphenomena": ("epiphenomena", "epiphenomena", "epiphenomenon"),
+    "epiphenomenon": ("epiphenomena", "epiphenomena", "epiphenomenon"),
+    "epithelioma": ("epitheliomata", "epitheliomata", "epithelioma"),
+    "epitheliomata": ("epitheliomata", "epitheliomata", "epithelioma"),
+    "epyllia": ("epyllia", "epyllia", "epyllion"),
+    "epyllion": ("epyllia", "epyllia", "epyllion"),
+    "equinoctia": ("equinoctia", "equinoctia", "equinoctium"),
+    "equinoctium": ("equinoctiums", "equinoctia", "equinoctium"),
+    "equinoctiums": ("equinoctiums", "equinoctiums", "equinoctium"),
+    "equiseta": ("equiseta", "equiseta", "equisetum"),
+    "equisetum": ("equisetums", "equiseta", "equisetum"),
+    "equisetums": ("equisetums", "equisetums", "equisetum"),
+    "erf": ("erfs", "erven", "erf"),
+    "erfs": ("erfs", "erfs", "erf"),
+    "ergastula": ("ergastula", "ergastula", "ergastulum"),
+    "ergastulum": ("ergastula", "ergastula", "ergastulum"),
+    "eros": ("eroses", "erotes", "eros"),
+    "eroses": ("eroses", "eroses", "eros"),
+    "erotes": ("erotes", "erotes", "eros"),
+    "errata": ("errata", "errata", "erratum"),
+    "erratum": ("errata", "errata", "erratum"),
+    "erven": ("erven", "erven", "erf"),
+    "espanol": ("espanoles", "espanoles", "espanol"),
+    "espanoles": ("espanoles", "espanoles", "espanol"),
+    "esperanto": ("esperantos", "esperantos", "esperanto"),
+    "esperantos": ("esperantos", "esperantos", "esperanto"),
+    "espresso": ("espressos", "espressos", "espresso"),
+    "espressos": ("espressos", "espressos", "espresso"),
+    "ethos": ("ethoses", "ethoses", "ethos"),
+    "ethoses": ("ethoses", "ethoses", "ethos"),
+    "eucalypti": ("eucalypti", "eucalypti", "eucalyptus"),
+    "eucalyptus": ("eucalyptuses", "eucalypti", "eucalyptus"),
+    "eucalyptuses": ("eucalyptuses", "eucalyptuses", "eucalyptus"),
+    "eunuch": ("eunuchs", "eunuchs", "eunuch"),
+    "eunuchs": ("eunuchs", "eunuchs", "eunuch"),
+    "euporista": ("euporista", "euporista", "euporiston"),
+    "euporiston": ("euporista", "euporista", "euporiston"),
+    "euro": ("euros", "euros", "euro"),
+    "euros": ("euros", "euros", "euro"),
+    "evirati": ("evirati", "evirati", "evirato"),
+    "evirato": ("evirati", "evirati", "evirato"),
+    "ex": ("exes", "exes", "ex"),
+    "exanthema": ("exanthemata", "exanthemata", "exanthema"),
+    "exanthemata": ("exanthemata", "exanthemata", "exanthema"),
+    "exempla": ("exempla", "exempla", "exemplum"),
+    "exemplum": ("exempla", "exempla", "exemplum"),
+    "exencephali": ("exencephali", "exencephali", "exencephalus"),
+    "exencephalus": ("exencephali", "exencephali", "exencephalus"),
+    "exes": ("exes", "exes", "ex"),
+    "explananda": ("explananda", "explananda", "explanandum"),
+    "explanandum": ("explananda", "explananda", "explanandum"),
+    "explicanda": ("explicanda", "explicanda", "explicandum"),
+    "explicandum": ("explicanda", "explicanda", "explicandum"),
+    "extispex": ("extispices", "extispices", "extispex"),
+    "extispices": ("extispices", "extispices", "extispex"),
+    "extrema": ("extrema", "extrema", "extremum"),
+    "extremum": ("extremums", "extrema", "extremum"),
+    "extremums": ("extremums", "extremums", "extremum"),
+    "eyas": ("eyases", "eyases", "eyas"),
+    "eyases": ("eyases", "eyases", "eyas"),
+    "fabella": ("fabellae", "fabellae", "fabella"),
+    "fabellae": ("fabellae", "fabellae", "fabella"),
+    "fabliau": ("fabliaux", "fabliaux", "fabliau"),
+    "fabliaux": ("fabliaux", "fabliaux", "fabliau"),
+    "facienda": ("facienda", "facienda", "faciendum"),
+    "faciendum": ("facienda", "facienda", "faciendum"),
+    "faecula": ("faeculae", "faeculae", "faecula"),
+    "faeculae": ("faeculae", "faeculae", "faecula"),
+    "fait accompli": ("faits accomplis", "faits accomplis", "fait accompli"),
+    "faits accomplis": ("faits accomplis", "faits accomplis", "fait accompli"),
+    "falces": ("falces", "falces", "falx"),
+    "falsetto": ("falsettos", "falsettos", "falsetto"),
+    "falsettos": ("falsettos", "falsettos", "falsetto"),
+    "falx": ("falces", "falces", "falx"),
+    "familia": ("familiae", "familiae", "familia"),
+    "familiae": ("familiae", "familiae", "familia"),
+    "famuli": ("famuli", "famuli", "famulus"),
+    "famulus": ("famuli", "famuli", "famulus"),
+    "fanfoot": ("fanfoots", "fanfoots", "fanfoot"),
+    "fanfoots": ("fanfoots", "fanfoots", "fanfoot"),
+    "farman": ("farmans", "farmans", "farman"),
+    "farmans": ("farmans", "farmans", "farman"),
+    "faro": ("faros", "faros", "faro"),
+    "faroese": ("faroese", "faroese", "faroese"),
+    "faros": ("faros", "faros", "faro"),
+    "fascia": ("fascias", "fasciae", "fascia"),
+    "fasciae": ("fasciae", "fasciae", "fascia"),
+    "fascias": ("fascias", "fascias", "fascia"),
+    "fasciculi": ("fasciculi", "fasciculi", "fasciculus"),
+    "fasciculus": ("fasciculi", "fasciculi", "fasciculus"),
+    "fauna": ("faunas", "faunae", "fauna"),
+    "faunae": ("faunae", "faunae", "fauna"),
+    "faunas": ("faunas", "faunas", "fauna"),
+    "favella": ("favellae", "favellae", "favella"),
+    "favellae": ("favellae", "favellae", "favella"),
+    "faveoli": ("faveoli", "faveoli", "faveolus"),
+    "faveolus": ("faveoli", "faveoli", "faveolus"),
+    "favissa": ("favissae", "favissae", "favissa"),
+    "favissae": ("favissae", "favissae", "favissa"),
+    "fecula": ("feculae", "feculae", "fecula"),
+    "feculae": ("feculae", "feculae", "fecula"),
+    "fedai": ("fedais", "fedai", "fedai"),
+    "fedais": ("fedais", "fedais", "fedai"),
+    "feet": ("feet", "feet", "foot"),
+    "feis": ("fess", "feiseanna", "feis"),
+    "feiseanna": ("feiseanna", "feiseanna", "feis"),
+    "felo": ("felones", "felones", "felo"),
+    "felo de se": ("felos de se", "felones de se", "felo de se"),
+    "felo-de-se": ("felos-de-se", "felones-de-se", "felo-de-se"),
+    "felones": ("felones", "felones", "felo"),
+    "felones de se": ("felones de se", "felones de se", "felo de se"),
+    "felones-de-se": ("felones-de-se", "felones-de-se", "felo-de-se"),
+    "felos de se": ("felos de se", "felos de se", "felo de se"),
+    "felos-de-se": ("felos-de-se", "felos-de-se", "felo-de-se"),
+    "felsenmeer": ("felsenmeere", "felsenmeere", "felsenmeer"),
+    "felsenmeere": ("felsenmeere", "felsenmeere", "felsenmeer"),
+    "femora": ("femora", "femora", "femur"),
+    "femur": ("femurs", "femora", "femur"),
+    "femurs": ("femurs", "femurs", "femur"),
+    "fenestra": ("fenestrae", "fenestrae", "fenestra"),
+    "fenestrae": ("fenestrae", "fenestrae", "fenestra"),
+    "fermata": ("fermatas", "fermate", "fermata"),
+    "fermatas": ("fermatas", "fermatas", "fermata"),
+    "fermate": ("fermate", "fermate", "fermata"),
+    "ferrarese": ("ferrarese", "ferrarese", "ferrarese"),
+    "fess": ("fess", "fess", "feis"),
+    "fiasco": ("fiascos", "fiascos", "fiasco"),
+    "fiascos": ("fiascos", "fiascos", "fiasco"),
+    "fibra": ("fibrae", "fibrae", "fibra"),
+    "fibrae": ("fibrae", "fibrae", "fibra"),
+    "fibrilla": ("fibrillae", "fibrillae", "fibrilla"),
+    "fibrillae": ("fibrillae", "fibrillae", "fibrilla"),
+    "fibroma": ("fibromata", "fibromata", "fibroma"),
+    "fibromata": ("fibromata", "fibromata", "fibroma"),
+    "fibula": ("fibulas", "fibulae", "fibula"),
+    "fibulae": ("fibulae", "fibulae", "fibula"),
+    "fibulas": ("fibulas", "fibulas", "fibula"),
+    "fidei defensor": ("fidei defensores", "fidei defensores", "fidei defensor"),
+    "fidei defensores": ("fidei defensores", "fidei defensores", "fidei defensor"),
+    "figurante": ("figurantes", "figuranti", "figurante"),
+    "figurantes": ("figurantes", "figurantes", "figurante"),
+    "figuranti": ("figuranti", "figuranti", "figurante"),
+    "filaria": ("filarias", "filariae", "filaria"),
+    "filariae": ("filariae", "filariae", "filaria"),
+    "filarias": ("filarias", "filarias", "filaria"),
+    "filipino": ("filipinos", "filipinos", "filipino"),
+    "filipinos": ("filipinos", "filipinos", "filipino"),
+    "finger end": ("finger ends", "fingers ends", "finger end"),
+    "finger ends": ("finger ends", "finger ends", "finger end"),
+    "finger-end": ("finger-ends", "fingers-ends", "finger-end"),
+    "finger-ends": ("finger-ends", "finger-ends", "finger-end"),
+    "fingers ends": ("fingers ends", "fingers ends", "finger end"),
+    "fingers-ends": ("fingers-ends", "fingers-ends", "finger-end"),
+    "fioritura": ("fioriture", "fioriture", "fioritura"),
+    "fioriture": ("fioriture", "fioriture", "fioritura"),
+    "fish": ("fish", "fish", "fish"),
+    "fizz": ("fizzes", "fizzes", "fizz"),
+    "fizzes": ("fizzes", "fizzes", "fizz"),
+    "flabella": ("flabella", "flabella", "flabellum"),
+    "flabellum": ("flabella", "flabella", "flabellum"),
+    "flag staff": ("flag staffs", "flag staves", "flag staff"),
+    "flag staffs": ("flag staffs", "flag staffs", "flag staff"),
+    "flag staves": ("flag staves", "flag staves", "flag staff"),
+    "flag-staff": ("flag-staffs", "flag-staves", "flag-staff"),
+    "flag-staffs": ("flag-staffs", "flag-staffs", "flag-staff"),
+    "flag-staves": ("flag-staves", "flag-staves", "flag-staff"),
+    "flagella": ("flagella", "flagella", "flagellum"),
+    "flagellum": ("flagella", "flagella", "flagellum"),
+    "flamenco": ("flamencos", "flamencos", "flamenco"),
+    "flamencos": ("flamencos", "flamencos", "flamenco"),
+    "flatfoot": ("flatfoots", "flatfoots", "flatfoot"),
+    "flatfoots": ("flatfoots", "flatfoots", "flatfoot"),
+    "flatus": ("flatuses", "flatuses", "flatus"),
+    "flatuses": ("flatuses", "flatuses", "flatus"),
+    "flies": ("flies", "flies", "fly"),
+    "flocci": ("flocci", "flocci", "floccus"),
+    "flocculi": ("flocculi", "flocculi", "flocculus"),
+    "flocculus": ("flocculi", "flocculi", "flocculus"),
+    "floccus": ("flocci", "flocci", "floccus"),
+    "flora": ("floras", "florae", "flora"),
+    "florae": ("florae", "florae", "flora"),
+    "floras": ("floras", "floras", "flora"),
+    "flounder": ("flounder", "flounder", "flounder"),
+    "fly": ("flies", "flys", "fly"),
+    "flys": ("flys", "flys", "fly"),
+    "foci": ("foci", "foci", "focus"),
+    "focus": ("focuses", "foci", "focus"),
+    "focuses": ("focuses", "focuses", "focus"),
+    "folles": ("folles", "folles", "follis"),
+    "follis": ("folles", "folles", "follis"),
+    "fomes": ("fomites", "fomites", "fomes"),
+    "fomites": ("fomites", "fomites", "fomes"),
+    "foochowese": ("foochowese", "foochowese", "foochowese"),
+    "foot": ("feet", "feet", "foot"),
+    "fora": ("fora", "fora", "forum"),
+    "foramen": ("foramens", "foramina", "foramen"),
+    "foramens": ("foramens", "foramens", "foramen"),
+    "foramina": ("foramina", "foramina", "foramen"),
+    "formula": ("formulas", "formulae", "formula"),
+    "formulae": ("formulae", "formulae", "formula"),
+    "formulas": ("formulas", "formulas", "formula"),
+    "forum": ("forums", "fora", "forum"),
+    "forums": ("forums", "forums", "forum"),
+    "fossa": ("fossae", "fossae", "fossa"),
+    "fossae": ("fossae", "fossae", "fossa"),
+    "fowl": ("fowls", "fowl", "fowl"),
+    "fowls": ("fowls", "fowls", "fowl"),
+    "fraena": ("fraena", "fraena", "fraenum"),
+    "fraenum": ("fraena", "fraena", "fraenum"),
+    "franc archer": ("franc archers", "francs archers", "franc archer"),
+    "franc archers": ("franc archers", "franc archers", "franc archer"),
+    "franc-archer": ("franc-archers", "francs-archers", "franc-archer"),
+    "franc-archers": ("franc-archers", "franc-archers", "franc-archer"),
+    "francs archers": ("francs archers", "francs archers", "franc archer"),
+    "francs-archers": ("francs-archers", "francs-archers", "franc-archer"),
+    "frate": ("frati", "frati", "frate"),
+    "frati": ("frati", "frati", "frate"),
+    "frena": ("frena", "frena", "frenum"),
+    "frenum": ("frena", "fraena", "frenum"),
+    "fricandeau": ("fricandeaux", "fricandeaux", "fricandeau"),
+    "fricandeaux": ("fricandeaux", "fricandeaux", "fricandeau"),
+    "frizz": ("frizzes", "frizzes", "frizz"),
+    "frizzes": ("frizzes", "frizzes", "frizz"),
+    "fro": ("froes", "froes", "fro"),
+    "froe": ("froes", "froes", "froe"),
+    "froes": ("froes", "froes", "fro"),
+    "frottola": ("frottole", "frottole", "frottola"),
+    "frottole": ("frottole", "frottole", "frottola"),
+    "frusta": ("frusta", "frusta", "frustum"),
+    "frustula": ("frustula", "frustula", "frustulum"),
+    "frustulum": ("frustula", "frustula", "frustulum"),
+    "frustum": ("frustums", "frusta", "frustum"),
+    "frustums": ("frustums", "frustums", "frustum"),
+    "fuci": ("fuci", "fuci", "fucus"),
+    "fucus": ("fuci", "fuci", "fucus"),
+    "fulcra": ("fulcra", "fulcra", "fulcrum"),
+    "fulcrum": ("fulcra", "fulcra", "fulcrum"),
+    "funambuli": ("funambuli", "funambuli", "funambulus"),
+    "funambulus": ("funambuli", "funambuli", "funambulus"),
+    "fundamenta divisionis": ("fundamenta divisionis", "fundamenta divisionis", "fundamentum divisionis"),
+    "fundamentum divisionis": ("fundamenta divisionis", "fundamenta divisionis", "fundamentum divisionis"),
+    "funghi porchini": ("funghi porchini", "funghi porchini", "fungo porcino"),
+    "fungi": ("fungi", "fungi", "fungus"),
+    "fungo porcino": ("funghi porchini", "funghi porchini", "fungo porcino"),
+    "fungus": ("funguses", "fungi", "fungus"),
+    "funguses": ("funguses", "funguses", "fungus"),
+    "furfur": ("furfures", "furfures", "furfur"),
+    "furfures": ("furfures", "furfures", "furfur"),
+    "furioso": ("furiosos", "furiosos", "furioso"),
+    "furiosos": ("furiosos", "furiosos", "furioso"),
+    "fuzz": ("fuzzes", "fuzzes", "fuzz"),
+    "fuzzes": ("fuzzes", "fuzzes", "fuzz"),
+    "gabunese": ("gabunese", "gabunese", "gabunese"),
+    "galla": ("gallas", "galla", "galla"),
+    "gallas": ("gallas", "gallas", "galla"),
+    "gallows": ("gallows", "gallows", "gallows"),
+    "gametangia": ("gametangia", "gametangia", "gametangium"),
+    "gametangium": ("gametangia", "gametangia", "gametangium"),
+    "ganglia": ("ganglia", "ganglia", "ganglion"),
+    "ganglion": ("ganglions", "ganglia", "ganglion"),
+    "ganglions": ("ganglions", "ganglions", "ganglion"),
+    "gaon": ("gaons", "gaonim", "gaon"),
+    "gaonim": ("gaonim", "gaonim", "gaon"),
+    "gaons": ("gaons", "gaons", "gaon"),
+    "gas": ("gases", "gases", "gas"),
+    "gases": ("gases", "gases", "gas"),
+    "gastrocnemii": ("gastrocnemii", "gastrocnemii", "gastrocnemius"),
+    "gastrocnemius": ("gastrocnemii", "gastrocnemii", "gastrocnemius"),
+    "geese": ("geese", "geese", "goose"),
+    "geisha": ("geishas", "geisha", "geisha"),
+    "geishas": ("geishas", "geishas", "geisha"),
+    "geisteswissenschaft": ("geisteswissenschaften", "geisteswissenschaften", "geisteswissenschaft"),
+    "geisteswissenschaften": ("geisteswissenschaften", "geisteswissenschaften", "geisteswissenschaft"),
+    "gemma": ("gemmae", "gemmae", "gemma"),
+    "gemmae": ("gemmae", "gemmae", "gemma"),
+    "gena": ("genae", "genae", "gena"),
+    "genae": ("genae", "genae", "gena"),
+    "genera": ("genera", "genera", "genus"),
+    "generalissimo": ("generalissimos", "generalissimos", "generalissimo"),
+    "generalissimos": ("generalissimos", "generalissimos", "generalissimo"),
+    "genevese": ("genevese", "genevese", "genevese"),
+    "genie": ("genies", "genii", "genie"),
+    "genies": ("genies", "genies", "genie"),
+    "genii": ("genii", "genii", "genie"),
+    "genius": ("geniuses", "genii", "genius"),
+    "geniuses": ("geniuses", "geniuses", "genius"),
+    "genoese": ("genoese", "genoese", "genoese"),
+    "gens": ("gentes", "gentes", "gens"),
+    "gentes": ("gentes", "gentes", "gens"),
+    "genus": ("genera", "genera", "genus"),
+    "german": ("germans", "germans", "german"),
+    "germans": ("germans", "germans", "german"),
+    "germaria": ("germaria", "germaria", "germarium"),
+    "germarium": ("germaria", "germaria", "germarium"),
+    "gestapo": ("gestapos", "gestapos", "gestapo"),
+    "gestapos": ("gestapos", "gestapos", "gestapo"),
+    "ghetto": ("ghettos", "ghettos", "ghetto"),
+    "ghettos": ("ghettos", "ghettos", "ghetto"),
+    "gigolo": ("gigolos", "gigolos", "gigolo"),
+    "gigolos": ("gigolos", "gigolos", "gigolo"),
+    "gilbertese": ("gilbertese", "gilbertese", "gilbertese"),
+    "giunchi": ("giunchi", "giunchi", "giuncus"),
+    "giuncus": ("giunchi", "giunchi", "giuncus"),
+    "gizmo": ("gizmos", "gizmos", "gizmo"),
+    "gizmos": ("gizmos", "gizmos", "gizmo"),
+    "glacis": ("glacises", "glacis", "glacis"),
+    "glacises": ("glacises", "glacises", "glacis"),
+    "gladioli": ("gladioli", "gladioli", "gladiolus"),
+    "gladiolus": ("gladioluses", "gladioli", "gladiolus"),
+    "gladioluses": ("gladioluses", "gladioluses", "gladiolus"),
+    "glass": ("glasses", "glasses", "glass"),
+    "glasses": ("glasses", "glasses", "glass"),
+    "glioma": ("gliomata", "gliomata", "glioma"),
+    "gliomata": ("gliomata", "gliomata", "glioma"),
+    "gliosarcoma": ("gliosarcomata", "gliosarcomata", "gliosarcoma"),
+    "gliosarcomata": ("gliosarcomata", "gliosarcomata", "gliosarcoma"),
+    "glissandi": ("glissandi", "glissandi", "glissando"),
+    "glissando": ("glissandos", "glissandi", "glissando"),
+    "glissandos": ("glissandos", "glissandos", "glissando"),
+    "globigerina": ("globigerinae", "globigerinae", "globigerina"),
+    "globigerinae": ("globigerinae", "globigerinae", "globigerina"),
+    "glochidia": ("glochidia", "glochidia", "glochidium"),
+    "glochidium": ("glochidia", "glochidia", "glochidium"),
+    "glomera": ("glomera", "glomera", "glomus"),
+    "glomus": ("glomera", "glomera", "glomus"),
+    "glottis": ("glottises", "glottises", "glottis"),
+    "glottises": ("glottises", "glottises", "glottis"),
+    "glutaei": ("glutaei", "glutaei", "glutaeus"),
+    "glutaeus": ("glutei", "glutaei", "glutaeus"),
+    "glutei": ("glutei", "glutei", "glutaeus"),
+    "gluteus": ("glutei", "glutaei", "gluteus"),
+    "gmina": ("gminy", "gminy", "gmina"),
+    "gminy": ("gminy", "gminy", "gmina"),
+    "go": ("goes", "goes", "go"),
+    "goanese": ("goanese", "goanese", "goanese"),
+    "goes": ("goes", "goes", "go"),
+    "gonangia": ("gonangia", "gonangia", "gonangium"),
+    "gonangium": ("gonangia", "gonangia", "gonangium"),
+    "gonidia": ("gonidia", "gonidia", "gonidium"),
+    "gonidium": ("gonidia", "gonidia", "gonidium"),
+    "gonimia": ("gonimia", "gonimia", "gonimium"),
+    "gonimium": ("gonimia", "gonimia", "gonimium"),
+    "goose": ("geese", "geese", "goose"),
+    "gorgonia": ("gorgonias", "gorgoniae", "gorgonia"),
+    "gorgoniae": ("gorgoniae", "gorgoniae", "gorgonia"),
+    "gorgonias": ("gorgonias", "gorgonias", "gorgonia"),
+    "gousblom": ("gousblomme", "gousblomme", "gousblom"),
+    "gousblomme": ("gousblomme", "gousblomme", "gousblom"),
+    "goy": ("goys", "goyim", "goy"),
+    "goyim": ("goyim", "goyim", "goy"),
+    "goys": ("goys", "goys", "goy"),
+    "graben": ("grabens", "graben", "graben"),
+    "grabens": ("grabens", "grabens", "graben"),
+    "graffiti": ("graffiti", "graffiti", "graffiti"),
+    "graffito": ("graffiti", "graffiti", "graffito"),
+    "grani": ("grani", "grani", "grano"),
+    "granita": ("granite", "granite", "granita"),
+    "granite": ("granite", "granite", "granita"),
+    "grano": ("grani", "grani", "grano"),
+    "granula": ("granulae", "granulae", "granula"),
+    "granulae": ("granulae", "granulae", "granula"),
+    "gravamen": ("gravamina", "gravamina", "gravamen"),
+    "gravamina": ("gravamina", "gravamina", "gravamen"),
+    "greensboro": ("greensboros", "greensboros", "greensboro"),
+    "greensboros": ("greensboros", "greensboros", "greensboro"),
+    "gringo": ("gringos", "gringos", "gringo"),
+    "gringos": ("gringos", "gringos", "gringo"),
+    "grissini": ("grissini", "grissini", "grissino"),
+    "grissino": ("grissini", "grissini", "grissino"),
+    "grotto": ("grottos", "grottoes", "grotto"),
+    "grottoes": ("grottoes", "grottoes", "grotto"),
+    "grottos": ("grottos", "grottos", "grotto"),
+    "grouse": ("grouses", "grouse", "grouse"),
+    "grouses": ("grouses", "grouses", "grouse"),
+    "guaiabero": ("guaiaberos", "guaiaberos", "guaiabero"),
+    "guaiaberos": ("guaiaberos", "guaiaberos", "guaiabero"),
+    "guano": ("guanos", "guanos", "guano"),
+    "guanos": ("guanos", "guanos", "guano"),
+    "guardia civil": ("guardias civiles", "guardias civiles", "guardia civil"),
+    "guardias civiles": ("guardias civiles", "guardias civiles", "guardia civil"),
+    "gubernacula": ("gubernacula", "gubernacula", "gubernaculum"),
+    "gubernaculum": ("gubernacula", "gubernacula", "gubernaculum"),
+    "guglio": ("guglios", "guglioes", "guglio"),
+    "guglioes": ("guglioes", "guglioes", "guglio"),
+    "guglios": ("guglios", "guglios", "guglio"),
+    "guianese": ("guianese", "guianese", "guianese"),
+    "gumbo": ("gumbos", "gumbos", "gumbo"),
+    "gumbos": ("gumbos", "gumbos", "gumbo"),
+    "gumma": ("gummas", "gummata", "gumma"),
+    "gummas": ("gummas", "gummas", "gumma"),
+    "gummata": ("gummata", "gummata", "gumma"),
+    "gutti": ("gutti", "gutti", "guttus"),
+    "guttus": ("gutti", "gutti", "guttus"),
+    "guy": ("guys", "guys", "guy"),
+    "guys": ("guys", "guys", "guy"),
+    "gymnasia": ("gymnasia", "gymnasia", "gymnasium"),
+    "gymnasium": ("gymnasiums", "gymnasia", "gymnasium"),
+    "gymnasiums": ("gymnasiums", "gymnasiums", "gymnasium"),
+    "gymnoti": ("gymnoti", "gymnoti", "gymnotus"),
+    "gymnotus": ("gymnoti", "gymnoti", "gymnotus"),
+    "gyri": ("gyri", "gyri", "gyrus"),
+    "gyro": ("gyros", "gyros", "gyro"),
+    "gyros": ("gyros", "gyros", "gyro"),
+    "gyrus": ("gyri", "gyri", "gyrus"),
+    "haddock": ("haddocks", "haddock", "haddock"),
+    "haddocks": ("haddocks", "haddocks", "haddock"),
+    "haemangioma": ("haemangiomas", "haemangiomata", "haemangioma"),
+    "haemangiomas": ("haemangiomas", "haemangiomas", "haemangioma"),
+    "haemangiomata": ("haemangiomata", "haemangiomata", "haemangioma"),
+    "haggis": ("haggis", "haggis", "haggis"),
+    "hainanese": ("hainanese", "hainanese", "hainanese"),
+    "hairdo": ("hairdos", "hairdos", "hairdo"),
+    "hairdos": ("hairdos", "hairdos", "hairdo"),
+    "hake": ("hakes", "hake", "hake"),
+    "hakes": ("hakes", "hakes", "hake"),
+    "halibut": ("halibuts", "halibut", "halibut"),
+    "halibuts": ("halibuts", "halibuts", "halibut"),
+    "halluces": ("halluces", "halluces", "hallux"),
+    "hallux": ("halluces", "halluces", "hallux"),
+    "halteridia": ("halteridia", "halteridia", "halteridium"),
+    "halteridium": ("halteridia", "halteridia", "halteridium"),
+    "hamadryad": ("hamadryads", "hamadryades", "hamadryad"),
+    "hamadryades": ("hamadryades", "hamadryades", "hamadryad"),
+    "hamadryads": ("hamadryads", "hamadryads", "hamadryad"),
+    "hamuli": ("hamuli", "hamuli", "hamulus"),
+    "hamulus": ("hamuli", "hamuli", "hamulus"),
+    "hapax legomena": ("hapax legomena", "hapax legomena", "hapax legomenon"),
+    "hapax legomenon": ("hapax legomenons", "hapax legomena", "hapax legomenon"),
+    "hapax legomenons": ("hapax legomenons", "hapax legomenons", "hapax legomenon"),
+    "haptera": ("haptera", "haptera", "hapteron"),
+    "hapteron": ("haptera", "haptera", "hapteron"),
+    "hararese": ("hararese", "hararese", "hararese"),
+    "harlemese": ("harlemese", "harlemese", "harlemese"),
+    "harman": ("harmans", "harmans", "harman"),
+    "harmans": ("harmans", "harmans", "harman"),
+    "haruspex": ("haruspices", "haruspices", "haruspex"),
+    "haruspices": ("haruspices", "haruspices", "haruspex"),
+    "haustella": ("haustella", "haustella", "haustellum"),
+    "haustellum": ("haustella", "haustella", "haustellum"),
+    "haustoria": ("haustoria", "haustoria", "haustorium"),
+    "haustorium": ("haustoria", "haustoria", "haustorium"),
+    "haustra": ("haustra", "haustra", "haustrum"),
+    "haustrum": ("haustra", "haustra", "haustrum"),
+    "havanese": ("havanese", "havanese", "havanese"),
+    "he": ("they", "they", "he"),
+    "headquarters": ("headquarters", "headquarters", "headquarters"),
+    "heavenese": ("heavenese", "heavenese", "heavenese"),
+    "hedra": ("hedra", "hedra", "hedron"),
+    "hedron": ("hedrons", "hedra", "hedron"),
+    "hedrons": ("hedrons", "hedrons", "hedron"),
+    "heen": ("heen", "heen", "hsien"),
+    "heft": ("hefte", "hefte", "heft"),
+    "hefte": ("hefte", "hefte", "heft"),
+    "helia": ("helia", "helia", "helion"),
+    "helices": ("helices", "helices", "helix"),
+    "helion": ("helions", "helia", "helion"),
+    "helions": ("helions", "helions", "helion"),
+    "helix": ("helices", "helices", "helix"),
+    "hemangeioma": ("hemangeiomas", "hemangeiomata", "hemangeioma"),
+    "hemangeiomas": ("hemangeiomas", "hemangeiomas", "hemangeioma"),
+    "hemangeiomata": ("hemangeiomata", "hemangeiomata", "hemangeioma"),
+    "hemangioma": ("hemangiomas", "hemangiomata", "hemangioma"),
+    "hemangiomas": ("hemangiomas", "hemangiomas", "hemangioma"),
+    "hemangiomata": ("hemangiomata", "hemangiomata", "hemangioma"),
+    "hemelytra": ("hemelytra", "hemelytra", "hemelytrum"),
+    "hemelytrum": ("hemelytra", "hemelytra", "hemelytrum"),
+    "hemera": ("hemerae", "hemerae", "hemera"),
+    "hemerae": ("hemerae", "hemerae", "hemera"),
+    "hemi elytra": ("hemi elytra", "hemi elytra", "hemi elytrum"),
+    "hemi elytrum": ("hemi elytra", "hemi elytra", "hemi elytrum"),
+    "hemi-elytra": ("hemi-elytra", "hemi-elytra", "hemi-elytrum"),
+    "hemi-elytrum": ("hemi-elytra", "hemi-elytra", "hemi-elytrum"),
+    "her": ("them", "them", "her"),
+    "hernia": ("hernias", "herniae", "hernia"),
+    "herniae": ("herniae", "herniae", "hernia"),
+    "hernias": ("hernias", "hernias", "hernia"),
+    "hero": ("heroes", "heroes", "hero"),
+    "heroa": ("heroa", "heroa", "heroon"),
+    "heroes": ("heroes", "heroes", "hero"),
+    "heroon": ("heroa", "heroa", "heroon"),
+    "heroum": ("heroa", "heroa", "heroum"),
+    "herpes": ("herpes", "herpes", "herpes"),
+    "herr": ("herren", "herren", "herr"),
+    "herren": ("herren", "herren", "herr"),
+    "herring": ("herrings", "herring", "herring"),
+    "herrings": ("herrings", "herrings", "herring"),
+    "hers": ("theirs", "theirs", "hers"),
+    "herself": ("themselves", "themselves", "herself"),
+    "hertz": ("hertz", "hertz", "hertz"),
+    "hetaera": ("hetaerae", "hetairai", "hetaera"),
+    "hetaerae": ("hetaerae", "hetaerae", "hetaera"),
+    "hetaira": ("hetaerae", "hetairai", "hetaira"),
+    "hetairai": ("hetairai", "hetairai", "hetaera"),
+    "hetman": ("hetmans", "hetmans", "hetman"),
+    "hetmans": ("hetmans", "hetmans", "hetman"),
+    "hiatus": ("hiatuses", "hiatus", "hiatus"),
+    "hiatuses": ("hiatuses", "hiatuses", "hiatus"),
+    "hijinks": ("hijinks", "hijinks", "hijinks"),
+    "him": ("them", "them", "him"),
+    "himself": ("themselves", "themselves", "himself"),
+    "hinaki": ("hinaki", "hinaki", "hinaki"),
+    "hippo": ("hippos", "hippos", "hippo"),
+    "hippocampi": ("hippocampi", "hippocampi", "hippocampus"),
+    "hippocampus": ("hippocampi", "hippocampi", "hippocampus"),
+    "hippopotami": ("hippopotami", "hippopotami", "hippopotamus"),
+    "hippopotamus": ("hippopotamuses", "hippopotami", "hippopotamus"),
+    "hippopotamuses": ("hippopotamuses", "hippopotamuses", "hippopotamus"),
+    "hippos": ("hippos", "hippos", "hippo"),
+    "hiroshiman": ("hiroshimans", "hiroshimans", "hiroshiman"),
+    "hiroshimans": ("hiroshimans", "hiroshimans", "hiroshiman"),
+    "his": ("theirs", "theirs", "his"),
+    "ho": ("hoes", "hoes", "ho"),
+    "hoe": ("hoes", "hoes", "hoe"),
+    "hoes": ("hoes", "hoes", "hoe"),
+    "holothuria": ("holothurias", "holothuriae", "holothuria"),
+    "holothuriae": ("holothuriae", "holothuriae", "holothuria"),
+    "holothurias": ("holothurias", "holothurias", "holothuria"),
+    "honoraria": ("honoraria", "honoraria", "honorarium"),
+    "honorarium": ("honorariums", "honoraria", "honorarium"),
+    "honorariums": ("honorariums", "honorariums", "honorarium"),
+    "hoof": ("hoofs", "hooves", "hoof"),
+    "hoofs": ("hoofs", "hoofs", "hoof"),
+    "hoosierese": ("hoosierese", "hoosierese", "hoosierese"),
+    "hooves": ("hooves", "hooves", "hoof"),
+    "hordeola": ("hordeola", "hordeola", "hordeolum"),
+    "hordeolum": ("hordeola", "hordeola", "hordeolum"),
+    "hormogonia": ("hormogonia", "hormogonia", "hormogonium"),
+    "hormogonium": ("hormogonia", "hormogonia", "hormogonium"),
+    "hoti": ("hoties", "hoties", "hoti"),
+    "hoties": ("hoties", "hoties", "hoti"),
+    "hottentotese": ("hottentotese", "hottentotese", "hottentotese"),
+    "hsien": ("heen", "heen", "hsien"),
+    "hubris": ("hubrises", "hubrises", "hubris"),
+    "hubrises": ("hubrises", "hubrises", "hubris"),
+    "human": ("humans", "humans", "human"),
+    "humans": ("humans", "humans", "human"),
+    "humeri": ("humeri", "humeri", "humerus"),
+    "humerus": ("humeri", "humeri", "humerus"),
+    "hunanese": ("hunanese", "hunanese", "hunanese"),
+    "hydra": ("hydras", "hydrae", "hydra"),
+    "hydrae": ("hydrae", "hydrae", "hydra"),
+    "hydras": ("hydras", "hydras", "hydra"),
+    "hydraulica": ("hydraulica", "hydraulica", "hydraulicon"),
+    "hydraulicon": ("hydraulica", "hydraulica", "hydraulicon"),
+    "hydria": ("hydriae", "hydriae", "hydria"),
+    "hydriae": ("hydriae", "hydriae", "hydria"),
+    "hymenia": ("hymenia", "hymenia", "hymenium"),
+    "hymenium": ("hymenia", "hymenia", "hymenium"),
+    "hymnaria": ("hymnaria", "hymnaria", "hymnarium"),
+    "hymnarium": ("hymnaria", "hymnaria", "hymnarium"),
+    "hyperbata": ("hyperbata", "hyperbata", "hyperbaton"),
+    "hyperbaton": ("hyperbata", "hyperbata", "hyperbaton"),
+    "hyperbola": ("hyperbolas", "hyperbolae", "hyperbola"),
+    "hyperbolae": ("hyperbolae", "hyperbolae", "hyperbola"),
+    "hyperbolas": ("hyperbolas", "hyperbolas", "hyperbola"),
+    "hypha": ("hyphae", "hyphae", "hypha"),
+    "hyphae": ("hyphae", "hyphae", "hypha"),
+    "hypna": ("hypna", "hypna", "hypnum"),
+    "hypnum": ("hypnums", "hypna", "hypnum"),
+    "hypnums": ("hypnums", "hypnums", "hypnum"),
+    "hypoderma": ("hypodermata", "hypodermata", "hypoderma"),
+    "hypodermata": ("hypodermata", "hypodermata", "hypoderma"),
+    "hypolimnia": ("hypolimnia", "hypolimnia", "hypolimnion"),
+    "hypolimnion": ("hypolimnia", "hypolimnia", "hypolimnion"),
+    "i": ("we", "we", "I"),
+    "ibis": ("ibises", "ibises", "ibis"),
+    "ibises": ("ibises", "ibises", "ibis"),
+    "ichthyosauri": ("ichthyosauri", "ichthyosauri", "ichthyosaurus"),
+    "ichthyosaurus": ("ichthyosauri", "ichthyosauri", "ichthyosaurus"),
+    "idaho": ("idahos", "idahos", "idaho"),
+    "idahos": ("idahos", "idahos", "idaho"),
+    "idee fixe": ("idees fixes", "idees fixes", "idee fixe"),
+    "idees fixes": ("idees fixes", "idees fixes", "idee fixe"),
+    "idola": ("idola", "idola", "idolum"),
+    "idolon": ("idola", "idola", "idolon"),
+    "idolum": ("idola", "idola", "idolum"),
+    "ignoramus": ("ignoramuses", "ignoramus", "ignoramus"),
+    "ignoramuses": ("ignoramuses", "ignoramuses", "ignoramus"),
+    "ilia": ("ilia", "ilia", "ilium"),
+    "ilium": ("ilia", "ilia", "ilium"),
+    "imagines": ("imagines", "imagines", "imago"),
+    "imago": ("imagos", "imagines", "imago"),
+    "imagos": ("imagos", "imagos", "imago"),
+    "imbrex": ("imbrices", "imbrices", "imbrex"),
+    "imbrices": ("imbrices", "imbrices", "imbrex"),
+    "impetigo": ("impetigos", "impetigos", "impetigo"),
+    "impetigos": ("impetigos", "impetigos", "impetigo"),
+    "impetus": ("impetuses", "impetus", "impetus"),
+    "impetuses": ("impetuses", "impetuses", "impetus"),
+    "improperia": ("improperia", "improperia", "improperium"),
+    "improperium": ("improperia", "improperia", "improperium"),
+    "improvisatrice": ("improvisatrici", "improvisatrici", "improvisatrice"),
+    "improvisatrici": ("improvisatrici", "improvisatrici", "improvisatrice"),
+    "incubi": ("incubi", "incubi", "incubus"),
+    "incubus": ("incubuses", "incubi", "incubus"),
+    "incubuses": ("incubuses", "incubuses", "incubus"),
+    "index": ("indexes", "indices", "index"),
+    "indexes": ("indexes", "indexes", "index"),
+    "indices": ("indices", "indices", "index"),
+    "indicia": ("indicia", "indicia", "indicium"),
+    "indicium": ("indicia", "indicia", "indicium"),
+    "indigena": ("indigenae", "indigenae", "indigena"),
+    "indigenae": ("indigenae", "indigenae", "indigena"),
+    "individua": ("individua", "individua", "individuum"),
+    "individuum": ("individuums", "individua", "individuum"),
+    "individuums": ("individuums", "individuums", "individuum"),
+    "indochinese": ("indochinese", "indochinese", "indochinese"),
+    "indumenta": ("indumenta", "indumenta", "indumentum"),
+    "indumentum": ("indumenta", "indumenta", "indumentum"),
+    "indusia": ("indusia", "indusia", "indusium"),
+    "indusium": ("indusia", "indusia", "indusium"),
+    "inferno": ("infernos", "infernos", "inferno"),
+    "infernos": ("infernos", "infernos", "inferno"),
+    "infima species": ("infimae species", "infimae species", "infima species"),
+    "infimae species": ("infimae species", "infimae species", "infima species"),
+    "info": ("infos", "infos", "info"),
+    "infos": ("infos", "infos", "info"),
+    "inhalatoria": ("inhalatoria", "inhalatoria", "inhalatorium"),
+    "inhalatorium": ("inhalatoria", "inhalatoria", "inhalatorium"),
+    "innings": ("innings", "innings", "innings"),
+    "inocula": ("inocula", "inocula", "inoculum"),
+    "inoculum": ("inocula", "inocula", "inoculum"),
+    "insula": ("insulae", "insulae", "insula"),
+    "insulae": ("insulae", "insulae", "insula"),
+    "intaglio": ("intaglios", "intaglios", "intaglio"),
+    "intaglios": ("intaglios", "intaglios", "intaglio"),
+    "interambulacra": ("interambulacra", "interambulacra", "interambulacrum"),
+    "interambulacrum": ("interambulacra", "interambulacra", "interambulacrum"),
+    "interaxes": ("interaxes", "interaxes", "interaxis"),
+    "interaxis": ("interaxes", "interaxes", "interaxis"),
+    "intercalare": ("intercalare", "intercalare", "intercalarium"),
+    "intercalaria": ("intercalaria", "intercalaria", "intercalarium"),
+    "intercalarium": ("intercalaria", "intercalare", "intercalarium"),
+    "interleaf": ("leaves", "leaves", "interleaf"),
+    "intermaxilla": ("intermaxillae", "intermaxillae", "intermaxilla"),
+    "intermaxillae": ("intermaxillae", "intermaxillae", "intermaxilla"),
+    "intermedia": ("intermedia", "intermedia", "intermedium"),
+    "intermedium": ("intermedia", "intermedia", "intermedium"),
+    "intermezzo": ("intermezzos", "intermezzos", "intermezzo"),
+    "intermezzos": ("intermezzos", "intermezzos", "intermezzo"),
+    "internodia": ("internodia", "internodia", "internodium"),
+    "internodium": ("internodia", "internodia", "internodium"),
+    "interphenomena": ("interphenomena", "interphenomena", "interphenomenon"),
+    "interphenomenon": ("interphenomena", "interphenomena", "interphenomenon"),
+    "interradii": ("interradii", "interradii", "interradius"),
+    "interradius": ("interradii", "interradii", "interradius"),
+    "interreges": ("interreges", "interreges", "interrex"),
+    "interregna": ("interregna", "interregna", "interregnum"),
+    "interregnum": ("interregnums", "interregna", "interregnum"),
+    "interregnums": ("interregnums", "interregnums", "interregnum"),
+    "interrex": ("interreges", "interreges", "interrex"),
+    "interstitia": ("interstitia", "interstitia", "interstitium"),
+    "interstitium": ("interstitiums", "interstitia", "interstitium"),
+    "interstitiums": ("interstitiums", "interstitiums", "interstitium"),
+    "intertrigo": ("intertrigos", "intertrigos", "intertrigo"),
+    "intertrigos": ("intertrigos", "intertrigos", "intertrigo"),
+    "intervalla": ("intervalla", "intervalla", "intervallum"),
+    "intervallum": ("intervallums", "intervalla", "intervallum"),
+    "intervallums": ("intervallums", "intervallums", "intervallum"),
+    "intichiuma": ("intichiuma", "intichiuma", "intichiuma"),
+    "inuit": ("inuit", "inuit", "inuk"),
+    "inuk": ("inuit", "inuit", "inuk"),
+    "inukshuit": ("inukshuit", "inukshuit", "inukshuk"),
+    "inukshuk": ("inukshuit", "inukshuit", "inukshuk"),
+    "involucra": ("involucra", "involucra", "involucrum"),
+    "involucrum": ("involucra", "involucra", "involucrum"),
+    "ipse dixit": ("ipse dixits", "ipse dixits", "ipse dixit"),
+    "ipse dixits": ("ipse dixits", "ipse dixits", "ipse dixit"),
+    "iquico": ("iquicos", "iquicos", "iquico"),
+    "iquicos": ("iquicos", "iquicos", "iquico"),
+    "irides": ("irides", "irides", "iris"),
+    "iris": ("irises", "irides", "iris"),
+    "irises": ("irises", "irises", "iris"),
+    "ischia": ("ischia", "ischia", "ischium"),
+    "ischium": ("ischia", "ischia", "ischium"),
+    "isidia": ("isidia", "isidia", "isidium"),
+    "isidium": ("isidia", "isidia", "isidium"),
+    "ispravnik": ("ispravniks", "ispravniki", "ispravnik"),
+    "ispravniki": ("ispravniki", "ispravniki", "ispravnik"),
+    "ispravniks": ("ispravniks", "ispravniks", "ispravnik"),
+    "isthmi": ("isthmi", "isthmi", "isthmus"),
+    "isthmus": ("isthmuses", "isthmi", "isthmus"),
+    "isthmuses": ("isthmuses", "isthmuses", "isthmus"),
+    "it": ("they", "they", "it"),
+    "iter": ("iters", "itinera", "iter"),
+    "iters": ("iters", "iters", "iter"),
+    "itinera": ("itinera", "itinera", "iter"),
+    "its": ("theirs", "theirs", "its"),
+    "itself": ("themselves", "themselves", "itself"),
+    "iueles": ("iueles", "iueles", "juelet"),
+    "ixodid": ("ixodides", "ixodides", "ixodid"),
+    "ixodides": ("ixodides", "ixodides", "ixodid"),
+    "jackanapes": ("jackanapes", "jackanapes", "jackanapes"),
+    "jacobus": ("jacobuses", "jacobus", "jacobus"),
+    "jacobuses": ("jacobuses", "jacobuses", "jacobus"),
+    "jalapeno": ("jalapenos", "jalapenos", "jalapeno"),
+    "jalapenos": ("jalapenos", "jalapenos", "jalapeno"),
+    "jambeau": ("jambeaus", "jambeaux", "jambeau"),
+    "jambeaus": ("jambeaus", "jambeaus", "jambeau"),
+    "jambeaux": ("jambeaux", "jambeaux", "jambeau"),
+    "japanese": ("japanese", "japanese", "japanese"),
+    "javanese": ("javanese", "javanese", "javanese"),
+    "jazz": ("jazzes", "jazzes", "jazz"),
+    "jazzes": ("jazzes", "jazzes", "jazz"),
+    "jerries": ("jerries", "jerries", "jerry"),
+    "jerry": ("jerries", "jerries", "jerry"),
+    "jerrys": ("jerrys", "jerrys", "jerry"),
+    "jeu": ("jeux", "jeux", "jeu"),
+    "jeux": ("jeux", "jeux", "jeu"),
+    "jo": ("joes", "joes", "jo"),
+    "joe": ("joes", "joes", "joe"),
+    "joes": ("joes", "joes", "joe"),
+    "johnsonese": ("johnsonese", "johnsonese", "johnsonese"),
+    "judicata": ("judicata", "judicata", "judicatum"),
+    "judicatum": ("judicata", "judicata", "judicatum"),
+    "juelet": ("iueles", "iueles", "juelet"),
+    "juga": ("juga", "juga", "jugum"),
+    "jugum": ("juga", "juga", "jugum"),
+    "jumbo": ("jumbos", "jumbos", "jumbo"),
+    "jumbos": ("jumbos", "jumbos", "jumbo"),
+    "junto": ("juntos", "juntos", "junto"),
+    "juntos": ("juntos", "juntos", "junto"),
+    "kakapo": ("kakapos", "kakapos", "kakapo"),
+    "kakapos": ("kakapos", "kakapos", "kakapo"),
+    "kanarese": ("kanarese", "kanarese", "kanarese"),
+    "kantharoi": ("kantharoi", "kantharoi", "kantharos"),
+    "kantharos": ("kantharoi", "kantharoi", "kantharos"),
+    "kar": ("kars", "kare", "kar"),
+    "karakia": ("karakias", "karakia", "karakia"),
+    "karakias": ("karakias", "karakias", "karakia"),
+    "kare": ("kare", "kare", "kar"),
+    "karrenfeld": ("karrenfelds", "karrenfelder", "karrenfeld"),
+    "karrenfelder": ("karrenfelder", "karrenfelder", "karrenfeld"),
+    "karrenfelds": ("karrenfelds", "karrenfelds", "karrenfeld"),
+    "kars": ("kars", "kars", "kar"),
+    "kernoi": ("kernoi", "kernoi", "kernos"),
+    "kernos": ("kernoi", "kernoi", "kernos"),
+    "kibbutz": ("kibbutzes", "kibbutzim", "kibbutz"),
+    "kibbutzes": ("kibbutzes", "kibbutzes", "kibbutz"),
+    "kibbutzim": ("kibbutzim", "kibbutzim", "kibbutz"),
+    "kilo": ("kilos", "kilos", "kilo"),
+    "kilos": ("kilos", "kilos", "kilo"),
+    "kimono": ("kimonos", "kimonos", "kimono"),
+    "kimonos": ("kimonos", "kimonos", "kimono"),
+    "kine": ("kine", "kine", "cow"),
+    "kinkimavo": ("kinkimavos", "kinkimavos", "kinkimavo"),
+    "kinkimavos": ("kinkimavos", "kinkimavos", "kinkimavo"),
+    "kioko": ("kiokos", "kioko", "kioko"),
+    "kiokos": ("kiokos", "kiokos", "kioko"),
+    "kiplingese": ("kiplingese", "kiplingese", "kiplingese"),
+    "kletterschuh": ("kletterschuhe", "kletterschuhe", "kletterschuh"),
+    "kletterschuhe": ("kletterschuhe", "kletterschuhe", "kletterschuh"),
+    "knife": ("knives", "knives", "knife"),
+    "knives": ("knives", "knives", "knife"),
+    "knopper": ("knoppers", "knoppern", "knopper"),
+    "knoppern": ("knoppern", "knoppern", "knopper"),
+    "knoppers": ("knoppers", "knoppers", "knopper"),
+    "kobo": ("kobo", "kobo", "kobo"),
+    "kokako": ("kokakos", "kokakos", "kokako"),
+    "kokakos": ("kokakos", "kokakos", "kokako"),
+    "konditorei": ("konditorei", "konditoreien", "konditorei"),
+    "konditoreien": ("konditoreien", "konditoreien", "konditorei"),
+    "kongoese": ("kongoese", "kongoese", "kongoese"),
+    "kongolese": ("kongolese", "kongolese", "kongolese"),
+    "kosovo": ("kosovos", "kosovos", "kosovo"),
+    "kosovos": ("kosovos", "kosovos", "kosovo"),
+    "kouroi": ("kouroi", "kouroi", "kouros"),
+    "kouros": ("kouroi", "kouroi", "kouros"),
+    "kovsh": ("kovshi", "kovshi", "kovsh"),
+    "kovshi": ("kovshi", "kovshi", "kovsh"),
+    "kuvasz": ("kuvaszok", "kuvaszok", "kuvasz"),
+    "kuvaszok": ("kuvaszok", "kuvaszok", "kuvasz"),
+    "kylikes": ("kylikes", "kylikes", "kylix"),
+    "kylix": ("kylixes", "kylikes", "kylix"),
+    "kylixes": ("kylixes", "kylixes", "kylix"),
+    "labra": ("labra", "labra", "labrum"),
+    "labrum": ("labra", "labra", "labrum"),
+    "lacinia": ("laciniae", "laciniae", "lacinia"),
+    "laciniae": ("laciniae", "laciniae", "lacinia"),
+    "lactobacilli": ("lactobacilli", "lactobacilli", "lactobacillus"),
+    "lactobacillus": ("lactobacilli", "lactobacilli", "lactobacillus"),
+    "lacuna": ("lacunas", "lacunae", "lacuna"),
+    "lacunae": ("lacunae", "lacunae", "lacuna"),
+    "lacunar": ("lacunars", "lacunaria", "lacunar"),
+    "lacunaria": ("lacunaria", "lacunaria", "lacunar"),
+    "lacunars": ("lacunars", "lacunars", "lacunar"),
+    "lacunas": ("lacunas", "lacunas", "lacuna"),
+    "laika": ("laiki", "laiki", "laika"),
+    "laiki": ("laiki", "laiki", "laika"),
+    "lamella": ("lamellae", "lamellae", "lamella"),
+    "lamellae": ("lamellae", "lamellae", "lamella"),
+    "lamina": ("laminae", "laminae", "lamina"),
+    "laminae": ("laminae", "laminae", "lamina"),
+    "lapith": ("lapiths", "lapithae", "lapith"),
+    "lapithae": ("lapithae", "lapithae", "lapith"),
+    "lapiths": ("lapiths", "lapiths", "lapith"),
+    "lapponese": ("lapponese", "lapponese", "lapponese"),
+    "lar": ("lars", "lares", "lar"),
+    "lares": ("lares", "lares", "lar"),
+    "larnakes": ("larnakes", "larnakes", "larnax"),
+    "larnax": ("larnakes", "larnakes", "larnax"),
+    "lars": ("lars", "lars", "lar"),
+    "larynges": ("larynges", "larynges", "larynx"),
+    "larynx": ("larynges", "larynges", "larynx"),
+    "latex": ("latexes", "latices", "latex"),
+    "latexes": ("latexes", "latexes", "latex"),
+    "latices": ("latices", "latices", "latex"),
+    "leaf": ("leaves", "leaves", "leaf"),
+    "leaves": ("leaves", "leaves", "leaf"),
+    "lebanese": ("lebanese", "lebanese", "lebanese"),
+    "lebensform": ("lebensformen", "lebensformen", "lebensform"),
+    "lebensformen": ("lebensformen", "lebensformen", "lebensform"),
+    "leges humanae": ("leges humanae", "leges humanae", "lex humana"),
+    "legionella": ("legionellae", "legionellae", "legionella"),
+    "legionellae": ("legionellae", "legionellae", "legionella"),
+    "legomena": ("legomena", "legomena", "legomenon"),
+    "legomenon": ("legomena", "legomena", "legomenon"),
+    "legumen": ("legumens", "legumina", "legumen"),
+    "legumens": ("legumens", "legumens", "legumen"),
+    "legumina": ("legumina", "legumina", "legumen"),
+    "lei": ("lei", "lei", "leu"),
+    "leishmania": ("leishmanias", "leishmaniae", "leishmania"),
+    "leishmaniae": ("leishmaniae", "leishmaniae", "leishmania"),
+    "leishmanias": ("leishmanias", "leishmanias", "leishmania"),
+    "leman": ("lemans", "lemans", "leman"),
+    "lemans": ("lemans", "lemans", "leman"),
+    "lemma": ("lemmas", "lemmata", "lemma"),
+    "lemmas": ("lemmas", "lemmas", "lemma"),
+    "lemmata": ("lemmata", "lemmata", "lemma"),
+    "lemnisci": ("lemnisci", "lemnisci", "lemniscus"),
+    "lemniscus": ("lemnisci", "lemnisci", "lemniscus"),
+    "lemur": ("lemurs", "lemures", "lemur"),
+    "lemures": ("lemures", "lemures", "lemur"),
+    "lemurs": ("lemurs", "lemurs", "lemur"),
+    "lens": ("lenses", "lenses", "lens"),
+    "lenses": ("lenses", "lenses", "lens"),
+    "lentigines": ("lentigines", "lentigines", "lentigo"),
+    "lentigo": ("lentigines", "lentigines", "lentigo"),
+    "lentisci": ("lentisci", "lentisci", "lentiscus"),
+    "lentiscus": ("lentisci", "lentisci", "lentiscus"),
+    "leonese": ("leonese", "leonese", "leonese"),
+    "leproma": ("lepromas", "lepromata", "leproma"),
+    "lepromas": ("lepromas", "lepromas", "leproma"),
+    "lepromata": ("lepromata", "lepromata", "leproma"),
+    "leprosaria": ("leprosaria", "leprosaria", "leprosarium"),
+    "leprosarium": ("leprosaria", "leprosaria", "leprosarium"),
+    "lepta": ("lepta", "lepta", "lepton"),
+    "leptomonas": ("leptomonas", "leptomonas", "leptomonas"),
+    "lepton": ("lepta", "lepta", "lepton"),
+    "leptospira": ("leptospirae", "leptospirae", "leptospira"),
+    "leptospirae": ("leptospirae", "leptospirae", "leptospira"),
+    "lesotho": ("lesothos", "lesothos", "lesotho"),
+    "lesothos": ("lesothos", "lesothos", "lesotho"),
+    "leu": ("lei", "lei", "leu"),
+    "lex humana": ("leges humanae", "leges humanae", "lex humana"),
+    "libero": ("liberos", "liberos", "libero"),
+    "liberos": ("liberos", "liberos", "libero"),
+    "libido": ("libidos", "libidos", "libido"),
+    "libidos": ("libidos", "libidos", "libido"),
+    "libretti": ("libretti", "libretti", "libretto"),
+    "libretto": ("librettos", "libretti", "libretto"),
+    "librettos": ("librettos", "librettos", "libretto"),
+    "lice": ("lice", "lice", "louse"),
+    "lido": ("lidos", "lidos", "lido"),
+    "lidos": ("lidos", "lidos", "lido"),
+    "lied": ("lieder", "lieder", "lied"),
+    "lieder": ("lieder", "lieder", "lied"),
+    "lieu": ("lieus", "lieux", "lieu"),
+    "lieus": ("lieus", "lieus", "lieu"),
+    "lieutenant general": ("lieutenant generals", "lieutenant generals", "lieutenant general"),
+    "lieutenant generals": ("lieutenant generals", "lieutenant generals", "lieutenant general"),
+    "lieux": ("lieux", "lieux", "lieu"),
+    "life": ("lives", "lives", "life"),
+    "ligamenta": ("ligamenta", "ligamenta", "ligamentum"),
+    "ligamentum": ("ligamenta", "ligamenta", "ligamentum"),
+    "likuta": ("makuta", "makuta", "likuta"),
+    "lilo": ("lilos", "lilos", "lilo"),
+    "lilos": ("lilos", "lilos", "lilo"),
+    "limaces": ("limaces", "limaces", "limax"),
+    "liman": ("limans", "limans", "liman"),
+    "limans": ("limans", "limans", "liman"),
+    "limax": ("limaces", "limaces", "limax"),
+    "limbo": ("limbos", "limbos", "limbo"),
+    "limbos": ("limbos", "limbos", "limbo"),
+    "limes": ("limites", "limites", "limes"),
+    "limites": ("limites", "limites", "limes"),
+    "limo": ("limos", "limos", "limo"),
+    "limos": ("limos", "limos", "limo"),
+    "limuli": ("limuli", "limuli", "limulus"),
+    "limulus": ("limuli", "limuli", "limulus"),
+    "linctus": ("linctuses", "linctuses", "linctus"),
+    "linctuses": ("linctuses", "linctuses", "linctus"),
+    "line out": ("line outs", "lines out", "line out"),
+    "line outs": ("line outs", "line outs", "line out"),
+    "line-out": ("line-outs", "lines-out", "line-out"),
+    "line-outs": ("line-outs", "line-outs", "line-out"),
+    "linea": ("lineae", "lineae", "linea"),
+    "lineae": ("lineae", "lineae", "linea"),
+    "lineno": ("linenos", "linenos", "lineno"),
+    "linenos": ("linenos", "linenos", "lineno"),
+    "lines out": ("lines out", "lines out", "line out"),
+    "lines-out": ("lines-out", "lines-out", "line-out"),
+    "lingo": ("lingos", "lingos", "lingo"),
+    "lingos": ("lingos", "lingos", "lingo"),
+    "lingula": ("lingulae", "lingulae", "lingula"),
+    "lingulae": ("lingulae", "lingulae", "lingula"),
+    "lino": ("linos", "linos", "lino"),
+    "linos": ("linos", "linos", "lino"),
+    "lipoma": ("lipomata", "lipomata", "lipoma"),
+    "lipomata": ("lipomata", "lipomata", "lipoma"),
+    "lis": ("lisses", "lis", "lis"),
+    "lisses": ("lisses", "lisses", "lis"),
+    "listerella": ("listerellas", "listerellae", "listerella"),
+    "listerellae": ("listerellae", "listerellae", "listerella"),
+    "listerellas": ("listerellas", "listerellas", "listerella"),
+    "listeria": ("listerias", "listeria", "listeria"),
+    "listerias": ("listerias", "listerias", "listeria"),
+    "lithodomi": ("lithodomi", "lithodomi", "lithodomus"),
+    "lithodomus": ("lithodomi", "lithodomi", "lithodomus"),
+    "lithophyta": ("lithophyta", "lithophyta", "lithophyton"),
+    "lithophyton": ("lithophyta", "lithophyta", "lithophyton"),
+    "livedo": ("livedos", "livedos", "livedo"),
+    "livedos": ("livedos", "livedos", "livedo"),
+    "lives": ("lives", "lives", "life"),
+    "lixivia": ("lixivia", "lixivia", "lixivium"),
+    "lixivium": ("lixivia", "lixivia", "lixivium"),
+    "loa": ("loas", "loa", "loa"),
+    "loaf": ("loaves", "loaves", "loaf"),
+    "loas": ("loas", "loas", "loa"),
+    "loaves": ("loaves", "loaves", "loaf"),
+    "lobuli": ("lobuli", "lobuli", "lobulus"),
+    "lobulus": ("lobuli", "lobuli", "lobulus"),
+    "lochi": ("lochi", "lochi", "lochus"),
+    "lochus": ("lochi", "lochi", "lochus"),
+    "loci": ("loci", "loci", "locus"),
+    "loco": ("locos", "locos", "loco"),
+    "locos": ("locos", "locos", "loco"),
+    "loculi": ("loculi", "loculi", "loculus"),
+    "loculus": ("loculi", "loculi", "loculus"),
+    "locus": ("loci", "loci", "locus"),
+    "loggia": ("loggias", "loggie", "loggia"),
+    "loggias": ("loggias", "loggias", "loggia"),
+    "loggie": ("loggie", "loggie", "loggia"),
+    "logia": ("logia", "logia", "logion"),
+    "logion": ("logia", "logia", "logion"),
+    "logo": ("logos", "logos", "logo"),
+    "logodaedale": ("logodaedale", "logodaedale", "logodaedalus"),
+    "logodaedali": ("logodaedali", "logodaedali", "logodaedalus"),
+    "logodaedalus": ("logodaedali", "logodaedale", "logodaedalus"),
+    "logos": ("logos", "logos", "logo"),
+    "loma": ("lomata", "lomata", "loma"),
+    "lomata": ("lomata", "lomata", "loma"),
+    "lomenta": ("lomenta", "lomenta", "lomentum"),
+    "lomentum": ("lomenta", "lomenta", "lomentum"),
+    "londonese": ("londonese", "londonese", "londonese"),
+    "lora": ("lora", "lora", "lorum"),
+    "lord lieutenant": ("lord lieutenants", "lords lieutenant", "lord lieutenant"),
+    "lord lieutenants": ("lord lieutenants", "lord lieutenants", "lord lieutenant"),
+    "lord-lieutenant": ("lord-lieutenants", "lords-lieutenant", "lord-lieutenant"),
+    "lord-lieutenants": ("lord-lieutenants", "lord-lieutenants", "lord-lieutenant"),
+    "lords lieutenant": ("lords lieutenant", "lords lieutenant", "lord lieutenant"),
+    "lords-lieutenant": ("lords-lieutenant", "lords-lieutenant", "lord-lieutenant"),
+    "lorrainese": ("lorrainese", "lorrainese", "lorrainese"),
+    "lorum": ("lora", "lora", "lorum"),
+    "louis": ("louis", "louis", "louis"),
+    "louse": ("lice", "lice", "louse"),
+    "lowlife": ("lowlifes", "lowlifes", "lowlife"),
+    "lowlifes": ("lowlifes", "lowlifes", "lowlife"),
+    "lox": ("loxes", "lox", "lox"),
+    "loxes": ("loxes", "loxes", "lox"),
+    "lucchese": ("lucchese", "lucchese", "lucchese"),
+    "lumbago": ("lumbagos", "lumbagos", "lumbago"),
+    "lumbagos": ("lumbagos", "lumbagos", "lumbago"),
+    "lumbrici": ("lumbrici", "lumbrici", "lumbricus"),
+    "lumbricus": ("lumbrici", "lumbrici", "lumbricus"),
+    "lumen": ("lumens", "lumina", "lumen"),
+    "lumens": ("lumens", "lumens", "lumen"),
+    "lumina": ("lumina", "lumina", "lumen"),
+    "lustra": ("lustra", "lustra", "lustrum"),
+    "lustrum": ("lustrums", "lustra", "lustrum"),
+    "lustrums": ("lustrums", "lustrums", "lustrum"),
+    "lymphangioma": ("lymphangiomata", "lymphangiomata", "lymphangioma"),
+    "lymphangiomata": ("lymphangiomata", "lymphangiomata", "lymphangioma"),
+    "lymphoma": ("lymphomas", "lymphomata", "lymphoma"),
+    "lymphomas": ("lymphomas", "lymphomas", "lymphoma"),
+    "lymphomata": ("lymphomata", "lymphomata", "lymphoma"),
+    "lyonese": ("lyonese", "lyonese", "lyonese"),
+    "lyssa": ("lyssae", "lyssae", "lyssa"),
+    "lyssae": ("lyssae", "lyssae", "lyssa"),
+    "maar": ("maars", "maare", "maar"),
+    "maare": ("maare", "maare", "maar"),
+    "maars": ("maars", "maars", "maar"),
+    "macaci": ("macaci", "macaci", "macacus"),
+    "macacus": ("macaci", "macaci", "macacus"),
+    "macanese": ("macanese", "macanese", "macanese"),
+    "macaroni": ("macaronies", "macaronies", "macaroni"),
+    "macaronies": ("macaronies", "macaronies", "macaroni"),
+    "macassarese": ("macassarese", "macassarese", "macassarese"),
+    "macho": ("machos", "machos", "macho"),
+    "machos": ("machos", "machos", "macho"),
+    "mackerel": ("mackerels", "mackerel", "mackerel"),
+    "mackerels": ("mackerels", "mackerels", "mackerel"),
+    "macro": ("macros", "macros", "macro"),
+    "macros": ("macros", "macros", "macro"),
+    "macula": ("maculas", "maculae", "macula"),
+    "maculae": ("maculae", "maculae", "macula"),
+    "maculas": ("maculas", "maculas", "macula"),
+    "madurese": ("madurese", "madurese", "madurese"),
+    "maecenas": ("maecenases", "maecenates", "maecenas"),
+    "maecenases": ("maecenases", "maecenases", "maecenas"),
+    "maecenates": ("maecenates", "maecenates", "maecenas"),
+    "maestri": ("maestri", "maestri", "maestro"),
+    "maestro": ("maestros", "maestri", "maestro"),
+    "maestros": ("maestros", "maestros", "maestro"),
+    "mafiosa": ("mafiose", "mafiose", "mafiosa"),
+    "mafiose": ("mafiose", "mafiose", "mafiosa"),
+    "mafiosi": ("mafiosi", "mafiosi", "mafioso"),
+    "mafioso": ("mafiosos", "mafiosi", "mafioso"),
+    "mafiosos": ("mafiosos", "mafiosos", "mafioso"),
+    "magi": ("magi", "magi", "magus"),
+    "magili": ("magili", "magili", "magilus"),
+    "magilus": ("magili", "magili", "magilus"),
+    "magma": ("magmas", "magmata", "magma"),
+    "magmas": ("magmas", "magmas", "magma"),
+    "magmata": ("magmata", "magmata", "magma"),
+    "magna opera": ("magna opera", "magna opera", "magnum opus"),
+    "magneto": ("magnetos", "magnetos", "magneto"),
+    "magnetos": ("magnetos", "magnetos", "magneto"),
+    "magnifico": ("magnificos", "magnificos", "magnifico"),
+    "magnificos": ("magnificos", "magnificos", "magnifico"),
+    "magnum opus": ("magnum opuses", "magna opera", "magnum opus"),
+    "magnum opuses": ("magnum opuses", "magnum opuses", "magnum opus"),
+    "magus": ("magi", "magi", "magus"),
+    "major general": ("major generals", "major generals", "major general"),
+    "major generals": ("major generals", "major generals", "major general"),
+    "majuro": ("majuros", "majuros", "majuro"),
+    "majuros": ("majuros", "majuros", "majuro"),
+    "makuta": ("makuta", "makuta", "likuta"),
+    "mala in se": ("mala in se", "mala in se", "malum in se"),
+    "malabarese": ("malabarese", "malabarese", "malabarese"),
+    "malabo": ("malabos", "malabos", "malabo"),
+    "malabos": ("malabos", "malabos", "malabo"),
+    "malagma": ("malagmata", "malagmata", "malagma"),
+    "malagmata": ("malagmata", "malagmata", "malagma"),
+    "mallei": ("mallei", "mallei", "malleus"),
+    "malleoli": ("malleoli", "malleoli", "malleolus"),
+    "malleolus": ("malleoli", "malleoli", "malleolus"),
+    "malleus": ("mallei", "mallei", "malleus"),
+    "maltese": ("maltese", "maltese", "maltese"),
+    "malum in se": ("mala in se", "mala in se", "malum in se"),
+    "man": ("men", "men", "man"),
+    "man child": ("men children", "men children", "man child"),
+    "man midwife": ("men midwives", "men midwives", "man midwife"),
+    "man milliner": ("man milliners", "men milliners", "man milliner"),
+    "man milliners": ("man milliners", "man milliners", "man milliner"),
+    "man servant": ("men servants", "men servants", "man servant"),
+    "man-child": ("men-children", "men-children", "man-child"),
+    "man-midwife": ("men-midwives", "men-midwives", "man-midwife"),
+    "man-milliner": ("man-milliners", "men-milliners", "man-milliner"),
+    "man-milliners": ("man-milliners", "man-milliners", "man-milliner"),
+    "man-servant": ("men-servants", "men-servants", "man-servant"),
+    "manchild": ("menchildren", "menchildren", "manchild"),
+    "mango": ("mangos", "mangoes", "mango"),
+    "mangoes": ("mangoes", "mangoes", "mango"),
+    "mangos": ("mangos", "mangos", "mango"),
+    "manifesto": ("manifestos", "manifestos", "manifesto"),
+    "manifestos": ("manifestos", "manifestos", "manifesto"),
+    "manservant": ("menservants", "menservants", "manservant"),
+    "manteau": ("manteaus", "manteaux", "manteau"),
+    "manteaus": ("manteaus", "manteaus", "manteau"),
+    "manteaux": ("manteaux", "manteaux", "manteau"),
+    "mantelletta": ("mantellette", "mantellette", "mantelletta"),
+    "mantellette": ("mantellette", "mantellette", "mantelletta"),
+    "mantis": ("mantises", "mantises", "mantis"),
+    "mantises": ("mantises", "mantises", "mantis"),
+    "manubria": ("manubria", "manubria", "manubrium"),
+    "manubrium": ("manubriums", "manubria", "manubrium"),
+    "manubriums": ("manubriums", "manubriums", "manubrium"),
+    "maputo": ("maputos", "maputos", "maputo"),
+    "maputos": ("maputos", "maputos", "maputo"),
+    "maquereau": ("maquereaux", "maquereaux", "maquereau"),
+    "maquereaux": ("maquereaux", "maquereaux", "maquereau"),
+    "maracaibo": ("maracaibos", "maracaibos", "maracaibo"),
+    "maracaibos": ("maracaibos", "maracaibos", "maracaibo"),
+    "mare": ("mares", "maria", "mare"),
+    "maremma": ("maremme", "maremme", "maremma"),
+    "maremme": ("maremme", "maremme", "maremma"),
+    "mares": ("mares", "mares", "mare"),
+    "maria": ("maria", "maria", "mare"),
+    "maries": ("maries", "maries", "mary"),
+    "marquis": ("marquises", "marquises", "marquis"),
+    "marquises": ("marquises", "marquises", "marquis"),
+    "mary": ("maries", "maries", "mary"),
+    "marys": ("marys", "marys", "mary"),
+    "mater lectionis": ("matres lectionis", "matres lectionis", "mater lectionis"),
+    "math": ("maths", "maths", "math"),
+    "maths": ("maths", "maths", "math"),
+    "matin": ("matins", "matins", "matin"),
+    "matinee musicale": ("matinees musicales", "matinees musicales", "matinee musicale"),
+    "matinees musicales": ("matinees musicales", "matinees musicales", "matinee musicale"),
+    "matins": ("matins", "matins", "matin"),
+    "matres lectionis": ("matres lectionis", "matres lectionis", "mater lectionis"),
+    "matzah": ("matzahs", "matzot", "matzah"),
+    "matzahs": ("matzahs", "matzahs", "matzah"),
+    "matzot": ("matzot", "matzot", "matzah"),
+    "mausolea": ("mausolea", "mausolea", "mausoleum"),
+    "mausoleum": ("mausoleums", "mausolea", "mausoleum"),
+    "mausoleums": ("mausoleums", "mausoleums", "mausoleum"),
+    "maxilla": ("maxillae", "maxillae", "maxilla"),
+    "maxillae": ("maxillae", "maxillae", "maxilla"),
+    "maxima": ("maxima", "maxima", "maximum"),
+    "maximum": ("maximums", "maxima", "maximum"),
+    "maximums": ("maximums", "maximums", "maximum"),
+    "me": ("us", "us", "me"),
+    "measles": ("measles", "measles", "measles"),
+    "meatus": ("meatuses", "meatus", "meatus"),
+    "meatuses": ("meatuses", "meatuses", "meatus"),
+    "media": ("media", "media", "medium"),
+    "mediastina": ("mediastina", "mediastina", "mediastinum"),
+    "mediastinum": ("mediastina", "mediastina", "mediastinum"),
+    "mediatrices": ("mediatrices", "mediatrices", "mediatrix"),
+    "mediatrix": ("mediatrices", "mediatrices", "mediatrix"),
+    "medico": ("medicos", "medicoes", "medico"),
+    "medicoes": ("medicoes", "medicoes", "medico"),
+    "medicos": ("medicos", "medicos", "medico"),
+    "medium": ("mediums", "media", "medium"),
+    "mediums": ("mediums", "mediums", "medium"),
+    "medulloblastoma": ("medulloblastomas", "medulloblastomata", "medulloblastoma"),
+    "medulloblastomas": ("medulloblastomas", "medulloblastomas", "medulloblastoma"),
+    "medulloblastomata": ("medulloblastomata", "medulloblastomata", "medulloblastoma"),
+    "medusa": ("medusas", "medusae", "medusa"),
+    "medusae": ("medusae", "medusae", "medusa"),
+    "medusas": ("medusas", "medusas", "medusa"),
+    "megalosauri": ("megalosauri", "megalosauri", "megalosaurus"),
+    "megalosaurus": ("megalosauri", "megalosauri", "megalosaurus"),
+    "megatheria": ("megatheria", "megatheria", "megatherium"),
+    "megatherium": ("megatheria", "megatheria", "megatherium"),
+    "melanoma": ("melanomas", "melanomata", "melanoma"),
+    "melanomas": ("melanomas", "melanomas", "melanoma"),
+    "melanomata": ("melanomata", "melanomata", "melanoma"),
+    "melastoma": ("melastomas", "melastomae", "melastoma"),
+    "melastomae": ("melastomae", "melastomae", "melastoma"),
+    "melastomas": ("melastomas", "melastomas", "melastoma"),
+    "melicerides": ("melicerides", "melicerides", "meliceris"),
+    "meliceris": ("melicerides", "melicerides", "meliceris"),
+    "melisma": ("melismas", "melismata", "melisma"),
+    "melismas": ("melismas", "melismas", "melisma"),
+    "melismata": ("melismata", "melismata", "melisma"),
+    "memento": ("mementos", "mementoes", "memento"),
+    "mementoes": ("mementoes", "mementoes", "memento"),
+    "mementos": ("mementos", "mementos", "memento"),
+    "memo": ("memos", "memos", "memo"),
+    "memoranda": ("memoranda", "memoranda", "memorandum"),
+    "memorandum": ("memorandums", "memoranda", "memorandum"),
+    "memorandums": ("memorandums", "memorandums", "memorandum"),
+    "memos": ("memos", "memos", "memo"),
+    "men": ("men", "men", "man"),
+    "men children": ("men children", "men children", "man child"),
+    "men midwives": ("men midwives", "men midwives", "man midwife"),
+    "men milliners": ("men milliners", "men milliners", "man milliner"),
+    "men servants": ("men servants", "men servants", "man servant"),
+    "men-children": ("men-children", "men-children", "man-child"),
+    "men-midwives": ("men-midwives", "men-midwives", "man-midwife"),
+    "men-milliners": ("men-milliners", "men-milliners", "man-milliner"),
+    "men-servants": ("men-servants", "men-servants", "man-servant"),
+    "menage a quatre": ("menages a quatre", "menages a quatre", "menage a quatre"),
+    "menage a trois": ("menages a trois", "menages a trois", "menage a trois"),
+    "menages a quatre": ("menages a quatre", "menages a quatre", "menage a quatre"),
+    "menages a trois": ("menages a trois", "menages a trois", "menage a trois"),
+    "menchildren": ("menchildren", "menchildren", "manchild"),
+    "meningioma": ("meningiomas", "meningiomata", "meningioma"),
+    "meningiomas": ("meningiomas", "meningiomas", "meningioma"),
+    "meningiomata": ("meningiomata", "meningiomata", "meningioma"),
+    "menisci": ("menisci", "menisci", "meniscus"),
+    "meniscus": ("menisci", "menisci", "meniscus"),
+    "menservants": ("menservants", "menservants", "manservant"),
+    "menu": ("menus", "menus", "menu"),
+    "menus": ("menus", "menus", "menu"),
+    "meretrices": ("meretrices", "meretrices", "meretrix"),
+    "meretrix": ("meretrices", "meretrices", "meretrix"),
+    "merides": ("merides", "merides", "meris"),
+    "meris": ("merides", "merides", "meris"),
+    "meshumad": ("meshumadim", "meshumadim", "meshumad"),
+    "meshumadim": ("meshumadim", "meshumadim", "meshumad"),
+    "meshummad": ("meshummadim", "meshummadim", "meshummad"),
+    "meshummadim": ("meshummadim", "meshummadim", "meshummad"),
+    "mesothelia": ("mesothelia", "mesothelia", "mesothelium"),
+    "mesothelioma": ("mesotheliomas", "mesotheliomata", "mesothelioma"),
+    "mesotheliomas": ("mesotheliomas", "mesotheliomas", "mesothelioma"),
+    "mesotheliomata": ("mesotheliomata", "mesotheliomata", "mesothelioma"),
+    "mesothelium": ("mesothelia", "mesothelia", "mesothelium"),
+    "messa di voce": ("messe di voce", "messe di voce", "messa di voce"),
+    "messe di voce": ("messe di voce", "messe di voce", "messa di voce"),
+    "messeigneurs": ("messeigneurs", "messeigneurs", "monseigneur"),
+    "messinese": ("messinese", "messinese", "messinese"),
+    "meta": ("metae", "metae", "meta"),
+    "metae": ("metae", "metae", "meta"),
+    "metalimnia": ("metalimnia", "metalimnia", "metalimnion"),
+    "metalimnion": ("metalimnia", "metalimnia", "metalimnion"),
+    "metapleura": ("metapleura", "metapleura", "metapleuron"),
+    "metapleuron": ("metapleura", "metapleura", "metapleuron"),
+    "metatarsi": ("metatarsi", "metatarsi", "metatarsus"),
+    "metatarsus": ("metatarsi", "metatarsi", "metatarsus"),
+    "metro": ("metros", "metros", "metro"),
+    "metropolis": ("metropolises", "metropolises", "metropolis"),
+    "metropolises": ("metropolises", "metropolises", "metropolis"),
+    "metros": ("metros", "metros", "metro"),
+    "mew": ("mews", "mews", "mew"),
+    "mews": ("mews", "mews", "mew"),
+    "mexico": ("mexicos", "mexicos", "mexico"),
+    "mexicos": ("mexicos", "mexicos", "mexico"),
+    "mezuza": ("mezuzoth", "mezuzoth", "mezuza"),
+    "mezuzah": ("mezuzoth", "mezuzoth", "mezuzah"),
+    "mezuzoth": ("mezuzoth", "mezuzoth", "mezuza"),
+    "mezzo rilievo": ("mezzo rilievos", "mezzo rilievos", "mezzo rilievo"),
+    "mezzo rilievos": ("mezzo rilievos", "mezzo rilievos", "mezzo rilievo"),
+    "mezzo-rilievo": ("mezzo-rilievos", "mezzo-rilievos", "mezzo-rilievo"),
+    "mezzo-rilievos": ("mezzo-rilievos", "mezzo-rilievos", "mezzo-rilievo"),
+    "miasma": ("miasmas", "miasmata", "miasma"),
+    "miasmas": ("miasmas", "miasmas", "miasma"),
+    "miasmata": ("miasmata", "miasmata", "miasma"),
+    "mice": ("mice", "mice", "mouse"),
+    "micetraps": ("micetraps", "micetraps", "mousetrap"),
+    "micro": ("micros", "micros", "micro"),
+    "microbia": ("microbia", "microbia", "microbion"),
+    "microbion": ("microbia", "microbia", "microbion"),
+    "microcephali": ("microcephali", "microcephali", "microcephalus"),
+    "microcephalus": ("microcephali", "microcephali", "microcephalus"),
+    "micrococci": ("micrococci", "micrococci", "micrococcus"),
+    "micrococcus": ("micrococci", "micrococci", "micrococcus"),
+    "microfiche": ("microfiches", "microfiche", "microfiche"),
+    "microfiches": ("microfiches", "microfiches", "microfiche"),
+    "micronuclei": ("micronuclei", "micronuclei", "micronucleus"),
+    "micronucleus": ("micronuclei", "micronuclei", "micronucleus"),
+    "micros": ("micros", "micros", "micro"),
+    "milanese": ("milanese", "milanese", "milanese"),
+    "milano": ("milanos", "milanos", "milano"),
+    "milanos": ("milanos", "milanos", "milano"),
+    "miles gloriosus": ("milites gloriosi", "milites gloriosi", "miles gloriosus"),
+    "milieu": ("milieus", "milieux", "milieu"),
+    "milieu interieur": ("milieux interieurs", "milieux interieurs", "milieu interieur"),
+    "milieus": ("milieus", "milieus", "milieu"),
+    "milieux": ("milieux", "milieux", "milieu"),
+    "milieux interieurs": ("milieux interieurs", "milieux interieurs", "milieu interieur"),
+    "miliola": ("miliolae", "miliolae", "miliola"),
+    "miliolae": ("miliolae", "miliolae", "miliola"),
+    "milites gloriosi": ("milites gloriosi", "milites gloriosi", "miles gloriosus"),
+    "millennia": ("millennia", "millennia", "millennium"),
+    "millennium": ("millenniums", "millennia", "millennium"),
+    "millenniums": ("millenniums", "millenniums", "millennium"),
+    "mimosa": ("mimosas", "mimosae", "mimosa"),
+    "mimosae": ("mimosae", "mimosae", "mimosa"),
+    "mimosas": ("mimosas", "mimosas", "mimosa"),
+    "mine": ("ours", "ours", "mine"),
+    "minima": ("minima", "minima", "minimum"),
+    "minimum": ("minimums", "minima", "minimum"),
+    "minimums": ("minimums", "minimums", "minimum"),
+    "minnelied": ("minnelieder", "minnelieder", "minnelied"),
+    "minnelieder": ("minnelieder", "minnelieder", "minnelied"),
+    "minutia": ("minutias", "minutiae", "minutia"),
+    "minutiae": ("minutiae", "minutiae", "minutia"),
+    "minutias": ("minutias", "minutias", "minutia"),
+    "minyan": ("minyanim", "minyanim", "minyan"),
+    "minyanim": ("minyanim", "minyanim", "minyan"),
+    "miracidia": ("miracidia", "miracidia", "miracidium"),
+    "miracidium": ("miracidia", "miracidia", "miracidium"),
+    "mithraea": ("mithraea", "mithraea", "mithraeum"),
+    "mithraeum": ("mithraea", "mithraea", "mithraeum"),
+    "mitochondria": ("mitochondria", "mitochondria", "mitochondrion"),
+    "mitochondrion": ("mitochondria", "mitochondria", "mitochondrion"),
+    "mixolimnia": ("mixolimnia", "mixolimnia", "mixolimnion"),
+    "mixolimnion": ("mixolimnia", "mixolimnia", "mixolimnion"),
+    "mo": ("moes", "moes", "mo"),
+    "moaks": ("moakses", "moakses", "moaks"),
+    "moakses": ("moakses", "moakses", "moaks"),
+    "modelletti": ("modelletti", "modelletti", "modelletto"),
+    "modelletto": ("modelletti", "modelletti", "modelletto"),
+    "modelli": ("modelli", "modelli", "modello"),
+    "modello": ("modellos", "modelli", "modello"),
+    "modellos": ("modellos", "modellos", "modello"),
+    "modenese": ("modenese", "modenese", "modenese"),
+    "moderni": ("moderni", "moderni", "modernus"),
+    "modernus": ("moderni", "moderni", "modernus"),
+    "modi": ("modi", "modi", "modus"),
+    "modii": ("modii", "modii", "modius"),
+    "modius": ("modii", "modii", "modius"),
+    "moduli": ("moduli", "moduli", "modulus"),
+    "modulus": ("moduluses", "moduli", "modulus"),
+    "moduluses": ("moduluses", "moduluses", "modulus"),
+    "modus": ("moduses", "modi", "modus"),
+    "moduses": ("moduses", "moduses", "modus"),
+    "moe": ("moes", "moes", "moe"),
+    "moes": ("moes", "moes", "moe"),
+    "molimen": ("molimina", "molimina", "molimen"),
+    "molimina": ("molimina", "molimina", "molimen"),
+    "momenta": ("momenta", "momenta", "momentum"),
+    "momentum": ("momentums", "momenta", "momentum"),
+    "momentums": ("momentums", "momentums", "momentum"),
+    "monaco": ("monacos", "monacos", "monaco"),
+    "monacos": ("monacos", "monacos", "monaco"),
+    "monades": ("monades", "monades", "monas"),
+    "monas": ("monades", "monades", "monas"),
+    "mondi": ("mondi", "mondi", "mondo"),
+    "mondo": ("mondi", "mondi", "mondo"),
+    "money": ("monies", "monies", "money"),
+    "mongoose": ("mongooses", "mongooses", "mongoose"),
+    "mongooses": ("mongooses", "mongooses", "mongoose"),
+    "monies": ("monies", "monies", "money"),
+    "monimolimnia": ("monimolimnia", "monimolimnia", "monimolimnion"),
+    "monimolimnion": ("monimolimnia", "monimolimnia", "monimolimnion"),
+    "mono": ("monos", "monos", "mono"),
+    "monochasia": ("monochasia", "monochasia", "monochasium"),
+    "monochasium": ("monochasia", "monochasia", "monochasium"),
+    "monorchides": ("monorchides", "monorchides", "monorchis"),
+    "monorchis": ("monorchides", "monorchides", "monorchis"),
+    "monos": ("monos", "monos", "mono"),
+    "monosyllaba": ("monosyllaba", "monosyllaba", "monosyllabon"),
+    "monosyllabon": ("monosyllaba", "monosyllaba", "monosyllabon"),
+    "monota": ("monotae", "monotae", "monota"),
+    "monotae": ("monotae", "monotae", "monota"),
+    "monoxyla": ("monoxyla", "monoxyla", "monoxylon"),
+    "monoxylon": ("monoxyla", "monoxyla", "monoxylon"),
+    "mons": ("montes", "montes", "mons"),
+    "monseigneur": ("monsiegneurs", "messeigneurs", "monseigneur"),
+    "monsiegneurs": ("monsiegneurs", "monsiegneurs", "monseigneur"),
+    "monsignor": ("monsignors", "monsignori", "monsignor"),
+    "monsignore": ("monsignori", "monsignori", "monsignore"),
+    "monsignori": ("monsignori", "monsignori", "monsignore"),
+    "monsignors": ("monsignors", "monsignors", "monsignor"),
+    "monstre sacre": ("monstres sacres", "monstres sacres", "monstre sacre"),
+    "monstres sacres": ("monstres sacres", "monstres sacres", "monstre sacre"),
+    "montenegro": ("montenegros", "montenegros", "montenegro"),
+    "montenegros": ("montenegros", "montenegros", "montenegro"),
+    "montes": ("montes", "montes", "mons"),
+    "moose": ("moose", "moose", "moose"),
+    "moratoria": ("moratoria", "moratoria", "moratorium"),
+    "moratorium": ("moratoriums", "moratoria", "moratorium"),
+    "moratoriums": ("moratoriums", "moratoriums", "moratorium"),
+    "morceau": ("morceaux", "morceaux", "morceau"),
+    "morceaux": ("morceaux", "morceaux", "morceau"),
+    "morocco": ("moroccos", "moroccos", "morocco"),
+    "moroccos": ("moroccos", "moroccos", "morocco"),
+    "morosi": ("morosi", "morosi", "moroso"),
+    "moroso": ("morosi", "morosi", "moroso"),
+    "mortadella": ("mortadellas", "mortadelle", "mortadella"),
+    "mortadellas": ("mortadellas", "mortadellas", "mortadella"),
+    "mortadelle": ("mortadelle", "mortadelle", "mortadella"),
+    "mortaria": ("mortaria", "mortaria", "mortarium"),
+    "mortarium": ("mortaria", "mortaria", "mortarium"),
+    "moscardini": ("moscardini", "moscardini", "moscardino"),
+    "moscardino": ("moscardini", "moscardini", "moscardino"),
+    "motoscafi": ("motoscafi", "motoscafi", "motoscafo"),
+    "motoscafo": ("motoscafi", "motoscafi", "motoscafo"),
+    "motto": ("mottos", "mottoes", "motto"),
+    "mottoes": ("mottoes", "mottoes", "motto"),
+    "mottos": ("mottos", "mottos", "motto"),
+    "mouse": ("mice", "mice", "mouse"),
+    "mousetrap": ("mousetraps", "micetraps", "mousetrap"),
+    "mousetraps": ("mousetraps", "mousetraps", "mousetrap"),
+    "mouth": ("mouths", "mouths", "mouth"),
+    "mouths": ("mouths", "mouths", "mouth"),
+    "mucro": ("mucros", "mucrones", "mucro"),
+    "mucrones": ("mucrones", "mucrones", "mucro"),
+    "mucros": ("mucros", "mucros", "mucro"),
+    "mukim": ("mukims", "mukim", "mukim"),
+    "mukims": ("mukims", "mukims", "mukim"),
+    "multigravida": ("multigravidas", "multigravidae", "multigravida"),
+    "multigravidae": ("multigravidae", "multigravidae", "multigravida"),
+    "multigravidas": ("multigravidas", "multigravidas", "multigravida"),
+    "mumps": ("mumps", "mumps", "mumps"),
+    "municipia": ("municipia", "municipia", "municipium"),
+    "municipium": ("municipia", "municipia", "municipium"),
+    "muqdisho": ("muqdishos", "muqdishos", "muqdisho"),
+    "muqdishos": ("muqdishos", "muqdishos", "muqdisho"),
+    "muranese": ("muranese", "muranese", "muranese"),
+    "murex": ("murexes", "murices", "murex"),
+    "murexes": ("murexes", "murexes", "murex"),
+    "murices": ("murices", "murices", "murex"),
+    "musa": ("musas", "musae", "musa"),
+    "musae": ("musae", "musae", "musa"),
+    "musas": ("musas", "musas", "musa"),
+    "musee imaginaire": ("musees imaginaires", "musees imaginaires", "musee imaginaire"),
+    "musees imaginaires": ("musees imaginaires", "musees imaginaires", "musee imaginaire"),
+    "musique concrete": ("musiques concretes", "musiques concretes", "musique concrete"),
+    "musiques concretes": ("musiques concretes", "musiques concretes", "musique concrete"),
+    "mustachio": ("mustachios", "mustachios", "mustachio"),
+    "mustachios": ("mustachios", "mustachios", "mustachio"),
+    "muzz": ("muzzes", "muzzes", "muzz"),
+    "muzzes": ("muzzes", "muzzes", "muzz"),
+    "mya": ("myas", "myae", "mya"),
+    "myae": ("myae", "myae", "mya"),
+    "myas": ("myas", "myas", "mya"),
+    "mycoplasma": ("mycoplasmas", "mycoplasmata", "mycoplasma"),
+    "mycoplasmas": ("mycoplasmas", "mycoplasmas", "mycoplasma"),
+    "mycoplasmata": ("mycoplasmata", "mycoplasmata", "mycoplasma"),
+    "mycorhiza": ("mycorhizas", "mycorhizae", "mycorhiza"),
+    "mycorhizae": ("mycorhizae", "mycorhizae", "mycorhiza"),
+    "mycorhizas": ("mycorhizas", "mycorhizas", "mycorhiza"),
+    "mycorrhiza": ("mycorrhizas", "mycorrhizae", "mycorrhiza"),
+    "mycorrhizae": ("mycorrhizae", "mycorrhizae", "mycorrhiza"),
+    "mycorrhizas": ("mycorrhizas", "mycorrhizas", "mycorrhiza"),
+    "myeloma": ("myelomas", "myelomata", "myeloma"),
+    "myelomas": ("myelomas", "myelomas", "myeloma"),
+    "myelomata": ("myelomata", "myelomata", "myeloma"),
+    "myo": ("myos", "myos", "myo"),
+    "myos": ("myos", "myos", "myo"),
+    "myself": ("ourselves", "ourselves", "myself"),
+    "mythoi": ("mythoi", "mythoi", "mythos"),
+    "mythos": ("mythoi", "mythoi", "mythos"),
+    "myxoma": ("myxomata", "myxomata", "myxoma"),
+    "myxomata": ("myxomata", "myxomata", "myxoma"),
+    "nachtlokal": ("nachtlokale", "nachtlokale", "nachtlokal"),
+    "nachtlokale": ("nachtlokale", "nachtlokale", "nachtlokal"),
+    "nagaika": ("nagaikas", "nagaiki", "nagaika"),
+    "nagaikas": ("nagaikas", "nagaikas", "nagaika"),
+    "nagaiki": ("nagaiki", "nagaiki", "nagaika"),
+    "nakayaman": ("nakayamans", "nakayamans", "nakayaman"),
+    "nakayamans": ("nakayamans", "nakayamans", "nakayaman"),
+    "nankingese": ("nankingese", "nankingese", "nankingese"),
+    "nasuti": ("nasuti", "nasuti", "nasutus"),
+    "nasutus": ("nasuti", "nasuti", "nasutus"),
+    "naumachia": ("naumachias", "naumachiae", "naumachia"),
+    "naumachiae": ("naumachiae", "naumachiae", "naumachia"),
+    "naumachias": ("naumachias", "naumachias", "naumachia"),
+    "nauplii": ("nauplii", "nauplii", "nauplius"),
+    "nauplius": ("nauplii", "nauplii", "nauplius"),
+    "nautili": ("nautili", "nautili", "nautilus"),
+    "nautilus": ("nautiluses", "nautili", "nautilus"),
+    "nautiluses": ("nautiluses", "nautiluses", "nautilus"),
+    "navarrese": ("navarrese", "navarrese", "navarrese"),
+    "naya paisa": ("naye paise", "naye paise", "naya paisa"),
+    "naye paise": ("naye paise", "naye paise", "naya paisa"),
+    "nebenkern": ("nebenkerne", "nebenkerne", "nebenkern"),
+    "nebenkerne": ("nebenkerne", "nebenkerne", "nebenkern"),
+    "nebula": ("nebulas", "nebulae", "nebula"),
+    "nebulae": ("nebulae", "nebulae", "nebula"),
+    "nebulas": ("nebulas", "nebulas", "nebula"),
+    "nectocalyces": ("nectocalyces", "nectocalyces", "nectocalyx"),
+    "nectocalyx": ("nectocalyces", "nectocalyces", "nectocalyx"),
+    "nemathecia": ("nemathecia", "nemathecia", "nemathecium"),
+    "nemathecium": ("nemathecia", "nemathecia", "nemathecium"),
+    "nenets": ("nentsi", "nentsy", "nenets"),
+    "nentsi": ("nentsi", "nentsi", "nenets"),
+    "nentsy": ("nentsy", "nentsy", "nenets"),
+    "nepalese": ("nepalese", "nepalese", "nepalese"),
+    "nephridia": ("nephridia", "nephridia", "nephridium"),
+    "nephridium": ("nephridia", "nephridia", "nephridium"),
+    "nerita": ("neritas", "neritae", "nerita"),
+    "neritae": ("neritae", "neritae", "nerita"),
+    "neritas": ("neritas", "neritas", "nerita"),
+    "neuma": ("neumas", "neumata", "neuma"),
+    "neumas": ("neumas", "neumas", "neuma"),
+    "neumata": ("neumata", "neumata", "neuma"),
+    "neurinoma": ("neurinomas", "neurinomata", "neurinoma"),
+    "neurinomas": ("neurinomas", "neurinomas", "neurinoma"),
+    "neurinomata": ("neurinomata", "neurinomata", "neurinoma"),
+    "neuroma": ("neuromata", "neuromata", "neuroma"),
+    "neuromata": ("neuromata", "neuromata", "neuroma"),
+    "neurula": ("neurulae", "neurulae", "neurula"),
+    "neurulae": ("neurulae", "neurulae", "neurula"),
+    "neutrino": ("neutrinos", "neutrinos", "neutrino"),
+    "neutrinos": ("neutrinos", "neutrinos", "neutrino"),
+    "news": ("news", "news", "news"),
+    "nexus": ("nexuses", "nexus", "nexus"),
+    "nexuses": ("nexuses", "nexuses", "nexus"),
+    "ngwee": ("ngwee", "ngwee", "ngwee"),
+    "niasese": ("niasese", "niasese", "niasese"),
+    "nicobarese": ("nicobarese", "nicobarese", "nicobarese"),
+    "nidi": ("nidi", "nidi", "nidus"),
+    "nidus": ("niduses", "nidi", "nidus"),
+    "niduses": ("niduses", "niduses", "nidus"),
+    "nielli": ("nielli", "nielli", "niello"),
+    "niello": ("niellos", "nielli", "niello"),
+    "niellos": ("niellos", "niellos", "niello"),
+    "nimbi": ("nimbi", "nimbi", "nimbus"),
+    "nimbus": ("nimbuses", "nimbi", "nimbus"),
+    "nimbuses": ("nimbuses", "nimbuses", "nimbus"),
+    "ningbo": ("ningbos", "ningbos", "ningbo"),
+    "ningbos": ("ningbos", "ningbos", "ningbo"),
+    "nipponese": ("nipponese", "nipponese", "nipponese"),
+    "nockerl": ("nockerln", "nockerln", "nockerl"),
+    "nockerln": ("nockerln", "nockerln", "nockerl"),
+    "noctiluca": ("noctilucae", "noctilucae", "noctiluca"),
+    "noctilucae": ("noctilucae", "noctilucae", "noctiluca"),
+    "noda": ("noda", "noda", "nodum"),
+    "nodi": ("nodi", "nodi", "nodus"),
+    "nodum": ("noda", "noda", "nodum"),
+    "nodus": ("nodi", "nodi", "nodus"),
+    "noema": ("noemata", "noemata", "noema"),
+    "noemata": ("noemata", "noemata", "noema"),
+    "nomisma": ("nomismata", "nomismata", "nomisma"),
+    "nomismata": ("nomismata", "nomismata", "nomisma"),
+    "non-ens": ("nonentia", "nonentia", "non-ens"),
+    "nonentia": ("nonentia", "nonentia", "non-ens"),
+    "norman": ("normans", "normans", "norman"),
+    "normans": ("normans", "normans", "norman"),
+    "noumena": ("noumena", "noumena", "noumenon"),
+    "noumenon": ("noumena", "noumena", "noumenon"),
+    "nouveau pauvre": ("nouvelle pauvre", "nouveaux pauvres", "nouveau pauvre"),
+    "nouveau riche": ("nouvelle riche", "nouveaux riches", "nouveau riche"),
+    "nouveaux arrives": ("nouveaux arrives", "nouveaux arrives", "nouvel arrive"),
+    "nouveaux pauvres": ("nouveaux pauvres", "nouveaux pauvres", "nouveau pauvre"),
+    "nouveaux riches": ("nouveaux riches", "nouveaux riches", "nouveau riche"),
+    "nouvel arrive": ("nouveaux arrives", "nouveaux arrives", "nouvel arrive"),
+    "nouvelle pauvre": ("nouvelle pauvre", "nouvelle pauvre", "nouveau pauvre"),
+    "nouvelle riche": ("nouvelle riche", "nouvelle riche", "nouveau riche"),
+    "nova": ("novas", "novae", "nova"),
+    "novae": ("novae", "novae", "nova"),
+    "novas": ("novas", "novas", "nova"),
+    "novi homines": ("novi homines", "novi homines", "novus homo"),
+    "novus homo": ("novi homines", "novi homines", "novus homo"),
+    "noxa": ("noxae", "noxae", "noxa"),
+    "noxae": ("noxae", "noxae", "noxa"),
+    "nubecula": ("nubeculae", "nubeculae", "nubecula"),
+    "nubeculae": ("nubeculae", "nubeculae", "nubecula"),
+    "nuclei": ("nuclei", "nuclei", "nucleus"),
+    "nucleoli": ("nucleoli", "nucleoli", "nucleolus"),
+    "nucleolonema": ("nucleolonemas", "nucleolonemata", "nucleolonema"),
+    "nucleolonemas": ("nucleolonemas", "nucleolonemas", "nucleolonema"),
+    "nucleolonemata": ("nucleolonemata", "nucleolonemata", "nucleolonema"),
+    "nucleolus": ("nucleoluses", "nucleoli", "nucleolus"),
+    "nucleoluses": ("nucleoluses", "nucleoluses", "nucleolus"),
+    "nucleus": ("nucleuses", "nuclei", "nucleus"),
+    "nucleuses": ("nucleuses", "nucleuses", "nucleus"),
+    "numen": ("numina", "numina", "numen"),
+    "numina": ("numina", "numina", "numen"),
+    "nuntii": ("nuntii", "nuntii", "nuntius"),
+    "nuntius": ("nuntii", "nuntii", "nuntius"),
+    "nympha": ("nymphae", "nymphae", "nympha"),
+    "nymphae": ("nymphae", "nymphae", "nympha"),
+    "nymphaea": ("nymphaea", "nymphaea", "nymphaeum"),
+    "nymphaeum": ("nymphea", "nymphaea", "nymphaeum"),
+    "nymphea": ("nymphea", "nymphea", "nymphaeum"),
+    "nympheum": ("nymphea", "nymphaea", "nympheum"),
+    "oath": ("oaths", "oaths", "oath"),
+    "oaths": ("oaths", "oaths", "oath"),
+    "obeli": ("obeli", "obeli", "obelus"),
+    "obelus": ("obeli", "obeli", "obelus"),
+    "oboli": ("oboli", "oboli", "obolus"),
+    "obolus": ("oboli", "oboli", "obolus"),
+    "occipita": ("occipita", "occipita", "occiput"),
+    "occiput": ("occiputs", "occipita", "occiput"),
+    "occiputs": ("occiputs", "occiputs", "occiput"),
+    "oceanaria": ("oceanaria", "oceanaria", "oceanarium"),
+    "oceanarium": ("oceanaria", "oceanaria", "oceanarium"),
+    "ocelli": ("ocelli", "ocelli", "ocellus"),
+    "ocellus": ("ocelli", "ocelli", "ocellus"),
+    "octavo": ("octavos", "octavos", "octavo"),
+    "octavos": ("octavos", "octavos", "octavo"),
+    "octohedra": ("octohedra", "octohedra", "octohedron"),
+    "octohedron": ("octohedrons", "octohedra", "octohedron"),
+    "octohedrons": ("octohedrons", "octohedrons", "octohedron"),
+    "octopi": ("octopi", "octopi", "octopus"),
+    "octopodes": ("octopodes", "octopodes", "octopus"),
+    "octopus": ("octopuses", "octopuses", "octopus"),
+    "octopuses": ("octopuses", "octopuses", "octopus"),
+    "oculi": ("oculi", "oculi", "oculus"),
+    "oculus": ("oculi", "oculi", "oculus"),
+    "odea": ("odea", "odea", "odeum"),
+    "odeum": ("odea", "odea", "odeum"),
+    "oedema": ("oedemas", "oedemata", "oedema"),
+    "oedemas": ("oedemas", "oedemas", "oedema"),
+    "oedemata": ("oedemata", "oedemata", "oedema"),
+    "offspring": ("offspring", "offspring", "offspring"),
+    "ogle": ("oglys", "oglys", "ogle"),
+    "oglys": ("oglys", "oglys", "ogle"),
+    "oklahoman": ("oklahomans", "oklahomans", "oklahoman"),
+    "oklahomans": ("oklahomans", "oklahomans", "oklahoman"),
+    "olfactoria": ("olfactoria", "olfactoria", "olfactorium"),
+    "olfactorium": ("olfactoria", "olfactoria", "olfactorium"),
+    "omenta": ("omenta", "omenta", "omentum"),
+    "omentum": ("omenta", "omenta", "omentum"),
+    "ommatidia": ("ommatidia", "ommatidia", "ommatidium"),
+    "ommatidium": ("ommatidia", "ommatidia", "ommatidium"),
+    "onager": ("onagers", "onagri", "onager"),
+    "onagers": ("onagers", "onagers", "onager"),
+    "onagri": ("onagri", "onagri", "onager"),
+    "one": ("some", "some", "one"),
+    "opera magna": ("opera magna", "opera magna", "opus magnum"),
+    "opercula": ("opercula", "opercula", "operculum"),
+    "operculum": ("opercula", "opercula", "operculum"),
+    "ophiophagi": ("ophiophagi", "ophiophagi", "ophiophagus"),
+    "ophiophagus": ("ophiophagi", "ophiophagi", "ophiophagus"),
+    "optima": ("optima", "optima", "optimum"),
+    "optimum": ("optimums", "optima", "optimum"),
+    "optimums": ("optimums", "optimums", "optimum"),
+    "opus": ("opuses", "opuses", "opus"),
+    "opus magnum": ("opera magna", "opera magna", "opus magnum"),
+    "opuscula": ("opuscula", "opuscula", "opusculum"),
+    "opusculum": ("opuscula", "opuscula", "opusculum"),
+    "opuses": ("opuses", "opuses", "opus"),
+    "oratrices": ("oratrices", "oratrices", "oratrix"),
+    "oratrix": ("oratrices", "oratrices", "oratrix"),
+    "oregano": ("oreganos", "oreganos", "oregano"),
+    "oreganos": ("oreganos", "oreganos", "oregano"),
+    "organa": ("organa", "organa", "organon"),
+    "organon": ("organa", "organa", "organon"),
+    "orinoco": ("orinocos", "orinocos", "orinoco"),
+    "orinocos": ("orinocos", "orinocos", "orinoco"),
+    "orlando": ("orlandos", "orlandos", "orlando"),
+    "orlandos": ("orlandos", "orlandos", "orlando"),
+    "orthoceras": ("orthocerata", "orthocerata", "orthoceras"),
+    "orthocerata": ("orthocerata", "orthocerata", "orthoceras"),
+    "oscula": ("oscula", "oscula", "osculum"),
+    "osculum": ("oscula", "oscula", "osculum"),
+    "oslo": ("oslos", "oslos", "oslo"),
+    "oslos": ("oslos", "oslos", "oslo"),
+    "osmateria": ("osmateria", "osmateria", "osmaterium"),
+    "osmaterium": ("osmateria", "osmateria", "osmaterium"),
+    "osmeteria": ("osmeteria", "osmeteria", "osmeterium"),
+    "osmeterium": ("osmeteria", "osmeteria", "osmeterium"),
+    "ossicula": ("ossicula", "ossicula", "ossiculum"),
+    "ossiculum": ("ossicula", "ossicula", "ossiculum"),
+    "osteoclastoma": ("osteoclastomas", "osteoclastomata", "osteoclastoma"),
+    "osteoclastomas": ("osteoclastomas", "osteoclastomas", "osteoclastoma"),
+    "osteoclastomata": ("osteoclastomata", "osteoclastomata", "osteoclastoma"),
+    "osteoma": ("osteomata", "osteomata", "osteoma"),
+    "osteomata": ("osteomata", "osteomata", "osteoma"),
+    "ostia": ("ostia", "ostia", "ostium"),
+    "ostium": ("ostia", "ostia", "ostium"),
+    "oto": ("otos", "otos", "oto"),
+    "otomi": ("otomies", "otomi", "otomi"),
+    "otomies": ("otomies", "otomies", "otomi"),
+    "otos": ("otos", "otos", "oto"),
+    "ottoman": ("ottomans", "ottomans", "ottoman"),
+    "ottomans": ("ottomans", "ottomans", "ottoman"),
+    "ours": ("ours", "ours", "mine"),
+    "ourselves": ("ourselves", "ourselves", "myself"),
+    "ova": ("ova", "ova", "ovum"),
+    "ovaria": ("ovaria", "ovaria", "ovarium"),
+    "ovarium": ("ovaria", "ovaria", "ovarium"),
+    "ovoli": ("ovoli", "ovoli", "ovolo"),
+    "ovolo": ("ovoli", "ovoli", "ovolo"),
+    "ovula": ("ovula", "ovula", "ovulum"),
+    "ovulum": ("ovula", "ovula", "ovulum"),
+    "ovum": ("ova", "ova", "ovum"),
+    "ox": ("oxen", "oxen", "ox"),
+    "oxen": ("oxen", "oxen", "ox"),
+    "oxybapha": ("oxybapha", "oxybapha", "oxybaphon"),
+    "oxybaphon": ("oxybapha", "oxybapha", "oxybaphon"),
+    "oxymora": ("oxymora", "oxymora", "oxymoron"),
+    "oxymoron": ("oxymorons", "oxymora", "oxymoron"),
+    "oxymorons": ("oxymorons", "oxymorons", "oxymoron"),
+    "oxyurides": ("oxyurides", "oxyurides", "oxyuris"),
+    "oxyuris": ("oxyurides", "oxyurides", "oxyuris"),
+    "paha": ("paha", "paha", "paha"),
+    "paisa": ("paisas", "paise", "paisa"),
+    "paisas": ("paisas", "paisas", "paisa"),
+    "paise": ("paise", "paise", "paisa"),
+    "pajamas": ("pajamas", "pajamas", "pajamas"),
+    "pala": ("palae", "palae", "pala"),
+    "palae": ("palae", "palae", "pala"),
+    "palea": ("paleae", "paleae", "palea"),
+    "paleae": ("paleae", "paleae", "palea"),
+    "pali": ("pali", "pali", "palus"),
+    "pallia": ("pallia", "pallia", "pallium"),
+    "pallium": ("pallia", "pallia", "pallium"),
+    "palpebra": ("palpebrae", "palpebrae", "palpebra"),
+    "palpebrae": ("palpebrae", "palpebrae", "palpebra"),
+    "palpi": ("palpi", "palpi", "palpus"),
+    "palpus": ("palpi", "palpi", "palpus"),
+    "palus": ("pali", "pali", "palus"),
+    "panaman": ("panamans", "panamans", "panaman"),
+    "panamans": ("panamans", "panamans", "panaman"),
+    "pangasinan": ("pangasinans", "pangasinanes", "pangasinan"),
+    "pangasinanes": ("pangasinanes", "pangasinanes", "pangasinan"),
+    "pangasinans": ("pangasinans", "pangasinans", "pangasinan"),
+    "panini": ("panini", "panini", "panino"),
+    "panino": ("panini", "panini", "panino"),
+    "panorpa": ("panorpae", "panorpae", "panorpa"),
+    "panorpae": ("panorpae", "panorpae", "panorpa"),
+    "pant": ("pants", "pants", "pant"),
+    "panto": ("pantos", "pantos", "panto"),
+    "pantos": ("pantos", "pantos", "panto"),
+    "pants": ("pants", "pants", "pant"),
+    "paparrazi": ("paparrazi", "paparrazi", "paparrazo"),
+    "paparrazo": ("paparrazi", "paparrazi", "paparrazo"),
+    "papilla": ("papillae", "papillae", "papilla"),
+    "papillae": ("papillae", "papillae", "papilla"),
+    "papilloma": ("papillomata", "papillomata", "papilloma"),
+    "papillomata": ("papillomata", "papillomata", "papilloma"),
+    "papula": ("papulae", "papulae", "papula"),
+    "papulae": ("papulae", "papulae", "papula"),
+    "papyri": ("papyri", "papyri", "papyrus"),
+    "papyrus": ("papyruses", "papyri", "papyrus"),
+    "papyruses": ("papyruses", "papyruses", "papyrus"),
+    "parabola": ("parabolas", "parabolae", "parabola"),
+    "parabolae": ("parabolae", "parabolae", "parabola"),
+    "parabolani": ("parabolani", "parabolani", "parabolanus"),
+    "parabolanus": ("parabolani", "parabolani", "parabolanus"),
+    "parabolas": ("parabolas", "parabolas", "parabola"),
+    "parador": ("paradors", "paradores", "parador"),
+    "paradores": ("paradores", "paradores", "parador"),
+    "paradors": ("paradors", "paradors", "parador"),
+    "paraganglia": ("paraganglia", "paraganglia", "paraganglion"),
+    "paraganglioma": ("paragangliomas", "paragangliomata", "paraganglioma"),
+    "paragangliomas": ("paragangliomas", "paragangliomas", "paraganglioma"),
+    "paragangliomata": ("paragangliomata", "paragangliomata", "paraganglioma"),
+    "paraganglion": ("paraganglia", "paraganglia", "paraganglion"),
+    "paraglossa": ("paraglossae", "paraglossae", "paraglossa"),
+    "paraglossae": ("paraglossae", "paraglossae", "paraglossa"),
+    "paramaribo": ("paramaribos", "paramaribos", "paramaribo"),
+    "paramaribos": ("paramaribos", "paramaribos", "paramaribo"),
+    "paranuclei": ("paranuclei", "paranuclei", "paranucleus"),
+    "paranucleus": ("paranuclei", "paranuclei", "paranucleus"),
+    "parapleura": ("parapleura", "parapleura", "parapleura"),
+    "parapleurum": ("parapleura", "parapleura", "parapleurum"),
+    "parapsides": ("parapsides", "parapsides", "parapsis"),
+    "parapsis": ("parapsides", "parapsides", "parapsis"),
+    "paraselenae": ("paraselenae", "paraselenae", "paraselene"),
+    "paraselene": ("paraselenae", "paraselenae", "paraselene"),
+    "parc ferme": ("parcs fermes", "parcs fermes", "parc ferme"),
+    "parcs fermes": ("parcs fermes", "parcs fermes", "parc ferme"),
+    "pardusco": ("parduscos", "parduscos", "pardusco"),
+    "parduscos": ("parduscos", "parduscos", "pardusco"),
+    "parenchyma": ("parenchymata", "parenchymata", "parenchyma"),
+    "parenchymata": ("parenchymata", "parenchymata", "parenchyma"),
+    "parerga": ("parerga", "parerga", "parergon"),
+    "parergon": ("parerga", "parerga", "parergon"),
+    "parhelia": ("parhelia", "parhelia", "parhelion"),
+    "parhelion": ("parhelions", "parhelia", "parhelion"),
+    "parhelions": ("parhelions", "parhelions", "parhelion"),
+    "paries": ("parietes", "parietes", "paries"),
+    "parietes": ("parietes", "parietes", "paries"),
+    "parisa": ("parisa", "parisa", "parison"),
+    "parison": ("parisa", "parisa", "parison"),
+    "parmese": ("parmese", "parmese", "parmese"),
+    "parnas": ("parnassim", "parnassim", "parnas"),
+    "parnass": ("parnassim", "parnassim", "parnass"),
+    "parnassim": ("parnassim", "parnassim", "parnas"),
+    "parvenu": ("parvenus", "parvenus", "parvenu"),
+    "parvenus": ("parvenus", "parvenus", "parvenu"),
+    "pasteurella": ("pasteurellas", "pasteurellae", "pasteurella"),
+    "pasteurellae": ("pasteurellae", "pasteurellae", "pasteurella"),
+    "pasteurellas": ("pasteurellas", "pasteurellas", "pasteurella"),
+    "pastorale": ("pastorales", "pastorali", "pastorale"),
+    "pastorales": ("pastorales", "pastorales", "pastorale"),
+    "pastorali": ("pastorali", "pastorali", "pastorale"),
+    "patagia": ("patagia", "patagia", "patagium"),
+    "patagium": ("patagia", "patagia", "patagium"),
+    "patera": ("paterae", "paterae", "patera"),
+    "paterae": ("paterae", "paterae", "patera"),
+    "path": ("paths", "paths", "path"),
+    "pathos": ("pathoses", "pathoses", "pathos"),
+    "pathoses": ("pathoses", "pathoses", "pathos"),
+    "paths": ("paths", "paths", "path"),
+    "paxilla": ("paxillae", "paxillae", "paxilla"),
+    "paxillae": ("paxillae", "paxillae", "paxilla"),
+    "pecia": ("pecias", "peciae", "pecia"),
+    "peciae": ("peciae", "peciae", "pecia"),
+    "pecias": ("pecias", "pecias", "pecia"),
+    "pecten": ("pectens", "pectines", "pecten"),
+    "pectens": ("pectens", "pectens", "pecten"),
+    "pectines": ("pectines", "pectines", "pecten"),
+    "pectora": ("pectora", "pectora", "pectus"),
+    "pectus": ("pectora", "pectora", "pectus"),
+    "pedalo": ("pedalos", "pedalos", "pedalo"),
+    "pedalos": ("pedalos", "pedalos", "pedalo"),
+    "pedes": ("pedes", "pedes", "pes"),
+    "pedia": ("pedia", "pedia", "pedion"),
+    "pedicellaria": ("pedicellariae", "pedicellariae", "pedicellaria"),
+    "pedicellariae": ("pedicellariae", "pedicellariae", "pedicellaria"),
+    "pediluvia": ("pediluvia", "pediluvia", "pediluvium"),
+    "pediluvium": ("pediluvia", "pediluvia", "pediluvium"),
+    "pedion": ("pedia", "pedia", "pedion"),
+    "pekingese": ("pekingese", "pekingese", "pekingese"),
+    "pelta": ("peltae", "peltae", "pelta"),
+    "peltae": ("peltae", "peltae", "pelta"),
+    "pelves": ("pelves", "pelves", "pelvis"),
+    "pelvis": ("pelvises", "pelves", "pelvis"),
+    "pelvises": ("pelvises", "pelvises", "pelvis"),
+    "pence": ("pence", "pence", "penny"),
+    "pendula": ("pendula", "pendula", "pendulum"),
+    "pendulum": ("pendulums", "pendula", "pendulum"),
+    "pendulums": ("pendulums", "pendulums", "pendulum"),
+    "penes": ("penes", "penes", "penis"),
+    "pengo": ("pengo", "pengoes", "pengo"),
+    "pengoes": ("pengoes", "pengoes", "pengo"),
+    "penicilli": ("penicilli", "penicilli", "penicillus"),
+    "penicillus": ("penicilli", "penicilli", "penicillus"),
+    "peninsula": ("peninsulas", "peninsulae", "peninsula"),
+    "peninsulae": ("peninsulae", "peninsulae", "peninsula"),
+    "peninsulas": ("peninsulas", "peninsulas", "peninsula"),
+    "penis": ("penises", "penes", "penis"),
+    "penises": ("penises", "penises", "penis"),
+    "penni": ("pennia", "pennia", "penni"),
+    "pennia": ("pennia", "pennia", "penni"),
+    "pennies": ("pennies", "pennies", "penny"),
+    "penny": ("pennies", "pence", "penny"),
+    "pensieri": ("pensieri", "pensieri", "pensiero"),
+    "pensiero": ("pensieri", "pensieri", "pensiero"),
+    "people": ("people", "people", "person"),
+    "percepta": ("percepta", "percepta", "perceptum"),
+    "perceptum": ("percepta", "percepta", "perceptum"),
+    "peridia": ("peridia", "peridia", "peridium"),
+    "peridium": ("peridia", "peridia", "peridium"),
+    "perikarya": ("perikarya", "perikarya", "perikaryon"),
+    "perikaryon": ("perikarya", "perikarya", "perikaryon"),
+    "perithecia": ("perithecia", "perithecia", "perithecium"),
+    "perithecium": ("perithecia", "perithecia", "perithecium"),
+    "pernio": ("perniones", "perniones", "pernio"),
+    "perniones": ("perniones", "perniones", "pernio"),
+    "peronia": ("peronia", "peronia", "peronium"),
+    "peronium": ("peronia", "peronia", "peronium"),
+    "perradii": ("perradii", "perradii", "perradius"),
+    "perradius": ("perradii", "perradii", "perradius"),
+    "person": ("people", "persons", "person"),
+    "persona": ("personas", "personae", "persona"),
+    "personae": ("personae", "personae", "persona"),
+    "personas": ("personas", "personas", "persona"),
+    "persons": ("persons", "persons", "person"),
+    "pes": ("pedes", "pedes", "pes"),
+    "phalanges": ("phalanges", "phalanges", "phalanx"),
+    "phalangia": ("phalangia", "phalangia", "phalangium"),
+    "phalangium": ("phalangia", "phalangia", "phalangium"),
+    "phalanx": ("phalanxes", "phalanges", "phalanx"),
+    "phalanxes": ("phalanxes", "phalanxes", "phalanx"),
+    "phalli": ("phalli", "phalli", "phallus"),
+    "phalloi": ("phalloi", "phalloi", "phallos"),
+    "phallos": ("phalloi", "phalloi", "phallos"),
+    "phallus": ("phalluses", "phalli", "phallus"),
+    "phalluses": ("phalluses", "phalluses", "phallus"),
+    "pharmakoi": ("pharmakoi", "pharmakoi", "pharmakos"),
+    "pharmakos": ("pharmakoi", "pharmakoi", "pharmakos"),
+    "phenomena": ("phenomena", "phenomena", "phenomenon"),
+    "phenomenon": ("phenomena", "phenomena", "phenomenon"),
+    "phlegmasia": ("phlegmasiae", "phlegmasiae", "phlegmasia"),
+    "phlegmasiae": ("phlegmasiae", "phlegmasiae", "phlegmasia"),
+    "phoca": ("phocas", "phocae", "phoca"),
+    "phocae": ("phocae", "phocae", "phoca"),
+    "phocas": ("phocas", "phocas", "phoca"),
+    "pholades": ("pholades", "pholades", "pholas"),
+    "pholas": ("pholades", "pholades", "pholas"),
+    "photo": ("photos", "photos", "photo"),
+    "photos": ("photos", "photos", "photo"),
+    "phototaxes": ("phototaxes", "phototaxes", "phototaxis"),
+    "phototaxis": ("phototaxes", "phototaxes", "phototaxis"),
+    "phragma": ("phragmata", "phragmata", "phragma"),
+    "phragmata": ("phragmata", "phragmata", "phragma"),
+    "phren": ("phrenes", "phrenes", "phren"),
+    "phrenes": ("phrenes", "phrenes", "phren"),
+    "phyla": ("phyla", "phyla", "phylum"),
+    "phylae": ("phylae", "phylae", "phyle"),
+    "phyle": ("phylae", "phylae", "phyle"),
+    "phyllobranchia": ("phyllobranchiae", "phyllobranchiae", "phyllobranchia"),
+    "phyllobranchiae": ("phyllobranchiae", "phyllobranchiae", "phyllobranchia"),
+    "phylum": ("phylums", "phyla", "phylum"),
+    "phylums": ("phylums", "phylums", "phylum"),
+    "phyma": ("phymata", "phymata", "phyma"),
+    "phymata": ("phymata", "phymata", "phyma"),
+    "phyogemmaria": ("phyogemmaria", "phyogemmaria", "phyogemmarium"),
+    "phyogemmarium": ("phyogemmaria", "phyogemmaria", "phyogemmarium"),
+    "piani": ("piani", "piani", "piano"),
+    "piano": ("pianos", "piani", "piano"),
+    "pianos": ("pianos", "pianos", "piano"),
+    "pickerel": ("pickerels", "pickerel", "pickerel"),
+    "pickerels": ("pickerels", "pickerels", "pickerel"),
+    "pied a terre": ("pieds a terre", "pieds a terre", "pied a terre"),
+    "pied noir": ("pieds noirs", "pieds noirs", "pied noir"),
+    "piedmontese": ("piedmontese", "piedmontese", "piedmontese"),
+    "pieds a terre": ("pieds a terre", "pieds a terre", "pied a terre"),
+    "pieds noirs": ("pieds noirs", "pieds noirs", "pied noir"),
+    "pietra": ("pietre", "pietre", "pietra"),
+    "pietre": ("pietre", "pietre", "pietra"),
+    "pifferari": ("pifferari", "pifferari", "pifferaro"),
+    "pifferaro": ("pifferari", "pifferari", "pifferaro"),
+    "pike": ("pikes", "pike", "pike"),
+    "pikes": ("pikes", "pikes", "pike"),
+    "pilei": ("pilei", "pilei", "pileus"),
+    "pileus": ("pilei", "pilei", "pileus"),
+    "pili": ("pili", "pili", "pilus"),
+    "pilleis": ("pilleis", "pilleis", "pillie"),
+    "pillie": ("pilleis", "pilleis", "pillie"),
+    "pilus": ("pili", "pili", "pilus"),
+    "pimento": ("pimentos", "pimentos", "pimento"),
+    "pimentos": ("pimentos", "pimentos", "pimento"),
+    "pina colada": ("pina coladas", "pinas coladas", "pina colada"),
+    "pina coladas": ("pina coladas", "pina coladas", "pina colada"),
+    "pinaces": ("pinaces", "pinaces", "pinax"),
+    "pinas coladas": ("pinas coladas", "pinas coladas", "pina colada"),
+    "pinax": ("pinaces", "pinaces", "pinax"),
+    "pincer": ("pincers", "pincers", "pincer"),
+    "pincers": ("pincers", "pincers", "pincer"),
+    "pineta": ("pineta", "pineta", "pinetum"),
+    "pinetum": ("pinetums", "pineta", "pinetum"),
+    "pinetums": ("pinetums", "pinetums", "pinetum"),
+    "pingo": ("pingos", "pingoes", "pingo"),
+    "pingoes": ("pingoes", "pingoes", "pingo"),
+    "pingos": ("pingos", "pingos", "pingo"),
+    "pinna": ("pinnas", "pinnae", "pinna"),
+    "pinnae": ("pinnae", "pinnae", "pinna"),
+    "pinnas": ("pinnas", "pinnas", "pinna"),
+    "pinon": ("pinons", "pinones", "pinon"),
+    "pinones": ("pinones", "pinones", "pinon"),
+    "pinons": ("pinons", "pinons", "pinon"),
+    "pinto": ("pintos", "pintos", "pinto"),
+    "pintos": ("pintos", "pintos", "pinto"),
+    "pipkrake": ("pipkrakes", "pipkraker", "pipkrake"),
+    "pipkraker": ("pipkraker", "pipkraker", "pipkrake"),
+    "pipkrakes": ("pipkrakes", "pipkrakes", "pipkrake"),
+    "pirrites": ("pirrites", "pirrites", "pyrites"),
+    "piscina": ("piscinas", "piscinae", "piscina"),
+    "piscinae": ("piscinae", "piscinae", "piscina"),
+    "piscinas": ("piscinas", "piscinas", "piscina"),
+    "pistillidia": ("pistillidia", "pistillidia", "pistillidium"),
+    "pistillidium": ("pistillidia", "pistillidia", "pistillidium"),
+    "pistoiese": ("pistoiese", "pistoiese", "pistoiese"),
+    "pithoi": ("pithoi", "pithoi", "pithos"),
+    "pithos": ("pithoi", "pithoi", "pithos"),
+    "pizza": ("pizzas", "pizze", "pizza"),
+    "pizzas": ("pizzas", "pizzas", "pizza"),
+    "pizze": ("pizze", "pizze", "pizza"),
+    "placebo": ("placebos", "placeboes", "placebo"),
+    "placeboes": ("placeboes", "placeboes", "placebo"),
+    "placebos": ("placebos", "placebos", "placebo"),
+    "placita": ("placita", "placita", "placitum"),
+    "placitum": ("placita", "placita", "placitum"),
+    "planctus": ("planctus", "planctus", "planctus"),
+    "plankter": ("plankton", "plankton", "plankter"),
+    "plankton": ("plankton", "plankton", "plankter"),
+    "planula": ("planulae", "planulae", "planula"),
+    "planulae": ("planulae", "planulae", "planula"),
+    "plasmalemma": ("plasmalemmas", "plasmalemmae", "plasmalemma"),
+    "plasmalemmae": ("plasmalemmae", "plasmalemmae", "plasmalemma"),
+    "plasmalemmas": ("plasmalemmas", "plasmalemmas", "plasmalemma"),
+    "plasmodia": ("plasmodia", "plasmodia", "plasmodium"),
+    "plasmodium": ("plasmodia", "plasmodia", "plasmodium"),
+    "plasmolytica": ("plasmolytica", "plasmolytica", "plasmolyticum"),
+    "plasmolyticum": ("plasmolytica", "plasmolytica", "plasmolyticum"),
+    "plasmoma": ("plasmomata", "plasmomata", "plasmoma"),
+    "plasmomata": ("plasmomata", "plasmomata", "plasmoma"),
+    "plateau": ("plateaus", "plateaux", "plateau"),
+    "plateaus": ("plateaus", "plateaus", "plateau"),
+    "plateaux": ("plateaux", "plateaux", "plateau"),
+    "platypodes": ("platypodes", "platypodes", "platypus"),
+    "platypus": ("platypuses", "platypodes", "platypus"),
+    "platypuses": ("platypuses", "platypuses", "platypus"),
+    "pleco": ("plecos", "plecos", "pleco"),
+    "plecos": ("plecos", "plecos", "pleco"),
+    "plectra": ("plectra", "plectra", "plectrum"),
+    "plectrum": ("plectra", "plectra", "plectrum"),
+    "plenaria": ("plenaria", "plenaria", "plenarium"),
+    "plenarium": ("plenaria", "plenaria", "plenarium"),
+    "plesiosauri": ("plesiosauri", "plesiosauri", "plesiosaurus"),
+    "plesiosaurus": ("plesiosauri", "plesiosauri", "plesiosaurus"),
+    "plether": ("plether", "plether", "plethron"),
+    "plethra": ("plethra", "plethra", "plethron"),
+    "plethron": ("plethra", "plether", "plethron"),
+    "pleura": ("pleura", "pleura", "pleura"),
+    "pleuron": ("pleura", "pleura", "pleuron"),
+    "pleurum": ("pleura", "pleura", "pleurum"),
+    "plexus": ("plexuses", "plexus", "plexus"),
+    "plexuses": ("plexuses", "plexuses", "plexus"),
+    "plica": ("plicae", "plicae", "plica"),
+    "plicae": ("plicae", "plicae", "plica"),
+    "pliers": ("pliers", "pliers", "pliers"),
+    "ploshchadka": ("ploshchadki", "ploshchadki", "ploshchadka"),
+    "ploshchadki": ("ploshchadki", "ploshchadki", "ploshchadka"),
+    "plurale tantum": ("pluralia tantum", "pluralia tantum", "plurale tantum"),
+    "pluralia tantum": ("pluralia tantum", "pluralia tantum", "plurale tantum"),
+    "plutei": ("plutei", "plutei", "pluteus"),
+    "pluteus": ("plutei", "plutei", "pluteus"),
+    "pluto": ("plutos", "plutos", "pluto"),
+    "plutos": ("plutos", "plutos", "pluto"),
+    "pneumothoraces": ("pneumothoraces", "pneumothoraces", "pneumothorax"),
+    "pneumothorax": ("pneumothoraxes", "pneumothoraces", "pneumothorax"),
+    "pneumothoraxes": ("pneumothoraxes", "pneumothoraxes", "pneumothorax"),
+    "po": ("poes", "poes", "po"),
+    "poblador": ("pobladores", "pobladores", "poblador"),
+    "pobladores": ("pobladores", "pobladores", "poblador"),
+    "pocula": ("pocula", "pocula", "poculum"),
+    "poculum": ("pocula", "pocula", "poculum"),
+    "podere": ("poderi", "poderi", "podere"),
+    "poderi": ("poderi", "poderi", "podere"),
+    "podetia": ("podetia", "podetia", "podetium"),
+    "podetium": ("podetia", "podetia", "podetium"),
+    "podia": ("podia", "podia", "podium"),
+    "podion": ("podia", "podia", "podion"),
+    "podium": ("podiums", "podia", "podium"),
+    "podiums": ("podiums", "podiums", "podium"),
+    "poe": ("poes", "poes", "poe"),
+    "poes": ("poes", "poes", "po"),
+    "pogo": ("pogos", "pogos", "pogo"),
+    "pogos": ("pogos", "pogos", "pogo"),
+    "poise": ("poises", "poise", "poise"),
+    "poises": ("poises", "poises", "poise"),
+    "polis": ("polises", "polises", "polis"),
+    "polises": ("polises", "polises", "polis"),
+    "politbureau": ("politbureaus", "politbureaux", "politbureau"),
+    "politbureaus": ("politbureaus", "politbureaus", "politbureau"),
+    "politbureaux": ("politbureaux", "politbureaux", "politbureau"),
+    "politico": ("politicos", "politicoes", "politico"),
+    "politicoes": ("politicoes", "politicoes", "politico"),
+    "politicos": ("politicos", "politicos", "politico"),
+    "pollex": ("pollices", "pollices", "pollex"),
+    "pollices": ("pollices", "pollices", "pollex"),
+    "pollinaria": ("pollinaria", "pollinaria", "pollinarium"),
+    "pollinarium": ("pollinaria", "pollinaria", "pollinarium"),
+    "pollinia": ("pollinia", "pollinia", "pollinium"),
+    "pollinium": ("pollinia", "pollinia", "pollinium"),
+    "polo": ("polos", "polos", "polo"),
+    "polonese": ("polonese", "polonese", "polonese"),
+    "polos": ("polos", "polos", "polo"),
+    "polythecia": ("polythecia", "polythecia", "polythecium"),
+    "polythecium": ("polythecia", "polythecia", "polythecium"),
+    "pomme de terre": ("pommes de terre", "pommes de terre", "pomme de terre"),
+    "pommes de terre": ("pommes de terre", "pommes de terre", "pomme de terre"),
+    "poncho": ("ponchos", "ponchos", "poncho"),
+    "ponchos": ("ponchos", "ponchos", "poncho"),
+    "pontifex": ("pontifexes", "pontifices", "pontifex"),
+    "pontifexes": ("pontifexes", "pontifexes", "pontifex"),
+    "pontifices": ("pontifices", "pontifices", "pontifex"),
+    "porcini": ("porcini", "porcini", "porcino"),
+    "porcino": ("porcini", "porcini", "porcino"),
+    "poria": ("poria", "poria", "porion"),
+    "porion": ("poria", "poria", "porion"),
+    "porron": ("porrons", "porrones", "porron"),
+    "porrones": ("porrones", "porrones", "porron"),
+    "porrons": ("porrons", "porrons", "porron"),
+    "port a beul": ("puirt a beul", "puirt a beul", "port a beul"),
+    "port de bras": ("ports de bras", "ports de bras", "port de bras"),
+    "port-a-beul": ("puirt-a-beul", "puirt-a-beul", "port-a-beul"),
+    "portico": ("porticos", "porticoes", "portico"),
+    "porticoes": ("porticoes", "porticoes", "portico"),
+    "porticos": ("porticos", "porticos", "portico"),
+    "portiforia": ("portiforia", "portiforia", "portiforium"),
+    "portiforium": ("portiforia", "portiforia", "portiforium"),
+    "portmanteau": ("portmanteaus", "portmanteaux", "portmanteau"),
+    "portmanteaus": ("portmanteaus", "portmanteaus", "portmanteau"),
+    "portmanteaux": ("portmanteaux", "portmanteaux", "portmanteau"),
+    "porto": ("portos", "portos", "porto"),
+    "porto novo": ("porto novos", "porto novos", "porto novo"),
+    "porto novos": ("porto novos", "porto novos", "porto novo"),
+    "porto-novo": ("porto-novos", "porto-novos", "porto-novo"),
+    "porto-novos": ("porto-novos", "porto-novos", "porto-novo"),
+    "portos": ("portos", "portos", "porto"),
+    "portrait parle": ("portraits parles", "portraits parles", "portrait parle"),
+    "portraits parles": ("portraits parles", "portraits parles", "portrait parle"),
+    "ports de bras": ("ports de bras", "ports de bras", "port de bras"),
+    "portuguese": ("portuguese", "portuguese", "portuguese"),
+    "pos": ("pos", "pos", "po"),
+    "postnati": ("postnati", "postnati", "postnatus"),
+    "postnatus": ("postnati", "postnati", "postnatus"),
+    "postpubes": ("postpubes", "postpubes", "postpubis"),
+    "postpubis": ("postpubes", "postpubes", "postpubis"),
+    "postulata": ("postulata", "postulata", "postulatum"),
+    "postulatum": ("postulata", "postulata", "postulatum"),
+    "potato": ("potatoes", "potatoes", "potato"),
+    "potatoes": ("potatoes", "potatoes", "potato"),
+    "potestas": ("potestates", "potestates", "potestas"),
+    "potestates": ("potestates", "potestates", "potestas"),
+    "pox": ("pox", "pox", "pox"),
+    "praecognita": ("praecognita", "praecognita", "praecognitum"),
+    "praecognitum": ("praecognita", "praecognita", "praecognitum"),
+    "pragma": ("pragmas", "pragmata", "pragma"),
+    "pragmas": ("pragmas", "pragmas", "pragma"),
+    "pragmata": ("pragmata", "pragmata", "pragma"),
+    "precis": ("precis", "precis", "precis"),
+    "precognita": ("precognita", "precognita", "precognitum"),
+    "precognitum": ("precognita", "precognita", "precognitum"),
+    "premier danseur": ("premiers danseurs", "premiers danseurs", "premier danseur"),
+    "premiers danseurs": ("premiers danseurs", "premiers danseurs", "premier danseur"),
+    "prepenna": ("prepennae", "prepennae", "prepenna"),
+    "prepennae": ("prepennae", "prepennae", "prepenna"),
+    "prima ballerina": ("prima ballerinas", "prime ballerine", "prima ballerina"),
+    "prima ballerinas": ("prima ballerinas", "prima ballerinas", "prima ballerina"),
+    "prima donna": ("prima donnas", "prime donne", "prima donna"),
+    "prima donnas": ("prima donnas", "prima donnas", "prima donna"),
+    "prime ballerine": ("prime ballerine", "prime ballerine", "prima ballerina"),
+    "prime donne": ("prime donne", "prime donne", "prima donna"),
+    "primigravida": ("primigravidae", "primigravidae", "primigravida"),
+    "primigravidae": ("primigravidae", "primigravidae", "primigravida"),
+    "primordia": ("primordia", "primordia", "primordium"),
+    "primordium": ("primordia", "primordia", "primordium"),
+    "principia": ("principia", "principia", "principium"),
+    "principium": ("principia", "principia", "principium"),
+    "pro": ("pros", "pros", "pro"),
+    "proaves": ("proaves", "proaves", "proavis"),
+    "proavis": ("proaves", "proaves", "proavis"),
+    "proboscides": ("proboscides", "proboscides", "proboscis"),
+    "proboscis": ("proboscises", "proboscides", "proboscis"),
+    "proboscises": ("proboscises", "proboscises", "proboscis"),
+    "proceedings": ("proceedings", "proceedings", "proceedings"),
+    "procoelia": ("procoeliae", "procoeliae", "procoelia"),
+    "procoeliae": ("procoeliae", "procoeliae", "procoelia"),
+    "prodromi": ("prodromi", "prodromi", "prodromus"),
+    "prodromus": ("prodromi", "prodromi", "prodromus"),
+    "proferens": ("proferentes", "proferentes", "proferens"),
+    "proferentes": ("proferentes", "proferentes", "proferens"),
+    "profluvia": ("profluvia", "profluvia", "profluvium"),
+    "profluvium": ("profluvia", "profluvia", "profluvium"),
+    "proglottides": ("proglottides", "proglottides", "proglottis"),
+    "proglottis": ("proglottides", "proglottides", "proglottis"),
+    "programma": ("programmata", "programmata", "programma"),
+    "programmata": ("programmata", "programmata", "programma"),
+    "progymnasia": ("progymnasia", "progymnasia", "progymnasium"),
+    "progymnasium": ("progymnasia", "progymnasia", "progymnasium"),
+    "progymnasma": ("progymnasmata", "progymnasmata", "progymnasma"),
+    "progymnasmata": ("progymnasmata", "progymnasmata", "progymnasma"),
+    "prokarya": ("prokarya", "prokarya", "prokaryon"),
+    "prokaryon": ("prokarya", "prokarya", "prokaryon"),
+    "prolabia": ("prolabia", "prolabia", "prolabium"),
+    "prolabium": ("prolabia", "prolabia", "prolabium"),
+    "prolegomena": ("prolegomena", "prolegomena", "prolegomenon"),
+    "prolegomenon": ("prolegomena", "prolegomena", "prolegomenon"),
+    "promeropes": ("promeropes", "promeropes", "promerops"),
+    "promerops": ("promeropes", "promeropes", "promerops"),
+    "propleura": ("propleura", "propleura", "propleuron"),
+    "propleuron": ("propleura", "propleura", "propleuron"),
+    "propodia": ("propodia", "propodia", "propodium"),
+    "propodium": ("propodia", "propodia", "propodium"),
+    "propositi": ("propositi", "propositi", "propositus"),
+    "propositus": ("propositi", "propositi", "propositus"),
+    "propria": ("propria", "propria", "proprium"),
+    "proprium": ("propria", "propria", "proprium"),
+    "propyla": ("propyla", "propyla", "propylon"),
+    "propylaea": ("propylaea", "propylaea", "propylaeum"),
+    "propylaeum": ("propylaea", "propylaea", "propylaeum"),
+    "propylon": ("propylons", "propyla", "propylon"),
+    "propylons": ("propylons", "propylons", "propylon"),
+    "prora": ("prorae", "prorae", "prora"),
+    "prorae": ("prorae", "prorae", "prora"),
+    "pros": ("pros", "pros", "pro"),
+    "prosa": ("prosae", "prosae", "prosa"),
+    "prosae": ("prosae", "prosae", "prosa"),
+    "proscenia": ("proscenia", "proscenia", "proscenium"),
+    "proscenium": ("proscenia", "proscenia", "proscenium"),
+    "proscolla": ("proscollae", "proscollae", "proscolla"),
+    "proscollae": ("proscollae", "proscollae", "proscolla"),
+    "prosecutrices": ("prosecutrices", "prosecutrices", "prosecutrix"),
+    "prosecutrix": ("prosecutrices", "prosecutrices", "prosecutrix"),
+    "prosencephala": ("prosencephala", "prosencephala", "prosencephalon"),
+    "prosencephalon": ("prosencephala", "prosencephala", "prosencephalon"),
+    "proseucha": ("proseuchae", "proseuchae", "proseucha"),
+    "proseuchae": ("proseuchae", "proseuchae", "proseucha"),
+    "prosodiencephala": ("prosodiencephala", "prosodiencephala", "prosodiencephalon"),
+    "prosodiencephalon": ("prosodiencephala", "prosodiencephala", "prosodiencephalon"),
+    "prosopia": ("prosopia", "prosopia", "prosopium"),
+    "prosopium": ("prosopia", "prosopia", "prosopium"),
+    "prospectus": ("prospectuses", "prospectus", "prospectus"),
+    "prospectuses": ("prospectuses", "prospectuses", "prospectus"),
+    "prosula": ("prosulae", "prosulae", "prosula"),
+    "prosulae": ("prosulae", "prosulae", "prosula"),
+    "protarsi": ("protarsi", "protarsi", "protarsus"),
+    "protarsus": ("protarsi", "protarsi", "protarsus"),
+    "prothalli": ("prothalli", "prothalli", "prothallus"),
+    "prothallia": ("prothallia", "prothallia", "prothallium"),
+    "prothallium": ("prothallia", "prothallia", "prothallium"),
+    "prothallus": ("prothalli", "prothalli", "prothallus"),
+    "protococci": ("protococci", "protococci", "protococcus"),
+    "protococcus": ("protococci", "protococci", "protococcus"),
+    "protoma": ("protomas", "protomae", "protoma"),
+    "protomae": ("protomae", "protomae", "protoma"),
+    "protomas": ("protomas", "protomas", "protoma"),
+    "protonema": ("protonemata", "protonemata", "protonema"),
+    "protonemata": ("protonemata", "protonemata", "protonema"),
+    "prototypa": ("prototypa", "prototypa", "prototypon"),
+    "prototypon": ("prototypons", "prototypa", "prototypon"),
+    "prototypons": ("prototypons", "prototypons", "prototypon"),
+    "protypa": ("protypa", "protypa", "protypon"),
+    "protypon": ("protypa", "protypa", "protypon"),
+    "proviso": ("provisos", "provisoes", "proviso"),
+    "provisoes": ("provisoes", "provisoes", "proviso"),
+    "provisos": ("provisos", "provisos", "proviso"),
+    "prytan": ("prytan", "prytan", "prytanis"),
+    "prytanes": ("prytanes", "prytanes", "prytanis"),
+    "prytanis": ("prytanes", "prytan", "prytanis"),
+    "psammoma": ("psammomata", "psammomata", "psammoma"),
+    "psammomata": ("psammomata", "psammomata", "psammoma"),
+    "pseudopodia": ("pseudopodia", "pseudopodia", "pseudopodium"),
+    "pseudopodium": ("pseudopodia", "pseudopodia", "pseudopodium"),
+    "pseudostoma": ("pseudostomata", "pseudostomata", "pseudostoma"),
+    "pseudostomata": ("pseudostomata", "pseudostomata", "pseudostoma"),
+    "psycho": ("psychos", "psychos", "psycho"),
+    "psychos": ("psychos", "psychos", "psycho"),
+    "psydracia": ("psydracia", "psydracia", "psydracium"),
+    "psydracium": ("psydracia", "psydracia", "psydracium"),
+    "pteroma": ("pteromata", "pteromata", "pteroma"),
+    "pteromata": ("pteromata", "pteromata", "pteroma"),
+    "pteropi": ("pteropi", "pteropi", "pteropus"),
+    "pteropus": ("pteropi", "pteropi", "pteropus"),
+    "pteryla": ("pterylae", "pterylae", "pteryla"),
+    "pterylae": ("pterylae", "pterylae", "pteryla"),
+    "pueblo": ("pueblos", "pueblos", "pueblo"),
+    "pueblos": ("pueblos", "pueblos", "pueblo"),
+    "puirt a beul": ("puirt a beul", "puirt a beul", "port a beul"),
+    "puirt-a-beul": ("puirt-a-beul", "puirt-a-beul", "port-a-beul"),
+    "pul": ("puls", "puli", "pul"),
+    "puli": ("puli", "puli", "pul"),
+    "pulli": ("pulli", "pulli", "pullus"),
+    "pullus": ("pulli", "pulli", "pullus"),
+    "pulmonaria": ("pulmonaria", "pulmonaria", "pulmonarium"),
+    "pulmonarium": ("pulmonaria", "pulmonaria", "pulmonarium"),
+    "puls": ("puls", "puls", "pul"),
+    "pulsella": ("pulsella", "pulsella", "pulsellum"),
+    "pulsellum": ("pulsella", "pulsella", "pulsellum"),
+    "pulveratrices": ("pulveratrices", "pulveratrices", "pulveratrix"),
+    "pulveratrix": ("pulveratrices", "pulveratrices", "pulveratrix"),
+    "puncta": ("puncta", "puncta", "punctum"),
+    "punctum": ("puncta", "puncta", "punctum"),
+    "punti blanchi": ("punti blanchi", "punti blanchi", "punto blanco"),
+    "punto blanco": ("puntos blancos", "punti blanchi", "punto blanco"),
+    "puntos blancos": ("puntos blancos", "puntos blancos", "punto blanco"),
+    "pupa": ("pupae", "pupae", "pupa"),
+    "pupae": ("pupae", "pupae", "pupa"),
+    "purlieu": ("purlieus", "purlieux", "purlieu"),
+    "purlieus": ("purlieus", "purlieus", "purlieu"),
+    "purlieux": ("purlieux", "purlieux", "purlieu"),
+    "purum": ("purums", "purum", "purum"),
+    "purums": ("purums", "purums", "purum"),
+    "putti": ("putti", "putti", "putto"),
+    "putto": ("putti", "putti", "putto"),
+    "puttony": ("puttonys", "puttonys", "puttony"),
+    "puttonys": ("puttonys", "puttonys", "puttony"),
+    "pycnia": ("pycnia", "pycnia", "pycnium"),
+    "pycnides": ("pycnides", "pycnides", "pycnis"),
+    "pycnidia": ("pycnidia", "pycnidia", "pycnidium"),
+    "pycnidium": ("pycnidia", "pycnidia", "pycnidium"),
+    "pycnis": ("pycnides", "pycnides", "pycnis"),
+    "pycnium": ("pycnia", "pycnia", "pycnium"),
+    "pyjamas": ("pyjamas", "pyjamas", "pyjamas"),
+    "pyla": ("pylae", "pylae", "pyla"),
+    "pylae": ("pylae", "pylae", "pyla"),
+    "pyralides": ("pyralides", "pyralides", "pyralis"),
+    "pyralis": ("pyralides", "pyralides", "pyralis"),
+    "pyramidia": ("pyramidia", "pyramidia", "pyramidion"),
+    "pyramidion": ("pyramidions", "pyramidia", "pyramidion"),
+    "pyramidions": ("pyramidions", "pyramidions", "pyramidion"),
+    "pyrexia": ("pyrexiae", "pyrexiae", "pyrexia"),
+    "pyrexiae": ("pyrexiae", "pyrexiae", "pyrexia"),
+    "pyritae": ("pyritae", "pyritae", "pyrites"),
+    "pyrites": ("pyritae", "pirrites", "pyrites"),
+    "pyrophori": ("pyrophori", "pyrophori", "pyrophorus"),
+    "pyrophorus": ("pyrophori", "pyrophori", "pyrophorus"),
+    "pyxidia": ("pyxidia", "pyxidia", "pyxidium"),
+    "pyxidium": ("pyxidia", "pyxidia", "pyxidium"),
+    "quadratrices": ("quadratrices", "quadratrices", "quadratrix"),
+    "quadratrix": ("quadratrices", "quadratrices", "quadratrix"),
+    "quaesita": ("quaesita", "quaesita", "quaesitum"),
+    "quaesitum": ("quaesita", "quaesita", "quaesitum"),
+    "quanta": ("quanta", "quanta", "quantum"),
+    "quantum": ("quantums", "quanta", "quantum"),
+    "quantums": ("quantums", "quantums", "quantum"),
+    "quarto": ("quartos", "quartos", "quarto"),
+    "quartos": ("quartos", "quartos", "quarto"),
+    "quartz": ("quartzes", "quartzes", "quartz"),
+    "quartzes": ("quartzes", "quartzes", "quartz"),
+    "quid": ("quid", "quid", "quid"),
+    "quinarii": ("quinarii", "quinarii", "quinarius"),
+    "quinarius": ("quinarii", "quinarii", "quinarius"),
+    "quinquennia": ("quinquennia", "quinquennia", "quinquennium"),
+    "quinquennium": ("quinquennia", "quinquennia", "quinquennium"),
+    "quito": ("quitos", "quitos", "quito"),
+    "quitos": ("quitos", "quitos", "quito"),
+    "rabies": ("rabies", "rabies", "rabies"),
+    "rad": ("rads", "rad", "rad"),
+    "radiale": ("radialia", "radialia", "radiale"),
+    "radialia": ("radialia", "radialia", "radiale"),
+    "radices": ("radices", "radices", "radix"),
+    "radii": ("radii", "radii", "radius"),
+    "radius": ("radiuses", "radii", "radius"),
+    "radiuses": ("radiuses", "radiuses", "radius"),
+    "radix": ("radixes", "radices", "radix"),
+    "radixes": ("radixes", "radixes", "radix"),
+    "rads": ("rads", "rads", "rad"),
+    "ragazza": ("ragazze", "ragazze", "ragazza"),
+    "ragazze": ("ragazze", "ragazze", "ragazza"),
+    "ragazzi": ("ragazzi", "ragazzi", "ragazzo"),
+    "ragazzo": ("ragazzi", "ragazzi", "ragazzo"),
+    "raggare": ("raggares", "raggare", "raggare"),
+    "raggares": ("raggares", "raggares", "raggare"),
+    "rami": ("rami", "rami", "ramus"),
+    "ramuli": ("ramuli", "ramuli", "ramulus"),
+    "ramulus": ("ramuli", "ramuli", "ramulus"),
+    "ramus": ("rami", "rami", "ramus"),
+    "ranunculi": ("ranunculi", "ranunculi", "ranunculus"),
+    "ranunculus": ("ranunculuses", "ranunculi", "ranunculus"),
+    "ranunculuses": ("ranunculuses", "ranunculuses", "ranunculus"),
+    "rara avis": ("rara avises", "rarae aves", "rara avis"),
+    "rara avises": ("rara avises", "rara avises", "rara avis"),
+    "rarae aves": ("rarae aves", "rarae aves", "rara avis"),
+    "razz": ("razzes", "razzes", "razz"),
+    "razzes": ("razzes", "razzes", "razz"),
+    "recti": ("recti", "recti", "rectus"),
+    "rectus": ("recti", "recti", "rectus"),
+    "redia": ("rediae", "rediae", "redia"),
+    "rediae": ("rediae", "rediae", "redia"),
+    "reductio": ("reductiones", "reductiones", "reductio"),
+    "reductiones": ("reductiones", "reductiones", "reductio"),
+    "referenda": ("referenda", "referenda", "referendum"),
+    "referendum": ("referendums", "referenda", "referendum"),
+    "referendums": ("referendums", "referendums", "referendum"),
+    "refugia": ("refugia", "refugia", "refugium"),
+    "refugium": ("refugia", "refugia", "refugium"),
+    "regidor": ("regidors", "regidores", "regidor"),
+    "regidores": ("regidores", "regidores", "regidor"),
+    "regidors": ("regidors", "regidors", "regidor"),
+    "regma": ("regmata", "regmata", "regma"),
+    "regmata": ("regmata", "regmata", "regma"),
+    "reguli": ("reguli", "reguli", "regulus"),
+    "regulus": ("reguli", "reguli", "regulus"),
+    "reich": ("reiche", "reiche", "reich"),
+    "reiche": ("reiche", "reiche", "reich"),
+    "rejon": ("rejones", "rejones", "rejon"),
+    "rejoneador": ("rejoneadores", "rejoneadores", "rejoneador"),
+    "rejoneadores": ("rejoneadores", "rejoneadores", "rejoneador"),
+    "rejones": ("rejones", "rejones", "rejon"),
+    "relata": ("relata", "relata", "relatum"),
+    "relatum": ("relata", "relata", "relatum"),
+    "rem": ("rems", "rem", "rem"),
+    "remex": ("remexes", "remiges", "remex"),
+    "remexes": ("remexes", "remexes", "remex"),
+    "remiges": ("remiges", "remiges", "remex"),
+    "remou": ("remou", "remou", "remous"),
+    "remous": ("remous", "remou", "remous"),
+    "rems": ("rems", "rems", "rem"),
+    "repla": ("repla", "repla", "replum"),
+    "replum": ("repla", "repla", "replum"),
+    "representamen": ("representamens", "representamina", "representamen"),
+    "representamens": ("representamens", "representamens", "representamen"),
+    "representamina": ("representamina", "representamina", "representamen"),
+    "res": ("res", "res", "res"),
+    "residua": ("residua", "residua", "residuum"),
+    "residuum": ("residuums", "residua", "residuum"),
+    "residuums": ("residuums", "residuums", "residuum"),
+    "responsa": ("responsa", "responsa", "responsum"),
+    "responsum": ("responsa", "responsa", "responsum"),
+    "rete": ("retia", "retia", "rete"),
+    "retia": ("retia", "retia", "rete"),
+    "retinacula": ("retinacula", "retinacula", "retinaculum"),
+    "retinaculum": ("retinacula", "retinacula", "retinaculum"),
+    "retinula": ("retinulae", "retinulae", "retinula"),
+    "retinulae": ("retinulae", "retinulae", "retinula"),
+    "rezident": ("rezidenty", "rezidenty", "rezident"),
+    "rezidentsia": ("rezidentsii", "rezidentsii", "rezidentsia"),
+    "rezidentsii": ("rezidentsii", "rezidentsii", "rezidentsia"),
+    "rezidenty": ("rezidenty", "rezidenty", "rezident"),
+    "rhino": ("rhinos", "rhinos", "rhino"),
+    "rhinoceros": ("rhinoceroses", "rhinoceros", "rhinoceros"),
+    "rhinoceroses": ("rhinoceroses", "rhinoceroses", "rhinoceros"),
+    "rhinophyma": ("rhinophymas", "rhinophymata", "rhinophyma"),
+    "rhinophymas": ("rhinophymas", "rhinophymas", "rhinophyma"),
+    "rhinophymata": ("rhinophymata", "rhinophymata", "rhinophyma"),
+    "rhinos": ("rhinos", "rhinos", "rhino"),
+    "rhizoma": ("rhizomas", "rhizomata", "rhizoma"),
+    "rhizomas": ("rhizomas", "rhizomas", "rhizoma"),
+    "rhizomata": ("rhizomata", "rhizomata", "rhizoma"),
+    "rhododendra": ("rhododendra", "rhododendra", "rhododendron"),
+    "rhododendron": ("rhododendrons", "rhododendra", "rhododendron"),
+    "rhododendrons": ("rhododendrons", "rhododendrons", "rhododendron"),
+    "rhombohedra": ("rhombohedra", "rhombohedra", "rhombohedron"),
+    "rhombohedron": ("rhombohedrons", "rhombohedra", "rhombohedron"),
+    "rhombohedrons": ("rhombohedrons", "rhombohedrons", "rhombohedron"),
+    "rhomboidei": ("rhomboidei", "rhomboidei", "rhomboideus"),
+    "rhomboideus": ("rhomboidei", "rhomboidei", "rhomboideus"),
+    "rhopalia": ("rhopalia", "rhopalia", "rhopalium"),
+    "rhopalium": ("rhopalia", "rhopalia", "rhopalium"),
+    "rhynchodaea": ("rhynchodaea", "rhynchodaea", "rhynchodaeum"),
+    "rhynchodaeum": ("rhynchodaea", "rhynchodaea", "rhynchodaeum"),
+    "rhythmi": ("rhythmi", "rhythmi", "rhythmus"),
+    "rhythmus": ("rhythmi", "rhythmi", "rhythmus"),
+    "ri": ("ri", "ri", "ri"),
+    "ricercar": ("ricercars", "ricercari", "ricercar"),
+    "ricercari": ("ricercari", "ricercari", "ricercar"),
+    "ricercars": ("ricercars", "ricercars", "ricercar"),
+    "ricercata": ("ricercate", "ricercate", "ricercata"),
+    "ricercate": ("ricercate", "ricercate", "ricercata"),
+    "ricordi": ("ricordi", "ricordi", "ricordo"),
+    "ricordo": ("ricordi", "ricordi", "ricordo"),
+    "rideau": ("rideaus", "rideaux", "rideau"),
+    "rideaus": ("rideaus", "rideaus", "rideau"),
+    "rideaux": ("rideaux", "rideaux", "rideau"),
+    "rilievo": ("rilievos", "rilievos", "rilievo"),
+    "rilievos": ("rilievos", "rilievos", "rilievo"),
+    "rimmonim": ("rimmonim", "rimmonim", "rimon"),
+    "rimon": ("rimonim", "rimmonim", "rimon"),
+    "rimonim": ("rimonim", "rimonim", "rimon"),
+    "rione": ("rioni", "rioni", "rione"),
+    "rioni": ("rioni", "rioni", "rione"),
+    "risotto": ("risottos", "risottos", "risotto"),
+    "risottos": ("risottos", "risottos", "risotto"),
+    "ritardandi": ("ritardandi", "ritardandi", "ritardando"),
+    "ritardando": ("ritardandos", "ritardandi", "ritardando"),
+    "ritardandos": ("ritardandos", "ritardandos", "ritardando"),
+    "rite de passage": ("rites de passage", "rites de passage", "rite de passage"),
+    "rites de passage": ("rites de passage", "rites de passage", "rite de passage"),
+    "rococo": ("rococos", "rococos", "rococo"),
+    "rococos": ("rococos", "rococos", "rococo"),
+    "roe": ("roes", "roe", "roe"),
+    "roes": ("roes", "roes", "roe"),
+    "rom": ("roma", "roma", "rom"),
+    "roma": ("roma", "roma", "rom"),
+    "romagnese": ("romagnese", "romagnese", "romagnese"),
+    "roman": ("romans", "romans", "roman"),
+    "romanese": ("romanese", "romanese", "romanese"),
+    "romanies": ("romanies", "romanies", "romany"),
+    "romans": ("romans", "romans", "roman"),
+    "romany": ("romanies", "romanies", "romany"),
+    "romanze": ("romanzen", "romanzen", "romanze"),
+    "romanzen": ("romanzen", "romanzen", "romanze"),
+    "rond de jambe": ("rond de jambes", "ronds de jambes", "rond de jambe"),
+    "rond de jambes": ("rond de jambes", "rond de jambes", "rond de jambe"),
+    "rondeau": ("rondeaus", "rondeaux", "rondeau"),
+    "rondeaus": ("rondeaus", "rondeaus", "rondeau"),
+    "rondeaux": ("rondeaux", "rondeaux", "rondeau"),
+    "rondo": ("rondos", "rondos", "rondo"),
+    "rondos": ("rondos", "rondos", "rondo"),
+    "ronds de jambes": ("ronds de jambes", "ronds de jambes", "rond de jambe"),
+    "rostra": ("rostra", "rostra", "rostrum"),
+    "rostrum": ("rostrums", "rostra", "rostrum"),
+    "rostrums": ("rostrums", "rostrums", "rostrum"),
+    "rotula": ("rotulae", "rotulae", "rotula"),
+    "rotulae": ("rotulae", "rotulae", "rotula"),
+    "route nationale": ("routes nationales", "routes nationales", "route nationale"),
+    "routes nationales": ("routes nationales", "routes nationales", "route nationale"),
+    "rubashka": ("rubashkas", "rubashki", "rubashka"),
+    "rubashkas": ("rubashkas", "rubashkas", "rubashka"),
+    "rubashki": ("rubashki", "rubashki", "rubashka"),
+    "ruga": ("rugae", "rugae", "ruga"),
+    "rugae": ("rugae", "rugae", "ruga"),
+    "ruse de guerre": ("ruses de guerre", "ruses de guerre", "ruse de guerre"),
+    "ruses de guerre": ("ruses de guerre", "ruses de guerre", "ruse de guerre"),
+    "rype": ("ryper", "ryper", "rype"),
+    "ryper": ("ryper", "ryper", "rype"),
+    "sabertooth": ("sabertooths", "sabertooths", "sabertooth"),
+    "sabertooths": ("sabertooths", "sabertooths", "sabertooth"),
+    "sacculi": ("sacculi", "sacculi", "sacculus"),
+    "sacculus": ("sacculi", "sacculi", "sacculus"),
+    "sacella": ("sacella", "sacella", "sacellum"),
+    "sacellum": ("sacella", "sacella", "sacellum"),
+    "sachverhalt": ("sachverhalte", "sachverhalte", "sachverhalt"),
+    "sachverhalte": ("sachverhalte", "sachverhalte", "sachverhalt"),
+    "sacra": ("sacra", "sacra", "sacrum"),
+    "sacramento": ("sacramentos", "sacramentos", "sacramento"),
+    "sacramentos": ("sacramentos", "sacramentos", "sacramento"),
+    "sacraria": ("sacraria", "sacraria", "sacrarium"),
+    "sacrarium": ("sacraria", "sacraria", "sacrarium"),
+    "sacrum": ("sacrums", "sacra", "sacrum"),
+    "sacrums": ("sacrums", "sacrums", "sacrum"),
+    "saddo": ("saddos", "saddos", "saddo"),
+    "saddos": ("saddos", "saddos", "saddo"),
+    "saffi": ("saffi", "saffi", "saffo"),
+    "saffo": ("saffi", "saffi", "saffo"),
+    "saga": ("saga", "saga", "sagum"),
+    "sago": ("sagos", "sagos", "sago"),
+    "sagos": ("sagos", "sagos", "sago"),
+    "sagum": ("saga", "saga", "sagum"),
+    "salita": ("salitas", "salite", "salita"),
+    "salitas": ("salitas", "salitas", "salita"),
+    "salite": ("salite", "salite", "salita"),
+    "salivaria": ("salivaria", "salivaria", "salivarium"),
+    "salivarium": ("salivaria", "salivaria", "salivarium"),
+    "salmon": ("salmon", "salmon", "salmon"),
+    "salpa": ("salpas", "salpae", "salpa"),
+    "salpae": ("salpae", "salpae", "salpa"),
+    "salpas": ("salpas", "salpas", "salpa"),
+    "salvo": ("salvos", "salvos", "salvo"),
+    "salvos": ("salvos", "salvos", "salvo"),
+    "sambo": ("sambos", "samboes", "sambo"),
+    "samboes": ("samboes", "samboes", "sambo"),
+    "sambos": ("sambos", "sambos", "sambo"),
+    "samurai": ("samurai", "samurai", "samurai"),
+    "sanatoria": ("sanatoria", "sanatoria", "sanatorium"),
+    "sanatorium": ("sanatoriums", "sanatoria", "sanatorium"),
+    "sanatoriums": ("sanatoriums", "sanatoriums", "sanatorium"),
+    "sancta sanctorum": ("sancta sanctorum", "sancta sanctorum", "sanctum sanctorum"),
+    "sanctum sanctorum": ("sancta sanctorum", "sancta sanctorum", "sanctum sanctorum"),
+    "sandr": ("sandrs", "sandr", "sandr"),
+    "sandrs": ("sandrs", "sandrs", "sandr"),
+    "sangirese": ("sangirese", "sangirese", "sangirese"),
+    "santiago": ("santiagos", "santiagos", "santiago"),
+    "santiagos": ("santiagos", "santiagos", "santiago"),
+    "sapporo": ("sapporos", "sapporos", "sapporo"),
+    "sapporos": ("sapporos", "sapporos", "sapporo"),
+    "sarajevo": ("sarajevos", "sarajevos", "sarajevo"),
+    "sarajevos": ("sarajevos", "sarajevos", "sarajevo"),
+    "sarawakese": ("sarawakese", "sarawakese", "sarawakese"),
+    "sarcina": ("sarcinae", "sarcinae", "sarcina"),
+    "sarcinae": ("sarcinae", "sarcinae", "sarcina"),
+    "sarcoma": ("sarcomas", "sarcomata", "sarcoma"),
+    "sarcomas": ("sarcomas", "sarcomas", "sarcoma"),
+    "sarcomata": ("sarcomata", "sarcomata", "sarcoma"),
+    "sarcophagi": ("sarcophagi", "sarcophagi", "sarcophagus"),
+    "sarcophagus": ("sarcophagi", "sarcophagi", "sarcophagus"),
+    "sarissa": ("sarissae", "sarissae", "sarissa"),
+    "sarissae": ("sarissae", "sarissae", "sarissa"),
+    "sassafras": ("sassafrases", "sassafrases", "sassafras"),
+    "sassafrases": ("sassafrases", "sassafrases", "sassafras"),
+    "satelles": ("satellites", "satellites", "satelles"),
+    "satellites": ("satellites", "satellites", "satelles"),
+    "saxicava": ("saxicavae", "saxicavae", "saxicava"),
+    "saxicavae": ("saxicavae", "saxicavae", "saxicava"),
+    "sbirri": ("sbirri", "sbirri", "sbirro"),
+    "sbirro": ("sbirri", "sbirri", "sbirro"),
+    "scaleni": ("scaleni", "scaleni", "scalenus"),
+    "scalenus": ("scaleni", "scaleni", "scalenus"),
+    "scandala magnatum": ("scandala magnatum", "scandala magnatum", "scandalum magnatum"),
+    "scandalum magnatum": ("scandala magnatum", "scandala magnatum", "scandalum magnatum"),
+    "scapi": ("scapi", "scapi", "scapus"),
+    "scapula": ("scapulas", "scapulae", "scapula"),
+    "scapulae": ("scapulae", "scapulae", "scapula"),
+    "scapulas": ("scapulas", "scapulas", "scapula"),
+    "scapus": ("scapi", "scapi", "scapus"),
+    "scarabaei": ("scarabaei", "scarabaei", "scarabaeus"),
+    "scarabaeus": ("scarabaei", "scarabaei", "scarabaeus"),
+    "scari": ("scari", "scari", "scarus"),
+    "scarus": ("scari", "scari", "scarus"),
+    "scazon": ("scazontes", "scazons", "scazon"),
+    "scazons": ("scazons", "scazons", "scazon"),
+    "scazontes": ("scazontes", "scazontes", "scazon"),
+    "sceat": ("sceattas", "sceattas", "sceat"),
+    "sceattas": ("sceattas", "sceattas", "sceat"),
+    "schema": ("schemas", "schemata", "schema"),
+    "schemas": ("schemas", "schemas", "schema"),
+    "schemata": ("schemata", "schemata", "schema"),
+    "scherzando": ("scherzandos", "scherzandos", "scherzando"),
+    "scherzandos": ("scherzandos", "scherzandos", "scherzando"),
+    "scherzo": ("scherzos", "scherzos", "scherzo"),
+    "scherzos": ("scherzos", "scherzos", "scherzo"),
+    "schisma": ("schismata", "schismata", "schisma"),
+    "schismata": ("schismata", "schismata", "schisma"),
+    "schistosomula": ("schistosomula", "schistosomula", "schistosomulum"),
+    "schistosomulum": ("schistosomula", "schistosomula", "schistosomulum"),
+    "schizostylis": ("schizostylis", "schizostylis", "schizostylis"),
+    "scholia": ("scholia", "scholia", "scholium"),
+    "scholium": ("scholia", "scholia", "scholium"),
+    "scioli": ("scioli", "scioli", "sciolus"),
+    "sciolus": ("scioli", "scioli", "sciolus"),
+    "scirrhi": ("scirrhi", "scirrhi", "scirrhus"),
+    "scirrhus": ("scirrhusses", "scirrhi", "scirrhus"),
+    "scirrhusses": ("scirrhusses", "scirrhusses", "scirrhus"),
+    "scissors": ("scissors", "scissors", "scissors"),
+    "scoleces": ("scoleces", "scoleces", "scolex"),
+    "scolex": ("scoleces", "scoleces", "scolex"),
+    "scolopidia": ("scolopidia", "scolopidia", "scolopidium"),
+    "scolopidium": ("scolopidia", "scolopidia", "scolopidium"),
+    "scomber": ("scombri", "scombri", "scomber"),
+    "scombri": ("scombri", "scombri", "scomber"),
+    "scoria": ("scorias", "scoriae", "scoria"),
+    "scoriae": ("scoriae", "scoriae", "scoria"),
+    "scorias": ("scorias", "scorias", "scoria"),
+    "scotoma": ("scotomas", "scotomata", "scotoma"),
+    "scotomas": ("scotomas", "scotomas", "scotoma"),
+    "scotomata": ("scotomata", "scotomata", "scotoma"),
+    "scriptoria": ("scriptoria", "scriptoria", "scriptorium"),
+    "scriptorium": ("scriptoriums", "scriptoria", "scriptorium"),
+    "scriptoriums": ("scriptoriums", "scriptoriums", "scriptorium"),
+    "scudi": ("scudi", "scudi", "scudo"),
+    "scudo": ("scudi", "scudi", "scudo"),
+    "scungille": ("scungilli", "scungilli", "scungille"),
+    "scungilli": ("scungilli", "scungilli", "scungille"),
+    "scuola": ("scuole", "scuole", "scuola"),
+    "scuole": ("scuole", "scuole", "scuola"),
+    "scuta": ("scuta", "scuta", "scutum"),
+    "scutella": ("scutella", "scutella", "scutellum"),
+    "scutellum": ("scutella", "scutella", "scutellum"),
+    "scutula": ("scutula", "scutula", "scutulum"),
+    "scutulum": ("scutula", "scutula", "scutulum"),
+    "scutum": ("scuta", "scuta", "scutum"),
+    "scyphi": ("scyphi", "scyphi", "scyphus"),
+    "scyphus": ("scyphi", "scyphi", "scyphus"),
+    "seaquaria": ("seaquaria", "seaquaria", "seaquarium"),
+    "seaquarium": ("seaquaria", "seaquaria", "seaquarium"),
+    "secans": ("secantes", "secantes", "secans"),
+    "secantes": ("secantes", "secantes", "secans"),
+    "secreta": ("secreta", "secreta", "secretum"),
+    "secretum": ("secreta", "secreta", "secretum"),
+    "secundagravida": ("secundagravidas", "secundagravidae", "secundagravida"),
+    "secundagravidae": ("secundagravidae", "secundagravidae", "secundagravida"),
+    "secundagravidas": ("secundagravidas", "secundagravidas", "secundagravida"),
+    "secundigravida": ("secundigravidas", "secundigravidae", "secundigravida"),
+    "secundigravidae": ("secundigravidae", "secundigravidae", "secundigravida"),
+    "secundigravidas": ("secundigravidas", "secundigravidas", "secundigravida"),
+    "secundipara": ("secundiparas", "secundiparae", "secundipara"),
+    "secundiparae": ("secundiparae", "secundiparae", "secundipara"),
+    "secundiparas": ("secundiparas", "secundiparas", "secundipara"),
+    "sedes": ("sedes", "sedes", "sedes"),
+    "sedile": ("sedilia", "sedilia", "sedile"),
+    "sedilia": ("sedilia", "sedilia", "sedile"),
+    "seecatch": ("seecatchie", "seecatchie", "seecatch"),
+    "seecatchie": ("seecatchie", "seecatchie", "seecatch"),
+    "seed": ("seeds", "seed", "seed"),
+    "seeds": ("seeds", "seeds", "seed"),
+    "selman": ("selmans", "selmans", "selman"),
+    "selmans": ("selmans", "selmans", "selman"),
+    "sema": ("semas", "semata", "sema"),
+    "semas": ("semas", "semas", "sema"),
+    "semata": ("semata", "semata", "sema"),
+    "seminia": ("seminia", "seminia", "seminium"),
+    "seminium": ("seminia", "seminia", "seminium"),
+    "semuncia": ("semunciae", "semunciae", "semuncia"),
+    "semunciae": ("semunciae", "semunciae", "semuncia"),
+    "senarii": ("senarii", "senarii", "senarius"),
+    "senarius": ("senarii", "senarii", "senarius"),
+    "senegalese": ("senegalese", "senegalese", "senegalese"),
+    "senes": ("senes", "senes", "senex"),
+    "senex": ("senes", "senes", "senex"),
+    "sensa": ("sensa", "sensa", "sensum"),
+    "sensedata": ("sensedata", "sensedata", "sensedatum"),
+    "sensedatum": ("sensedata", "sensedata", "sensedatum"),
+    "sensilla": ("sensilla", "sensilla", "sensillum"),
+    "sensillum": ("sensilla", "sensilla", "sensillum"),
+    "sensoriola": ("sensoriola", "sensoriola", "sensoriolum"),
+    "sensoriolum": ("sensoriola", "sensoriola", "sensoriolum"),
+    "sensum": ("sensa", "sensa", "sensum"),
+    "sententia": ("sententiae", "sententiae", "sententia"),
+    "sententiae": ("sententiae", "sententiae", "sententia"),
+    "separatrices": ("separatrices", "separatrices", "separatrix"),
+    "separatrix": ("separatrices", "separatrices", "separatrix"),
+    "sephardi": ("sephardim", "sephardin", "sephardi"),
+    "sephardim": ("sephardim", "sephardim", "sephardi"),
+    "sephardin": ("sephardin", "sephardin", "sephardi"),
+    "septa": ("septa", "septa", "septum"),
+    "septaria": ("septaria", "septaria", "septarium"),
+    "septarium": ("septaria", "septaria", "septarium"),
+    "septemvir": ("septemviri", "septemviri", "septemvir"),
+    "septemviri": ("septemviri", "septemviri", "septemvir"),
+    "septenarii": ("septenarii", "septenarii", "septenarius"),
+    "septenarius": ("septenarii", "septenarii", "septenarius"),
+    "septum": ("septa", "septa", "septum"),
+    "sequela": ("sequelae", "sequelae", "sequela"),
+    "sequelae": ("sequelae", "sequelae", "sequela"),
+    "sequestra": ("sequestra", "sequestra", "sequestrum"),
+    "sequestrum": ("sequestra", "sequestra", "sequestrum"),
+    "sera": ("sera", "sera", "serum"),
+    "seraph": ("seraphs", "seraphim", "seraph"),
+    "seraphim": ("seraphim", "seraphim", "seraph"),
+    "seraphs": ("seraphs", "seraphs", "seraph"),
+    "sericteria": ("sericteria", "sericteria", "sericterium"),
+    "sericterium": ("sericteria", "sericteria", "sericterium"),
+    "series": ("series", "series", "series"),
+    "serir": ("serirs", "serir", "serir"),
+    "serirs": ("serirs", "serirs", "serir"),
+    "serpigines": ("serpigines", "serpigines", "serpigo"),
+    "serpigo": ("serpigoes", "serpigines", "serpigo"),
+    "serpigoes": ("serpigoes", "serpigoes", "serpigo"),
+    "serpula": ("serpulae", "serpulae", "serpula"),
+    "serpulae": ("serpulae", "serpulae", "serpula"),
+    "serra": ("serrae", "serrae", "serra"),
+    "serrae": ("serrae", "serrae", "serra"),
+    "sertularia": ("sertularias", "sertulariae", "sertularia"),
+    "sertulariae": ("sertulariae", "sertulariae", "sertularia"),
+    "sertularias": ("sertularias", "sertularias", "sertularia"),
+    "serum": ("serums", "sera", "serum"),
+    "serums": ("serums", "serums", "serum"),
+    "sestertia": ("sestertia", "sestertia", "sestertium"),
+    "sestertium": ("sestertia", "sestertia", "sestertium"),
+    "sestiere": ("sestieri", "sestieri", "sestiere"),
+    "sestieri": ("sestieri", "sestieri", "sestiere"),
+    "set off": ("set offs", "sets off", "set off"),
+    "set offs": ("set offs", "set offs", "set off"),
+    "set out": ("set outs", "sets out", "set out"),
+    "set outs": ("set outs", "set outs", "set out"),
+    "set to": ("set tos", "sets to", "set to"),
+    "set tos": ("set tos", "set tos", "set to"),
+    "set-off": ("set-offs", "sets-off", "set-off"),
+    "set-offs": ("set-offs", "set-offs", "set-off"),
+    "set-out": ("set-outs", "sets-out", "set-out"),
+    "set-outs": ("set-outs", "set-outs", "set-out"),
+    "set-to": ("set-tos", "sets-to", "set-to"),
+    "set-tos": ("set-tos", "set-tos", "set-to"),
+    "seta": ("setae", "setae", "seta"),
+    "setae": ("setae", "setae", "seta"),
+    "sets off": ("sets off", "sets off", "set off"),
+    "sets out": ("sets out", "sets out", "set out"),
+    "sets to": ("sets to", "sets to", "set to"),
+    "sets-off": ("sets-off", "sets-off", "set-off"),
+    "sets-out": ("sets-out", "sets-out", "set-out"),
+    "sets-to": ("sets-to", "sets-to", "set-to"),
+    "sezession": ("sezessionen", "sezessionen", "sezession"),
+    "sezessionen": ("sezessionen", "sezessionen", "sezession"),
+    "sforzati": ("sforzati", "sforzati", "sforzato"),
+    "sforzato": ("sforzatos", "sforzati", "sforzato"),
+    "sforzatos": ("sforzatos", "sforzatos", "sforzato"),
+    "sgraffiati": ("sgraffiati", "sgraffiati", "sgraffiato"),
+    "sgraffiato": ("sgraffiati", "sgraffiati", "sgraffiato"),
+    "shad": ("shads", "shad", "shad"),
+    "shads": ("shads", "shads", "shad"),
+    "shaman": ("shamans", "shamans", "shaman"),
+    "shamans": ("shamans", "shamans", "shaman"),
+    "shauri": ("shauris", "shauries", "shauri"),
+    "shauries": ("shauries", "shauries", "shauri"),
+    "shauris": ("shauris", "shauris", "shauri"),
+    "shavese": ("shavese", "shavese", "shavese"),
+    "shawabti": ("shawabtis", "shawabtiu", "shawabti"),
+    "shawabtis": ("shawabtis", "shawabtis", "shawabti"),
+    "shawabtiu": ("shawabtiu", "shawabtiu", "shawabti"),
+    "shawanese": ("shawanese", "shawanese", "shawanese"),
+    "she": ("they", "they", "she"),
+    "shear": ("shears", "shears", "shear"),
+    "shears": ("shears", "shears", "shears"),
+    "sheep": ("sheep", "sheep", "sheep"),
+    "shelf": ("shelves", "shelves", "shelf"),
+    "shelves": ("shelves", "shelves", "shelf"),
+    "shifta": ("shiftas", "shifta", "shifta"),
+    "shiftas": ("shiftas", "shiftas", "shifta"),
+    "shochet": ("shochetim", "shochetim", "shochet"),
+    "shochetim": ("shochetim", "shochetim", "shochet"),
+    "shomer": ("shomrim", "shomrim", "shomer"),
+    "shomrim": ("shomrim", "shomrim", "shomer"),
+    "short": ("shorts", "shorts", "short"),
+    "shorts": ("shorts", "shorts", "shorts"),
+    "siamese": ("siamese", "siamese", "siamese"),
+    "siemens": ("siemens", "siemens", "siemens"),
+    "sienese": ("sienese", "sienese", "sienese"),
+    "sigli": ("sigli", "sigli", "siglos"),
+    "sigloi": ("sigloi", "sigloi", "siglos"),
+    "siglos": ("sigli", "sigloi", "siglos"),
+    "signa": ("signa", "signa", "signum"),
+    "signum": ("signa", "signa", "signum"),
+    "sikkimese": ("sikkimese", "sikkimese", "sikkimese"),
+    "silbador": ("silbadors", "silbadores", "silbador"),
+    "silbadores": ("silbadores", "silbadores", "silbador"),
+    "silbadors": ("silbadors", "silbadors", "silbador"),
+    "sileni": ("sileni", "sileni", "silenus"),
+    "silenus": ("sileni", "sileni", "silenus"),
+    "silex": ("silices", "silices", "silex"),
+    "silices": ("silices", "silices", "silex"),
+    "siliqua": ("siliquae", "siliquae", "siliqua"),
+    "siliquae": ("siliquae", "siliquae", "siliqua"),
+    "silo": ("silos", "silos", "silo"),
+    "silos": ("silos", "silos", "silo"),
+    "siluri": ("siluri", "siluri", "silurus"),
+    "silurus": ("siluri", "siluri", "silurus"),
+    "simia": ("simiae", "simiae", "simia"),
+    "simiae": ("simiae", "simiae", "simia"),
+    "simplex": ("simplexes", "simplices", "simplex"),
+    "simplexes": ("simplexes", "simplexes", "simplex"),
+    "simplices": ("simplices", "simplices", "simplex"),
+    "simpula": ("simpula", "simpula", "simpulum"),
+    "simpulum": ("simpula", "simpula", "simpulum"),
+    "simulacra": ("simulacra", "simulacra", "simulacrum"),
+    "simulacrum": ("simulacrums", "simulacra", "simulacrum"),
+    "simulacrums": ("simulacrums", "simulacrums", "simulacrum"),
+    "sinfonia": ("sinfonias", "sinfonie", "sinfonia"),
+    "sinfonias": ("sinfonias", "sinfonias", "sinfonia"),
+    "sinfonie": ("sinfonie", "sinfonie", "sinfonia"),
+    "singhalese": ("singhalese", "singhalese", "singhalese"),
+    "sinhalese": ("sinhalese", "sinhalese", "sinhalese"),
+    "sinus": ("sinuses", "sinus", "sinus"),
+    "sinuses": ("sinuses", "sinuses", "sinus"),
+    "siphunculi": ("siphunculi", "siphunculi", "siphunculus"),
+    "siphunculus": ("siphunculi", "siphunculi", "siphunculus"),
+    "sipunculi": ("sipunculi", "sipunculi", "sipunculus"),
+    "sipunculus": ("sipunculi", "sipunculi", "sipunculus"),
+    "sirocco": ("siroccos", "siroccos", "sirocco"),
+    "siroccos": ("siroccos", "siroccos", "sirocco"),
+    "sistra": ("sistra", "sistra", "sistrum"),
+    "sistrum": ("sistrums", "sistra", "sistrum"),
+    "sistrums": ("sistrums", "sistrums", "sistrum"),
+    "situla": ("situlas", "situlae", "situla"),
+    "situlae": ("situlae", "situlae", "situla"),
+    "situlas": ("situlas", "situlas", "situla"),
+    "sizz": ("sizzes", "sizzes", "sizz"),
+    "sizzes": ("sizzes", "sizzes", "sizz"),
+    "ski": ("skis", "skis", "ski"),
+    "skis": ("skis", "skis", "ski"),
+    "snekkja": ("snekkjur", "snekkjur", "snekkja"),
+    "snekkjur": ("snekkjur", "snekkjur", "snekkja"),
+    "snipe": ("snipes", "snipe", "snipe"),
+    "snipes": ("snipes", "snipes", "snipe"),
+    "snooze": ("snoozes", "snoozes", "snooze"),
+    "snoozes": ("snoozes", "snoozes", "snooze"),
+    "so": ("soes", "soes", "so"),
+    "soe": ("soes", "soes", "soe"),
+    "soes": ("soes", "soes", "so"),
+    "sogdianese": ("sogdianese", "sogdianese", "sogdianese"),
+    "sol": ("soles", "soles", "sol"),
+    "solaria": ("solaria", "solaria", "solarium"),
+    "solarium": ("solaria", "solaria", "solarium"),
+    "soldi": ("soldi", "soldi", "soldo"),
+    "soldo": ("soldi", "soldi", "soldo"),
+    "solenia": ("solenia", "solenia", "solenium"),
+    "solenium": ("solenia", "solenia", "solenium"),
+    "soles": ("soles", "soles", "sol"),
+    "solfeggi": ("solfeggi", "solfeggi", "solfeggio"),
+    "solfeggio": ("solfeggios", "solfeggi", "solfeggio"),
+    "solfeggios": ("solfeggios", "solfeggios", "solfeggio"),
+    "soli": ("soli", "soli", "solo"),
+    "solidi": ("solidi", "solidi", "solidus"),
+    "solidos": ("solidos", "solidos", "solidus"),
+    "solidus": ("solidi", "solidos", "solidus"),
+    "solo": ("solos", "soli", "solo"),
+    "solos": ("solos", "solos", "solo"),
+    "solstitia": ("solstitia", "solstitia", "solstitium"),
+    "solstitium": ("solstitia", "solstitia", "solstitium"),
+    "solvi": ("solvi", "solvi", "solvus"),
+    "solvus": ("solvi", "solvi", "solvus"),
+    "soma": ("somas", "somata", "soma"),
+    "somas": ("somas", "somas", "soma"),
+    "somata": ("somata", "somata", "soma"),
+    "somaten": ("somatenes", "somatenes", "somaten"),
+    "somatenes": ("somatenes", "somatenes", "somaten"),
+    "sombrero": ("sombreros", "sombreros", "sombrero"),
+    "sombreros": ("sombreros", "sombreros", "sombrero"),
+    "some": ("some", "some", "one"),
+    "sonaman": ("sonamans", "sonamans", "sonaman"),
+    "sonamans": ("sonamans", "sonamans", "sonaman"),
+    "soprani": ("soprani", "soprani", "soprano"),
+    "soprano": ("sopranos", "soprani", "soprano"),
+    "sopranos": ("sopranos", "sopranos", "soprano"),
+    "soralia": ("soralia", "soralia", "soralium"),
+    "soralium": ("soralia", "soralia", "soralium"),
+    "soredia": ("soredia", "soredia", "soredium"),
+    "soredium": ("soredia", "soredia", "soredium"),
+    "sori": ("sori", "sori", "sorus"),
+    "sorus": ("sori", "sori", "sorus"),
+    "soshi": ("soshi", "soshi", "soshi"),
+    "sotch": ("sotches", "sotchs", "sotch"),
+    "sotches": ("sotches", "sotches", "sotch"),
+    "sotchs": ("sotchs", "sotchs", "sotch"),
+    "souvlaki": ("souvlakis", "souvlakia", "souvlaki"),
+    "souvlakia": ("souvlakia", "souvlakia", "souvlaki"),
+    "souvlakis": ("souvlakis", "souvlakis", "souvlaki"),
+    "spadices": ("spadices", "spadices", "spadix"),
+    "spadix": ("spadixes", "spadices", "spadix"),
+    "spadixes": ("spadixes", "spadixes", "spadix"),
+    "spaetlese": ("spaetlesen", "spaetlesen", "spaetlese"),
+    "spaetlesen": ("spaetlesen", "spaetlesen", "spaetlese"),
+    "spari": ("spari", "spari", "sparus"),
+    "sparus": ("spari", "spari", "sparus"),
+    "spasmi": ("spasmi", "spasmi", "spasmus"),
+    "spasmus": ("spasmi", "spasmi", "spasmus"),
+    "spatha": ("spathae", "spathae", "spatha"),
+    "spathae": ("spathae", "spathae", "spatha"),
+    "species": ("species", "species", "species"),
+    "spectra": ("spectra", "spectra", "spectrum"),
+    "spectrum": ("spectrums", "spectra", "spectrum"),
+    "spectrums": ("spectrums", "spectrums", "spectrum"),
+    "specula": ("specula", "specula", "speculum"),
+    "speculum": ("speculums", "specula", "speculum"),
+    "speculums": ("speculums", "speculums", "speculum"),
+    "sperma": ("spermata", "spermata", "sperma"),
+    "spermaria": ("spermaria", "spermaria", "spermarium"),
+    "spermarium": ("spermaria", "spermaria", "spermarium"),
+    "spermata": ("spermata", "spermata", "sperma"),
+    "spermatheca": ("spermathecae", "spermathecae", "spermatheca"),
+    "spermathecae": ("spermathecae", "spermathecae", "spermatheca"),
+    "spermatia": ("spermatia", "spermatia", "spermatium"),
+    "spermatium": ("spermatia", "spermatia", "spermatium"),
+    "spermatoa": ("spermatoa", "spermatoa", "spermatoon"),
+    "spermatoon": ("spermatoa", "spermatoa", "spermatoon"),
+    "spermogonia": ("spermogonia", "spermogonia", "spermogonium"),
+    "spermogonium": ("spermogonia", "spermogonia", "spermogonium"),
+    "sphaerideum": ("sphaerideum", "sphaerideum", "sphaeridium"),
+    "sphaeridia": ("sphaeridia", "sphaeridia", "sphaeridium"),
+    "sphaeridium": ("sphaeridia", "sphaerideum", "sphaeridium"),
+    "sphagna": ("sphagna", "sphagna", "sphagnum"),
+    "sphagnum": ("sphagnums", "sphagna", "sphagnum"),
+    "sphagnums": ("sphagnums", "sphagnums", "sphagnum"),
+    "spheges": ("spheges", "spheges", "sphex"),
+    "sphex": ("spheges", "spheges", "sphex"),
+    "sphinges": ("sphinges", "sphinges", "sphinx"),
+    "sphinx": ("sphinxes", "sphinges", "sphinx"),
+    "sphinxes": ("sphinxes", "sphinxes", "sphinx"),
+    "spicula": ("spicula", "spicula", "spiculum"),
+    "spiculum": ("spicula", "spicula", "spiculum"),
+    "spiracula": ("spiracula", "spiracula", "spiraculum"),
+    "spiraculum": ("spiracula", "spiracula", "spiraculum"),
+    "spirilla": ("spirilla", "spirilla", "spirillum"),
+    "spirillum": ("spirilla", "spirilla", "spirillum"),
+    "spondyli": ("spondyli", "spondyli", "spondylus"),
+    "spondylus": ("spondyli", "spondyli", "spondylus"),
+    "sporodochia": ("sporodochia", "sporodochia", "sporodochium"),
+    "sporodochium": ("sporodochia", "sporodochia", "sporodochium"),
+    "sputa": ("sputa", "sputa", "sputum"),
+    "sputum": ("sputa", "sputa", "sputum"),
+    "squadra": ("squadre", "squadre", "squadra"),
+    "squadre": ("squadre", "squadre", "squadra"),
+    "squadrist": ("squadrists", "squadristi", "squadrist"),
+    "squadristi": ("squadristi", "squadristi", "squadrist"),
+    "squadrists": ("squadrists", "squadrists", "squadrist"),
+    "squali": ("squali", "squali", "squalus"),
+    "squalus": ("squali", "squali", "squalus"),
+    "squama": ("squamae", "squamae", "squama"),
+    "squamae": ("squamae", "squamae", "squama"),
+    "squilla": ("squillae", "squillae", "squilla"),
+    "squillae": ("squillae", "squillae", "squilla"),
+    "stabilimenta": ("stabilimenta", "stabilimenta", "stabilimentum"),
+    "stabilimentum": ("stabilimenta", "stabilimenta", "stabilimentum"),
+    "staccato": ("staccatos", "staccatos", "staccato"),
+    "staccatos": ("staccatos", "staccatos", "staccato"),
+    "stadia": ("stadia", "stadia", "stadium"),
+    "stadium": ("stadiums", "stadia", "stadium"),
+    "stadiums": ("stadiums", "stadiums", "stadium"),
+    "stalactitae": ("stalactitae", "stalactitae", "stalactite"),
+    "stalactite": ("stalactites", "stalactitae", "stalactite"),
+    "stalactites": ("stalactites", "stalactites", "stalactite"),
+    "stamen": ("stamen", "stamina", "stamen"),
+    "stamina": ("stamina", "stamina", "stamen"),
+    "staminidia": ("staminidia", "staminidia", "staminidium"),
+    "staminidium": ("staminidia", "staminidia", "staminidium"),
+    "staphylococci": ("staphylococci", "staphylococci", "staphylococcus"),
+    "staphylococcus": ("staphylococci", "staphylococci", "staphylococcus"),
+    "star fish": ("star fishes", "star fish", "star fish"),
+    "star fishes": ("star fishes", "star fishes", "star fish"),
+    "star-fish": ("star-fishes", "star-fish", "star-fish"),
+    "star-fishes": ("star-fishes", "star-fishes", "star-fish"),
+    "starets": ("startsy", "startsy", "starets"),
+    "staretz": ("startzy", "startzy", "staretz"),
+    "starfish": ("starfishes", "starfish", "starfish"),
+    "starfishes": ("starfishes", "starfishes", "starfish"),
+    "starosta": ("starosti", "starosti", "starosta"),
+    "starosti": ("starosti", "starosti", "starosta"),
+    "starover": ("starovers", "starovery", "starover"),
+    "starovers": ("starovers", "starovers", "starover"),
+    "starovery": ("starovery", "starovery", "starover"),
+    "startsy": ("startsy", "startsy", "starets"),
+    "startzy": ("startzy", "startzy", "staretz"),
+    "stasima": ("stasima", "stasima", "stasimon"),
+    "stasimon": ("stasimons", "stasima", "stasimon"),
+    "stasimons": ("stasimons", "stasimons", "stasimon"),
+    "statera": ("staterae", "staterae", "statera"),
+    "staterae": ("staterae", "staterae", "statera"),
+    "statua": ("statuas", "statuae", "statua"),
+    "statuae": ("statuae", "statuae", "statua"),
+    "statuas": ("statuas", "statuas", "statua"),
+    "status": ("statuses", "status", "status"),
+    "statuses": ("statuses", "statuses", "status"),
+    "stela": ("stelas", "stelae", "stela"),
+    "stelae": ("stelae", "stelae", "stela"),
+    "stelas": ("stelas", "stelas", "stela"),
+    "stella": ("stellae", "stellae", "stella"),
+    "stellae": ("stellae", "stellae", "stella"),
+    "stemma": ("stemmata", "stemmata", "stemma"),
+    "stemmata": ("stemmata", "stemmata", "stemma"),
+    "stephania": ("stephania", "stephania", "stephanion"),
+    "stephanion": ("stephanions", "stephania", "stephanion"),
+    "stephanions": ("stephanions", "stephanions", "stephanion"),
+    "sterigma": ("sterigmata", "sterigmata", "sterigma"),
+    "sterigmata": ("sterigmata", "sterigmata", "sterigma"),
+    "sterna": ("sterna", "sterna", "sternum"),
+    "sternebra": ("sternebrae", "sternebrae", "sternebra"),
+    "sternebrae": ("sternebrae", "sternebrae", "sternebra"),
+    "sterno": ("sternos", "sternos", "sterno"),
+    "sternos": ("sternos", "sternos", "sterno"),
+    "sternum": ("sternums", "sterna", "sternum"),
+    "sternums": ("sternums", "sternums", "sternum"),
+    "stichidia": ("stichidia", "stichidia", "stichidium"),
+    "stichidium": ("stichidia", "stichidia", "stichidium"),
+    "stichoi": ("stichoi", "stichoi", "stichos"),
+    "stichos": ("stichoi", "stichoi", "stichos"),
+    "stigma": ("stigmas", "stigmata", "stigma"),
+    "stigmaria": ("stigmariae", "stigmariae", "stigmaria"),
+    "stigmariae": ("stigmariae", "stigmariae", "stigmaria"),
+    "stigmas": ("stigmas", "stigmas", "stigma"),
+    "stigmata": ("stigmata", "stigmata", "stigma"),
+    "stiletto": ("stilettoes", "stilettoes", "stiletto"),
+    "stilettoes": ("stilettoes", "stilettoes", "stiletto"),
+    "stillicidia": ("stillicidia", "stillicidia", "stillicidium"),
+    "stillicidium": ("stillicidia", "stillicidia", "stillicidium"),
+    "stimuli": ("stimuli", "stimuli", "stimulus"),
+    "stimulus": ("stimuli", "stimuli", "stimulus"),
+    "stipes": ("stipites", "stipites", "stipes"),
+    "stipites": ("stipites", "stipites", "stipes"),
+    "stipula": ("stipulas", "stipulae", "stipula"),
+    "stipulae": ("stipulae", "stipulae", "stipula"),
+    "stipulas": ("stipulas", "stipulas", "stipula"),
+    "stirpes": ("stirpes", "stirpes", "stirps"),
+    "stirps": ("stirpes", "stirpes", "stirps"),
+    "stoa": ("stoas", "stoai", "stoa"),
+    "stoai": ("stoai", "stoai", "stoa"),
+    "stoas": ("stoas", "stoas", "stoa"),
+    "stolo": ("stolones", "stolones", "stolo"),
+    "stolones": ("stolones", "stolones", "stolo"),
+    "stoma": ("stomas", "stomata", "stoma"),
+    "stomach": ("stomachs", "stomachs", "stomach"),
+    "stomachs": ("stomachs", "stomachs", "stomach"),
+    "stomas": ("stomas", "stomas", "stoma"),
+    "stomata": ("stomata", "stomata", "stoma"),
+    "stomatia": ("stomatia", "stomatia", "stomatium"),
+    "stomatium": ("stomatia", "stomatia", "stomatium"),
+    "stomia": ("stomia", "stomia", "stomion"),
+    "stomion": ("stomia", "stomia", "stomion"),
+    "stomodaea": ("stomodaea", "stomodaea", "stomodaeum"),
+    "stomodaeum": ("stomodea", "stomodaea", "stomodaeum"),
+    "stomodea": ("stomodea", "stomodea", "stomodaeum"),
+    "storey": ("storeys", "storeys", "storey"),
+    "storeys": ("storeys", "storeys", "storey"),
+    "stornelli": ("stornelli", "stornelli", "stornello"),
+    "stornello": ("stornelli", "stornelli", "stornello"),
+    "strambotti": ("strambotti", "strambotti", "strambotto"),
+    "strambotto": ("strambotti", "strambotti", "strambotto"),
+    "strata": ("strata", "strata", "stratum"),
+    "strategi": ("strategi", "strategi", "strategus"),
+    "strategoi": ("strategoi", "strategoi", "strategos"),
+    "strategos": ("strategoi", "strategoi", "strategos"),
+    "strategus": ("strategi", "strategi", "strategus"),
+    "stratum": ("stratums", "strata", "stratum"),
+    "stratums": ("stratums", "stratums", "stratum"),
+    "streptococci": ("streptococci", "streptococci", "streptococcus"),
+    "streptococcus": ("streptococci", "streptococci", "streptococcus"),
+    "streptothrices": ("streptothrices", "streptothrices", "streptothrix"),
+    "streptothrix": ("streptothrices", "streptothrices", "streptothrix"),
+    "stria": ("striae", "striae", "stria"),
+    "striae": ("striae", "striae", "stria"),
+    "striata": ("striata", "striata", "striatum"),
+    "striatum": ("striata", "striata", "striatum"),
+    "striga": ("strigae", "strigae", "striga"),
+    "strigae": ("strigae", "strigae", "striga"),
+    "striola": ("striolae", "striolae", "striola"),
+    "striolae": ("striolae", "striolae", "striola"),
+    "strobila": ("strobilae", "strobilae", "strobila"),
+    "strobilae": ("strobilae", "strobilae", "strobila"),
+    "strobili": ("strobili", "strobili", "strobilus"),
+    "strobilus": ("strobili", "strobili", "strobilus"),
+    "stroma": ("stromata", "stromata", "stroma"),
+    "stromata": ("stromata", "stromata", "stroma"),
+    "stromodaea": ("stromodaea", "stromodaea", "stromodeum"),
+    "stromodea": ("stromodea", "stromodea", "stromodeum"),
+    "stromodeum": ("stromodea", "stromodaea", "stromodeum"),
+    "struma": ("strumae", "strumae", "struma"),
+    "strumae": ("strumae", "strumae", "struma"),
+    "stryddae": ("stryddae", "stryddae", "stryddag"),
+    "stryddag": ("stryddae", "stryddae", "stryddag"),
+    "stucco": ("stuccos", "stuccos", "stucco"),
+    "stuccos": ("stuccos", "stuccos", "stucco"),
+    "studia generali": ("studia generali", "studia generali", "studium generale"),
+    "studium generale": ("studia generali", "studia generali", "studium generale"),
+    "styli": ("styli", "styli", "stylus"),
+    "stylo": ("stylos", "stylos", "stylo"),
+    "stylopodia": ("stylopodia", "stylopodia", "stylopodium"),
+    "stylopodium": ("stylopodia", "stylopodia", "stylopodium"),
+    "stylos": ("stylos", "stylos", "stylo"),
+    "stylus": ("styluses", "styli", "stylus"),
+    "styluses": ("styluses", "styluses", "stylus"),
+    "subbotnik": ("subbotniks", "subbotniki", "subbotnik"),
+    "subbotniki": ("subbotniki", "subbotniki", "subbotnik"),
+    "subbotniks": ("subbotniks", "subbotniks", "subbotnik"),
+    "subsellia": ("subsellia", "subsellia", "subsellium"),
+    "subsellium": ("subsellia", "subsellia", "subsellium"),
+    "subsidia": ("subsidia", "subsidia", "subsidium"),
+    "subsidium": ("subsidia", "subsidia", "subsidium"),
+    "substrata": ("substrata", "substrata", "substratum"),
+    "substratum": ("substratums", "substrata", "substratum"),
+    "substratums": ("substratums", "substratums", "substratum"),
+    "succi": ("succi", "succi", "succus"),
+    "succinea": ("succineas", "succineae", "succinea"),
+    "succineae": ("succineae", "succineae", "succinea"),
+    "succineas": ("succineas", "succineas", "succinea"),
+    "succubi": ("succubi", "succubi", "succubus"),
+    "succubus": ("succubuses", "succubi", "succubus"),
+    "succubuses": ("succubuses", "succubuses", "succubus"),
+    "succus": ("succi", "succi", "succus"),
+    "sudanese": ("sudanese", "sudanese", "sudanese"),
+    "suffrutex": ("suffrutices", "suffrutices", "suffrutex"),
+    "suffrutices": ("suffrutices", "suffrutices", "suffrutex"),
+    "suggesta": ("suggesta", "suggesta", "suggestum"),
+    "suggestio falsi": ("suggestiones falsi", "suggestiones falsi", "suggestio falsi"),
+    "suggestiones falsi": ("suggestiones falsi", "suggestiones falsi", "suggestio falsi"),
+    "suggestum": ("suggestums", "suggesta", "suggestum"),
+    "suggestums": ("suggestums", "suggestums", "suggestum"),
+    "sulci": ("sulci", "sulci", "sulcus"),
+    "sulcus": ("sulci", "sulci", "sulcus"),
+    "sum total": ("sum totals", "sums total", "sum total"),
+    "sum totals": ("sum totals", "sum totals", "sum total"),
+    "sum-total": ("sum-totals", "sums-total", "sum-total"),
+    "sum-totals": ("sum-totals", "sum-totals", "sum-total"),
+    "summa": ("summae", "summae", "summa"),
+    "summa bona": ("summa bona", "summa bona", "summum bonum"),
+    "summa genera": ("summa genera", "summa genera", "summum genus"),
+    "summae": ("summae", "summae", "summa"),
+    "summum bonum": ("summa bona", "summa bona", "summum bonum"),
+    "summum genus": ("summa genera", "summa genera", "summum genus"),
+    "sumo": ("sumos", "sumos", "sumo"),
+    "sumos": ("sumos", "sumos", "sumo"),
+    "sums total": ("sums total", "sums total", "sum total"),
+    "sums-total": ("sums-total", "sums-total", "sum-total"),
+    "sundanese": ("sundanese", "sundanese", "sundanese"),
+    "supercilia": ("supercilia", "supercilia", "supercilium"),
+    "supercilium": ("supercilia", "supercilia", "supercilium"),
+    "superficies": ("superficies", "superficies", "superficies"),
+    "supernova": ("supernovas", "supernovae", "supernova"),
+    "supernovae": ("supernovae", "supernovae", "supernova"),
+    "supernovas": ("supernovas", "supernovas", "supernova"),
+    "superstrata": ("superstrata", "superstrata", "superstratum"),
+    "superstratum": ("superstrata", "superstrata", "superstratum"),
+    "supposita": ("supposita", "supposita", "suppositum"),
+    "suppositum": ("supposita", "supposita", "suppositum"),
+    "supracleithra": ("supracleithra", "supracleithra", "supracleithrum"),
+    "supracleithrum": ("supracleithra", "supracleithra", "supracleithrum"),
+    "suprascapula": ("suprascapulae", "suprascapulae", "suprascapula"),
+    "suprascapulae": ("suprascapulae", "suprascapulae", "suprascapula"),
+    "surculi": ("surculi", "surculi", "surculus"),
+    "surculus": ("surculi", "surculi", "surculus"),
+    "surimono": ("surimonos", "surimonos", "surimono"),
+    "surimonos": ("surimonos", "surimonos", "surimono"),
+    "sustentacula": ("sustentacula", "sustentacula", "sustentaculum"),
+    "sustentaculum": ("sustentacula", "sustentacula", "sustentaculum"),
+    "swahilese": ("swahilese", "swahilese", "swahilese"),
+    "swine": ("swine", "swines", "swine"),
+    "swines": ("swines", "swines", "swine"),
+    "switchfoot": ("switchfoots", "switchfoots", "switchfoot"),
+    "switchfoots": ("switchfoots", "switchfoots", "switchfoot"),
+    "syllabaria": ("syllabaria", "syllabaria", "syllabarium"),
+    "syllabarium": ("syllabaria", "syllabaria", "syllabarium"),
+    "syllabi": ("syllabi", "syllabi", "syllabus"),
+    "syllabus": ("syllabuses", "syllabi", "syllabus"),
+    "syllabuses": ("syllabuses", "syllabuses", "syllabus"),
+    "symplasma": ("symplasmata", "symplasmata", "symplasma"),
+    "symplasmata": ("symplasmata", "symplasmata", "symplasma"),
+    "sympodia": ("sympodia", "sympodia", "sympodium"),
+    "sympodium": ("sympodia", "sympodia", "sympodium"),
+    "symposia": ("symposia", "symposia", "symposium"),
+    "symposium": ("symposiums", "symposia", "symposium"),
+    "symposiums": ("symposiums", "symposiums", "symposium"),
+    "synaesthesia": ("synaesthesiae", "synaesthesiae", "synaesthesia"),
+    "synaesthesiae": ("synaesthesiae", "synaesthesiae", "synaesthesia"),
+    "synangia": ("synangia", "synangia", "synangium"),
+    "synangium": ("synangia", "synangia", "synangium"),
+    "synapticula": ("synapticulas", "synapticulae", "synapticula"),
+    "synapticulae": ("synapticulae", "synapticulae", "synapticula"),
+    "synapticulas": ("synapticulas", "synapticulas", "synapticula"),
+    "synaxaria": ("synaxaria", "synaxaria", "synaxarium"),
+    "synaxarion": ("synaxaria", "synaxaria", "synaxarion"),
+    "synaxarium": ("synaxaria", "synaxaria", "synaxarium"),
+    "synaxes": ("synaxes", "synaxes", "synaxis"),
+    "synaxis": ("synaxes", "synaxes", "synaxis"),
+    "syncelli": ("syncelli", "syncelli", "syncellus"),
+    "syncellus": ("syncelli", "syncelli", "syncellus"),
+    "syncytia": ("syncytia", "syncytia", "syncytium"),
+    "syncytium": ("syncytia", "syncytia", "syncytium"),
+    "syndendria": ("syndendria", "syndendria", "syndendrium"),
+    "syndendrium": ("syndendria", "syndendria", "syndendrium"),
+    "synechia": ("synechiae", "synechiae", "synechia"),
+    "synechiae": ("synechiae", "synechiae", "synechia"),
+    "synedria": ("synedria", "synedria", "synedrium"),
+    "synedrion": ("synedria", "synedria", "synedrion"),
+    "synedrium": ("synedria", "synedria", "synedrium"),
+    "synesthesia": ("synesthesiae", "synesthesiae", "synesthesia"),
+    "synesthesiae": ("synesthesiae", "synesthesiae", "synesthesia"),
+    "syntagma": ("syntagmas", "syntagmata", "syntagma"),
+    "syntagmas": ("syntagmas", "syntagmas", "syntagma"),
+    "syntagmata": ("syntagmata", "syntagmata", "syntagma"),
+    "syntaxes": ("syntaxes", "syntaxes", "syntaxis"),
+    "syntaxis": ("syntaxes", "syntaxes", "syntaxis"),
+    "synthroni": ("synthroni", "synthroni", "synthronus"),
+    "synthronus": ("synthroni", "synthroni", "synthronus"),
+    "synusia": ("synusiae", "synusiae", "synusia"),
+    "synusiae": ("synusiae", "synusiae", "synusia"),
+    "syphiloma": ("syphilomata", "syphilomata", "syphiloma"),
+    "syphilomata": ("syphilomata", "syphilomata", "syphiloma"),
+    "syringe": ("syringes", "syringes", "syringe"),
+    "syringes": ("syringes", "syringes", "syringe"),
+    "syrinx": ("syrinxes", "syringes", "syrinx"),
+    "syrinxes": ("syrinxes", "syrinxes", "syrinx"),
+    "syrphi": ("syrphi", "syrphi", "syrphus"),
+    "syrphus": ("syrphi", "syrphi", "syrphus"),
+    "syrtes": ("syrtes", "syrtes", "syrtis"),
+    "syrtis": ("syrtes", "syrtes", "syrtis"),
+    "tabella": ("tabellae", "tabellae", "tabella"),
+    "tabellae": ("tabellae", "tabellae", "tabella"),
+    "tableau": ("tableaus", "tableaux", "tableau"),
+    "tableaus": ("tableaus", "tableaus", "tableau"),
+    "tableaux": ("tableaux", "tableaux", "tableau"),
+    "tablina": ("tablina", "tablina", "tablinum"),
+    "tablinum": ("tablina", "tablina", "tablinum"),
+    "tabula": ("tabulae", "tabulae", "tabula"),
+    "tabulae": ("tabulae", "tabulae", "tabula"),
+    "tacoman": ("tacomans", "tacomans", "tacoman"),
+    "tacomans": ("tacomans", "tacomans", "tacoman"),
+    "taenia": ("taenias", "taeniae", "taenia"),
+    "taeniae": ("taeniae", "taeniae", "taenia"),
+    "taenias": ("taenias", "taenias", "taenia"),
+    "tagma": ("tagmata", "tagmata", "tagma"),
+    "tagmata": ("tagmata", "tagmata", "tagma"),
+    "taiko": ("taikos", "taikos", "taiko"),
+    "taikos": ("taikos", "taikos", "taiko"),
+    "talea": ("taleae", "taleae", "talea"),
+    "taleae": ("taleae", "taleae", "talea"),
+    "tali": ("tali", "tali", "talus"),
+    "talisman": ("talismans", "talismans", "talisman"),
+    "talismans": ("talismans", "talismans", "talisman"),
+    "talouse": ("talouses", "talouses", "talouse"),
+    "talouses": ("talouses", "talouses", "talouse"),
+    "talus": ("tali", "tali", "talus"),
+    "tango": ("tangos", "tangoes", "tango"),
+    "tangoes": ("tangoes", "tangoes", "tango"),
+    "tangos": ("tangos", "tangos", "tango"),
+    "tarantata": ("tarantate", "tarantate", "tarantata"),
+    "tarantate": ("tarantate", "tarantate", "tarantata"),
+    "tarantati": ("tarantati", "tarantati", "tarantato"),
+    "tarantato": ("tarantati", "tarantati", "tarantato"),
+    "tarsi": ("tarsi", "tarsi", "tarsus"),
+    "tarsus": ("tarsi", "tarsi", "tarsus"),
+    "tax": ("taxes", "taxes", "tax"),
+    "taxa": ("taxa", "taxa", "taxon"),
+    "taxes": ("taxes", "taxes", "tax"),
+    "taxis": ("taxes", "taxes", "taxis"),
+    "taxon": ("taxa", "taxa", "taxon"),
+    "tazza": ("tazze", "tazze", "tazza"),
+    "tazze": ("tazze", "tazze", "tazza"),
+    "teal": ("teals", "teal", "teal"),
+    "teals": ("teals", "teals", "teal"),
+    "techno": ("technos", "technos", "techno"),
+    "technos": ("technos", "technos", "techno"),
+    "teeth": ("teeth", "teeth", "tooth"),
+    "tegmen": ("tegmina", "tegmina", "tegmen"),
+    "tegmenta": ("tegmenta", "tegmenta", "tegmentum"),
+    "tegmentum": ("tegmenta", "tegmenta", "tegmentum"),
+    "tegmina": ("tegmina", "tegmina", "tegmen"),
+    "tegula": ("tegulae", "tegulae", "tegula"),
+    "tegulae": ("tegulae", "tegulae", "tegula"),
+    "telamon": ("telamones", "telamones", "telamon"),
+    "telamones": ("telamones", "telamones", "telamon"),
+    "telia": ("telia", "telia", "telium"),
+    "telium": ("telia", "telia", "telium"),
+    "temblor": ("temblores", "temblores", "temblor"),
+    "temblores": ("temblores", "temblores", "temblor"),
+    "tempi": ("tempi", "tempi", "tempo"),
+    "tempietti": ("tempietti", "tempietti", "tempietto"),
+    "tempietto": ("tempietti", "tempietti", "tempietto"),
+    "tempo": ("tempos", "tempi", "tempo"),
+    "tempos": ("tempos", "tempos", "tempo"),
+    "tenacula": ("tenacula", "tenacula", "tenaculum"),
+    "tenaculum": ("tenacula", "tenacula", "tenaculum"),
+    "tenderfoot": ("tenderfoots", "tenderfoots", "tenderfoot"),
+    "tenderfoots": ("tenderfoots", "tenderfoots", "tenderfoot"),
+    "tenggerese": ("tenggerese", "tenggerese", "tenggerese"),
+    "tenia": ("tenias", "teniae", "tenia"),
+    "teniae": ("teniae", "teniae", "tenia"),
+    "tenias": ("tenias", "tenias", "tenia"),
+    "tenorini": ("tenorini", "tenorini", "tenorino"),
+    "tenorino": ("tenorini", "tenorini", "tenorino"),
+    "tentacula": ("tentacula", "tentacula", "tentaculum"),
+    "tentaculum": ("tentacula", "tentacula", "tentaculum"),
+    "tentamen": ("tentamina", "tentamina", "tentamen"),
+    "tentamina": ("tentamina", "tentamina", "tentamen"),
+    "tenues": ("tenues", "tenues", "tenuis"),
+    "tenuis": ("tenues", "tenues", "tenuis"),
+    "tepidaria": ("tepidaria", "tepidaria", "tepidarium"),
+    "tepidarium": ("tepidaria", "tepidaria", "tepidarium"),
+    "teratoma": ("teratomata", "teratomata", "teratoma"),
+    "teratomata": ("teratomata", "teratomata", "teratoma"),
+    "terebella": ("terebella", "terebella", "terebellum"),
+    "terebellum": ("terebella", "terebella", "terebellum"),
+    "terebratula": ("terebratulas", "terebratulae", "terebratula"),
+    "terebratulae": ("terebratulae", "terebratulae", "terebratula"),
+    "terebratulas": ("terebratulas", "terebratulas", "terebratula"),
+    "teredines": ("teredines", "teredines", "teredo"),
+    "teredo": ("teredos", "teredines", "teredo"),
+    "teredos": ("teredos", "teredos", "teredo"),
+    "terga": ("terga", "terga", "tergum"),
+    "tergum": ("terga", "terga", "tergum"),
+    "termes": ("termites", "termites", "termes"),
+    "termini": ("termini", "termini", "terminus"),
+    "terminus": ("terminuses", "termini", "terminus"),
+    "terminuses": ("terminuses", "terminuses", "terminus"),
+    "termites": ("termites", "termites", "termes"),
+    "terp": ("terps", "terpen", "terp"),
+    "terpen": ("terpen", "terpen", "terp"),
+    "terps": ("terps", "terps", "terp"),
+    "terrae filii": ("terrae filii", "terrae filii", "terrae filius"),
+    "terrae filius": ("terrae filii", "terrae filii", "terrae filius"),
+    "terramara": ("terremare", "terremare", "terramara"),
+    "terraria": ("terraria", "terraria", "terrarium"),
+    "terrarium": ("terrariums", "terraria", "terrarium"),
+    "terrariums": ("terrariums", "terrariums", "terrarium"),
+    "terrazzo": ("terrazzos", "terrazzos", "terrazzo"),
+    "terrazzos": ("terrazzos", "terrazzos", "terrazzo"),
+    "terremare": ("terremare", "terremare", "terramara"),
+    "territoria": ("territoria", "territoria", "territorium"),
+    "territorium": ("territoria", "territoria", "territorium"),
+    "terzetti": ("terzetti", "terzetti", "terzetto"),
+    "terzetto": ("terzetti", "terzetti", "terzetto"),
+    "tessella": ("tessellas", "tessellae", "tessella"),
+    "tessellae": ("tessellae", "tessellae", "tessella"),
+    "tessellas": ("tessellas", "tessellas", "tessella"),
+    "tessera": ("tesserae", "tesserae", "tessera"),
+    "tesserae": ("tesserae", "tesserae", "tessera"),
+    "testes": ("testes", "testes", "testes"),
+    "testis": ("testes", "testes", "testis"),
+    "testudo": ("testudos", "testudos", "testudo"),
+    "testudos": ("testudos", "testudos", "testudo"),
+    "tetanother": ("tetanother", "tetanother", "tetanothrum"),
+    "tetanothra": ("tetanothra", "tetanothra", "tetanothrum"),
+    "tetanothrum": ("tetanothra", "tetanother", "tetanothrum"),
+    "tete a tete": ("tete a tetes", "tete a tetes", "tete a tete"),
+    "tete a tetes": ("tete a tetes", "tete a tetes", "tete a tete"),
+    "tete-a-tete": ("tete-a-tetes", "tete-a-tetes", "tete-a-tete"),
+    "tete-a-tetes": ("tete-a-tetes", "tete-a-tetes", "tete-a-tete"),
+    "tetracola": ("tetracola", "tetracola", "tetracolon"),
+    "tetracolon": ("tetracola", "tetracola", "tetracolon"),
+    "tetragrammata": ("tetragrammata", "tetragrammata", "tetragrammaton"),
+    "tetragrammaton": ("tetragrammata", "tetragrammata", "tetragrammaton"),
+    "tetrahedra": ("tetrahedra", "tetrahedra", "tetrahedron"),
+    "tetrahedron": ("tetrahedrons", "tetrahedra", "tetrahedron"),
+    "tetrahedrons": ("tetrahedrons", "tetrahedrons", "tetrahedron"),
+    "tetrapleura": ("tetrapleura", "tetrapleura", "tetrapleuron"),
+    "tetrapleuron": ("tetrapleurons", "tetrapleura", "tetrapleuron"),
+    "tetrapleurons": ("tetrapleurons", "tetrapleurons", "tetrapleuron"),
+    "tetrasporangia": ("tetrasporangia", "tetrasporangia", "tetrasporangium"),
+    "tetrasporangium": ("tetrasporangia", "tetrasporangia", "tetrasporangium"),
+    "thalami": ("thalami", "thalami", "thalamus"),
+    "thalamoi": ("thalamoi", "thalamoi", "thalamos"),
+    "thalamos": ("thalamoi", "thalamoi", "thalamos"),
+    "thalamus": ("thalami", "thalami", "thalamus"),
+    "thanatoria": ("thanatoria", "thanatoria", "thanatorium"),
+    "thanatorium": ("thanatoria", "thanatoria", "thanatorium"),
+    "that": ("those", "those", "that"),
+    "thaumaturgi": ("thaumaturgi", "thaumaturgi", "thaumaturgus"),
+    "thaumaturgus": ("thaumaturgi", "thaumaturgi", "thaumaturgus"),
+    "thebe": ("thebe", "thebe", "thebe"),
+    "theca": ("thecae", "thecae", "theca"),
+    "thecae": ("thecae", "thecae", "theca"),
+    "theirs": ("theirs", "theirs", "its"),
+    "thelyca": ("thelyca", "thelyca", "thelycum"),
+    "thelycum": ("thelyca", "thelyca", "thelycum"),
+    "them": ("them", "them", "it"),
+    "thema": ("themata", "themata", "thema"),
+    "themata": ("themata", "themata", "thema"),
+    "themself": ("themselves", "themselves", "themselves"),
+    "themselves": ("themselves", "themselves", "itself"),
+    "theologoumena": ("theologoumena", "theologoumena", "theologoumenon"),
+    "theologoumenon": ("theologoumena", "theologoumena", "theologoumenon"),
+    "thesauri": ("thesauri", "thesauri", "thesaurus"),
+    "thesaurus": ("thesauruses", "thesauri", "thesaurus"),
+    "thesauruses": ("thesauruses", "thesauruses", "thesaurus"),
+    "these": ("these", "these", "this"),
+    "theses": ("theses", "theses", "thesis"),
+    "thesis": ("theses", "theses", "thesis"),
+    "they": ("they", "they", "it"),
+    "thief": ("thieves", "thieves", "thief"),
+    "thieves": ("thieves", "thieves", "thief"),
+    "this": ("these", "these", "this"),
+    "thoes": ("thoes", "thoes", "thos"),
+    "tholi": ("tholi", "tholi", "tholus"),
+    "tholoi": ("tholoi", "tholoi", "tholos"),
+    "tholos": ("tholoi", "tholoi", "tholos"),
+    "tholus": ("tholi", "tholi", "tholus"),
+    "thoraces": ("thoraces", "thoraces", "thorax"),
+    "thorax": ("thoraxes", "thoraces", "thorax"),
+    "thoraxes": ("thoraxes", "thoraxes", "thorax"),
+    "thos": ("thoes", "thoes", "thos"),
+    "those": ("those", "those", "that"),
+    "thraso": ("thrasoes", "thrasones", "thraso"),
+    "thrasoes": ("thrasoes", "thrasoes", "thraso"),
+    "thrasones": ("thrasones", "thrasones", "thraso"),
+    "thymi": ("thymi", "thymi", "thymus"),
+    "thymiateria": ("thymiateria", "thymiateria", "thymiaterion"),
+    "thymiaterion": ("thymiateria", "thymiateria", "thymiaterion"),
+    "thymus": ("thymi", "thymi", "thymus"),
+    "thyridia": ("thyridia", "thyridia", "thyridium"),
+    "thyridium": ("thyridia", "thyridia", "thyridium"),
+    "thyrsi": ("thyrsi", "thyrsi", "thyrsus"),
+    "thyrsus": ("thyrsi", "thyrsi", "thyrsus"),
+    "tibia": ("tibiae", "tibiae", "tibia"),
+    "tibiae": ("tibiae", "tibiae", "tibia"),
+    "timorese": ("timorese", "timorese", "timorese"),
+    "timpano": ("timpanos", "timpanos", "timpano"),
+    "timpanos": ("timpanos", "timpanos", "timpano"),
+    "tintinnabula": ("tintinnabula", "tintinnabula", "tintinnabulum"),
+    "tintinnabulum": ("tintinnabula", "tintinnabula", "tintinnabulum"),
+    "tipula": ("tipulae", "tipulae", "tipula"),
+    "tipulae": ("tipulae", "tipulae", "tipula"),
+    "tiro": ("tiros", "tiros", "tiro"),
+    "tirolese": ("tirolese", "tirolese", "tirolese"),
+    "tiros": ("tiros", "tiros", "tiro"),
+    "to": ("toes", "toes", "to"),
+    "tobacco": ("tobaccos", "tobaccos", "tobacco"),
+    "tobaccos": ("tobaccos", "tobaccos", "tobacco"),
+    "tocharese": ("tocharese", "tocharese", "tocharese"),
+    "toe": ("toes", "toes", "toe"),
+    "toes": ("toes", "toes", "toe"),
+    "togo": ("togos", "togos", "togo"),
+    "togos": ("togos", "togos", "togo"),
+    "tokyo": ("tokyos", "tokyos", "tokyo"),
+    "tokyos": ("tokyos", "tokyos", "tokyo"),
+    "tolkach": ("tolkachi", "tolkachi", "tolkach"),
+    "tolkachi": ("tolkachi", "tolkachi", "tolkach"),
+    "tomato": ("tomatoes", "tomatoes", "tomato"),
+    "tomatoes": ("tomatoes", "tomatoes", "tomato"),
+    "tombaroli": ("tombaroli", "tombaroli", "tombarolo"),
+    "tombarolo": ("tombaroli", "tombaroli", "tombarolo"),
+    "tomia": ("tomia", "tomia", "tomium"),
+    "tomium": ("tomia", "tomia", "tomium"),
+    "tondi": ("tondi", "tondi", "tondo"),
+    "tondo": ("tondi", "tondi", "tondo"),
+    "tong": ("tongs", "tongs", "tong"),
+    "tongs": ("tongs", "tongs", "tongs"),
+    "tonkinese": ("tonkinese", "tonkinese", "tonkinese"),
+    "tonneau": ("tonneaus", "tonneaux", "tonneau"),
+    "tonneaus": ("tonneaus", "tonneaus", "tonneau"),
+    "tonneaux": ("tonneaux", "tonneaux", "tonneau"),
+    "tooth": ("teeth", "teeth", "tooth"),
+    "topaz": ("topazes", "topazes", "topaz"),
+    "topazes": ("topazes", "topazes", "topaz"),
+    "topoi": ("topoi", "topoi", "topos"),
+    "topos": ("topoi", "topoi", "topos"),
+    "torero": ("toreros", "toreros", "torero"),
+    "toreros": ("toreros", "toreros", "torero"),
+    "tori": ("tori", "tori", "torus"),
+    "toril": ("toriles", "toriles", "toril"),
+    "toriles": ("toriles", "toriles", "toril"),
+    "torinese": ("torinese", "torinese", "torinese"),
+    "torino": ("torinos", "torinos", "torino"),
+    "torinos": ("torinos", "torinos", "torino"),
+    "torma": ("tormas", "torma", "torma"),
+    "tormas": ("tormas", "tormas", "torma"),
+    "tornese": ("tornesi", "tornesi", "tornese"),
+    "tornesi": ("tornesi", "tornesi", "tornese"),
+    "torni": ("torni", "torni", "tornus"),
+    "tornus": ("torni", "torni", "tornus"),
+    "toronto": ("torontos", "torontos", "toronto"),
+    "torontos": ("torontos", "torontos", "toronto"),
+    "torso": ("torsos", "torsos", "torso"),
+    "torsos": ("torsos", "torsos", "torso"),
+    "tortilla espanola": ("tortillas espanolas", "tortillas espanolas", "tortilla espanola"),
+    "tortillas espanolas": ("tortillas espanolas", "tortillas espanolas", "tortilla espanola"),
+    "tortrices": ("tortrices", "tortrices", "tortrix"),
+    "tortrix": ("tortrices", "tortrices", "tortrix"),
+    "torula": ("torulae", "torulae", "torula"),
+    "torulae": ("torulae", "torulae", "torula"),
+    "toruli": ("toruli", "toruli", "torulus"),
+    "torulus": ("toruli", "toruli", "torulus"),
+    "torus": ("toruses", "tori", "torus"),
+    "toruses": ("toruses", "toruses", "torus"),
+    "tour de force": ("tours de force", "tours de force", "tour de force"),
+    "tours de force": ("tours de force", "tours de force", "tour de force"),
+    "toxica": ("toxica", "toxica", "toxicum"),
+    "toxicum": ("toxica", "toxica", "toxicum"),
+    "toxii": ("toxii", "toxii", "toxius"),
+    "toxius": ("toxii", "toxii", "toxius"),
+    "toxoplasma": ("toxoplasmata", "toxoplasmata", "toxoplasma"),
+    "toxoplasmata": ("toxoplasmata", "toxoplasmata", "toxoplasma"),
+    "trabea": ("trabeae", "trabeae", "trabea"),
+    "trabeae": ("trabeae", "trabeae", "trabea"),
+    "trabecula": ("trabeculae", "trabeculae", "trabecula"),
+    "trabeculae": ("trabeculae", "trabeculae", "trabecula"),
+    "trachea": ("tracheae", "tracheae", "trachea"),
+    "tracheae": ("tracheae", "tracheae", "trachea"),
+    "tractatrices": ("tractatrices", "tractatrices", "tractatrix"),
+    "tractatrix": ("tractatrices", "tractatrices", "tractatrix"),
+    "tractella": ("tractella", "tractella", "tractellum"),
+    "tractellum": ("tractella", "tractella", "tractellum"),
+    "tractrices": ("tractrices", "tractrices", "tractrix"),
+    "tractrix": ("tractrices", "tractrices", "tractrix"),
+    "tragi": ("tragi", "tragi", "tragus"),
+    "tragus": ("tragi", "tragi", "tragus"),
+    "trapezia": ("trapezia", "trapezia", "trapezium"),
+    "trapezii": ("trapezii", "trapezii", "trapezius"),
+    "trapezium": ("trapeziums", "trapezia", "trapezium"),
+    "trapeziums": ("trapeziums", "trapeziums", "trapezium"),
+    "trapezius": ("trapezii", "trapezii", "trapezius"),
+    "trapezohedra": ("trapezohedra", "trapezohedra", "trapezohedron"),
+    "trapezohedron": ("trapezohedrons", "trapezohedra", "trapezohedron"),
+    "trapezohedrons": ("trapezohedrons", "trapezohedrons", "trapezohedron"),
+    "trattoria": ("trattorias", "trattorie", "trattoria"),
+    "trattorias": ("trattorias", "trattorias", "trattoria"),
+    "trattorie": ("trattorie", "trattorie", "trattoria"),
+    "trauma": ("traumas", "traumata", "trauma"),
+    "traumas": ("traumas", "traumas", "trauma"),
+    "traumata": ("traumata", "traumata", "trauma"),
+    "trellis": ("trellises", "trellises", "trellis"),
+    "trellises": ("trellises", "trellises", "trellis"),
+    "tremolo": ("tremolos", "tremolos", "tremolo"),
+    "tremolos": ("tremolos", "tremolos", "tremolo"),
+    "treponema": ("treponemata", "treponemata", "treponema"),
+    "treponemata": ("treponemata", "treponemata", "treponema"),
+    "trichidia": ("trichidia", "trichidia", "trichidium"),
+    "trichidium": ("trichidia", "trichidia", "trichidium"),
+    "trichina": ("trichine", "trichinae", "trichina"),
+    "trichinae": ("trichinae", "trichinae", "trichina"),
+    "trichine": ("trichine", "trichine", "trichina"),
+    "trichoma": ("trichomata", "trichomata", "trichoma"),
+    "trichomata": ("trichomata", "trichomata", "trichoma"),
+    "triclinia": ("triclinia", "triclinia", "triclinium"),
+    "triclinium": ("triclinia", "triclinia", "triclinium"),
+    "triens": ("trientes", "trientes", "triens"),
+    "trientes": ("trientes", "trientes", "triens"),
+    "triforia": ("triforia", "triforia", "triforium"),
+    "triforium": ("triforia", "triforia", "triforium"),
+    "trilby": ("trilbys", "trilbys", "trilby"),
+    "trilbys": ("trilbys", "trilbys", "trilby"),
+    "tripla": ("tripla", "tripla", "triplum"),
+    "triplum": ("tripla", "tripla", "triplum"),
+    "triradii": ("triradii", "triradii", "triradius"),
+    "triradius": ("triradii", "triradii", "triradius"),
+    "triumvir": ("triumvirs", "triumviri", "triumvir"),
+    "triumviri": ("triumviri", "triumviri", "triumvir"),
+    "triumvirs": ("triumvirs", "triumvirs", "triumvir"),
+    "trochi": ("trochi", "trochi", "trochus"),
+    "trochus": ("trochuses", "trochi", "trochus"),
+    "trochuses": ("trochuses", "trochuses", "trochus"),
+    "trockenbeerenauslese": ("trockenbeerenauslesen", "trockenbeerenauslesen", "trockenbeerenauslese"),
+    "trockenbeerenauslesen": ("trockenbeerenauslesen", "trockenbeerenauslesen", "trockenbeerenauslese"),
+    "tropaeola": ("tropaeola", "tropaeola", "tropaeolum"),
+    "tropaeolum": ("tropaeolums", "tropaeola", "tropaeolum"),
+    "tropaeolums": ("tropaeolums", "tropaeolums", "tropaeolum"),
+    "troparia": ("troparia", "troparia", "troparion"),
+    "troparion": ("troparia", "troparia", "troparion"),
+    "tropides": ("tropides", "tropides", "tropis"),
+    "tropis": ("tropides", "tropides", "tropis"),
+    "trousers": ("trousers", "trousers", "trousers"),
+    "trousseau": ("trousseaus", "trousseaux", "trousseau"),
+    "trousseaus": ("trousseaus", "trousseaus", "trousseau"),
+    "trousseaux": ("trousseaux", "trousseaux", "trousseau"),
+    "trout": ("trout", "trout", "trout"),
+    "trulli": ("trulli", "trulli", "trullo"),
+    "trullo": ("trulli", "trulli", "trullo"),
+    "trumeau": ("trumeaux", "trumeaux", "trumeau"),
+    "trumeaux": ("trumeaux", "trumeaux", "trumeau"),
+    "tsuba": ("tsubas", "tsuba", "tsuba"),
+    "tsubas": ("tsubas", "tsubas", "tsuba"),
+    "tsubo": ("tsubos", "tsubo", "tsubo"),
+    "tsubos": ("tsubos", "tsubos", "tsubo"),
+    "tuber": ("tuberes", "tuberes", "tuber"),
+    "tubercula": ("tubercula", "tubercula", "tuberculum"),
+    "tuberculoma": ("tuberculomas", "tuberculomata", "tuberculoma"),
+    "tuberculomas": ("tuberculomas", "tuberculomas", "tuberculoma"),
+    "tuberculomata": ("tuberculomata", "tuberculomata", "tuberculoma"),
+    "tuberculum": ("tubercula", "tubercula", "tuberculum"),
+    "tuberes": ("tuberes", "tuberes", "tuber"),
+    "tubuli": ("tubuli", "tubuli", "tubulus"),
+    "tubulus": ("tubuli", "tubuli", "tubulus"),
+    "tumuli": ("tumuli", "tumuli", "tumulus"),
+    "tumulus": ("tumuli", "tumuli", "tumulus"),
+    "tuna": ("tuna", "tuna", "tuna"),
+    "turbot": ("turbots", "turbot", "turbot"),
+    "turbots": ("turbots", "turbots", "turbot"),
+    "turf": ("turfs", "turves", "turf"),
+    "turfs": ("turfs", "turfs", "turf"),
+    "turron": ("turrons", "turrones", "turron"),
+    "turrones": ("turrones", "turrones", "turron"),
+    "turrons": ("turrons", "turrons", "turron"),
+    "turves": ("turves", "turves", "turf"),
+    "tympana": ("tympana", "tympana", "tympanum"),
+    "tympanum": ("tympana", "tympana", "tympanum"),
+    "typo": ("typos", "typos", "typo"),
+    "typos": ("typos", "typos", "typo"),
+    "tyro": ("tyros", "tyros", "tyro"),
+    "tyrolese": ("tyrolese", "tyrolese", "tyrolese"),
+    "tyros": ("tyros", "tyros", "tyro"),
+    "udarnik": ("udarniki", "udarniki", "udarnik"),
+    "udarniki": ("udarniki", "udarniki", "udarnik"),
+    "ulpan": ("ulpanim", "ulpanim", "ulpan"),
+    "ulpanim": ("ulpanim", "ulpanim", "ulpan"),
+    "ultimata": ("ultimata", "ultimata", "ultimatum"),
+    "ultimatum": ("ultimatums", "ultimata", "ultimatum"),
+    "ultimatums": ("ultimatums", "ultimatums", "ultimatum"),
+    "umbilici": ("umbilici", "umbilici", "umbilicus"),
+    "umbilicus": ("umbilicuses", "umbilici", "umbilicus"),
+    "umbilicuses": ("umbilicuses", "umbilicuses", "umbilicus"),
+    "umbo": ("umbos", "umbones", "umbo"),
+    "umbones": ("umbones", "umbones", "umbo"),
+    "umbos": ("umbos", "umbos", "umbo"),
+    "umbra": ("umbras", "umbrae", "umbra"),
+    "umbrae": ("umbrae", "umbrae", "umbra"),
+    "umbras": ("umbras", "umbras", "umbra"),
+    "umwelt": ("umwelten", "umwelten", "umwelt"),
+    "umwelten": ("umwelten", "umwelten", "umwelt"),
+    "unci": ("unci", "unci", "uncus"),
+    "uncia": ("unciae", "unciae", "uncia"),
+    "unciae": ("unciae", "unciae", "uncia"),
+    "uncini": ("uncini", "uncini", "uncinus"),
+    "uncinus": ("uncini", "uncini", "uncinus"),
+    "uncus": ("unci", "unci", "uncus"),
+    "ungues": ("ungues", "ungues", "unguis"),
+    "unguis": ("ungues", "ungues", "unguis"),
+    "unio": ("unios", "uniones", "unio"),
+    "uniones": ("uniones", "uniones", "unio"),
+    "unios": ("unios", "unios", "unio"),
+    "uomini": ("uomini", "uomini", "uomo"),
+    "uomini universali": ("uomini universali", "uomini universali", "uomo universale"),
+    "uomo": ("uomini", "uomini", "uomo"),
+    "uomo universale": ("uomini universali", "uomini universali", "uomo universale"),
+    "uraei": ("uraei", "uraei", "uraeus"),
+    "uraeus": ("uraei", "uraei", "uraeus"),
+    "uredia": ("uredia", "uredia", "uredium"),
+    "uredinia": ("uredinia", "uredinia", "uredinium"),
+    "uredinium": ("uredinia", "uredinia", "uredinium"),
+    "uredium": ("uredia", "uredia", "uredium"),
+    "uredosori": ("uredosori", "uredosori", "uredosorus"),
+    "uredosorus": ("uredosori", "uredosori", "uredosorus"),
+    "uri": ("uri", "uri", "urus"),
+    "urodaea": ("urodaea", "urodaea", "urodaeum"),
+    "urodaeum": ("urodaea", "urodaea", "urodaeum"),
+    "urodea": ("urodea", "urodea", "urodeum"),
+    "urodeum": ("urodea", "urodea", "urodeum"),
+    "urus": ("uruses", "uri", "urus"),
+    "uruses": ("uruses", "uruses", "urus"),
+    "us": ("us", "us", "me"),
+    "usnea": ("usneas", "usneae", "usnea"),
+    "usneae": ("usneae", "usneae", "usnea"),
+    "usneas": ("usneas", "usneas", "usnea"),
+    "ustilagines": ("ustilagines", "ustilagines", "ustilago"),
+    "ustilago": ("ustilagines", "ustilagines", "ustilago"),
+    "uteri": ("uteri", "uteri", "uterus"),
+    "uterus": ("uteruses", "uteri", "uterus"),
+    "uteruses": ("uteruses", "uteruses", "uterus"),
+    "utricularia": ("utriculariae", "utriculariae", "utricularia"),
+    "utriculariae": ("utriculariae", "utriculariae", "utricularia"),
+    "uva": ("uvae", "uvae", "uva"),
+    "uvae": ("uvae", "uvae", "uva"),
+    "vaalpens": ("vaalpens", "vaalpensen", "vaalpens"),
+    "vaalpensen": ("vaalpensen", "vaalpensen", "vaalpens"),
+    "vacua": ("vacua", "vacua", "vacuum"),
+    "vacuum": ("vacuums", "vacua", "vacuum"),
+    "vacuums": ("vacuums", "vacuums", "vacuum"),
+    "vagi": ("vagi", "vagi", "vagus"),
+    "vagina": ("vaginas", "vaginae", "vagina"),
+    "vaginae": ("vaginae", "vaginae", "vagina"),
+    "vaginas": ("vaginas", "vaginas", "vagina"),
+    "vaginula": ("vaginulae", "vaginulae", "vaginula"),
+    "vaginulae": ("vaginulae", "vaginulae", "vaginula"),
+    "vagus": ("vagi", "vagi", "vagus"),
+    "vallecula": ("valleculae", "valleculae", "vallecula"),
+    "valleculae": ("valleculae", "valleculae", "vallecula"),
+    "valuta": ("valute", "valuten", "valuta"),
+    "valute": ("valute", "valute", "valuta"),
+    "valuten": ("valuten", "valuten", "valuta"),
+    "valvula": ("valvulae", "valvulae", "valvula"),
+    "valvulae": ("valvulae", "valvulae", "valvula"),
+    "vaporetti": ("vaporetti", "vaporetti", "vaporetto"),
+    "vaporetto": ("vaporettos", "vaporetti", "vaporetto"),
+    "vaporettos": ("vaporettos", "vaporettos", "vaporetto"),
+    "vaquero": ("vaqueros", "vaqueros", "vaquero"),
+    "vaqueros": ("vaqueros", "vaqueros", "vaquero"),
+    "varella": ("varellaes", "varely", "varella"),
+    "varellaes": ("varellaes", "varellaes", "varella"),
+    "varely": ("varely", "varely", "varella"),
+    "varia lectio": ("variae lectiones", "variae lectiones", "varia lectio"),
+    "variae lectiones": ("variae lectiones", "variae lectiones", "varia lectio"),
+    "varices": ("varices", "varices", "varix"),
+    "varix": ("varices", "varices", "varix"),
+    "vas": ("vasa", "vasa", "vas"),
+    "vasa": ("vasa", "vasa", "vas"),
+    "vascula": ("vascula", "vascula", "vasculum"),
+    "vasculitides": ("vasculitides", "vasculitides", "vasculitis"),
+    "vasculitis": ("vasculitises", "vasculitides", "vasculitis"),
+    "vasculitises": ("vasculitises", "vasculitises", "vasculitis"),
+    "vasculum": ("vasculums", "vascula", "vasculum"),
+    "vasculums": ("vasculums", "vasculums", "vasculum"),
+    "veduta": ("vedutas", "vedute", "veduta"),
+    "vedutas": ("vedutas", "vedutas", "veduta"),
+    "vedute": ("vedute", "vedute", "veduta"),
+    "veg": ("veges", "veg", "veg"),
+    "veges": ("veges", "veges", "veg"),
+    "vehicula": ("vehicula", "vehicula", "vehiculum"),
+    "vehiculum": ("vehicula", "vehicula", "vehiculum"),
+    "vela": ("vela", "vela", "velum"),
+    "velamen": ("velamina", "velamina", "velamen"),
+    "velamina": ("velamina", "velamina", "velamen"),
+    "velaria": ("velaria", "velaria", "velarium"),
+    "velarium": ("velaria", "velaria", "velarium"),
+    "velum": ("velums", "vela", "velum"),
+    "velums": ("velums", "velums", "velum"),
+    "vena": ("venae", "venae", "vena"),
+    "venae": ("venae", "venae", "vena"),
+    "veneres": ("veneres", "veneres", "venus"),
+    "venus": ("venuses", "veneres", "venus"),
+    "venuses": ("venuses", "venuses", "venus"),
+    "vermicello": ("vermicellos", "vermicellos", "vermicello"),
+    "vermicellos": ("vermicellos", "vermicellos", "vermicello"),
+    "vermiculi": ("vermiculi", "vermiculi", "vermiculus"),
+    "vermiculus": ("vermiculi", "vermiculi", "vermiculus"),
+    "vermontese": ("vermontese", "vermontese", "vermontese"),
+    "veronese": ("veronese", "veronese", "veronese"),
+    "verruca": ("verrucae", "verrucae", "verruca"),
+    "verrucae": ("verrucae", "verrucae", "verruca"),
+    "vers libre": ("vers libres", "vers libres", "vers libre"),
+    "vers libres": ("vers libres", "vers libres", "vers libre"),
+    "versiculi": ("versiculi", "versiculi", "versiculus"),
+    "versiculus": ("versiculi", "versiculi", "versiculus"),
+    "verso": ("versos", "versos", "verso"),
+    "versos": ("versos", "versos", "verso"),
+    "vertebra": ("vertebrae", "vertebrae", "vertebra"),
+    "vertebrae": ("vertebrae", "vertebrae", "vertebra"),
+    "vertex": ("vertexes", "vertices", "vertex"),
+    "vertexes": ("vertexes", "vertexes", "vertex"),
+    "vertices": ("vertices", "vertices", "vertex"),
+    "verticilli": ("verticilli", "verticilli", "verticillus"),
+    "verticillus": ("verticilli", "verticilli", "verticillus"),
+    "vesicula": ("vesiculae", "vesiculae", "vesicula"),
+    "vesiculae": ("vesiculae", "vesiculae", "vesicula"),
+    "vestigia": ("vestigia", "vestigia", "vestigium"),
+    "vestigium": ("vestigia", "vestigia", "vestigium"),
+    "vetturini": ("vetturini", "vetturini", "vetturino"),
+    "vetturino": ("vetturini", "vetturini", "vetturino"),
+    "viale": ("viali", "viali", "viale"),
+    "viali": ("viali", "viali", "viale"),
+    "viatica": ("viatica", "viatica", "viaticum"),
+    "viaticum": ("viatica", "viatica", "viaticum"),
+    "vibex": ("vibices", "vibices", "vibex"),
+    "vibices": ("vibices", "vibices", "vibex"),
+    "vibracula": ("vibracula", "vibracula", "vibraculum"),
+    "vibraculum": ("vibracula", "vibracula", "vibraculum"),
+    "vibrato": ("vibratos", "vibratos", "vibrato"),
+    "vibratos": ("vibratos", "vibratos", "vibrato"),
+    "vibrio": ("vibrios", "vibriones", "vibrio"),
+    "vibriones": ("vibriones", "vibriones", "vibrio"),
+    "vibrios": ("vibrios", "vibrios", "vibrio"),
+    "viennese": ("viennese", "viennese", "viennese"),
+    "vietnamese": ("vietnamese", "vietnamese", "vietnamese"),
+    "vila": ("vilas", "vile", "vila"),
+    "vilas": ("vilas", "vilas", "vila"),
+    "vile": ("vile", "vile", "vila"),
+    "villanella": ("villanelle", "villanelle", "villanella"),
+    "villanelle": ("villanelle", "villanelle", "villanella"),
+    "villi": ("villi", "villi", "villus"),
+    "villini": ("villini", "villini", "villino"),
+    "villino": ("villini", "villini", "villino"),
+    "villus": ("villi", "villi", "villus"),
+    "vincula": ("vincula", "vincula", "vinculum"),
+    "vinculum": ("vincula", "vincula", "vinculum"),
+    "violetta": ("violette", "violette", "violetta"),
+    "violette": ("violette", "violette", "violetta"),
+    "violoncello": ("violoncellos", "violoncellos", "violoncello"),
+    "violoncellos": ("violoncellos", "violoncellos", "violoncello"),
+    "vires": ("vires", "vires", "vis"),
+    "virga": ("virgae", "virgae", "virga"),
+    "virgae": ("virgae", "virgae", "virga"),
+    "virgo": ("virgos", "virgos", "virgo"),
+    "virgos": ("virgos", "virgos", "virgo"),
+    "viri": ("viri", "viri", "virus"),
+    "virii": ("virii", "virii", "virus"),
+    "virtuosi": ("virtuosi", "virtuosi", "virtuoso"),
+    "virtuoso": ("virtuosos", "virtuosi", "virtuoso"),
+    "virtuosos": ("virtuosos", "virtuosos", "virtuoso"),
+    "virus": ("viruses", "viruses", "virus"),
+    "viruses": ("viruses", "viruses", "virus"),
+    "vis": ("vires", "vires", "vis"),
+    "viscera": ("viscera", "viscera", "viscus"),
+    "viscus": ("viscera", "viscera", "viscus"),
+    "vitellaria": ("vitellaria", "vitellaria", "vitellarium"),
+    "vitellarium": ("vitellaria", "vitellaria", "vitellarium"),
+    "vitta": ("vittae", "vittae", "vitta"),
+    "vittae": ("vittae", "vittae", "vitta"),
+    "vivaria": ("vivaria", "vivaria", "vivarium"),
+    "vivarium": ("vivariums", "vivaria", "vivarium"),
+    "vivariums": ("vivariums", "vivariums", "vivarium"),
+    "vlakte": ("vlaktes", "vlakten", "vlakte"),
+    "vlakten": ("vlakten", "vlakten", "vlakte"),
+    "vlaktes": ("vlaktes", "vlaktes", "vlakte"),
+    "voeu": ("voeux", "voeux", "voeu"),
+    "voeux": ("voeux", "voeux", "voeu"),
+    "volcanelli": ("volcanelli", "volcanelli", "volcanello"),
+    "volcanello": ("volcanelli", "volcanelli", "volcanello"),
+    "volcano": ("volcanos", "volcanoes", "volcano"),
+    "volcanoes": ("volcanoes", "volcanoes", "volcano"),
+    "volcanos": ("volcanos", "volcanos", "volcano"),
+    "vomica": ("vomicas", "vomicae", "vomica"),
+    "vomicae": ("vomicae", "vomicae", "vomica"),
+    "vomicas": ("vomicas", "vomicas", "vomica"),
+    "vomitoria": ("vomitoria", "vomitoria", "vomitorium"),
+    "vomitorium": ("vomitoriums", "vomitoria", "vomitorium"),
+    "vomitoriums": ("vomitoriums", "vomitoriums", "vomitorium"),
+    "voorbok": ("voorbokke", "voorbokke", "voorbok"),
+    "voorbokke": ("voorbokke", "voorbokke", "voorbok"),
+    "vorspiel": ("vorspiele", "vorspiele", "vorspiel"),
+    "vorspiele": ("vorspiele", "vorspiele", "vorspiel"),
+    "vorstellung": ("vorstellungen", "vorstellungen", "vorstellung"),
+    "vorstellungen": ("vorstellungen", "vorstellungen", "vorstellung"),
+    "vortex": ("vortexes", "vortices", "vortex"),
+    "vortexes": ("vortexes", "vortexes", "vortex"),
+    "vortices": ("vortices", "vortices", "vortex"),
+    "wadi": ("wadies", "wadis", "wadi"),
+    "wadies": ("wadies", "wadies", "wadi"),
+    "wadis": ("wadis", "wadis", "wadi"),
+    "wady": ("wadies", "wadys", "wady"),
+    "wadys": ("wadys", "wadys", "wady"),
+    "waldo": ("waldos", "waldoes", "waldo"),
+    "waldoes": ("waldoes", "waldoes", "waldo"),
+    "waldos": ("waldos", "waldos", "waldo"),
+    "waltz": ("waltzes", "waltzes", "waltz"),
+    "waltzes": ("waltzes", "waltzes", "waltz"),
+    "wanderjahr": ("wanderjahre", "wanderjahre", "wanderjahr"),
+    "wanderjahre": ("wanderjahre", "wanderjahre", "wanderjahr"),
+    "wandervogel": ("wandervogel", "wandervogel", "wandervogel"),
+    "washer up": ("washers up", "washers up", "washer up"),
+    "washer-up": ("washers-up", "washers-up", "washer-up"),
+    "washers up": ("washers up", "washers up", "washer up"),
+    "washers-up": ("washers-up", "washers-up", "washer-up"),
+    "we": ("we", "we", "I"),
+    "weirdo": ("weirdos", "weirdos", "weirdo"),
+    "weirdos": ("weirdos", "weirdos", "weirdo"),
+    "wenchowese": ("wenchowese", "wenchowese", "wenchowese"),
+    "wharf": ("wharfs", "wharves", "wharf"),
+    "wharfs": ("wharfs", "wharfs", "wharf"),
+    "wharves": ("wharves", "wharves", "wharf"),
+    "what": ("what", "what", "what"),
+    "whatever": ("whatever", "whatever", "whatever"),
+    "whatsoever": ("whatsoever", "whatsoever", "whatsoever"),
+    "white staff": ("white staves", "white staves", "white staff"),
+    "white staves": ("white staves", "white staves", "white staff"),
+    "whiting": ("whiting", "whiting", "whiting"),
+    "whitmanese": ("whitmanese", "whitmanese", "whitmanese"),
+    "who": ("who", "who", "who"),
+    "whoever": ("whoever", "whoever", "whoever"),
+    "whom": ("whom", "whom", "whom"),
+    "whomever": ("whomever", "whomever", "whomever"),
+    "whomsoever": ("whomsoever", "whomsoever", "whomsoever"),
+    "whose": ("whose", "whose", "whose"),
+    "whosesoever": ("whosesoever", "whosesoever", "whosesoever"),
+    "whosever": ("whosever", "whosever", "whosever"),
+    "whosoever": ("whosoever", "whosoever", "whosoever"),
+    "wife": ("wives", "wives", "wife"),
+    "wildebeest": ("wildebeests", "wildebeest", "wildebeest"),
+    "wildebeests": ("wildebeests", "wildebeests", "wildebeest"),
+    "wives": ("wives", "wives", "wife"),
+    "wolf": ("wolves", "wolves", "wolf"),
+    "wolves": ("wolves", "wolves", "wolf"),
+    "woman child": ("women children", "women children", "woman child"),
+    "woman servant": ("women servants", "women servants", "woman servant"),
+    "woman-child": ("women-children", "women-children", "woman-child"),
+    "woman-servant": ("women-servants", "women-servants", "woman-servant"),
+    "womanchild": ("womenchildren", "womenchildren", "womanchild"),
+    "women children": ("women children", "women children", "woman child"),
+    "women servants": ("women servants", "women servants", "woman servant"),
+    "women-children": ("women-children", "women-children", "woman-child"),
+    "women-servants": ("women-servants", "women-servants", "woman-servant"),
+    "womenchildren": ("womenchildren", "womenchildren", "womanchild"),
+    "wreath": ("wreaths", "wreaths", "wreath"),
+    "wreaths": ("wreaths", "wreaths", "wreath"),
+    "xanthoma": ("xanthomas", "xanthomata", "xanthoma"),
+    "xanthomas": ("xanthomas", "xanthomas", "xanthoma"),
+    "xanthomata": ("xanthomata", "xanthomata", "xanthoma"),
+    "xiphiplastra": ("xiphiplastra", "xiphiplastra", "xiphiplastron"),
+    "xiphiplastron": ("xiphiplastra", "xiphiplastra", "xiphiplastron"),
+    "xiphopagi": ("xiphopagi", "xiphopagi", "xiphopagus"),
+    "xiphopagus": ("xiphopagi", "xiphopagi", "xiphopagus"),
+    "xiphoplastra": ("xiphoplastra", "xiphoplastra", "xiphoplastron"),
+    "xiphoplastron": ("xiphoplastra", "xiphoplastra", "xiphoplastron"),
+    "xoana": ("xoana", "xoana", "xoanon"),
+    "xoanon": ("xoana", "xoana", "xoanon"),
+    "xysti": ("xysti", "xysti", "xystus"),
+    "xystus": ("xysti", "xysti", "xystus"),
+    "yakiman": ("yakimans", "yakimans", "yakiman"),
+    "yakimans": ("yakimans", "yakimans", "yakiman"),
+    "yamoussoukro": ("yamoussoukros", "yamoussoukros", "yamoussoukro"),
+    "yamoussoukros": ("yamoussoukros", "yamoussoukros", "yamoussoukro"),
+    "yarraman": ("yarramen", "yarramans", "yarraman"),
+    "yarramans": ("yarramans", "yarramans", "yarraman"),
+    "yarramen": ("yarramen", "yarramen", "yarraman"),
+    "yengeese": ("yengeese", "yengeese", "yengeese"),
+    "yes": ("yeses", "yeses", "yes"),
+    "yeses": ("yeses", "yeses", "yes"),
+    "yo": ("yoes", "yoes", "yo"),
+    "yo yo": ("yo yos", "yo yos", "yo yo"),
+    "yo yos": ("yo yos", "yo yos", "yo yo"),
+    "yo-yo": ("yo-yos", "yo-yos", "yo-yo"),
+    "yo-yos": ("yo-yos", "yo-yos", "yo-yo"),
+    "yoe": ("yoes", "yoes", "yoe"),
+    "yoes": ("yoes", "yoes", "yo"),
+    "yokohaman": ("yokohamans", "yokohamans", "yokohaman"),
+    "yokohamans": ("yokohamans", "yokohamans", "yokohaman"),
+    "you": ("you", "you", "you"),
+    "yours": ("yours", "yours", "yours"),
+    "yourself": ("yourselves", "yourselves", "yourself"),
+    "yourselves": ("yourselves", "yourselves", "yourself"),
+    "yuman": ("yumans", "yumans", "yuman"),
+    "yumans": ("yumans", "yumans", "yuman"),
+    "yunnanese": ("yunnanese", "yunnanese", "yunnanese"),
+    "yuo": ("yuon", "yuon", "yuo"),
+    "yuon": ("yuon", "yuon", "yuo"),
+    "zadruga": ("zadrugas", "zadruge", "zadruga"),
+    "zadrugas": ("zadrugas", "zadrugas", "zadruga"),
+    "zadruge": ("zadruge", "zadruge", "zadruga"),
+    "zeitgeber": ("zeitgebers", "zeitgebers", "zeitgeber"),
+    "zeitgebers": ("zeitgebers", "zeitgebers", "zeitgeber"),
+    "zemirah": ("zemiroth", "zemirot", "zemirah"),
+    "zemirot": ("zemirot", "zemirot", "zemirah"),
+    "zemiroth": ("zemiroth", "zemiroth", "zemirah"),
+    "zeppole": ("zeppoli", "zeppoli", "zeppole"),
+    "zeppoli": ("zeppoli", "zeppoli", "zeppole"),
+    "zero": ("zeros", "zeros", "zero"),
+    "zeros": ("zeros", "zeros", "zero"),
+    "zibo": ("zibos", "zibos", "zibo"),
+    "zibos": ("zibos", "zibos", "zibo"),
+    "zingani": ("zingani", "zingani", "zingano"),
+    "zingano": ("zingani", "zingani", "zingano"),
+    "zita": ("ziti", "zite", "zita"),
+    "zite": ("zite", "zite", "zita"),
+    "zitella": ("zitelle", "zitelle", "zitella"),
+    "zitelle": ("zitelle", "zitelle", "zitella"),
+    "ziti": ("ziti", "ziti", "zita"),
+    "zizz": ("zizzes", "zizzes", "zizz"),
+    "zizzes": ("zizzes", "zizzes", "zizz"),
+    "zloty": ("zlotys", "zloty", "zloty"),
+    "zlotys": ("zlotys", "zlotys", "zloty"),
+    "zoaea": ("zoaeae", "zoaeae", "zoaea"),
+    "zoaeae": ("zoaeae", "zoaeae", "zoaea"),
+    "zoaria": ("zoaria", "zoaria", "zoarium"),
+    "zoarium": ("zoaria", "zoaria", "zoarium"),
+    "zoea": ("zoeas", "zoeae", "zoea"),
+    "zoeae": ("zoeae", "zoeae", "zoea"),
+    "zoeas": ("zoeas", "zoeas", "zoea"),
+    "zooea": ("zooeae", "zooeae", "zooea"),
+    "zooeae": ("zooeae", "zooeae", "zooea"),
+    "zooecia": ("zooecia", "zooecia", "zooecium"),
+    "zooecium": ("zooecia", "zooecia", "zooecium"),
+    "zoophori": ("zoophori", "zoophori", "zoophorus"),
+    "zoophorus": ("zoophori", "zoophori", "zoophorus"),
+    "zoosporangia": ("zoosporangia", "zoosporangia", "zoosporangium"),
+    "zoosporangium": ("zoosporangia", "zoosporangia", "zoosporangium"),
+    "zophori": ("zophori", "zophori", "zophorus"),
+    "zophorus": ("zophori", "zophori", "zophorus"),
+    "zucca": ("zucche", "zucche", "zucca"),
+    "zucche": ("zucche", "zucche", "zucca"),
+    "zucchini": ("zucchinis", "zucchini", "zucchini"),
+    "zucchinis": ("zucchinis", "zucchinis", "zucchini"),
+    "zuppa": ("zuppe", "zuppe", "zuppa"),
+    "zuppe": ("zuppe", "zuppe", "zuppa"),
+    "zuz": ("zuzzes", "zuzim", "zuz"),
+    "zuzim": ("zuzim", "zuzim", "zuz"),
+    "zuzzes": ("zuzzes", "zuzzes", "zuz"),
+    "zyga": ("zyga", "zyga", "zygon"),
+    "zygantra": ("zygantra", "zygantra", "zygantrum"),
+    "zygantrum": ("zygantra", "zygantra", "zygantrum"),
+    "zygoma": ("zygomas", "zygomata", "zygoma"),
+    "zygomas": ("zygomas", "zygomas", "zygoma"),
+    "zygomata": ("zygomata", "zygomata", "zygoma"),
+    "zygon": ("zyga", "zyga", "zygon"),
+}
+
+# Mapping of every verb in the dictionaries of `verb_core` to its singular, plural,
+# past, present participle and past participle form, as computed by `Verb`
+verb_paradigms = {
+    "abide": ("abides", "abide", "abided", "abiding", "abided"),
+    "abided": ("abideds", "abided", "abided", "abiding", "abided"),
+    "abides": ("abides", "abide", "abided", "abiding", "abided"),
+    "abiding": ("abidings", "abiding", "abided", "abiding", "abided"),
+    "ache": ("aches", "ache", "ached", "aching", "ached"),
+    "ached": ("acheds", "ached", "ached", "aching", "ached"),
+    "aches": ("aches", "ache", "ached", "aching", "ached"),
+    "aching": ("achings", "aching", "ached", "aching", "ached"),
+    "am": ("am", "are", "was", "being", "been"),
+    "arc": ("arcs", "arc", "arced", "arcing", "arced"),
+    "arced": ("arceds", "arced", "arced", "arcing", "arced"),
+    "arcing": ("arcings", "arcing", "arced", "arcing", "arced"),
+    "arcs": ("arcs", "arc", "arced", "arcing", "arced"),
+    "are": ("is", "are", "were", "being", "been"),
+    "arise": ("arises", "arise", "arose", "arising", "arisen"),
+    "arisen": ("arisens", "arisen", "arose", "arising", "arisen"),
+    "arises": ("arises", "arise", "arose", "arising", "arisen"),
+    "arising": ("arisings", "arising", "arose", "arising", "arisen"),
+    "arose": ("aroses", "arose", "arose", "arising", "arisen"),
+    "ask": ("asks", "ask", "asked", "asking", "asked"),
+    "asked": ("askeds", "asked", "asked", "asking", "asked"),
+    "asking": ("askings", "asking", "asked", "asking", "asked"),
+    "asks": ("asks", "ask", "asked", "asking", "asked"),
+    "ate": ("ates", "ate", "ate", "eating", "eaten"),
+    "avalanche": ("avalanches", "avalanche", "avalanched", "avalanching", "avalanched"),
+    "avalanched": ("avalancheds", "avalanched", "avalanched", "avalanching", "avalanched"),
+    "avalanches": ("avalanches", "avalanche", "avalanched", "avalanching", "avalanched"),
+    "avalanching": ("avalanchings", "avalanching", "avalanched", "avalanching", "avalanched"),
+    "awake": ("awakes", "awake", "awoke", "awakening", "awoken"),
+    "awakening": ("awakenings", "awakening", "awoke", "awakening", "awoken"),
+    "awakes": ("awakes", "awake", "awoke", "awakening", "awoken"),
+    "awoke": ("awokes", "awoke", "awoke", "awakening", "awoken"),
+    "awoken": ("awokens", "awoken", "awoke", "awakening", "awoken"),
+    "be": ("is", "be", "were", "being", "been"),
+    "beat": ("beats", "beat", "beat", "beating", "beaten"),
+    "beaten": ("beatens", "beaten", "beat", "beating", "beaten"),
+    "beating": ("beatings", "beating", "beat", "beating", "beaten"),
+    "beats": ("beats", "beat", "beat", "beating", "beaten"),
+    "became": ("becames", "became", "became", "becoming", "become"),
+    "become": ("becomes", "become", "became", "becoming", "become"),
+    "becomes": ("becomes", "become", "became", "becoming", "become"),
+    "becoming": ("becomings", "becoming", "became", "becoming", "become"),
+    "been": ("beens", "been", "was", "being", "been"),
+    "began": ("begans", "began", "began", "beginning", "begun"),
+    "beget": ("begets", "beget", "begot", "begetting", "begotten"),
+    "begets": ("begets", "beget", "begot", "begetting", "begotten"),
+    "begetting": ("begettings", "begetting", "begot", "begetting", "begotten"),
+    "begin": ("begins", "begin", "began", "beginning", "begun"),
+    "beginning": ("beginnings", "beginning", "began", "beginning", "begun"),
+    "begins": ("begins", "begin", "began", "beginning", "begun"),
+    "begot": ("begots", "begot", "begot", "begetting", "begotten"),
+    "begotten": ("begottens", "begotten", "begot", "begetting", "begotten"),
+    "begun": ("beguns", "begun", "began", "beginning", "begun"),
+    "beheld": ("behelds", "beheld", "beheld", "beholding", "beheld"),
+    "behold": ("beholds", "behold", "beheld", "beholding", "beheld"),
+    "beholding": ("beholdings", "beholding", "beheld", "beholding", "beheld"),
+    "beholds": ("beholds", "behold", "beheld", "beholding", "beheld"),
+    "being": ("beings", "being", "was", "being", "been"),
+    "bellyache": ("bellyaches", "bellyache", "bellyached", "bellyaching", "bellyached"),
+    "bellyached": ("bellyacheds", "bellyached", "bellyached", "bellyaching", "bellyached"),
+    "bellyaches": ("bellyaches", "bellyache", "bellyached", "bellyaching", "bellyached"),
+    "bellyaching": ("bellyachings", "bellyaching", "bellyached", "bellyaching", "bellyached"),
+    "bend": ("bends", "bend", "bent", "bending", "bent"),
+    "bending": ("bendings", "bending", "bent", "bending", "bent"),
+    "bends": ("bends", "bend", "bent", "bending", "bent"),
+    "bent": ("bents", "bent", "bent", "bending", "bent"),
+    "bet": ("bets", "bet", "bet", "betting", "bet"),
+    "bets": ("bets", "bet", "bet", "betting", "bet"),
+    "betting": ("bettings", "betting", "bet", "betting", "bet"),
+    "bias": ("biases", "bias", "biased", "biasing", "biased"),
+    "biased": ("biaseds", "biased", "biased", "biasing", "biased"),
+    "biases": ("biases", "bias", "biased", "biasing", "biased"),
+    "biasing": ("biasings", "biasing", "biased", "biasing", "biased"),
+    "bit": ("bits", "bit", "bit", "biting", "bitten"),
+    "bite": ("bites", "bite", "bit", "biting", "bitten"),
+    "bites": ("bites", "bite", "bit", "biting", "bitten"),
+    "biting": ("bitings", "biting", "bit", "biting", "bitten"),
+    "bitten": ("bittens", "bitten", "bit", "biting", "bitten"),
+    "bled": ("bleds", "bled", "bled", "bleeding", "bled"),
+    "bleed": ("bleeds", "bleed", "bled", "bleeding", "bled"),
+    "bleeding": ("bleedings", "bleeding", "bled", "bleeding", "bled"),
+    "bleeds": ("bleeds", "bleed", "bled", "bleeding", "bled"),
+    "blew": ("blews", "blew", "blew", "blowing", "blown"),
+    "blitz": ("blitzes", "blitz", "blitzed", "blitzing", "blitzed"),
+    "blitzed": ("blitzeds", "blitzed", "blitzed", "blitzing", "blitzed"),
+    "blitzes": ("blitzes", "blitz", "blitzed", "blitzing", "blitzed"),
+    "blitzing": ("blitzings", "blitzing", "blitzed", "blitzing", "blitzed"),
+    "blow": ("blows", "blow", "blew", "blowing", "blown"),
+    "blowing": ("blowings", "blowing", "blew", "blowing", "blown"),
+    "blown": ("blowns", "blown", "blew", "blowing", "blown"),
+    "blows": ("blows", "blow", "blew", "blowing", "blown"),
+    "break": ("breaks", "break", "broke", "breaking", "broken"),
+    "breaking": ("breakings", "breaking", "broke", "breaking", "broken"),
+    "breaks": ("breaks", "break", "broke", "breaking", "broken"),
+    "bring": ("brings", "bring", "brought", "bringing", "brought"),
+    "bringing": ("bringings", "bringing", "brought", "bringing", "brought"),
+    "brings": ("brings", "bring", "brought", "bringing", "brought"),
+    "broke": ("brokes", "broke", "broke", "breaking", "broken"),
+    "broken": ("brokens", "broken", "broke", "breaking", "broken"),
+    "brought": ("broughts", "brought", "brought", "bringing", "brought"),
+    "build": ("builds", "build", "built", "building", "built"),
+    "building": ("buildings", "building", "built", "building", "built"),
+    "builds": ("builds", "build", "built", "building", "built"),
+    "built": ("builts", "built", "built", "building", "built"),
+    "burn": ("burns", "burn", "burnt", "burning", "burnt"),
+    "burning": ("burnings", "burning", "burnt", "burning", "burnt"),
+    "burns": ("burns", "burn", "burnt", "burning", "burnt"),
+    "burnt": ("burnts", "burnt", "burnt", "burning", "burnt"),
+    "burst": ("bursts", "burst", "burst", "bursting", "burst"),
+    "bursting": ("burstings", "bursting", "burst", "bursting", "burst"),
+    "bursts": ("bursts", "burst", "burst", "bursting", "burst"),
+    "bus": ("buses", "bus", "bused", "busing", "bused"),
+    "bused": ("buseds", "bused", "bused", "busing", "bused"),
+    "buses": ("buses", "bus", "bused", "busing", "bused"),
+    "busing": ("busings", "busing", "bused", "busing", "bused"),
+    "bust": ("busts", "bust", "bust", "busting", "bust"),
+    "busting": ("bustings", "busting", "bust", "busting", "bust"),
+    "busts": ("busts", "bust", "bust", "busting", "bust"),
+    "cache": ("caches", "cache", "cached", "caching", "cached"),
+    "cached": ("cacheds", "cached", "cached", "caching", "cached"),
+    "caches": ("caches", "cache", "cached", "caching", "cached"),
+    "caching": ("cachings", "caching", "cached", "caching", "cached"),
+    "caddie": ("caddies", "caddie", "caddied", "caddying", "caddied"),
+    "caddied": ("caddieds", "caddied", "caddied", "caddying", "caddied"),
+    "caddies": ("caddies", "caddie", "caddied", "caddying", "caddied"),
+    "caddying": ("caddyings", "caddying", "caddied", "caddying", "caddied"),
+    "came": ("cames", "came", "came", "coming", "come"),
+    "can": ("can", "can", "could", "canning", "canned"),
+    "canvas": ("canvases", "canvas", "canvased", "canvasing", "canvased"),
+    "canvased": ("canvaseds", "canvased", "canvased", "canvasing", "canvased"),
+    "canvases": ("canvases", "canvas", "canvased", "canvasing", "canvased"),
+    "canvasing": ("canvasings", "canvasing", "canvased", "canvasing", "canvased"),
+    "catch": ("catches", "catch", "caught", "catching", "caught"),
+    "catches": ("catches", "catch", "caught", "catching", "caught"),
+    "catching": ("catchings", "catching", "caught", "catching", "caught"),
+    "caucus": ("caucuses", "caucus", "caucused", "caucusing", "caucused"),
+    "caucused": ("caucuseds", "caucused", "caucused", "caucusing", "caucused"),
+    "caucuses": ("caucuses", "caucus", "caucused", "caucusing", "caucused"),
+    "caucusing": ("caucusings", "caucusing", "caucused", "caucusing", "caucused"),
+    "caught": ("caughts", "caught", "caught", "catching", "caught"),
+    "change": ("changes", "change", "changed", "changing", "changed"),
+    "changed": ("changeds", "changed", "changed", "changing", "changed"),
+    "changes": ("changes", "change", "changed", "changing", "changed"),
+    "changing": ("changings", "changing", "changed", "changing", "changed"),
+    "choose": ("chooses", "choose", "chose", "choosing", "chosen"),
+    "chooses": ("chooses", "choose", "chose", "choosing", "chosen"),
+    "choosing": ("choosings", "choosing", "chose", "choosing", "chosen"),
+    "chorus": ("choruses", "chorus", "chorused", "chorusing", "chorused"),
+    "chorused": ("choruseds", "chorused", "chorused", "chorusing", "chorused"),
+    "choruses": ("choruses", "chorus", "chorused", "chorusing", "chorused"),
+    "chorusing": ("chorusings", "chorusing", "chorused", "chorusing", "chorused"),
+    "chose": ("choses", "chose", "chose", "choosing", "chosen"),
+    "chosen": ("chosens", "chosen", "chose", "choosing", "chosen"),
+    "clap": ("claps", "clap", "clapped", "clapping", "clapped"),
+    "clapped": ("clappeds", "clapped", "clapped", "clapping", "clapped"),
+    "clapping": ("clappings", "clapping", "clapped", "clapping", "clapped"),
+    "claps": ("claps", "clap", "clapped", "clapping", "clapped"),
+    "cling": ("clings", "cling", "clung", "clinging", "clung"),
+    "clinging": ("clingings", "clinging", "clung", "clinging", "clung"),
+    "clings": ("clings", "cling", "clung", "clinging", "clung"),
+    "clung": ("clungs", "clung", "clung", "clinging", "clung"),
+    "come": ("comes", "come", "came", "coming", "come"),
+    "comes": ("comes", "come", "came", "coming", "come"),
+    "coming": ("comings", "coming", "came", "coming", "come"),
+    "continue": ("continues", "continue", "continued", "continuing", "continued"),
+    "continued": ("continueds", "continued", "continued", "continuing", "continued"),
+    "continues": ("continues", "continue", "continued", "continuing", "continued"),
+    "continuing": ("continuings", "continuing", "continued", "continuing", "continued"),
+    "cost": ("costs", "cost", "cost", "costing", "cost"),
+    "costing": ("costings", "costing", "cost", "costing", "cost"),
+    "costs": ("costs", "cost", "cost", "costing", "cost"),
+    "could": ("could", "could", "could", "coulding", "coulded"),
+    "creche": ("creches", "creche", "creched", "creching", "creched"),
+    "creched": ("crecheds", "creched", "creched", "creching", "creched"),
+    "creches": ("creches", "creche", "creched", "creching", "creched"),
+    "creching": ("crechings", "creching", "creched", "creching", "creched"),
+    "creep": ("creeps", "creep", "crept", "creeping", "crept"),
+    "creeping": ("creepings", "creeping", "crept", "creeping", "crept"),
+    "creeps": ("creeps", "creep", "crept", "creeping", "crept"),
+    "crept": ("crepts", "crept", "crept", "creeping", "crept"),
+    "dare": ("dares", "dare", "dared", "daring", "dared"),
+    "dared": ("dareds", "dared", "dared", "daring", "dared"),
+    "dares": ("dares", "dare", "dared", "daring", "dared"),
+    "daring": ("darings", "daring", "dared", "daring", "dared"),
+    "deal": ("deals", "deal", "dealt", "dealing", "dealt"),
+    "dealing": ("dealings", "dealing", "dealt", "dealing", "dealt"),
+    "deals": ("deals", "deal", "dealt", "dealing", "dealt"),
+    "dealt": ("dealts", "dealt", "dealt", "dealing", "dealt"),
+    "did": ("dids", "did", "did", "doing", "done"),
+    "die": ("dies", "die", "died", "dying", "died"),
+    "died": ("dieds", "died", "died", "dying", "died"),
+    "dies": ("dies", "die", "died", "dying", "died"),
+    "dig": ("digs", "dig", "dug", "digging", "dug"),
+    "digging": ("diggings", "digging", "dug", "digging", "dug"),
+    "digs": ("digs", "dig", "dug", "digging", "dug"),
+    "dis": ("disses", "dis", "dissed", "dissing", "dissed"),
+    "dissed": ("disseds", "dissed", "dissed", "dissing", "dissed"),
+    "disses": ("disses", "dis", "dissed", "dissing", "dissed"),
+    "dissing": ("dissings", "dissing", "dissed", "dissing", "dissed"),
+    "dive": ("dives", "dive", "dived", "diving", "dived"),
+    "dived": ("diveds", "dived", "dived", "diving", "dived"),
+    "dives": ("dives", "dive", "dived", "diving", "dived"),
+    "diving": ("divings", "diving", "dived", "diving", "dived"),
+    "do": ("does", "do", "did", "doing", "done"),
+    "does": ("does", "do", "did", "doing", "done"),
+    "doing": ("doings", "doing", "did", "doing", "done"),
+    "done": ("dones", "done", "did", "doing", "done"),
+    "douche": ("douches", "douche", "douched", "douching", "douched"),
+    "douched": ("doucheds", "douched", "douched", "douching", "douched"),
+    "douches": ("douches", "douche", "douched", "douching", "douched"),
+    "douching": ("douchings", "douching", "douched", "douching", "douched"),
+    "drag": ("drags", "drag", "dragged", "dragging", "dragged"),
+    "dragged": ("draggeds", "dragged", "dragged", "dragging", "dragged"),
+    "dragging": ("draggings", "dragging", "dragged", "dragging", "dragged"),
+    "drags": ("drags", "drag", "dragged", "dragging", "dragged"),
+    "drank": ("dranks", "drank", "drank", "drinking", "drunk"),
+    "dream": ("dreams", "dream", "dreamed", "dreaming", "dreamed"),
+    "dreamed": ("dreameds", "dreamed", "dreamed", "dreaming", "dreamed"),
+    "dreaming": ("dreamings", "dreaming", "dreamed", "dreaming", "dreamed"),
+    "dreams": ("dreams", "dream", "dreamed", "dreaming", "dreamed"),
+    "drink": ("drinks", "drink", "drank", "drinking", "drunk"),
+    "drinking": ("drinkings", "drinking", "drank", "drinking", "drunk"),
+    "drinks": ("drinks", "drink", "drank", "drinking", "drunk"),
+    "drive": ("drives", "drive", "drove", "driving", "driven"),
+    "driven": ("drivens", "driven", "drove", "driving", "driven"),
+    "drives": ("drives", "drive", "drove", "driving", "driven"),
+    "driving": ("drivings", "driving", "drove", "driving", "driven"),
+    "drove": ("droves", "drove", "drove", "driving", "driven"),
+    "drunk": ("drunks", "drunk", "drank", "drinking", "drunk"),
+    "dug": ("dugs", "dug", "dug", "digging", "dug"),
+    "dwell": ("dwells", "dwell", "dwelt", "dwelling", "dwelt"),
+    "dwelling": ("dwellings", "dwelling", "dwelt", "dwelling", "dwelt"),
+    "dwells": ("dwells", "dwell", "dwelt", "dwelling", "dwelt"),
+    "dwelt": ("dwelts", "dwelt", "dwelt", "dwelling", "dwelt"),
+    "dying": ("dyings", "dying", "died", "dying", "died"),
+    "eat": ("eats", "eat", "ate", "eating", "eaten"),
+    "eaten": ("eatens", "eaten", "ate", "eating", "eaten"),
+    "eating": ("eatings", "eating", "ate", "eating", "eaten"),
+    "eats": ("eats", "eat", "ate", "eating", "eaten"),
+    "expect": ("expects", "expect", "expected", "expecting", "expected"),
+    "expected": ("expecteds", "expected", "expected", "expecting", "expected"),
+    "expecting": ("expectings", "expecting", "expected", "expecting", "expected"),
+    "expects": ("expects", "expect", "expected", "expecting", "expected"),
+    "fall": ("falls", "fall", "fell", "falling", "fallen"),
+    "fallen": ("fallens", "fallen", "fell", "falling", "fallen"),
+    "falling": ("fallings", "falling", "fell", "falling", "fallen"),
+    "falls": ("falls", "fall", "fell", "falling", "fallen"),
+    "feel": ("feels", "feel", "felt", "feeling", "felt"),
+    "feeling": ("feelings", "feeling", "felt", "feeling", "felt"),
+    "feels": ("feels", "feel", "felt", "feeling", "felt"),
+    "fell": ("fells", "fell", "fell", "falling", "fallen"),
+    "felt": ("felts", "felt", "felt", "feeling", "felt"),
+    "fight": ("fights", "fight", "fought", "fighting", "fought"),
+    "fighting": ("fightings", "fighting", "fought", "fighting", "fought"),
+    "fights": ("fights", "fight", "fought", "fighting", "fought"),
+    "find": ("finds", "find", "found", "finding", "found"),
+    "finding": ("findings", "finding", "found", "finding", "found"),
+    "finds": ("finds", "find", "found", "finding", "found"),
+    "fled": ("fleds", "fled", "fled", "fleeing", "fled"),
+    "flee": ("flees", "flee", "fled", "fleeing", "fled"),
+    "fleeing": ("fleeings", "fleeing", "fled", "fleeing", "fled"),
+    "flees": ("flees", "flee", "fled", "fleeing", "fled"),
+    "flew": ("flews", "flew", "flew", "flying", "flown"),
+    "flies": ("flies", "fly", "flew", "flying", "flown"),
+    "fling": ("flings", "fling", "flung", "flinging", "flung"),
+    "flinging": ("flingings", "flinging", "flung", "flinging", "flung"),
+    "flings": ("flings", "fling", "flung", "flinging", "flung"),
+    "flown": ("flowns", "flown", "flew", "flying", "flown"),
+    "flung": ("flungs", "flung", "flung", "flinging", "flung"),
+    "fly": ("flies", "fly", "flew", "flying", "flown"),
+    "flying": ("flyings", "flying", "flew", "flying", "flown"),
+    "focus": ("focuses", "focus", "focused", "focusing", "focused"),
+    "focused": ("focuseds", "focused", "focused", "focusing", "focused"),
+    "focuses": ("focuses", "focus", "focused", "focusing", "focused"),
+    "focusing": ("focusings", "focusing", "focused", "focusing", "focused"),
+    "follow": ("follows", "follow", "followed", "following", "followed"),
+    "followed": ("followeds", "followed", "followed", "following", "followed"),
+    "following": ("followings", "following", "followed", "following", "followed"),
+    "follows": ("follows", "follow", "followed", "following", "followed"),
+    "forbade": ("forbades", "forbade", "forbaded", "forbidding", "forbidden"),
+    "forbid": ("forbids", "forbid", "forbade", "forbidding", "forbidden"),
+    "forbidden": ("forbiddens", "forbidden", "forbade", "forbidding", "forbidden"),
+    "forbidding": ("forbiddings", "forbidding", "forbade", "forbidding", "forbidden"),
+    "forbids": ("forbids", "forbid", "forbade", "forbidding", "forbidden"),
+    "foresaw": ("foresaws", "foresaw", "foresawed", "foreseeing", "foreseen"),
+    "foresee": ("foresees", "foresee", "foresaw", "foreseeing", "foreseen"),
+    "foreseeing": ("foreseeings", "foreseeing", "foresaw", "foreseeing", "foreseen"),
+    "foreseen": ("foreseens", "foreseen", "foresaw", "foreseeing", "foreseen"),
+    "foresees": ("foresees", "foresee", "foresaw", "foreseeing", "foreseen"),
+    "foretell": ("foretells", "foretell", "foretold", "foretelling", "foretold"),
+    "foretelling": ("foretellings", "foretelling", "foretold", "foretelling", "foretold"),
+    "foretells": ("foretells", "foretell", "foretold", "foretelling", "foretold"),
+    "foretold": ("foretolds", "foretold", "foretold", "foretelling", "foretold"),
+    "forgave": ("forgaves", "forgave", "forgave", "forgiving", "forgiven"),
+    "forget": ("forgets", "forget", "forgot", "forgetting", "forgotten"),
+    "forgets": ("forgets", "forget", "forgot", "forgetting", "forgotten"),
+    "forgetting": ("forgettings", "forgetting", "forgot", "forgetting", "forgotten"),
+    "forgive": ("forgives", "forgive", "forgave", "forgiving", "forgiven"),
+    "forgiven": ("forgivens", "forgiven", "forgave", "forgiving", "forgiven"),
+    "forgives": ("forgives", "forgive", "forgave", "forgiving", "forgiven"),
+    "forgiving": ("forgivings", "forgiving", "forgave", "forgiving", "forgiven"),
+    "forgot": ("forgots", "forgot", "forgot", "forgetting", "forgotten"),
+    "forgotten": ("forgottens", "forgotten", "forgot", "forgetting", "forgotten"),
+    "forsake": ("forsakes", "forsake", "forsook", "forsaking", "forsaken"),
+    "forsaken": ("forsakens", "forsaken", "forsook", "forsaking", "forsaken"),
+    "forsakes": ("forsakes", "forsake", "forsook", "forsaking", "forsaken"),
+    "forsaking": ("forsakings", "forsaking", "forsook", "forsaking", "forsaken"),
+    "forsook": ("forsooks", "forsook", "forsook", "forsaking", "forsaken"),
+    "fought": ("foughts", "fought", "fought", "fighting", "fought"),
+    "found": ("founds", "found", "found", "finding", "found"),
+    "gas": ("gases", "gas", "gassed", "gassing", "gassed"),
+    "gases": ("gases", "gas", "gassed", "gassing", "gassed"),
+    "gassed": ("gasseds", "gassed", "gassed", "gassing", "gassed"),
+    "gassing": ("gassings", "gassing", "gassed", "gassing", "gassed"),
+    "gave": ("gaves", "gave", "gave", "giving", "given"),
+    "get": ("gets", "get", "got", "getting", "gotten"),
+    "gets": ("gets", "get", "got", "getting", "gotten"),
+    "getting": ("gettings", "getting", "got", "getting", "gotten"),
+    "gild": ("gilds", "gild", "gilded", "gilding", "gilded"),
+    "gilded": ("gildeds", "gilded", "gilded", "gilding", "gilded"),
+    "gilding": ("gildings", "gilding", "gilded", "gilding", "gilded"),
+    "gilds": ("gilds", "gild", "gilded", "gilding", "gilded"),
+    "give": ("gives", "give", "gave", "giving", "given"),
+    "given": ("givens", "given", "gave", "giving", "given"),
+    "gives": ("gives", "give", "gave", "giving", "given"),
+    "giving": ("givings", "giving", "gave", "giving", "given"),
+    "go": ("goes", "go", "went", "going", "gone"),
+    "goes": ("goes", "go", "went", "going", "gone"),
+    "going": ("goings", "going", "went", "going", "gone"),
+    "gone": ("gones", "gone", "went", "going", "gone"),
+    "got": ("gots", "got", "got", "getting", "gotten"),
+    "gotten": ("gottens", "gotten", "got", "getting", "gotten"),
+    "grind": ("grinds", "grind", "ground", "grinding", "ground"),
+    "grinding": ("grindings", "grinding", "ground", "grinding", "ground"),
+    "grinds": ("grinds", "grind", "ground", "grinding", "ground"),
+    "ground": ("grounds", "ground", "ground", "grinding", "ground"),
+    "had": ("hads", "had", "had", "having", "had"),
+    "happen": ("happens", "happen", "happened", "happening", "happened"),
+    "happened": ("happeneds", "happened", "happened", "happening", "happened"),
+    "happening": ("happenings", "happening", "happened", "happening", "happened"),
+    "happens": ("happens", "happen", "happened", "happening", "happened"),
+    "has": ("has", "have", "had", "having", "had"),
+    "have": ("has", "have", "had", "having", "had"),
+    "having": ("havings", "having", "had", "having", "had"),
+    "held": ("helds", "held", "held", "holding", "held"),
+    "help": ("helps", "help", "helped", "helping", "helped"),
+    "helped": ("helpeds", "helped", "helped", "helping", "helped"),
+    "helping": ("helpings", "helping", "helped", "helping", "helped"),
+    "helps": ("helps", "help", "helped", "helping", "helped"),
+    "hew": ("hews", "hew", "hewed", "hewing", "hewn"),
+    "hewed": ("heweds", "hewed", "hewed", "hewing", "hewn"),
+    "hewing": ("hewings", "hewing", "hewed", "hewing", "hewn"),
+    "hewn": ("hewns", "hewn", "hewed", "hewing", "hewn"),
+    "hews": ("hews", "hew", "hewed", "hewing", "hewn"),
+    "hie": ("hies", "hie", "hied", "hying", "hied"),
+    "hied": ("hieds", "hied", "hied", "hying", "hied"),
+    "hies": ("hies", "hie", "hied", "hying", "hied"),
+    "hit": ("hits", "hit", "hit", "hitting", "hit"),
+    "hits": ("hits", "hit", "hit", "hitting", "hit"),
+    "hitting": ("hittings", "hitting", "hit", "hitting", "hit"),
+    "hocus": ("hocuses", "hocus", "hocused", "hocusing", "hocused"),
+    "hocused": ("hocuseds", "hocused", "hocused", "hocusing", "hocused"),
+    "hocuses": ("hocuses", "hocus", "hocused", "hocusing", "hocused"),
+    "hocusing": ("hocusings", "hocusing", "hocused", "hocusing", "hocused"),
+    "hold": ("holds", "hold", "held", "holding", "held"),
+    "holding": ("holdings", "holding", "held", "holding", "held"),
+    "holds": ("holds", "hold", "held", "holding", "held"),
+    "hurt": ("hurts", "hurt", "hurt", "hurting", "hurt"),
+    "hurting": ("hurtings", "hurting", "hurt", "hurting", "hurt"),
+    "hurts": ("hurts", "hurt", "hurt", "hurting", "hurt"),
+    "hying": ("hyings", "hying", "hied", "hying", "hied"),
+    "inlaid": ("inlaids", "inlaid", "inlaid", "inlaying", "inlaid"),
+    "inlay": ("inlays", "inlay", "inlaid", "inlaying", "inlaid"),
+    "inlaying": ("inlayings", "inlaying", "inlaid", "inlaying", "inlaid"),
+    "inlays": ("inlays", "inlay", "inlaid", "inlaying", "inlaid"),
+    "insist": ("insists", "insist", "insisted", "insisting", "insisted"),
+    "insisted": ("insisteds", "insisted", "insisted", "insisting", "insisted"),
+    "insisting": ("insistings", "insisting", "insisted", "insisting", "insisted"),
+    "insists": ("insists", "insist", "insisted", "insisting", "insisted"),
+    "interlaid": ("interlaids", "interlaid", "interlaid", "interlaying", "interlaid"),
+    "interlay": ("interlays", "interlay", "interlaid", "interlaying", "interlaid"),
+    "interlaying": ("interlayings", "interlaying", "interlaid", "interlaying", "interlaid"),
+    "interlays": ("interlays", "interlay", "interlaid", "interlaying", "interlaid"),
+    "iris": ("irises", "iris", "irised", "irising", "irised"),
+    "irised": ("iriseds", "irised", "irised", "irising", "irised"),
+    "irises": ("irises", "iris", "irised", "irising", "irised"),
+    "irising": ("irisings", "irising", "irised", "irising", "irised"),
+    "is": ("is", "are", "was", "being", "been"),
+    "keep": ("keeps", "keep", "kept", "keeping", "kept"),
+    "keeping": ("keepings", "keeping", "kept", "keeping", "kept"),
+    "keeps": ("keeps", "keep", "kept", "keeping", "kept"),
+    "kept": ("kepts", "kept", "kept", "keeping", "kept"),
+    "kill": ("kills", "kill", "killed", "killing", "killed"),
+    "killed": ("killeds", "killed", "killed", "killing", "killed"),
+    "killing": ("killings", "killing", "killed", "killing", "killed"),
+    "kills": ("kills", "kill", "killed", "killing", "killed"),
+    "kneel": ("kneels", "kneel", "knelt", "kneeling", "knelt"),
+    "kneeling": ("kneelings", "kneeling", "knelt", "kneeling", "knelt"),
+    "kneels": ("kneels", "kneel", "knelt", "kneeling", "knelt"),
+    "knelt": ("knelts", "knelt", "knelt", "kneeling", "knelt"),
+    "knew": ("knews", "knew", "knew", "knowing", "known"),
+    "knit": ("knits", "knit", "knitted", "knitting", "knitted"),
+    "knits": ("knits", "knit", "knitted", "knitting", "knitted"),
+    "knitted": ("knitteds", "knitted", "knitted", "knitting", "knitted"),
+    "knitting": ("knittings", "knitting", "knitted", "knitting", "knitted"),
+    "know": ("knows", "know", "knew", "knowing", "known"),
+    "knowing": ("knowings", "knowing", "knew", "knowing", "known"),
+    "known": ("knowns", "known", "knew", "knowing", "known"),
+    "knows": ("knows", "know", "knew", "knowing", "known"),
+    "laid": ("laids", "laid", "laid", "laying", "laid"),
+    "lain": ("lains", "lain", "lay", "lying", "lain"),
+    "lay": ("lays", "lay", "laid", "laying", "laid"),
+    "laying": ("layings", "laying", "laid", "laying", "laid"),
+    "lays": ("lays", "lay", "laid", "laying", "laid"),
+    "lead": ("leads", "lead", "led", "leading", "led"),
+    "leading": ("leadings", "leading", "led", "leading", "led"),
+    "leads": ("leads", "lead", "led", "leading", "led"),
+    "lean": ("leans", "lean", "leaned", "leaning", "leaned"),
+    "leaned": ("leaneds", "leaned", "leaned", "leaning", "leaned"),
+    "leaning": ("leanings", "leaning", "leaned", "leaning", "leaned"),
+    "leans": ("leans", "lean", "leaned", "leaning", "leaned"),
+    "leap": ("leaps", "leap", "leapt", "leaping", "leapt"),
+    "leaping": ("leapings", "leaping", "leapt", "leaping", "leapt"),
+    "leaps": ("leaps", "leap", "leapt", "leaping", "leapt"),
+    "leapt": ("leapts", "leapt", "leapt", "leaping", "leapt"),
+    "learn": ("learns", "learn", "learned", "learning", "learned"),
+    "learned": ("learneds", "learned", "learned", "learning", "learned"),
+    "learning": ("learnings", "learning", "learned", "learning", "learned"),
+    "learns": ("learns", "learn", "learned", "learning", "learned"),
+    "leave": ("leaves", "leave", "left", "leaving", "left"),
+    "leaves": ("leaves", "leave", "left", "leaving", "left"),
+    "leaving": ("leavings", "leaving", "left", "leaving", "left"),
+    "led": ("leds", "led", "led", "leading", "led"),
+    "left": ("lefts", "left", "left", "leaving", "left"),
+    "let": ("lets", "let", "let", "letting", "let"),
+    "lets": ("lets", "let", "let", "letting", "let"),
+    "letting": ("lettings", "letting", "let", "letting", "let"),
+    "lie": ("lies", "lie", "lay", "lying", "lain"),
+    "lies": ("lies", "lie", "lay", "lying", "lain"),
+    "like": ("likes", "like", "liked", "liking", "liked"),
+    "liked": ("likeds", "liked", "liked", "liking", "liked"),
+    "likes": ("likes", "like", "liked", "liking", "liked"),
+    "liking": ("likings", "liking", "liked", "liking", "liked"),
+    "live": ("lives", "live", "lived", "living", "lived"),
+    "lived": ("liveds", "lived", "lived", "living", "lived"),
+    "lives": ("lives", "live", "lived", "living", "lived"),
+    "living": ("livings", "living", "lived", "living", "lived"),
+    "look": ("looks", "look", "looked", "looking", "looked"),
+    "looked": ("lookeds", "looked", "looked", "looking", "looked"),
+    "looking": ("lookings", "looking", "looked", "looking", "looked"),
+    "looks": ("looks", "look", "looked", "looking", "looked"),
+    "lose": ("loses", "lose", "lost", "losing", "lost"),
+    "loses": ("loses", "lose", "lost", "losing", "lost"),
+    "losing": ("losings", "losing", "lost", "losing", "lost"),
+    "lost": ("losts", "lost", "lost", "losing", "lost"),
+    "love": ("loves", "love", "loved", "loving", "loved"),
+    "loved": ("loveds", "loved", "loved", "loving", "loved"),
+    "loves": ("loves", "love", "loved", "loving", "loved"),
+    "loving": ("lovings", "loving", "loved", "loving", "loved"),
+    "lying": ("lyings", "lying", "lay", "lying", "lain"),
+    "may": ("may", "may", "might", "maying", "mayed"),
+    "mean": ("means", "mean", "meant", "meaning", "meant"),
+    "meaning": ("meanings", "meaning", "meant", "meaning", "meant"),
+    "means": ("means", "mean", "meant", "meaning", "meant"),
+    "meant": ("meants", "meant", "meant", "meaning", "meant"),
+    "meet": ("meets", "meet", "met", "meeting", "met"),
+    "meeting": ("meetings", "meeting", "met", "meeting", "met"),
+    "meets": ("meets", "meet", "met", "meeting", "met"),
+    "menu": ("menus", "menu", "menued", "menuing", "menued"),
+    "menued": ("menueds", "menued", "menued", "menuing", "menued"),
+    "menuing": ("menuings", "menuing", "menued", "menuing", "menued"),
+    "menus": ("menus", "menu", "menued", "menuing", "menued"),
+    "met": ("mets", "met", "met", "meeting", "met"),
+    "might": ("might", "might", "might", "mighting", "mighted"),
+    "mislead": ("misleads", "mislead", "misled", "misleading", "misled"),
+    "misleading": ("misleadings", "misleading", "misled", "misleading", "misled"),
+    "misleads": ("misleads", "mislead", "misled", "misleading", "misled"),
+    "misled": ("misleds", "misled", "misled", "misleading", "misled"),
+    "mistake": ("mistakes", "mistake", "mistook", "mistaking", "mistaken"),
+    "mistaken": ("mistakens", "mistaken", "mistook", "mistaking", "mistaken"),
+    "mistakes": ("mistakes", "mistake", "mistook", "mistaking", "mistaken"),
+    "mistaking": ("mistakings", "mistaking", "mistook", "mistaking", "mistaken"),
+    "mistook": ("mistooks", "mistook", "mistook", "mistaking", "mistaken"),
+    "misunderstand": ("misunderstands", "misunderstand", "misunderstood", "misunderstanding", "misunderstood"),
+    "misunderstanding": ("misunderstandings", "misunderstanding", "misunderstood", "misunderstanding", "misunderstood"),
+    "misunderstands": ("misunderstands", "misunderstand", "misunderstood", "misunderstanding", "misunderstood"),
+    "misunderstood": ("misunderstoods", "misunderstood", "misunderstood", "misunderstanding", "misunderstood"),
+    "move": ("moves", "move", "moved", "moving", "moved"),
+    "moved": ("moveds", "moved", "moved", "moving", "moved"),
+    "moves": ("moves", "move", "moved", "moving", "moved"),
+    "moving": ("movings", "moving", "moved", "moving", "moved"),
+    "must": ("must", "must", "musted", "musting", "musted"),
+    "need": ("needs", "need", "needed", "needing", "needed"),
+    "needed": ("neededs", "needed", "needed", "needing", "needed"),
+    "needing": ("needings", "needing", "needed", "needing", "needed"),
+    "needs": ("needs", "need", "needed", "needing", "needed"),
+    "niche": ("niches", "niche", "niched", "nicheing", "niched"),
+    "niched": ("nicheds", "niched", "niched", "nicheing", "niched"),
+    "nicheing": ("nicheings", "nicheing", "niched", "nicheing", "niched"),
+    "niches": ("niches", "niche", "niched", "nicheing", "niched"),
+    "ought": ("ought", "ought", "oughted", "oughting", "oughted"),
+    "outvie": ("outvies", "outvie", "outvied", "outvying", "outvied"),
+    "outvied": ("outvieds", "outvied", "outvied", "outvying", "outvied"),
+    "outvies": ("outvies", "outvie", "outvied", "outvying", "outvied"),
+    "outvying": ("outvyings", "outvying", "outvied", "outvying", "outvied"),
+    "overdraw": ("overdraws", "overdraw", "overdrew", "overdrawing", "overdrawn"),
+    "overdrawing": ("overdrawings", "overdrawing", "overdrew", "overdrawing", "overdrawn"),
+    "overdrawn": ("overdrawns", "overdrawn", "overdrew", "overdrawing", "overdrawn"),
+    "overdraws": ("overdraws", "overdraw", "overdrew", "overdrawing", "overdrawn"),
+    "overdrew": ("overdrews", "overdrew", "overdrew", "overdrawing", "overdrawn"),
+    "overhear": ("overhears", "overhear", "overheard", "overhearing", "overheard"),
+    "overheard": ("overheards", "overheard", "overheard", "overhearing", "overheard"),
+    "overhearing": ("overhearings", "overhearing", "overheard", "overhearing", "overheard"),
+    "overhears": ("overhears", "overhear", "overheard", "overhearing", "overheard"),
+    "overtake": ("overtakes", "overtake", "overtook", "overtaking", "overtaken"),
+    "overtaken": ("overtakens", "overtaken", "overtook", "overtaking", "overtaken"),
+    "overtakes": ("overtakes", "overtake", "overtook", "overtaking", "overtaken"),
+    "overtaking": ("overtakings", "overtaking", "overtook", "overtaking", "overtaken"),
+    "overtook": ("overtooks", "overtook", "overtook", "overtaking", "overtaken"),
+    "preset": ("presets", "preset", "preset", "presetting", "preset"),
+    "presets": ("presets", "preset", "preset", "presetting", "preset"),
+    "presetting": ("presettings", "presetting", "preset", "presetting", "preset"),
+    "prove": ("proves", "prove", "proved", "proving", "proven"),
+    "proved": ("proveds", "proved", "proved", "proving", "proven"),
+    "proven": ("provens", "proven", "proved", "proving", "proven"),
+    "proves": ("proves", "prove", "proved", "proving", "proven"),
+    "provide": ("provides", "provide", "provided", "providing", "provided"),
+    "provided": ("provideds", "provided", "provided", "providing", "provided"),
+    "provides": ("provides", "provide", "provided", "providing", "provided"),
+    "providing": ("providings", "providing", "provided", "providing", "provided"),
+    "proving": ("provings", "proving", "proved", "proving", "proven"),
+    "psyche": ("psyches", "psyche", "psyched", "psyching", "psyched"),
+    "psyched": ("psycheds", "psyched", "psyched", "psyching", "psyched"),
+    "psyches": ("psyches", "psyche", "psyched", "psyching", "psyched"),
+    "psyching": ("psychings", "psyching", "psyched", "psyching", "psyched"),
+    "put": ("puts", "put", "put", "putting", "put"),
+    "puts": ("puts", "put", "put", "putting", "put"),
+    "putting": ("puttings", "putting", "put", "putting", "put"),
+    "quit": ("quits", "quit", "quit", "quitting", "quit"),
+    "quits": ("quits", "quit", "quit", "quitting", "quit"),
+    "quitting": ("quittings", "quitting", "quit", "quitting", "quit"),
+    "quiz": ("quizzes", "quiz", "quizzed", "quizzing", "quizzed"),
+    "quizzed": ("quizzeds", "quizzed", "quizzed", "quizzing", "quizzed"),
+    "quizzes": ("quizzes", "quiz", "quizzed", "quizzing", "quizzed"),
+    "quizzing": ("quizzings", "quizzing", "quizzed", "quizzing", "quizzed"),
+    "rang": ("rangs", "rang", "rang", "ringing", "rung"),
+    "reach": ("reaches", "reach", "reached", "reaching", "reached"),
+    "reached": ("reacheds", "reached", "reached", "reaching", "reached"),
+    "reaches": ("reaches", "reach", "reached", "reaching", "reached"),
+    "reaching": ("reachings", "reaching", "reached", "reaching", "reached"),
+    "remain": ("remains", "remain", "remained", "remaining", "remained"),
+    "remained": ("remaineds", "remained", "remained", "remaining", "remained"),
+    "remaining": ("remainings", "remaining", "remained", "remaining", "remained"),
+    "remains": ("remains", "remain", "remained", "remaining", "remained"),
+    "remember": ("remembers", "remember", "remembered", "remembering", "remembered"),
+    "remembered": ("remembereds", "remembered", "remembered", "remembering", "remembered"),
+    "remembering": ("rememberings", "remembering", "remembered", "remembering", "remembered"),
+    "remembers": ("remembers", "remember", "remembered", "remembering", "remembered"),
+    "rend": ("rends", "rend", "rent", "rending", "rent"),
+    "rending": ("rendings", "rending", "rent", "rending", "rent"),
+    "rends": ("rends", "rend", "rent", "rending", "rent"),
+    "rent": ("rents", "rent", "rent", "rending", "rent"),
+    "rented": ("renteds", "rented", "rented", "renting", "rented"),
+    "renting": ("rentings", "renting", "rented", "renting", "rented"),
+    "rents": ("rents", "rent", "rented", "renting", "rented"),
+    "rid": ("rids", "rid", "rid", "ridding", "rid"),
+    "ridding": ("riddings", "ridding", "rid", "ridding", "rid"),
+    "rids": ("rids", "rid", "rid", "ridding", "rid"),
+    "ring": ("rings", "ring", "rang", "ringing", "rung"),
+    "ringing": ("ringings", "ringing", "rang", "ringing", "rung"),
+    "rings": ("rings", "ring", "rang", "ringing", "rung"),
+    "rise": ("rises", "rise", "rose", "rising", "risen"),
+    "risen": ("risens", "risen", "rose", "rising", "risen"),
+    "rises": ("rises", "rise", "rose", "rising", "risen"),
+    "rising": ("risings", "rising", "rose", "rising", "risen"),
+    "rive": ("rives", "rive", "rived", "riving", "riven"),
+    "rived": ("riveds", "rived", "rived", "riving", "riven"),
+    "riven": ("rivens", "riven", "rived", "riving", "riven"),
+    "rives": ("rives", "rive", "rived", "riving", "riven"),
+    "riving": ("rivings", "riving", "rived", "riving", "riven"),
+    "rose": ("roses", "rose", "rose", "rising", "risen"),
+    "rung": ("rungs", "rung", "rang", "ringing", "rung"),
+    "s": ("s", "", "ed", "ing", "ed"),
+    "sang": ("sangs", "sang", "sang", "singing", "sung"),
+    "sank": ("sanks", "sank", "sank", "sinking", "sunk"),
+    "sat": ("sats", "sat", "sat", "sitting", "sat"),
+    "saw": ("saws", "saw", "sawed", "sawing", "sawn"),
+    "sawed": ("saweds", "sawed", "sawed", "sawing", "sawn"),
+    "sawing": ("sawings", "sawing", "sawed", "sawing", "sawn"),
+    "sawn": ("sawns", "sawn", "sawed", "sawing", "sawn"),
+    "saws": ("saws", "saw", "sawed", "sawing", "sawn"),
+    "seek": ("seeks", "seek", "sought", "seeking", "sought"),
+    "seeking": ("seekings", "seeking", "sought", "seeking", "sought"),
+    "seeks": ("seeks", "seek", "sought", "seeking", "sought"),
+    "seem": ("seems", "seem", "seemed", "seeming", "seemed"),
+    "seemed": ("seemeds", "seemed", "seemed", "seeming", "seemed"),
+    "seeming": ("seemings", "seeming", "seemed", "seeming", "seemed"),
+    "seems": ("seems", "seem", "seemed", "seeming", "seemed"),
+    "shake": ("shakes", "shake", "shook", "shaking", "shaken"),
+    "shaken": ("shakens", "shaken", "shook", "shaking", "shaken"),
+    "shakes": ("shakes", "shake", "shook", "shaking", "shaken"),
+    "shaking": ("shakings", "shaking", "shook", "shaking", "shaken"),
+    "shall": ("shall", "shall", "should", "shalling", "shalled"),
+    "shat": ("shats", "shat", "shat", "shitting", "shitted"),
+    "shave": ("shaves", "shave", "shaved", "shaving", "shaved"),
+    "shaved": ("shaveds", "shaved", "shaved", "shaving", "shaved"),
+    "shaves": ("shaves", "shave", "shaved", "shaving", "shaved"),
+    "shaving": ("shavings", "shaving", "shaved", "shaving", "shaved"),
+    "shed": ("sheds", "shed", "shed", "shedding", "shed"),
+    "shedding": ("sheddings", "shedding", "shed", "shedding", "shed"),
+    "sheds": ("sheds", "shed", "shed", "shedding", "shed"),
+    "shit": ("shits", "shit", "shat", "shitting", "shitted"),
+    "shits": ("shits", "shit", "shat", "shitting", "shitted"),
+    "shitted": ("shitteds", "shitted", "shat", "shitting", "shitted"),
+    "shitting": ("shittings", "shitting", "shat", "shitting", "shitted"),
+    "shod": ("shods", "shod", "shod", "shoeing", "shod"),
+    "shoe": ("shoes", "shoe", "shod", "shoeing", "shod"),
+    "shoeing": ("shoeings", "shoeing", "shod", "shoeing", "shod"),
+    "shoes": ("shoes", "shoe", "shod", "shoeing", "shod"),
+    "shook": ("shooks", "shook", "shook", "shaking", "shaken"),
+    "should": ("should", "should", "should", "shoulding", "shoulded"),
+    "show": ("shows", "show", "showed", "showing", "shown"),
+    "showed": ("showeds", "showed", "showed", "showing", "shown"),
+    "showing": ("showings", "showing", "showed", "showing", "shown"),
+    "shown": ("showns", "shown", "showed", "showing", "shown"),
+    "shows": ("shows", "show", "showed", "showing", "shown"),
+    "shrank": ("shranks", "shrank", "shrank", "shrinking", "shrunk"),
+    "shrink": ("shrinks", "shrink", "shrank", "shrinking", "shrunk"),
+    "shrinking": ("shrinkings", "shrinking", "shrank", "shrinking", "shrunk"),
+    "shrinks": ("shrinks", "shrink", "shrank", "shrinking", "shrunk"),
+    "shrunk": ("shrunks", "shrunk", "shrank", "shrinking", "shrunk"),
+    "sing": ("sings", "sing", "sang", "singing", "sung"),
+    "singing": ("singings", "singing", "sang", "singing", "sung"),
+    "sings": ("sings", "sing", "sang", "singing", "sung"),
+    "sink": ("sinks", "sink", "sank", "sinking", "sunk"),
+    "sinking": ("sinkings", "sinking", "sank", "sinking", "sunk"),
+    "sinks": ("sinks", "sink", "sank", "sinking", "sunk"),
+    "sit": ("sits", "sit", "sat", "sitting", "sat"),
+    "sits": ("sits", "sit", "sat", "sitting", "sat"),
+    "sitting": ("sittings", "sitting", "sat", "sitting", "sat"),
+    "ski": ("skis", "ski", "skied", "skiing", "skied"),
+    "skied": ("skieds", "skied", "skied", "skiing", "skied"),
+    "skiing": ("skiings", "skiing", "skied", "skiing", "skied"),
+    "skis": ("skis", "ski", "skied", "skiing", "skied"),
+    "slain": ("slains", "slain", "slew", "slaying", "slain"),
+    "slay": ("slays", "slay", "slew", "slaying", "slain"),
+    "slaying": ("slayings", "slaying", "slew", "slaying", "slain"),
+    "slays": ("slays", "slay", "slew", "slaying", "slain"),
+    "slew": ("slews", "slew", "slew", "slaying", "slain"),
+    "slid": ("slids", "slid", "slid", "sliding", "slid"),
+    "slide": ("slides", "slide", "slid", "sliding", "slid"),
+    "slides": ("slides", "slide", "slid", "sliding", "slid"),
+    "sliding": ("slidings", "sliding", "slid", "sliding", "slid"),
+    "slink": ("slinks", "slink", "slunk", "slinking", "slunk"),
+    "slinking": ("slinkings", "slinking", "slunk", "slinking", "slunk"),
+    "slinks": ("slinks", "slink", "slunk", "slinking", "slunk"),
+    "slit": ("slits", "slit", "slit", "slitting", "slit"),
+    "slits": ("slits", "slit", "slit", "slitting", "slit"),
+    "slitting": ("slittings", "slitting", "slit", "slitting", "slit"),
+    "slunk": ("slunks", "slunk", "slunk", "slinking", "slunk"),
+    "smell": ("smells", "smell", "smelled", "smelling", "smelled"),
+    "smelled": ("smelleds", "smelled", "smelled", "smelling", "smelled"),
+    "smelling": ("smellings", "smelling", "smelled", "smelling", "smelled"),
+    "smells": ("smells", "smell", "smelled", "smelling", "smelled"),
+    "smite": ("smites", "smite", "smote", "smiting", "smitten"),
+    "smites": ("smites", "smite", "smote", "smiting", "smitten"),
+    "smiting": ("smitings", "smiting", "smote", "smiting", "smitten"),
+    "smitten": ("smittens", "smitten", "smote", "smiting", "smitten"),
+    "smote": ("smotes", "smote", "smote", "smiting", "smitten"),
+    "sneak": ("sneaks", "sneak", "sneaked", "sneaking", "sneaked"),
+    "sneaked": ("sneakeds", "sneaked", "sneaked", "sneaking", "sneaked"),
+    "sneaking": ("sneakings", "sneaking", "sneaked", "sneaking", "sneaked"),
+    "sneaks": ("sneaks", "sneak", "sneaked", "sneaking", "sneaked"),
+    "sought": ("soughts", "sought", "sought", "seeking", "sought"),
+    "sow": ("sows", "sow", "sowed", "sowing", "sown"),
+    "sowed": ("soweds", "sowed", "sowed", "sowing", "sown"),
+    "sowing": ("sowings", "sowing", "sowed", "sowing", "sown"),
+    "sown": ("sowns", "sown", "sowed", "sowing", "sown"),
+    "sows": ("sows", "sow", "sowed", "sowing", "sown"),
+    "spat": ("spats", "spat", "spat", "spitting", "spat"),
+    "speak": ("speaks", "speak", "spoke", "speaking", "spoken"),
+    "speaking": ("speakings", "speaking", "spoke", "speaking", "spoken"),
+    "speaks": ("speaks", "speak", "spoke", "speaking", "spoken"),
+    "sped": ("speds", "sped", "sped", "speeding", "sped"),
+    "speed": ("speeds", "speed", "sped", "speeding", "sped"),
+    "speeding": ("speedings", "speeding", "sped", "speeding", "sped"),
+    "speeds": ("speeds", "speed", "sped", "speeding", "sped"),
+    "spend": ("spends", "spend", "spent", "spending", "spent"),
+    "spending": ("spendings", "spending", "spent", "spending", "spent"),
+    "spends": ("spends", "spend", "spent", "spending", "spent"),
+    "spent": ("spents", "spent", "spent", "spending", "spent"),
+    "spit": ("spits", "spit", "spat", "spitting", "spat"),
+    "spits": ("spits", "spit", "spat", "spitting", "spat"),
+    "spitting": ("spittings", "spitting", "spat", "spitting", "spat"),
+    "spoil": ("spoils", "spoil", "spoilt", "spoiling", "spoiled"),
+    "spoiled": ("spoileds", "spoiled", "spoilt", "spoiling", "spoiled"),
+    "spoiling": ("spoilings", "spoiling", "spoilt", "spoiling", "spoiled"),
+    "spoils": ("spoils", "spoil", "spoilt", "spoiling", "spoiled"),
+    "spoilt": ("spoilts", "spoilt", "spoilt", "spoiling", "spoiled"),
+    "spoke": ("spokes", "spoke", "spoke", "speaking", "spoken"),
+    "spoken": ("spokens", "spoken", "spoke", "speaking", "spoken"),
+    "sprang": ("sprangs", "sprang", "sprang", "springing", "sprung"),
+    "spring": ("springs", "spring", "sprang", "springing", "sprung"),
+    "springing": ("springings", "springing", "sprang", "springing", "sprung"),
+    "springs": ("springs", "spring", "sprang", "springing", "sprung"),
+    "sprung": ("sprungs", "sprung", "sprang", "springing", "sprung"),
+    "stand": ("stands", "stand", "stood", "standing", "stood"),
+    "standing": ("standings", "standing", "stood", "standing", "stood"),
+    "stands": ("stands", "stand", "stood", "standing", "stood"),
+    "stank": ("stanks", "stank", "stank", "stinking", "stunk"),
+    "stave": ("staves", "stave", "staved", "staving", "staved"),
+    "staved": ("staveds", "staved", "staved", "staving", "staved"),
+    "staves": ("staves", "stave", "staved", "staving", "staved"),
+    "staving": ("stavings", "staving", "staved", "staving", "staved"),
+    "stay": ("stays", "stay", "stayed", "staying", "stayed"),
+    "stayed": ("stayeds", "stayed", "stayed", "staying", "stayed"),
+    "staying": ("stayings", "staying", "stayed", "staying", "stayed"),
+    "stays": ("stays", "stay", "stayed", "staying", "stayed"),
+    "steal": ("steals", "steal", "stole", "stealing", "stolen"),
+    "stealing": ("stealings", "stealing", "stole", "stealing", "stolen"),
+    "steals": ("steals", "steal", "stole", "stealing", "stolen"),
+    "sting": ("stings", "sting", "stung", "stinging", "stung"),
+    "stinging": ("stingings", "stinging", "stung", "stinging", "stung"),
+    "stings": ("stings", "sting", "stung", "stinging", "stung"),
+    "stink": ("stinks", "stink", "stank", "stinking", "stunk"),
+    "stinking": ("stinkings", "stinking", "stank", "stinking", "stunk"),
+    "stinks": ("stinks", "stink", "stank", "stinking", "stunk"),
+    "stole": ("stoles", "stole", "stole", "stealing", "stolen"),
+    "stolen": ("stolens", "stolen", "stole", "stealing", "stolen"),
+    "stood": ("stoods", "stood", "stood", "standing", "stood"),
+    "stop": ("stops", "stop", "stopped", "stopping", "stopped"),
+    "stopped": ("stoppeds", "stopped", "stopped", "stopping", "stopped"),
+    "stopping": ("stoppings", "stopping", "stopped", "stopping", "stopped"),
+    "stops": ("stops", "stop", "stopped", "stopping", "stopped"),
+    "strew": ("strews", "strew", "strewed", "strewing", "strewn"),
+    "strewed": ("streweds", "strewed", "strewed", "strewing", "strewn"),
+    "strewing": ("strewings", "strewing", "strewed", "strewing", "strewn"),
+    "strewn": ("strewns", "strewn", "strewed", "strewing", "strewn"),
+    "strews": ("strews", "strew", "strewed", "strewing", "strewn"),
+    "stride": ("strides", "stride", "strode", "striding", "strode"),
+    "strides": ("strides", "stride", "strode", "striding", "strode"),
+    "striding": ("stridings", "striding", "strode", "striding", "strode"),
+    "strip": ("strips", "strip", "stripped", "stripping", "stripped"),
+    "stripped": ("strippeds", "stripped", "stripped", "stripping", "stripped"),
+    "stripping": ("strippings", "stripping", "stripped", "stripping", "stripped"),
+    "strips": ("strips", "strip", "stripped", "stripping", "stripped"),
+    "strive": ("strives", "strive", "strove", "striving", "strived"),
+    "strived": ("striveds", "strived", "strove", "striving", "strived"),
+    "strives": ("strives", "strive", "strove", "striving", "strived"),
+    "striving": ("strivings", "striving", "strove", "striving", "strived"),
+    "strode": ("strodes", "strode", "strode", "striding", "strode"),
+    "strove": ("stroves", "strove", "strove", "striving", "strived"),
+    "stung": ("stungs", "stung", "stung", "stinging", "stung"),
+    "stunk": ("stunks", "stunk", "stank", "stinking", "stunk"),
+    "sublet": ("sublets", "sublet", "sublet", "subletting", "sublet"),
+    "sublets": ("sublets", "sublet", "sublet", "subletting", "sublet"),
+    "subletting": ("sublettings", "subletting", "sublet", "subletting", "sublet"),
+    "sunburn": ("sunburns", "sunburn", "sunburned", "sunburning", "sunburned"),
+    "sunburned": ("sunburneds", "sunburned", "sunburned", "sunburning", "sunburned"),
+    "sunburning": ("sunburnings", "sunburning", "sunburned", "sunburning", "sunburned"),
+    "sunburns": ("sunburns", "sunburn", "sunburned", "sunburning", "sunburned"),
+    "sung": ("sungs", "sung", "sang", "singing", "sung"),
+    "sunk": ("sunks", "sunk", "sank", "sinking", "sunk"),
+    "swam": ("swams", "swam", "swam", "swimming", "swum"),
+    "swear": ("swears", "swear", "swore", "swearing", "sworn"),
+    "swearing": ("swearings", "swearing", "swore", "swearing", "sworn"),
+    "swears": ("swears", "swear", "swore", "swearing", "sworn"),
+    "sweat": ("sweats", "sweat", "sweat", "sweating", "sweated"),
+    "sweated": ("sweateds", "sweated", "sweat", "sweating", "sweated"),
+    "sweating": ("sweatings", "sweating", "sweat", "sweating", "sweated"),
+    "sweats": ("sweats", "sweat", "sweat", "sweating", "sweated"),
+    "sweep": ("sweeps", "sweep", "swept", "sweeping", "swept"),
+    "sweeping": ("sweepings", "sweeping", "swept", "sweeping", "swept"),
+    "sweeps": ("sweeps", "sweep", "swept", "sweeping", "swept"),
+    "swell": ("swells", "swell", "swelled", "swelling", "swollen"),
+    "swelled": ("swelleds", "swelled", "swelled", "swelling", "swollen"),
+    "swelling": ("swellings", "swelling", "swelled", "swelling", "swollen"),
+    "swells": ("swells", "swell", "swelled", "swelling", "swollen"),
+    "swept": ("swepts", "swept", "swept", "sweeping", "swept"),
+    "swim": ("swims", "swim", "swam", "swimming", "swum"),
+    "swimming": ("swimmings", "swimming", "swam", "swimming", "swum"),
+    "swims": ("swims", "swim", "swam", "swimming", "swum"),
+    "swing": ("swings", "swing", "swung", "swinging", "swung"),
+    "swinging": ("swingings", "swinging", "swung", "swinging", "swung"),
+    "swings": ("swings", "swing", "swung", "swinging", "swung"),
+    "swollen": ("swollens", "swollen", "swelled", "swelling", "swollen"),
+    "swore": ("swores", "swore", "swore", "swearing", "sworn"),
+    "sworn": ("sworns", "sworn", "swore", "swearing", "sworn"),
+    "swum": ("swums", "swum", "swam", "swimming", "swum"),
+    "swung": ("swungs", "swung", "swung", "swinging", "swung"),
+    "talk": ("talks", "talk", "talked", "talking", "talked"),
+    "talked": ("talkeds", "talked", "talked", "talking", "talked"),
+    "talking": ("talkings", "talking", "talked", "talking", "talked"),
+    "talks": ("talks", "talk", "talked", "talking", "talked"),
+    "tear": ("tears", "tear", "tore", "tearing", "torn"),
+    "tearing": ("tearings", "tearing", "tore", "tearing", "torn"),
+    "tears": ("tears", "tear", "tore", "tearing", "torn"),
+    "thrive": ("thrives", "thrive", "thrived", "thriving", "thrived"),
+    "thrived": ("thriveds", "thrived", "thrived", "thriving", "thrived"),
+    "thrives": ("thrives", "thrive", "thrived", "thriving", "thrived"),
+    "thriving": ("thrivings", "thriving", "thrived", "thriving", "thrived"),
+    "thrust": ("thrusts", "thrust", "thrust", "thrusting", "thrust"),
+    "thrusting": ("thrustings", "thrusting", "thrust", "thrusting", "thrust"),
+    "thrusts": ("thrusts", "thrust", "thrust", "thrusting", "thrust"),
+    "tore": ("tores", "tore", "tore", "tearing", "torn"),
+    "torn": ("torns", "torn", "tore", "tearing", "torn"),
+    "tread": ("treads", "tread", "trod", "treading", "trodden"),
+    "treading": ("treadings", "treading", "trod", "treading", "trodden"),
+    "treads": ("treads", "tread", "trod", "treading", "trodden"),
+    "trod": ("trods", "trod", "trod", "treading", "trodden"),
+    "trodden": ("troddens", "trodden", "trod", "treading", "trodden"),
+    "undergo": ("undergoes", "undergo", "underwent", "undergoing", "undergone"),
+    "undergoes": ("undergoes", "undergo", "underwent", "undergoing", "undergone"),
+    "undergoing": ("undergoings", "undergoing", "underwent", "undergoing", "undergone"),
+    "undergone": ("undergones", "undergone", "underwent", "undergoing", "undergone"),
+    "underlain": ("underlains", "underlain", "underlay", "underlying", "underlain"),
+    "underlay": ("underlays", "underlay", "underlaid", "underlying", "underlain"),
+    "underlie": ("underlies", "underlie", "underlay", "underlying", "underlain"),
+    "underlies": ("underlies", "underlie", "underlay", "underlying", "underlain"),
+    "underlying": ("underlyings", "underlying", "underlay", "underlying", "underlain"),
+    "understand": ("understands", "understand", "understood", "understanding", "understood"),
+    "understanding": ("understandings", "understanding", "understood", "understanding", "understood"),
+    "understands": ("understands", "understand", "understood", "understanding", "understood"),
+    "understood": ("understoods", "understood", "understood", "understanding", "understood"),
+    "undertake": ("undertakes", "undertake", "undertook", "undertaking", "undertaken"),
+    "undertaken": ("undertakens", "undertaken", "undertook", "undertaking", "undertaken"),
+    "undertakes": ("undertakes", "undertake", "undertook", "undertaking", "undertaken"),
+    "undertaking": ("undertakings", "undertaking", "undertook", "undertaking", "undertaken"),
+    "undertook": ("undertooks", "undertook", "undertook", "undertaking", "undertaken"),
+    "underwent": ("underwents", "underwent", "underwent", "undergoing", "undergone"),
+    "upset": ("upsets", "upset", "upset", "upsetting", "upset"),
+    "upsets": ("upsets", "upset", "upset", "upsetting", "upset"),
+    "upsetting": ("upsettings", "upsetting", "upset", "upsetting", "upset"),
+    "vex": ("vexes", "vex", "vexed", "vexing", "vexed"),
+    "vexed": ("vexeds", "vexed", "vexed", "vexing", "vexed"),
+    "vexes": ("vexes", "vex", "vexed", "vexing", "vexed"),
+    "vexing": ("vexings", "vexing", "vexed", "vexing", "vexed"),
+    "vie": ("vies", "vie", "vied", "vying", "vied"),
+    "vied": ("vieds", "vied", "vied", "vying", "vied"),
+    "vies": ("vies", "vie", "vied", "vying", "vied"),
+    "vying": ("vyings", "vying", "vied", "vying", "vied"),
+    "wait": ("waits", "wait", "waited", "waiting", "waited"),
+    "waited": ("waiteds", "waited", "waited", "waiting", "waited"),
+    "waiting": ("waitings", "waiting", "waited", "waiting", "waited"),
+    "waits": ("waits", "wait", "waited", "waiting", "waited"),
+    "wake": ("wakes", "wake", "woke", "waking", "woken"),
+    "wakes": ("wakes", "wake", "woke", "waking", "woken"),
+    "waking": ("wakings", "waking", "woke", "waking", "woken"),
+    "walk": ("walks", "walk", "walked", "walking", "walked"),
+    "walked": ("walkeds", "walked", "walked", "walking", "walked"),
+    "walking": ("walkings", "walking", "walked", "walking", "walked"),
+    "walks": ("walks", "walk", "walked", "walking", "walked"),
+    "want": ("wants", "want", "wanted", "wanting", "wanted"),
+    "wanted": ("wanteds", "wanted", "wanted", "wanting", "wanted"),
+    "wanting": ("wantings", "wanting", "wanted", "wanting", "wanted"),
+    "wants": ("wants", "want", "wanted", "wanting", "wanted"),
+    "was": ("was", "were", "was", "being", "been"),
+    "watch": ("watches", "watch", "watched", "watching", "watched"),
+    "watched": ("watcheds", "watched", "watched", "watching", "watched"),
+    "watches": ("watches", "watch", "watched", "watching", "watched"),
+    "watching": ("watchings", "watching", "watched", "watching", "watched"),
+    "wear": ("wears", "wear", "wore", "wearing", "worn"),
+    "wearing": ("wearings", "wearing", "wore", "wearing", "worn"),
+    "wears": ("wears", "wear", "wore", "wearing", "worn"),
+    "weep": ("weeps", "weep", "wept", "weeping", "wept"),
+    "weeping": ("weepings", "weeping", "wept", "weeping", "wept"),
+    "weeps": ("weeps", "weep", "wept", "weeping", "wept"),
+    "wend": ("wends", "wend", "wended", "wending", "wended"),
+    "wended": ("wendeds", "wended", "wended", "wending", "wended"),
+    "wending": ("wendings", "wending", "wended", "wending", "wended"),
+    "wends": ("wends", "wend", "wended", "wending", "wended"),
+    "went": ("wents", "went", "went", "going", "gone"),
+    "wept": ("wepts", "wept", "wept", "weeping", "wept"),
+    "were": ("was", "were", "were", "being", "been"),
+    "will": ("will", "will", "would", "willing", "willed"),
+    "win": ("wins", "win", "won", "winning", "won"),
+    "winning": ("winnings", "winning", "won", "winning", "won"),
+    "wins": ("wins", "win", "won", "winning", "won"),
+    "wis": ("wises", "wis", "wised", "wising", "wised"),
+    "wised": ("wiseds", "wised", "wised", "wising", "wised"),
+    "wises": ("wises", "wis", "wised", "wising", "wised"),
+    "wising": ("wisings", "wising", "wised", "wising", "wised"),
+    "withdraw": ("withdraws", "withdraw", "withdrew", "withdrawing", "withdrawn"),
+    "withdrawing": ("withdrawings", "withdrawing", "withdrew", "withdrawing", "withdrawn"),
+    "withdrawn": ("withdrawns", "withdrawn", "withdrew", "withdrawing", "withdrawn"),
+    "withdraws": ("withdraws", "withdraw", "withdrew", "withdrawing", "withdrawn"),
+    "withdrew": ("withdrews", "withdrew", "withdrew", "withdrawing", "withdrawn"),
+    "withheld": ("withhelds", "withheld", "withheld", "withholding", "withheld"),
+    "withhold": ("withholds", "withhold", "withheld", "withholding", "withheld"),
+    "withholding": ("withholdings", "withholding", "withheld", "withholding", "withheld"),
+    "withholds": ("withholds", "withhold", "withheld", "withholding", "withheld"),
+    "withstand": ("withstands", "withstand", "withstood", "withstanding", "withstood"),
+    "withstanding": ("withstandings", "withstanding", "withstood", "withstanding", "withstood"),
+    "withstands": ("withstands", "withstand", "withstood", "withstanding", "withstood"),
+    "withstood": ("withstoods", "withstood", "withstood", "withstanding", "withstood"),
+    "woke": ("wokes", "woke", "woke", "waking", "woken"),
+    "woken": ("wokens", "woken", "woke", "waking", "woken"),
+    "won": ("wons", "won", "won", "winning", "won"),
+    "wore": ("wores", "wore", "wore", "wearing", "worn"),
+    "worn": ("worns", "worn", "wore", "wearing", "worn"),
+    "would": ("would", "would", "would", "woulding", "woulded"),
+    "wring": ("wrings", "wring", "wrung", "wringing", "wrung"),
+    "wringing": ("wringings", "wringing", "wrung", "wringing", "wrung"),
+    "wrings": ("wrings", "wring", "wrung", "wringing", "wrung"),
+    "wrung": ("wrungs", "wrung", "wrung", "wringing", "wrung"),
+}
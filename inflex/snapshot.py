@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Save the state which a process builds up while inflecting terms, so other processes,
+e.g. freshly started workers, can load it and start out warm::
+
+    from inflex import cache, snapshot
+    cache.enable()
+    ...  # Inflect a representative workload
+    snapshot.save("inflex.snapshot")
+
+    # In each worker
+    from inflex import snapshot
+    snapshot.load("inflex.snapshot")
+
+A snapshot holds the dictionaries of `noun_core` and `verb_core`, including entries added
+with `inflex.load_lexicon`, the precomputed forms of `paradigm_core`, the suffix tries of
+`noun_core` that have been built, the case-sensitive words of `inflex.term`, and the results
+stored in the enabled caches of `inflex.cache`. Compiled regular expressions can't be stored,
+so `load` compiles them like `inflex.preload` does.
+
+A snapshot is only loaded by processes using the same version of inflex, and the same
+generated core modules, i.e. with the same `VERSION` of `noun_core`, `verb_core`,
+`adjective_core` and `paradigm_core`. Snapshots are pickled, so only load snapshots from
+trusted sources.
+"""
+
+__all__ = [
+    "save",
+    "load",
+]
+
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import inflex
+from inflex import adjective_core, cache, lexicon, noun_core, paradigm_core, term, verb_core
+from inflex.suffix_trie import SuffixTrie
+
+# Version of the format of snapshots. Snapshots of another version are ignored.
+SNAPSHOT_FORMAT = 2
+
+# Errors raised by `pickle.load` for corrupt snapshots, e.g. if a referenced class is missing
+_unpickling_errors = (pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError,
+                      IndexError, KeyError, TypeError)
+
+# The dictionaries of the core modules stored in a snapshot
+_literal_tables = {
+    noun_core: ("modern_plural_of", "classical_plural_of", "singular_of"),
+    verb_core: ("plural_of", "singular_of", "past_of", "pres_part_of", "past_part_of"),
+}
+
+
+def _header() -> Dict[str, Any]:
+    """Get the header of snapshots saved by this process. Snapshots with another header are stale.
+
+    Returns:
+        Dict[str, Any]: The format of the snapshot and of the cached `Term` outputs, and the
+            versions of inflex and of the core modules.
+    """
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "term_cache_format": term.CACHE_FORMAT,
+        "inflex": inflex.__version__,
+        "versions": {module.__name__: module.VERSION for module in (noun_core, verb_core, adjective_core, paradigm_core)},
+    }
+
+
+def _encode_key(lru_cache: cache.LRUCache, key: Hashable) -> Optional[Hashable]:
+    """Convert the key of a cached result into a key that can be pickled.
+
+    The keys of "term.canonical_forms" and "term.patterns" hold the undecorated `Term` methods,
+    which can't be pickled by reference, so these are replaced by the name of the method.
+
+    Args:
+        lru_cache (cache.LRUCache): The cache holding `key`.
+        key (Hashable): Key of the arguments of a cached result.
+
+    Returns:
+        Optional[Hashable]: The key that can be pickled, or None if the result can't be stored.
+    """
+    if lru_cache not in (term.canonical_forms, term.patterns):
+        return key
+    cls, method, word, args, kwargs = key
+    if getattr(getattr(cls, method.__name__, None), "__wrapped__", None) is not method:
+        return None
+    return cls, method.__name__, word, args, kwargs
+
+
+def _decode_key(lru_cache: cache.LRUCache, key: Hashable) -> Hashable:
+    """Convert a key as returned by `_encode_key` back into the key of a cached result.
+
+    Args:
+        lru_cache (cache.LRUCache): The cache in which the result will be stored.
+        key (Hashable): Key as returned by `_encode_key`.
+
+    Returns:
+        Hashable: Key of the arguments of the cached result.
+    """
+    if lru_cache not in (term.canonical_forms, term.patterns):
+        return key
+    cls, name, word, args, kwargs = key
+    return cls, getattr(cls, name).__wrapped__, word, args, kwargs
+
+
+def save(path: str) -> None:
+    """Save the state of this process, including the results of all enabled caches, to `path`.
+    The file is replaced atomically, so concurrent processes never load a partial snapshot.
+
+    Examples:
+        >>> from inflex import snapshot
+        >>> snapshot.save("inflex.snapshot")
+
+    Args:
+        path (str): Path of the snapshot.
+    """
+    tries = {}
+    for name, value in vars(noun_core).items():
+        if isinstance(value, SuffixTrie) and value._root is not None:  # pylint: disable=W0212
+            tries[name] = (value._root, value._regex_rules, value._suffix_rules)  # pylint: disable=W0212
+
+    caches: Dict[str, Tuple[int, List[Tuple[Hashable, Any]]]] = {}
+    for name, lru_cache in cache.caches.items():
+        if lru_cache.enabled:
+            items = ((_encode_key(lru_cache, key), result) for key, result in lru_cache.items())
+            caches[name] = (lru_cache.maxsize, [(key, result) for key, result in items if key is not None])
+
+    state = {
+        "literals": {module.__name__: {name: getattr(module, name) for name in names}
+                     for module, names in _literal_tables.items()},
+        "paradigms": (paradigm_core.noun_paradigms, paradigm_core.verb_paradigms),
+        "tries": tries,
+        "case_sensitive": term._case_sensitive,  # pylint: disable=W0212
+        "caches": caches,
+    }
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # The header is pickled separately, so stale snapshots are rejected without reading the state
+            pickle.dump(_header(), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _decode(state: Any) -> Optional[Dict[str, Any]]:
+    """Check that `state` holds every part of a snapshot saved with `save` by this version,
+    and decode the keys of the cached results, without changing anything.
+
+    Args:
+        state (Any): The unpickled state of a snapshot.
+
+    Returns:
+        Optional[Dict[str, Any]]: The state, with the cached results as a list of pairs of
+            the cache and its maximum size and decoded items, or None if `state` is invalid.
+    """
+    if not isinstance(state, dict) or set(state) != {"literals", "paradigms", "tries", "case_sensitive", "caches"}:
+        return None
+
+    literals = state["literals"]
+    if not isinstance(literals, dict) or set(literals) != {module.__name__ for module in _literal_tables}:
+        return None
+    for module, names in _literal_tables.items():
+        tables = literals[module.__name__]
+        if not isinstance(tables, dict) or set(tables) != set(names) or \
+                not all(isinstance(table, dict) for table in tables.values()):
+            return None
+
+    paradigms = state["paradigms"]
+    if not isinstance(paradigms, tuple) or len(paradigms) != 2 or \
+            not all(isinstance(table, dict) for table in paradigms):
+        return None
+
+    tries = state["tries"]
+    if not isinstance(tries, dict) or not all(
+            isinstance(getattr(noun_core, name, None), SuffixTrie) and isinstance(value, tuple) and len(value) == 3
+            for name, value in tries.items()):
+        return None
+
+    if not isinstance(state["case_sensitive"], (frozenset, type(None))):
+        return None
+
+    caches = state["caches"]
+    if not isinstance(caches, dict):
+        return None
+    # Import the core modules, which register their caches
+    registered = cache._select(())  # pylint: disable=W0212
+    decoded = []
+    for name, value in caches.items():
+        if name not in registered or not isinstance(value, tuple) or len(value) != 2:
+            return None
+        maxsize, items = value
+        if not isinstance(maxsize, int) or maxsize < 0 or not isinstance(items, list):
+            return None
+        lru_cache = registered[name]
+        try:
+            decoded.append((lru_cache, maxsize, [(_decode_key(lru_cache, key), result) for key, result in items]))
+        except (AttributeError, TypeError, ValueError):
+            return None
+    return {**state, "caches": decoded}
+
+
+def load(path: str, compile_patterns: bool = True) -> bool:
+    """Load the state saved with `save` into this process. Caches that were enabled when
+    saving are enabled, with the same maximum size, and hold the saved results.
+
+    Examples:
+        >>> from inflex import snapshot
+        >>> snapshot.load("inflex.snapshot")
+        True
+
+    Args:
+        path (str): Path of the snapshot.
+        compile_patterns (bool, optional): Whether to also compile all regular expressions,
+            like `inflex.preload`. Defaults to True.
+
+    Returns:
+        bool: True if the snapshot was loaded, or False if it doesn't exist, if it is stale,
+            i.e. saved with another version of inflex or of the core modules, or if it is
+            corrupt, e.g. truncated. Nothing is changed unless the snapshot is loaded.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return False
+    with f:
+        try:
+            if pickle.load(f) != _header():
+                return False
+            state = _decode(pickle.load(f))
+        except _unpickling_errors:
+            return False
+    # The whole snapshot is checked before anything is changed
+    if state is None:
+        return False
+
+    for module, names in _literal_tables.items():
+        for name in names:
+            table = getattr(module, name)
+            table.clear()
+            table.update(state["literals"][module.__name__][name])
+    lexicon._update_verb_sets()  # pylint: disable=W0212
+    # Discard results computed using the previous dictionaries
+    lexicon._invalidate()  # pylint: disable=W0212
+    term._case_sensitive = state["case_sensitive"]  # pylint: disable=W0212
+    for table, paradigms in zip((paradigm_core.noun_paradigms, paradigm_core.verb_paradigms), state["paradigms"]):
+        table.update(paradigms)
+
+    for name, (root, regex_rules, suffix_rules) in state["tries"].items():
+        trie = getattr(noun_core, name)
+        trie._regex_rules = regex_rules  # pylint: disable=W0212
+        trie._suffix_rules = suffix_rules  # pylint: disable=W0212
+        trie._root = root  # pylint: disable=W0212
+
+    for lru_cache, maxsize, items in state["caches"]:
+        lru_cache.enable(maxsize)
+        lru_cache.update(items)
+
+    if compile_patterns:
+        inflex.preload()
+    return True
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    "StressIndex"
+]
+
+import functools
+import mmap
+import struct
+import sys
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Stress values are stored as single byte codes
+_STRESS_CODES = {0: 0, 0.5: 1, 1: 2}
+_STRESS_VALUES = (0, 0.5, 1)
+
+
+class StressIndex:
+    """Read-only, memory-mapped index of syllable stress data, in the packed binary format
+    written by `StressIndex.write`.
+
+    All integers are little-endian. The file consists of a header followed by eight sections:
+
+    * key offsets: `n_words + 1` uint32 offsets into the key blob.
+    * set ids: `n_words` uint16 ids, the stress pattern set of each word.
+    * flags: `n_words` uint8 bitsets of precomputed properties of each word, e.g.
+      `Syllable.ONE_SYLLABLE`.
+    * set offsets: `n_sets + 1` uint32 offsets into the set members.
+    * set members: uint16 stress pattern ids.
+    * pattern offsets: `n_patterns + 1` uint32 offsets into the pattern codes.
+    * pattern codes: uint8 stress codes, where 0, 1 and 2 correspond to no stress,
+      secondary stress and primary stress respectively.
+    * key blob: The UTF-8 encoded words, sorted bytewise.
+
+    Only the few hundred distinct stress patterns and pattern sets are decoded when
+    the index is opened. Words are found with a binary search directly on the mapped
+    file, so the file is never parsed in full, and its pages are shared between
+    processes. The positions of the most recently looked up words are kept in memory,
+    so repeated lookups take about as long as a dictionary lookup.
+    """
+
+    MAGIC = b"IFXS"
+    VERSION = 2
+    # Magic, version, number of words, sets and patterns, and the offset of each section
+    _header = struct.Struct("<4sI3I8I")
+    # Maximum number of words of which the position is kept in memory
+    CACHE_SIZE = 16384
+
+    def __init__(self, path: str):
+        """Open and memory-map the index at `path`.
+
+        Args:
+            path (str): Path to a file written by `StressIndex.write`.
+
+        Raises:
+            ValueError: If `path` is not a stress index of the supported version.
+        """
+        super().__init__()
+        self._find = functools.lru_cache(maxsize=StressIndex.CACHE_SIZE)(self._search)
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = StressIndex._header.unpack_from(self._mmap, 0)
+        magic, version, self.n_words, n_sets, n_patterns = header[:5]
+        if magic != StressIndex.MAGIC or version != StressIndex.VERSION:
+            raise ValueError(f"{path!r} is not a version {StressIndex.VERSION} stress index.")
+        (key_offsets, set_ids, flags, set_offsets, set_members,
+         pattern_offsets, pattern_codes, self._keys) = header[5:]
+
+        # Typed views on the mapped file, without copying. The file is little-endian,
+        # so on big-endian platforms the arrays are decoded into memory instead.
+        self._view = memoryview(self._mmap)
+        self._key_offsets = self._array(key_offsets, "I", self.n_words + 1)
+        self._set_ids = self._array(set_ids, "H", self.n_words)
+        self._flags = self._view[flags:flags + self.n_words]
+
+        # Decode the small tables of distinct stress patterns and pattern sets
+        offsets = struct.unpack_from(f"<{n_patterns + 1}I", self._mmap, pattern_offsets)
+        codes = self._mmap[pattern_codes:pattern_codes + offsets[-1]]
+        patterns = [tuple(_STRESS_VALUES[code] for code in codes[start:end])
+                    for start, end in zip(offsets, offsets[1:])]
+
+        offsets = struct.unpack_from(f"<{n_sets + 1}I", self._mmap, set_offsets)
+        members = struct.unpack_from(f"<{offsets[-1]}H", self._mmap, set_members)
+        self.sets: Tuple[Tuple[Tuple[float, ...], ...], ...] = tuple(
+            tuple(patterns[member] for member in members[start:end])
+            for start, end in zip(offsets, offsets[1:]))
+
+    def __len__(self) -> int:
+        return self.n_words
+
+    def _array(self, offset: int, typecode: str, length: int) -> Sequence[int]:
+        """Get a sequence of `length` integers of type `typecode`, starting at `offset`.
+
+        Args:
+            offset (int): Offset of the first integer in the file.
+            typecode (str): "I" for uint32, or "H" for uint16.
+            length (int): Number of integers.
+
+        Returns:
+            Sequence[int]: The integers.
+        """
+        size = struct.calcsize(typecode)
+        if sys.byteorder == "little" and size == {"I": 4, "H": 2}[typecode]:
+            return self._view[offset:offset + size * length].cast(typecode)
+        return struct.unpack_from(f"<{length}{typecode}", self._mmap, offset)
+
+    def find(self, word: str) -> int:
+        """Find the position of `word` in the index.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            int: The position of `word`, or -1 if `word` is not in the index.
+        """
+        return self._find(word)
+
+    def _search(self, word: str) -> int:
+        """Find the position of `word` in the index using binary search on the mapped file.
+        Called through `self._find`, which caches the positions of recent words.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            int: The position of `word`, or -1 if `word` is not in the index.
+        """
+        try:
+            key = word.encode("utf8")
+        except UnicodeEncodeError:
+            return -1
+
+        data = self._mmap
+        offsets = self._key_offsets
+        keys = self._keys
+        low, high = 0, self.n_words
+        while low < high:
+            middle = (low + high) // 2
+            probe = data[keys + offsets[middle]:keys + offsets[middle + 1]]
+            if probe < key:
+                low = middle + 1
+            elif probe > key:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def get(self, word: str) -> Tuple[Tuple[float, ...], ...]:
+        """Return the stress patterns of `word`.
+
+        Examples:
+            >>> index.get("abdomen")
+            ((0, 1, 0), (1, 0, 0))
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Tuple[Tuple[float, ...], ...]: The stress patterns of `word`, or an empty tuple
+                if `word` is not in the index. The tuples are shared between all words with
+                the same stress patterns.
+        """
+        position = self._find(word)
+        if position < 0:
+            return ()
+        return self.sets[self._set_ids[position]]
+
+    def get_flags(self, word: str) -> Optional[int]:
+        """Return the precomputed flags of `word`.
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Optional[int]: The flags of `word`, or None if `word` is not in the index.
+        """
+        position = self._find(word)
+        if position < 0:
+            return None
+        return self._flags[position]
+
+    def items(self) -> Iterator[Tuple[str, Tuple[Tuple[float, ...], ...]]]:
+        """Iterate over all words and their stress patterns, in bytewise sorted order.
+
+        Yields:
+            Tuple[str, Tuple[Tuple[float, ...], ...]]: A word and its stress patterns.
+        """
+        data = self._mmap
+        offsets = self._key_offsets
+        keys = self._keys
+        for position in range(self.n_words):
+            word = data[keys + offsets[position]:keys + offsets[position + 1]].decode("utf8")
+            yield word, self.sets[self._set_ids[position]]
+
+    def close(self) -> None:
+        """Close the memory map. The index can't be used afterwards."""
+        self._find.cache_clear()
+        for view in (self._key_offsets, self._set_ids, self._flags, self._view):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+
+    @staticmethod
+    def write(data: Dict[str, List[List[float]]],
+              path: str,
+              flags: Optional[Dict[str, int]] = None) -> None:
+        """Write `data` to `path` in the packed binary stress index format.
+
+        Args:
+            data (Dict[str, List[List[float]]]): Mapping of words to lists of stress patterns,
+                as stored in `cmudict_stress.json`.
+            path (str): Output path.
+            flags (Optional[Dict[str, int]], optional): Mapping of words to bitsets between
+                0 and 255. Defaults to None, i.e. 0 for every word.
+        """
+        flags = flags or {}
+        patterns: Dict[Tuple[float, ...], int] = {}
+        sets: Dict[Tuple[int, ...], int] = {}
+        keys = sorted((word.encode("utf8"), word) for word in data)
+
+        key_offsets = [0]
+        set_ids = []
+        for key, word in keys:
+            key_offsets.append(key_offsets[-1] + len(key))
+            members = tuple(patterns.setdefault(tuple(stress), len(patterns)) for stress in data[word])
+            set_ids.append(sets.setdefault(members, len(sets)))
+
+        set_offsets = [0]
+        set_members: List[int] = []
+        for members in sets:
+            set_members.extend(members)
+            set_offsets.append(len(set_members))
+
+        pattern_offsets = [0]
+        pattern_codes = bytearray()
+        for pattern in patterns:
+            pattern_codes.extend(_STRESS_CODES[stress] for stress in pattern)
+            pattern_offsets.append(len(pattern_codes))
+
+        sections = [
+            struct.pack(f"<{len(key_offsets)}I", *key_offsets),
+            struct.pack(f"<{len(set_ids)}H", *set_ids),
+            bytes(flags.get(word, 0) for _key, word in keys),
+            struct.pack(f"<{len(set_offsets)}I", *set_offsets),
+            struct.pack(f"<{len(set_members)}H", *set_members),
+            struct.pack(f"<{len(pattern_offsets)}I", *pattern_offsets),
+            bytes(pattern_codes),
+            b"".join(key for key, _word in keys),
+        ]
+        offsets = []
+        position = StressIndex._header.size
+        for i, section in enumerate(sections):
+            # Align every section to 4 bytes
+            padding = -position % 4
+            sections[i] = b"\0" * padding + section
+            offsets.append(position + padding)
+            position += len(sections[i])
+
+        with open(path, "wb") as file:
+            file.write(StressIndex._header.pack(StressIndex.MAGIC, StressIndex.VERSION,
+                                                len(keys), len(sets), len(patterns), *offsets))
+            for section in sections:
+                file.write(section)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    "SuffixBuckets"
+]
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from inflex.suffix_trie import split_alternatives
+
+
+class SuffixBuckets:
+    """Dispatch table that matches generated rules using only the rules that can match
+    the ending of the word.
+
+    The generated `*_convert_rule_regex` and `*_recognize_rule` patterns in `verb_core`
+    consist of one large alternation, mostly of rules of the shape `((?:.{2,})?)<suffix>`,
+    e.g. `((?:.{2,})?)believe`. Every rule is stored in a bucket keyed on the last (up to)
+    three characters of its literal suffix, e.g. "eve". Each bucket also holds the rules
+    with a shorter key that is an ending of its own key, e.g. "ve", "e" or "", so a single
+    bucket holds every rule that can match a word ending in the key of the bucket.
+    Only the rules in that bucket are tried, in their original order, and the matched rule
+    is found directly from the last matched group, rather than by checking every group.
+
+    The output is identical to that of the regex it was built from.
+    """
+
+    def __init__(self, regex: Pattern[str], buckets: Dict[str, Tuple[int, ...]]):
+        """Create a SuffixBuckets from a generated regex and its generated buckets.
+
+        Note:
+            The regex of a bucket is only compiled when it is first used.
+
+        Args:
+            regex (Pattern[str]): The generated regex, e.g. `past_convert_rule_regex`.
+            buckets (Dict[str, Tuple[int, ...]]): Mapping of word endings of at most three
+                characters to the indices of the alternatives of `regex` that may match
+                words with that ending, in order. Must contain the empty ending "".
+        """
+        super().__init__()
+        self.regex = regex
+        self.buckets = buckets
+
+        # The alternatives of `regex`, split on first use
+        self._rules: Optional[List[str]] = None
+        # Mapping of bucket keys to the compiled regex of the bucket, or None if the bucket
+        # is empty, and to a list mapping each group of that regex to the rule index and the
+        # first group of the rule.
+        self._compiled: Dict[str, Tuple[Optional[Pattern[str]], List[Tuple[int, int]]]] = {}
+
+    def _compile(self, key: str) -> Tuple[Optional[Pattern[str]], List[Tuple[int, int]]]:
+        """Compile the regex of the bucket with key `key`.
+
+        Args:
+            key (str): Key of the bucket.
+
+        Returns:
+            Tuple[Optional[Pattern[str]], List[Tuple[int, int]]]: The compiled regex of the bucket,
+                or None if the bucket is empty, and the rule index and first group of the rule
+                for each group.
+        """
+        if self._rules is None:
+            self._rules = split_alternatives(self.regex.pattern)
+
+        alternatives = []
+        group_rules = [(-1, 0)]
+        for index in self.buckets[key]:
+            rule = self._rules[index]
+            first_group = len(group_rules)
+            group_rules += [(index, first_group)] * re.compile(rule).groups
+            alternatives.append(rule)
+        # An empty alternation would match the empty word
+        compiled = re.compile(f"^(?:{'|'.join(alternatives)})$", flags=self.regex.flags) if alternatives else None
+        self._compiled[key] = compiled, group_rules
+        return compiled, group_rules
+
+    def match(self, word: str) -> Optional[Tuple[int, str]]:
+        """Find the first rule that matches `word`.
+
+        Args:
+            word (str): Input word, in the casing in which `regex` should match it.
+
+        Returns:
+            Optional[Tuple[int, str]]: The index of the first matching alternative of `regex`,
+                and the first group matched by that alternative, or None if no rule matches.
+        """
+        # Like `regex`, the rules may match before a trailing newline
+        ending = word[:-1] if word.endswith("\n") else word
+        key = ending[-3:]
+        if key not in self.buckets:
+            key = ending[-2:]
+            if key not in self.buckets:
+                key = ending[-1:]
+                if key not in self.buckets:
+                    key = ""
+        try:
+            compiled, group_rules = self._compiled[key]
+        except KeyError:
+            compiled, group_rules = self._compile(key)
+
+        if compiled is None:
+            return None
+        match = compiled.match(word)
+        if match is None:
+            return None
+        index, first_group = group_rules[match.lastindex]
+        return index, match.group(first_group)
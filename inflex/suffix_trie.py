@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__all__ = [
+    "SuffixTrie"
+]
+
+import re
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+
+def split_alternatives(pattern: str) -> List[str]:
+    """Split the top-level alternation of a generated rule regex into its alternatives.
+
+    Examples:
+        >>> split_alternatives(r"^(?:(.*)staff|(.+[aeiou])o|(.+))$")
+        ['(.*)staff', '(.+[aeiou])o', '(.+)']
+
+    Args:
+        pattern (str): Regular expression pattern of the form `^(?:...|...)$`.
+
+    Returns:
+        List[str]: The alternatives, in the order in which they are tried.
+    """
+    if pattern.startswith("^(?:") and pattern.endswith(")$"):
+        pattern = pattern[4:-2]
+
+    alternatives = []
+    depth = 0
+    in_class = False
+    start = 0
+    escaped = False
+    for i, char in enumerate(pattern):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+class SuffixTrie:
+    """Rule engine that matches generated conversion rules via a trie of reversed word endings.
+
+    The generated `*_convert_rule_regex` patterns in `noun_core` consist of one large
+    alternation, of which the first alternative that matches the full word determines
+    the conversion. Most alternatives have the shape `(<generic><restriction>)<suffix>`,
+    e.g. `(.+[aeiou])o` or `(.*)staff`. These are stored in a trie keyed on the reversed
+    literal suffix, so finding every candidate rule costs about as much as the length of
+    the matching suffix, rather than the number of rules. All other alternatives, e.g.
+    `son-of-a-(.*?)`, are tried with their own regex, but only if they precede the best
+    candidate from the trie.
+
+    The output is identical to that of the regex it was built from.
+    """
+
+    # Matches an alternative of the shape `(<generic><restriction>)<suffix>`
+    _suffix_rule_regex = re.compile(r"""
+        \A
+        \( (?P<generic> \.[*+]\?? ) (?P<restrict> (?:\[[^\]]+\])* ) \)
+        (?P<suffix> [^\\()\[\]{}|.*+?^$]* )
+        \Z
+    """, flags=re.VERBOSE)
+
+    # Words containing non-ASCII characters or newlines are left for the regex to handle,
+    # as case-insensitive matching and `.` behave differently for these.
+    _unsupported_regex = re.compile(r"[^\x00-\x09\x0b-\x7f]")
+
+    # Matches a parenthesized group, to find the literal text required by a regex rule
+    _group_regex = re.compile(r"\((?:[^()]|\([^()]*\))*\)")
+
+    def __init__(self,
+                 regex: Pattern[str],
+                 outputs: List[Callable[[List[str]], str]],
+                 slices: List[Tuple[int, List[int]]]):
+        """Create a SuffixTrie from the generated regex, outputs and slices of a conversion.
+
+        Note:
+            The trie is only built when it is first used.
+
+        Args:
+            regex (Pattern[str]): The generated `*_convert_rule_regex`.
+            outputs (List[Callable[[List[str]], str]]): The generated `*_convert_outputs`.
+            slices (List[Tuple[int, List[int]]]): The generated `*_convert_slices`, mapping
+                each capture group of `regex` to an index of `outputs` and the capture groups
+                to pass to that output.
+        """
+        super().__init__()
+        self.regex = regex
+        self.outputs = outputs
+        self.slices = slices
+
+        # Trie of reversed suffixes. Each node maps characters to child nodes, while the
+        # `None` key holds the rules whose suffix ends at that node.
+        self._root: Optional[Dict] = None
+        # List of (rule index, compiled regex, required characters, output index) tuples,
+        # for rules that can't be expressed as a suffix.
+        self._regex_rules: List[Tuple[int, Pattern[str], str, int]] = []
+        # List of (compiled regex, output index) tuples, for the rules that are expressed
+        # as a suffix, except for collocation rules, in order. Used by `find` with
+        # `suffix_only` for words which the trie doesn't support.
+        self._suffix_rules: List[Tuple[Pattern[str], int]] = []
+
+    def _build(self) -> Dict:
+        """Build the trie and the list of remaining regex rules.
+
+        Returns:
+            Dict: The root node of the trie.
+        """
+        root: Dict = {None: []}
+        group = 0
+        for index, rule in enumerate(split_alternatives(self.regex.pattern)):
+            output_id = self.slices[group][0]
+            compiled = re.compile(f"^{rule}$", flags=self.regex.flags)
+            group += compiled.groups
+
+            match = SuffixTrie._suffix_rule_regex.match(rule)
+            if not match:
+                # Every character outside of the groups must occur in a matching word
+                literal = SuffixTrie._group_regex.sub("", rule)
+                required = literal if re.fullmatch(r"[\w '-]*", literal) else ""
+                self._regex_rules.append((index, compiled, required, output_id))
+                continue
+
+            # Rules capturing a subterm of a collocation lazily, e.g. `(.*?) errant`, of which
+            # the output may convert that subterm recursively
+            collocation = match.group("generic").endswith("?")
+            if not collocation:
+                self._suffix_rules.append((compiled, output_id))
+
+            # Compile the restriction character classes, e.g. "[aeiou]"
+            restrict = [re.compile(char_class, flags=self.regex.flags)
+                        for char_class in re.findall(r"\[[^\]]+\]", match.group("restrict"))]
+            # The minimum length of the prefix before the suffix
+            min_length = (1 if match.group("generic").startswith(".+") else 0) + len(restrict)
+
+            suffix = match.group("suffix").lower()
+            node = root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {None: []})
+            node[None].append((index, len(suffix), min_length, restrict, output_id, collocation))
+
+        return root
+
+    def convert(self, word: str, default: Optional[str] = None) -> Optional[str]:
+        """Apply the first rule that matches `word`, and return the converted output.
+
+        Args:
+            word (str): Input word or collocation.
+            default (Optional[str], optional): Returned if no rule matches `word`.
+                Defaults to None.
+
+        Returns:
+            Optional[str]: The converted `word`, or `default` if no rule matches.
+        """
+        found = self.find(word)
+        if found is None:
+            return default
+        return self.outputs[found[0]](found[1])
+
+    def find(self, word: str, suffix_only: bool = False) -> Optional[Tuple[int, List[str]]]:
+        """Find the first rule that matches `word`, without applying its output. Outputs may
+        convert subterms recursively, so callers applying the output themselves save a stack
+        frame per nesting level of e.g. "son of a son of a gun".
+
+        Args:
+            word (str): Input word or collocation.
+            suffix_only (bool, optional): If True, only the rules that can be expressed as
+                a suffix are tried, except for rules on collocations, e.g. neither `son-of-a-(.*?)`
+                nor `(.*?) errant`. No subterms are then converted recursively, and the time
+                taken is linear in the length of `word`. Defaults to False.
+
+        Returns:
+            Optional[Tuple[int, List[str]]]: The index of the output in `outputs`, and the
+                subterms to pass to it, or None if no rule matches.
+        """
+        if self._root is None:
+            self._root = self._build()
+
+        if SuffixTrie._unsupported_regex.search(word):
+            if suffix_only:
+                return self._find_by_suffix_rules(word)
+            return self._find_by_regex(word)
+
+        lowered = word.lower()
+        length = len(word)
+
+        # Find the first rule (i.e. with the lowest index) of which the suffix matches
+        best = None
+        node = self._root
+        depth = 0
+        while True:
+            for rule in node[None]:
+                if best is not None and rule[0] >= best[0]:
+                    continue
+                _index, suffix_length, min_length, restrict, _output_id, collocation = rule
+                if suffix_only and collocation:
+                    continue
+                prefix_length = length - suffix_length
+                if prefix_length < min_length:
+                    continue
+                if restrict and not all(
+                        char_class.match(lowered[prefix_length - len(restrict) + i])
+                        for i, char_class in enumerate(restrict)):
+                    continue
+                best = rule
+            if depth == length:
+                break
+            depth += 1
+            node = node.get(lowered[-depth])
+            if node is None:
+                break
+
+        # Rules that can't be expressed as suffixes are tried if they precede `best`
+        for index, compiled, required, output_id in self._regex_rules:
+            if suffix_only or best is not None and index > best[0]:
+                break
+            if required and not all(char in lowered for char in required):
+                continue
+            match = compiled.match(word)
+            if match:
+                return output_id, list(match.groups())
+
+        if best is None:
+            return None
+        return best[4], [word[:length - best[1]]]
+
+    def _find_by_regex(self, word: str) -> Optional[Tuple[int, List[str]]]:
+        """Find the first rule that matches `word` using the original regex.
+
+        Args:
+            word (str): Input word or collocation.
+
+        Returns:
+            Optional[Tuple[int, List[str]]]: The index of the output in `outputs`, and the
+                subterms to pass to it, or None if no rule matches.
+        """
+        match = self.regex.match(word)
+        if match:
+            for i, group in enumerate(match.groups()):
+                if group is not None:
+                    output_id, slices = self.slices[i]
+                    return output_id, [match.group(index) for index in slices]
+        return None
+
+    def _find_by_suffix_rules(self, word: str) -> Optional[Tuple[int, List[str]]]:
+        """Find the first rule that can be expressed as a suffix and matches `word`, using
+        the regex of each of these rules. Rules on collocations are skipped, as in `find`
+        with `suffix_only`.
+
+        Args:
+            word (str): Input word or collocation.
+
+        Returns:
+            Optional[Tuple[int, List[str]]]: The index of the output in `outputs`, and the
+                subterms to pass to it, or None if no rule matches.
+        """
+        for compiled, output_id in self._suffix_rules:
+            match = compiled.match(word)
+            if match:
+                return output_id, [match.group(1)]
+        return None
@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import json
 import os
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
+
+from inflex.stress_index import StressIndex
 
 
 class Syllable:
@@ -14,11 +15,23 @@ class Syllable:
     """
 
     _data: Dict[str, List[List[float]]] = {}
+    _index: Optional[StressIndex] = None
+
+    # Flags precomputed for every word in the stress data, see `Syllable.get_flags`
+    ONE_SYLLABLE = 1
+    ENDS_WITH_STRESS = 2
+    DOUBLES_FINAL_CONSONANT = 4
+    TAKES_MORE_MOST = 8
 
     @staticmethod
     def data() -> Dict[str, List[List[float]]]:
         """Lazy load syllable and stress data when requested.
 
+        Note:
+            This builds a dictionary of all words, with separate lists for each word,
+            which the other methods avoid by using `Syllable.index()` instead. The index
+            stores each distinct stress pattern only once.
+
         Examples:
             >>> Stress.data()
             {
@@ -37,12 +50,24 @@ class Syllable:
         if Syllable._data:
             return Syllable._data
 
-        path = os.path.join(os.path.dirname(__file__),
-                            "data/cmudict_stress.json")
-        with open(path, "r", encoding="utf8") as file:
-            Syllable._data = json.load(file)
+        Syllable._data = {word: [list(stress) for stress in stresses]
+                          for word, stresses in Syllable.index().items()}
         return Syllable._data
 
+    @staticmethod
+    def index() -> StressIndex:
+        """Lazy open the memory-mapped syllable and stress data when requested.
+
+        Returns:
+            StressIndex: Index of the stress patterns of each word, read from the
+                packed binary `data/cmudict_stress.bin`.
+        """
+        if Syllable._index is None:
+            path = os.path.join(os.path.dirname(__file__),
+                                "data/cmudict_stress.bin")
+            Syllable._index = StressIndex(path)
+        return Syllable._index
+
     @staticmethod
     def get_stress(word: str) -> List[List[float]]:
         """Return a list of syllable interpretations that correspond to stress values, for `word`.
@@ -63,10 +88,33 @@ class Syllable:
             List[List[float]]: A list of syllable interpretations that correspond to stress values,
                 for `word`.
         """
-        try:
-            return Syllable.data()[word]
-        except KeyError:
-            return []
+        return [list(stress) for stress in Syllable.index().get(word)]
+
+    @staticmethod
+    def get_flags(word: str) -> Optional[int]:
+        """Return the precomputed flags of `word`, or None if `word` is not in the stress data.
+
+        The flags are computed when generating the stress data, using the same heuristics
+        that are applied at runtime to words outside of the stress data:
+
+        * `Syllable.ONE_SYLLABLE`: 1 is one of the valid syllable counts of `word`.
+        * `Syllable.ENDS_WITH_STRESS`: All syllable interpretations of `word` end with stress.
+        * `Syllable.DOUBLES_FINAL_CONSONANT`: The final consonant of `word` is doubled before
+          appending e.g. "-er" or "-ed".
+        * `Syllable.TAKES_MORE_MOST`: "more" and "most" are prepended to `word` rather than
+          appending "-er" or "-est".
+
+        Examples:
+            >>> Syllable.get_flags("big") & Syllable.DOUBLES_FINAL_CONSONANT
+            4
+
+        Args:
+            word (str): The input word.
+
+        Returns:
+            Optional[int]: Bitset of the flags of `word`, or None if `word` is unknown.
+        """
+        return Syllable.index().get_flags(word)
 
     @staticmethod
     def count_syllables(word: str) -> Set[int]:
@@ -81,7 +129,7 @@ class Syllable:
         Returns:
             Set[int]: The set of valid syllable counts of `word`.
         """
-        return {len(stress) for stress in Syllable.get_stress(word)}
+        return {len(stress) for stress in Syllable.index().get(word)}
 
     @staticmethod
     def count_reduced_syllables(word: str) -> Set[int]:
@@ -117,7 +165,7 @@ class Syllable:
             bool: True if all syllable interpretations of `word` end with stress.
                 False otherwise.
         """
-        stresses = Syllable.get_stress(word)
+        stresses = Syllable.index().get(word)
         return all(stress[-1] > 0 for stress in stresses if stress)
 
     @staticmethod
@@ -5,25 +5,32 @@ __all__ = [
     "Term"
 ]
 
+import functools
+import importlib
+import inspect
+import operator
 import re
-from typing import Callable, Dict, Generator, List, Pattern, TypeVar, Union
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, Generator, Iterable, List, Optional, Pattern, Sequence, Tuple, Type, TypeVar, Union
+
+from inflex.cache import LRUCache, caches
 
 T = TypeVar("T")  # pylint: disable=C0103
+TermT = TypeVar("TermT", bound="Term")  # pylint: disable=C0103
 
 
-def list_to_generator(input_list: List[T]) -> Generator[T, None, None]:
+def list_to_generator(input_list: Sequence[T]) -> Generator[T, None, None]:
     """Yield element from list, repeating the very last element infinitely.
 
     Args:
-        input_list (List[T]): List of elements.
+        input_list (Sequence[T]): List of elements.
 
     Yields:
         T: Element of `input_list`
     """
+    yield from input_list[:-1]
     while True:
-        yield input_list[0]
-        if len(input_list) > 1:
-            input_list = input_list[1:]
+        yield input_list[-1]
 
 
 def _transform(func: Callable[[str], str]) -> Callable[[str], str]:
@@ -38,6 +45,244 @@ def _transform(func: Callable[[str], str]) -> Callable[[str], str]:
     return lambda word: "I" if word.lower() == "i" else func(word)
 
 
+def _call_canonical(cls: Type["Term"],
+                    method: Callable[..., T],
+                    term: str,
+                    args: Tuple[Any, ...],
+                    kwargs: Tuple[Tuple[str, Any], ...]) -> T:
+    """Call `method` on an instance of `cls` for `term`, as used by the "term.canonical_forms"
+    and "term.patterns" caches. For "term.canonical_forms", `term` is the lowercase, stripped
+    term, and the output has lowercase casing, onto which the casing of any case variant of
+    `term` can be applied. For "term.patterns", `term` is the input term, including its casing
+    and whitespace, although `memoize_pattern` computes patterns on the instance itself.
+
+    Args:
+        cls (Type[Term]): The class of the original instance.
+        method (Callable[..., T]): Undecorated method converting the term to some form,
+            or compiling a pattern for the term.
+        term (str): The term for which `method` is called.
+        args (Tuple[Any, ...]): Positional arguments for `method`.
+        kwargs (Tuple[Tuple[str, Any], ...]): Keyword arguments for `method`, as items.
+
+    Returns:
+        T: The output of `method` for `term`.
+    """
+    return method(cls._canonical_instance(term), *args, **dict(kwargs)) # pylint: disable=W0212
+
+
+"""
+Lowercase forms of the words that have case-sensitive entries in the core modules, e.g.
+"jerry" due to "Jerry" -> "Jerrys". Computed on first use by `_case_sensitive_words()`.
+"""
+_case_sensitive: Optional[FrozenSet[str]] = None
+
+
+def _case_sensitive_words() -> FrozenSet[str]:
+    """Get the lowercase forms of all words and collocations which appear with uppercase
+    characters in the dictionaries and sets of the core modules. The core modules only
+    convert these case-sensitively, other words are converted identically regardless of casing.
+
+    Returns:
+        FrozenSet[str]: Lowercase words and collocations.
+    """
+    global _case_sensitive # pylint: disable=W0603
+    if _case_sensitive is None:
+        words = set()
+        for name in ("inflex.noun_core", "inflex.verb_core", "inflex.adjective_core"):
+            for value in vars(importlib.import_module(name)).values():
+                if isinstance(value, (dict, set, frozenset)):
+                    words.update(key.lower() for key in value if isinstance(key, str) and not key.islower())
+        _case_sensitive = frozenset(words)
+    return _case_sensitive
+
+
+"""
+Version of the keys and outputs of the "term.canonical_forms" and "term.patterns" caches,
+which is stored in snapshots, see `inflex.snapshot`. Increment it when either changes.
+"""
+CACHE_FORMAT = 2
+
+"""
+Cache of outputs for lowercase terms, shared by all casing and whitespace variants
+of a term. Like the core caches, it is disabled by default, see `inflex.cache.enable`.
+"""
+canonical_forms = LRUCache(_call_canonical, "term.canonical_forms")
+caches[canonical_forms.name] = canonical_forms
+
+"""
+Cache of the compiled patterns of `as_regex`, shared by all instances of the same class
+for the same input term, e.g. by `Noun("child")` and `Noun("child").classical()` for the modern
+and classical pattern respectively. Disabled by default, see `inflex.cache.enable`.
+"""
+patterns = LRUCache(_call_canonical, "term.patterns")
+caches[patterns.name] = patterns
+
+
+def _argument_normaliser(method: Callable[..., Any]) -> Callable[[Tuple[Any, ...], Dict[str, Any]], Tuple[Any, ...]]:
+    """Create a function binding the arguments of a call to `method` to its parameters,
+    as used for the memo keys of `memoize_form` and `memoize_pattern`. The arguments are
+    normalised to the positional values of all parameters, or to an empty tuple if these
+    are all equal to the defaults, so e.g. `plural()`, `plural(0)` and `plural(person=0)`
+    give the same key.
+
+    Args:
+        method (Callable[..., Any]): Method of which all parameters besides `self`
+            have a default value.
+
+    Returns:
+        Callable[[Tuple[Any, ...], Dict[str, Any]], Tuple[Any, ...]]: Function normalising
+            the positional and keyword arguments of a call, raising a TypeError for
+            arguments which `method` doesn't accept.
+    """
+    parameters = list(inspect.signature(method).parameters.values())[1:]
+    names = tuple(parameter.name for parameter in parameters)
+    defaults = tuple(parameter.default for parameter in parameters)
+    positions = {name: position for position, name in enumerate(names)}
+
+    def normalise(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+        if len(args) > len(names):
+            raise TypeError(f"{method.__name__}() takes at most {len(names)} arguments ({len(args)} given)")
+        if kwargs:
+            values = list(args + defaults[len(args):])
+            for name, value in kwargs.items():
+                position = positions.get(name, -1)
+                if position < 0:
+                    raise TypeError(f"{method.__name__}() got an unexpected keyword argument {name!r}")
+                if position < len(args):
+                    raise TypeError(f"{method.__name__}() got multiple values for argument {name!r}")
+                values[position] = value
+            args = tuple(values)
+        elif len(args) < len(names):
+            args += defaults[len(args):]
+        return () if args == defaults else args
+
+    return normalise
+
+
+def memoize_pattern(method: Callable[..., Pattern[str]]) -> Callable[..., Pattern[str]]:
+    """Decorator remembering the compiled pattern returned by a `Term` method per instance,
+    keyed on the method and its arguments, e.g. `word_boundaries`.
+
+    If the "term.patterns" cache is enabled, then patterns are also shared between instances
+    of the same class, created for the same input term, including its casing and whitespace.
+    The pattern is still computed on the instance itself, so it is identical to the pattern
+    without the cache. Instances of which `term`, `start`, `end` or `spaces` was assigned
+    no longer correspond to their input term, and don't share patterns.
+
+    The arguments are normalised to the positional values of all parameters, so e.g.
+    `as_regex()`, `as_regex(False)` and `as_regex(word_boundaries=False)` share one pattern.
+
+    Args:
+        method (Callable[..., Pattern[str]]): Method compiling a pattern for the term,
+            of which all parameters besides `self` have a default value.
+
+    Returns:
+        Callable[..., Pattern[str]]: Wrapped method, which only calls `method` once per
+            instance and combination of arguments.
+    """
+    normalise = _argument_normaliser(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "Term", *args: Any, **kwargs: Any) -> Pattern[str]:
+        if args or kwargs:
+            args = normalise(args, kwargs)
+        key = (method, args) if args else method
+        memo = self._memo # pylint: disable=W0212
+        if memo is None:
+            memo = self._memo = {} # pylint: disable=W0212
+        else:
+            try:
+                return memo[key]
+            except KeyError:
+                pass
+        if patterns.enabled and self._input is not None: # pylint: disable=W0212
+            result = memo[key] = patterns.get((self.__class__, method, self._input, args, ()), # pylint: disable=W0212
+                                              functools.partial(method, self, *args))
+            return result
+        result = memo[key] = method(self, *args)
+        return result
+
+    return wrapper
+
+
+def memoize_form(method: Optional[Callable[..., str]] = None,
+                 canonical: bool = True) -> Callable[..., Any]:
+    """Decorator remembering the output of a `Term` method per instance, keyed on the
+    method and its arguments, e.g. `person`.
+
+    If `canonical`, and the "term.canonical_forms" cache is enabled, then outputs are
+    also shared between instances whose terms only differ in casing and whitespace.
+    The output is then computed for the lowercase term, after which the casing and
+    whitespace of the term are applied. This is only done for terms where each word
+    is lowercase, title case or e.g. "McDonald", as these casings fully determine the
+    casing of the output.
+
+    The arguments are normalised to the positional values of all parameters, so e.g.
+    `plural()`, `plural(0)` and `plural(person=0)` share one output.
+
+    Args:
+        method (Optional[Callable[..., str]]): Method converting the term to some form,
+            of which all parameters besides `self` have a default value.
+        canonical (bool, optional): Whether outputs may be shared between case variants.
+            Must be False for methods whose output depends on the casing of the term
+            in other ways. Defaults to True.
+
+    Returns:
+        Callable[..., Any]: Wrapped method, which only calls `method` once per instance
+            and combination of arguments, or a decorator if `method` is None.
+    """
+    if method is None:
+        return functools.partial(memoize_form, canonical=canonical)
+    normalise = _argument_normaliser(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "Term", *args: Any, **kwargs: Any) -> str:
+        if args or kwargs:
+            args = normalise(args, kwargs)
+        key = (method, args) if args else method
+        memo = self._memo # pylint: disable=W0212
+        if memo is None:
+            memo = self._memo = {} # pylint: disable=W0212
+        else:
+            try:
+                return memo[key]
+            except KeyError:
+                pass
+        if canonical and canonical_forms.enabled:
+            # Whether this term may use `canonical_forms` is stored in the memo as well
+            try:
+                has_canonical_casing = memo[Term._has_canonical_casing]
+            except KeyError:
+                has_canonical_casing = memo[Term._has_canonical_casing] = self._has_canonical_casing() # type: ignore # pylint: disable=W0212
+            if has_canonical_casing:
+                result = memo[key] = self._encase(canonical_forms(self.__class__, method, self.term.lower(),
+                                                                  args, ()))
+                return result
+        result = memo[key] = method(self, *args)
+        return result
+
+    return wrapper
+
+
+def _identifying_attribute(name: str, doc: str) -> property:
+    """Create a property for one of the attributes identifying a `Term`, see `Term._key()`.
+    Assigning it discards the outputs computed for the previous value, see `Term._reset()`.
+
+    Args:
+        name (str): Name of the slot holding the value.
+        doc (str): Docstring of the property.
+
+    Returns:
+        property: The property.
+    """
+    def setter(self: "Term", value: Any) -> None:
+        # The separators are stored as a tuple, as they are part of `__hash__`
+        setattr(self, name, tuple(value) if name == "_spaces" and value is not None else value)
+        self._reset() # pylint: disable=W0212
+
+    return property(operator.attrgetter(name), setter, doc=doc)
+
+
 class Term:
     """`Term` is the base class of the `Noun`, `Verb`, `Adjective` subclasses,
     and holds some default implementations of methods used across these
@@ -46,6 +291,18 @@ class Term:
     Method docstrings from this class are inherited to the subclasses' methods.
     """
 
+    __slots__ = ("_term", "_start", "_end", "_spaces", "_input", "_casing", "_memo", "__weakref__")
+
+    # The attributes identifying the term, see `_key()`. Assigning one of them changes
+    # `__eq__` and `__hash__`, and discards the outputs computed so far.
+    term = _identifying_attribute("_term", "The stripped input term, with single spaces.")
+    start = _identifying_attribute("_start", "The whitespace before the input term.")
+    end = _identifying_attribute("_end", "The whitespace after the input term.")
+    spaces = _identifying_attribute("_spaces", "The separators between the words of the term, or None for the default.")
+
+    # Shared instances returned by `get()`, by class and input term
+    _instances: "weakref.WeakValueDictionary[Tuple[type, str], Term]" = weakref.WeakValueDictionary()
+
     # Supported casing formats: I, lower, Title, UPPER, Mc
     # Note that if the passed word is "i", we always output "I"
     _casing_formats: Dict[str, Dict[str, Union[Pattern[str], Callable[[str], str]]]] = {
@@ -79,8 +336,28 @@ class Term:
         },
     }
 
-    # Regex for finding a word
+    # Regex for finding a word, and the characters separating words
     _word_regex = re.compile(r"([^\r\n\t\f\v\-\' ]+)")
+    _word_separators = "\r\n\t\f\v-' "
+
+    # Regex for detecting uppercase characters, as used by `_casing_formats`
+    _uppercase_regex = re.compile(r"[A-Z]")
+
+    # Casing transformations which give the same output regardless of the casing of their input.
+    # The "upper" transformation keeps the casing of a final "s", e.g. for "FSMs".
+    _canonical_transformations = frozenset(casing_format["transformation"]
+                                           for name, casing_format in _casing_formats.items()
+                                           if name != "upper")
+
+    # Regex for splitting a term into pieces separated by whitespace or hyphens
+    _piece_regex = re.compile(r"[\s\-]+")
+
+    # Regex for separators mixing hyphens with whitespace or other hyphens, e.g. "a - b",
+    # for which the whitespace of the output is not reapplied consistently
+    _irregular_separator_regex = re.compile(r"\s-|-[\s\-]")
+
+    # Casing plan shared by all terms without uppercase characters, see `_casing_plan()`
+    _lowercase_plan = (_casing_formats["lower"]["transformation"],)
 
     # Regex for extracting whitespace before and after input
     _whitespace_regex = re.compile(r"(?P<start>^\s*).*?(?P<end>\s*$)")
@@ -97,24 +374,145 @@ class Term:
         """
         super().__init__()
         # Whitestring strings before and after the terms
-        self.start = ""
-        self.end = ""
+        self._start = ""
+        self._end = ""
         # Default format for the separator between words
-        self.spaces = None
+        self._spaces: Optional[Tuple[str, ...]] = None
+
+        self._term = term.strip()
+        # The input term, or None once one of the attributes identifying the term is assigned
+        self._input: Optional[str] = term
 
-        self.term = term.strip()
+        # Casing transformations of the words in the term, computed on the first `_encase()`
+        self._casing: Optional[Tuple[Callable[[str], str], ...]] = None
+        # Outputs of the methods decorated with `memoize_form`, created on first use
+        self._memo: Optional[Dict[Any, Any]] = None
 
         # Extract whitespace before and after the term
         if term.startswith(" ") or term.endswith(" "):
-            self.start, self.end = Term._whitespace_regex.match(term).groups() # type: ignore
+            self._start, self._end = Term._whitespace_regex.match(term).groups() # type: ignore
 
         # If there is troublesome double whitespace, find the substrings
         # between words and normalize them
         # NOTE: Assume there are no tabs, newlines, etc. in the input terms
-        if " " in self.term or "-" in self.term:
-            self.spaces = re.findall(r"([\r\n\t\f\v\- ]+)", self.term)
-        if "  " in self.term:
-            self.term = re.sub(r"\s{2,}", " ", self.term)
+        if " " in self._term or "-" in self._term:
+            self._spaces = tuple(re.findall(r"([\r\n\t\f\v\- ]+)", self._term))
+        if "  " in self._term:
+            self._term = re.sub(r"\s{2,}", " ", self._term)
+
+    @classmethod
+    def get(cls: Type[TermT], term: str) -> TermT:
+        """Return a shared instance for `term`, creating it only if none exists yet.
+
+        Unlike `Noun(term)`, repeated calls with the same `term` return the same object,
+        including the forms it already computed. The instance is discarded when it is
+        no longer referenced elsewhere. Assigning `term`, `start`, `end` or `spaces` of a
+        shared instance stops sharing it, so `get()` always gives the outputs for `term`.
+
+        Examples:
+            >>> Noun.get("user") is Noun.get("user")
+            True
+            >>> Noun.get("user") == Noun("user")
+            True
+
+        Args:
+            term (str): Input word or collocation.
+
+        Returns:
+            Term: An instance of this class for `term`.
+        """
+        key = (cls, term)
+        try:
+            return Term._instances[key] # type: ignore
+        except KeyError:
+            return Term._instances.setdefault(key, cls(term)) # type: ignore
+
+    @classmethod
+    def _canonical_instance(cls, term: str) -> "Term":
+        """Create the instance on which outputs are computed for the "term.canonical_forms"
+        and "term.patterns" caches, see `memoize_form` and `memoize_pattern`.
+
+        Args:
+            term (str): The lowercase, stripped term, or for the "term.patterns" cache,
+                the term including its casing and whitespace.
+
+        Returns:
+            Term: An instance of this class for `term`.
+        """
+        return cls(term)
+
+    def _has_canonical_casing(self) -> bool:
+        """Check whether the output for this term is equal to the output for the lowercase
+        term, after applying the casing of this term onto it. See `memoize_form`.
+
+        This holds if each word of this term is lowercase, title case or e.g. "McDonald",
+        and unchanged when applying that casing on it, as the casing of the output is then
+        fully determined by this term. Furthermore, none of the words may have a
+        case-sensitive conversion, such as "Jerry" -> "Jerrys" versus "jerry" -> "jerries".
+
+        Returns:
+            bool: True if outputs for this term may be computed from the lowercase term.
+        """
+        if self._casing is None:
+            self._casing = Term._casing_plan(self.term)
+        if not self._casing or self.term == "I" or Term._irregular_separator_regex.search(self.term):
+            return False
+
+        case_sensitive = _case_sensitive_words()
+        lowered = self.term.lower()
+        if lowered in case_sensitive:
+            return False
+
+        # Fast path for single words, which are the whole term
+        if not any(separator in self.term for separator in Term._word_separators):
+            transformation = self._casing[0]
+            return transformation in Term._canonical_transformations and transformation(self.term) == self.term
+
+        words = Term._word_regex.findall(self.term)
+        for word, transformation in zip(words, list_to_generator(self._casing)):
+            if transformation not in Term._canonical_transformations or transformation(word) != word:
+                return False
+        return all(piece not in case_sensitive for piece in Term._piece_regex.split(lowered)) and \
+            all(word.lower() not in case_sensitive for word in words)
+
+    def _reset(self) -> None:
+        """Discard everything computed for the previous value of `term`, `start`, `end` or
+        `spaces`, after one of them is assigned. If this is a shared instance from `get()`,
+        it is no longer shared.
+        """
+        # A shared instance is stored under its class and input term, see `get()`
+        key = (self.__class__, self._input)
+        if self._input is not None and Term._instances.get(key) is self:
+            Term._instances.pop(key, None)
+        self._input = None
+        self._casing = None
+        self._memo = None
+
+    def _key(self) -> Tuple[Any, ...]:
+        """Return the values identifying this object, used for `__eq__` and `__hash__`.
+
+        Returns:
+            Tuple[Any, ...]: The class, term and whitespace of this object.
+        """
+        return (self.__class__, self._term, self._start, self._end, self._spaces or None)
+
+    def __eq__(self, other: object) -> bool:
+        """Return `self == other`, i.e. whether both objects are of the same class, and have
+        the same term and whitespace, such that they produce the same outputs.
+
+        Examples:
+            >>> Noun("book") == Noun("book")
+            True
+            >>> Noun("book") == Noun("Book")
+            False
+        """
+        if not isinstance(other, Term):
+            return NotImplemented
+        return self._key() == other._key() # pylint: disable=W0212
+
+    def __hash__(self) -> int:
+        """Return `hash(self)`, consistent with `__eq__`."""
+        return hash(self._key())
 
     def is_noun(self) -> bool: # pylint: disable=R0201
         """Returns `True` only if this object is instantiated via `Noun(term)`.
@@ -244,9 +642,18 @@ class Term:
                 "Invalid `person` parameter supplied. Valid values include 0, 1, 2, and 3.")
         return True
 
-    def as_regex(self) -> Pattern[str]:
+    @memoize_pattern
+    def as_regex(self, word_boundaries: bool = False) -> Pattern[str]:
         """Returns a `re.Pattern` which case-insensitively matches any inflected form of the word.
 
+        Note:
+            The pattern is compiled once per object. With `inflex.cache.enable("term.patterns")`,
+            it is also shared between objects of the same class for the same term.
+
+        Args:
+            word_boundaries (bool, optional): Only match whole words, by surrounding the
+                pattern with `\\b`. Defaults to False.
+
         Returns:
             re.Pattern: Compiled regex object which case-insensitively matches any inflected form
                 of the word.
@@ -256,10 +663,26 @@ class Term:
             re.compile('cherubs|cherubim|cherub', re.IGNORECASE)
             >>> Verb('eat').as_regex()
             re.compile('eats|eating|eaten|eat|ate', re.IGNORECASE)
+            >>> Verb('eat').as_regex(word_boundaries=True)
+            re.compile('\\b(?:eats|eating|eaten|eat|ate)\\b', re.IGNORECASE)
+        """
+        return Term._compile_forms({self.singular(), self.plural()}, word_boundaries)
+
+    @staticmethod
+    def _compile_forms(forms: Iterable[str], word_boundaries: bool) -> Pattern[str]:
+        """Compile a pattern case-insensitively matching any of `forms`, used by `as_regex`.
+
+        Args:
+            forms (Iterable[str]): Distinct forms of a term.
+            word_boundaries (bool): Whether to surround the pattern with `\\b`.
+
+        Returns:
+            re.Pattern: Compiled regex object matching any of `forms`, trying longer forms first.
         """
-        return re.compile("|".join(sorted(map(re.escape, {self.singular(), # type: ignore
-                                                          self.plural()}), reverse=True)),
-                          flags=re.I)
+        pattern = "|".join(sorted(map(re.escape, forms), reverse=True))
+        if word_boundaries:
+            pattern = rf"\b(?:{pattern})\b"
+        return re.compile(pattern, flags=re.I)
 
     def __repr__(self) -> str:
         """Return `repr(self)`.
@@ -288,20 +711,39 @@ class Term:
             str: `target`, but encased according to the patterns applied on `self.term`.
         """
 
-        # Split off 's
-        suffix = ""
-        if target.endswith("'s"):
-            target = target[:-2]
-            suffix = "'s"
+        if self._casing is None:
+            self._casing = Term._casing_plan(self.term)
+        return self._reapply_whitespace(Term._apply_casing(self.term, target, self._casing))
 
-        # Special case for 'I'
-        if self.term == "I" or target == "I":
-            return self._reapply_whitespace(target + suffix)
+    @staticmethod
+    def _casing_plan(term: str) -> Tuple[Callable[[str], str], ...]:
+        """Get the casing transformation of each word in `term`, used by `_encase()`.
+
+        Args:
+            term (str): The stripped word or collocation of which the casing is applied.
+
+        Returns:
+            Tuple[Callable[[str], str], ...]: One casing transformation per word in `term`.
+                The last transformation applies to all remaining words.
+        """
+        # If there are no words in term, there is nothing to apply
+        if not term.strip(Term._word_separators):
+            return ()
+
+        # Fast path for the common lowercase terms, which share one transformation for all words
+        if not Term._uppercase_regex.search(term):
+            return Term._lowercase_plan
+
+        # Fast path for single words, which are the whole term
+        if any(separator in term for separator in Term._word_separators):
+            words = Term._word_regex.findall(term)
+        else:
+            words = [term]
 
         # Get list of lambda functions that correspond to the
         # casing formats for `original`.
         transformations: List[Callable[[str], str]] = []
-        for word in Term._word_regex.findall(self.term):
+        for word in words:
             for casing_format in Term._casing_formats.values():
                 if casing_format["regex"].match(word): # type: ignore
                     transformations.append(casing_format["transformation"]) # type: ignore
@@ -309,10 +751,39 @@ class Term:
             else:
                 # If no casing regexes matches
                 transformations.append(lambda word: word)
+        return tuple(transformations)
+
+    @staticmethod
+    def _apply_casing(term: str, target: str, transformations: Tuple[Callable[[str], str], ...]) -> str:
+        """Apply casing from `term` string onto `target` string, see `_encase()`.
+
+        Args:
+            term (str): The stripped word or collocation of which the casing is applied.
+            target (str): The word or collocation on which to apply the casing of `term`.
+            transformations (Tuple[Callable[[str], str], ...]): The casing plan of `term`,
+                see `_casing_plan()`.
+
+        Returns:
+            str: `target`, but encased according to the patterns applied on `term`.
+        """
+        # Split off 's
+        suffix = ""
+        if target.endswith("'s"):
+            target = target[:-2]
+            suffix = "'s"
+
+        # Special case for 'I'
+        if term == "I" or target == "I":
+            return target + suffix
 
         # If no words found in term, just return target
         if not transformations:
-            return self._reapply_whitespace(target + suffix)
+            return target + suffix
+
+        if len(transformations) == 1:
+            transformation = transformations[0]
+            return Term._word_regex.sub(lambda match_obj: transformation(match_obj.group()),
+                                        target) + suffix
 
         # Generator that gets next transformation until there is
         # just one transformation left, after which it will
@@ -323,7 +794,7 @@ class Term:
         phrase = Term._word_regex.sub(
             lambda match_obj: next(transformations_gen)(match_obj.group()),
             target)
-        return self._reapply_whitespace(phrase + suffix)
+        return phrase + suffix
 
     def _reapply_whitespace(self, phrase: str) -> str:
         """Reapply whitespace formats before, after and within a phrase.
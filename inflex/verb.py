@@ -2,11 +2,12 @@
 # -*- coding: utf-8 -*-
 
 import re
-from typing import Optional, Pattern, Tuple
+from typing import Callable, Dict, Optional, Pattern, Tuple
 
 from inflex.syllable import Syllable
-from inflex.term import Term
+from inflex.term import Term, memoize_form, memoize_pattern
 from inflex.verb_core import (
+    VERSION,
     is_plural,
     is_singular,
     is_past,
@@ -17,17 +18,25 @@ from inflex.verb_core import (
     convert_to_past,
     convert_to_pres_part,
     convert_to_past_part,
+    convert_to_paradigm,
     plural_of,
     singular_of,
     past_of,
     pres_part_of,
     past_part_of,
 )
+from inflex.paradigm_core import verb_core_version, verb_paradigms
+
+# The precomputed forms are only valid for the verb_core from which they were generated
+if verb_core_version != VERSION:
+    verb_paradigms.clear()
 
 
 class Verb(Term):
     """Class for detecting and converting to verb forms."""
 
+    __slots__ = ("_paradigm",)
+
     _prefixes = (
         'counter',
         'trans',
@@ -95,7 +104,7 @@ class Verb(Term):
     # Override default methods from Term #
     # ---------------------------------- #
 
-    def __init__(self, term: str): # pylint: disable=W0235
+    def __init__(self, term: str):
         """Creates a Verb instance with detection and conversion methods.
 
         Examples:
@@ -121,6 +130,15 @@ class Verb(Term):
         """
         super().__init__(term)
 
+        # The precomputed singular, plural, past, present participle and past participle
+        # forms of `term`, if it is a known verb
+        self._paradigm: Optional[Tuple[str, str, str, str, str]] = verb_paradigms.get(term)
+
+    def _reset(self) -> None:
+        """Discard everything computed for the previous term, including the precomputed forms."""
+        super()._reset()
+        self._paradigm = None
+
     def is_verb(self) -> bool:
         """Returns `True` only if this verb is instantiated via `Verb(term)`.
 
@@ -151,7 +169,10 @@ class Verb(Term):
 
         return is_plural(term)
 
-    def singular(self, person: int = 0) -> str: # pylint: disable=R0911
+    # Verbs are not converted via the lowercase term, as prefixes and stress lookups are
+    # case-sensitive, e.g. Verb("abid").past() is "abided" but Verb("Abid").past() is "Abidded"
+    @memoize_form(canonical=False)
+    def singular(self, person: int = 0) -> str:
         """Returns this verb's singular form.
 
         Args:
@@ -161,87 +182,130 @@ class Verb(Term):
         Returns:
             str: This verb's singular form.
         """
+        if person == 0 and self._paradigm is not None:
+            return self._paradigm[0]
         self._check_valid_person(person)
+        return Verb._singular(self.term, person, self._encase, self._reapply_whitespace)
 
+    @memoize_form(canonical=False)
+    def plural(self, person: int = 0) -> str:
+        """Returns this verb's plural form.
+
+        Args:
+            person (Optional[int], optional): Represents the grammatical "person" (1st, 2nd, 3rd).
+                Defaults to 0.
+
+        Returns:
+            str: This verb's plural form.
+        """
+        if person == 0 and self._paradigm is not None:
+            return self._paradigm[1]
+        self._check_valid_person(person)
+        return Verb._plural(self.term, self._encase, self._reapply_whitespace)
+
+    @staticmethod
+    def _singular(term: str, # pylint: disable=R0911
+                  person: int,
+                  encase: Callable[[str], str],
+                  reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to singular form, see `singular()`.
+
+        Args:
+            term (str): The stripped input word or collocation.
+            person (int): Represents the grammatical "person" (1st, 2nd, 3rd).
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
+
+        Returns:
+            str: The singular form of `term`.
+        """
+        original = term
         # "To be" is special
-        if self.term.lower() in ["is", "am", "are"]:
+        if term.lower() in ["is", "am", "are"]:
             if person == 0:
                 # "are" is already singular, e.g. "they are my friend",
                 # but the expected result is "is", so we opt for that.
-                if self.term.lower() == "are":
-                    return self._encase("is")
-                return self._reapply_whitespace(self.term)
-            if person == 2 or not self.is_singular():
-                return self._encase("are")
+                if term.lower() == "are":
+                    return encase("is")
+                return reapply_whitespace(term)
+            if person == 2 or not is_singular(Verb.get_subterm(term)[0]):
+                return encase("are")
             if person == 1:
-                return self._encase("am")
-            return self._encase("is")
+                return encase("am")
+            return encase("is")
 
         # Third person uses the "notational" singular inflection
         if person in (3, 0):
             # Get first word, last section of that word (if "-" in the word)
-            term, form = Verb.get_subterm(self.term)
+            term, form = Verb.get_subterm(term)
 
             # If this term is in the list of known cases
             # TODO: # pylint: disable=W0511
             # - This partially overlaps with `known = convert_to_singular(term)` from below
             if term.lower() in singular_of:
-                return self._encase(form.format(singular_of[term.lower()]))
+                return encase(form.format(singular_of[term.lower()]))
 
             # Try splitting off a prefix
             prefix, subterm = Verb.split_prefix(term)
             if prefix:
                 known = convert_to_singular(subterm)
                 if known:
-                    return self._encase(form.format(prefix + known))
+                    return encase(form.format(prefix + known))
 
             # Otherwise convert the first word, last section
             known = convert_to_singular(term)
             if known:
-                return self._encase(form.format(known))
+                return encase(form.format(known))
 
             # If all else fails, return the term
-            return self._reapply_whitespace(self.term)
+            return reapply_whitespace(original)
 
         # First and second person always use the uninflected (i.e. "notational plural" form)
-        return self.plural()
+        return Verb._plural(term, encase, reapply_whitespace)
 
-    def plural(self, person: int = 0) -> str:
-        """Returns this verb's plural form.
+    @staticmethod
+    def _plural(term: str,
+                encase: Callable[[str], str],
+                reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to plural form, see `plural()`.
 
         Args:
-            person (Optional[int], optional): Represents the grammatical "person" (1st, 2nd, 3rd).
-                Defaults to 0.
+            term (str): The stripped input word or collocation.
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
 
         Returns:
-            str: This verb's plural form.
+            str: The plural form of `term`.
         """
-        self._check_valid_person(person)
-
+        original = term
         known = None
         # Get first word, last section of that word (if "-" in the word)
-        term, form = Verb.get_subterm(self.term)
+        term, form = Verb.get_subterm(term)
 
         # If this term is in the list of known cases
         # TODO: # pylint: disable=W0511
         # - This partially overlaps with `known = convert_to_singular(term)` from below
         if term.lower() in plural_of:
-            return self._encase(form.format(plural_of[term.lower()]))
+            return encase(form.format(plural_of[term.lower()]))
 
         # Try splitting off a prefix
         prefix, subterm = Verb.split_prefix(term)
         if prefix:
             known = convert_to_plural(subterm)
             if known:
-                return self._encase(form.format(prefix + known))
+                return encase(form.format(prefix + known))
 
         # Otherwise convert the first word, last section
         known = convert_to_plural(term)
         if known:
-            return self._encase(form.format(known))
+            return encase(form.format(known))
 
         # If all else fails, return the term
-        return self._reapply_whitespace(self.term)
+        return reapply_whitespace(original)
 
     def lemma(self) -> str:
         """Return this object's lemma form.
@@ -255,9 +319,14 @@ class Verb(Term):
         """
         return self.plural()
 
-    def as_regex(self) -> Pattern[str]:
+    @memoize_pattern
+    def as_regex(self, word_boundaries: bool = False) -> Pattern[str]:
         """Returns a `re.Pattern` which case-insensitively matches any inflected form of the verb.
 
+        Args:
+            word_boundaries (bool, optional): Only match whole words, by surrounding the
+                pattern with `\\b`. Defaults to False.
+
         Returns:
             re.Pattern: Compiled regex object which case-insensitively matches any inflected form
                 of the verb.
@@ -266,12 +335,8 @@ class Verb(Term):
             >>> Verb('eat').as_regex()
             re.compile('eats|eating|eaten|eat|ate', re.IGNORECASE)
         """
-        return re.compile("|".join(sorted(map(re.escape, {self.singular(), # type: ignore
-                                                          self.plural(),
-                                                          self.past(),
-                                                          self.past_part(),
-                                                          self.pres_part()
-                                                          }), reverse=True)), flags=re.I)
+        return Term._compile_forms({self.singular(), self.plural(), self.past(), # pylint: disable=W0212
+                                    self.past_part(), self.pres_part()}, word_boundaries)
 
     # ---------------------------- #
     # Methods exclusively for Verb #
@@ -303,21 +368,37 @@ class Verb(Term):
         last_word = term.replace("-", " ").split()[-1]
         _, last_word = Verb.split_prefix(last_word)
 
-        # Get a set of known syllable counts for last_word
-        syllable_count = Syllable.count_syllables(last_word)
+        # Duplicate last letter if the word is one syllable or ends with stress,
+        # AND the word ends in (roughly) CVC
+        if Verb._stem_stressed(last_word) and Verb._stem_double_regex.search(term):
+            return term + term[-1]
 
-        # Duplicate last letter if:
-        if (
+        return term
+
+    @staticmethod
+    def _stem_stressed(word: str) -> bool:
+        """Return whether the syllables of `word` allow doubling its final consonant.
+
+        Args:
+            word (str): The input word, without prefix.
+
+        Returns:
+            bool: True if `word` is one syllable, or if its last syllable is stressed.
+        """
+        flags = Syllable.get_flags(word)
+        if flags is not None:
+            return bool(flags & (Syllable.ONE_SYLLABLE | Syllable.ENDS_WITH_STRESS))
+
+        # Get a set of known syllable counts for word
+        syllable_count = Syllable.count_syllables(word)
+        return (
             # The word is certainly just one syllable, or
             1 in syllable_count
             # The word is just one syllable, or
-            or (not syllable_count and Syllable.guess_if_one_syllable(last_word))
+            or (not syllable_count and Syllable.guess_if_one_syllable(word))
             # The last syllable is stressed
-            or (Syllable.ends_with_stress(last_word))
-        ) and Verb._stem_double_regex.search(term):  # AND the word ends in (roughly) CVC
-            return term + term[-1]
-
-        return term
+            or (Syllable.ends_with_stress(word))
+        )
 
     @staticmethod
     def split_prefix(term: str) -> Tuple[str, str]:
@@ -384,6 +465,7 @@ class Verb(Term):
             pass
         return term, form
 
+    @memoize_form(canonical=False)
     def past(self) -> str:
         """Returns this Verb's past form.
 
@@ -395,63 +477,121 @@ class Verb(Term):
         Returns:
             str: This Verb's past form.
         """
+        if self._paradigm is not None:
+            return self._paradigm[2]
+        return Verb._past(self.term, self._encase, self._reapply_whitespace)
+
+    @memoize_form(canonical=False)
+    def pres_part(self) -> str:
+        """Returns this Verb's present participle form.
+
+        Examples:
+            >>> verb = Verb("fly")
+            >>> verb.pres_part()
+            "flying"
+
+        Returns:
+            str: This Verb's present participle form.
+        """
+        if self._paradigm is not None:
+            return self._paradigm[3]
+        return Verb._pres_part(self.term, self._encase, self._reapply_whitespace)
+
+    @memoize_form(canonical=False)
+    def past_part(self) -> str:
+        """Returns this Verb's past participle form.
+
+        Examples:
+            >>> verb = Verb("fly")
+            >>> verb.pres_part()
+            "flown"
+
+        Returns:
+            str: This Verb's past participle form.
+        """
+        if self._paradigm is not None:
+            return self._paradigm[4]
+        return Verb._past_part(self.term, self._encase, self._reapply_whitespace)
+
+    @staticmethod
+    def _past(term: str,
+              encase: Callable[[str], str],
+              reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to past form, see `past()`.
+
+        Args:
+            term (str): The stripped input word or collocation.
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
+
+        Returns:
+            str: The past form of `term`.
+        """
+        original = term
         known = None
         # "To be" is special
-        if self.term.lower() in ["is", "am"]:
-            return self._encase("was")
-        if self.term.lower() == "are":
-            return self._encase("were")
+        if term.lower() in ["is", "am"]:
+            return encase("was")
+        if term.lower() == "are":
+            return encase("were")
 
         # Get first word, last section of that word (if "-" in the word)
-        term, form = Verb.get_subterm(self.term)
+        term, form = Verb.get_subterm(term)
 
         # If this term is in the list of known cases
         if term.lower() in past_of:
-            return self._encase(form.format(past_of[term.lower()]))
+            return encase(form.format(past_of[term.lower()]))
 
         # Try splitting off a prefix
         prefix, subterm = Verb.split_prefix(term)
         if prefix:
             known = convert_to_past(subterm)
             if known:
-                return self._encase(form.format(prefix + known))
+                return encase(form.format(prefix + known))
 
         # Convert the root of the term
-        root, form = Verb.get_subterm(self.plural())
+        root, form = Verb.get_subterm(Verb._plural(original, encase, reapply_whitespace))
         known = convert_to_past(root)
         if known:
-            return self._encase(form.format(known))
+            return encase(form.format(known))
 
         # Otherwise use the standard pattern on the root
         known = Verb._stem(root) + "ed"
 
-        return self._encase(form.format(known))
+        return encase(form.format(known))
 
-    def pres_part(self) -> str:
-        """Returns this Verb's present participle form.
+    @staticmethod
+    def _pres_part(term: str,
+                   encase: Callable[[str], str],
+                   reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to present participle form, see `pres_part()`.
 
-        Examples:
-            >>> verb = Verb("fly")
-            >>> verb.pres_part()
-            "flying"
+        Args:
+            term (str): The stripped input word or collocation.
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
 
         Returns:
-            str: This Verb's present participle form.
+            str: The present participle form of `term`.
         """
         known = None
         # If this term is in the list of known cases
-        if self.term.lower() in pres_part_of:
-            return self._encase(pres_part_of[self.term.lower()])
+        if term.lower() in pres_part_of:
+            return encase(pres_part_of[term.lower()])
 
         # Get first word, last section of that word (if "-" in the word)
-        term, form = Verb.get_subterm(self.plural())
+        term, form = Verb.get_subterm(Verb._plural(term, encase, reapply_whitespace))
 
         # Try splitting off a prefix
         prefix, subterm = Verb.split_prefix(term)
         if prefix:
             known = convert_to_pres_part(subterm)
             if known:
-                return self._encase(form.format(prefix + known))
+                return encase(form.format(prefix + known))
 
         # Convert the full (sub)term
         known = convert_to_pres_part(term)
@@ -460,33 +600,38 @@ class Verb(Term):
         if known is None:
             known = Verb._stem(term) + "ing"
 
-        return self._encase(form.format(known))
+        return encase(form.format(known))
 
-    def past_part(self) -> str:
-        """Returns this Verb's past participle form.
+    @staticmethod
+    def _past_part(term: str,
+                   encase: Callable[[str], str],
+                   reapply_whitespace: Callable[[str], str]) -> str:
+        """Convert `term` to past participle form, see `past_part()`.
 
-        Examples:
-            >>> verb = Verb("fly")
-            >>> verb.pres_part()
-            "flown"
+        Args:
+            term (str): The stripped input word or collocation.
+            encase (Callable[[str], str]): Applies the casing and whitespace of the input
+                onto the output, e.g. `Term._encase`.
+            reapply_whitespace (Callable[[str], str]): Applies the whitespace of the input
+                onto the output, e.g. `Term._reapply_whitespace`.
 
         Returns:
-            str: This Verb's past participle form.
+            str: The past participle form of `term`.
         """
         known = None
         # If this term is in the list of known cases
-        if self.term.lower() in past_part_of:
-            return self._encase(past_part_of[self.term.lower()])
+        if term.lower() in past_part_of:
+            return encase(past_part_of[term.lower()])
 
         # Get first word, last section of that word (if "-" in the word)
-        term, form = Verb.get_subterm(self.plural())
+        term, form = Verb.get_subterm(Verb._plural(term, encase, reapply_whitespace))
 
         # Try splitting off a prefix
         prefix, subterm = Verb.split_prefix(term)
         if prefix:
             known = convert_to_past_part(subterm)
             if known:
-                return self._encase(form.format(prefix + known))
+                return encase(form.format(prefix + known))
 
         # Convert the full (sub)term
         known = convert_to_past_part(term)
@@ -495,7 +640,96 @@ class Verb(Term):
         if known is None:
             known = Verb._stem(term) + "ed"
 
-        return self._encase(form.format(known))
+        return encase(form.format(known))
+
+    def paradigm(self) -> Dict[str, str]:
+        """Returns this Verb's singular, plural, past, present participle and past participle forms.
+
+        Examples:
+            >>> verb = Verb("fly")
+            >>> verb.paradigm()
+            {'singular': 'flies', 'plural': 'fly', 'past': 'flew', 'pres_part': 'flying', 'past_part': 'flown'}
+
+        Note:
+            The output is identical to calling `singular()`, `plural()`, `past()`, `pres_part()`
+            and `past_part()`, but the term is only analysed once, rather than once per form.
+
+        Returns:
+            Dict[str, str]: Mapping of "singular", "plural", "past", "pres_part" and "past_part"
+                to the corresponding form of this Verb.
+        """
+        if self._paradigm is not None:
+            return dict(zip(("singular", "plural", "past", "pres_part", "past_part"), self._paradigm))
+
+        # "To be" is special
+        if self.term.lower() in ["is", "am", "are"]:
+            return {
+                "singular": self.singular(),
+                "plural": self.plural(),
+                "past": self.past(),
+                "pres_part": self.pres_part(),
+                "past_part": self.past_part(),
+            }
+
+        # Conversions of the (sub)terms, such that each form of each word is computed at most once
+        converted: Dict[str, Dict[str, Optional[str]]] = {}
+
+        def convert(word: str, names: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+            forms = converted.setdefault(word, {})
+            missing = tuple(name for name in names if name not in forms)
+            if missing:
+                forms.update(convert_to_paradigm(word, missing))
+            return forms
+
+        # Get first word, last section of that word (if "-" in the word)
+        term, form = Verb.get_subterm(self.term)
+        lower = term.lower()
+        prefix, subterm = Verb.split_prefix(term)
+
+        paradigm: Dict[str, str] = {}
+        # Mirrors `singular()` and `plural()`
+        for name, known in (("plural", plural_of), ("singular", singular_of)):
+            if lower in known:
+                paradigm[name] = self._encase(form.format(known[lower]))
+            elif prefix and convert(subterm, (name,))[name]:
+                paradigm[name] = self._encase(form.format(prefix + convert(subterm, (name,))[name])) # type: ignore
+            elif convert(term, (name,))[name]:
+                paradigm[name] = self._encase(form.format(convert(term, (name,))[name]))
+            else:
+                paradigm[name] = self._reapply_whitespace(self.term)
+
+        # Mirrors the known cases in `past()`, `pres_part()` and `past_part()`
+        if lower in past_of:
+            paradigm["past"] = self._encase(form.format(past_of[lower]))
+        elif prefix and convert(subterm, ("past",))["past"]:
+            paradigm["past"] = self._encase(form.format(prefix + convert(subterm, ("past",))["past"])) # type: ignore
+        for name, known in (("pres_part", pres_part_of), ("past_part", past_part_of)):
+            if self.term.lower() in known:
+                paradigm[name] = self._encase(known[self.term.lower()])
+
+        # The remaining forms are derived from the first word, last section of the plural
+        root, root_form = Verb.get_subterm(paradigm["plural"])
+        root_prefix, root_subterm = Verb.split_prefix(root)
+        if root_prefix:
+            names = tuple(name for name in ("pres_part", "past_part") if name not in paradigm)
+            for name, known in convert(root_subterm, names).items():
+                if name in names and known:
+                    paradigm[name] = self._encase(root_form.format(root_prefix + known))
+
+        names = tuple(name for name in ("past", "pres_part", "past_part") if name not in paradigm)
+        if names:
+            stem = None
+            for name, known in convert(root, names).items():
+                if name not in names:
+                    continue
+                # Otherwise use the standard pattern on the root
+                if (name == "past" and not known) or known is None:
+                    if stem is None:
+                        stem = Verb._stem(root)
+                    known = stem + ("ing" if name == "pres_part" else "ed")
+                paradigm[name] = self._encase(root_form.format(known))
+
+        return {name: paradigm[name] for name in ("singular", "plural", "past", "pres_part", "past_part")}
 
     def is_past(self) -> bool:
         """Detect whether this Verb is in past form.
@@ -6,9 +6,11 @@
 ## Contains no user-servicable parts!!! ##
 ##########################################
 
-import re
+from inflex.cache import memoize
+from inflex.lazy_regex import lazy_compile
+from inflex.suffix_buckets import SuffixBuckets
 
-VERSION = 20210606.145933
+VERSION = 20261018.140505
 
 plural_of = {
     "abides": "abide",
@@ -3102,7 +3104,7 @@ past_part_of = {
     "wrung": "wrung"
 }
 
-plural_convert_rule_regex = re.compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)breeds|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)sticks|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)allows|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shuts|((?:.{2,})?)spins|((?:.{2,})?)takes|((?:.{2,})?)tells|((?:.{2,})?)tries|((?:.{2,})?)winds|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bids|((?:.{2,})?)buys|((?:.{2,})?)cuts|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)adds|((?:.{2,})?)fits|((?:.{2,})?)uses|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)zzes|(.+[aeiou])zzes|(.+)n't|(.+)ics|(.+[cs])hes|(.+)oes|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+[aeiou])ys|(.+)is|(.+[au])es|(.+[^b])is|(.+)ys|(.+[^e])es|(.+[^s])s)$")
+plural_convert_rule_regex = lazy_compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)breeds|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)sticks|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)allows|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shuts|((?:.{2,})?)spins|((?:.{2,})?)takes|((?:.{2,})?)tells|((?:.{2,})?)tries|((?:.{2,})?)winds|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bids|((?:.{2,})?)buys|((?:.{2,})?)cuts|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)adds|((?:.{2,})?)fits|((?:.{2,})?)uses|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)zzes|(.+[aeiou])zzes|(.+)n't|(.+)ics|(.+[cs])hes|(.+)oes|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+[aeiou])ys|(.+)is|(.+[au])es|(.+[^b])is|(.+)ys|(.+[^e])es|(.+[^s])s)$")
 
 plural_convert_outputs = [
     "consider",
@@ -3210,7 +3212,63 @@ plural_convert_outputs = [
     "",
 ]
 
-singular_convert_rule_regex = re.compile(r"^(?:((?:.{2,})?)consider|((?:.{2,})?)believe|((?:.{2,})?)include|((?:.{2,})?)freeze|((?:.{2,})?)spread|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)alight|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)breed|((?:.{2,})?)input|((?:.{2,})?)light|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)teach|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)weave|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)offer|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)bear|((?:.{2,})?)bind|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)wind|((?:.{2,})?)call|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)work|(.+)ceps|(.+)trix|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)n't|(.+)ieu|(.+)eau|(.+)ic|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)ee|(.+)ye|(.+)ie|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e|(.+[^s]))$")
+plural_convert_buckets = SuffixBuckets(plural_convert_rule_regex, {
+    "": (),
+    "ads": (4, 37, 47, 102),
+    "ars": (9, 15, 34, 42, 102),
+    "aus": (81, 102),
+    "aws": (38, 102),
+    "ays": (60, 67, 69, 96, 100, 102),
+    "cks": (21, 102),
+    "dds": (75, 102),
+    "des": (2, 43, 48, 98, 101, 102),
+    "eds": (12, 39, 73, 102),
+    "ees": (70, 92, 98, 101, 102),
+    "ens": (59, 102),
+    "eps": (18, 79, 102),
+    "ers": (0, 27, 95, 102),
+    "es": (98, 101, 102),
+    "ets": (71, 74, 102),
+    "eus": (80, 102),
+    "ews": (72, 102),
+    "hes": (7, 10, 87, 98, 101, 102),
+    "hts": (8, 14, 102),
+    "ics": (86, 102),
+    "ids": (63, 102),
+    "ies": (55, 94, 98, 101, 102),
+    "ins": (52, 102),
+    "is": (97, 99, 102),
+    "its": (20, 44, 76, 102),
+    "kes": (5, 46, 53, 98, 101, 102),
+    "lls": (29, 30, 31, 49, 54, 57, 102),
+    "lts": (58, 102),
+    "n't": (85,),
+    "nds": (35, 45, 50, 56, 102),
+    "nes": (16, 98, 101, 102),
+    "ngs": (6, 19, 41, 102),
+    "nks": (22, 102),
+    "oes": (88, 98, 101, 102),
+    "ots": (17, 102),
+    "ows": (23, 26, 40, 66, 102),
+    "rks": (62, 102),
+    "rns": (61, 102),
+    "rts": (32, 102),
+    "s": (102,),
+    "ses": (77, 82, 98, 101, 102),
+    "sts": (36, 102),
+    "tes": (11, 25, 98, 101, 102),
+    "ues": (91, 98, 101, 102),
+    "uns": (68, 102),
+    "uts": (13, 51, 65, 102),
+    "uys": (64, 96, 100, 102),
+    "ves": (1, 24, 28, 98, 101, 102),
+    "xes": (33, 78, 89, 98, 101, 102),
+    "yes": (93, 98, 101, 102),
+    "ys": (96, 100, 102),
+    "zes": (3, 83, 84, 90, 98, 101, 102),
+})
+
+singular_convert_rule_regex = lazy_compile(r"^(?:((?:.{2,})?)consider|((?:.{2,})?)believe|((?:.{2,})?)include|((?:.{2,})?)freeze|((?:.{2,})?)spread|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)alight|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)breed|((?:.{2,})?)input|((?:.{2,})?)light|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)teach|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)weave|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)offer|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)bear|((?:.{2,})?)bind|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)wind|((?:.{2,})?)call|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)work|(.+)ceps|(.+)trix|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)n't|(.+)ieu|(.+)eau|(.+)ic|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)ee|(.+)ye|(.+)ie|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e|(.+[^s]))$")
 
 singular_convert_outputs = [
     "considers",
@@ -3319,7 +3377,95 @@ singular_convert_outputs = [
     "s",
 ]
 
-past_convert_rule_regex = re.compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)n't|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
+singular_convert_buckets = SuffixBuckets(singular_convert_rule_regex, {
+    "": (103,),
+    "ach": (21, 94, 103),
+    "add": (76, 103),
+    "ake": (45, 52, 99, 102, 103),
+    "all": (55, 103),
+    "ang": (40, 103),
+    "art": (32, 103),
+    "ast": (35, 103),
+    "ate": (10, 99, 102, 103),
+    "ave": (24, 99, 102, 103),
+    "bid": (63, 103),
+    "buy": (64, 93, 101, 103),
+    "cut": (65, 103),
+    "der": (0, 92, 103),
+    "e": (99, 102, 103),
+    "ead": (4, 46, 103),
+    "ear": (8, 14, 33, 41, 103),
+    "eau": (81, 103),
+    "ee": (89, 99, 102, 103),
+    "eed": (11, 38, 103),
+    "eep": (17, 103),
+    "ell": (29, 30, 48, 53, 103),
+    "elt": (56, 103),
+    "end": (44, 49, 103),
+    "eps": (61, 103),
+    "er": (92, 103),
+    "eve": (1, 99, 102, 103),
+    "eze": (3, 87, 99, 102, 103),
+    "fer": (27, 92, 103),
+    "fit": (77, 103),
+    "ght": (7, 13, 103),
+    "h": (94, 103),
+    "hut": (50, 103),
+    "i": (98, 100, 103),
+    "ic": (82, 103),
+    "ick": (20, 103),
+    "ide": (42, 47, 99, 102, 103),
+    "ie": (91, 99, 102, 103),
+    "ieu": (80, 103),
+    "ike": (5, 99, 102, 103),
+    "ill": (31, 103),
+    "ind": (34, 54, 103),
+    "ine": (15, 99, 102, 103),
+    "ing": (6, 18, 103),
+    "ink": (22, 103),
+    "ite": (25, 99, 102, 103),
+    "lad": (36, 103),
+    "lay": (58, 93, 101, 103),
+    "lit": (19, 103),
+    "low": (26, 103),
+    "mow": (66, 103),
+    "n't": (79, 103),
+    "nit": (43, 103),
+    "nx": (83, 95, 103),
+    "oe": (84, 99, 102, 103),
+    "oot": (16, 103),
+    "ork": (60, 103),
+    "pay": (67, 93, 101, 103),
+    "pen": (57, 103),
+    "pin": (51, 103),
+    "put": (12, 103),
+    "raw": (37, 103),
+    "rix": (62, 95, 103),
+    "row": (23, 39, 103),
+    "run": (68, 103),
+    "rve": (28, 99, 102, 103),
+    "say": (69, 93, 101, 103),
+    "see": (70, 89, 99, 102, 103),
+    "set": (71, 103),
+    "sew": (72, 103),
+    "ss": (85, 103),
+    "the": (9, 99, 102, 103),
+    "try": (73, 93, 101, 103),
+    "ude": (2, 99, 102, 103),
+    "ue": (88, 99, 102, 103),
+    "urn": (59, 103),
+    "use": (78, 99, 102, 103),
+    "wed": (74, 103),
+    "wet": (75, 103),
+    "x": (95, 103),
+    "y": (93, 101, 103),
+    "ye": (90, 99, 102, 103),
+    "z": (96, 97, 103),
+    "ze": (87, 99, 102, 103),
+    "zz": (86, 96, 97, 103),
+})
+
+past_convert_rule_regex = lazy_compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)n't|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
 
 past_convert_outputs = [
     "considered",
@@ -3527,7 +3673,144 @@ past_convert_outputs = [
     "ed",
 ]
 
-pres_part_convert_rule_regex = re.compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
+past_convert_buckets = SuffixBuckets(past_convert_rule_regex, {
+    "": (),
+    "ach": (75, 194),
+    "add": (160,),
+    "ads": (5, 49, 61),
+    "ake": (111, 125, 199, 202),
+    "all": (131,),
+    "ang": (106,),
+    "ars": (10, 19, 45, 54),
+    "art": (93,),
+    "ast": (100,),
+    "ate": (37, 199, 202),
+    "aus": (142,),
+    "ave": (80, 199, 202),
+    "aws": (50,),
+    "ays": (88, 113, 117, 177, 190),
+    "bid": (147,),
+    "buy": (148, 193, 201),
+    "cks": (26,),
+    "cut": (149,),
+    "dds": (130,),
+    "der": (2, 192),
+    "des": (3, 55, 62, 187, 191),
+    "e": (199, 202),
+    "ead": (25, 114),
+    "ear": (35, 65, 96, 107),
+    "eau": (168,),
+    "eds": (15, 51, 127),
+    "ee": (185, 199, 202),
+    "eed": (47, 104),
+    "eep": (69,),
+    "ees": (118, 172, 187, 191),
+    "ell": (90, 91, 119, 126),
+    "elt": (133,),
+    "end": (110, 120),
+    "ens": (87,),
+    "eps": (22, 140),
+    "er": (192,),
+    "ers": (0, 38, 175),
+    "es": (187, 191),
+    "ets": (121, 128),
+    "eus": (141,),
+    "eve": (11, 199, 202),
+    "ews": (122,),
+    "eze": (16, 182, 199, 202),
+    "fer": (86, 192),
+    "fit": (161,),
+    "ght": (33, 59),
+    "h": (194,),
+    "hes": (8, 12, 165, 187, 191),
+    "hts": (9, 18),
+    "hut": (123,),
+    "i": (198, 200),
+    "ic": (176,),
+    "ick": (73,),
+    "ics": (164,),
+    "ide": (108, 115, 199, 202),
+    "ids": (97,),
+    "ie": (189, 199, 202),
+    "ies": (79, 174, 187, 191),
+    "ieu": (167,),
+    "ike": (27, 199, 202),
+    "ill": (92,),
+    "ind": (98, 129),
+    "ine": (66, 199, 202),
+    "ing": (28, 70),
+    "ink": (77,),
+    "ins": (71,),
+    "is": (184, 188),
+    "ite": (82, 199, 202),
+    "its": (24, 57, 132),
+    "kes": (6, 60, 74, 187, 191),
+    "lad": (101,),
+    "lay": (135, 193, 201),
+    "lit": (72,),
+    "lls": (40, 41, 42, 63, 76, 84),
+    "low": (83,),
+    "lts": (85,),
+    "mow": (150,),
+    "n't": (163,),
+    "nds": (46, 58, 64, 81),
+    "nes": (20, 187, 191),
+    "ngs": (7, 23, 53),
+    "nit": (109,),
+    "nks": (29,),
+    "nx": (178, 195),
+    "oe": (179, 199, 202),
+    "oes": (166, 187, 191),
+    "oot": (67,),
+    "ork": (138,),
+    "ots": (21,),
+    "ows": (30, 34, 52, 112),
+    "pay": (151, 193, 201),
+    "pen": (134,),
+    "pin": (124,),
+    "put": (56,),
+    "raw": (103,),
+    "rix": (144, 195),
+    "rks": (95,),
+    "rns": (94,),
+    "row": (78, 105),
+    "rts": (43,),
+    "run": (152,),
+    "rve": (89, 199, 202),
+    "say": (153, 193, 201),
+    "see": (154, 185, 199, 202),
+    "ses": (137, 143, 187, 191),
+    "set": (155,),
+    "sew": (156,),
+    "ss": (180,),
+    "sts": (48,),
+    "tes": (13, 32, 187, 191),
+    "the": (36, 199, 202),
+    "try": (157, 193, 201),
+    "ude": (14, 199, 202),
+    "ue": (183, 199, 202),
+    "ues": (171, 187, 191),
+    "uns": (116,),
+    "urn": (136,),
+    "use": (162, 199, 202),
+    "uts": (17, 68, 102),
+    "uys": (99, 177, 190),
+    "ves": (1, 31, 39, 187, 191),
+    "wed": (158,),
+    "wet": (159,),
+    "x": (195,),
+    "xes": (44, 139, 169, 187, 191),
+    "y": (193, 201),
+    "ye": (186, 199, 202),
+    "yes": (173, 187, 191),
+    "ys": (177, 190),
+    "z": (196, 197),
+    "ze": (182, 199, 202),
+    "zes": (4, 145, 146, 170, 187, 191),
+    "zz": (181, 196, 197),
+})
+
+pres_part_convert_rule_regex = lazy_compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
 
 pres_part_convert_outputs = [
     "considering",
@@ -3734,7 +4017,143 @@ pres_part_convert_outputs = [
     "ing",
 ]
 
-past_part_convert_rule_regex = re.compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
+pres_part_convert_buckets = SuffixBuckets(pres_part_convert_rule_regex, {
+    "": (),
+    "ach": (75, 193),
+    "add": (160,),
+    "ads": (5, 49, 61),
+    "ake": (111, 125, 198, 201),
+    "all": (131,),
+    "ang": (106,),
+    "ars": (10, 19, 45, 54),
+    "art": (93,),
+    "ast": (100,),
+    "ate": (37, 198, 201),
+    "aus": (142,),
+    "ave": (80, 198, 201),
+    "aws": (50,),
+    "ays": (88, 113, 117, 176, 189),
+    "bid": (147,),
+    "buy": (148, 192, 200),
+    "cks": (26,),
+    "cut": (149,),
+    "dds": (130,),
+    "der": (2, 191),
+    "des": (3, 55, 62, 186, 190),
+    "e": (198, 201),
+    "ead": (25, 114),
+    "ear": (35, 65, 96, 107),
+    "eau": (167,),
+    "eds": (15, 51, 127),
+    "ee": (184, 198, 201),
+    "eed": (47, 104),
+    "eep": (69,),
+    "ees": (118, 171, 186, 190),
+    "ell": (90, 91, 119, 126),
+    "elt": (133,),
+    "end": (110, 120),
+    "ens": (87,),
+    "eps": (22, 140),
+    "er": (191,),
+    "ers": (0, 38, 174),
+    "es": (186, 190),
+    "ets": (121, 128),
+    "eus": (141,),
+    "eve": (11, 198, 201),
+    "ews": (122,),
+    "eze": (16, 181, 198, 201),
+    "fer": (86, 191),
+    "fit": (161,),
+    "ght": (33, 59),
+    "h": (193,),
+    "hes": (8, 12, 164, 186, 190),
+    "hts": (9, 18),
+    "hut": (123,),
+    "i": (197, 199),
+    "ic": (175,),
+    "ick": (73,),
+    "ics": (163,),
+    "ide": (108, 115, 198, 201),
+    "ids": (97,),
+    "ie": (188, 198, 201),
+    "ies": (79, 173, 186, 190),
+    "ieu": (166,),
+    "ike": (27, 198, 201),
+    "ill": (92,),
+    "ind": (98, 129),
+    "ine": (66, 198, 201),
+    "ing": (28, 70),
+    "ink": (77,),
+    "ins": (71,),
+    "is": (183, 187),
+    "ite": (82, 198, 201),
+    "its": (24, 57, 132),
+    "kes": (6, 60, 74, 186, 190),
+    "lad": (101,),
+    "lay": (135, 192, 200),
+    "lit": (72,),
+    "lls": (40, 41, 42, 63, 76, 84),
+    "low": (83,),
+    "lts": (85,),
+    "mow": (150,),
+    "nds": (46, 58, 64, 81),
+    "nes": (20, 186, 190),
+    "ngs": (7, 23, 53),
+    "nit": (109,),
+    "nks": (29,),
+    "nx": (177, 194),
+    "oe": (178, 198, 201),
+    "oes": (165, 186, 190),
+    "oot": (67,),
+    "ork": (138,),
+    "ots": (21,),
+    "ows": (30, 34, 52, 112),
+    "pay": (151, 192, 200),
+    "pen": (134,),
+    "pin": (124,),
+    "put": (56,),
+    "raw": (103,),
+    "rix": (144, 194),
+    "rks": (95,),
+    "rns": (94,),
+    "row": (78, 105),
+    "rts": (43,),
+    "run": (152,),
+    "rve": (89, 198, 201),
+    "say": (153, 192, 200),
+    "see": (154, 184, 198, 201),
+    "ses": (137, 143, 186, 190),
+    "set": (155,),
+    "sew": (156,),
+    "ss": (179,),
+    "sts": (48,),
+    "tes": (13, 32, 186, 190),
+    "the": (36, 198, 201),
+    "try": (157, 192, 200),
+    "ude": (14, 198, 201),
+    "ue": (182, 198, 201),
+    "ues": (170, 186, 190),
+    "uns": (116,),
+    "urn": (136,),
+    "use": (162, 198, 201),
+    "uts": (17, 68, 102),
+    "uys": (99, 176, 189),
+    "ves": (1, 31, 39, 186, 190),
+    "wed": (158,),
+    "wet": (159,),
+    "x": (194,),
+    "xes": (44, 139, 168, 186, 190),
+    "y": (192, 200),
+    "ye": (185, 198, 201),
+    "yes": (172, 186, 190),
+    "ys": (176, 189),
+    "z": (195, 196),
+    "ze": (181, 198, 201),
+    "zes": (4, 145, 146, 169, 186, 190),
+    "zz": (180, 195, 196),
+})
+
+past_part_convert_rule_regex = lazy_compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
 
 past_part_convert_outputs = [
     "considered",
@@ -3941,15 +4360,758 @@ past_part_convert_outputs = [
     "ed",
 ]
 
-plural_recognize_rule = re.compile(r"^(?:(.+[^s])|(.+)i|(.+)x|(.+)y|(.+)y|(.+[^b])i|(.+[^e])e|(.+[aeiou])y|(.+[aeiou])z|(.+[au])e|(.+[cs])h|(.+)ee|(.+)er|(.+)ic|(.+)oe|(.+)ss|(.+)ue|(.+)ye|(.+)ze|(.+)zz|(.+[aiy])nx|((?:.{2,})?)add|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)fit|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)use|((?:.{2,})?)wed|((?:.{2,})?)wet|(.+)eau|(.+)ieu|(.+)n't|((?:.{2,})?)bear|((?:.{2,})?)bind|((?:.{2,})?)call|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)turn|((?:.{2,})?)wind|((?:.{2,})?)work|(.+)ceps|(.+)trix|((?:.{2,})?)allow|((?:.{2,})?)breed|((?:.{2,})?)input|((?:.{2,})?)light|((?:.{2,})?)offer|((?:.{2,})?)serve|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)split|((?:.{2,})?)start|((?:.{2,})?)stick|((?:.{2,})?)teach|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)weave|((?:.{2,})?)write|((?:.{2,})?)alight|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)freeze|((?:.{2,})?)spread|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)believe|((?:.{2,})?)include|((?:.{2,})?)consider)$")
+past_part_convert_buckets = SuffixBuckets(past_part_convert_rule_regex, {
+    "": (),
+    "ach": (75, 193),
+    "add": (160,),
+    "ads": (5, 49, 61),
+    "ake": (111, 125, 198, 201),
+    "all": (131,),
+    "ang": (106,),
+    "ars": (10, 19, 45, 54),
+    "art": (93,),
+    "ast": (100,),
+    "ate": (37, 198, 201),
+    "aus": (142,),
+    "ave": (80, 198, 201),
+    "aws": (50,),
+    "ays": (88, 113, 117, 176, 189),
+    "bid": (147,),
+    "buy": (148, 192, 200),
+    "cks": (26,),
+    "cut": (149,),
+    "dds": (130,),
+    "der": (2, 191),
+    "des": (3, 55, 62, 186, 190),
+    "e": (198, 201),
+    "ead": (25, 114),
+    "ear": (35, 65, 96, 107),
+    "eau": (167,),
+    "eds": (15, 51, 127),
+    "ee": (184, 198, 201),
+    "eed": (47, 104),
+    "eep": (69,),
+    "ees": (118, 171, 186, 190),
+    "ell": (90, 91, 119, 126),
+    "elt": (133,),
+    "end": (110, 120),
+    "ens": (87,),
+    "eps": (22, 140),
+    "er": (191,),
+    "ers": (0, 38, 174),
+    "es": (186, 190),
+    "ets": (121, 128),
+    "eus": (141,),
+    "eve": (11, 198, 201),
+    "ews": (122,),
+    "eze": (16, 181, 198, 201),
+    "fer": (86, 191),
+    "fit": (161,),
+    "ght": (33, 59),
+    "h": (193,),
+    "hes": (8, 12, 164, 186, 190),
+    "hts": (9, 18),
+    "hut": (123,),
+    "i": (197, 199),
+    "ic": (175,),
+    "ick": (73,),
+    "ics": (163,),
+    "ide": (108, 115, 198, 201),
+    "ids": (97,),
+    "ie": (188, 198, 201),
+    "ies": (79, 173, 186, 190),
+    "ieu": (166,),
+    "ike": (27, 198, 201),
+    "ill": (92,),
+    "ind": (98, 129),
+    "ine": (66, 198, 201),
+    "ing": (28, 70),
+    "ink": (77,),
+    "ins": (71,),
+    "is": (183, 187),
+    "ite": (82, 198, 201),
+    "its": (24, 57, 132),
+    "kes": (6, 60, 74, 186, 190),
+    "lad": (101,),
+    "lay": (135, 192, 200),
+    "lit": (72,),
+    "lls": (40, 41, 42, 63, 76, 84),
+    "low": (83,),
+    "lts": (85,),
+    "mow": (150,),
+    "nds": (46, 58, 64, 81),
+    "nes": (20, 186, 190),
+    "ngs": (7, 23, 53),
+    "nit": (109,),
+    "nks": (29,),
+    "nx": (177, 194),
+    "oe": (178, 198, 201),
+    "oes": (165, 186, 190),
+    "oot": (67,),
+    "ork": (138,),
+    "ots": (21,),
+    "ows": (30, 34, 52, 112),
+    "pay": (151, 192, 200),
+    "pen": (134,),
+    "pin": (124,),
+    "put": (56,),
+    "raw": (103,),
+    "rix": (144, 194),
+    "rks": (95,),
+    "rns": (94,),
+    "row": (78, 105),
+    "rts": (43,),
+    "run": (152,),
+    "rve": (89, 198, 201),
+    "say": (153, 192, 200),
+    "see": (154, 184, 198, 201),
+    "ses": (137, 143, 186, 190),
+    "set": (155,),
+    "sew": (156,),
+    "ss": (179,),
+    "sts": (48,),
+    "tes": (13, 32, 186, 190),
+    "the": (36, 198, 201),
+    "try": (157, 192, 200),
+    "ude": (14, 198, 201),
+    "ue": (182, 198, 201),
+    "ues": (170, 186, 190),
+    "uns": (116,),
+    "urn": (136,),
+    "use": (162, 198, 201),
+    "uts": (17, 68, 102),
+    "uys": (99, 176, 189),
+    "ves": (1, 31, 39, 186, 190),
+    "wed": (158,),
+    "wet": (159,),
+    "x": (194,),
+    "xes": (44, 139, 168, 186, 190),
+    "y": (192, 200),
+    "ye": (185, 198, 201),
+    "yes": (172, 186, 190),
+    "ys": (176, 189),
+    "z": (195, 196),
+    "ze": (181, 198, 201),
+    "zes": (4, 145, 146, 169, 186, 190),
+    "zz": (180, 195, 196),
+})
+
+paradigm_convert_rule_regex = lazy_compile(r"^(?:((?:.{2,})?)considers|((?:.{2,})?)believes|((?:.{2,})?)consider|((?:.{2,})?)includes|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)believe|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)include|((?:.{2,})?)breeds|((?:.{2,})?)freeze|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)splits|((?:.{2,})?)spread|((?:.{2,})?)sticks|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|((?:.{2,})?)alight|((?:.{2,})?)allows|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)starts|(.+)trixes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)breed|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)input|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)light|((?:.{2,})?)makes|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)shuts|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)spins|((?:.{2,})?)split|((?:.{2,})?)stick|((?:.{2,})?)takes|((?:.{2,})?)teach|((?:.{2,})?)tells|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)tries|((?:.{2,})?)weave|((?:.{2,})?)winds|((?:.{2,})?)write|((?:.{2,})?)allow|((?:.{2,})?)calls|((?:.{2,})?)melts|((?:.{2,})?)offer|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)serve|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)start|((?:.{2,})?)turns|((?:.{2,})?)works|((?:.{2,})?)bear|((?:.{2,})?)bids|((?:.{2,})?)bind|((?:.{2,})?)buys|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)cuts|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)weds|((?:.{2,})?)wets|((?:.{2,})?)wind|((?:.{2,})?)adds|((?:.{2,})?)call|((?:.{2,})?)fits|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)turn|((?:.{2,})?)uses|((?:.{2,})?)work|(.+[aiy])nxes|(.+)ceps|(.+)ieus|(.+)eaus|(.+)sses|(.+)trix|(.+)zzes|(.+[aeiou])zzes|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)wed|((?:.{2,})?)wet|((?:.{2,})?)add|((?:.{2,})?)fit|((?:.{2,})?)use|(.+)n't|(.+)ics|(.+[cs])hes|(.+)oes|(.+)ieu|(.+)eau|(.+)xes|(.+)zes|(.+)ues|(.+)ees|(.+)yes|(.+)ies|(.+)ers|(.+)ic|(.+[aeiou])ys|(.+[aiy])nx|(.+)oe|(.+)ss|(.+)zz|(.+)ze|(.+)ue|(.+)is|(.+)ee|(.+)ye|(.+[au])es|(.+[^b])is|(.+)ie|(.+)ys|(.+[^e])es|(.+)er|(.+[aeiou])y|(.+[cs])h|(.+)x|(.+[aeiou])z|(.+)z|(.+)i|(.+[au])e|(.+[^b])i|(.+)y|(.+[^e])e)$")
+
+paradigm_convert_outputs = [
+    ("considered", "considering", "considered"),
+    ("believed", "believing", "believed"),
+    ("considered", "considering", "considered"),
+    ("included", "including", "included"),
+    ("froze", "freezing", "frozen"),
+    ("spread", "spreading", "spread"),
+    ("struck", "striking", "struck"),
+    ("strung", "stringing", "strung"),
+    ("taught", "teaching", "taught"),
+    ("alighted", "alighting", "alighted"),
+    ("appeared", "appearing", "appeared"),
+    ("believed", "believing", "believed"),
+    ("clothed", "clothing", "clothed"),
+    ("created", "creating", "created"),
+    ("included", "including", "included"),
+    ("bred", "breeding", "bred"),
+    ("froze", "freezing", "frozen"),
+    ("input", "inputting", "input"),
+    ("lit", "lighting", "lit"),
+    ("sheared", "shearing", "shorn"),
+    ("shone", "shining", "shone"),
+    ("shot", "shooting", "shot"),
+    ("slept", "sleeping", "slept"),
+    ("slung", "slinging", "slung"),
+    ("split", "splitting", "split"),
+    ("spread", "spreading", "spread"),
+    ("stuck", "sticking", "stuck"),
+    ("struck", "striking", "struck"),
+    ("strung", "stringing", "strung"),
+    ("thought", "thinking", "thought"),
+    ("threw", "throwing", "thrown"),
+    ("wove", "weaving", "woven"),
+    ("wrote", "writing", "written"),
+    ("alighted", "alighting", "alighted"),
+    ("allowed", "allowing", "allowed"),
+    ("appeared", "appearing", "appeared"),
+    ("clothed", "clothing", "clothed"),
+    ("created", "creating", "created"),
+    ("offered", "offering", "offered"),
+    ("served", "serving", "served"),
+    ("smelled", "smelling", "smelled"),
+    ("spelled", "spelling", "spelled"),
+    ("spilled", "spilling", "spilled"),
+    ("started", "starting", "started"),
+    ("trixed", "trixing", "trixed"),
+    ("bore", "bearing", "borne"),
+    ("bound", "binding", "bound"),
+    ("bred", "breeding", "bred"),
+    ("cast", "casting", "cast"),
+    ("clad", "cladding", "clad"),
+    ("drew", "drawing", "drawn"),
+    ("fed", "feeding", "fed"),
+    ("grew", "growing", "grown"),
+    ("hung", "hanging", "hung"),
+    ("heard", "hearing", "heard"),
+    ("hid", "hiding", "hidden"),
+    ("input", "inputting", "input"),
+    ("knitted", "knitting", "knitted"),
+    ("lent", "lending", "lent"),
+    ("lit", "lighting", "lit"),
+    ("made", "making", "made"),
+    ("read", "reading", "read"),
+    ("rode", "riding", "ridden"),
+    ("sold", "selling", "sold"),
+    ("sent", "sending", "sent"),
+    ("sheared", "shearing", "shorn"),
+    ("shone", "shining", "shone"),
+    ("shot", "shooting", "shot"),
+    ("shut", "shutting", "shut"),
+    ("slept", "sleeping", "slept"),
+    ("slung", "slinging", "slung"),
+    ("spun", "spinning", "spun"),
+    ("split", "splitting", "split"),
+    ("stuck", "sticking", "stuck"),
+    ("took", "taking", "taken"),
+    ("taught", "teaching", "taught"),
+    ("told", "telling", "told"),
+    ("thought", "thinking", "thought"),
+    ("threw", "throwing", "thrown"),
+    ("tried", "trying", "tried"),
+    ("wove", "weaving", "woven"),
+    ("wound", "winding", "wound"),
+    ("wrote", "writing", "written"),
+    ("allowed", "allowing", "allowed"),
+    ("called", "calling", "called"),
+    ("melted", "melting", "melted"),
+    ("offered", "offering", "offered"),
+    ("opened", "opening", "opened"),
+    ("played", "playing", "played"),
+    ("served", "serving", "served"),
+    ("smelled", "smelling", "smelled"),
+    ("spelled", "spelling", "spelled"),
+    ("spilled", "spilling", "spilled"),
+    ("started", "starting", "started"),
+    ("turned", "turning", "turned"),
+    ("worked", "working", "worked"),
+    ("bore", "bearing", "borne"),
+    ("bid", "bidding", "bid"),
+    ("bound", "binding", "bound"),
+    ("bought", "buying", "bought"),
+    ("cast", "casting", "cast"),
+    ("clad", "cladding", "clad"),
+    ("cut", "cutting", "cut"),
+    ("drew", "drawing", "drawn"),
+    ("fed", "feeding", "fed"),
+    ("grew", "growing", "grown"),
+    ("hung", "hanging", "hung"),
+    ("heard", "hearing", "heard"),
+    ("hid", "hiding", "hidden"),
+    ("knitted", "knitting", "knitted"),
+    ("lent", "lending", "lent"),
+    ("made", "making", "made"),
+    ("mowed", "mowing", "mown"),
+    ("paid", "paying", "paid"),
+    ("read", "reading", "read"),
+    ("rode", "riding", "ridden"),
+    ("ran", "running", "run"),
+    ("said", "saying", "said"),
+    ("saw", "seeing", "seen"),
+    ("sold", "selling", "sold"),
+    ("sent", "sending", "sent"),
+    ("set", "setting", "set"),
+    ("sewed", "sewing", "sewn"),
+    ("shut", "shutting", "shut"),
+    ("spun", "spinning", "spun"),
+    ("took", "taking", "taken"),
+    ("told", "telling", "told"),
+    ("wed", "wedding", "wed"),
+    ("wet", "wetting", "wetted"),
+    ("wound", "winding", "wound"),
+    ("added", "adding", "added"),
+    ("called", "calling", "called"),
+    ("fitted", "fitting", "fitted"),
+    ("melted", "melting", "melted"),
+    ("opened", "opening", "opened"),
+    ("played", "playing", "played"),
+    ("turned", "turning", "turned"),
+    ("used", "using", "used"),
+    ("worked", "working", "worked"),
+    ("nxed", "nxing", "nxed"),
+    ("cepsed", "cepsing", "cepsed"),
+    ("ieued", "ieuing", "ieued"),
+    ("eaued", "eauing", "eaued"),
+    ("ssed", "ssing", "ssed"),
+    ("trixed", "trixing", "trixed"),
+    ("zzed", "zzing", "zzed"),
+    ("zzed", "zzing", "zzed"),
+    ("bid", "bidding", "bid"),
+    ("bought", "buying", "bought"),
+    ("cut", "cutting", "cut"),
+    ("mowed", "mowing", "mown"),
+    ("paid", "paying", "paid"),
+    ("ran", "running", "run"),
+    ("said", "saying", "said"),
+    ("saw", "seeing", "seen"),
+    ("set", "setting", "set"),
+    ("sewed", "sewing", "sewn"),
+    ("tried", "trying", "tried"),
+    ("wed", "wedding", "wed"),
+    ("wet", "wetting", "wetted"),
+    ("added", "adding", "added"),
+    ("fitted", "fitting", "fitted"),
+    ("used", "using", "used"),
+    ("n't", None, None),
+    ("icked", "icking", "icked"),
+    ("hed", "hing", "hed"),
+    ("oed", "oeing", "oed"),
+    ("ieued", "ieuing", "ieued"),
+    ("eaued", "eauing", "eaued"),
+    ("xed", "xing", "xed"),
+    ("zed", "zing", "zed"),
+    ("ued", "uing", "ued"),
+    ("eed", "eeing", "eed"),
+    ("yed", "yeing", "yed"),
+    ("ied", "ying", "ied"),
+    ("ered", "ering", "ered"),
+    ("icked", "icking", "icked"),
+    ("yed", "ying", "yed"),
+    ("nxed", "nxing", "nxed"),
+    ("oed", "oeing", "oed"),
+    ("ssed", "ssing", "ssed"),
+    ("zzed", "zzing", "zzed"),
+    ("zed", "zing", "zed"),
+    ("ued", "uing", "ued"),
+    ("ied", "iing", "ied"),
+    ("eed", "eeing", "eed"),
+    ("yed", "yeing", "yed"),
+    ("ed", "ing", "ed"),
+    ("ied", "ing", "ied"),
+    ("ied", "ying", "ied"),
+    ("yed", "ying", "yed"),
+    ("ed", "ing", "ed"),
+    ("ered", "ering", "ered"),
+    ("yed", "ying", "yed"),
+    ("hed", "hing", "hed"),
+    ("xed", "xing", "xed"),
+    ("zzed", "zzing", "zzed"),
+    ("zed", "zing", "zed"),
+    ("ied", "iing", "ied"),
+    ("ed", "ing", "ed"),
+    ("ied", "ing", "ied"),
+    ("ied", "ying", "ied"),
+    ("ed", "ing", "ed"),
+]
+
+paradigm_convert_buckets = SuffixBuckets(paradigm_convert_rule_regex, {
+    "": (),
+    "ach": (75, 194),
+    "add": (160,),
+    "ads": (5, 49, 61),
+    "ake": (111, 125, 199, 202),
+    "all": (131,),
+    "ang": (106,),
+    "ars": (10, 19, 45, 54),
+    "art": (93,),
+    "ast": (100,),
+    "ate": (37, 199, 202),
+    "aus": (142,),
+    "ave": (80, 199, 202),
+    "aws": (50,),
+    "ays": (88, 113, 117, 177, 190),
+    "bid": (147,),
+    "buy": (148, 193, 201),
+    "cks": (26,),
+    "cut": (149,),
+    "dds": (130,),
+    "der": (2, 192),
+    "des": (3, 55, 62, 187, 191),
+    "e": (199, 202),
+    "ead": (25, 114),
+    "ear": (35, 65, 96, 107),
+    "eau": (168,),
+    "eds": (15, 51, 127),
+    "ee": (185, 199, 202),
+    "eed": (47, 104),
+    "eep": (69,),
+    "ees": (118, 172, 187, 191),
+    "ell": (90, 91, 119, 126),
+    "elt": (133,),
+    "end": (110, 120),
+    "ens": (87,),
+    "eps": (22, 140),
+    "er": (192,),
+    "ers": (0, 38, 175),
+    "es": (187, 191),
+    "ets": (121, 128),
+    "eus": (141,),
+    "eve": (11, 199, 202),
+    "ews": (122,),
+    "eze": (16, 182, 199, 202),
+    "fer": (86, 192),
+    "fit": (161,),
+    "ght": (33, 59),
+    "h": (194,),
+    "hes": (8, 12, 165, 187, 191),
+    "hts": (9, 18),
+    "hut": (123,),
+    "i": (198, 200),
+    "ic": (176,),
+    "ick": (73,),
+    "ics": (164,),
+    "ide": (108, 115, 199, 202),
+    "ids": (97,),
+    "ie": (189, 199, 202),
+    "ies": (79, 174, 187, 191),
+    "ieu": (167,),
+    "ike": (27, 199, 202),
+    "ill": (92,),
+    "ind": (98, 129),
+    "ine": (66, 199, 202),
+    "ing": (28, 70),
+    "ink": (77,),
+    "ins": (71,),
+    "is": (184, 188),
+    "ite": (82, 199, 202),
+    "its": (24, 57, 132),
+    "kes": (6, 60, 74, 187, 191),
+    "lad": (101,),
+    "lay": (135, 193, 201),
+    "lit": (72,),
+    "lls": (40, 41, 42, 63, 76, 84),
+    "low": (83,),
+    "lts": (85,),
+    "mow": (150,),
+    "n't": (163,),
+    "nds": (46, 58, 64, 81),
+    "nes": (20, 187, 191),
+    "ngs": (7, 23, 53),
+    "nit": (109,),
+    "nks": (29,),
+    "nx": (178, 195),
+    "oe": (179, 199, 202),
+    "oes": (166, 187, 191),
+    "oot": (67,),
+    "ork": (138,),
+    "ots": (21,),
+    "ows": (30, 34, 52, 112),
+    "pay": (151, 193, 201),
+    "pen": (134,),
+    "pin": (124,),
+    "put": (56,),
+    "raw": (103,),
+    "rix": (144, 195),
+    "rks": (95,),
+    "rns": (94,),
+    "row": (78, 105),
+    "rts": (43,),
+    "run": (152,),
+    "rve": (89, 199, 202),
+    "say": (153, 193, 201),
+    "see": (154, 185, 199, 202),
+    "ses": (137, 143, 187, 191),
+    "set": (155,),
+    "sew": (156,),
+    "ss": (180,),
+    "sts": (48,),
+    "tes": (13, 32, 187, 191),
+    "the": (36, 199, 202),
+    "try": (157, 193, 201),
+    "ude": (14, 199, 202),
+    "ue": (183, 199, 202),
+    "ues": (171, 187, 191),
+    "uns": (116,),
+    "urn": (136,),
+    "use": (162, 199, 202),
+    "uts": (17, 68, 102),
+    "uys": (99, 177, 190),
+    "ves": (1, 31, 39, 187, 191),
+    "wed": (158,),
+    "wet": (159,),
+    "x": (195,),
+    "xes": (44, 139, 169, 187, 191),
+    "y": (193, 201),
+    "ye": (186, 199, 202),
+    "yes": (173, 187, 191),
+    "ys": (177, 190),
+    "z": (196, 197),
+    "ze": (182, 199, 202),
+    "zes": (4, 145, 146, 170, 187, 191),
+    "zz": (181, 196, 197),
+})
+
+plural_recognize_rule = lazy_compile(r"^(?:(.+[^s])|(.+)i|(.+)x|(.+)y|(.+)y|(.+[^b])i|(.+[^e])e|(.+[aeiou])y|(.+[aeiou])z|(.+[au])e|(.+[cs])h|(.+)ee|(.+)er|(.+)ic|(.+)oe|(.+)ss|(.+)ue|(.+)ye|(.+)ze|(.+)zz|(.+[aiy])nx|((?:.{2,})?)add|((?:.{2,})?)bid|((?:.{2,})?)buy|((?:.{2,})?)cut|((?:.{2,})?)fit|((?:.{2,})?)mow|((?:.{2,})?)pay|((?:.{2,})?)run|((?:.{2,})?)say|((?:.{2,})?)see|((?:.{2,})?)set|((?:.{2,})?)sew|((?:.{2,})?)try|((?:.{2,})?)use|((?:.{2,})?)wed|((?:.{2,})?)wet|(.+)eau|(.+)ieu|(.+)n't|((?:.{2,})?)bear|((?:.{2,})?)bind|((?:.{2,})?)call|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)draw|((?:.{2,})?)feed|((?:.{2,})?)grow|((?:.{2,})?)hang|((?:.{2,})?)hear|((?:.{2,})?)hide|((?:.{2,})?)knit|((?:.{2,})?)lend|((?:.{2,})?)make|((?:.{2,})?)melt|((?:.{2,})?)open|((?:.{2,})?)play|((?:.{2,})?)read|((?:.{2,})?)ride|((?:.{2,})?)sell|((?:.{2,})?)send|((?:.{2,})?)shut|((?:.{2,})?)spin|((?:.{2,})?)take|((?:.{2,})?)tell|((?:.{2,})?)turn|((?:.{2,})?)wind|((?:.{2,})?)work|(.+)ceps|(.+)trix|((?:.{2,})?)allow|((?:.{2,})?)breed|((?:.{2,})?)input|((?:.{2,})?)light|((?:.{2,})?)offer|((?:.{2,})?)serve|((?:.{2,})?)shear|((?:.{2,})?)shine|((?:.{2,})?)shoot|((?:.{2,})?)sleep|((?:.{2,})?)sling|((?:.{2,})?)smell|((?:.{2,})?)spell|((?:.{2,})?)spill|((?:.{2,})?)split|((?:.{2,})?)start|((?:.{2,})?)stick|((?:.{2,})?)teach|((?:.{2,})?)think|((?:.{2,})?)throw|((?:.{2,})?)weave|((?:.{2,})?)write|((?:.{2,})?)alight|((?:.{2,})?)appear|((?:.{2,})?)clothe|((?:.{2,})?)create|((?:.{2,})?)freeze|((?:.{2,})?)spread|((?:.{2,})?)strike|((?:.{2,})?)string|((?:.{2,})?)believe|((?:.{2,})?)include|((?:.{2,})?)consider)$")
 
-singular_recognize_rule = re.compile(r"^(?:(.+[^s])s|(.+)is|(.+[^b])is|(.+[^e])es|(.+[aeiou])ys|(.+[au])es|(.+)ees|(.+)ers|(.+)ics|(.+)ies|(.+)ies|(.+)n't|(.+)oes|(.+)ues|(.+)xes|(.+)yes|(.+)zes|(.+)zes|(.+[cs])hes|((?:.{2,})?)adds|((?:.{2,})?)bids|((?:.{2,})?)buys|((?:.{2,})?)cuts|((?:.{2,})?)fits|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)uses|((?:.{2,})?)weds|((?:.{2,})?)wets|(.+)ceps|(.+)eaus|(.+)ieus|(.+)sses|(.+)zzes|(.+[aeiou])zzes|(.+[aiy])nxes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)calls|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)makes|((?:.{2,})?)melts|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shuts|((?:.{2,})?)spins|((?:.{2,})?)takes|((?:.{2,})?)tells|((?:.{2,})?)tries|((?:.{2,})?)turns|((?:.{2,})?)winds|((?:.{2,})?)works|((?:.{2,})?)allows|((?:.{2,})?)breeds|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)splits|((?:.{2,})?)starts|((?:.{2,})?)sticks|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|(.+)trixes|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)believes|((?:.{2,})?)includes|((?:.{2,})?)considers)$")
+plural_recognize_buckets = SuffixBuckets(plural_recognize_rule, {
+    "": (0,),
+    "ach": (0, 10, 87),
+    "add": (0, 21),
+    "ake": (0, 6, 9, 53, 63),
+    "all": (0, 42),
+    "ang": (0, 48),
+    "art": (0, 85),
+    "ast": (0, 43),
+    "ate": (0, 6, 9, 95),
+    "ave": (0, 6, 9, 90),
+    "bid": (0, 22),
+    "buy": (0, 3, 4, 7, 23),
+    "cut": (0, 24),
+    "der": (0, 12, 102),
+    "e": (0, 6, 9),
+    "ead": (0, 57, 97),
+    "ear": (0, 40, 49, 76, 93),
+    "eau": (0, 37),
+    "ee": (0, 6, 9, 11),
+    "eed": (0, 46, 71),
+    "eep": (0, 79),
+    "ell": (0, 59, 64, 81, 82),
+    "elt": (0, 54),
+    "end": (0, 52, 60),
+    "eps": (0, 68),
+    "er": (0, 12),
+    "eve": (0, 6, 9, 100),
+    "eze": (0, 6, 9, 18, 96),
+    "fer": (0, 12, 74),
+    "fit": (0, 25),
+    "ght": (0, 73, 92),
+    "h": (0, 10),
+    "hut": (0, 61),
+    "i": (0, 1, 5),
+    "ic": (0, 13),
+    "ick": (0, 86),
+    "ide": (0, 6, 9, 50, 58),
+    "ieu": (0, 38),
+    "ike": (0, 6, 9, 98),
+    "ill": (0, 83),
+    "ind": (0, 41, 66),
+    "ine": (0, 6, 9, 77),
+    "ing": (0, 80, 99),
+    "ink": (0, 88),
+    "ite": (0, 6, 9, 91),
+    "lad": (0, 44),
+    "lay": (0, 3, 4, 7, 56),
+    "lit": (0, 84),
+    "low": (0, 70),
+    "mow": (0, 26),
+    "n't": (0, 39),
+    "nit": (0, 51),
+    "nx": (0, 2, 20),
+    "oe": (0, 6, 9, 14),
+    "oot": (0, 78),
+    "ork": (0, 67),
+    "pay": (0, 3, 4, 7, 27),
+    "pen": (0, 55),
+    "pin": (0, 62),
+    "put": (0, 72),
+    "raw": (0, 45),
+    "rix": (0, 2, 69),
+    "row": (0, 47, 89),
+    "run": (0, 28),
+    "rve": (0, 6, 9, 75),
+    "say": (0, 3, 4, 7, 29),
+    "see": (0, 6, 9, 11, 30),
+    "set": (0, 31),
+    "sew": (0, 32),
+    "ss": (0, 15),
+    "the": (0, 6, 9, 94),
+    "try": (0, 3, 4, 7, 33),
+    "ude": (0, 6, 9, 101),
+    "ue": (0, 6, 9, 16),
+    "urn": (0, 65),
+    "use": (0, 6, 9, 34),
+    "wed": (0, 35),
+    "wet": (0, 36),
+    "x": (0, 2),
+    "y": (0, 3, 4, 7),
+    "ye": (0, 6, 9, 17),
+    "z": (0, 8),
+    "ze": (0, 6, 9, 18),
+    "zz": (0, 8, 19),
+})
 
-past_recognize_rule = re.compile(r"^(?:(.+[^e])ed|(.+[au])ed|((?:.{2,})?)bid|((?:.{2,})?)cut|((?:.{2,})?)fed|((?:.{2,})?)hid|((?:.{2,})?)lit|((?:.{2,})?)ran|((?:.{2,})?)saw|((?:.{2,})?)set|((?:.{2,})?)wed|((?:.{2,})?)wet|(.+)eed|(.+)ied|(.+)ied|(.+)n't|(.+)oed|(.+)ued|(.+)xed|(.+)yed|(.+)yed|(.+)zed|(.+[^b])ied|(.+[aeiou])yed|(.+[cs])hed|((?:.{2,})?)bore|((?:.{2,})?)bred|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)drew|((?:.{2,})?)grew|((?:.{2,})?)hung|((?:.{2,})?)lent|((?:.{2,})?)made|((?:.{2,})?)paid|((?:.{2,})?)read|((?:.{2,})?)rode|((?:.{2,})?)said|((?:.{2,})?)sent|((?:.{2,})?)shot|((?:.{2,})?)shut|((?:.{2,})?)sold|((?:.{2,})?)spun|((?:.{2,})?)told|((?:.{2,})?)took|((?:.{2,})?)used|((?:.{2,})?)wove|(.+)ered|(.+)ssed|(.+)zzed|(.+[aeiou])zzed|(.+[aiy])nxed|((?:.{2,})?)added|((?:.{2,})?)bound|((?:.{2,})?)froze|((?:.{2,})?)heard|((?:.{2,})?)input|((?:.{2,})?)mowed|((?:.{2,})?)sewed|((?:.{2,})?)shone|((?:.{2,})?)slept|((?:.{2,})?)slung|((?:.{2,})?)split|((?:.{2,})?)stuck|((?:.{2,})?)threw|((?:.{2,})?)tried|((?:.{2,})?)wound|((?:.{2,})?)wrote|(.+)eaued|(.+)icked|(.+)ieued|((?:.{2,})?)bought|((?:.{2,})?)called|((?:.{2,})?)fitted|((?:.{2,})?)melted|((?:.{2,})?)opened|((?:.{2,})?)played|((?:.{2,})?)served|((?:.{2,})?)spread|((?:.{2,})?)struck|((?:.{2,})?)strung|((?:.{2,})?)taught|((?:.{2,})?)turned|((?:.{2,})?)worked|(.+)cepsed|(.+)trixed|((?:.{2,})?)allowed|((?:.{2,})?)clothed|((?:.{2,})?)created|((?:.{2,})?)knitted|((?:.{2,})?)offered|((?:.{2,})?)sheared|((?:.{2,})?)smelled|((?:.{2,})?)spelled|((?:.{2,})?)spilled|((?:.{2,})?)started|((?:.{2,})?)thought|((?:.{2,})?)alighted|((?:.{2,})?)appeared|((?:.{2,})?)believed|((?:.{2,})?)included|((?:.{2,})?)considered)$")
+singular_recognize_rule = lazy_compile(r"^(?:(.+[^s])s|(.+)is|(.+[^b])is|(.+[^e])es|(.+[aeiou])ys|(.+[au])es|(.+)ees|(.+)ers|(.+)ics|(.+)ies|(.+)ies|(.+)n't|(.+)oes|(.+)ues|(.+)xes|(.+)yes|(.+)zes|(.+)zes|(.+[cs])hes|((?:.{2,})?)adds|((?:.{2,})?)bids|((?:.{2,})?)buys|((?:.{2,})?)cuts|((?:.{2,})?)fits|((?:.{2,})?)mows|((?:.{2,})?)pays|((?:.{2,})?)runs|((?:.{2,})?)says|((?:.{2,})?)sees|((?:.{2,})?)sets|((?:.{2,})?)sews|((?:.{2,})?)uses|((?:.{2,})?)weds|((?:.{2,})?)wets|(.+)ceps|(.+)eaus|(.+)ieus|(.+)sses|(.+)zzes|(.+[aeiou])zzes|(.+[aiy])nxes|((?:.{2,})?)bears|((?:.{2,})?)binds|((?:.{2,})?)calls|((?:.{2,})?)casts|((?:.{2,})?)clads|((?:.{2,})?)draws|((?:.{2,})?)feeds|((?:.{2,})?)grows|((?:.{2,})?)hangs|((?:.{2,})?)hears|((?:.{2,})?)hides|((?:.{2,})?)knits|((?:.{2,})?)lends|((?:.{2,})?)makes|((?:.{2,})?)melts|((?:.{2,})?)opens|((?:.{2,})?)plays|((?:.{2,})?)reads|((?:.{2,})?)rides|((?:.{2,})?)sells|((?:.{2,})?)sends|((?:.{2,})?)shuts|((?:.{2,})?)spins|((?:.{2,})?)takes|((?:.{2,})?)tells|((?:.{2,})?)tries|((?:.{2,})?)turns|((?:.{2,})?)winds|((?:.{2,})?)works|((?:.{2,})?)allows|((?:.{2,})?)breeds|((?:.{2,})?)inputs|((?:.{2,})?)lights|((?:.{2,})?)offers|((?:.{2,})?)serves|((?:.{2,})?)shears|((?:.{2,})?)shines|((?:.{2,})?)shoots|((?:.{2,})?)sleeps|((?:.{2,})?)slings|((?:.{2,})?)smells|((?:.{2,})?)spells|((?:.{2,})?)spills|((?:.{2,})?)splits|((?:.{2,})?)starts|((?:.{2,})?)sticks|((?:.{2,})?)thinks|((?:.{2,})?)throws|((?:.{2,})?)weaves|((?:.{2,})?)writes|(.+)trixes|((?:.{2,})?)alights|((?:.{2,})?)appears|((?:.{2,})?)clothes|((?:.{2,})?)creates|((?:.{2,})?)freezes|((?:.{2,})?)spreads|((?:.{2,})?)strikes|((?:.{2,})?)strings|((?:.{2,})?)teaches|((?:.{2,})?)believes|((?:.{2,})?)includes|((?:.{2,})?)considers)$")
 
-pres_part_recognize_rule = re.compile(r"^(?:(.+[^b])ing|(.+[^e])ing|(.+[au])ing|(.+)iing|(.+)uing|(.+)xing|(.+)ying|(.+)ying|(.+)zing|(.+[aeiou])ying|(.+[cs])hing|((?:.{2,})?)using|(.+)eeing|(.+)ering|(.+)oeing|(.+)ssing|(.+)yeing|(.+)zzing|(.+[aeiou])zzing|(.+[aiy])nxing|((?:.{2,})?)adding|((?:.{2,})?)buying|((?:.{2,})?)hiding|((?:.{2,})?)making|((?:.{2,})?)mowing|((?:.{2,})?)paying|((?:.{2,})?)riding|((?:.{2,})?)saying|((?:.{2,})?)seeing|((?:.{2,})?)sewing|((?:.{2,})?)taking|((?:.{2,})?)trying|(.+)eauing|(.+)icking|(.+)ieuing|((?:.{2,})?)bearing|((?:.{2,})?)bidding|((?:.{2,})?)binding|((?:.{2,})?)calling|((?:.{2,})?)casting|((?:.{2,})?)cutting|((?:.{2,})?)drawing|((?:.{2,})?)feeding|((?:.{2,})?)fitting|((?:.{2,})?)growing|((?:.{2,})?)hanging|((?:.{2,})?)hearing|((?:.{2,})?)lending|((?:.{2,})?)melting|((?:.{2,})?)opening|((?:.{2,})?)playing|((?:.{2,})?)reading|((?:.{2,})?)running|((?:.{2,})?)selling|((?:.{2,})?)sending|((?:.{2,})?)serving|((?:.{2,})?)setting|((?:.{2,})?)shining|((?:.{2,})?)telling|((?:.{2,})?)turning|((?:.{2,})?)weaving|((?:.{2,})?)wedding|((?:.{2,})?)wetting|((?:.{2,})?)winding|((?:.{2,})?)working|((?:.{2,})?)writing|(.+)cepsing|(.+)trixing|((?:.{2,})?)allowing|((?:.{2,})?)breeding|((?:.{2,})?)cladding|((?:.{2,})?)clothing|((?:.{2,})?)creating|((?:.{2,})?)freezing|((?:.{2,})?)knitting|((?:.{2,})?)lighting|((?:.{2,})?)offering|((?:.{2,})?)shearing|((?:.{2,})?)shooting|((?:.{2,})?)shutting|((?:.{2,})?)sleeping|((?:.{2,})?)slinging|((?:.{2,})?)smelling|((?:.{2,})?)spelling|((?:.{2,})?)spilling|((?:.{2,})?)spinning|((?:.{2,})?)starting|((?:.{2,})?)sticking|((?:.{2,})?)striking|((?:.{2,})?)teaching|((?:.{2,})?)thinking|((?:.{2,})?)throwing|((?:.{2,})?)alighting|((?:.{2,})?)appearing|((?:.{2,})?)believing|((?:.{2,})?)including|((?:.{2,})?)inputting|((?:.{2,})?)splitting|((?:.{2,})?)spreading|((?:.{2,})?)stringing|((?:.{2,})?)considering)$")
+singular_recognize_buckets = SuffixBuckets(singular_recognize_rule, {
+    "": (),
+    "ads": (0, 45, 58, 97),
+    "ars": (0, 41, 50, 76, 93),
+    "aus": (0, 35),
+    "aws": (0, 46),
+    "ays": (0, 4, 25, 27, 57),
+    "cks": (0, 86),
+    "dds": (0, 19),
+    "des": (0, 3, 5, 51, 59, 102),
+    "eds": (0, 32, 47, 71),
+    "ees": (0, 3, 5, 6, 28),
+    "ens": (0, 56),
+    "eps": (0, 34, 79),
+    "ers": (0, 7, 74, 103),
+    "es": (0, 3, 5),
+    "ets": (0, 29, 33),
+    "eus": (0, 36),
+    "ews": (0, 30),
+    "hes": (0, 3, 5, 18, 94, 100),
+    "hts": (0, 73, 92),
+    "ics": (0, 8),
+    "ids": (0, 20),
+    "ies": (0, 3, 5, 9, 10, 66),
+    "ins": (0, 63),
+    "is": (0, 1, 2),
+    "its": (0, 23, 52, 84),
+    "kes": (0, 3, 5, 54, 64, 98),
+    "lls": (0, 43, 60, 65, 81, 82, 83),
+    "lts": (0, 55),
+    "n't": (11,),
+    "nds": (0, 42, 53, 61, 68),
+    "nes": (0, 3, 5, 77),
+    "ngs": (0, 49, 80, 99),
+    "nks": (0, 87),
+    "oes": (0, 3, 5, 12),
+    "ots": (0, 78),
+    "ows": (0, 24, 48, 70, 88),
+    "rks": (0, 69),
+    "rns": (0, 67),
+    "rts": (0, 85),
+    "s": (0,),
+    "ses": (0, 3, 5, 31, 37),
+    "sts": (0, 44),
+    "tes": (0, 3, 5, 90, 95),
+    "ues": (0, 3, 5, 13),
+    "uns": (0, 26),
+    "uts": (0, 22, 62, 72),
+    "uys": (0, 4, 21),
+    "ves": (0, 3, 5, 75, 89, 101),
+    "xes": (0, 3, 5, 14, 40, 91),
+    "yes": (0, 3, 5, 15),
+    "ys": (0, 4),
+    "zes": (0, 3, 5, 16, 17, 38, 39, 96),
+})
 
-past_part_recognize_rule = re.compile(r"^(?:(.+[^e])ed|(.+[au])ed|((?:.{2,})?)bid|((?:.{2,})?)cut|((?:.{2,})?)fed|((?:.{2,})?)lit|((?:.{2,})?)run|((?:.{2,})?)set|((?:.{2,})?)wed|(.+)eed|(.+)ied|(.+)ied|(.+)oed|(.+)ued|(.+)xed|(.+)yed|(.+)yed|(.+)zed|(.+[^b])ied|(.+[aeiou])yed|(.+[cs])hed|((?:.{2,})?)bred|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)hung|((?:.{2,})?)lent|((?:.{2,})?)made|((?:.{2,})?)mown|((?:.{2,})?)paid|((?:.{2,})?)read|((?:.{2,})?)said|((?:.{2,})?)seen|((?:.{2,})?)sent|((?:.{2,})?)sewn|((?:.{2,})?)shot|((?:.{2,})?)shut|((?:.{2,})?)sold|((?:.{2,})?)spun|((?:.{2,})?)told|((?:.{2,})?)used|(.+)ered|(.+)ssed|(.+)zzed|(.+[aeiou])zzed|(.+[aiy])nxed|((?:.{2,})?)added|((?:.{2,})?)borne|((?:.{2,})?)bound|((?:.{2,})?)drawn|((?:.{2,})?)grown|((?:.{2,})?)heard|((?:.{2,})?)input|((?:.{2,})?)shone|((?:.{2,})?)shorn|((?:.{2,})?)slept|((?:.{2,})?)slung|((?:.{2,})?)split|((?:.{2,})?)stuck|((?:.{2,})?)taken|((?:.{2,})?)tried|((?:.{2,})?)wound|((?:.{2,})?)woven|(.+)eaued|(.+)icked|(.+)ieued|((?:.{2,})?)bought|((?:.{2,})?)called|((?:.{2,})?)fitted|((?:.{2,})?)frozen|((?:.{2,})?)hidden|((?:.{2,})?)melted|((?:.{2,})?)opened|((?:.{2,})?)played|((?:.{2,})?)ridden|((?:.{2,})?)served|((?:.{2,})?)spread|((?:.{2,})?)struck|((?:.{2,})?)strung|((?:.{2,})?)taught|((?:.{2,})?)thrown|((?:.{2,})?)turned|((?:.{2,})?)wetted|((?:.{2,})?)worked|(.+)cepsed|(.+)trixed|((?:.{2,})?)allowed|((?:.{2,})?)clothed|((?:.{2,})?)created|((?:.{2,})?)knitted|((?:.{2,})?)offered|((?:.{2,})?)smelled|((?:.{2,})?)spelled|((?:.{2,})?)spilled|((?:.{2,})?)started|((?:.{2,})?)thought|((?:.{2,})?)written|((?:.{2,})?)alighted|((?:.{2,})?)appeared|((?:.{2,})?)believed|((?:.{2,})?)included|((?:.{2,})?)considered)$")
+past_recognize_rule = lazy_compile(r"^(?:(.+[^e])ed|(.+[au])ed|((?:.{2,})?)bid|((?:.{2,})?)cut|((?:.{2,})?)fed|((?:.{2,})?)hid|((?:.{2,})?)lit|((?:.{2,})?)ran|((?:.{2,})?)saw|((?:.{2,})?)set|((?:.{2,})?)wed|((?:.{2,})?)wet|(.+)eed|(.+)ied|(.+)ied|(.+)n't|(.+)oed|(.+)ued|(.+)xed|(.+)yed|(.+)yed|(.+)zed|(.+[^b])ied|(.+[aeiou])yed|(.+[cs])hed|((?:.{2,})?)bore|((?:.{2,})?)bred|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)drew|((?:.{2,})?)grew|((?:.{2,})?)hung|((?:.{2,})?)lent|((?:.{2,})?)made|((?:.{2,})?)paid|((?:.{2,})?)read|((?:.{2,})?)rode|((?:.{2,})?)said|((?:.{2,})?)sent|((?:.{2,})?)shot|((?:.{2,})?)shut|((?:.{2,})?)sold|((?:.{2,})?)spun|((?:.{2,})?)told|((?:.{2,})?)took|((?:.{2,})?)used|((?:.{2,})?)wove|(.+)ered|(.+)ssed|(.+)zzed|(.+[aeiou])zzed|(.+[aiy])nxed|((?:.{2,})?)added|((?:.{2,})?)bound|((?:.{2,})?)froze|((?:.{2,})?)heard|((?:.{2,})?)input|((?:.{2,})?)mowed|((?:.{2,})?)sewed|((?:.{2,})?)shone|((?:.{2,})?)slept|((?:.{2,})?)slung|((?:.{2,})?)split|((?:.{2,})?)stuck|((?:.{2,})?)threw|((?:.{2,})?)tried|((?:.{2,})?)wound|((?:.{2,})?)wrote|(.+)eaued|(.+)icked|(.+)ieued|((?:.{2,})?)bought|((?:.{2,})?)called|((?:.{2,})?)fitted|((?:.{2,})?)melted|((?:.{2,})?)opened|((?:.{2,})?)played|((?:.{2,})?)served|((?:.{2,})?)spread|((?:.{2,})?)struck|((?:.{2,})?)strung|((?:.{2,})?)taught|((?:.{2,})?)turned|((?:.{2,})?)worked|(.+)cepsed|(.+)trixed|((?:.{2,})?)allowed|((?:.{2,})?)clothed|((?:.{2,})?)created|((?:.{2,})?)knitted|((?:.{2,})?)offered|((?:.{2,})?)sheared|((?:.{2,})?)smelled|((?:.{2,})?)spelled|((?:.{2,})?)spilled|((?:.{2,})?)started|((?:.{2,})?)thought|((?:.{2,})?)alighted|((?:.{2,})?)appeared|((?:.{2,})?)believed|((?:.{2,})?)included|((?:.{2,})?)considered)$")
+
+past_recognize_buckets = SuffixBuckets(past_recognize_rule, {
+    "": (),
+    "ade": (33,),
+    "aid": (34, 37),
+    "ard": (55,),
+    "ast": (27,),
+    "bid": (2,),
+    "cut": (3,),
+    "ded": (0, 1, 52, 100),
+    "ead": (35, 78),
+    "ed": (0, 1),
+    "eed": (0, 1, 12),
+    "ent": (32, 38),
+    "ept": (60,),
+    "fed": (0, 1, 4),
+    "ght": (71, 81, 96),
+    "hed": (0, 1, 24, 87),
+    "hid": (5,),
+    "hot": (39,),
+    "hut": (40,),
+    "ied": (0, 1, 13, 14, 22, 65),
+    "ked": (0, 1, 69, 83),
+    "lad": (28,),
+    "led": (0, 1, 72, 92, 93, 94),
+    "lit": (6, 62),
+    "n't": (15,),
+    "ned": (0, 1, 75, 82),
+    "ode": (36,),
+    "oed": (0, 1, 16),
+    "old": (41, 43),
+    "one": (59,),
+    "ook": (44,),
+    "ore": (25,),
+    "ote": (67,),
+    "ove": (46,),
+    "oze": (54,),
+    "pun": (42,),
+    "put": (56,),
+    "ran": (7,),
+    "red": (0, 1, 26, 47, 90, 91, 98, 101),
+    "rew": (29, 30, 64),
+    "saw": (8,),
+    "sed": (0, 1, 45, 48, 84),
+    "set": (9,),
+    "ted": (0, 1, 73, 74, 88, 89, 95, 97),
+    "uck": (63, 79),
+    "ued": (0, 1, 17, 68, 70),
+    "und": (53, 66),
+    "ung": (31, 61, 80),
+    "ved": (0, 1, 77, 99),
+    "wed": (0, 1, 10, 57, 58, 86),
+    "wet": (11,),
+    "xed": (0, 1, 18, 51, 85),
+    "yed": (0, 1, 19, 20, 23, 76),
+    "zed": (0, 1, 21, 49, 50),
+})
+
+pres_part_recognize_rule = lazy_compile(r"^(?:(.+[^b])ing|(.+[^e])ing|(.+[au])ing|(.+)iing|(.+)uing|(.+)xing|(.+)ying|(.+)ying|(.+)zing|(.+[aeiou])ying|(.+[cs])hing|((?:.{2,})?)using|(.+)eeing|(.+)ering|(.+)oeing|(.+)ssing|(.+)yeing|(.+)zzing|(.+[aeiou])zzing|(.+[aiy])nxing|((?:.{2,})?)adding|((?:.{2,})?)buying|((?:.{2,})?)hiding|((?:.{2,})?)making|((?:.{2,})?)mowing|((?:.{2,})?)paying|((?:.{2,})?)riding|((?:.{2,})?)saying|((?:.{2,})?)seeing|((?:.{2,})?)sewing|((?:.{2,})?)taking|((?:.{2,})?)trying|(.+)eauing|(.+)icking|(.+)ieuing|((?:.{2,})?)bearing|((?:.{2,})?)bidding|((?:.{2,})?)binding|((?:.{2,})?)calling|((?:.{2,})?)casting|((?:.{2,})?)cutting|((?:.{2,})?)drawing|((?:.{2,})?)feeding|((?:.{2,})?)fitting|((?:.{2,})?)growing|((?:.{2,})?)hanging|((?:.{2,})?)hearing|((?:.{2,})?)lending|((?:.{2,})?)melting|((?:.{2,})?)opening|((?:.{2,})?)playing|((?:.{2,})?)reading|((?:.{2,})?)running|((?:.{2,})?)selling|((?:.{2,})?)sending|((?:.{2,})?)serving|((?:.{2,})?)setting|((?:.{2,})?)shining|((?:.{2,})?)telling|((?:.{2,})?)turning|((?:.{2,})?)weaving|((?:.{2,})?)wedding|((?:.{2,})?)wetting|((?:.{2,})?)winding|((?:.{2,})?)working|((?:.{2,})?)writing|(.+)cepsing|(.+)trixing|((?:.{2,})?)allowing|((?:.{2,})?)breeding|((?:.{2,})?)cladding|((?:.{2,})?)clothing|((?:.{2,})?)creating|((?:.{2,})?)freezing|((?:.{2,})?)knitting|((?:.{2,})?)lighting|((?:.{2,})?)offering|((?:.{2,})?)shearing|((?:.{2,})?)shooting|((?:.{2,})?)shutting|((?:.{2,})?)sleeping|((?:.{2,})?)slinging|((?:.{2,})?)smelling|((?:.{2,})?)spelling|((?:.{2,})?)spilling|((?:.{2,})?)spinning|((?:.{2,})?)starting|((?:.{2,})?)sticking|((?:.{2,})?)striking|((?:.{2,})?)teaching|((?:.{2,})?)thinking|((?:.{2,})?)throwing|((?:.{2,})?)alighting|((?:.{2,})?)appearing|((?:.{2,})?)believing|((?:.{2,})?)including|((?:.{2,})?)inputting|((?:.{2,})?)splitting|((?:.{2,})?)spreading|((?:.{2,})?)stringing|((?:.{2,})?)considering)$")
+
+pres_part_recognize_buckets = SuffixBuckets(pres_part_recognize_rule, {
+    "": (),
+    "ing": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100),
+})
+
+past_part_recognize_rule = lazy_compile(r"^(?:(.+[^e])ed|(.+[au])ed|((?:.{2,})?)bid|((?:.{2,})?)cut|((?:.{2,})?)fed|((?:.{2,})?)lit|((?:.{2,})?)run|((?:.{2,})?)set|((?:.{2,})?)wed|(.+)eed|(.+)ied|(.+)ied|(.+)oed|(.+)ued|(.+)xed|(.+)yed|(.+)yed|(.+)zed|(.+[^b])ied|(.+[aeiou])yed|(.+[cs])hed|((?:.{2,})?)bred|((?:.{2,})?)cast|((?:.{2,})?)clad|((?:.{2,})?)hung|((?:.{2,})?)lent|((?:.{2,})?)made|((?:.{2,})?)mown|((?:.{2,})?)paid|((?:.{2,})?)read|((?:.{2,})?)said|((?:.{2,})?)seen|((?:.{2,})?)sent|((?:.{2,})?)sewn|((?:.{2,})?)shot|((?:.{2,})?)shut|((?:.{2,})?)sold|((?:.{2,})?)spun|((?:.{2,})?)told|((?:.{2,})?)used|(.+)ered|(.+)ssed|(.+)zzed|(.+[aeiou])zzed|(.+[aiy])nxed|((?:.{2,})?)added|((?:.{2,})?)borne|((?:.{2,})?)bound|((?:.{2,})?)drawn|((?:.{2,})?)grown|((?:.{2,})?)heard|((?:.{2,})?)input|((?:.{2,})?)shone|((?:.{2,})?)shorn|((?:.{2,})?)slept|((?:.{2,})?)slung|((?:.{2,})?)split|((?:.{2,})?)stuck|((?:.{2,})?)taken|((?:.{2,})?)tried|((?:.{2,})?)wound|((?:.{2,})?)woven|(.+)eaued|(.+)icked|(.+)ieued|((?:.{2,})?)bought|((?:.{2,})?)called|((?:.{2,})?)fitted|((?:.{2,})?)frozen|((?:.{2,})?)hidden|((?:.{2,})?)melted|((?:.{2,})?)opened|((?:.{2,})?)played|((?:.{2,})?)ridden|((?:.{2,})?)served|((?:.{2,})?)spread|((?:.{2,})?)struck|((?:.{2,})?)strung|((?:.{2,})?)taught|((?:.{2,})?)thrown|((?:.{2,})?)turned|((?:.{2,})?)wetted|((?:.{2,})?)worked|(.+)cepsed|(.+)trixed|((?:.{2,})?)allowed|((?:.{2,})?)clothed|((?:.{2,})?)created|((?:.{2,})?)knitted|((?:.{2,})?)offered|((?:.{2,})?)smelled|((?:.{2,})?)spelled|((?:.{2,})?)spilled|((?:.{2,})?)started|((?:.{2,})?)thought|((?:.{2,})?)written|((?:.{2,})?)alighted|((?:.{2,})?)appeared|((?:.{2,})?)believed|((?:.{2,})?)included|((?:.{2,})?)considered)$")
+
+past_part_recognize_buckets = SuffixBuckets(past_part_recognize_rule, {
+    "": (),
+    "ade": (26,),
+    "aid": (28, 30),
+    "ard": (50,),
+    "ast": (22,),
+    "awn": (48,),
+    "bid": (2,),
+    "cut": (3,),
+    "ded": (0, 1, 45, 99),
+    "den": (69, 73),
+    "ead": (29, 75),
+    "ed": (0, 1),
+    "eed": (0, 1, 9),
+    "een": (31,),
+    "ent": (25, 32),
+    "ept": (54,),
+    "ewn": (33,),
+    "fed": (0, 1, 4),
+    "ght": (65, 78, 94),
+    "hed": (0, 1, 20, 86),
+    "hot": (34,),
+    "hut": (35,),
+    "ied": (0, 1, 10, 11, 18, 59),
+    "ked": (0, 1, 63, 82),
+    "ken": (58,),
+    "lad": (23,),
+    "led": (0, 1, 66, 90, 91, 92),
+    "lit": (5, 56),
+    "ned": (0, 1, 71, 80),
+    "oed": (0, 1, 12),
+    "old": (36, 38),
+    "one": (52,),
+    "orn": (53,),
+    "own": (27, 49, 79),
+    "pun": (37,),
+    "put": (51,),
+    "red": (0, 1, 21, 40, 89, 97, 100),
+    "rne": (46,),
+    "run": (6,),
+    "sed": (0, 1, 39, 41, 83),
+    "set": (7,),
+    "ted": (0, 1, 67, 70, 81, 87, 88, 93, 96),
+    "ten": (95,),
+    "uck": (57, 76),
+    "ued": (0, 1, 13, 62, 64),
+    "und": (47, 60),
+    "ung": (24, 55, 77),
+    "ved": (0, 1, 74, 98),
+    "ven": (61,),
+    "wed": (0, 1, 8, 85),
+    "xed": (0, 1, 14, 44, 84),
+    "yed": (0, 1, 15, 16, 19, 72),
+    "zed": (0, 1, 17, 42, 43),
+    "zen": (68,),
+})
 
 past_of_values = set(past_of.values())
 pres_part_of_values = set(pres_part_of.values())
@@ -4018,6 +5180,7 @@ def known_pres_part(word):
     """
     return word.lower() in pres_part_of_values
 
+@memoize
 def convert_to_plural(word):
     """Convert `word` to plural form.
 
@@ -4033,13 +5196,13 @@ def convert_to_plural(word):
         return plural_of[word.lower()]
     if known_plural(word):
         return word
-    match = plural_convert_rule_regex.match(word.lower())
-    if match:
-        for i, group in enumerate(match.groups()):
-            if group is not None:
-                return group + plural_convert_outputs[i]
+    rule = plural_convert_buckets.match(word.lower())
+    if rule:
+        index, stem = rule
+        return stem + plural_convert_outputs[index]
     return None
 
+@memoize
 def convert_to_singular(word):
     """Convert `word` to singular form.
 
@@ -4053,13 +5216,13 @@ def convert_to_singular(word):
         return singular_of[word]
     if not word.islower() and word.lower() in singular_of:
         return singular_of[word.lower()]
-    match = singular_convert_rule_regex.match(word.lower())
-    if match:
-        for i, group in enumerate(match.groups()):
-            if group is not None:
-                return group + singular_convert_outputs[i]
+    rule = singular_convert_buckets.match(word.lower())
+    if rule:
+        index, stem = rule
+        return stem + singular_convert_outputs[index]
     return None
 
+@memoize
 def convert_to_past(word):
     """Convert `word` to past form.
 
@@ -4075,13 +5238,13 @@ def convert_to_past(word):
         return past_of[word.lower()]
     if is_past(word):
         return word
-    match = past_convert_rule_regex.match(word.lower())
-    if match:
-        for i, group in enumerate(match.groups()):
-            if group is not None:
-                return group + past_convert_outputs[i]
+    rule = past_convert_buckets.match(word.lower())
+    if rule:
+        index, stem = rule
+        return stem + past_convert_outputs[index]
     return None
 
+@memoize
 def convert_to_pres_part(word):
     """Convert `word` to present participle form.
 
@@ -4097,13 +5260,13 @@ def convert_to_pres_part(word):
         return pres_part_of[word.lower()]
     if is_pres_part(word):
         return word
-    match = pres_part_convert_rule_regex.match(word.lower())
-    if match:
-        for i, group in enumerate(match.groups()):
-            if group is not None:
-                return group + pres_part_convert_outputs[i]
+    rule = pres_part_convert_buckets.match(word.lower())
+    if rule:
+        index, stem = rule
+        return stem + pres_part_convert_outputs[index]
     return None
 
+@memoize
 def convert_to_past_part(word):
     """Convert `word` to past participle form.
 
@@ -4119,13 +5282,13 @@ def convert_to_past_part(word):
         return past_part_of[word.lower()]
     if is_past_part(word):
         return word
-    match = past_part_convert_rule_regex.match(word.lower())
-    if match:
-        for i, group in enumerate(match.groups()):
-            if group is not None:
-                return group + past_part_convert_outputs[i]
+    rule = past_part_convert_buckets.match(word.lower())
+    if rule:
+        index, stem = rule
+        return stem + past_part_convert_outputs[index]
     return None
 
+@memoize
 def is_plural(word: str):
     """Detect whether `word` is in plural form.
 
@@ -4139,10 +5302,11 @@ def is_plural(word: str):
         return True
     if known_singular(word):
         return False
-    if plural_recognize_rule.match(word):
+    if plural_recognize_buckets.match(word):
         return True
     return False
 
+@memoize
 def is_singular(word: str):
     """Detect whether `word` is in singular form.
 
@@ -4156,10 +5320,11 @@ def is_singular(word: str):
         return True
     if known_plural(word):
         return False
-    if singular_recognize_rule.match(word):
+    if singular_recognize_buckets.match(word):
         return True
     return not is_plural(word)
 
+@memoize
 def is_past(word: str):
     """Detect whether `word` is in past form.
 
@@ -4171,10 +5336,11 @@ def is_past(word: str):
     """
     if known_past(word):
         return True
-    if past_recognize_rule.match(word):
+    if past_recognize_buckets.match(word):
         return True
     return False
 
+@memoize
 def is_pres_part(word: str):
     """Detect whether `word` is in present participle form.
 
@@ -4186,10 +5352,11 @@ def is_pres_part(word: str):
     """
     if known_pres_part(word):
         return True
-    if pres_part_recognize_rule.match(word):
+    if pres_part_recognize_buckets.match(word):
         return True
     return False
 
+@memoize
 def is_past_part(word: str):
     """Detect whether `word` is in past participle form.
 
@@ -4201,6 +5368,95 @@ def is_past_part(word: str):
     """
     if known_past_part(word):
         return True
-    if past_part_recognize_rule.match(word):
+    if past_part_recognize_buckets.match(word):
         return True
     return False
+
+def _convert_with_rules(word, lword, literals, is_form, convert_buckets, convert_outputs):
+    """Convert `word` using `literals` and the conversion rules, as in the `convert_to_...` functions.
+
+    Args:
+        word (str): Input word.
+        lword (str): `word` in lowercase.
+        literals (Dict[str, str]): Known conversions, e.g. `plural_of`.
+        is_form (Optional[Callable[[str], bool]]): If this returns True for `word`,
+            then `word` is already in the target form.
+        convert_buckets (SuffixBuckets): The conversion rules, e.g. `plural_convert_buckets`.
+        convert_outputs (List[str]): The suffixes for each conversion rule.
+
+    Returns:
+        Optional[str]: The converted `word`, or None if it can't be converted.
+    """
+    if word in literals:
+        return literals[word]
+    if lword in literals:
+        return literals[lword]
+    if is_form is not None and is_form(word):
+        return word
+    rule = convert_buckets.match(lword)
+    if rule:
+        index, stem = rule
+        return stem + convert_outputs[index]
+    return None
+
+paradigm_forms = ("singular", "plural", "past", "pres_part", "past_part")
+
+def convert_to_paradigm(word, forms=paradigm_forms):
+    """Convert `word` to several forms at once, e.g. to its past, present participle and past participle.
+
+    Note:
+        The output is identical to calling the `convert_to_...` functions on `word`,
+        but `word` is only lowercased once, and the past, present participle and
+        past participle forms share one match of `paradigm_convert_buckets`.
+
+    Args:
+        word (str): Input word.
+        forms (Tuple[str, ...], optional): The forms to convert to, out of "singular", "plural",
+            "past", "pres_part" and "past_part". Defaults to all of them.
+
+    Returns:
+        Dict[str, Optional[str]]: Mapping of each form in `forms` to the corresponding form
+            of `word`, or to None if `word` can't be converted to that form.
+    """
+    lword = word.lower()
+    converted = {}
+    if "singular" in forms:
+        converted["singular"] = _convert_with_rules(word, lword, singular_of, None,
+                                                    singular_convert_buckets,
+                                                    singular_convert_outputs)
+    if "plural" in forms:
+        converted["plural"] = _convert_with_rules(word, lword, plural_of, known_plural,
+                                                  plural_convert_buckets,
+                                                  plural_convert_outputs)
+
+    remaining = []
+    for i, (name, literals, is_form, convert_buckets, convert_outputs) in enumerate((
+        ("past", past_of, is_past, past_convert_buckets, past_convert_outputs),
+        ("pres_part", pres_part_of, is_pres_part, pres_part_convert_buckets, pres_part_convert_outputs),
+        ("past_part", past_part_of, is_past_part, past_part_convert_buckets, past_part_convert_outputs),
+    )):
+        if name not in forms:
+            continue
+        if word in literals:
+            converted[name] = literals[word]
+        elif lword in literals:
+            converted[name] = literals[lword]
+        elif is_form(word):
+            converted[name] = word
+        else:
+            converted[name] = None
+            remaining.append((i, name, convert_buckets, convert_outputs))
+
+    if remaining:
+        rule = paradigm_convert_buckets.match(lword)
+        if rule:
+            j, stem = rule
+            for i, name, convert_buckets, convert_outputs in remaining:
+                if paradigm_convert_outputs[j][i] is not None:
+                    converted[name] = stem + paradigm_convert_outputs[j][i]
+                else:
+                    # The matched rule does not exist for this form
+                    converted[name] = _convert_with_rules(word, lword, {}, None,
+                                                          convert_buckets,
+                                                          convert_outputs)
+    return converted
@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Parser for verb lexicons in the `.lei` format, e.g. `lei/verbs.lei`, of which each line
+holds the five forms of a verb, e.g. "gives give gave giving given". It is used both by
+`generate/generate_verbs.py` to generate `verb_core`, and by `inflex.load_lexicon`
+to extend `verb_core` at runtime.
+"""
+
+__all__ = [
+    "Reader"
+]
+
+import re
+from typing import Dict, List, Optional, Set
+
+"""
+Compiled variants of useful regexes used all around this file
+"""
+xms  = re.VERBOSE | re.MULTILINE | re.DOTALL
+COMMENT_LINE_PAT = re.compile(r" \A \s* \#",         flags=xms)
+COMMENT_PAT      = re.compile(r" \# .* ",            flags=xms)
+BLANK_LINE_PAT   = re.compile(r" \A \s* $ ",         flags=xms)
+WS               = re.compile(r" [\s]* ",            flags=xms)
+WORD_SEQ         = re.compile(r" \S* (?: \s \S+)* ", flags=xms)
+DATA_PAT         = re.compile(r"""
+    \A
+        {WS}
+        ([*-])? ( {WORD_SEQ} )      # 3rd person singular
+        {WS}
+        ([*-])? ( {WORD_SEQ} )      # 3rd person plural
+        {WS}
+        ([*-])? ( {WORD_SEQ} )      # Simple past (preterite)
+        {WS}
+        ([*-])? ( {WORD_SEQ} )      # Present continuous participle
+        {WS}
+        ([*-])? ( {WORD_SEQ} )      # Past participle
+        {WS}
+        (?:{COMMENT_PAT})?          # Optional trailing comment
+    \Z
+""".format(WS=WS.pattern, WORD_SEQ=WORD_SEQ.pattern, COMMENT_PAT=COMMENT_PAT.pattern),
+    flags=xms)
+CONS = re.compile(r"\(CONS\)", flags=xms)
+VOWEL = re.compile(r"\(VOWEL\)", flags=xms)
+VOWELY = re.compile(r"\(VOWELY\)", flags=xms)
+DASH = re.compile(r"-")
+STAR = re.compile(r"\*")
+RESTRICT = re.compile(r"( \[.*?\] )+", flags=xms)
+SPLIT = re.compile(r"(.*?) [|] (.*)", flags=xms)
+
+
+class Word(object):
+    def __init__(self, gen: Optional[str], word: str):
+        super().__init__()
+        self.gen = gen
+        self.word = word
+        self.restrict = ""
+
+    def expand_dash_star(self) -> None:
+        """
+        Replace - and * with the proper regex variant in input gen: "-" -> ".+"
+        """
+        if not self.gen:
+            return
+        self.gen = DASH.sub(r".+", self.gen)
+        self.gen = STAR.sub(r"(?:.{2,})?", self.gen)
+
+    def expand_cons_vowel(self) -> None:
+        """
+        Replace (CONS), (VOWEL) and (VOWELS) macros in input verb, e.g. "(VOWEL)ys" -> "[aeiou]ys"
+        """
+        self.word = CONS.sub(r"[^aeiou]", self.word)
+        self.word = VOWEL.sub(r"[aeiou]", self.word)
+        self.word = VOWELY.sub(r"[aeiouy]", self.word)
+
+    def restrict_word(self) -> None:
+        """
+        Input verb (e.g. "[aeiou]ys") is split up into restriction (e.g. "[aeiou]") and remainder (e.g. "ys")
+        """
+        match = RESTRICT.search(self.word)
+        if match:
+            self.restrict = match.group()
+            self.word = RESTRICT.sub(r"", self.word, count=1)
+
+    def split(self) -> Optional[str]:
+        match = SPLIT.match(self.word)
+        if match:
+            self.word = match.group(1)
+            return match.group(2)
+        return None
+
+    def __str__(self) -> str:
+        return f"{self.gen or ''}{self.restrict}{self.word}"
+
+
+class Verb(object):
+    def __init__(self, match):
+        super().__init__()
+        """
+        Extract line information.
+
+        sing -> Singular
+        plur -> Plural
+        pret -> Preterite
+        pres -> Present participle
+        past -> Past participle
+
+        ..._gen holds "-" and "*" generator for suffixes, e.g. in "-ys" or "*melts"
+        """
+        types = ["sing", "plur", "pret", "pres", "past"]
+        self.verbs = {}
+        for i, key in enumerate(types):
+            # Get gen and verb of this word
+            gen = match.group(i * 2 + 1)
+            verb = match.group(i * 2 + 2)
+            # Turn into Word object and add to list for this type
+            w = Word(gen, verb)
+            self.verbs[key] = w
+            # It's possible this word can be split up, eg "was|were"
+            if key == "pret":
+                self.pret_plur = w.split()
+
+        """
+        For each word:
+        - Replace (CONS), (VOWEL) and (VOWELS) macros: "(VOWEL)ys" -> "[aeiou]ys"
+        - Replace - and * with the proper regex variant: "-ys" -> ".+ys"
+        - Split up word (e.g. "[aeiou]ys") into restriction (e.g. "[aeiou]") and remainder (e.g. "ys")
+        """
+        for word in self.verbs.values():
+            word.expand_cons_vowel()
+            word.expand_dash_star()
+            word.restrict_word()
+
+    def replace_hyphens(self, repl: str):
+        for word in self.verbs.values():
+            word.word = word.word.replace("-", repl)
+
+    def __getitem__(self, key):
+        return self.verbs[key]
+
+    def __getattribute__(self, name):
+        try:
+            return super().__getattribute__(name)
+        except AttributeError:
+            return self.verbs[name]
+
+    def has_gen(self) -> bool:
+        """
+        Returns true iff there is at least one verb between the five that is prefixed with * or -
+        """
+        return any(self.verbs[key].gen for key in self.verbs)
+
+    def __str__(self) -> str:
+        return "\n".join(f"{key: <9}: {self.verbs[key]}" for key in self.verbs) + (f"\npret_plur: {self.pret_plur}" if self.pret_plur else "")
+
+
+class Reader(object):
+    def __init__(self, fname: str):
+        types = ["plural", "singular", "past", "pres_part", "past_part"]
+        self.patterns: Dict[str, List[Dict[str, str]]] = {key: [] for key in types}
+        self.literals: Dict[str, Dict[str, str]] = {key: {} for key in types}
+        self.words: Dict[str, Set[str]] = {key: set() for key in types}
+        self.fname = fname
+
+    def get_readlines(self) -> List[str]:
+        with open(self.fname, "r", encoding="utf8") as f:
+            return f.readlines()
+
+    def parse_file(self):
+        """
+        Fill `pattern`, `literal` and `words`
+        """
+        lines = self.get_readlines()
+
+        for line in lines:
+            # Skip empty or comment lines
+            if COMMENT_LINE_PAT.match(line) or BLANK_LINE_PAT.match(line):
+                continue
+
+            # Extract data
+            match = DATA_PAT.match(line)
+            if match:
+                verb = Verb(match)
+            else:
+                raise ValueError(f"Unknown input: {line!r}")
+
+            if verb.has_gen():
+                self.optionally_add_pattern(self.patterns["plural"], {
+                    "is": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
+                    "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
+                    "to": f'"{verb.plur.word}"'
+                })
+                self.optionally_add_pattern(self.patterns["singular"], {
+                    "is": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
+                    "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
+                    "to": f'"{verb.sing.word}"'
+                })
+                if verb.pret.word != "_":
+                    self.optionally_add_pattern(self.patterns["past"], {
+                        "is": f"({verb.pret.gen}{verb.pret.restrict}){verb.pret.word}",
+                        "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
+                        "to": f'"{verb.pret.word}"'
+                    })
+                    self.optionally_add_pattern(self.patterns["past"], {
+                        "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
+                        "to": f'"{verb.pret.word}"'
+                    })
+                if verb.pres.word != "_":
+                    self.optionally_add_pattern(self.patterns["pres_part"], {
+                        "is": f"({verb.pres.gen}{verb.pres.restrict}){verb.pres.word}",
+                        "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
+                        "to": f'"{verb.pres.word}"'
+                    })
+                    self.optionally_add_pattern(self.patterns["pres_part"], {
+                        "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
+                        "to": f'"{verb.pres.word}"'
+                    })
+                if verb.past.word != "_":
+                    self.optionally_add_pattern(self.patterns["past_part"], {
+                        "is": f"({verb.past.gen}{verb.past.restrict}){verb.past.word}",
+                        "from": f"({verb.sing.gen}{verb.sing.restrict}){verb.sing.word}",
+                        "to": f'"{verb.past.word}"'
+                    })
+                    self.optionally_add_pattern(self.patterns["past_part"], {
+                        "from": f"({verb.plur.gen}{verb.plur.restrict}){verb.plur.word}",
+                        "to": f'"{verb.past.word}"'
+                    })
+
+            if not (verb.sing.gen and verb.plur.gen and verb.pret.gen):
+                self.add_literals_and_words(verb)
+
+                # If there is a hyphen in the singular verb, replace the hyphens
+                # in all verbs, and add those to the literals and words too
+                if "-" in verb.sing.word:
+                    verb.replace_hyphens(" ")
+                    self.add_literals_and_words(verb)
+
+    def optionally_add_pattern(self, collection, dict_to_add):
+        if dict_to_add["from"] not in (pattern["from"] for pattern in collection):
+            collection.append(dict_to_add)
+
+    def optionally_add_literal(self, collection, key, word):
+        if key == "_" or word == "_":
+            return
+        if key not in collection:
+            collection[key] = word
+
+    def add_literals_and_words(self, verb):
+        self.optionally_add_literal(
+            self.literals["plural"], verb.sing.word, verb.plur.word)
+        self.optionally_add_literal(
+            self.literals["singular"], verb.plur.word, verb.sing.word)
+
+        self.words["singular"].add(verb.sing.word)
+        self.words["plural"].add(verb.plur.word)
+
+        if verb.pret.word:
+            self.words["past"].add(verb.pret.word)
+
+            self.optionally_add_literal(
+                self.literals["past"], verb.sing.word, verb.pret.word)
+            self.optionally_add_literal(
+                self.literals["past"], verb.past.word, verb.pret.word)
+            self.optionally_add_literal(
+                self.literals["past"], verb.pres.word, verb.pret.word)
+            self.optionally_add_literal(
+                self.literals["past"], verb.past.word, verb.pret.word)
+
+            if verb.pret_plur:
+                self.optionally_add_literal(
+                    self.literals["past"], verb.plur.word, verb.pret_plur)
+                self.words["past"].add(verb.pret_plur)
+            else:
+                self.optionally_add_literal(
+                    self.literals["past"], verb.plur.word, verb.pret.word)
+
+        if verb.pres.word:
+            self.words["pres_part"].add(verb.pres.word)
+
+            self.optionally_add_literal(
+                self.literals["pres_part"], verb.sing.word, verb.pres.word)
+            self.optionally_add_literal(
+                self.literals["pres_part"], verb.plur.word, verb.pres.word)
+            self.optionally_add_literal(
+                self.literals["pres_part"], verb.pret.word, verb.pres.word)
+            self.optionally_add_literal(
+                self.literals["pres_part"], verb.pres.word, verb.pres.word)
+            self.optionally_add_literal(
+                self.literals["pres_part"], verb.past.word, verb.pres.word)
+
+        if verb.past.word:
+            self.words["past_part"].add(verb.past.word)
+
+            self.optionally_add_literal(
+                self.literals["past_part"], verb.sing.word, verb.past.word)
+            self.optionally_add_literal(
+                self.literals["past_part"], verb.plur.word, verb.past.word)
+            self.optionally_add_literal(
+                self.literals["past_part"], verb.pret.word, verb.past.word)
+            self.optionally_add_literal(
+                self.literals["past_part"], verb.pres.word, verb.past.word)
+            self.optionally_add_literal(
+                self.literals["past_part"], verb.past.word, verb.past.word)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+
+from inflex import Adjective, Noun, Verb
+from inflex import cache, lexicon, paradigm_core, snapshot
+
+
+class TestAsRegex(unittest.TestCase):
+    def setUp(self):
+        cache.disable()
+        cache.clear()
+
+    def tearDown(self):
+        cache.disable()
+        cache.enable(maxsize=4096)
+        cache.disable()
+
+    def test_patterns(self):
+        self.assertEqual(Noun("cherub").as_regex().pattern, "cherubs|cherubim|cherub")
+        self.assertEqual(Noun("cherub").classical().as_regex().pattern, "cherubim|cherub")
+        self.assertEqual(Verb("eat").as_regex().pattern, "eats|eating|eaten|eat|ate")
+        self.assertEqual(Adjective("my").as_regex().pattern, "our|my")
+        self.assertEqual(Verb("eat").as_regex(word_boundaries=True).pattern, r"\b(?:eats|eating|eaten|eat|ate)\b")
+        self.assertEqual(Noun("mother-in-law").as_regex(True).pattern, r"\b(?:mothers\-in\-law|mother\-in\-law)\b")
+
+        pattern = Noun("child").as_regex(word_boundaries=True)
+        self.assertTrue(pattern.fullmatch("CHILDREN"))
+        self.assertEqual(pattern.findall("Children, childhood and a child."), ["Children", "child"])
+
+    def test_per_object(self):
+        noun = Noun("child")
+        pattern = noun.as_regex()
+        self.assertIs(noun.as_regex(), pattern)
+        self.assertIsNot(noun.as_regex(word_boundaries=True), pattern)
+        self.assertIs(noun.as_regex(word_boundaries=True), noun.as_regex(True))
+        self.assertIs(noun.as_regex(), noun.as_regex())
+        self.assertIs(Noun.get("child").as_regex(), Noun.get("child").as_regex())
+        self.assertEqual(cache.cache_info("term.patterns")["term.patterns"].misses, 0)
+
+        # Arguments equal to the defaults, passed positionally or by keyword, share one pattern
+        size = len(noun._memo)  # pylint: disable=W0212
+        self.assertIs(noun.as_regex(False), pattern)
+        self.assertIs(noun.as_regex(word_boundaries=False), pattern)
+        self.assertEqual(len(noun._memo), size)  # pylint: disable=W0212
+        with self.assertRaises(TypeError):
+            noun.as_regex(boundaries=True)
+        with self.assertRaises(TypeError):
+            noun.as_regex(True, False)
+
+    def test_shared(self):
+        cache.enable("term.patterns")
+        pattern = Noun("child").as_regex()
+        self.assertIs(Noun("child").as_regex(), pattern)
+        self.assertIs(Noun("child").as_regex(word_boundaries=True), Noun("child").as_regex(word_boundaries=True))
+        info = cache.cache_info("term.patterns")["term.patterns"]
+        self.assertEqual((info.hits, info.misses), (2, 2))
+        self.assertIs(Noun("child").as_regex(False), pattern)
+        self.assertIs(Noun("child").as_regex(word_boundaries=False), pattern)
+        self.assertIs(Noun("child").as_regex(True), Noun("child").as_regex(word_boundaries=True))
+        info = cache.cache_info("term.patterns")["term.patterns"]
+        self.assertEqual((info.hits, info.misses), (6, 2))
+
+        # Patterns are kept apart per class, casing and classical flag
+        self.assertEqual(Verb("child").as_regex().pattern, "childs|childing|childed|child")
+        self.assertEqual(Noun("Child").as_regex().pattern, "Children|Child")
+        self.assertEqual(Noun("formula").as_regex().pattern, "formulas|formulae|formula")
+        self.assertEqual(Noun("formula").classical().as_regex().pattern, "formulae|formula")
+        info = cache.cache_info("term.patterns")["term.patterns"]
+        self.assertEqual((info.hits, info.misses), (6, 6))
+
+    def test_shared_equals_uncached(self):
+        terms = ["show--off", "x - y", "  x  -  y ", "mother-in-law", "son  of a  gun", "Child", " cherub "]
+        expected = [(Noun(term).as_regex(), Noun(term).as_regex(True), Noun(term).classical().as_regex(),
+                     Verb(term).as_regex()) for term in terms]
+        cache.enable("term.patterns")
+        for _ in range(2):
+            for term, patterns in zip(terms, expected):
+                self.assertEqual((Noun(term).as_regex(), Noun(term).as_regex(True),
+                                  Noun(term).classical().as_regex(), Verb(term).as_regex()), patterns, term)
+
+        # Terms differing only in whitespace share no patterns
+        self.assertNotEqual(Noun("show-off").as_regex(), Noun("show--off").as_regex())
+        self.assertNotEqual(Noun("x - y").as_regex(), Noun("x  -  y").as_regex())
+
+        # Nor do objects of which the term was assigned
+        noun = Noun("child")
+        noun.term = "cherub"
+        self.assertEqual(noun.as_regex().pattern, "cherubs|cherubim|cherub")
+        self.assertEqual(Noun("child").as_regex().pattern, "children|child")
+
+    def test_invalidate(self):
+        cache.enable("term.patterns")
+        originals = (paradigm_core.noun_paradigms.copy(), paradigm_core.verb_paradigms.copy())
+        Noun.get("child").as_regex()
+        try:
+            lexicon._invalidate()  # pylint: disable=W0212
+            self.assertEqual(cache.cache_info("term.patterns")["term.patterns"].currsize, 0)
+            # The shared instance compiles its pattern again
+            Noun.get("child").as_regex()
+            Noun("child").as_regex()
+            info = cache.cache_info("term.patterns")["term.patterns"]
+            self.assertEqual((info.hits, info.misses), (1, 1))
+        finally:
+            for table, original in zip((paradigm_core.noun_paradigms, paradigm_core.verb_paradigms), originals):
+                table.update(original)
+
+    def test_snapshot(self):
+        cache.enable("term.patterns")
+        expected = [Noun("Child").as_regex(), Verb("fly").as_regex(word_boundaries=True),
+                    Noun("cherub").classical().as_regex()]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "inflex.snapshot")
+            snapshot.save(path)
+            cache.clear("term.patterns")
+            self.assertTrue(snapshot.load(path))
+            self.assertEqual(cache.cache_info("term.patterns")["term.patterns"].currsize, 3)
+            self.assertEqual([Noun("Child").as_regex(), Verb("fly").as_regex(word_boundaries=True),
+                              Noun("cherub").classical().as_regex()], expected)
+            self.assertEqual(cache.cache_info("term.patterns")["term.patterns"].hits, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
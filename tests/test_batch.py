@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from inflex import Adjective, Noun, Verb
+from inflex import batch
+
+
+class TestBatch(unittest.TestCase):
+    terms = ["book", "Child", "book", " fly ", "I", "mother-in-law", "book", "my", "", "Child"]
+
+    def test_equivalence(self):
+        for function, method in [
+                (batch.plural_nouns, lambda term: Noun(term).plural()),
+                (batch.singular_nouns, lambda term: Noun(term).singular()),
+                (lambda terms: batch.plural_nouns(terms, classical=True),
+                 lambda term: Noun(term).classical().plural()),
+                (lambda terms: batch.plural_nouns(terms, person=1), lambda term: Noun(term).plural(1)),
+                (batch.plural_verbs, lambda term: Verb(term).plural()),
+                (batch.singular_verbs, lambda term: Verb(term).singular()),
+                (batch.past_verbs, lambda term: Verb(term).past()),
+                (batch.pres_part_verbs, lambda term: Verb(term).pres_part()),
+                (batch.past_part_verbs, lambda term: Verb(term).past_part()),
+                (batch.plural_adjectives, lambda term: Adjective(term).plural()),
+                (batch.singular_adjectives, lambda term: Adjective(term).singular()),
+                (batch.comparatives, lambda term: Adjective(term).comparative()),
+                (batch.superlatives, lambda term: Adjective(term).superlative())]:
+            with self.subTest():
+                self.assertEqual(list(function(self.terms)), [method(term) for term in self.terms])
+
+    def test_dedupe(self):
+        calls = []
+        def convert(term):
+            calls.append(term)
+            return term.upper()
+
+        output = list(batch._map_unique(convert, iter(self.terms), cache_size=100)) # pylint: disable=W0212
+        self.assertEqual(output, [term.upper() for term in self.terms])
+        self.assertEqual(calls, list(dict.fromkeys(self.terms)))
+
+        calls.clear()
+        output = list(batch._map_unique(convert, ["a", "b", "a", "c", "b"], cache_size=1)) # pylint: disable=W0212
+        self.assertEqual(output, ["A", "B", "A", "C", "B"])
+        self.assertEqual(calls, ["a", "b", "a", "c", "b"])
+
+    def test_streaming(self):
+        def infinite():
+            while True:
+                yield "walk"
+                yield "run"
+
+        output = batch.past_verbs(infinite())
+        self.assertEqual([next(output) for _ in range(4)], ["walked", "ran", "walked", "ran"])
+
+    def test_invalid_person(self):
+        for function in (batch.plural_nouns, batch.singular_nouns, batch.plural_verbs, batch.singular_verbs,
+                         batch.plural_adjectives, batch.singular_adjectives):
+            with self.subTest(function=function.__name__):
+                with self.assertRaises(ValueError):
+                    function(["walk"], person=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from inflex import Adjective, Noun
+from inflex import cache, noun_core, verb_core
+from tests import test_noun_core_to_modern_plural
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        cache.enable()
+        cache.clear()
+
+    def tearDown(self):
+        cache.disable()
+        cache.enable(maxsize=4096)
+        cache.disable()
+
+    def test_disabled_by_default(self):
+        cache.disable()
+        Noun("cat").plural()
+        self.assertFalse(cache.is_enabled("noun_core.convert_to_modern_plural"))
+        self.assertEqual(cache.cache_info("noun_core.convert_to_modern_plural")["noun_core.convert_to_modern_plural"],
+                         cache.CacheInfo(hits=0, misses=0, evictions=0, maxsize=4096, currsize=0))
+
+    def test_hits_and_misses(self):
+        # Count the calls reaching the core functions
+        cache.disable("term")
+        self.assertEqual(Noun("cat").plural(), "cats")
+        self.assertEqual(Noun("cat").plural(), "cats")
+        info = cache.cache_info("noun_core.convert_to_modern_plural")["noun_core.convert_to_modern_plural"]
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        cache.clear("noun_core")
+        info = cache.cache_info("noun_core.convert_to_modern_plural")["noun_core.convert_to_modern_plural"]
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_recursive(self):
+        for _ in range(3):
+            self.assertEqual(Noun("mother-in-law").plural(), "mothers-in-law")
+            self.assertEqual(Noun("mothers-in-law").singular(), "mother-in-law")
+            self.assertEqual(noun_core.convert_to_modern_plural("mother-in-law"), "mothers-in-law")
+        info = cache.cache_info("noun_core.convert_to_modern_plural")["noun_core.convert_to_modern_plural"]
+        self.assertGreater(info.hits, 0)
+
+    def test_keyword_arguments(self):
+        lru_cache = cache.LRUCache(lambda word, suffix="s": word + suffix, "test.append")
+        lru_cache.enable()
+        self.assertEqual(lru_cache("sheep", suffix=""), "sheep")
+        self.assertEqual(lru_cache("sheep"), "sheeps")
+        self.assertEqual(lru_cache("sheep", suffix=""), "sheep")
+        self.assertEqual(lru_cache.cache_info(), cache.CacheInfo(hits=1, misses=2, evictions=0, maxsize=4096, currsize=2))
+
+    def test_deprecated_argument(self):
+        # The is_word_plural argument of is_singular is still accepted, but ignored
+        with self.assertWarns(DeprecationWarning):
+            self.assertTrue(noun_core.is_singular("sheep", is_word_plural=True))
+        with self.assertWarns(DeprecationWarning):
+            self.assertFalse(noun_core.is_singular("sheeps", False))
+        self.assertEqual(noun_core.is_singular("sheep"), noun_core.is_singular.func("sheep"))
+
+    def test_eviction(self):
+        cache.enable("verb_core.convert_to_past", maxsize=2)
+        for word in ["walks", "talks", "walks", "runs"]:
+            verb_core.convert_to_past(word)
+        info = cache.cache_info("verb_core.convert_to_past")["verb_core.convert_to_past"]
+        self.assertEqual(info, cache.CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2))
+
+        cache.enable("verb_core.convert_to_past", maxsize=0)
+        self.assertEqual(verb_core.convert_to_past("walks"), "walked")
+        info = cache.cache_info("verb_core.convert_to_past")["verb_core.convert_to_past"]
+        self.assertEqual((info.evictions, info.currsize), (3, 0))
+
+    def test_unknown_name(self):
+        with self.assertRaises(KeyError):
+            cache.enable("noun_core.convert_to_dual")
+
+    def test_corpus(self):
+        # Count the calls reaching the core functions
+        cache.disable("term")
+        for _ in range(2):
+            for test_case in test_noun_core_to_modern_plural.TestNounToModernPlural.test_args:
+                with self.subTest():
+                    self.assertEqual(Noun(test_case["in"]).plural(), test_case["out"])
+        self.assertEqual(Adjective("this").plural(), "these")
+        self.assertEqual(Adjective("this").plural(), "these")
+        info = cache.cache_info("adjective_core")["adjective_core.convert_to_plural"]
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_canonical_forms(self):
+        for term, plural in [("book", "books"), ("Book", "Books"), (" book ", " books "),
+                             ("Old Book", "Old Books"), ("old book", "old books")]:
+            with self.subTest():
+                self.assertEqual(Noun(term).plural(), plural)
+        info = cache.cache_info("term.canonical_forms")["term.canonical_forms"]
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 2, 2))
+
+    def test_canonical_forms_case_sensitive(self):
+        for term in ["Jerry", "jerry", "FSM", "fsm", "BOOK", "book", "I", "i", "McDonald", "St_john",
+                     "Big - Dog", "a--b", "mother-in-law", "About Him"]:
+            with self.subTest():
+                for _ in range(2):
+                    self.assertEqual(Noun(term).plural(), Noun(term).plural.__wrapped__(Noun(term)))
+                    self.assertEqual(Adjective(term).plural(), Adjective(term).plural.__wrapped__(Adjective(term)))
+                    self.assertEqual(Noun(term).classical().plural(),
+                                     Noun(term).classical().plural.__wrapped__(Noun(term).classical()))
+
+
+if __name__ == "__main__":
+    unittest.main()
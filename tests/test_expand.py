@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from typing import Iterator, List
+
+from inflex import Noun, Verb, expand
+
+VOCABULARY = ["child", "fly", "", "  formula\n", "sheep", "go", "datum", "walk", "mouse"]
+
+
+def interrupted(vocabulary: List[str], count: int) -> Iterator[str]:
+    yield from vocabulary[:count]
+    raise KeyboardInterrupt()
+
+
+class TestExpand(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "expansions.tsv")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_forms(self):
+        self.assertEqual(expand.noun_forms("formula"), ["formula", "formulas", "formulae"])
+        self.assertEqual(expand.verb_forms("fly"), ["fly", "flies", "flew", "flying", "flown"])
+        # The same forms as matched by `as_regex`
+        for lemma in ("cherub", "Child", "sheep"):
+            self.assertTrue(all(Noun(lemma).as_regex().fullmatch(form) for form in expand.noun_forms(lemma)))
+        for lemma in ("eat", "be", "walk"):
+            self.assertTrue(all(Verb(lemma).as_regex().fullmatch(form) for form in expand.verb_forms(lemma)))
+
+    def test_build(self):
+        self.assertEqual(expand.build(VOCABULARY, self.path, processes=1), 16)
+        with open(self.path, encoding="utf8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[:4], ["child\tnoun\tchildren", "child\tverb\tchilds\tchilded\tchilding",
+                                     "fly\tnoun\tflies\tflys", "fly\tverb\tflies\tflew\tflying\tflown"])
+        self.assertIn("sheep\tnoun", lines)
+        self.assertEqual(list(expand.read(self.path))[2], ("fly", "noun", ["flies", "flys"]))
+        self.assertFalse(os.path.exists(self.path + ".progress"))
+
+        # Worker processes write the same file, regardless of the chunk size
+        with open(self.path, "rb") as f:
+            expected = f.read()
+        for chunk_size in (1, 4, 100):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(expand.build(iter(VOCABULARY), self.path, processes=2, chunk_size=chunk_size), 16)
+                with open(self.path, "rb") as f:
+                    self.assertEqual(f.read(), expected)
+
+    def test_pos(self):
+        self.assertEqual(expand.build(VOCABULARY, self.path, pos="verb", processes=1), 8)
+        self.assertEqual({pos for _, pos, _ in expand.read(self.path)}, {"verb"})
+        with self.assertRaises(ValueError):
+            expand.build(VOCABULARY, self.path, pos="adjective", processes=1)
+
+    def test_resume(self):
+        expand.build(VOCABULARY, self.path, pos="noun", processes=1)
+        with open(self.path, "rb") as f:
+            expected = f.read()
+        os.remove(self.path)
+
+        with self.assertRaises(KeyboardInterrupt):
+            expand.build(interrupted(VOCABULARY, 5), self.path, pos="noun", processes=1, chunk_size=2)
+        self.assertTrue(os.path.exists(self.path + ".progress"))
+        # Output of a chunk that was only partially written is discarded
+        with open(self.path, "ab") as f:
+            f.write(b"sheep\tno")
+
+        with self.assertRaises(ValueError):
+            expand.build(VOCABULARY, self.path, pos="verb", processes=1, chunk_size=2)
+        self.assertEqual(expand.build(VOCABULARY, self.path, pos="noun", processes=1, chunk_size=2), 5)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), expected)
+        self.assertFalse(os.path.exists(self.path + ".progress"))
+
+        # A completed build is not resumed
+        self.assertEqual(expand.build(VOCABULARY, self.path, pos="noun", processes=1), 8)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), expected)
+
+    def test_invalid_lemma(self):
+        for lemma in ("sheep\tdog", "sheep\rdog", "sheep\ndog"):
+            with self.subTest(lemma=lemma):
+                with self.assertRaises(ValueError):
+                    expand.build(["child", lemma], self.path, processes=1)
+        # Surrounding whitespace is stripped
+        self.assertEqual(expand.build(["\tchild\r\n"], self.path, pos="noun", processes=1), 1)
+
+    def test_resume_missing_output(self):
+        with self.assertRaises(KeyboardInterrupt):
+            expand.build(interrupted(VOCABULARY, 5), self.path, pos="noun", processes=1, chunk_size=2)
+        os.remove(self.path)
+        # The build starts over if the expansion file is missing or truncated
+        self.assertEqual(expand.build(VOCABULARY, self.path, pos="noun", processes=1, chunk_size=2), 8)
+
+        with self.assertRaises(KeyboardInterrupt):
+            expand.build(interrupted(VOCABULARY, 5), self.path, pos="noun", processes=1, chunk_size=2)
+        with open(self.path, "r+b") as f:
+            f.truncate(3)
+        self.assertEqual(expand.build(VOCABULARY, self.path, pos="noun", processes=1, chunk_size=2), 8)
+        self.assertEqual(len(list(expand.read(self.path))), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
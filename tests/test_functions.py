@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+import inflex
+from inflex import Adjective, Noun, Verb, paradigm_core
+
+
+class TestFunctions(unittest.TestCase):
+    words = ["book", "child", "fly", "i", "my", "mine", "is", "are", "to me", "dog's", "pretty", "open",
+             "Book", "CHILD", " fly ", "I", "mother-in-law", "high and mighty", "'", ""]
+
+    def test_equivalence(self):
+        for function, method in [
+                (inflex.noun_singular, lambda word: Noun(word).singular()),
+                (lambda word: inflex.noun_singular(word, 1), lambda word: Noun(word).singular(1)),
+                (inflex.noun_plural, lambda word: Noun(word).plural()),
+                (lambda word: inflex.noun_plural(word, 3), lambda word: Noun(word).plural(3)),
+                (lambda word: inflex.noun_plural(word, classical=True),
+                 lambda word: Noun(word).classical().plural()),
+                (inflex.verb_singular, lambda word: Verb(word).singular()),
+                (lambda word: inflex.verb_singular(word, 1), lambda word: Verb(word).singular(1)),
+                (inflex.verb_plural, lambda word: Verb(word).plural()),
+                (inflex.verb_past, lambda word: Verb(word).past()),
+                (inflex.verb_pres_part, lambda word: Verb(word).pres_part()),
+                (inflex.verb_past_part, lambda word: Verb(word).past_part()),
+                (inflex.adj_singular, lambda word: Adjective(word).singular()),
+                (lambda word: inflex.adj_plural(word, 2), lambda word: Adjective(word).plural(2)),
+                (inflex.adj_comparative, lambda word: Adjective(word).comparative()),
+                (lambda word: inflex.adj_superlative(word, True),
+                 lambda word: Adjective(word).superlative(True))]:
+            for word in self.words:
+                with self.subTest(word=word):
+                    self.assertEqual(function(word), method(word))
+
+    def test_preserve_case(self):
+        self.assertEqual(inflex.noun_plural("book", preserve_case=False), "books")
+        self.assertEqual(inflex.noun_plural("Book"), "Books")
+        self.assertEqual(inflex.verb_past("fly", preserve_case=False), "flew")
+        self.assertEqual(inflex.verb_past(" Fly "), " Flew ")
+        self.assertEqual(inflex.adj_superlative("pretty", preserve_case=False), "prettiest")
+        self.assertEqual(inflex.adj_comparative("open", preserve_case=False), "more open")
+
+    def test_paradigms(self):
+        # Precomputed forms are used with and without `preserve_case`
+        with mock.patch.dict(paradigm_core.noun_paradigms, {"book": ("bookz", "booki", "book")}), \
+                mock.patch.dict(paradigm_core.verb_paradigms, {"fly": ("flies", "fly", "flewz", "flying", "flown")}):
+            self.assertEqual(inflex.noun_plural("book"), "bookz")
+            self.assertEqual(inflex.noun_plural("book", preserve_case=False), "bookz")
+            self.assertEqual(inflex.noun_plural("book", classical=True, preserve_case=False), "booki")
+            self.assertEqual(inflex.verb_past("fly", preserve_case=False), "flewz")
+            # Without `preserve_case`, the lowercase word is looked up
+            self.assertEqual(inflex.noun_plural("Book", preserve_case=False), "bookz")
+            self.assertEqual(inflex.verb_past("FLY", preserve_case=False), "flewz")
+            # Other persons aren't precomputed
+            self.assertEqual(inflex.noun_plural("book", 3, preserve_case=False), "books")
+
+    def test_invalid_person(self):
+        for function in [inflex.noun_singular, inflex.noun_plural, inflex.verb_singular,
+                         inflex.verb_plural, inflex.adj_singular, inflex.adj_plural]:
+            with self.assertRaises(ValueError):
+                function("book", 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
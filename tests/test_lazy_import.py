@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+import subprocess
+import sys
+import unittest
+
+import inflex
+from inflex.lazy_regex import LazyPattern, compile_all
+
+
+class TestLazyImport(unittest.TestCase):
+    def loaded_modules(self, code: str) -> set:
+        output = subprocess.run(
+            [sys.executable, "-c", code + "; import sys; print(' '.join(sys.modules))"],
+            stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+        return set(output.split())
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Module __getattr__ requires Python 3.7")
+    def test_import_is_lazy(self):
+        modules = self.loaded_modules("import inflex")
+        self.assertNotIn("inflex.noun_core", modules)
+        self.assertNotIn("inflex.verb_core", modules)
+
+        modules = self.loaded_modules("from inflex import Noun")
+        self.assertIn("inflex.noun_core", modules)
+        self.assertNotIn("inflex.verb_core", modules)
+
+    def test_attributes(self):
+        self.assertIs(inflex.Noun, __import__("inflex.noun", fromlist=["Noun"]).Noun)
+        self.assertIn("Verb", dir(inflex))
+        with self.assertRaises(AttributeError):
+            inflex.Pronoun  # pylint: disable=W0104
+        from inflex import noun_core  # pylint: disable=C0415
+        self.assertTrue(hasattr(noun_core, "convert_to_singular"))
+
+    def test_preload(self):
+        inflex.preload()
+        self.assertEqual(compile_all(), 0)
+        self.assertEqual(inflex.Verb("fly").past(), "flew")
+
+    def test_lazy_pattern(self):
+        pattern = LazyPattern(r"^(.+)es$", flags=re.I)
+        self.assertEqual(pattern.pattern, r"^(.+)es$")
+        self.assertIsNone(pattern._compiled)  # pylint: disable=W0212
+        self.assertEqual(pattern.match("FOXES").group(1), "FOX")
+        self.assertEqual(pattern.groups, 1)
+        self.assertIsNotNone(pattern._compiled)  # pylint: disable=W0212
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import inflex
+from inflex import Noun, Verb
+from inflex import lemmatizer, lexicon, noun_core, paradigm_core
+from inflex.lemmatizer import Analysis
+
+
+class TestLemmatizer(unittest.TestCase):
+    def test_nouns(self):
+        self.assertEqual(inflex.lemmatize("children"), Analysis("child", "noun", "plural"))
+        self.assertEqual(inflex.lemmatize("child"), ("child", "noun", "singular"))
+        self.assertEqual(inflex.lemmatize("formulae"), ("formula", "noun", "plural"))
+        self.assertEqual(inflex.lemmatize("sheep"), ("sheep", "noun", "singular"))
+        self.assertEqual(inflex.lemmatize("Geese"), ("Goose", "noun", "plural"))
+
+    def test_verbs(self):
+        self.assertEqual(inflex.lemmatize("flew"), ("fly", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("wrung"), ("wring", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("flying"), ("fly", "verb", "pres_part"))
+        self.assertEqual(inflex.lemmatize("flown"), ("fly", "verb", "past_part"))
+        self.assertEqual(inflex.lemmatize("put"), ("put", "verb", "plural"))
+        self.assertEqual(inflex.lemmatize("FLEW"), ("FLY", "verb", "past"))
+        # Past forms which are in `plural_of` are analysed as the past of their lemma
+        self.assertEqual(inflex.lemmatize("was"), ("are", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("were"), ("are", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("could"), ("can", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("rents", pos="verb"), ("rent", "verb", "singular"))
+
+    def test_pos(self):
+        self.assertEqual(inflex.lemmatize("flies"), ("fly", "noun", "plural"))
+        self.assertEqual(inflex.lemmatize("flies", pos="verb"), ("fly", "verb", "singular"))
+        self.assertEqual(inflex.lemmatize("children", pos="noun"), ("child", "noun", "plural"))
+        with self.assertRaises(ValueError):
+            inflex.lemmatize("flies", pos="adjective")
+        with self.assertRaises(ValueError):
+            inflex.lemmatize_all(["flies"], pos="adjective")
+
+    def test_rules(self):
+        # Unknown tokens are analysed like `Noun.lemma` and `Verb.lemma`
+        self.assertEqual(inflex.lemmatize("glorps"), ("glorp", "noun", "plural"))
+        self.assertEqual(inflex.lemmatize("glorps", pos="verb"), ("glorp", "verb", "singular"))
+        self.assertEqual(inflex.lemmatize("glorped"), ("glorp", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("glorping"), ("glorp", "verb", "pres_part"))
+        self.assertEqual(inflex.lemmatize("glorp"), ("glorp", "noun", "singular"))
+        self.assertEqual(inflex.lemmatize("glorp", pos="verb"), ("glorp", "verb", "plural"))
+
+    def test_regular_verbs(self):
+        # The regular rules are undone, and the lemma must be inflected back into the token
+        for token, lemma, form in (("jumped", "jump", "past"),
+                                   ("baked", "bake", "past"),
+                                   ("hopped", "hop", "past"),
+                                   ("hoped", "hope", "past"),
+                                   ("called", "call", "past"),
+                                   ("tried", "try", "past"),
+                                   ("died", "die", "past"),
+                                   ("agreed", "agree", "past"),
+                                   ("running", "run", "pres_part"),
+                                   ("baking", "bake", "pres_part"),
+                                   ("dying", "die", "pres_part")):
+            with self.subTest(token=token):
+                self.assertEqual(inflex.lemmatize(token), (lemma, "verb", form))
+                self.assertEqual(getattr(Verb(lemma), form)(), token)
+
+    def test_strong_verbs(self):
+        # The irregular rules of `verb_core` are inverted
+        for token, lemma, form in (("ran", "run", "past"),
+                                   ("wrote", "write", "past"),
+                                   ("took", "take", "past"),
+                                   ("thought", "think", "past"),
+                                   ("outran", "outrun", "past"),
+                                   ("written", "write", "past_part")):
+            with self.subTest(token=token):
+                self.assertEqual(inflex.lemmatize(token), (lemma, "verb", form))
+
+        # Known limitation: Strong verbs missing from the dictionaries and rules
+        self.assertEqual(inflex.lemmatize("throve", pos="verb"), ("throve", "verb", "plural"))
+
+    def test_short_stems(self):
+        # Removing "-ed" or "-ing" must leave a stem with at least two letters and a vowel,
+        # and the irregular rules and known words are preferred over the regular rules
+        for token, lemma, form in (("fed", "fed", "past"),
+                                   ("bred", "bred", "past"),
+                                   ("wed", "wed", "past"),
+                                   ("sled", "sled", "past"),
+                                   ("led", "lead", "past"),
+                                   ("bled", "bleed", "past"),
+                                   ("sped", "speed", "past"),
+                                   ("sledding", "sled", "pres_part")):
+            with self.subTest(token=token):
+                self.assertEqual(inflex.lemmatize(token), (lemma, "verb", form))
+                self.assertEqual(inflex.lemmatize(token, pos="verb"), (lemma, "verb", form))
+        # Words ending in "-ing" that aren't present participles
+        self.assertEqual(inflex.lemmatize("thing"), ("thing", "noun", "singular"))
+        self.assertEqual(inflex.lemmatize("king"), ("king", "noun", "singular"))
+
+    def test_casing(self):
+        # The casing doesn't change the analysis, and is applied onto the lemma
+        self.assertEqual(inflex.lemmatize("RAN"), ("RUN", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("Running"), ("Run", "verb", "pres_part"))
+        self.assertEqual(inflex.lemmatize("Jumped"), ("Jump", "verb", "past"))
+        self.assertEqual(inflex.lemmatize("Fed"), ("Fed", "verb", "past"))
+        # Tokens which are their own lemma keep their casing
+        self.assertEqual(inflex.lemmatize("I", pos="verb").lemma, "I")
+        self.assertEqual(inflex.lemmatize("I").lemma, "I")
+
+    def test_matches_lemma(self):
+        # Known nouns have the same lemma as computed by `Noun.lemma`
+        for word, analysis in lemmatizer._get_indices()["noun"].items():  # pylint: disable=W0212
+            if analysis.form == "plural":
+                self.assertEqual(Noun(word).lemma(), analysis.lemma, word)
+        for word, analysis in lemmatizer._get_indices()["verb"].items():  # pylint: disable=W0212
+            if analysis.form in ("singular", "plural"):
+                self.assertEqual(Verb(word).lemma(), analysis.lemma, word)
+
+    def test_lemmatize_all(self):
+        tokens = ["cats", "ate", "Mice", "glorps", "cats", "glorps", "flies"]
+        self.assertEqual(list(inflex.lemmatize_all(tokens)), [inflex.lemmatize(token) for token in tokens])
+        self.assertEqual(list(inflex.lemmatize_all(tokens, pos="verb", cache_size=1)),
+                         [inflex.lemmatize(token, pos="verb") for token in tokens])
+
+        # Known tokens are not analysed using the rules, and unknown tokens only once
+        with mock.patch.object(lemmatizer, "_analyse", wraps=lemmatizer._analyse) as analyse:  # pylint: disable=W0212
+            list(inflex.lemmatize_all(tokens))
+        self.assertEqual([call[0][0] for call in analyse.call_args_list], ["cats", "Mice", "glorps"])
+
+    def test_lexicon(self):
+        tables = [noun_core.modern_plural_of, noun_core.classical_plural_of, noun_core.singular_of,
+                  paradigm_core.noun_paradigms, paradigm_core.verb_paradigms]
+        originals = [table.copy() for table in tables]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "custom.lei")
+            with open(path, "w", encoding="utf8") as f:
+                f.write("    glorp  =>  glorpen\n")
+            try:
+                self.assertEqual(inflex.lemmatize("glorpen"), ("glorpen", "noun", "singular"))
+                inflex.load_lexicon(path, use_cache=False)
+                self.assertEqual(inflex.lemmatize("glorpen"), ("glorp", "noun", "plural"))
+            finally:
+                lexicon._invalidate()  # pylint: disable=W0212
+                for table, original in zip(tables, originals):
+                    table.clear()
+                    table.update(original)
+        self.assertEqual(inflex.lemmatize("glorpen"), ("glorpen", "noun", "singular"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import inflex
+from inflex import Noun, Verb
+from inflex import cache, lexicon, noun_core, noun_lei, paradigm_core, verb_core
+
+NOUNS = """\
+# Domain vocabulary
+    schema          =>  schemata
+    glorp           =>  glorpen     |  glorpi
+    zorb-of-war     =>  zorbs-of-war
+"""
+
+VERBS = """\
+    glorps          glorp           glarp           glorping        glurped
+"""
+
+
+class TestLexicon(unittest.TestCase):
+    def setUp(self):
+        # The core modules are extended in place, so remember their original entries
+        self.tables = [getattr(noun_core, name) for name in ("modern_plural_of", "classical_plural_of", "singular_of")]
+        self.tables += [getattr(verb_core, name) for name in ("plural_of", "singular_of", "past_of", "pres_part_of",
+                                                              "past_part_of", "past_of_values", "pres_part_of_values",
+                                                              "past_part_of_values", "plural_and_singular")]
+        self.tables += [paradigm_core.noun_paradigms, paradigm_core.verb_paradigms]
+        self.originals = [table.copy() for table in self.tables]
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, "cache")
+
+    def tearDown(self):
+        lexicon._invalidate()  # pylint: disable=W0212
+        for table, original in zip(self.tables, self.originals):
+            table.clear()
+            table.update(original)
+        cache.disable()
+        self.directory.cleanup()
+
+    def write(self, contents: str, fname: str = "custom.lei") -> str:
+        path = os.path.join(self.directory.name, fname)
+        with open(path, "w", encoding="utf8") as f:
+            f.write(contents)
+        return path
+
+    def test_nouns(self):
+        literals = inflex.load_lexicon(self.write(NOUNS), cache_dir=self.cache_dir)
+        self.assertEqual(literals["modern_plural"]["schema"], "schemata")
+        self.assertEqual(Noun("schema").plural(), "schemata")
+        self.assertEqual(Noun("Schemata").singular(), "Schema")
+        self.assertTrue(Noun("schemata").is_plural())
+        self.assertEqual(Noun("glorp").plural(), "glorpen")
+        self.assertEqual(Noun("glorp").classical().plural(), "glorpi")
+        self.assertEqual(Noun("glorpi").singular(), "glorp")
+        # Phrases with dashes are also added with spaces
+        self.assertEqual(Noun("zorb of war").plural(), "zorbs of war")
+
+    def test_verbs(self):
+        inflex.load_lexicon(self.write(VERBS), cache_dir=self.cache_dir)
+        self.assertEqual(Verb("glorp").past(), "glarp")
+        self.assertEqual(Verb("glorps").pres_part(), "glorping")
+        self.assertEqual(Verb("glarp").past_part(), "glurped")
+        self.assertTrue(Verb("glarp").is_past())
+        self.assertTrue(verb_core.known_past("glarp"))
+        self.assertIn("glurped", verb_core.plural_and_singular)
+
+    def test_pos(self):
+        path = self.write(NOUNS)
+        with self.assertRaises(ValueError):
+            inflex.load_lexicon(path, pos="adjective", use_cache=False)
+        with self.assertRaises(ValueError):
+            inflex.load_lexicon(self.write("# Only a comment\n", "empty.lei"), use_cache=False)
+        self.assertEqual(inflex.load_lexicon(path, pos="noun", use_cache=False)["singular"]["schemata"], "schema")
+
+    def test_invalid(self):
+        for contents in ("    -ix  =>  -ices\n", "    (SING)-major  =>  (PL)-major\n", "    a  b  c\n"):
+            with self.subTest(contents=contents):
+                with self.assertRaises(ValueError):
+                    inflex.load_lexicon(self.write(contents), pos="noun", use_cache=False)
+        with self.assertRaises(ValueError):
+            inflex.load_lexicon(self.write("    -ize  -ize  -ized  -izing  -ized\n"), pos="verb", use_cache=False)
+
+    def test_cache(self):
+        path = self.write(NOUNS)
+        literals = inflex.load_lexicon(path, cache_dir=self.cache_dir)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        # Loading the same contents again uses the cache rather than the parser
+        with mock.patch.object(noun_lei.Reader, "parse_file", side_effect=AssertionError):
+            self.assertEqual(inflex.load_lexicon(path, cache_dir=self.cache_dir), literals)
+            self.assertEqual(inflex.load_lexicon(self.write(NOUNS, "copy.lei"), cache_dir=self.cache_dir), literals)
+
+        # Changed contents are parsed again
+        self.write(NOUNS + "    blorp  =>  blorpen\n")
+        self.assertEqual(inflex.load_lexicon(path, cache_dir=self.cache_dir)["modern_plural"]["blorp"], "blorpen")
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_invalidate(self):
+        cache.enable()
+        shared = Noun.get("schema")
+        self.assertEqual(shared.plural(), "schemas")
+        self.assertEqual(noun_core.convert_to_modern_plural("schema"), "schemas")
+        self.assertEqual(noun_core.classify_number("glorpi"), (False, True))
+
+        inflex.load_lexicon(self.write(NOUNS), cache_dir=self.cache_dir)
+        self.assertEqual(shared.plural(), "schemata")
+        self.assertEqual(noun_core.convert_to_modern_plural("schema"), "schemata")
+        self.assertEqual(noun_core.classify_number("glorpi"), (True, False))
+
+    def test_invalidate_paradigms(self):
+        unrelated = Noun.get("mouse")
+        self.assertIn("man-child", paradigm_core.noun_paradigms)
+        inflex.load_lexicon(self.write(NOUNS + "    child  =>  childer\n"), cache_dir=self.cache_dir)
+
+        # Only the forms changed by the lexicon are dropped, the others remain precomputed
+        for word in ("schema", "child", "children", "man-child"):
+            self.assertNotIn(word, paradigm_core.noun_paradigms)
+        self.assertEqual(Noun("child of god").plural(), "childer of god")
+        self.assertEqual(Noun("man-child").plural(), "men-children")
+        self.assertIn("mouse", paradigm_core.noun_paradigms)
+        self.assertIsNotNone(unrelated._paradigm)  # pylint: disable=W0212
+        self.assertEqual(len(paradigm_core.verb_paradigms), len(self.originals[-1]))
+        with mock.patch("inflex.noun.noun_paradigms", {}):
+            for word, paradigm in paradigm_core.noun_paradigms.items():
+                noun = Noun(word)
+                self.assertEqual((noun.plural(), noun.classical().plural(), noun.singular()), paradigm, word)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import inspect
+import sys
+import time
+import unittest
+from unittest import mock
+
+from inflex import Noun, Verb, noun_core
+
+# Long product titles and other collocations, with the same output for both rule engines
+TITLES = [
+    "box of " + "very " * 40 + "fine chocolate",
+    "Premium " + "Stainless Steel " * 10 + "Water Bottle with " + "Lid " * 20 + "Extra",
+    "Gift Set of " + "Scented Candle, " * 15 + "Holder's",
+    "mother-in-law of " * 15 + "the bride",
+    "attorneys general of " * 10 + "the states",
+    "knight errant " * 12 + "of the realm",
+]
+
+
+class TimedTestCase(unittest.TestCase):
+    # Seconds allowed per conversion. The slowest of the inputs take about 0.2 seconds.
+    budget = 2.0
+
+    def assertWithinBudget(self, function, word):
+        start = time.perf_counter()
+        output = function(word)
+        duration = time.perf_counter() - start
+        self.assertLess(duration, self.budget, f"{function.__name__}({word[:30]!r}...) took {duration:.2f}s")
+        return output
+
+
+class TestLongInput(TimedTestCase):
+    """Long inputs, which are inflected using all rules by default."""
+
+    def test_regex_equivalent(self):
+        # Long words are converted and classified using the tries, rather than the regexes,
+        # which must give the same output, also if the words are collocations
+        functions = (noun_core.convert_to_modern_plural, noun_core.convert_to_classical_plural,
+                     noun_core.convert_to_singular, noun_core.classify_number)
+        words = TITLES + [noun_core.convert_to_modern_plural(title) for title in TITLES]
+        words += ["son of a " * 25 + "gun", "sons-of-" * 25 + "guns", "at " * 60 + "it"]
+        outputs = [[self.assertWithinBudget(function, word) for function in functions] for word in words]
+        self.assertEqual(outputs[0][0], "boxes of " + "very " * 40 + "fine chocolate")
+        with mock.patch.object(noun_core, "long_input_length", 10 ** 6):
+            for word, output in zip(words, outputs):
+                with self.subTest(word=word[:30]):
+                    self.assertGreater(len(word), 100)
+                    self.assertEqual([function(word) for function in functions], output)
+
+    def test_nested_son_of_a(self):
+        word = "son-of-a-" * 13 + "gun"
+        output = self.assertWithinBudget(noun_core.convert_to_modern_plural, word)
+        self.assertEqual(output, "sons-of-" * 13 + "guns")
+        self.assertEqual(self.assertWithinBudget(noun_core.classify_number, word), (False, True))
+
+    def test_nested_sons_of(self):
+        word = " ".join(["sons of"] * 15) + " guns"
+        output = self.assertWithinBudget(noun_core.convert_to_singular, word)
+        self.assertEqual(output, "son of a " * 15 + "gun")
+        self.assertEqual(self.assertWithinBudget(noun_core.classify_number, word), (True, False))
+        self.assertEqual(self.assertWithinBudget(lambda word: Noun(word).singular(), word), output)
+
+    def test_errant(self):
+        word = " ".join(["knight errant"] * 9)
+        output = self.assertWithinBudget(lambda word: Noun(word).plural(), word)
+        self.assertTrue(output.endswith("knights errant"), output[-30:])
+
+    def test_long_words_equivalent(self):
+        # Long words are converted and classified using the tries rather than the regexes,
+        # which must give the same output
+        words = ["x" * noun_core.long_input_length + word
+                 for word in ("shelf", "books", "mice", "sheep", "brethren", "knives", "thesis", "Oxen")]
+        words += ["sons of " + word for word in words] + ["about " + word for word in words]
+        outputs = [(noun_core.classify_number(word), noun_core.convert_to_modern_plural(word),
+                    noun_core.convert_to_singular(word)) for word in words]
+        with mock.patch.object(noun_core, "long_input_length", 10 ** 6):
+            for word, output in zip(words, outputs):
+                with self.subTest(word=word):
+                    self.assertEqual((noun_core.classify_number(word), noun_core.convert_to_modern_plural(word),
+                                      noun_core.convert_to_singular(word)), output)
+
+
+class TestMaxInputLength(TimedTestCase):
+    """Pathological long inputs, which are inflected in time linear in their length
+    beyond `noun_core.max_input_length`, if that is set."""
+
+    def setUp(self):
+        patcher = mock.patch.object(noun_core, "max_input_length", 128)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def duration(function, word):
+        # The fastest of several runs, to reduce the noise of the measurement
+        durations = []
+        for _ in range(5):
+            start = time.perf_counter()
+            function(word)
+            durations.append(time.perf_counter() - start)
+        return min(durations)
+
+    def test_linear_scaling(self):
+        functions = [noun_core.convert_to_modern_plural, noun_core.convert_to_classical_plural,
+                     noun_core.convert_to_singular, noun_core.classify_number,
+                     lambda word: Noun(word).plural(), lambda word: Noun(word).singular(),
+                     lambda word: Verb(word).past()]
+        for unit in ("son of a ", "sons of ", "son-of-a-", "at-", "knight errant ", "book of ", "x's", "'", "é of "):
+            with self.subTest(unit=unit):
+                # Quadrupling the length of the input may at most take 8 times as long,
+                # while a quadratic running time would take about 16 times as long
+                durations = []
+                for length in (5000, 20000):
+                    word = (unit * (length // len(unit) + 1))[:length]
+                    durations.append(sum(self.duration(function, word) for function in functions))
+                self.assertLess(durations[1], 8 * durations[0] + 0.005, f"{unit!r}: {durations}")
+
+    def test_max_input_length(self):
+        # Long inputs are inflected as a single word, without the rules for collocations
+        word = "son of a " * 20 + "gun"
+        self.assertGreater(len(word), noun_core.max_input_length)
+        self.assertEqual(noun_core.convert_to_modern_plural(word), "son of a " * 20 + "guns")
+        self.assertEqual(Noun(word).plural(), "son of a " * 20 + "guns")
+        self.assertEqual(noun_core.classify_number("sons of " * 20 + "son"), (False, True))
+
+        # Shorter inputs are inflected using all rules
+        word = "son of a " * 13 + "gun"
+        self.assertLessEqual(len(word), noun_core.max_input_length)
+        self.assertEqual(noun_core.convert_to_modern_plural(word), "sons of " * 13 + "guns")
+        self.assertEqual(noun_core.convert_to_singular("sons of " * 13 + "guns"), word)
+        self.assertEqual(noun_core.classify_number(word), (False, True))
+
+    def test_nesting_depth(self):
+        # The deepest nesting within `noun_core.max_input_length` takes a bounded number of
+        # stack frames, also when the caller leaves little room on the stack
+        word = "at " * (noun_core.max_input_length // 3 - 1) + "it"
+        self.assertLessEqual(len(word), noun_core.max_input_length)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 300)
+        try:
+            for function in (noun_core.convert_to_modern_plural, noun_core.convert_to_singular,
+                             noun_core.classify_number, lambda word: Noun(word).plural()):
+                with self.subTest(function=function):
+                    self.assertWithinBudget(function, word)
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_prepositions(self):
+        for separator in (" ", "-"):
+            with self.subTest(separator=separator):
+                word = separator.join(["book", "of"] * 150 + ["book"])
+                output = self.assertWithinBudget(noun_core.convert_to_modern_plural, word)
+                self.assertEqual(output, separator.join(["book", "of"] * 150 + ["books"]))
+                self.assertWithinBudget(noun_core.convert_to_singular, output)
+                self.assertWithinBudget(noun_core.classify_number, word)
+
+                word = separator.join(["book", "of"] * 10 + ["book"])
+                self.assertEqual(noun_core.convert_to_modern_plural(word),
+                                 separator.join(["books"] + ["of", "book"] * 10))
+
+    def test_long_words(self):
+        for word in ("a" * 3000, "s" * 3000, "x " * 1500 + "of", "a" + " " * 3000 + "b", "a" + "'" * 3000):
+            with self.subTest(word=word[:10]):
+                self.assertWithinBudget(noun_core.convert_to_modern_plural, word)
+                self.assertWithinBudget(noun_core.convert_to_singular, word)
+                self.assertWithinBudget(noun_core.classify_number, word)
+                self.assertWithinBudget(lambda word: Verb(word).past(), word)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+import unittest
+
+import inflex
+from inflex import Matcher, Noun, Verb
+from inflex.matcher import Match
+
+LEMMAS = ["child", "fly", "mouse", "eat", "son of a gun", "gun", "formula"]
+
+TEXT = """\
+The Children ate cheese, while a fly was flying by. Three mice had eaten
+the formulae; sons of guns! FLIES, Gunners and ungun-ish guns.
+"""
+
+
+class TestMatcher(unittest.TestCase):
+    def test_finditer(self):
+        matcher = Matcher(["child", "fly"])
+        self.assertEqual(list(matcher.finditer("The Children saw a fly flying by.")), [
+            Match(4, 12, "child", "noun", "children"),
+            Match(19, 22, "fly", "noun", "fly"),
+            Match(19, 22, "fly", "verb", "fly"),
+            Match(23, 29, "fly", "verb", "flying"),
+        ])
+        self.assertIs(inflex.Matcher, Matcher)
+
+    def test_overlapping(self):
+        matcher = Matcher(["son of a gun", "gun"], pos="noun")
+        self.assertEqual([(match.start, match.end, match.lemma) for match in matcher.finditer("Sons of guns!")],
+                         [(0, 12, "son of a gun"), (8, 12, "gun")])
+
+    def test_whole_words(self):
+        self.assertEqual(list(Matcher(["he"], pos="noun").finditer("Shepherd")), [])
+        self.assertEqual([match.start for match in Matcher(["he"], pos="noun", whole_words=False).finditer("Shepherd")],
+                         [1, 4])
+
+    def test_as_regex(self):
+        # The same occurrences are found as with the `as_regex` pattern of each lemma
+        for pos, cls in (("noun", Noun), ("verb", Verb)):
+            matcher = Matcher(LEMMAS, pos=pos)
+            expected = set()
+            for lemma in LEMMAS:
+                pattern = re.compile(rf"\b(?:{cls(lemma).as_regex().pattern})\b", flags=re.I)
+                expected.update((match.start(), match.end(), lemma) for match in pattern.finditer(TEXT))
+            found = [(match.start, match.end, match.lemma) for match in matcher.finditer(TEXT)]
+            self.assertEqual(len(found), len(set(found)))
+            # Longer forms, e.g. "sons of guns", also contain shorter forms, e.g. "guns"
+            self.assertEqual(set(found), expected, pos)
+            for start, end, lemma in found:
+                self.assertTrue(cls(lemma).as_regex().fullmatch(TEXT[start:end]))
+
+    def test_chunks(self):
+        matcher = Matcher(LEMMAS)
+        expected = list(matcher.finditer(TEXT))
+        self.assertGreater(len(expected), 10)
+        for size in (1, 2, 5, 13, 100):
+            with self.subTest(size=size):
+                chunks = ["", *(TEXT[i:i + size] for i in range(0, len(TEXT), size)), ""]
+                self.assertEqual(list(matcher.finditer_chunks(chunks)), expected)
+
+    def test_empty(self):
+        matcher = Matcher([])
+        self.assertEqual(len(matcher), 0)
+        self.assertEqual(list(matcher.finditer(TEXT)), [])
+        self.assertEqual(len(Matcher(["fly"], pos="verb")), 5)
+        with self.assertRaises(ValueError):
+            Matcher(LEMMAS, pos="adjective")
+
+
+if __name__ == "__main__":
+    unittest.main()
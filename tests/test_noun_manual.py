@@ -5,7 +5,7 @@ import re
 import random
 import unittest
 
-from inflex import Noun
+from inflex import Noun, noun_core
 
 
 class TestNouns(unittest.TestCase):
@@ -153,6 +153,126 @@ class TestNouns(unittest.TestCase):
                 out = Noun(plur).classical().singular()
                 self.assertEqual(out, sing, f"Noun({plur!r}).classical().singular()")
 
+    def test_pronoun(self):
+        test_data = [
+            ("I", 0, "we"),
+            ("me", 0, "us"),
+            ("to me", 0, "to us"),
+            ("to\tme", 0, "to\tus"),
+            ("for it", 0, "for them"),
+            ("her", 3, "them"),
+            ("About Him", 0, "About Them"),
+            ("yourself", 1, "ourselves"),
+        ]
+        for sing, person, plur in test_data:
+            with self.subTest():
+                out = Noun(sing).plural(person)
+                self.assertEqual(out, plur, f"Noun({sing!r}).plural({person})")
+
+    def test_long_collocation(self):
+        noun = Noun(" ".join(["Big", "RED", "old"] * 5000 + ["Dog"]))
+        self.assertEqual(noun.plural(), " ".join(["Big", "RED", "old"] * 5000 + ["Dogs"]))
+
+    def test_slots(self):
+        noun = Noun("brother")
+        self.assertFalse(hasattr(noun, "__dict__"))
+        self.assertFalse(hasattr(noun.classical(), "__dict__"))
+
+    def test_memo(self):
+        noun = Noun("Brother")
+        self.assertIs(noun.plural(), noun.plural())
+        self.assertEqual(noun.plural(), "Brothers")
+        self.assertEqual(noun.classical().plural(), "Brethren")
+        self.assertEqual(Noun("I").plural(1), "we")
+        self.assertEqual(Noun("I").plural(person=3), "they")
+        noun = Noun("I")
+        self.assertEqual([noun.plural(person) for person in range(4)] * 2,
+                         ["we", "we", "you", "they"] * 2)
+        with self.assertRaises(ValueError):
+            noun.plural(5)
+
+        # Arguments equal to the defaults, passed positionally or by keyword, share one output
+        noun = Noun("Brother")
+        plural = noun.plural()
+        size = len(noun._memo)  # pylint: disable=W0212
+        self.assertIs(noun.plural(0), plural)
+        self.assertIs(noun.plural(person=0), plural)
+        self.assertEqual(noun.plural(person=3), noun.plural(3))
+        self.assertEqual(len(noun._memo), size + 1)  # pylint: disable=W0212
+        with self.assertRaises(TypeError):
+            noun.plural(persons=0)
+        with self.assertRaises(TypeError):
+            noun.plural(0, 0)
+        with self.assertRaises(TypeError):
+            noun.plural(0, person=0)
+
+    def test_get(self):
+        noun = Noun.get("brother")
+        self.assertIs(noun, Noun.get("brother"))
+        self.assertIsInstance(noun, Noun)
+        self.assertIsNot(noun, Noun.get("Brother"))
+        self.assertIsNot(noun, Noun.get(" brother"))
+        noun.plural()
+        self.assertIs(Noun.get("brother").plural(), noun.plural())
+
+        # Changing a shared instance stops sharing it
+        noun.term = "child"
+        self.assertEqual(noun.plural(), "children")
+        self.assertEqual(noun, Noun("child"))
+        self.assertIsNot(Noun.get("brother"), noun)
+        self.assertEqual(Noun.get("brother").plural(), "brothers")
+
+        # Changing an instance which isn't shared, or no longer shared, keeps the shared one
+        shared = Noun.get("brother")
+        other = Noun("brother")
+        other.term = "child"
+        noun.term = "brother"
+        self.assertIs(Noun.get("brother"), shared)
+        self.assertEqual(Noun.get("child").plural(), "children")
+
+    def test_assign(self):
+        # The forms computed before assigning an attribute are discarded
+        for name, value, plural in (("term", "Child", "Children"), ("start", " ", " Brothers"),
+                                    ("end", " ", "Brothers "), ("spaces", ["-"], "Brothers")):
+            with self.subTest(name=name):
+                noun = Noun("Brother")
+                self.assertEqual(noun.plural(), "Brothers")
+                self.assertEqual(noun.classical().plural(), "Brethren")
+                setattr(noun, name, value)
+                self.assertEqual(getattr(noun, name), tuple(value) if name == "spaces" else value)
+                self.assertEqual(noun.plural(), plural)
+                self.assertEqual(hash(noun), hash(noun))
+        noun = Noun("mother in law")
+        noun.spaces = ["-", "-"]
+        self.assertEqual(noun.plural(), "mothers-in-law")
+
+    def test_eq_hash(self):
+        self.assertEqual(Noun("brother"), Noun("brother"))
+        self.assertEqual(hash(Noun("brother")), hash(Noun("brother")))
+        self.assertEqual(Noun(" a  b-c "), Noun(" a  b-c "))
+        self.assertNotEqual(Noun("brother"), Noun("Brother"))
+        self.assertNotEqual(Noun("brother"), Noun("brother "))
+        self.assertNotEqual(Noun("brother"), Noun("brother").classical())
+        self.assertNotEqual(Noun("brother"), "brother")
+        self.assertEqual(len({Noun("a"), Noun("a"), Noun("b")}), 2)
+
+    def test_classify_number(self):
+        test_data = [
+            ("book", (False, True)),
+            ("books", (True, False)),
+            ("sheep", (True, True)),
+            ("Children", (True, False)),
+            ("sons of guns", (True, False)),
+            ("son of a gun", (False, True)),
+            ("knights-errant", (True, False)),
+            ("about books", (True, False)),
+        ]
+        for term, number in test_data:
+            with self.subTest():
+                self.assertEqual(noun_core.classify_number(term), number, f"classify_number({term!r})")
+                self.assertEqual((noun_core.is_plural(term), noun_core.is_singular(term)), number)
+                self.assertEqual((Noun(term).is_plural(), Noun(term).is_singular()), number)
+
     def test_plural_wrong_person(self):
         with self.assertRaises(ValueError):
             Noun("brother").plural(5)
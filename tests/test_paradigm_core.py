@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+
+import inflex
+from inflex import Noun, Verb
+from inflex import lexicon, noun_core, paradigm_core, verb_core
+
+
+class TestParadigmCore(unittest.TestCase):
+    def test_current(self):
+        # Regenerate using `python generate/generate_paradigms.py` after regenerating the core modules
+        self.assertEqual(paradigm_core.noun_core_version, noun_core.VERSION)
+        self.assertEqual(paradigm_core.verb_core_version, verb_core.VERSION)
+        self.assertIn("child", paradigm_core.noun_paradigms)
+        self.assertIn("children", paradigm_core.noun_paradigms)
+        self.assertIn("flew", paradigm_core.verb_paradigms)
+
+    def test_matches_rules(self):
+        # The precomputed forms equal the forms computed without them
+        noun_paradigms = paradigm_core.noun_paradigms.copy()
+        verb_paradigms = paradigm_core.verb_paradigms.copy()
+        with mock.patch("inflex.noun.noun_paradigms", {}), mock.patch("inflex.verb.verb_paradigms", {}):
+            for word, paradigm in noun_paradigms.items():
+                noun = Noun(word)
+                self.assertEqual((noun.plural(), noun.classical().plural(), noun.singular()), paradigm, word)
+            for word, paradigm in verb_paradigms.items():
+                verb = Verb(word)
+                self.assertEqual((verb.singular(), verb.plural(), verb.past(), verb.pres_part(), verb.past_part()),
+                                 paradigm, word)
+
+    def test_lookup(self):
+        self.assertEqual(Noun("child").plural(), "children")
+        self.assertEqual(Noun("child").classical().plural(), "children")
+        self.assertEqual(Noun("formula").classical().plural(), "formulae")
+        self.assertEqual(Noun("children").singular(), "child")
+        self.assertEqual(Verb("fly").past(), "flew")
+        self.assertEqual(Verb("fly").paradigm(), {"singular": "flies", "plural": "fly", "past": "flew",
+                                                  "pres_part": "flying", "past_part": "flown"})
+        self.assertEqual(inflex.noun_plural("formula", classical=True), "formulae")
+        self.assertEqual(inflex.verb_past_part("flew"), "flown")
+
+        # Other terms, persons and casings are converted using the rules
+        self.assertEqual(Noun("Child").plural(), "Children")
+        self.assertEqual(Noun("  child ").plural(), "  children ")
+        self.assertEqual(Noun("I").plural(), "we")
+        self.assertEqual(Noun("it").plural(3), "they")
+        self.assertEqual(inflex.verb_past("Fly"), "Flew")
+        self.assertEqual(inflex.verb_singular("are", person=1), "am")
+
+    def test_invalidate(self):
+        originals = (paradigm_core.noun_paradigms.copy(), paradigm_core.verb_paradigms.copy())
+        shared, unrelated = Noun.get("child"), Noun.get("mouse")
+        self.assertIsNotNone(shared._paradigm)  # pylint: disable=W0212
+        try:
+            # Only the forms of the given words, and of the words inflected through them, are dropped
+            lexicon._invalidate(["child", "take"])  # pylint: disable=W0212
+            for word in ("child", "children", "man-child", "men children", "crafts child"):
+                self.assertNotIn(word, paradigm_core.noun_paradigms)
+            for word in ("mistake", "overtake", "undertake"):
+                self.assertNotIn(word, paradigm_core.verb_paradigms)
+            for word in ("mouse", "mice", "manchild"):
+                self.assertIn(word, paradigm_core.noun_paradigms)
+            self.assertIn("flew", paradigm_core.verb_paradigms)
+            self.assertIsNone(shared._paradigm)  # pylint: disable=W0212
+            self.assertIsNotNone(unrelated._paradigm)  # pylint: disable=W0212
+            self.assertEqual(shared.plural(), "children")
+            self.assertEqual(unrelated.plural(), "mice")
+
+            # Without words, all of them are dropped
+            lexicon._invalidate()  # pylint: disable=W0212
+            self.assertEqual(paradigm_core.noun_paradigms, {})
+            self.assertIsNone(unrelated._paradigm)  # pylint: disable=W0212
+        finally:
+            for table, original in zip((paradigm_core.noun_paradigms, paradigm_core.verb_paradigms), originals):
+                table.update(original)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import glob
+import importlib
+import os
+import random
+import re
+import sys
+import unittest
+from typing import Iterable, List, Optional, Pattern, Set
+
+from inflex import noun_core, verb_core
+from inflex.suffix_trie import split_alternatives
+
+# `rule_order` is used by the generators, which are not part of the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "generate"))
+
+from rule_order import order_rules, rules_overlap  # pylint: disable=C0413
+
+
+def generated_words(prefix: str) -> Set[str]:
+    """The inputs and outputs of the generated tests in the modules starting with `prefix`."""
+    words = set()
+    for fname in glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), prefix + "*.py")):
+        module = importlib.import_module("tests." + os.path.basename(fname)[:-3])
+        for value in vars(module).values():
+            for args in getattr(value, "test_args", []) if isinstance(value, type) else []:
+                words.update(word for word in (args["in"], args["out"]) if isinstance(word, str))
+    return words
+
+
+def first_rule(regex: Pattern[str], group_rules: List[int], word: str) -> Optional[int]:
+    """The index of the rule that matches `word` first, -1 if that rule has no matching group,
+    or None if no rule matches."""
+    match = regex.match(word)
+    if not match:
+        return None
+    for group, value in enumerate(match.groups()):
+        if value is not None:
+            return group_rules[group]
+    return -1
+
+
+class TestRuleOrder(unittest.TestCase):
+    def test_rules_overlap(self):
+        overlapping = [
+            ("(.*)staff", "(.+)ff"),
+            ("(.+[aeiou])o", "(.+)o"),
+            ("(.+[^e])s", "(.+[^i])s"),
+            ("((?:.{2,})?)believes", "(.+)s"),
+            ("son-of-a-(.*?)", "(.+)s"),
+            # Ranges and escapes in character classes are not expanded
+            ("(.+[a-c])s", "(.+[x])s"),
+            ("(.+[^a-c])s", "(.+[b])s"),
+            ("(.+[\\w])s", "(.+[.])s"),
+        ]
+        for first, second in overlapping:
+            with self.subTest(first=first, second=second):
+                self.assertTrue(rules_overlap(first, second))
+                self.assertTrue(rules_overlap(second, first))
+
+        disjoint = [
+            ("(.+)ies", "(.+[^e])s"),
+            ("(.+)man", "(.+)men"),
+            ("(.+[aeiou])y", "(.+[^aeiou])y"),
+            ("(.*)staff", "(.*)ox"),
+            ("((?:.{2,})?)believes", "((?:.{2,})?)believe"),
+            ("((?:.{2,})?)believes", "(.+[^e])s"),
+        ]
+        for first, second in disjoint:
+            with self.subTest(first=first, second=second):
+                self.assertFalse(rules_overlap(first, second))
+                self.assertFalse(rules_overlap(second, first))
+
+    def test_order_rules(self):
+        rules = ["(.+)ies", "(.+[^e])s", "(.*)staff", "(.+)ff"]
+        self.assertEqual(order_rules(rules, {}), [0, 1, 2, 3])
+        # "(.+)ff" may only move in front of the disjoint rules, and "(.*)staff" moves along
+        self.assertEqual(order_rules(rules, {"(.+)ff": 10}), [2, 3, 0, 1])
+        self.assertEqual(order_rules(rules, {"(.+[^e])s": 10, "(.+)ies": 5}), [1, 0, 2, 3])
+        self.assertEqual(order_rules(["(.+)s", "(.+)es"], {"(.+)es": 10}), [0, 1])
+
+    def assertSameFirstRule(self, regex: Pattern[str], words: Iterable[str], seed: int):
+        rules = split_alternatives(regex.pattern)
+        hits = dict(zip(rules, random.Random(seed).sample(range(1, len(rules) + 1), len(rules))))
+        order = order_rules(rules, hits)
+        self.assertEqual(sorted(order), list(range(len(rules))))
+        self.assertNotEqual(order, list(range(len(rules))))
+
+        group_rules = [index for index, rule in enumerate(rules) for _ in range(re.compile(rule).groups)]
+        reordered = re.compile(f"^(?:{'|'.join(rules[index] for index in order)})$", flags=regex.flags)
+        reordered_group_rules = [index for index in order for _ in range(re.compile(rules[index]).groups)]
+        compiled = re.compile(regex.pattern, flags=regex.flags)
+        for word in words:
+            # The output only depends on the rule that matches first
+            self.assertEqual(first_rule(reordered, reordered_group_rules, word),
+                             first_rule(compiled, group_rules, word), word)
+
+    def test_order_real_rules(self):
+        # Ordering the rules by a shuffled profile keeps the outputs for the generated tests
+        noun_words = generated_words("test_noun_core_")
+        verb_words = {word.lower() for word in generated_words("test_verb_core_")}
+        for module, words in ((noun_core, noun_words), (verb_core, verb_words)):
+            for name in sorted(vars(module)):
+                if not name.endswith("_convert_rule_regex"):
+                    continue
+                with self.subTest(module=module.__name__, name=name):
+                    self.assertSameFirstRule(getattr(module, name), words, seed=len(name))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import inflex
+from inflex import Noun, Verb
+from inflex import cache, lexicon, noun_core, paradigm_core, snapshot, term, verb_core
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        # Loading a snapshot replaces the entries of the core modules in place
+        self.tables = [getattr(noun_core, name) for name in ("modern_plural_of", "classical_plural_of", "singular_of")]
+        self.tables += [getattr(verb_core, name) for name in ("plural_of", "singular_of", "past_of", "pres_part_of",
+                                                              "past_part_of", "past_of_values", "pres_part_of_values",
+                                                              "past_part_of_values", "plural_and_singular")]
+        self.tables += [paradigm_core.noun_paradigms, paradigm_core.verb_paradigms]
+        self.originals = [table.copy() for table in self.tables]
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "inflex.snapshot")
+
+    def tearDown(self):
+        lexicon._invalidate()  # pylint: disable=W0212
+        for table, original in zip(self.tables, self.originals):
+            table.clear()
+            table.update(original)
+        cache.disable()
+        cache.enable(maxsize=4096)
+        cache.disable()
+        self.directory.cleanup()
+
+    def warm_up(self):
+        cache.enable()
+        self.assertEqual(Noun("Child").plural(), "Children")
+        self.assertEqual(Verb("fly").past(), "flew")
+        self.assertEqual(verb_core.convert_to_past("walk"), "walked")
+        self.assertEqual(noun_core.convert_to_singular("x" * noun_core.long_input_length + "wolves"),
+                         "x" * noun_core.long_input_length + "wolf")
+
+    def test_round_trip(self):
+        self.warm_up()
+        cache.enable("noun_core.convert_to_singular", maxsize=100)
+        info = cache.cache_info()
+        snapshot.save(self.path)
+
+        cache.disable()
+        noun_core.singular_convert_trie._root = None  # pylint: disable=W0212
+        self.assertTrue(snapshot.load(self.path))
+        self.assertEqual(cache.cache_info(), {name: info._replace(hits=0, misses=0, evictions=0)
+                                              for name, info in info.items()})
+        self.assertIsNotNone(noun_core.singular_convert_trie._root)  # pylint: disable=W0212
+
+        # The loaded results are used, including those shared between casing variants
+        self.assertEqual(Noun("child").plural(), "children")
+        self.assertEqual(verb_core.convert_to_past("walk"), "walked")
+        self.assertGreater(cache.cache_info("term.canonical_forms")["term.canonical_forms"].hits, 0)
+        self.assertGreater(cache.cache_info("verb_core.convert_to_past")["verb_core.convert_to_past"].hits, 0)
+
+    def test_lexicon(self):
+        path = os.path.join(self.directory.name, "custom.lei")
+        with open(path, "w", encoding="utf8") as f:
+            f.write("    glorp  =>  glorpen\n")
+        inflex.load_lexicon(path, use_cache=False)
+        snapshot.save(self.path)
+
+        del noun_core.modern_plural_of["glorp"]
+        lexicon._invalidate()  # pylint: disable=W0212
+        self.assertEqual(Noun("glorp").plural(), "glorps")
+        self.assertTrue(snapshot.load(self.path, compile_patterns=False))
+        self.assertEqual(Noun("glorp").plural(), "glorpen")
+
+    def test_stale(self):
+        self.assertFalse(snapshot.load(self.path))
+
+        self.warm_up()
+        snapshot.save(self.path)
+        cache.disable()
+        with mock.patch.object(verb_core, "VERSION", verb_core.VERSION + 1):
+            self.assertFalse(snapshot.load(self.path))
+        self.assertFalse(cache.is_enabled("verb_core"))
+
+    def test_version(self):
+        self.warm_up()
+        snapshot.save(self.path)
+        cache.disable()
+        with mock.patch.object(inflex, "__version__", "0.0.0"):
+            self.assertFalse(snapshot.load(self.path))
+        self.assertFalse(cache.is_enabled("verb_core"))
+
+    def test_invalid(self):
+        # Nothing is changed unless the whole snapshot is valid
+        self.warm_up()
+        removed = cache.LRUCache(str.lower, "noun_core.removed")
+        with mock.patch.dict(cache.caches, {"noun_core.removed": removed}):
+            cache.enable("noun_core.removed")
+            snapshot.save(self.path)
+        cache.disable()
+        del noun_core.modern_plural_of["child"]
+        self.assertFalse(snapshot.load(self.path))
+        self.assertNotIn("child", noun_core.modern_plural_of)
+        self.assertFalse(cache.is_enabled("verb_core"))
+
+    def test_suffix_rules(self):
+        tries = [noun_core.singular_convert_trie, noun_core.modern_plural_convert_trie]
+        for trie in tries:
+            trie.find("wolves")
+        snapshot.save(self.path)
+        for trie in tries:
+            rules = trie._suffix_rules  # pylint: disable=W0212
+            trie._suffix_rules = []  # pylint: disable=W0212
+            self.assertTrue(snapshot.load(self.path, compile_patterns=False))
+            self.assertEqual(trie._suffix_rules, rules)  # pylint: disable=W0212
+
+    def test_corrupt(self):
+        self.warm_up()
+        snapshot.save(self.path)
+        cache.disable()
+        with open(self.path, "rb") as f:
+            contents = f.read()
+        for size in (0, 1, 10, len(contents) // 2, len(contents) - 1):
+            with self.subTest(size=size):
+                with open(self.path, "wb") as f:
+                    f.write(contents[:size])
+                self.assertFalse(snapshot.load(self.path))
+                self.assertFalse(cache.is_enabled("verb_core"))
+        self.assertEqual(Verb("fly").past(), "flew")
+
+    def test_fresh_process(self):
+        self.warm_up()
+        snapshot.save(self.path)
+        code = ("from inflex import cache, snapshot; "
+                f"print(snapshot.load({self.path!r}), cache.cache_info('verb_core.convert_to_past')['verb_core.convert_to_past'].currsize)")
+        output = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True,
+                                universal_newlines=True).stdout
+        self.assertEqual(output.split(), ["True", str(cache.cache_info("verb_core.convert_to_past")["verb_core.convert_to_past"].currsize)])
+        self.assertIsNotNone(term._case_sensitive)  # pylint: disable=W0212
+
+
+if __name__ == "__main__":
+    unittest.main()
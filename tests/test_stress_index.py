@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import unittest
+
+import inflex
+from inflex.stress_index import StressIndex
+from inflex.syllable import Syllable
+
+
+class TestStressIndex(unittest.TestCase):
+    def test_matches_json(self):
+        path = os.path.join(os.path.dirname(inflex.__file__), "data", "cmudict_stress.json")
+        with open(path, "r", encoding="utf8") as file:
+            data = json.load(file)
+        index = Syllable.index()
+        self.assertEqual(len(index), len(data))
+        for word, stresses in data.items():
+            if index.get(word) != tuple(tuple(stress) for stress in stresses):
+                self.fail(f"Stress of {word!r} differs from cmudict_stress.json")
+        self.assertEqual(Syllable.data(), data)
+
+    def test_data_types(self):
+        data = Syllable.data()
+        self.assertEqual(data["bake"], [[1]])
+        self.assertIsInstance(data["bake"], list)
+        self.assertTrue(all(isinstance(stress, list) for stress in data["bake"]))
+        # Words with identical stress patterns don't share lists
+        self.assertEqual(data["bake"], data["cake"])
+        self.assertIsNot(data["bake"], data["cake"])
+        self.assertIsNot(data["bake"][0], data["cake"][0])
+
+    def test_syllable(self):
+        self.assertEqual(Syllable.get_stress("abdomen"), [[0, 1, 0], [1, 0, 0]])
+        self.assertEqual(Syllable.get_stress("qwxzv"), [])
+        self.assertEqual(Syllable.get_stress("\udc00"), [])
+        self.assertEqual(Syllable.count_syllables("abdomen"), {3})
+        self.assertEqual(Syllable.count_syllables("qwxzv"), set())
+        self.assertTrue(Syllable.ends_with_stress("prefer"))
+        self.assertFalse(Syllable.ends_with_stress("open"))
+
+    def test_flags(self):
+        self.assertEqual(Syllable.get_flags("big"),
+                         Syllable.ONE_SYLLABLE | Syllable.ENDS_WITH_STRESS | Syllable.DOUBLES_FINAL_CONSONANT)
+        self.assertEqual(Syllable.get_flags("open"), Syllable.TAKES_MORE_MOST)
+        self.assertEqual(Syllable.get_flags("happy"), 0)
+        self.assertEqual(Syllable.get_flags("beautiful"), Syllable.TAKES_MORE_MOST)
+        self.assertIsNone(Syllable.get_flags("qwxzv"))
+
+    def test_write(self):
+        data = {"zz": [[1]], "a": [[1], [0]], "é": [[0.5, 0]], "b": [[1]]}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stress.bin")
+            StressIndex.write(data, path, flags={"a": 3})
+            index = StressIndex(path)
+            self.assertEqual(len(index), 4)
+            self.assertEqual(index.get("a"), ((1,), (0,)))
+            self.assertEqual(index.get("é"), ((0.5, 0),))
+            self.assertIs(index.get("b"), index.get("zz"))
+            self.assertEqual(index.get("c"), ())
+            self.assertEqual(index.find(""), -1)
+            self.assertEqual(index.get_flags("a"), 3)
+            self.assertEqual(index.get_flags("b"), 0)
+            self.assertIsNone(index.get_flags("c"))
+
+            # Repeated lookups are served from memory, up to `CACHE_SIZE` words
+            info = index._find.cache_info()  # pylint: disable=W0212
+            self.assertEqual(index.find("a"), 0)
+            self.assertEqual(index.find("c"), -1)
+            self.assertEqual(index._find.cache_info().hits, info.hits + 2)  # pylint: disable=W0212
+            self.assertEqual(index._find.cache_info().maxsize, StressIndex.CACHE_SIZE)  # pylint: disable=W0212
+            index.close()
+            self.assertEqual(index._find.cache_info().currsize, 0)  # pylint: disable=W0212
+
+            with open(path, "wb") as file:
+                file.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                StressIndex(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
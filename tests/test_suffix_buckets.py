@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from inflex import verb_core
+from inflex.suffix_buckets import SuffixBuckets
+from inflex.lazy_regex import lazy_compile
+
+
+class TestSuffixBuckets(unittest.TestCase):
+    def test_match(self):
+        buckets = SuffixBuckets(lazy_compile(r"^(?:((?:.{2,})?)believe|(.+[^e])e|(.+)ve|(.+[^s]))$"), {
+            "": (3,),
+            "e": (1, 3),
+            "eve": (0, 1, 2, 3),
+            "ve": (1, 2, 3),
+        })
+        self.assertEqual(buckets.match("believe"), (0, ""))
+        self.assertEqual(buckets.match("disbelieve"), (0, "dis"))
+        self.assertEqual(buckets.match("relieve"), (1, "reliev"))
+        self.assertEqual(buckets.match("walk"), (3, "walk"))
+        self.assertEqual(buckets.match("relieve\n"), (1, "reliev"))
+        self.assertIsNone(buckets.match("s"))
+        self.assertIsNone(buckets.match(""))
+
+    def test_identical_to_regex(self):
+        words = [
+            "believe", "believes", "disbelieved", "walk", "walks", "walked", "walking", "go",
+            "s", "ed", "es", "ing", "", "a", "WALKED", "Walked", "fly", "flies", "x\n", "walked\n",
+            "ſed", "İed", "to be", "a-b", "quiz", "quizzes", "panic", "panicked",
+        ]
+        for name in ["convert", "recognize"]:
+            for form in ["singular", "plural", "past", "pres_part", "past_part"]:
+                buckets: SuffixBuckets = getattr(verb_core, f"{form}_{name}_buckets")
+                for word in words:
+                    for word in (word, word.lower()):
+                        with self.subTest():
+                            match = buckets.regex.match(word)
+                            expected = None
+                            if match:
+                                expected = next((i, group) for i, group in enumerate(match.groups())
+                                                if group is not None)
+                            self.assertEqual(buckets.match(word), expected,
+                                             f"{form}_{name}_buckets.match({word!r})")
+
+
+if __name__ == "__main__":
+    unittest.main()
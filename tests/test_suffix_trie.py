@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from inflex import Noun
+from inflex import noun_core
+from inflex.suffix_trie import SuffixTrie, split_alternatives
+from tests import (
+    test_noun_core_to_classical_plural,
+    test_noun_core_to_modern_plural,
+    test_noun_core_to_singular,
+)
+
+
+class TestSuffixTrie(unittest.TestCase):
+    def setUp(self):
+        noun_core.rule_engine = "trie"
+
+    def tearDown(self):
+        noun_core.rule_engine = "regex"
+
+    def test_split_alternatives(self):
+        self.assertEqual(
+            split_alternatives(r"^(?:(.*)staff|(about|above) it|(.+[^aeoui][aeouiy])che|(.+))$"),
+            ["(.*)staff", "(about|above) it", "(.+[^aeoui][aeouiy])che", "(.+)"],
+        )
+
+    def test_corpora(self):
+        for test_class, method in [
+                (test_noun_core_to_singular.TestNounToSingular, "singular"),
+                (test_noun_core_to_modern_plural.TestNounToModernPlural, "plural"),
+                (test_noun_core_to_classical_plural.TestNounToClassicalPlural, "classical().plural")]:
+            for test_case in test_class.test_args:
+                with self.subTest():
+                    noun = Noun(test_case["in"])
+                    if method == "classical().plural":
+                        prediction = noun.classical().plural()
+                    else:
+                        prediction = getattr(noun, method)()
+                    self.assertEqual(prediction, test_case["out"],
+                                     f"{method}({test_case['in']!r}) with the trie engine")
+
+    def test_identical_to_regex(self):
+        words = [
+            "mother-in-law", "son of a gun", "sons-of-guns", "of it", "passer-by",
+            "knight errant", "Consul General", "bay", "quay", "soliloquy", "axe",
+            "hypothesis", "Apex", "fox", "ox", "MOUSE", "s", "", "cafe's", "x\n", "ſtaff",
+        ]
+        for name in ["modern_plural", "classical_plural", "singular"]:
+            trie: SuffixTrie = getattr(noun_core, f"{name}_convert_trie")
+            for word in words:
+                with self.subTest():
+                    found = trie._find_by_regex(word) # pylint: disable=W0212
+                    self.assertEqual(trie.convert(word),
+                                     trie.outputs[found[0]](found[1]) if found else None,
+                                     f"{name} of {word!r} with the trie and regex engines")
+
+    def test_suffix_only(self):
+        words = ["son of a gun", "knight errant", "mother-in-law", "axe", "ſtaff", "x\n", "mouse's", "of it"]
+        for name in ["modern_plural", "classical_plural", "singular"]:
+            trie: SuffixTrie = getattr(noun_core, f"{name}_convert_trie")
+            for word in words:
+                with self.subTest():
+                    # The trie gives the same output as the regexes of the suffix rules
+                    found = trie._find_by_suffix_rules(word) # pylint: disable=W0212
+                    self.assertEqual(trie.find(word, suffix_only=True), found,
+                                     f"{name} of {word!r} with the trie and suffix rule regexes")
+        # Rules on collocations are skipped
+        self.assertEqual(noun_core.modern_plural_convert_trie.convert("son of a gun"), "sons of guns")
+        found = noun_core.modern_plural_convert_trie.find("son of a gun", suffix_only=True)
+        self.assertEqual(noun_core.modern_plural_convert_outputs[found[0]](found[1]), "son of a guns")
+        found = noun_core.modern_plural_convert_trie.find("knight errant", suffix_only=True)
+        self.assertEqual(noun_core.modern_plural_convert_outputs[found[0]](found[1]), "knight errants")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,27 @@ class TestVerbs(unittest.TestCase):
         self.assertEqual(pattern, re.compile("flying|fly|flown|flies|flew", re.IGNORECASE),
                          "Check whether as_regex produces a compiled regex object correctly.")
 
+    def test_paradigm(self):
+        self.assertEqual(Verb("fly").paradigm(), {
+            "singular": "flies",
+            "plural": "fly",
+            "past": "flew",
+            "pres_part": "flying",
+            "past_part": "flown",
+        })
+
+        for term in ["fly", "Flies", " walked ", "unbinds", "re-runs", "cried out", "hop",
+                     "mistook", "are", "Is", "panic", "argue", "Blorps Away"]:
+            verb = Verb(term)
+            with self.subTest():
+                self.assertEqual(verb.paradigm(), {
+                    "singular": verb.singular(),
+                    "plural": verb.plural(),
+                    "past": verb.past(),
+                    "pres_part": verb.pres_part(),
+                    "past_part": verb.past_part(),
+                }, f"Check whether paradigm() is identical to the separate methods for {term!r}.")
+
     def test_classical(self):
         verb = Verb("fly")
         self.assertEqual(verb, verb.classical(),
@@ -1199,6 +1220,13 @@ class TestVerbs(unittest.TestCase):
                 self.assertFalse(Verb(term).is_pres_part(),
                                  f"Verb({repr(term)}).is_pres_part => False")
 
+    def test_assign(self):
+        # The precomputed forms of the previous term are discarded
+        verb = Verb("fly")
+        self.assertEqual(verb.past(), "flew")
+        verb.term = "walk"
+        self.assertEqual((verb.past(), verb.paradigm()["past_part"]), ("walked", "walked"))
+
 
 if __name__ == "__main__":
     unittest.main()